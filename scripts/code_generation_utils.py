@@ -0,0 +1,107 @@
+#!/usr/bin/python2
+#
+# Copyright 2020 The ANGLE Project Authors. All rights reserved.
+# Use of this source code is governed by a BSD-style license that can be
+# found in the LICENSE file.
+#
+# code_generation_utils.py:
+#   Helpers shared by the code generation scripts.
+
+import io
+import os
+import re
+import subprocess
+
+# Generators stamp their outputs with the current year.
+copyright_re = re.compile(r'Copyright (\d{4}) The ANGLE Project Authors')
+
+
+def read_file(path, newline=None):
+    # Returns the contents of |path|, or None if it can't be read.
+    try:
+        if newline is None:
+            with open(path, 'r') as f:
+                return f.read()
+        with io.open(path, 'r', newline=newline) as f:
+            return f.read()
+    except IOError:
+        return None
+
+
+def keep_copyright_year(content, old_content):
+    # Keeps the copyright year of an existing output, so regenerating it in a later year doesn't
+    # change it.
+    if old_content is None:
+        return content
+    old_year = copyright_re.search(old_content)
+    if old_year is None:
+        return content
+    return copyright_re.sub(old_year.group(0), content, count=1)
+
+
+def get_format_command(path):
+    # The formatters "git cl format" runs on the outputs, from depot_tools.
+    ext = os.path.splitext(path)[1]
+    if ext in ['.c', '.cc', '.cpp', '.h']:
+        command = ['clang-format', '-style=file', '-assume-filename=' + os.path.abspath(path)]
+    elif ext in ['.gn', '.gni']:
+        command = ['gn', 'format', '--stdin']
+    else:
+        return None
+    if os.name == 'nt':
+        command[0] += '.bat'
+    return command
+
+
+def format_content(path, content):
+    # Returns |content| formatted the way "git cl format" formats |path|. If the formatter can't
+    # run, |content| is returned as is and "git cl format" formats the written file instead.
+    command = get_format_command(path)
+    if command is None:
+        return content
+    is_unicode = isinstance(content, unicode)
+    try:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=os.path.dirname(os.path.abspath(path)))
+        formatted, _ = process.communicate(content.encode('utf-8') if is_unicode else content)
+    except OSError:
+        return content
+    if process.returncode != 0:
+        return content
+    return formatted.decode('utf-8') if is_unicode else formatted
+
+
+def write_file_if_changed(path, content, newline=None):
+    # Writes |content| to |path| unless the file already contains it, so unchanged outputs keep
+    # their timestamps and don't trigger rebuilds. The comparison is done after keeping the
+    # existing copyright year and formatting |content| like the checked in file, so outputs that
+    # only differ from the generator's raw text by year or formatting aren't rewritten.
+    # The content is written to a temporary file first and renamed over |path|, so a partially
+    # written output is never left behind.
+    # |newline| is passed to io.open, in which case |content| must be unicode.
+    # Returns True if the file was written.
+    old_content = read_file(path, newline)
+    content = format_content(path, keep_copyright_year(content, old_content))
+    if old_content == content:
+        return False
+
+    temp_path = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        if newline is None:
+            with open(temp_path, 'w') as f:
+                f.write(content)
+        else:
+            with io.open(temp_path, 'w', newline=newline) as f:
+                f.write(content)
+        # os.rename doesn't replace existing files on Windows.
+        if os.name == 'nt' and os.path.exists(path):
+            os.remove(path)
+        os.rename(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return True
@@ -13,6 +13,7 @@ import os
 from datetime import date
 
 import registry_xml
+import code_generation_utils
 
 template_gl_enums_header = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
@@ -174,44 +175,39 @@ def main(header_output_path, source_output_path):
 
     # build a map from GLenum name to its value
     all_gl_enums = dict()
-    for enums_node in xml.root.findall('enums'):
-        for enum in enums_node.findall('enum'):
-            name = enum.attrib['name']
-            value = int(enum.attrib['value'], base=16)
-            all_gl_enums[name] = value
+    for name, value in xml.enums:
+        all_gl_enums[name] = int(value, base=16)
 
     # Parse groups of GLenums to build a {group, name} -> value mapping.
     gl_enum_in_groups = dict()
     enums_has_group = set()
-    for enums_group_node in xml.root.findall('groups/group'):
-        group_name = enums_group_node.attrib['name']
+    for group_name, group_enums in xml.enum_groups:
         if group_name in exclude_gl_enum_groups:
             continue
 
         if group_name not in gl_enum_in_groups:
             gl_enum_in_groups[group_name] = dict()
 
-        for enum_node in enums_group_node.findall('enum'):
-            enum_name = enum_node.attrib['name']
+        for enum_name in group_enums:
             enums_has_group.add(enum_name)
             gl_enum_in_groups[group_name][enum_name] = all_gl_enums[enum_name]
 
     # Find relevant GLenums according to enabled APIs and extensions.
     exporting_enums = set()
     # export all the apis
-    xpath = "./feature/require/enum"
-    for enum_tag in xml.root.findall(xpath):
-        enum_name = enum_tag.attrib['name']
-        if enum_name not in exclude_gl_enums:
-            exporting_enums.add(enum_name)
-
-    for extension in registry_xml.supported_extensions:
-        xpath = "./extensions/extension[@name='%s']/require/enum" % extension
-        for enum_tag in xml.root.findall(xpath):
-            enum_name = enum_tag.attrib['name']
+    for _, _, feature_enums in xml.features:
+        for enum_name in feature_enums:
             if enum_name not in exclude_gl_enums:
                 exporting_enums.add(enum_name)
 
+    for extension_name, _, requires in xml.extensions:
+        if extension_name not in registry_xml.supported_extensions:
+            continue
+        for _, _, _, require_enums in requires:
+            for enum_name in require_enums:
+                if enum_name not in exclude_gl_enums:
+                    exporting_enums.add(enum_name)
+
     # For enums that do not have a group, add them to a default group
     default_group_name = registry_xml.default_enum_group_name
     gl_enum_in_groups[default_group_name] = dict()
@@ -228,8 +224,7 @@ def main(header_output_path, source_output_path):
         gl_enum_groups=',\n'.join(sorted(gl_enum_in_groups.iterkeys())))
 
     header_output_path = registry_xml.script_relative(header_output_path)
-    with open(header_output_path, 'w') as f:
-        f.write(header_content)
+    code_generation_utils.write_file_if_changed(header_output_path, header_content)
 
     # Write mapping to source file
     gl_enums_value_to_string_table = dump_value_to_string_mapping(gl_enum_in_groups,
@@ -242,8 +237,7 @@ def main(header_output_path, source_output_path):
     )
 
     source_output_path = registry_xml.script_relative(source_output_path)
-    with open(source_output_path, 'w') as f:
-        f.write(source_content)
+    code_generation_utils.write_file_if_changed(source_output_path, source_content)
 
     return 0
 
@@ -252,6 +246,7 @@ if __name__ == '__main__':
     inputs = [
         'gl.xml',
         'gl_angle_ext.xml',
+        'code_generation_utils.py',
     ]
 
     gl_enum_utils_autogen_base_path = '../src/libANGLE/gl_enum_utils_autogen'
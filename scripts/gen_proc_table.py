@@ -1,4 +1,12 @@
-#!python
+#!/usr/bin/env vpython
+#
+# [VPYTHON:BEGIN]
+# wheel: <
+#   name: "infra/python/wheels/perfect-hash-py2_py3"
+#   version: "version:0.2.1"
+# >
+# [VPYTHON:END]
+#
 # Copyright 2017 The ANGLE Project Authors. All rights reserved.
 # Use of this source code is governed by a BSD-style license that can be
 # found in the LICENSE file.
@@ -7,9 +15,12 @@
 #  Code generation for entry point loading tables.
 #  NOTE: don't run this script directly. Run scripts/run_code_generation.py.
 
+import random
 import sys
 from datetime import date
+from perfect_hash import generate_hash, Hash2
 import registry_xml
+import code_generation_utils
 
 out_file_name_gles = "../src/libGLESv2/proc_table_egl_autogen.cpp"
 out_file_name_gl = "../src/libGL/proc_table_wgl_autogen.cpp"
@@ -29,12 +40,51 @@ template_cpp = """// GENERATED FILE - DO NOT EDIT.
 // found in the LICENSE file.
 //
 // getProcAddress loader table:
-//   Mapping from a string entry point name to function address.
+//   Mapping from a string entry point name to function address. The entries are found with a
+//   perfect hash function from {script_name}.
 //
 
 {includes}
 #define P(FUNC) reinterpret_cast<{cast}>(FUNC)
 
+namespace
+{{
+// clang-format off
+constexpr int kT1[] = {{
+{T1}
+}};
+constexpr int kT2[] = {{
+{T2}
+}};
+constexpr int kG[] = {{
+{G}
+}};
+// clang-format on
+
+int HashG(const char *key, const int *T)
+{{
+    int sum = 0;
+
+    for (int i = 0; key[i] != '\\0'; i++)
+    {{
+        // Names from applications may contain any byte, so it's read unsigned to keep |sum| in
+        // range of kG.
+        sum += T[i] * static_cast<unsigned char>(key[i]);
+        sum %= {NG};
+    }}
+    return kG[sum];
+}}
+
+// Returns the index of the entry that |key| would be at, if |key| is in the table.
+int PerfectHash(const char *key)
+{{
+    if (strlen(key) > {NS})
+        return 0;
+
+    return (HashG(key, kT1) + HashG(key, kT2)) % {NG};
+}}
+}}  // anonymous namespace
+
 namespace {namespace}
 {{
 ProcEntry g_procTable[] = {{
@@ -42,11 +92,23 @@ ProcEntry g_procTable[] = {{
 }};
 
 size_t g_numProcs = {num_procs};
+
+const ProcEntry *FindProcEntry(const char *name)
+{{
+    size_t index = static_cast<size_t>(PerfectHash(name));
+    if (index >= g_numProcs || strcmp(g_procTable[index].first, name) != 0)
+    {{
+        return nullptr;
+    }}
+    return &g_procTable[index];
+}}
 }}  // namespace {namespace}
 """
 
 includes_gles = """#include "libGLESv2/proc_table_egl.h"
 
+#include <cstring>
+
 #include "libGLESv2/entry_points_egl.h"
 #include "libGLESv2/entry_points_egl_ext.h"
 #include "libGLESv2/entry_points_gles_1_0_autogen.h"
@@ -59,6 +121,8 @@ includes_gles = """#include "libGLESv2/proc_table_egl.h"
 
 includes_gl = """#include "libGL/proc_table_wgl.h"
 
+#include <cstring>
+
 #include "libGL/entry_points_wgl.h"
 #include "libGL/entry_points_gl_1_0_autogen.h"
 #include "libGL/entry_points_gl_1_1_autogen.h"
@@ -86,11 +150,32 @@ sys.path.append('../src/libANGLE/renderer')
 import angle_format
 
 
+def format_hash_table(values):
+    lines = []
+    for start in range(0, len(values), 16):
+        lines.append('    ' + ', '.join(str(value) for value in values[start:start + 16]) + ',')
+    return '\n'.join(lines)
+
+
+def get_proc_hash_strings(names):
+    # The hash maps each name to its index in the sorted table, so that a lookup is a hash and a
+    # single string compare. The generator is seeded so that the output is stable.
+    random.seed(0)
+    f1, f2, G = generate_hash(dict(zip(names, range(len(names)))), Hash2)
+    return {
+        'T1': format_hash_table(f1.salt),
+        'T2': format_hash_table(f2.salt),
+        'G': format_hash_table(G),
+        'NG': len(G),
+        'NS': len(f1.salt),
+    }
+
+
 def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = [source for source in registry_xml.xml_inputs]
+        inputs = [source for source in registry_xml.xml_inputs] + ['code_generation_utils.py']
         outputs = [out_file_name_gles, out_file_name_gl]
         if sys.argv[1] == 'inputs':
             print ','.join(inputs)
@@ -156,18 +241,17 @@ def main():
     proc_data = [('    {"%s", P(%s)}' % (func, angle_func))
                  for func, angle_func in sorted(all_functions.iteritems())]
 
-    with open(out_file_name_gles, 'w') as out_file:
-        output_cpp = template_cpp.format(
-            script_name=sys.argv[0],
-            data_source_name="gl.xml, gl_angle_ext.xml, egl.xml, egl_angle_ext.xml",
-            copyright_year=date.today().year,
-            includes=includes_gles,
-            cast="__eglMustCastToProperFunctionPointerType",
-            namespace="egl",
-            proc_data=",\n".join(proc_data),
-            num_procs=len(proc_data))
-        out_file.write(output_cpp)
-        out_file.close()
+    output_cpp = template_cpp.format(
+        script_name=sys.argv[0],
+        data_source_name="gl.xml, gl_angle_ext.xml, egl.xml, egl_angle_ext.xml",
+        copyright_year=date.today().year,
+        includes=includes_gles,
+        cast="__eglMustCastToProperFunctionPointerType",
+        namespace="egl",
+        proc_data=",\n".join(proc_data),
+        num_procs=len(proc_data),
+        **get_proc_hash_strings(sorted(all_functions.iterkeys())))
+    code_generation_utils.write_file_if_changed(out_file_name_gles, output_cpp)
 
     # libGL proc table
     glxml = registry_xml.RegistryXML('gl.xml')
@@ -205,18 +289,17 @@ def main():
     proc_data = [('    {"%s", P(%s)}' % (func, angle_func))
                  for func, angle_func in sorted(all_functions.iteritems())]
 
-    with open(out_file_name_gl, 'w') as out_file:
-        output_cpp = template_cpp.format(
-            script_name=sys.argv[0],
-            data_source_name="gl.xml, wgl.xml",
-            copyright_year=date.today().year,
-            includes=includes_gl,
-            cast="PROC",
-            namespace="wgl",
-            proc_data=",\n".join(proc_data),
-            num_procs=len(proc_data))
-        out_file.write(output_cpp)
-        out_file.close()
+    output_cpp = template_cpp.format(
+        script_name=sys.argv[0],
+        data_source_name="gl.xml, wgl.xml",
+        copyright_year=date.today().year,
+        includes=includes_gl,
+        cast="PROC",
+        namespace="wgl",
+        proc_data=",\n".join(proc_data),
+        num_procs=len(proc_data),
+        **get_proc_hash_strings(sorted(all_functions.iterkeys())))
+    code_generation_utils.write_file_if_changed(out_file_name_gl, output_cpp)
     return 0
 
 
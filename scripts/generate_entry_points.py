@@ -9,8 +9,11 @@
 #   NOTE: don't run this script directly. Run scripts/run_code_generation.py.
 
 import sys, os, pprint, json
+import collections
+import multiprocessing
 from datetime import date
 import registry_xml
+import code_generation_utils
 
 # List of GLES1 extensions for which we don't need to add Context.h decls.
 gles1_no_context_decl_extensions = [
@@ -99,9 +102,6 @@ const char *GetEntryPointName(EntryPoint ep);
 #endif  // LIBANGLE_ENTRY_POINTS_ENUM_AUTOGEN_H_
 """
 
-template_entry_points_name_case = """        case EntryPoint::{enum}:
-            return "gl{enum}";"""
-
 template_entry_points_enum_source = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
 //
@@ -118,15 +118,29 @@ template_entry_points_enum_source = """// GENERATED FILE - DO NOT EDIT.
 
 namespace gl
 {{
+namespace
+{{
+// clang-format off
+// The entry point names, separated by NUL characters.
+constexpr char kEntryPointNames[] =
+{entry_points_names};
+
+// The offset of each name in kEntryPointNames, indexed by EntryPoint.
+constexpr uint32_t kEntryPointNameOffsets[] = {{
+{entry_points_name_offsets}
+}};
+// clang-format on
+}}  // anonymous namespace
+
 const char *GetEntryPointName(EntryPoint ep)
 {{
-    switch (ep)
+    size_t index = static_cast<size_t>(ep);
+    if (index >= ArraySize(kEntryPointNameOffsets))
     {{
-{entry_points_name_cases}
-        default:
-            UNREACHABLE();
-            return "error";
+        UNREACHABLE();
+        return "error";
     }}
+    return &kEntryPointNames[kEntryPointNameOffsets[index]];
 }}
 }}  // namespace gl
 """
@@ -155,7 +169,7 @@ template_entry_point_no_return = """void GL_APIENTRY {name}{explicit_context_suf
     Context *context = {context_getter};
     if (context)
     {{{assert_explicit_context}{packed_gl_enum_conversions}
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || Validate{name}({validate_params}));
         if (isCallValid)
         {{
@@ -174,7 +188,7 @@ template_entry_point_with_return = """{return_type}GL_APIENTRY {name}{explicit_c
     {return_type} returnValue;
     if (context)
     {{{assert_explicit_context}{packed_gl_enum_conversions}
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || Validate{name}({validate_params}));
         if (isCallValid)
         {{
@@ -446,6 +460,27 @@ template_capture_proto = "angle::CallCapture Capture%s(%s);"
 
 template_validation_proto = "bool Validate%s(%s);"
 
+# Multi-draw commands listed in entry_point_batched_validation.json validate the state shared by
+# all draws once, then only the parameters of each draw in the loop.
+template_batched_validation = """bool Validate{name}Shared({shared_params});
+bool Validate{name}Draw({draw_params});
+ANGLE_INLINE bool Validate{name}({params})
+{{
+    if (!Validate{name}Shared({shared_args}))
+    {{
+        return false;
+    }}
+    for (GLsizei drawID = 0; drawID < {drawcount}; ++drawID)
+    {{
+        if (!Validate{name}Draw({draw_args}))
+        {{
+            return false;
+        }}
+    }}
+    return true;
+}}
+"""
+
 template_windows_def_file = """; GENERATED FILE - DO NOT EDIT.
 ; Generated by {script_name} using data from {data_source_name}.
 ;
@@ -621,7 +656,7 @@ def just_the_name_packed(param, reserved_set):
         return name
 
 
-def param_print_argument(command_node, param):
+def param_print_argument(command, param):
     name_only = just_the_name(param)
     type_only = just_the_type(param)
 
@@ -638,11 +673,11 @@ def param_print_argument(command_node, param):
         return "GLbooleanToString(%s)" % (name_only,)
 
     if type_only == "GLbitfield":
-        group_name = find_gl_enum_group_in_command(command_node, name_only)
+        group_name = find_gl_enum_group_in_command(command, name_only)
         return "GLbitfieldToString(GLenumGroup::%s, %s).c_str()" % (group_name, name_only)
 
     if type_only == "GLenum":
-        group_name = find_gl_enum_group_in_command(command_node, name_only)
+        group_name = find_gl_enum_group_in_command(command, name_only)
         return "GLenumToString(GLenumGroup::%s, %s)" % (group_name, name_only)
 
     return name_only
@@ -690,11 +725,11 @@ def strip_suffix(name):
     return name
 
 
-def find_gl_enum_group_in_command(command_node, param_name):
+def find_gl_enum_group_in_command(command, param_name):
     group_name = None
-    for param_node in command_node.findall('./param'):
-        if param_node.find('./name').text == param_name:
-            group_name = param_node.attrib.get('group', None)
+    for param in command.params:
+        if param.name == param_name:
+            group_name = param.group
             break
 
     if group_name is None or group_name in registry_xml.unsupported_enum_group_names:
@@ -708,7 +743,7 @@ def get_packed_enums(cmd_packed_gl_enums, cmd_name):
     return cmd_packed_gl_enums.get(strip_suffix(cmd_name), {})
 
 
-def format_entry_point_def(command_node, cmd_name, proto, params, is_explicit_context,
+def format_entry_point_def(command, cmd_name, proto, params, is_explicit_context,
                            cmd_packed_gl_enums):
     packed_gl_enums = get_packed_enums(cmd_packed_gl_enums, cmd_name)
     internal_params = [just_the_name_packed(param, packed_gl_enums) for param in params]
@@ -723,7 +758,7 @@ def format_entry_point_def(command_node, cmd_name, proto, params, is_explicit_co
                 ">(" + name + ");"
             ]
 
-    pass_params = [param_print_argument(command_node, param) for param in params]
+    pass_params = [param_print_argument(command, param) for param in params]
     format_params = [param_format_string(param) for param in params]
     return_type = proto[:-len(cmd_name)]
     default_return = default_return_value(cmd_name, return_type.strip())
@@ -882,7 +917,54 @@ def format_libgles_entry_point_def(cmd_name, proto, params, is_explicit_context)
         explicit_context_internal_param="ctx" if is_explicit_context else "")
 
 
-def format_validation_proto(cmd_name, params, cmd_packed_gl_enums):
+def get_per_draw_type(param_type):
+    # Drops the array indirection from a per-draw param, e.g. "const GLint *" becomes "GLint" and
+    # "const GLvoid *const *" becomes "const GLvoid *".
+    element_type = param_type.strip()[:-1].strip()
+    if element_type.endswith("const"):
+        return element_type[:-len("const")].strip()
+    if "*" not in element_type and element_type.startswith("const "):
+        return element_type[len("const "):]
+    return element_type
+
+
+def format_batched_validation(cmd_name, params, cmd_packed_gl_enums, batched_validation):
+    packed_gl_enums = get_packed_enums(cmd_packed_gl_enums, cmd_name)
+    drawcount = batched_validation["drawcount"]
+    per_draw = batched_validation["per_draw"]
+    shared_params = ["Context *context"]
+    shared_args = ["context"]
+    draw_params = ["Context *context"]
+    draw_args = ["context"]
+
+    for param in params:
+        name = just_the_name(param)
+        param_type = just_the_type_packed(param, packed_gl_enums)
+        if name in per_draw:
+            draw_params.append(make_param(get_per_draw_type(param_type), per_draw[name]))
+            draw_args.append("%s[drawID]" % name)
+            continue
+        packed_name = just_the_name_packed(param, packed_gl_enums)
+        shared_params.append(make_param(param_type, packed_name))
+        shared_args.append(packed_name)
+        if name != drawcount:
+            draw_params.append(make_param(param_type, packed_name))
+            draw_args.append(packed_name)
+
+    return template_batched_validation.format(
+        name=cmd_name[2:],
+        params=get_internal_params(cmd_name, ["Context *context"] + params, cmd_packed_gl_enums),
+        shared_params=", ".join(shared_params),
+        shared_args=", ".join(shared_args),
+        draw_params=", ".join(draw_params),
+        draw_args=", ".join(draw_args),
+        drawcount=drawcount)
+
+
+def format_validation_proto(cmd_name, params, cmd_packed_gl_enums, cmd_batched_validation):
+    if cmd_name in cmd_batched_validation:
+        return format_batched_validation(cmd_name, params, cmd_packed_gl_enums,
+                                         cmd_batched_validation[cmd_name])
     internal_params = get_internal_params(cmd_name, ["Context *context"] + params,
                                           cmd_packed_gl_enums)
     return template_validation_proto % (cmd_name[2:], internal_params)
@@ -901,8 +983,30 @@ def path_to(folder, file):
     return os.path.join(script_relative(".."), "src", folder, file)
 
 
-def get_entry_points(all_commands, commands, is_explicit_context, is_wgl, all_param_types,
-                     cmd_packed_gl_enums):
+def get_command_table(command_signatures, is_wgl=False):
+    # Maps each entry point name to its position in the registry and its parsed signature, so the
+    # passes below only visit the commands they were asked for.
+    table = {}
+    for index, command in enumerate(command_signatures):
+        cmd_name = command.name
+        if is_wgl:
+            cmd_name = cmd_name if cmd_name[:3] == 'wgl' else 'wgl' + cmd_name
+        table.setdefault(cmd_name, (index, cmd_name, command))
+    return table
+
+
+def get_requested_commands(all_commands, commands):
+    # Returns (name, signature) for each requested command, in registry order.
+    requested = {}
+    for cmd_name in commands:
+        if cmd_name in all_commands:
+            index, name, command = all_commands[cmd_name]
+            requested[index] = (name, command)
+    return [requested[index] for index in sorted(requested)]
+
+
+def get_entry_points(all_commands, commands, is_explicit_context, all_param_types,
+                     cmd_packed_gl_enums, cmd_batched_validation):
     decls = []
     defs = []
     export_defs = []
@@ -911,18 +1015,9 @@ def get_entry_points(all_commands, commands, is_explicit_context, is_wgl, all_pa
     capture_methods = []
     capture_pointer_funcs = []
 
-    for command in all_commands:
-        proto = command.find('proto')
-        cmd_name = proto.find('name').text
-
-        if is_wgl:
-            cmd_name = cmd_name if cmd_name[:3] == 'wgl' else 'wgl' + cmd_name
-
-        if cmd_name not in commands:
-            continue
-
-        param_text = ["".join(param.itertext()) for param in command.findall('param')]
-        proto_text = "".join(proto.itertext())
+    for cmd_name, command in get_requested_commands(all_commands, commands):
+        param_text = [param.text for param in command.params]
+        proto_text = command.proto
         decls.append(
             format_entry_point_decl(cmd_name, proto_text, param_text, is_explicit_context))
         defs.append(
@@ -933,7 +1028,8 @@ def get_entry_points(all_commands, commands, is_explicit_context, is_wgl, all_pa
             format_libgles_entry_point_def(cmd_name, proto_text, param_text, is_explicit_context))
 
         validation_protos.append(
-            format_validation_proto(cmd_name, param_text, cmd_packed_gl_enums))
+            format_validation_proto(cmd_name, param_text, cmd_packed_gl_enums,
+                                    cmd_batched_validation))
         capture_protos.append(
             format_capture_proto(cmd_name, proto_text, param_text, cmd_packed_gl_enums))
         capture_methods.append(
@@ -943,16 +1039,50 @@ def get_entry_points(all_commands, commands, is_explicit_context, is_wgl, all_pa
     return decls, defs, export_defs, validation_protos, capture_protos, capture_methods, capture_pointer_funcs
 
 
+# Command tables, packed enums and batched validation data used by the entry point work units.
+# Workers either inherit them from the parent process or receive them through the pool initializer.
+_work_unit_state = {}
+
+
+def init_work_unit_state(command_tables, cmd_packed_gl_enums, cmd_batched_validation):
+    _work_unit_state['command_tables'] = command_tables
+    _work_unit_state['cmd_packed_gl_enums'] = cmd_packed_gl_enums
+    _work_unit_state['cmd_batched_validation'] = cmd_batched_validation
+
+
+def run_entry_point_unit(unit):
+    # The param types are returned instead of being accumulated so the parent can merge them.
+    table_name, commands, is_explicit_context, use_packed_gl_enums = unit
+    cmd_packed_gl_enums = _work_unit_state['cmd_packed_gl_enums'] if use_packed_gl_enums else {}
+    param_types = set()
+    entry_points = get_entry_points(_work_unit_state['command_tables'][table_name], commands,
+                                    is_explicit_context, param_types, cmd_packed_gl_enums,
+                                    _work_unit_state['cmd_batched_validation'])
+    return entry_points, param_types
+
+
+def run_entry_point_units(units, command_tables, cmd_packed_gl_enums, cmd_batched_validation):
+    # Runs the independent get_entry_points passes on a process pool. Results come back in the
+    # order of |units|, so the generated files don't depend on scheduling.
+    init_work_unit_state(command_tables, cmd_packed_gl_enums, cmd_batched_validation)
+    num_jobs = min(multiprocessing.cpu_count(), len(units))
+    if num_jobs <= 1:
+        return map(run_entry_point_unit, units)
+
+    pool = multiprocessing.Pool(num_jobs, init_work_unit_state,
+                                (command_tables, cmd_packed_gl_enums, cmd_batched_validation))
+    try:
+        return pool.map(run_entry_point_unit, units)
+    finally:
+        pool.close()
+        pool.join()
+
+
 def get_decls(formatter, all_commands, gles_commands, already_included, overloaded,
               cmd_packed_gl_enums):
     decls = []
-    for command in all_commands:
-        proto = command.find('proto')
-        cmd_name = proto.find('name').text
-
-        if cmd_name not in gles_commands:
-            continue
-
+    already_included = set(already_included)
+    for cmd_name, command in get_requested_commands(all_commands, gles_commands):
         if cmd_name in overloaded:
             continue
 
@@ -960,8 +1090,8 @@ def get_decls(formatter, all_commands, gles_commands, already_included, overload
         if name_no_suffix in already_included:
             continue
 
-        param_text = ["".join(param.itertext()) for param in command.findall('param')]
-        proto_text = "".join(proto.itertext())
+        param_text = [param.text for param in command.params]
+        proto_text = command.proto
         decls.append(
             format_context_decl(cmd_name, proto_text, param_text, formatter, cmd_packed_gl_enums))
 
@@ -976,15 +1106,9 @@ def get_glext_decls(all_commands, gles_commands, version, is_explicit_context):
     if (version == ""):
         is_gles1 = True
 
-    for command in all_commands:
-        proto = command.find('proto')
-        cmd_name = proto.find('name').text
-
-        if cmd_name not in gles_commands:
-            continue
-
-        param_text = ["".join(param.itertext()) for param in command.findall('param')]
-        proto_text = "".join(proto.itertext())
+    for cmd_name, command in get_requested_commands(all_commands, gles_commands):
+        param_text = [param.text for param in command.params]
+        proto_text = command.proto
 
         return_type = proto_text[:-len(cmd_name)]
         params = ", ".join(param_text)
@@ -1021,9 +1145,7 @@ def write_file(annotation, comment, template, entry_points, suffix, includes, li
 
     path = path_to(lib, "entry_points_{}_autogen.{}".format(annotation.lower(), suffix))
 
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
+    code_generation_utils.write_file_if_changed(path, content)
 
 
 def write_export_files(entry_points, includes, source, lib_name, lib_description):
@@ -1038,9 +1160,7 @@ def write_export_files(entry_points, includes, source, lib_name, lib_description
 
     path = path_to(lib_name, "{}_autogen.cpp".format(lib_name))
 
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
+    code_generation_utils.write_file_if_changed(path, content)
 
 
 def write_context_api_decls(template, decls, api):
@@ -1064,9 +1184,7 @@ def write_context_api_decls(template, decls, api):
 
         path = path_to("libANGLE", "Context_%s_autogen.h" % annotation.lower())
 
-        with open(path, "w") as out:
-            out.write(content)
-            out.close()
+        code_generation_utils.write_file_if_changed(path, content)
 
     if 'exts' in decls.keys():
         interface_lines = []
@@ -1088,9 +1206,7 @@ def write_context_api_decls(template, decls, api):
 
         path = path_to("libANGLE", "Context_gles_ext_autogen.h")
 
-        with open(path, "w") as out:
-            out.write(content)
-            out.close()
+        code_generation_utils.write_file_if_changed(path, content)
 
 
 def write_glext_explicit_context_inc(version, ptrs, protos):
@@ -1108,9 +1224,7 @@ def write_glext_explicit_context_inc(version, ptrs, protos):
         script_relative(".."), "include", "GLES{}".format(folder_version),
         "gl{}ext_explicit_context_autogen.inc".format(version))
 
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
+    code_generation_utils.write_file_if_changed(path, content)
 
 
 def write_validation_header(annotation, comment, protos, source):
@@ -1124,9 +1238,7 @@ def write_validation_header(annotation, comment, protos, source):
 
     path = path_to("libANGLE", "validation%s_autogen.h" % annotation)
 
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
+    code_generation_utils.write_file_if_changed(path, content)
 
 
 def write_capture_header(annotation, comment, protos, capture_pointer_funcs):
@@ -1141,9 +1253,7 @@ def write_capture_header(annotation, comment, protos, capture_pointer_funcs):
 
     path = path_to("libANGLE", "capture_gles_%s_autogen.h" % annotation)
 
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
+    code_generation_utils.write_file_if_changed(path, content)
 
 
 def write_capture_source(annotation_with_dash, annotation_no_dash, comment, capture_methods):
@@ -1158,9 +1268,7 @@ def write_capture_source(annotation_with_dash, annotation_no_dash, comment, capt
 
     path = path_to("libANGLE", "capture_gles_%s_autogen.cpp" % annotation_with_dash)
 
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
+    code_generation_utils.write_file_if_changed(path, content)
 
 
 def is_packed_enum_param_type(param_type):
@@ -1248,9 +1356,7 @@ def write_capture_helper_header(all_param_types):
 
     path = path_to("libANGLE", "frame_capture_utils_autogen.h")
 
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
+    code_generation_utils.write_file_if_changed(path, content)
 
 
 def format_param_type_to_string_case(param_type):
@@ -1274,9 +1380,7 @@ def write_capture_helper_source(all_param_types):
 
     path = path_to("libANGLE", "frame_capture_utils_autogen.cpp")
 
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
+    code_generation_utils.write_file_if_changed(path, content)
 
 
 def write_windows_def_file(data_source_name, lib, libexport, folder, exports):
@@ -1290,9 +1394,7 @@ def write_windows_def_file(data_source_name, lib, libexport, folder, exports):
 
     path = path_to(folder, "%s_autogen.def" % lib)
 
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
+    code_generation_utils.write_file_if_changed(path, content)
 
 
 def get_exports(commands, fmt=None):
@@ -1343,7 +1445,11 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['entry_point_packed_gl_enums.json'] + registry_xml.xml_inputs
+        inputs = [
+            'entry_point_packed_gl_enums.json',
+            'entry_point_batched_validation.json',
+            'code_generation_utils.py',
+        ] + registry_xml.xml_inputs
         outputs = [
             '../src/libANGLE/Context_gl_1_0_autogen.h',
             '../src/libANGLE/Context_gl_1_1_autogen.h',
@@ -1475,6 +1581,9 @@ def main():
     with open(script_relative('entry_point_packed_gl_enums.json')) as f:
         cmd_packed_gl_enums = json.loads(f.read())
 
+    with open(script_relative('entry_point_batched_validation.json')) as f:
+        cmd_batched_validation = json.loads(f.read())
+
     glesdecls = {}
     glesdecls['core'] = {}
     glesdecls['exts'] = {}
@@ -1487,35 +1596,85 @@ def main():
     libgles_ep_exports = []
 
     xml = registry_xml.RegistryXML('gl.xml', 'gl_angle_ext.xml')
+    all_commands = get_command_table(xml.command_signatures)
+    glxml = registry_xml.RegistryXML('gl.xml')
+    all_commands32 = get_command_table(glxml.command_signatures)
+    wglxml = registry_xml.RegistryXML('wgl.xml')
+    all_wgl_commands = get_command_table(wglxml.command_signatures, is_wgl=True)
+
+    # Since ES2+ is the primary use case, we go through those first and then add ES1-only APIs at
+    # the end.
+    gles_versions = [[2, 0], [3, 0], [3, 1], [1, 0]]
+    gl_versions = [[1, 0], [1, 1], [1, 2], [1, 3], [1, 4], [1, 5], [2, 0], [2, 1], [3, 0], [3, 1],
+                   [3, 2], [3, 3], [4, 0], [4, 1], [4, 2], [4, 3], [4, 4], [4, 5], [4, 6]]
+
+    # Resolve the commands of every version and extension first. Each registry filters out the
+    # commands added before, so this must run in order, but it is cheap. The entry points of each
+    # version and extension are then independent and are generated in parallel.
+    for major_version, minor_version in gles_versions:
+        version = "{}_{}".format(major_version, minor_version)
+        name_prefix = "GL_VERSION_ES_CM_" if major_version == 1 else "GL_ES_VERSION_"
+        xml.AddCommands("{}{}".format(name_prefix, version), version)
+
+    xml.AddExtensionCommands(registry_xml.supported_extensions, ['gles2', 'gles1'])
+
+    for major_version, minor_version in gl_versions:
+        version = "{}_{}".format(major_version, minor_version)
+        glxml.AddCommands("GL_VERSION_{}".format(version), version)
+
+    wglxml.AddCommands("WGL_VERSION_1_0", "1_0")
+    wgl_commands = wglxml.commands["1_0"]
+    wgl_commands = [cmd if cmd[:3] == 'wgl' else 'wgl' + cmd for cmd in wgl_commands]
+
+    # Each unit is (command table, commands, is_explicit_context, use_packed_gl_enums).
+    units = collections.OrderedDict()
+    for major_version, minor_version in gles_versions:
+        version = "{}_{}".format(major_version, minor_version)
+        units[('gles', version)] = ('gles', xml.commands[version], False, True)
+    for extension_name, ext_cmd_names in sorted(xml.ext_data.iteritems()):
+        units[('ext', extension_name)] = ('gles', ext_cmd_names, False, True)
+    if registry_xml.support_EGL_ANGLE_explicit_context:
+        units[('explicit_context',)] = ('gles', xml.all_cmd_names.get_all_commands(), True, True)
+    for major_version, minor_version in gl_versions:
+        version = "{}_{}".format(major_version, minor_version)
+        all_libgl_commands = glxml.commands[version]
+        # Validation duplicates handled with suffix
+        just_libgl_commands_suffix = [
+            cmd for cmd in all_libgl_commands if not xml.all_cmd_names.has_command(cmd)
+        ]
+        units[('gl_validation', version)] = ('gl', just_libgl_commands_suffix, False, True)
+        units[('gl', version)] = ('gl', all_libgl_commands, False, True)
+    units[('wgl',)] = ('wgl', wgl_commands, False, False)
+
+    command_tables = {'gles': all_commands, 'gl': all_commands32, 'wgl': all_wgl_commands}
+    unit_results = run_entry_point_units(units.values(), command_tables, cmd_packed_gl_enums,
+                                         cmd_batched_validation)
+
+    # Merge the results in unit order.
+    entry_points = {}
+    all_gles_param_types = set()
+    for key, (unit_entry_points, unit_param_types) in zip(units.keys(), unit_results):
+        entry_points[key] = unit_entry_points
+        if key != ('wgl',):
+            all_gles_param_types.update(unit_param_types)
 
     # Stores core commands to keep track of duplicates
     all_commands_no_suffix = []
-    all_commands_with_suffix = []
-    all_gles_param_types = set()
 
-    # First run through the main GLES entry points.  Since ES2+ is the primary use
-    # case, we go through those first and then add ES1-only APIs at the end.
-    for major_version, minor_version in [[2, 0], [3, 0], [3, 1], [1, 0]]:
+    # First run through the main GLES entry points.
+    for major_version, minor_version in gles_versions:
         version = "{}_{}".format(major_version, minor_version)
         annotation = "GLES_{}".format(version)
-        name_prefix = "GL_ES_VERSION_"
 
         is_gles1 = major_version == 1
-        if is_gles1:
-            name_prefix = "GL_VERSION_ES_CM_"
 
         comment = version.replace("_", ".")
-        feature_name = "{}{}".format(name_prefix, version)
-
-        xml.AddCommands(feature_name, version)
 
         gles_commands = xml.commands[version]
-        all_commands = xml.all_commands
         all_commands_no_suffix.extend(xml.commands[version])
-        all_commands_with_suffix.extend(xml.commands[version])
 
-        decls, defs, libgles_defs, validation_protos, capture_protos, capture_methods, capture_pointer_funcs = get_entry_points(
-            all_commands, gles_commands, False, False, all_gles_param_types, cmd_packed_gl_enums)
+        decls, defs, libgles_defs, validation_protos, capture_protos, capture_methods, capture_pointer_funcs = entry_points[
+            ('gles', version)]
 
         # Write the version as a comment before the first EP.
         libgles_defs.insert(0, "\n// OpenGL ES %s" % comment)
@@ -1573,15 +1732,11 @@ def main():
     for angle_ext in registry_xml.angle_extensions:
         glesdecls['exts']['ANGLE Extensions'][angle_ext] = []
 
-    xml.AddExtensionCommands(registry_xml.supported_extensions, ['gles2', 'gles1'])
-
     for extension_name, ext_cmd_names in sorted(xml.ext_data.iteritems()):
         extension_commands.extend(xml.ext_data[extension_name])
 
-        # Detect and filter duplicate extensions.
-        decls, defs, libgles_defs, validation_protos, capture_protos, capture_methods, capture_param_funcs = get_entry_points(
-            xml.all_commands, ext_cmd_names, False, False, all_gles_param_types,
-            cmd_packed_gl_enums)
+        decls, defs, libgles_defs, validation_protos, capture_protos, capture_methods, capture_param_funcs = entry_points[
+            ('ext', extension_name)]
 
         # Avoid writing out entry points defined by a prior extension.
         for dupe in xml.ext_dupes[extension_name]:
@@ -1621,7 +1776,6 @@ def main():
                 cmd_packed_gl_enums)
 
     for name in extension_commands:
-        all_commands_with_suffix.append(name)
         all_commands_no_suffix.append(strip_suffix(name))
 
     # Special handling for EGL_ANGLE_explicit_context extension
@@ -1634,8 +1788,8 @@ def main():
         cmds = xml.all_cmd_names.get_all_commands()
 
         # Get the explicit context entry points
-        decls, defs, libgles_defs, validation_protos, capture_protos, capture_methods, capture_param_funcs = get_entry_points(
-            xml.all_commands, cmds, True, False, all_gles_param_types, cmd_packed_gl_enums)
+        decls, defs, libgles_defs, validation_protos, capture_protos, capture_methods, capture_param_funcs = entry_points[
+            ('explicit_context',)]
 
         # Append the explicit context entry points
         extension_decls += decls
@@ -1684,38 +1838,22 @@ def main():
     libgl_ep_defs = []
     libgl_ep_exports = []
 
-    glxml = registry_xml.RegistryXML('gl.xml')
+    all_commands_no_suffix_set = set(all_commands_no_suffix)
 
-    for major_version, minor_version in [[1, 0], [1, 1], [1, 2], [1, 3], [1, 4], [1, 5], [2, 0],
-                                         [2, 1], [3, 0], [3, 1], [3, 2], [3, 3], [4, 0], [4, 1],
-                                         [4, 2], [4, 3], [4, 4], [4, 5], [4, 6]]:
+    for major_version, minor_version in gl_versions:
         version = "{}_{}".format(major_version, minor_version)
         annotation = "GL_{}".format(version)
-        name_prefix = "GL_VERSION_"
 
         comment = version.replace("_", ".")
-        feature_name = "{}{}".format(name_prefix, version)
-
-        glxml.AddCommands(feature_name, version)
 
         all_libgl_commands = glxml.commands[version]
 
         just_libgl_commands = [
-            cmd for cmd in all_libgl_commands if cmd not in all_commands_no_suffix
+            cmd for cmd in all_libgl_commands if cmd not in all_commands_no_suffix_set
         ]
-        just_libgl_commands_suffix = [
-            cmd for cmd in all_libgl_commands if cmd not in all_commands_with_suffix
-        ]
-
-        all_commands32 = glxml.all_commands
 
-        # Validation duplicates handled with suffix
-        _, _, _, validation_protos32, _, _, _ = get_entry_points(
-            all_commands32, just_libgl_commands_suffix, False, False, all_gles_param_types,
-            cmd_packed_gl_enums)
-        decls_gl, defs_gl, libgl_defs, _, _, _, _ = get_entry_points(
-            all_commands32, all_libgl_commands, False, False, all_gles_param_types,
-            cmd_packed_gl_enums)
+        _, _, _, validation_protos32, _, _, _ = entry_points[('gl_validation', version)]
+        decls_gl, defs_gl, libgl_defs, _, _, _, _ = entry_points[('gl', version)]
 
         # Write the version as a comment before the first EP.
         libgl_defs.insert(0, "\n// GL %s" % comment)
@@ -1746,21 +1884,10 @@ def main():
                                 "gl.xml and wgl.xml")
 
     # WGL
-    wglxml = registry_xml.RegistryXML('wgl.xml')
-
-    name_prefix = "WGL_VERSION_"
     version = "1_0"
     comment = version.replace("_", ".")
-    feature_name = "{}{}".format(name_prefix, version)
-    wglxml.AddCommands(feature_name, version)
-    wgl_commands = wglxml.commands[version]
-    all_commands32.extend(wglxml.all_commands)
-
-    wgl_commands = [cmd if cmd[:3] == 'wgl' else 'wgl' + cmd for cmd in wgl_commands]
 
-    wgl_param_types = set()
-    decls_wgl, defs_wgl, wgl_defs, validation_protos_wgl, _, _, _ = get_entry_points(
-        all_commands32, wgl_commands, False, True, wgl_param_types, {})
+    decls_wgl, defs_wgl, wgl_defs, validation_protos_wgl, _, _, _ = entry_points[('wgl',)]
 
     # Write the version as a comment before the first EP.
     libgl_ep_exports.append("\n    ; WGL %s" % comment)
@@ -1809,7 +1936,8 @@ def main():
     # Entry point enum
     cmd_names = ["Invalid"] + [cmd[2:] for cmd in xml.all_cmd_names.get_all_commands()]
     gl_cmd_names = [cmd[2:] for cmd in glxml.all_cmd_names.get_all_commands()]
-    cmd_names.extend([cmd for cmd in gl_cmd_names if cmd not in cmd_names])
+    cmd_names_set = set(cmd_names)
+    cmd_names.extend([cmd for cmd in gl_cmd_names if cmd not in cmd_names_set])
     sorted_cmd_names = sorted(cmd_names)
 
     entry_points_enum_header = template_entry_points_enum_header.format(
@@ -1820,24 +1948,29 @@ def main():
         entry_points_list=",\n".join(["    " + cmd for cmd in sorted_cmd_names]))
 
     entry_points_enum_header_path = path_to("libANGLE", "entry_points_enum_autogen.h")
-    with open(entry_points_enum_header_path, "w") as out:
-        out.write(entry_points_enum_header)
-        out.close()
-
-    entry_points_cases = [
-        template_entry_points_name_case.format(enum=cmd) for cmd in sorted_cmd_names
-    ]
+    code_generation_utils.write_file_if_changed(entry_points_enum_header_path,
+                                                entry_points_enum_header)
+
+    # All names are packed into one string, so that the lookup doesn't need a relocation per name.
+    entry_points_name_offsets = []
+    offset = 0
+    for cmd in sorted_cmd_names:
+        entry_points_name_offsets.append(offset)
+        offset += len("gl" + cmd) + 1
     entry_points_enum_source = template_entry_points_enum_source.format(
         script_name=os.path.basename(sys.argv[0]),
         data_source_name="gl.xml and gl_angle_ext.xml",
         year=date.today().year,
         lib="GL/GLES",
-        entry_points_name_cases="\n".join(entry_points_cases))
+        entry_points_names="\n".join(['    "gl%s\\0"' % cmd for cmd in sorted_cmd_names]),
+        entry_points_name_offsets="\n".join([
+            "    " + ", ".join([str(offset) for offset in entry_points_name_offsets[i:i + 12]]) +
+            "," for i in range(0, len(entry_points_name_offsets), 12)
+        ]))
 
     entry_points_enum_source_path = path_to("libANGLE", "entry_points_enum_autogen.cpp")
-    with open(entry_points_enum_source_path, "w") as out:
-        out.write(entry_points_enum_source)
-        out.close()
+    code_generation_utils.write_file_if_changed(entry_points_enum_source_path,
+                                                entry_points_enum_source)
 
     source_includes = """
     #include "angle_gl.h"
@@ -11,6 +11,7 @@
 import sys, os, pprint, json
 from datetime import date
 import registry_xml
+import code_generation_utils
 
 
 def write_header(data_source_name,
@@ -30,24 +31,22 @@ def write_header(data_source_name,
             return cmd
         return prefix + cmd[len(api):]
 
-    with open(header_path, "w") as out:
-        var_protos = [
-            "%sextern PFN%sPROC %s%s;" % (export, cmd.upper(), ns, pre(cmd)) for cmd in all_cmds
-        ]
-        loader_header = template_loader_h.format(
-            script_name=os.path.basename(sys.argv[0]),
-            data_source_name=data_source_name,
-            year=date.today().year,
-            function_pointers="\n".join(var_protos),
-            api_upper=api.upper(),
-            api_lower=api,
-            preamble=preamble,
-            export=export,
-            lib=lib.upper(),
-            load_fn_name="Load%s%s" % (prefix if prefix else "", api.upper()))
-
-        out.write(loader_header)
-        out.close()
+    var_protos = [
+        "%sextern PFN%sPROC %s%s;" % (export, cmd.upper(), ns, pre(cmd)) for cmd in all_cmds
+    ]
+    loader_header = template_loader_h.format(
+        script_name=os.path.basename(sys.argv[0]),
+        data_source_name=data_source_name,
+        year=date.today().year,
+        function_pointers="\n".join(var_protos),
+        api_upper=api.upper(),
+        api_lower=api,
+        preamble=preamble,
+        export=export,
+        lib=lib.upper(),
+        load_fn_name="Load%s%s" % (prefix if prefix else "", api.upper()))
+
+    code_generation_utils.write_file_if_changed(header_path, loader_header)
 
 
 def write_source(data_source_name, all_cmds, api, path, ns="", prefix=None, export=""):
@@ -59,24 +58,22 @@ def write_source(data_source_name, all_cmds, api, path, ns="", prefix=None, expo
             return cmd
         return prefix + cmd[len(api):]
 
-    with open(source_path, "w") as out:
-        var_defs = ["%sPFN%sPROC %s%s;" % (export, cmd.upper(), ns, pre(cmd)) for cmd in all_cmds]
+    var_defs = ["%sPFN%sPROC %s%s;" % (export, cmd.upper(), ns, pre(cmd)) for cmd in all_cmds]
 
-        setter = "    %s%s = reinterpret_cast<PFN%sPROC>(loadProc(\"%s\"));"
-        setters = [setter % (ns, pre(cmd), cmd.upper(), pre(cmd)) for cmd in all_cmds]
+    setter = "    %s%s = reinterpret_cast<PFN%sPROC>(loadProc(\"%s\"));"
+    setters = [setter % (ns, pre(cmd), cmd.upper(), pre(cmd)) for cmd in all_cmds]
 
-        loader_source = template_loader_cpp.format(
-            script_name=os.path.basename(sys.argv[0]),
-            data_source_name=data_source_name,
-            year=date.today().year,
-            function_pointers="\n".join(var_defs),
-            set_pointers="\n".join(setters),
-            api_upper=api.upper(),
-            api_lower=api,
-            load_fn_name="Load%s%s" % (prefix if prefix else "", api.upper()))
+    loader_source = template_loader_cpp.format(
+        script_name=os.path.basename(sys.argv[0]),
+        data_source_name=data_source_name,
+        year=date.today().year,
+        function_pointers="\n".join(var_defs),
+        set_pointers="\n".join(setters),
+        api_upper=api.upper(),
+        api_lower=api,
+        load_fn_name="Load%s%s" % (prefix if prefix else "", api.upper()))
 
-        out.write(loader_source)
-        out.close()
+    code_generation_utils.write_file_if_changed(source_path, loader_source)
 
 
 def gen_libegl_loader():
@@ -190,6 +187,7 @@ def main():
     # Handle inputs/outputs for run_code_generation.py's auto_script
     if len(sys.argv) > 1:
         inputs = [
+            'code_generation_utils.py',
             'egl.xml',
             'egl_angle_ext.xml',
             'registry_xml.py',
@@ -10,6 +10,9 @@
 # List of supported extensions. Add to this list to enable new extensions
 # available in gl.xml.
 
+import collections
+import hashlib
+import marshal
 import sys
 import os
 import xml.etree.ElementTree as etree
@@ -146,10 +149,132 @@ unsupported_enum_group_names = {
 }
 
 
+# Parsed registry roots, shared by all RegistryXML instances in the same process. The trees are
+# never modified once the ANGLE extensions have been appended.
+_registry_roots = {}
+
+# Compact snapshots of the registries are cached here, keyed by the hashes of the source XML files.
+# Bump the version whenever the snapshot layout changes.
+snapshot_dir = '.registry_snapshots'
+snapshot_version = 2
+
+
+# Parsed <command> and <param> elements.
+CommandSignature = collections.namedtuple('CommandSignature', ['name', 'proto', 'params'])
+CommandParam = collections.namedtuple('CommandParam', ['text', 'name', 'group'])
+
+
 def script_relative(path):
     return os.path.join(os.path.dirname(sys.argv[0]), path)
 
 
+# The registry files and their snapshots live next to this module, so generators outside scripts/
+# can load them too.
+def registry_relative(path):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+
+
+def _get_snapshot_key(xml_file, ext_file):
+    key = [snapshot_version]
+    for path in [xml_file, ext_file]:
+        if path:
+            with open(registry_relative(path), 'rb') as f:
+                key.append(hashlib.md5(f.read()).hexdigest())
+    return key
+
+
+def _get_snapshot_path(xml_file, ext_file):
+    name = '+'.join([path for path in [xml_file, ext_file] if path])
+    return registry_relative(os.path.join(snapshot_dir, name + '.marshal'))
+
+
+def _load_snapshot(path, key):
+    try:
+        with open(path, 'rb') as f:
+            snapshot = marshal.load(f)
+    except (IOError, EOFError, ValueError, TypeError):
+        return None
+    if snapshot.get('key') != key:
+        return None
+    return snapshot
+
+
+def _save_snapshot(path, snapshot):
+    # Generators may run concurrently, so write to a private file and move it into place.
+    temp_path = '%s.%d' % (path, os.getpid())
+    try:
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(temp_path, 'wb') as f:
+            marshal.dump(snapshot, f)
+        if os.path.exists(path):
+            os.remove(path)
+        os.rename(temp_path, path)
+    except OSError:
+        # The snapshot is only an optimization.
+        pass
+
+
+def _build_snapshot(root, key):
+    commands = []
+    for command in root.findall('commands/command'):
+        proto = command.find('proto')
+        params = [("".join(param.itertext()), param.find('name').text, param.attrib.get('group'))
+                  for param in command.findall('param')]
+        commands.append((proto.find('name').text, "".join(proto.itertext()), params))
+
+    enums = []
+    for enums_node in root.findall('enums'):
+        for enum in enums_node.findall('enum'):
+            enums.append((enum.attrib['name'], enum.attrib.get('value')))
+
+    groups = []
+    for group in root.findall('groups/group'):
+        groups.append((group.attrib['name'], [enum.attrib['name'] for enum in group.findall('enum')]))
+
+    features = []
+    feature_requirements = []
+    for feature in root.findall('feature'):
+        features.append((feature.attrib['name'],
+                         [command.attrib['name'] for command in feature.iter('command')],
+                         [enum.attrib['name'] for enum in feature.findall('require/enum')]))
+        removed = [(remove.attrib.get('profile'),
+                    [command.attrib['name'] for command in remove.findall('command')])
+                   for remove in feature.findall('remove')]
+        feature_requirements.append(
+            (feature.attrib['name'], feature.attrib.get('api'), feature.attrib.get('number'),
+             [command.attrib['name'] for command in feature.findall('require/command')], removed))
+
+    extensions = []
+    for extension in root.findall('extensions/extension'):
+        requires = []
+        for require in extension.findall('require'):
+            requires.append((require.attrib.get('api'), require.attrib.get('comment'),
+                             [command.attrib['name'] for command in require.findall('command')],
+                             [enum.attrib['name'] for enum in require.findall('enum')]))
+        extensions.append((extension.attrib['name'], extension.attrib.get('supported'), requires))
+
+    return {
+        'key': key,
+        'commands': commands,
+        'enums': enums,
+        'groups': groups,
+        'features': features,
+        'feature_requirements': feature_requirements,
+        'extensions': extensions,
+    }
+
+
+def _get_registry_key(xml_file, ext_file):
+    key = []
+    for path in [xml_file, ext_file]:
+        if path:
+            path = registry_relative(path)
+            st = os.stat(path)
+            key += [os.path.abspath(path), st.st_size, st.st_mtime]
+    return tuple(key)
+
+
 def path_to(folder, file):
     return os.path.join(script_relative(".."), "src", folder, file)
 
@@ -158,10 +283,15 @@ class GLCommandNames:
 
     def __init__(self):
         self.command_names = {}
+        # All command names across versions, for constant time membership tests.
+        self.command_name_set = set()
 
     def get_commands(self, version):
         return self.command_names[version]
 
+    def has_command(self, name):
+        return name in self.command_name_set
+
     def get_all_commands(self):
         cmd_names = []
         # Combine all the version lists into a single list
@@ -176,38 +306,93 @@ class GLCommandNames:
             self.command_names[version] = []
         # Add the commands that aren't duplicates
         self.command_names[version] += commands
+        self.command_name_set.update(commands)
 
 
-class RegistryXML:
+class RegistryXML(object):
 
     def __init__(self, xml_file, ext_file=None):
-        tree = etree.parse(script_relative(xml_file))
-        self.root = tree.getroot()
-        if (ext_file):
-            self._AppendANGLEExts(ext_file)
-        self.all_commands = self.root.findall('commands/command')
+        self.xml_file = xml_file
+        self.ext_file = ext_file
+        self._root = None
+        self._all_commands = None
+
+        # Load the registry contents from the snapshot when it matches the XML sources, so the
+        # XML only needs to be parsed when a caller asks for the element tree.
+        snapshot_path = _get_snapshot_path(xml_file, ext_file)
+        snapshot_key = _get_snapshot_key(xml_file, ext_file)
+        snapshot = _load_snapshot(snapshot_path, snapshot_key)
+        if snapshot is None:
+            snapshot = _build_snapshot(self.root, snapshot_key)
+            _save_snapshot(snapshot_path, snapshot)
+
+        # CommandSignatures in registry order.
+        self.command_signatures = [
+            CommandSignature(name, proto, [CommandParam(*param) for param in params])
+            for name, proto, params in snapshot['commands']
+        ]
+        # Lists of (name, value) for every <enum> in <enums>.
+        self.enums = snapshot['enums']
+        # Lists of (group name, [enum names]).
+        self.enum_groups = snapshot['groups']
+        # Lists of (feature name, [command names], [required enum names]).
+        self.features = snapshot['features']
+        # Lists of (feature name, api, number, [required command names],
+        # [(profile, [removed command names])]).
+        self.feature_requirements = snapshot['feature_requirements']
+        # Lists of (extension name, supported, [(api, comment, [command names], [enum names])]).
+        self.extensions = snapshot['extensions']
+
+        # Indexes over the snapshot so lookups don't need to scan the whole registry.
+        self.command_signature_index = {}
+        for signature in self.command_signatures:
+            self.command_signature_index.setdefault(signature.name, signature)
+        self.feature_commands = {}
+        for name, feature_commands, _ in self.features:
+            self.feature_commands.setdefault(name, []).extend(feature_commands)
+        self.extension_index = {}
+        for extension in self.extensions:
+            self.extension_index.setdefault(extension[0], []).append(extension)
+
         self.all_cmd_names = GLCommandNames()
         self.commands = {}
 
+    @property
+    def root(self):
+        if self._root is None:
+            key = _get_registry_key(self.xml_file, self.ext_file)
+            if key not in _registry_roots:
+                tree = etree.parse(registry_relative(self.xml_file))
+                self._root = tree.getroot()
+                if (self.ext_file):
+                    self._AppendANGLEExts(self.ext_file)
+                _registry_roots[key] = self._root
+            self._root = _registry_roots[key]
+        return self._root
+
+    @property
+    def all_commands(self):
+        if self._all_commands is None:
+            self._all_commands = self.root.findall('commands/command')
+        return self._all_commands
+
     def _AppendANGLEExts(self, ext_file):
-        angle_ext_tree = etree.parse(script_relative(ext_file))
+        angle_ext_tree = etree.parse(registry_relative(ext_file))
         angle_ext_root = angle_ext_tree.getroot()
 
-        insertion_point = self.root.findall("./commands")[0]
+        insertion_point = self._root.findall("./commands")[0]
         for command in angle_ext_root.iter('commands'):
             insertion_point.extend(command)
 
-        insertion_point = self.root.findall("./extensions")[0]
+        insertion_point = self._root.findall("./extensions")[0]
         for extension in angle_ext_root.iter('extensions'):
             insertion_point.extend(extension)
 
     def AddCommands(self, feature_name, annotation):
-        xpath = ".//feature[@name='%s']//command" % feature_name
-        commands = [cmd.attrib['name'] for cmd in self.root.findall(xpath)]
+        commands = self.feature_commands.get(feature_name, [])
 
         # Remove commands that have already been processed
-        current_cmds = self.all_cmd_names.get_all_commands()
-        commands = [cmd for cmd in commands if cmd not in current_cmds]
+        commands = [cmd for cmd in commands if not self.all_cmd_names.has_command(cmd)]
 
         self.all_cmd_names.add_commands(annotation, commands)
         self.commands[annotation] = commands
@@ -232,30 +417,29 @@ class RegistryXML:
         self.ext_dupes = {}
         ext_annotations = {}
 
-        for extension in self.root.findall("extensions/extension"):
-            extension_name = extension.attrib['name']
-            if not extension_name in supported_extensions:
-                continue
+        extensions = []
+        for extension_name in set(supported_extensions):
+            extensions += self.extension_index.get(extension_name, [])
+
+        for extension_name, supported, requires in extensions:
 
-            ext_annotations[extension_name] = self._ClassifySupport(extension.attrib['supported'])
+            ext_annotations[extension_name] = self._ClassifySupport(supported)
 
             ext_cmd_names = []
 
             # There's an extra step here to filter out 'api=gl' extensions. This
             # is necessary for handling KHR extensions, which have separate entry
-            # point signatures (without the suffix) for desktop GL. Note that this
-            # extra step is necessary because of Etree's limited Xpath support.
-            for require in extension.findall('require'):
-                if 'api' in require.attrib and require.attrib['api'] not in apis:
+            # point signatures (without the suffix) for desktop GL.
+            for api, comment, require_commands, _ in requires:
+                if api is not None and api not in apis:
                     continue
 
                 # A special case for EXT_texture_storage
                 filter_out_comment = "Supported only if GL_EXT_direct_state_access is supported"
-                if 'comment' in require.attrib and require.attrib['comment'] == filter_out_comment:
+                if comment == filter_out_comment:
                     continue
 
-                extension_commands = require.findall('command')
-                ext_cmd_names += [command.attrib['name'] for command in extension_commands]
+                ext_cmd_names += require_commands
 
             self.ext_data[extension_name] = sorted(ext_cmd_names)
 
@@ -264,7 +448,7 @@ class RegistryXML:
             # Detect and filter duplicate extensions.
             dupes = []
             for ext_cmd in ext_cmd_names:
-                if ext_cmd in self.all_cmd_names.get_all_commands():
+                if self.all_cmd_names.has_command(ext_cmd):
                     dupes.append(ext_cmd)
 
             for dupe in dupes:
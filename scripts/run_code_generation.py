@@ -7,17 +7,30 @@
 # run_code_generation.py:
 #   Runs ANGLE format table and other script code generation scripts.
 
+import argparse
 import hashlib
 import json
+import multiprocessing
 import os
+import Queue
+import runpy
+import StringIO
 import subprocess
 import sys
 import platform
+import time
+import traceback
+from multiprocessing.pool import ThreadPool
 
-script_dir = sys.path[0]
+import code_generation_utils
+
+script_dir = os.path.abspath(sys.path[0])
 root_dir = os.path.abspath(os.path.join(script_dir, '..'))
 
-hash_dir = 'code_generation_hashes'
+hash_dir = os.path.join(script_dir, 'code_generation_hashes')
+
+# Local, untracked cache of state that is expensive to recompute between runs.
+cache_file = os.path.join(script_dir, '.code_generation_cache.json')
 
 # auto_script is a standard way for scripts to return their inputs and outputs.
 
@@ -35,7 +48,8 @@ def clean_path_slashes(path):
 # Takes a script file name which is relative to the code generation script's directory and
 # changes it to be relative to the angle root directory
 def rebase_script_path(script_path, relative_path):
-    return os.path.relpath(os.path.join(os.path.dirname(script_path), relative_path), root_dir)
+    return os.path.relpath(
+        os.path.join(get_child_script_dirname(script_path), relative_path), root_dir)
 
 
 # Check if we need a module from vpython
@@ -45,26 +59,119 @@ def get_executable_name(first_line):
     return 'python'
 
 
-def grab_from_script(script, param):
-    res = ''
-    f = open(os.path.basename(script), "r")
-    res = subprocess.check_output([get_executable_name(f.readline()), script, param]).strip()
-    f.close()
+def get_script_executable(script):
+    with open(os.path.join(root_dir, script), "r") as f:
+        return get_executable_name(f.readline())
+
+
+def can_run_in_process(script):
+    # Scripts that need vpython rely on wheels this interpreter may not have.
+    return get_script_executable(script) == 'python'
+
+
+def run_script_in_process(script, args):
+    # Runs |script| as __main__ in this interpreter, the same way a child process would see it.
+    # Modules the script imports stay loaded, so their caches are shared with later scripts.
+    saved_cwd = os.getcwd()
+    saved_argv = sys.argv
+    saved_path = list(sys.path)
+    child_dir = get_child_script_dirname(script)
+    try:
+        os.chdir(child_dir)
+        sys.argv = [os.path.basename(script)] + args
+        sys.path.insert(0, child_dir)
+        runpy.run_path(os.path.basename(script), run_name='__main__')
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code)
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    finally:
+        os.chdir(saved_cwd)
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+
+
+def grab_from_script_in_process(script, param):
+    saved_stdout = sys.stdout
+    sys.stdout = StringIO.StringIO()
+    try:
+        result = run_script_in_process(script, [param])
+        output = sys.stdout.getvalue()
+    finally:
+        sys.stdout = saved_stdout
+    if result != 0:
+        raise subprocess.CalledProcessError(result, [script, param], output)
+    return output
+
+
+def grab_from_script(script, param, in_process=False):
+    if in_process and can_run_in_process(script):
+        res = grab_from_script_in_process(script, param).strip()
+    else:
+        res = subprocess.check_output(
+            [get_script_executable(script),
+             os.path.basename(script), param],
+            cwd=get_child_script_dirname(script)).strip()
     if res == '':
         return []
     return [clean_path_slashes(rebase_script_path(script, name)) for name in res.split(',')]
 
 
-def auto_script(script):
-    # Set the CWD to the script directory.
-    os.chdir(get_child_script_dirname(script))
-    base_script = os.path.basename(script)
-    info = {
-        'inputs': grab_from_script(base_script, 'inputs'),
-        'outputs': grab_from_script(base_script, 'outputs')
+def auto_script(script, in_process=False):
+    return {
+        'inputs': grab_from_script(script, 'inputs', in_process),
+        'outputs': grab_from_script(script, 'outputs', in_process)
+    }
+
+
+def list_input_dirs(inputs):
+    # Snapshot the directories holding the inputs, restricted to the file types the generator
+    # already consumes from them. This catches new inputs such as an added shader source.
+    extensions = {}
+    for input in inputs:
+        extensions.setdefault(os.path.dirname(input), set()).add(os.path.splitext(input)[1])
+
+    listing = {}
+    for dirname, dir_extensions in extensions.iteritems():
+        if not os.path.isdir(dirname or '.'):
+            continue
+        listing[dirname] = sorted(
+            f for f in os.listdir(dirname or '.') if os.path.splitext(f)[1] in dir_extensions)
+    return listing
+
+
+def is_auto_script_cache_valid(script, entry):
+    if entry.get('script') != md5(script):
+        return False
+    for input, input_hash in entry['input_hashes'].iteritems():
+        if not os.path.isfile(input) or md5(input) != input_hash:
+            return False
+    return list_input_dirs(entry['inputs']) == entry['input_dirs']
+
+
+def cached_auto_script(script, cache, in_process=False):
+    # The declared inputs and outputs only change when the generator script or one of its inputs
+    # (such as an imported helper or a variation file) changes, so they can be reused as long as
+    # those hashes still match.
+    entry = cache.get(script)
+    if entry and is_auto_script_cache_valid(script, entry):
+        return {'inputs': entry['inputs'], 'outputs': entry['outputs']}
+
+    info = auto_script(script, in_process)
+    cache[script] = {
+        'script': md5(script),
+        'inputs': info['inputs'],
+        'outputs': info['outputs'],
+        'input_hashes': {
+            input: md5(input) for input in info['inputs'] if os.path.isfile(input)
+        },
+        'input_dirs': list_input_dirs(info['inputs']),
     }
-    # Reset the CWD to the root ANGLE directory.
-    os.chdir(root_dir)
     return info
 
 
@@ -112,14 +219,49 @@ generators = {
 }
 
 
-def md5(fname):
+# Maps a file name to [size, mtime_ns, inode, md5] from the last time it was hashed. Shared by all
+# generators and persisted in the cache file between runs.
+file_hashes = {}
+
+# Stat records younger than this may be followed by a same-timestamp write, so they aren't saved.
+racy_stat_window_ns = 2 * 1000 * 1000 * 1000
+
+
+def compute_md5(fname):
     hash_md5 = hashlib.md5()
-    with open(fname, "r") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+    # Text mode on Windows keeps the hashes of CRLF checkouts identical to other platforms.
+    with open(fname, "r" if os.name == 'nt' else "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
 
 
+def get_stat_signature(fname):
+    st = os.stat(fname)
+    mtime_ns = getattr(st, 'st_mtime_ns', int(st.st_mtime * 1000000000))
+    return [st.st_size, mtime_ns, st.st_ino]
+
+
+def md5(fname):
+    # Only rehash a file when its size, modification time or inode changed since it was last hashed.
+    signature = get_stat_signature(fname)
+    record = file_hashes.get(fname)
+    if record is None or record[:3] != signature:
+        record = signature + [compute_md5(fname)]
+        file_hashes[fname] = record
+    return record[3]
+
+
+def get_persistent_file_hashes():
+    # Drop records for files that were modified too recently to trust their timestamp.
+    now_ns = int(time.time() * 1000000000)
+    return {
+        fname: record
+        for fname, record in file_hashes.iteritems()
+        if record[1] < now_ns - racy_stat_window_ns
+    }
+
+
 def get_hash_file_name(name):
     return name.replace(' ', '_').replace('/', '_') + '.json'
 
@@ -161,6 +303,159 @@ def update_output_hashes(script, outputs, new_hashes):
         new_hashes[output] = md5(output)
 
 
+def update_input_hashes(inputs, new_hashes):
+    # Inputs that are outputs of other generators can change during the run.
+    for input in inputs:
+        if os.path.isfile(input):
+            new_hashes[input] = md5(input)
+
+
+def count_changed_outputs(names, infos, old_hashes):
+    # Generators only rewrite outputs whose contents changed. Returns how many of the outputs of
+    # the generators in |names| differ from |old_hashes|, and the total number of outputs.
+    outputs = set()
+    for name in names:
+        outputs.update(infos[name]['outputs'])
+    changed = [
+        output for output in outputs
+        if not os.path.isfile(output) or md5(output) != old_hashes.get(output)
+    ]
+    return len(changed), len(outputs)
+
+
+def build_dependency_graph(infos):
+    # A generator depends on another if it consumes one of its outputs. Generators that write the
+    # same output file are also ordered so they never run at the same time.
+    deps = {name: set() for name in infos}
+    producers = {}
+    for name in sorted(infos):
+        for output in infos[name]['outputs']:
+            for producer in producers.get(output, []):
+                deps[name].add(producer)
+            producers.setdefault(output, []).append(name)
+    for name in sorted(infos):
+        for input in infos[name]['inputs']:
+            for producer in producers.get(input, []):
+                if producer != name:
+                    deps[name].add(producer)
+    return deps
+
+
+def add_dependents(dirty_generators, deps):
+    # A generator that consumes an output of a dirty generator can see that output change, so it
+    # runs too. Returns |dirty_generators| with all of their transitive dependents.
+    dependents = {name: set() for name in deps}
+    for name, name_deps in deps.iteritems():
+        for dep in name_deps:
+            dependents[dep].add(name)
+
+    to_run = set()
+    to_visit = list(dirty_generators)
+    while to_visit:
+        name = to_visit.pop()
+        if name not in to_run:
+            to_run.add(name)
+            to_visit.extend(dependents[name])
+    return to_run
+
+
+def run_generator(name, script, in_process=False):
+    # Failures are returned as a non-zero result, since an exception raised on a pool thread would
+    # never reach run_generators.
+    print('Running ' + name + ' code generator')
+    start = time.time()
+    try:
+        if in_process and can_run_in_process(script):
+            result = run_script_in_process(script, [])
+        else:
+            result = subprocess.call([get_script_executable(script),
+                                      os.path.basename(script)],
+                                     cwd=get_child_script_dirname(script))
+    except Exception:
+        traceback.print_exc()
+        result = 1
+    return name, result, time.time() - start
+
+
+def wait_for_generator(finished):
+    # Generators can take arbitrarily long, e.g. a cold shader build on a slow bot. Queue.get without
+    # a timeout cannot be interrupted with Ctrl-C in Python 2, so wait in short steps instead.
+    while True:
+        try:
+            return finished.get(timeout=1)
+        except Queue.Empty:
+            pass
+
+
+def run_generators(to_run, deps, num_jobs, in_process=False):
+    # Runs the generators in |to_run| concurrently, starting each one as soon as every generator
+    # it depends on has finished. Returns a dictionary of generator name to wall time.
+    # In-process generators share the working directory, so they always run one at a time.
+    if in_process:
+        num_jobs = 1
+    pending = {name: deps[name] & to_run for name in to_run}
+    finished = Queue.Queue()
+    timings = {}
+    failed = []
+    running = 0
+
+    pool = ThreadPool(num_jobs)
+    try:
+        while pending or running > 0:
+            ready = sorted(name for name, waiting in pending.iteritems() if not waiting)
+            for name in ready:
+                del pending[name]
+                pool.apply_async(
+                    run_generator, (name, generators[name], in_process), callback=finished.put)
+                running += 1
+
+            if running == 0:
+                print('Dependency cycle between generators: %s' % ', '.join(sorted(pending)))
+                sys.exit(1)
+
+            name, result, elapsed = wait_for_generator(finished)
+            running -= 1
+            timings[name] = elapsed
+            if result != 0:
+                print('%s code generator failed' % name)
+                failed.append(name)
+                pending.clear()
+                continue
+
+            for waiting in pending.itervalues():
+                waiting.discard(name)
+    finally:
+        pool.close()
+        pool.join()
+
+    if failed:
+        sys.exit(1)
+    return timings
+
+
+def print_timings(timings):
+    print('Code generator timings:')
+    for name, elapsed in sorted(timings.iteritems(), key=lambda item: -item[1]):
+        print('  %7.2fs  %s' % (elapsed, name))
+
+
+def load_cache():
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (IOError, ValueError):
+        cache = {}
+    cache.setdefault('auto_script', {})
+    cache.setdefault('files', {})
+    return cache
+
+
+def save_cache(cache):
+    cache['files'] = get_persistent_file_hashes()
+    with open(cache_file, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+
 def load_hashes():
     hashes = {}
     for file in os.listdir(hash_dir):
@@ -171,18 +466,41 @@ def load_hashes():
 
 
 def main():
-    os.chdir(script_dir)
+    parser = argparse.ArgumentParser(description='Runs ANGLE code generation scripts.')
+    parser.add_argument(
+        '--verify-no-dirty',
+        dest='verify_only',
+        action='store_true',
+        help='Only check that the generated files are up to date.')
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=multiprocessing.cpu_count(),
+        help='Maximum number of generators to run at the same time.')
+    parser.add_argument(
+        '--in-process',
+        action='store_true',
+        help='Run the generators one after another inside this interpreter, sharing parsed '
+        'registries and JSON tables, instead of starting a child process for each.')
+    args = parser.parse_args()
+
+    # All generator inputs and outputs are relative to the ANGLE root.
+    os.chdir(root_dir)
 
     all_old_hashes = load_hashes()
     all_new_hashes = {}
     any_dirty = False
+    dirty_generators = set()
 
-    verify_only = False
-    if len(sys.argv) > 1 and sys.argv[1] == '--verify-no-dirty':
-        verify_only = True
+    cache = load_cache()
+    file_hashes.update(cache['files'])
+    infos = {}
+    for name, script in sorted(generators.iteritems()):
+        infos[name] = cached_auto_script(script, cache['auto_script'], args.in_process)
 
     for name, script in sorted(generators.iteritems()):
-        info = auto_script(script)
+        info = infos[name]
         fname = get_hash_file_name(name)
         filenames = info['inputs'] + info['outputs'] + [script]
         new_hashes = {}
@@ -190,18 +508,7 @@ def main():
             all_old_hashes[fname] = {}
         if any_hash_dirty(name, filenames, new_hashes, all_old_hashes[fname]):
             any_dirty = True
-
-            if not verify_only:
-                # Set the CWD to the script directory.
-                os.chdir(get_child_script_dirname(script))
-
-                print('Running ' + name + ' code generator')
-
-                f = open(os.path.basename(script), "r")
-                if subprocess.call([get_executable_name(f.readline()),
-                                    os.path.basename(script)]) != 0:
-                    sys.exit(1)
-                f.close()
+            dirty_generators.add(name)
 
         # Update the hash dictionary.
         all_new_hashes[fname] = new_hashes
@@ -209,9 +516,20 @@ def main():
     if any_old_hash_missing(all_new_hashes, all_old_hashes):
         any_dirty = True
 
-    if verify_only:
+    if args.verify_only:
+        save_cache(cache)
         sys.exit(any_dirty)
 
+    old_output_hashes = {}
+    for new_hashes in all_new_hashes.itervalues():
+        old_output_hashes.update(new_hashes)
+
+    if dirty_generators:
+        deps = build_dependency_graph(infos)
+        dirty_generators = add_dependents(dirty_generators, deps)
+        timings = run_generators(dirty_generators, deps, max(1, args.jobs), args.in_process)
+        print_timings(timings)
+
     if any_dirty:
         args = ['git.bat'] if os.name == 'nt' else ['git']
         # The diff can be so large the arguments to clang-format can break the Windows command
@@ -220,22 +538,26 @@ def main():
         print('Calling git cl format')
         subprocess.call(args)
 
-        # Update the output hashes again since they can be formatted.
+        # Update the output hashes again since they can be formatted, and the input hashes since
+        # they can be outputs of generators that ran.
         for name, script in sorted(generators.iteritems()):
-            info = auto_script(script)
             fname = get_hash_file_name(name)
-            update_output_hashes(name, info['outputs'], all_new_hashes[fname])
-
-        os.chdir(script_dir)
+            update_output_hashes(name, infos[name]['outputs'], all_new_hashes[fname])
+            update_input_hashes(infos[name]['inputs'], all_new_hashes[fname])
 
         for fname, new_hashes in all_new_hashes.iteritems():
             hash_fname = os.path.join(hash_dir, fname)
-            json.dump(
-                new_hashes,
-                open(hash_fname, "w"),
-                indent=2,
-                sort_keys=True,
-                separators=(',', ':\n    '))
+            code_generation_utils.write_file_if_changed(
+                hash_fname,
+                json.dumps(new_hashes, indent=2, sort_keys=True, separators=(',', ':\n    ')))
+
+    # Counted after formatting, which can restore outputs the generators rewrote.
+    if dirty_generators:
+        num_changed, num_outputs = count_changed_outputs(dirty_generators, infos,
+                                                         old_output_hashes)
+        print('%d of %d generated files changed.' % (num_changed, num_outputs))
+
+    save_cache(cache)
 
 
 if __name__ == '__main__':
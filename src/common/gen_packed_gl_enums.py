@@ -10,6 +10,9 @@ import datetime, json, os, sys
 from collections import namedtuple
 from collections import OrderedDict
 
+sys.path.append('../../scripts')
+import code_generation_utils
+
 Enum = namedtuple('Enum', ['name', 'values', 'max_value'])
 EnumValue = namedtuple('EnumValue', ['name', 'gl_name', 'value'])
 
@@ -131,8 +134,7 @@ def write_header(enums, path_prefix, file_name, data_source_name, namespace, api
         namespace=namespace,
         api_enum_name=api_enum_name)
 
-    with (open(path_prefix + file_name, 'wt')) as f:
-        f.write(header)
+    code_generation_utils.write_file_if_changed(path_prefix + file_name, header)
 
 
 cpp_template = """// GENERATED FILE - DO NOT EDIT.
@@ -227,15 +229,14 @@ def write_cpp(enums, path_prefix, file_name, data_source_name, namespace, api_en
         namespace=namespace,
         api_enum_name=api_enum_name)
 
-    with (open(path_prefix + file_name, 'wt')) as f:
-        f.write(cpp)
+    code_generation_utils.write_file_if_changed(path_prefix + file_name, cpp)
 
 
 def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = []
+        inputs = ['../../scripts/code_generation_utils.py']
         outputs = []
         for generator in Generators:
             inputs += [generator['json']]
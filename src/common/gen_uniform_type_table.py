@@ -11,6 +11,9 @@ from datetime import date
 
 import sys
 
+sys.path.append('../../scripts')
+import code_generation_utils
+
 all_uniform_types = [
     "GL_NONE", "GL_BOOL", "GL_BOOL_VEC2", "GL_BOOL_VEC3", "GL_BOOL_VEC4", "GL_FLOAT",
     "GL_FLOAT_MAT2", "GL_FLOAT_MAT2x3", "GL_FLOAT_MAT2x4", "GL_FLOAT_MAT3", "GL_FLOAT_MAT3x2",
@@ -261,7 +264,7 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = []
+        inputs = ['../../scripts/code_generation_utils.py']
         outputs = ['uniform_type_info_autogen.cpp']
 
         if sys.argv[1] == 'inputs':
@@ -280,15 +283,13 @@ def main():
         for index, uniform_type in enumerate(all_uniform_types)
     ])
 
-    with open('uniform_type_info_autogen.cpp', 'wt') as out_file:
-        output_cpp = template_cpp.format(
-            script_name=sys.argv[0],
-            copyright_year=date.today().year,
-            total_count=len(all_uniform_types),
-            uniform_type_info_data=uniform_type_info_data,
-            uniform_type_index_cases=uniform_type_index_cases)
-        out_file.write(output_cpp)
-        out_file.close()
+    output_cpp = template_cpp.format(
+        script_name=sys.argv[0],
+        copyright_year=date.today().year,
+        total_count=len(all_uniform_types),
+        uniform_type_info_data=uniform_type_info_data,
+        uniform_type_index_cases=uniform_type_index_cases)
+    code_generation_utils.write_file_if_changed('uniform_type_info_autogen.cpp', output_cpp)
     return 0
 
 
@@ -5894,8 +5894,6 @@ namespace BuiltInParameters
 {
 
 constexpr const TVariable **empty        = nullptr;
-constexpr const TVariable *p00B00B00B[3] = {
-    &BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt00B};
 constexpr const TVariable *p00B00B00F[3] = {
     &BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt00F};
 constexpr const TVariable *p00B00B10B[3] = {
@@ -5904,10 +5902,6 @@ constexpr const TVariable *p00B00B20B[3] = {
     &BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt20B};
 constexpr const TVariable *p00B00B30B[3] = {
     &BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt30B};
-constexpr const TVariable *p00B00D[2] = {&BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt00D};
-constexpr const TVariable *p00B10B[2] = {&BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt10B};
-constexpr const TVariable *p00B20B[2] = {&BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt20B};
-constexpr const TVariable *p00B30B[2] = {&BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt30B};
 constexpr const TVariable *p00B_o_00B[2] = {&BuiltInVariable::var_pt00B,
                                             &BuiltInVariable::var_pt_o_00B};
 constexpr const TVariable *p00B_o_00D[2] = {&BuiltInVariable::var_pt00B,
@@ -5925,9 +5919,6 @@ constexpr const TVariable *p00C00C20C[3] = {
 constexpr const TVariable *p00C00C30C[3] = {
     &BuiltInVariable::var_pt00C, &BuiltInVariable::var_pt00C, &BuiltInVariable::var_pt30C};
 constexpr const TVariable *p00C00D[2] = {&BuiltInVariable::var_pt00C, &BuiltInVariable::var_pt00D};
-constexpr const TVariable *p00C10C[2] = {&BuiltInVariable::var_pt00C, &BuiltInVariable::var_pt10C};
-constexpr const TVariable *p00C20C[2] = {&BuiltInVariable::var_pt00C, &BuiltInVariable::var_pt20C};
-constexpr const TVariable *p00C30C[2] = {&BuiltInVariable::var_pt00C, &BuiltInVariable::var_pt30C};
 constexpr const TVariable *p00C_o_00C[2]    = {&BuiltInVariable::var_pt00C,
                                             &BuiltInVariable::var_pt_o_00C};
 constexpr const TVariable *p00C_o_00D[2]    = {&BuiltInVariable::var_pt00C,
@@ -5940,8 +5931,6 @@ constexpr const TVariable *p00D00D00F[3] = {
 constexpr const TVariable *p00D00D_o_00D_o_00D[4] = {
     &BuiltInVariable::var_pt00D, &BuiltInVariable::var_pt00D, &BuiltInVariable::var_pt_o_00D,
     &BuiltInVariable::var_pt_o_00D};
-constexpr const TVariable *p00E00D00D[3] = {
-    &BuiltInVariable::var_pt00E, &BuiltInVariable::var_pt00D, &BuiltInVariable::var_pt00D};
 constexpr const TVariable *p00E00E00D00D[4] = {
     &BuiltInVariable::var_pt00E, &BuiltInVariable::var_pt00E, &BuiltInVariable::var_pt00D,
     &BuiltInVariable::var_pt00D};
@@ -6955,16 +6944,10 @@ constexpr const TVariable *p01k[1]    = {&BuiltInVariable::var_pt01k};
 constexpr const TVariable *p01l00D[2] = {&BuiltInVariable::var_pt01l, &BuiltInVariable::var_pt00D};
 constexpr const TVariable *p01m00D[2] = {&BuiltInVariable::var_pt01m, &BuiltInVariable::var_pt00D};
 constexpr const TVariable *p01n00D[2] = {&BuiltInVariable::var_pt01n, &BuiltInVariable::var_pt00D};
-constexpr const TVariable *p10B00B00B[3] = {
-    &BuiltInVariable::var_pt10B, &BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt00B};
-constexpr const TVariable *p10B00D[2] = {&BuiltInVariable::var_pt10B, &BuiltInVariable::var_pt00D};
 constexpr const TVariable *p10B10B00B[3] = {
     &BuiltInVariable::var_pt10B, &BuiltInVariable::var_pt10B, &BuiltInVariable::var_pt00B};
-constexpr const TVariable *p10B10B10B[3] = {
-    &BuiltInVariable::var_pt10B, &BuiltInVariable::var_pt10B, &BuiltInVariable::var_pt10B};
 constexpr const TVariable *p10B10B10F[3] = {
     &BuiltInVariable::var_pt10B, &BuiltInVariable::var_pt10B, &BuiltInVariable::var_pt10F};
-constexpr const TVariable *p10B10D[2] = {&BuiltInVariable::var_pt10B, &BuiltInVariable::var_pt10D};
 constexpr const TVariable *p10B20B[2] = {&BuiltInVariable::var_pt10B, &BuiltInVariable::var_pt20B};
 constexpr const TVariable *p10B30B[2] = {&BuiltInVariable::var_pt10B, &BuiltInVariable::var_pt30B};
 constexpr const TVariable *p10B_o_10B[2] = {&BuiltInVariable::var_pt10B,
@@ -6982,12 +6965,10 @@ constexpr const TVariable *p10C10C10C[3] = {
 constexpr const TVariable *p10C10C10F[3] = {
     &BuiltInVariable::var_pt10C, &BuiltInVariable::var_pt10C, &BuiltInVariable::var_pt10F};
 constexpr const TVariable *p10C10D[2] = {&BuiltInVariable::var_pt10C, &BuiltInVariable::var_pt10D};
-constexpr const TVariable *p10C_o_10C[2] = {&BuiltInVariable::var_pt10C,
+constexpr const TVariable *p10C_o_10C[2]    = {&BuiltInVariable::var_pt10C,
                                             &BuiltInVariable::var_pt_o_10C};
-constexpr const TVariable *p10C_o_10D[2] = {&BuiltInVariable::var_pt10C,
+constexpr const TVariable *p10C_o_10D[2]    = {&BuiltInVariable::var_pt10C,
                                             &BuiltInVariable::var_pt_o_10D};
-constexpr const TVariable *p10D00D00D[3] = {
-    &BuiltInVariable::var_pt10D, &BuiltInVariable::var_pt00D, &BuiltInVariable::var_pt00D};
 constexpr const TVariable *p10D10D00D00D[4] = {
     &BuiltInVariable::var_pt10D, &BuiltInVariable::var_pt10D, &BuiltInVariable::var_pt00D,
     &BuiltInVariable::var_pt00D};
@@ -6998,8 +6979,6 @@ constexpr const TVariable *p10D10D10F[3] = {
 constexpr const TVariable *p10D10D_o_10D_o_10D[4] = {
     &BuiltInVariable::var_pt10D, &BuiltInVariable::var_pt10D, &BuiltInVariable::var_pt_o_10D,
     &BuiltInVariable::var_pt_o_10D};
-constexpr const TVariable *p10E00D00D[3] = {
-    &BuiltInVariable::var_pt10E, &BuiltInVariable::var_pt00D, &BuiltInVariable::var_pt00D};
 constexpr const TVariable *p10E00E00E[3] = {
     &BuiltInVariable::var_pt10E, &BuiltInVariable::var_pt00E, &BuiltInVariable::var_pt00E};
 constexpr const TVariable *p10E10E00D00D[4] = {
@@ -7014,18 +6993,11 @@ constexpr const TVariable *p10E10E_o_10E_o_10E[4] = {
     &BuiltInVariable::var_pt_o_10E};
 constexpr const TVariable *p10F10F10F[3] = {
     &BuiltInVariable::var_pt10F, &BuiltInVariable::var_pt10F, &BuiltInVariable::var_pt10F};
-constexpr const TVariable *p20B00B00B[3] = {
-    &BuiltInVariable::var_pt20B, &BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt00B};
-constexpr const TVariable *p20B00D[2] = {&BuiltInVariable::var_pt20B, &BuiltInVariable::var_pt00D};
 constexpr const TVariable *p20B00H[2] = {&BuiltInVariable::var_pt20B, &BuiltInVariable::var_pt00H};
-constexpr const TVariable *p20B10B[2] = {&BuiltInVariable::var_pt20B, &BuiltInVariable::var_pt10B};
 constexpr const TVariable *p20B20B00B[3] = {
     &BuiltInVariable::var_pt20B, &BuiltInVariable::var_pt20B, &BuiltInVariable::var_pt00B};
-constexpr const TVariable *p20B20B20B[3] = {
-    &BuiltInVariable::var_pt20B, &BuiltInVariable::var_pt20B, &BuiltInVariable::var_pt20B};
 constexpr const TVariable *p20B20B20F[3] = {
     &BuiltInVariable::var_pt20B, &BuiltInVariable::var_pt20B, &BuiltInVariable::var_pt20F};
-constexpr const TVariable *p20B20D[2] = {&BuiltInVariable::var_pt20B, &BuiltInVariable::var_pt20D};
 constexpr const TVariable *p20B30B[2] = {&BuiltInVariable::var_pt20B, &BuiltInVariable::var_pt30B};
 constexpr const TVariable *p20B_o_20B[2] = {&BuiltInVariable::var_pt20B,
                                             &BuiltInVariable::var_pt_o_20B};
@@ -7042,12 +7014,10 @@ constexpr const TVariable *p20C20C20C[3] = {
 constexpr const TVariable *p20C20C20F[3] = {
     &BuiltInVariable::var_pt20C, &BuiltInVariable::var_pt20C, &BuiltInVariable::var_pt20F};
 constexpr const TVariable *p20C20D[2] = {&BuiltInVariable::var_pt20C, &BuiltInVariable::var_pt20D};
-constexpr const TVariable *p20C_o_20C[2] = {&BuiltInVariable::var_pt20C,
+constexpr const TVariable *p20C_o_20C[2]    = {&BuiltInVariable::var_pt20C,
                                             &BuiltInVariable::var_pt_o_20C};
-constexpr const TVariable *p20C_o_20D[2] = {&BuiltInVariable::var_pt20C,
+constexpr const TVariable *p20C_o_20D[2]    = {&BuiltInVariable::var_pt20C,
                                             &BuiltInVariable::var_pt_o_20D};
-constexpr const TVariable *p20D00D00D[3] = {
-    &BuiltInVariable::var_pt20D, &BuiltInVariable::var_pt00D, &BuiltInVariable::var_pt00D};
 constexpr const TVariable *p20D20D00D00D[4] = {
     &BuiltInVariable::var_pt20D, &BuiltInVariable::var_pt20D, &BuiltInVariable::var_pt00D,
     &BuiltInVariable::var_pt00D};
@@ -7058,8 +7028,6 @@ constexpr const TVariable *p20D20D20F[3] = {
 constexpr const TVariable *p20D20D_o_20D_o_20D[4] = {
     &BuiltInVariable::var_pt20D, &BuiltInVariable::var_pt20D, &BuiltInVariable::var_pt_o_20D,
     &BuiltInVariable::var_pt_o_20D};
-constexpr const TVariable *p20E00D00D[3] = {
-    &BuiltInVariable::var_pt20E, &BuiltInVariable::var_pt00D, &BuiltInVariable::var_pt00D};
 constexpr const TVariable *p20E00E00E[3] = {
     &BuiltInVariable::var_pt20E, &BuiltInVariable::var_pt00E, &BuiltInVariable::var_pt00E};
 constexpr const TVariable *p20E20E00D00D[4] = {
@@ -7074,11 +7042,6 @@ constexpr const TVariable *p20E20E_o_20E_o_20E[4] = {
     &BuiltInVariable::var_pt_o_20E};
 constexpr const TVariable *p20F20F20F[3] = {
     &BuiltInVariable::var_pt20F, &BuiltInVariable::var_pt20F, &BuiltInVariable::var_pt20F};
-constexpr const TVariable *p30B00B00B[3] = {
-    &BuiltInVariable::var_pt30B, &BuiltInVariable::var_pt00B, &BuiltInVariable::var_pt00B};
-constexpr const TVariable *p30B00D[2] = {&BuiltInVariable::var_pt30B, &BuiltInVariable::var_pt00D};
-constexpr const TVariable *p30B10B[2] = {&BuiltInVariable::var_pt30B, &BuiltInVariable::var_pt10B};
-constexpr const TVariable *p30B20B[2] = {&BuiltInVariable::var_pt30B, &BuiltInVariable::var_pt20B};
 constexpr const TVariable *p30B30B00B[3] = {
     &BuiltInVariable::var_pt30B, &BuiltInVariable::var_pt30B, &BuiltInVariable::var_pt00B};
 constexpr const TVariable *p30B30B30B[3] = {
@@ -7101,12 +7064,10 @@ constexpr const TVariable *p30C30C30C[3] = {
 constexpr const TVariable *p30C30C30F[3] = {
     &BuiltInVariable::var_pt30C, &BuiltInVariable::var_pt30C, &BuiltInVariable::var_pt30F};
 constexpr const TVariable *p30C30D[2] = {&BuiltInVariable::var_pt30C, &BuiltInVariable::var_pt30D};
-constexpr const TVariable *p30C_o_30C[2] = {&BuiltInVariable::var_pt30C,
+constexpr const TVariable *p30C_o_30C[2]    = {&BuiltInVariable::var_pt30C,
                                             &BuiltInVariable::var_pt_o_30C};
-constexpr const TVariable *p30C_o_30D[2] = {&BuiltInVariable::var_pt30C,
+constexpr const TVariable *p30C_o_30D[2]    = {&BuiltInVariable::var_pt30C,
                                             &BuiltInVariable::var_pt_o_30D};
-constexpr const TVariable *p30D00D00D[3] = {
-    &BuiltInVariable::var_pt30D, &BuiltInVariable::var_pt00D, &BuiltInVariable::var_pt00D};
 constexpr const TVariable *p30D30D00D00D[4] = {
     &BuiltInVariable::var_pt30D, &BuiltInVariable::var_pt30D, &BuiltInVariable::var_pt00D,
     &BuiltInVariable::var_pt00D};
@@ -7117,8 +7078,6 @@ constexpr const TVariable *p30D30D30F[3] = {
 constexpr const TVariable *p30D30D_o_30D_o_30D[4] = {
     &BuiltInVariable::var_pt30D, &BuiltInVariable::var_pt30D, &BuiltInVariable::var_pt_o_30D,
     &BuiltInVariable::var_pt_o_30D};
-constexpr const TVariable *p30E00D00D[3] = {
-    &BuiltInVariable::var_pt30E, &BuiltInVariable::var_pt00D, &BuiltInVariable::var_pt00D};
 constexpr const TVariable *p30E00E00E[3] = {
     &BuiltInVariable::var_pt30E, &BuiltInVariable::var_pt00E, &BuiltInVariable::var_pt00E};
 constexpr const TVariable *p30E30E00D00D[4] = {
@@ -7172,7 +7131,7 @@ constexpr const TFunction kFunction_radians_00B(
     BuiltInId::radians_Float1,
     BuiltInName::radians,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpRadians,
@@ -7181,7 +7140,7 @@ constexpr const TFunction kFunction_radians_10B(
     BuiltInId::radians_Float2,
     BuiltInName::radians,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpRadians,
@@ -7190,7 +7149,7 @@ constexpr const TFunction kFunction_radians_20B(
     BuiltInId::radians_Float3,
     BuiltInName::radians,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpRadians,
@@ -7199,7 +7158,7 @@ constexpr const TFunction kFunction_radians_30B(
     BuiltInId::radians_Float4,
     BuiltInName::radians,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpRadians,
@@ -7208,7 +7167,7 @@ constexpr const TFunction kFunction_degrees_00B(
     BuiltInId::degrees_Float1,
     BuiltInName::degrees,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDegrees,
@@ -7217,7 +7176,7 @@ constexpr const TFunction kFunction_degrees_10B(
     BuiltInId::degrees_Float2,
     BuiltInName::degrees,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpDegrees,
@@ -7226,7 +7185,7 @@ constexpr const TFunction kFunction_degrees_20B(
     BuiltInId::degrees_Float3,
     BuiltInName::degrees,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpDegrees,
@@ -7235,7 +7194,7 @@ constexpr const TFunction kFunction_degrees_30B(
     BuiltInId::degrees_Float4,
     BuiltInName::degrees,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpDegrees,
@@ -7244,7 +7203,7 @@ constexpr const TFunction kFunction_sin_00B(
     BuiltInId::sin_Float1,
     BuiltInName::sin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpSin,
@@ -7253,7 +7212,7 @@ constexpr const TFunction kFunction_sin_10B(
     BuiltInId::sin_Float2,
     BuiltInName::sin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSin,
@@ -7262,7 +7221,7 @@ constexpr const TFunction kFunction_sin_20B(
     BuiltInId::sin_Float3,
     BuiltInName::sin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSin,
@@ -7271,7 +7230,7 @@ constexpr const TFunction kFunction_sin_30B(
     BuiltInId::sin_Float4,
     BuiltInName::sin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpSin,
@@ -7280,7 +7239,7 @@ constexpr const TFunction kFunction_cos_00B(
     BuiltInId::cos_Float1,
     BuiltInName::cos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCos,
@@ -7289,7 +7248,7 @@ constexpr const TFunction kFunction_cos_10B(
     BuiltInId::cos_Float2,
     BuiltInName::cos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCos,
@@ -7298,7 +7257,7 @@ constexpr const TFunction kFunction_cos_20B(
     BuiltInId::cos_Float3,
     BuiltInName::cos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCos,
@@ -7307,7 +7266,7 @@ constexpr const TFunction kFunction_cos_30B(
     BuiltInId::cos_Float4,
     BuiltInName::cos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCos,
@@ -7316,7 +7275,7 @@ constexpr const TFunction kFunction_tan_00B(
     BuiltInId::tan_Float1,
     BuiltInName::tan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpTan,
@@ -7325,7 +7284,7 @@ constexpr const TFunction kFunction_tan_10B(
     BuiltInId::tan_Float2,
     BuiltInName::tan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpTan,
@@ -7334,7 +7293,7 @@ constexpr const TFunction kFunction_tan_20B(
     BuiltInId::tan_Float3,
     BuiltInName::tan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpTan,
@@ -7343,7 +7302,7 @@ constexpr const TFunction kFunction_tan_30B(
     BuiltInId::tan_Float4,
     BuiltInName::tan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpTan,
@@ -7352,7 +7311,7 @@ constexpr const TFunction kFunction_asin_00B(
     BuiltInId::asin_Float1,
     BuiltInName::asin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAsin,
@@ -7361,7 +7320,7 @@ constexpr const TFunction kFunction_asin_10B(
     BuiltInId::asin_Float2,
     BuiltInName::asin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAsin,
@@ -7370,7 +7329,7 @@ constexpr const TFunction kFunction_asin_20B(
     BuiltInId::asin_Float3,
     BuiltInName::asin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAsin,
@@ -7379,7 +7338,7 @@ constexpr const TFunction kFunction_asin_30B(
     BuiltInId::asin_Float4,
     BuiltInName::asin,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAsin,
@@ -7388,7 +7347,7 @@ constexpr const TFunction kFunction_acos_00B(
     BuiltInId::acos_Float1,
     BuiltInName::acos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAcos,
@@ -7397,7 +7356,7 @@ constexpr const TFunction kFunction_acos_10B(
     BuiltInId::acos_Float2,
     BuiltInName::acos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAcos,
@@ -7406,7 +7365,7 @@ constexpr const TFunction kFunction_acos_20B(
     BuiltInId::acos_Float3,
     BuiltInName::acos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAcos,
@@ -7415,7 +7374,7 @@ constexpr const TFunction kFunction_acos_30B(
     BuiltInId::acos_Float4,
     BuiltInName::acos,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAcos,
@@ -7424,7 +7383,7 @@ constexpr const TFunction kFunction_atan_00B00B(
     BuiltInId::atan_Float1_Float1,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAtan,
@@ -7433,7 +7392,7 @@ constexpr const TFunction kFunction_atan_10B10B(
     BuiltInId::atan_Float2_Float2,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAtan,
@@ -7442,7 +7401,7 @@ constexpr const TFunction kFunction_atan_20B20B(
     BuiltInId::atan_Float3_Float3,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAtan,
@@ -7451,7 +7410,7 @@ constexpr const TFunction kFunction_atan_30B30B(
     BuiltInId::atan_Float4_Float4,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAtan,
@@ -7460,7 +7419,7 @@ constexpr const TFunction kFunction_atan_00B(
     BuiltInId::atan_Float1,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAtan,
@@ -7469,7 +7428,7 @@ constexpr const TFunction kFunction_atan_10B(
     BuiltInId::atan_Float2,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAtan,
@@ -7478,7 +7437,7 @@ constexpr const TFunction kFunction_atan_20B(
     BuiltInId::atan_Float3,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAtan,
@@ -7487,7 +7446,7 @@ constexpr const TFunction kFunction_atan_30B(
     BuiltInId::atan_Float4,
     BuiltInName::atan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAtan,
@@ -7496,7 +7455,7 @@ constexpr const TFunction kFunction_sinh_00B(
     BuiltInId::sinh_Float1,
     BuiltInName::sinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpSinh,
@@ -7505,7 +7464,7 @@ constexpr const TFunction kFunction_sinh_10B(
     BuiltInId::sinh_Float2,
     BuiltInName::sinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSinh,
@@ -7514,7 +7473,7 @@ constexpr const TFunction kFunction_sinh_20B(
     BuiltInId::sinh_Float3,
     BuiltInName::sinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSinh,
@@ -7523,7 +7482,7 @@ constexpr const TFunction kFunction_sinh_30B(
     BuiltInId::sinh_Float4,
     BuiltInName::sinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpSinh,
@@ -7532,7 +7491,7 @@ constexpr const TFunction kFunction_cosh_00B(
     BuiltInId::cosh_Float1,
     BuiltInName::cosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCosh,
@@ -7541,7 +7500,7 @@ constexpr const TFunction kFunction_cosh_10B(
     BuiltInId::cosh_Float2,
     BuiltInName::cosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCosh,
@@ -7550,7 +7509,7 @@ constexpr const TFunction kFunction_cosh_20B(
     BuiltInId::cosh_Float3,
     BuiltInName::cosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCosh,
@@ -7559,7 +7518,7 @@ constexpr const TFunction kFunction_cosh_30B(
     BuiltInId::cosh_Float4,
     BuiltInName::cosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCosh,
@@ -7568,7 +7527,7 @@ constexpr const TFunction kFunction_tanh_00B(
     BuiltInId::tanh_Float1,
     BuiltInName::tanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpTanh,
@@ -7577,7 +7536,7 @@ constexpr const TFunction kFunction_tanh_10B(
     BuiltInId::tanh_Float2,
     BuiltInName::tanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpTanh,
@@ -7586,7 +7545,7 @@ constexpr const TFunction kFunction_tanh_20B(
     BuiltInId::tanh_Float3,
     BuiltInName::tanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpTanh,
@@ -7595,7 +7554,7 @@ constexpr const TFunction kFunction_tanh_30B(
     BuiltInId::tanh_Float4,
     BuiltInName::tanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpTanh,
@@ -7604,7 +7563,7 @@ constexpr const TFunction kFunction_asinh_00B(
     BuiltInId::asinh_Float1,
     BuiltInName::asinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAsinh,
@@ -7613,7 +7572,7 @@ constexpr const TFunction kFunction_asinh_10B(
     BuiltInId::asinh_Float2,
     BuiltInName::asinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAsinh,
@@ -7622,7 +7581,7 @@ constexpr const TFunction kFunction_asinh_20B(
     BuiltInId::asinh_Float3,
     BuiltInName::asinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAsinh,
@@ -7631,7 +7590,7 @@ constexpr const TFunction kFunction_asinh_30B(
     BuiltInId::asinh_Float4,
     BuiltInName::asinh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAsinh,
@@ -7640,7 +7599,7 @@ constexpr const TFunction kFunction_acosh_00B(
     BuiltInId::acosh_Float1,
     BuiltInName::acosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAcosh,
@@ -7649,7 +7608,7 @@ constexpr const TFunction kFunction_acosh_10B(
     BuiltInId::acosh_Float2,
     BuiltInName::acosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAcosh,
@@ -7658,7 +7617,7 @@ constexpr const TFunction kFunction_acosh_20B(
     BuiltInId::acosh_Float3,
     BuiltInName::acosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAcosh,
@@ -7667,7 +7626,7 @@ constexpr const TFunction kFunction_acosh_30B(
     BuiltInId::acosh_Float4,
     BuiltInName::acosh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAcosh,
@@ -7676,7 +7635,7 @@ constexpr const TFunction kFunction_atanh_00B(
     BuiltInId::atanh_Float1,
     BuiltInName::atanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAtanh,
@@ -7685,7 +7644,7 @@ constexpr const TFunction kFunction_atanh_10B(
     BuiltInId::atanh_Float2,
     BuiltInName::atanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAtanh,
@@ -7694,7 +7653,7 @@ constexpr const TFunction kFunction_atanh_20B(
     BuiltInId::atanh_Float3,
     BuiltInName::atanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAtanh,
@@ -7703,7 +7662,7 @@ constexpr const TFunction kFunction_atanh_30B(
     BuiltInId::atanh_Float4,
     BuiltInName::atanh,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAtanh,
@@ -7712,7 +7671,7 @@ constexpr const TFunction kFunction_pow_00B00B(
     BuiltInId::pow_Float1_Float1,
     BuiltInName::pow,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpPow,
@@ -7721,7 +7680,7 @@ constexpr const TFunction kFunction_pow_10B10B(
     BuiltInId::pow_Float2_Float2,
     BuiltInName::pow,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpPow,
@@ -7730,7 +7689,7 @@ constexpr const TFunction kFunction_pow_20B20B(
     BuiltInId::pow_Float3_Float3,
     BuiltInName::pow,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpPow,
@@ -7739,7 +7698,7 @@ constexpr const TFunction kFunction_pow_30B30B(
     BuiltInId::pow_Float4_Float4,
     BuiltInName::pow,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpPow,
@@ -7748,7 +7707,7 @@ constexpr const TFunction kFunction_exp_00B(
     BuiltInId::exp_Float1,
     BuiltInName::exp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpExp,
@@ -7757,7 +7716,7 @@ constexpr const TFunction kFunction_exp_10B(
     BuiltInId::exp_Float2,
     BuiltInName::exp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpExp,
@@ -7766,7 +7725,7 @@ constexpr const TFunction kFunction_exp_20B(
     BuiltInId::exp_Float3,
     BuiltInName::exp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpExp,
@@ -7775,7 +7734,7 @@ constexpr const TFunction kFunction_exp_30B(
     BuiltInId::exp_Float4,
     BuiltInName::exp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpExp,
@@ -7784,7 +7743,7 @@ constexpr const TFunction kFunction_log_00B(
     BuiltInId::log_Float1,
     BuiltInName::log,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLog,
@@ -7793,7 +7752,7 @@ constexpr const TFunction kFunction_log_10B(
     BuiltInId::log_Float2,
     BuiltInName::log,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLog,
@@ -7802,7 +7761,7 @@ constexpr const TFunction kFunction_log_20B(
     BuiltInId::log_Float3,
     BuiltInName::log,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpLog,
@@ -7811,7 +7770,7 @@ constexpr const TFunction kFunction_log_30B(
     BuiltInId::log_Float4,
     BuiltInName::log,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLog,
@@ -7820,7 +7779,7 @@ constexpr const TFunction kFunction_exp2_00B(
     BuiltInId::exp2_Float1,
     BuiltInName::exp2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpExp2,
@@ -7829,7 +7788,7 @@ constexpr const TFunction kFunction_exp2_10B(
     BuiltInId::exp2_Float2,
     BuiltInName::exp2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpExp2,
@@ -7838,7 +7797,7 @@ constexpr const TFunction kFunction_exp2_20B(
     BuiltInId::exp2_Float3,
     BuiltInName::exp2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpExp2,
@@ -7847,7 +7806,7 @@ constexpr const TFunction kFunction_exp2_30B(
     BuiltInId::exp2_Float4,
     BuiltInName::exp2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpExp2,
@@ -7856,7 +7815,7 @@ constexpr const TFunction kFunction_log2_00B(
     BuiltInId::log2_Float1,
     BuiltInName::log2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLog2,
@@ -7865,7 +7824,7 @@ constexpr const TFunction kFunction_log2_10B(
     BuiltInId::log2_Float2,
     BuiltInName::log2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLog2,
@@ -7874,7 +7833,7 @@ constexpr const TFunction kFunction_log2_20B(
     BuiltInId::log2_Float3,
     BuiltInName::log2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpLog2,
@@ -7883,7 +7842,7 @@ constexpr const TFunction kFunction_log2_30B(
     BuiltInId::log2_Float4,
     BuiltInName::log2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLog2,
@@ -7892,7 +7851,7 @@ constexpr const TFunction kFunction_sqrt_00B(
     BuiltInId::sqrt_Float1,
     BuiltInName::sqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpSqrt,
@@ -7901,7 +7860,7 @@ constexpr const TFunction kFunction_sqrt_10B(
     BuiltInId::sqrt_Float2,
     BuiltInName::sqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSqrt,
@@ -7910,7 +7869,7 @@ constexpr const TFunction kFunction_sqrt_20B(
     BuiltInId::sqrt_Float3,
     BuiltInName::sqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSqrt,
@@ -7919,7 +7878,7 @@ constexpr const TFunction kFunction_sqrt_30B(
     BuiltInId::sqrt_Float4,
     BuiltInName::sqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpSqrt,
@@ -7928,7 +7887,7 @@ constexpr const TFunction kFunction_sqrt_00C(
     BuiltInId::sqrt_Double1,
     BuiltInName::sqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpSqrt,
@@ -7937,7 +7896,7 @@ constexpr const TFunction kFunction_sqrt_10C(
     BuiltInId::sqrt_Double2,
     BuiltInName::sqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSqrt,
@@ -7946,7 +7905,7 @@ constexpr const TFunction kFunction_sqrt_20C(
     BuiltInId::sqrt_Double3,
     BuiltInName::sqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSqrt,
@@ -7955,7 +7914,7 @@ constexpr const TFunction kFunction_sqrt_30C(
     BuiltInId::sqrt_Double4,
     BuiltInName::sqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpSqrt,
@@ -7964,7 +7923,7 @@ constexpr const TFunction kFunction_inversesqrt_00B(
     BuiltInId::inversesqrt_Float1,
     BuiltInName::inversesqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpInversesqrt,
@@ -7973,7 +7932,7 @@ constexpr const TFunction kFunction_inversesqrt_10B(
     BuiltInId::inversesqrt_Float2,
     BuiltInName::inversesqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpInversesqrt,
@@ -7982,7 +7941,7 @@ constexpr const TFunction kFunction_inversesqrt_20B(
     BuiltInId::inversesqrt_Float3,
     BuiltInName::inversesqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpInversesqrt,
@@ -7991,7 +7950,7 @@ constexpr const TFunction kFunction_inversesqrt_30B(
     BuiltInId::inversesqrt_Float4,
     BuiltInName::inversesqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpInversesqrt,
@@ -8000,7 +7959,7 @@ constexpr const TFunction kFunction_inversesqrt_00C(
     BuiltInId::inversesqrt_Double1,
     BuiltInName::inversesqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpInversesqrt,
@@ -8009,7 +7968,7 @@ constexpr const TFunction kFunction_inversesqrt_10C(
     BuiltInId::inversesqrt_Double2,
     BuiltInName::inversesqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpInversesqrt,
@@ -8018,7 +7977,7 @@ constexpr const TFunction kFunction_inversesqrt_20C(
     BuiltInId::inversesqrt_Double3,
     BuiltInName::inversesqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpInversesqrt,
@@ -8027,7 +7986,7 @@ constexpr const TFunction kFunction_inversesqrt_30C(
     BuiltInId::inversesqrt_Double4,
     BuiltInName::inversesqrt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpInversesqrt,
@@ -8036,7 +7995,7 @@ constexpr const TFunction kFunction_abs_00B(
     BuiltInId::abs_Float1,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAbs,
@@ -8045,7 +8004,7 @@ constexpr const TFunction kFunction_abs_10B(
     BuiltInId::abs_Float2,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAbs,
@@ -8054,7 +8013,7 @@ constexpr const TFunction kFunction_abs_20B(
     BuiltInId::abs_Float3,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAbs,
@@ -8063,7 +8022,7 @@ constexpr const TFunction kFunction_abs_30B(
     BuiltInId::abs_Float4,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAbs,
@@ -8072,7 +8031,7 @@ constexpr const TFunction kFunction_abs_00D(
     BuiltInId::abs_Int1,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D_o_00D_o_00D,
+    BuiltInParameters::p00g00B00B00B00D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAbs,
@@ -8081,7 +8040,7 @@ constexpr const TFunction kFunction_abs_10D(
     BuiltInId::abs_Int2,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p00I10B10B10B10D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAbs,
@@ -8090,7 +8049,7 @@ constexpr const TFunction kFunction_abs_20D(
     BuiltInId::abs_Int3,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20D20D00D00D,
+    BuiltInParameters::p00J20B20B20B20D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAbs,
@@ -8099,7 +8058,7 @@ constexpr const TFunction kFunction_abs_30D(
     BuiltInId::abs_Int4,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p01R10D00D30D + 3,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAbs,
@@ -8108,7 +8067,7 @@ constexpr const TFunction kFunction_abs_00C(
     BuiltInId::abs_Double1,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAbs,
@@ -8117,7 +8076,7 @@ constexpr const TFunction kFunction_abs_10C(
     BuiltInId::abs_Double2,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpAbs,
@@ -8126,7 +8085,7 @@ constexpr const TFunction kFunction_abs_20C(
     BuiltInId::abs_Double3,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpAbs,
@@ -8135,7 +8094,7 @@ constexpr const TFunction kFunction_abs_30C(
     BuiltInId::abs_Double4,
     BuiltInName::abs,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpAbs,
@@ -8144,7 +8103,7 @@ constexpr const TFunction kFunction_sign_00B(
     BuiltInId::sign_Float1,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpSign,
@@ -8153,7 +8112,7 @@ constexpr const TFunction kFunction_sign_10B(
     BuiltInId::sign_Float2,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSign,
@@ -8162,7 +8121,7 @@ constexpr const TFunction kFunction_sign_20B(
     BuiltInId::sign_Float3,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSign,
@@ -8171,7 +8130,7 @@ constexpr const TFunction kFunction_sign_30B(
     BuiltInId::sign_Float4,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpSign,
@@ -8180,7 +8139,7 @@ constexpr const TFunction kFunction_sign_00D(
     BuiltInId::sign_Int1,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D_o_00D_o_00D,
+    BuiltInParameters::p00g00B00B00B00D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpSign,
@@ -8189,7 +8148,7 @@ constexpr const TFunction kFunction_sign_10D(
     BuiltInId::sign_Int2,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p00I10B10B10B10D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSign,
@@ -8198,7 +8157,7 @@ constexpr const TFunction kFunction_sign_20D(
     BuiltInId::sign_Int3,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20D20D00D00D,
+    BuiltInParameters::p00J20B20B20B20D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSign,
@@ -8207,7 +8166,7 @@ constexpr const TFunction kFunction_sign_30D(
     BuiltInId::sign_Int4,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p01R10D00D30D + 3,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpSign,
@@ -8216,7 +8175,7 @@ constexpr const TFunction kFunction_sign_00C(
     BuiltInId::sign_Double1,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpSign,
@@ -8225,7 +8184,7 @@ constexpr const TFunction kFunction_sign_10C(
     BuiltInId::sign_Double2,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSign,
@@ -8234,7 +8193,7 @@ constexpr const TFunction kFunction_sign_20C(
     BuiltInId::sign_Double3,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSign,
@@ -8243,7 +8202,7 @@ constexpr const TFunction kFunction_sign_30C(
     BuiltInId::sign_Double4,
     BuiltInName::sign,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpSign,
@@ -8252,7 +8211,7 @@ constexpr const TFunction kFunction_floor_00B(
     BuiltInId::floor_Float1,
     BuiltInName::floor,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFloor,
@@ -8261,7 +8220,7 @@ constexpr const TFunction kFunction_floor_10B(
     BuiltInId::floor_Float2,
     BuiltInName::floor,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFloor,
@@ -8270,7 +8229,7 @@ constexpr const TFunction kFunction_floor_20B(
     BuiltInId::floor_Float3,
     BuiltInName::floor,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFloor,
@@ -8279,7 +8238,7 @@ constexpr const TFunction kFunction_floor_30B(
     BuiltInId::floor_Float4,
     BuiltInName::floor,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFloor,
@@ -8288,7 +8247,7 @@ constexpr const TFunction kFunction_floor_00C(
     BuiltInId::floor_Double1,
     BuiltInName::floor,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFloor,
@@ -8297,7 +8256,7 @@ constexpr const TFunction kFunction_floor_10C(
     BuiltInId::floor_Double2,
     BuiltInName::floor,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFloor,
@@ -8306,7 +8265,7 @@ constexpr const TFunction kFunction_floor_20C(
     BuiltInId::floor_Double3,
     BuiltInName::floor,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFloor,
@@ -8315,7 +8274,7 @@ constexpr const TFunction kFunction_floor_30C(
     BuiltInId::floor_Double4,
     BuiltInName::floor,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFloor,
@@ -8324,7 +8283,7 @@ constexpr const TFunction kFunction_trunc_00B(
     BuiltInId::trunc_Float1,
     BuiltInName::trunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpTrunc,
@@ -8333,7 +8292,7 @@ constexpr const TFunction kFunction_trunc_10B(
     BuiltInId::trunc_Float2,
     BuiltInName::trunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpTrunc,
@@ -8342,7 +8301,7 @@ constexpr const TFunction kFunction_trunc_20B(
     BuiltInId::trunc_Float3,
     BuiltInName::trunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpTrunc,
@@ -8351,7 +8310,7 @@ constexpr const TFunction kFunction_trunc_30B(
     BuiltInId::trunc_Float4,
     BuiltInName::trunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpTrunc,
@@ -8360,7 +8319,7 @@ constexpr const TFunction kFunction_trunc_00C(
     BuiltInId::trunc_Double1,
     BuiltInName::trunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpTrunc,
@@ -8369,7 +8328,7 @@ constexpr const TFunction kFunction_trunc_10C(
     BuiltInId::trunc_Double2,
     BuiltInName::trunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpTrunc,
@@ -8378,7 +8337,7 @@ constexpr const TFunction kFunction_trunc_20C(
     BuiltInId::trunc_Double3,
     BuiltInName::trunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpTrunc,
@@ -8387,7 +8346,7 @@ constexpr const TFunction kFunction_trunc_30C(
     BuiltInId::trunc_Double4,
     BuiltInName::trunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpTrunc,
@@ -8396,7 +8355,7 @@ constexpr const TFunction kFunction_round_00B(
     BuiltInId::round_Float1,
     BuiltInName::round,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpRound,
@@ -8405,7 +8364,7 @@ constexpr const TFunction kFunction_round_10B(
     BuiltInId::round_Float2,
     BuiltInName::round,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpRound,
@@ -8414,7 +8373,7 @@ constexpr const TFunction kFunction_round_20B(
     BuiltInId::round_Float3,
     BuiltInName::round,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpRound,
@@ -8423,7 +8382,7 @@ constexpr const TFunction kFunction_round_30B(
     BuiltInId::round_Float4,
     BuiltInName::round,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpRound,
@@ -8432,7 +8391,7 @@ constexpr const TFunction kFunction_round_00C(
     BuiltInId::round_Double1,
     BuiltInName::round,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpRound,
@@ -8441,7 +8400,7 @@ constexpr const TFunction kFunction_round_10C(
     BuiltInId::round_Double2,
     BuiltInName::round,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpRound,
@@ -8450,7 +8409,7 @@ constexpr const TFunction kFunction_round_20C(
     BuiltInId::round_Double3,
     BuiltInName::round,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpRound,
@@ -8459,7 +8418,7 @@ constexpr const TFunction kFunction_round_30C(
     BuiltInId::round_Double4,
     BuiltInName::round,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpRound,
@@ -8468,7 +8427,7 @@ constexpr const TFunction kFunction_roundEven_00B(
     BuiltInId::roundEven_Float1,
     BuiltInName::roundEven,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpRoundEven,
@@ -8477,7 +8436,7 @@ constexpr const TFunction kFunction_roundEven_10B(
     BuiltInId::roundEven_Float2,
     BuiltInName::roundEven,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpRoundEven,
@@ -8486,7 +8445,7 @@ constexpr const TFunction kFunction_roundEven_20B(
     BuiltInId::roundEven_Float3,
     BuiltInName::roundEven,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpRoundEven,
@@ -8495,7 +8454,7 @@ constexpr const TFunction kFunction_roundEven_30B(
     BuiltInId::roundEven_Float4,
     BuiltInName::roundEven,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpRoundEven,
@@ -8504,7 +8463,7 @@ constexpr const TFunction kFunction_roundEven_00C(
     BuiltInId::roundEven_Double1,
     BuiltInName::roundEven,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpRoundEven,
@@ -8513,7 +8472,7 @@ constexpr const TFunction kFunction_roundEven_10C(
     BuiltInId::roundEven_Double2,
     BuiltInName::roundEven,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpRoundEven,
@@ -8522,7 +8481,7 @@ constexpr const TFunction kFunction_roundEven_20C(
     BuiltInId::roundEven_Double3,
     BuiltInName::roundEven,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpRoundEven,
@@ -8531,7 +8490,7 @@ constexpr const TFunction kFunction_roundEven_30C(
     BuiltInId::roundEven_Double4,
     BuiltInName::roundEven,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpRoundEven,
@@ -8540,7 +8499,7 @@ constexpr const TFunction kFunction_ceil_00B(
     BuiltInId::ceil_Float1,
     BuiltInName::ceil,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCeil,
@@ -8549,7 +8508,7 @@ constexpr const TFunction kFunction_ceil_10B(
     BuiltInId::ceil_Float2,
     BuiltInName::ceil,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCeil,
@@ -8558,7 +8517,7 @@ constexpr const TFunction kFunction_ceil_20B(
     BuiltInId::ceil_Float3,
     BuiltInName::ceil,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCeil,
@@ -8567,7 +8526,7 @@ constexpr const TFunction kFunction_ceil_30B(
     BuiltInId::ceil_Float4,
     BuiltInName::ceil,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCeil,
@@ -8576,7 +8535,7 @@ constexpr const TFunction kFunction_ceil_00C(
     BuiltInId::ceil_Double1,
     BuiltInName::ceil,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCeil,
@@ -8585,7 +8544,7 @@ constexpr const TFunction kFunction_ceil_10C(
     BuiltInId::ceil_Double2,
     BuiltInName::ceil,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCeil,
@@ -8594,7 +8553,7 @@ constexpr const TFunction kFunction_ceil_20C(
     BuiltInId::ceil_Double3,
     BuiltInName::ceil,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCeil,
@@ -8603,7 +8562,7 @@ constexpr const TFunction kFunction_ceil_30C(
     BuiltInId::ceil_Double4,
     BuiltInName::ceil,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCeil,
@@ -8612,7 +8571,7 @@ constexpr const TFunction kFunction_fract_00B(
     BuiltInId::fract_Float1,
     BuiltInName::fract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFract,
@@ -8621,7 +8580,7 @@ constexpr const TFunction kFunction_fract_10B(
     BuiltInId::fract_Float2,
     BuiltInName::fract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFract,
@@ -8630,7 +8589,7 @@ constexpr const TFunction kFunction_fract_20B(
     BuiltInId::fract_Float3,
     BuiltInName::fract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFract,
@@ -8639,7 +8598,7 @@ constexpr const TFunction kFunction_fract_30B(
     BuiltInId::fract_Float4,
     BuiltInName::fract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFract,
@@ -8648,7 +8607,7 @@ constexpr const TFunction kFunction_fract_00C(
     BuiltInId::fract_Double1,
     BuiltInName::fract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFract,
@@ -8657,7 +8616,7 @@ constexpr const TFunction kFunction_fract_10C(
     BuiltInId::fract_Double2,
     BuiltInName::fract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFract,
@@ -8666,7 +8625,7 @@ constexpr const TFunction kFunction_fract_20C(
     BuiltInId::fract_Double3,
     BuiltInName::fract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFract,
@@ -8675,7 +8634,7 @@ constexpr const TFunction kFunction_fract_30C(
     BuiltInId::fract_Double4,
     BuiltInName::fract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFract,
@@ -8684,7 +8643,7 @@ constexpr const TFunction kFunction_mod_00B00B(
     BuiltInId::mod_Float1_Float1,
     BuiltInName::mod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMod,
@@ -8693,7 +8652,7 @@ constexpr const TFunction kFunction_mod_10B00B(
     BuiltInId::mod_Float2_Float1,
     BuiltInName::mod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B00B00B,
+    BuiltInParameters::p00g10B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMod,
@@ -8702,7 +8661,7 @@ constexpr const TFunction kFunction_mod_20B00B(
     BuiltInId::mod_Float3_Float1,
     BuiltInName::mod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B00B00B,
+    BuiltInParameters::p00i20B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMod,
@@ -8711,7 +8670,7 @@ constexpr const TFunction kFunction_mod_30B00B(
     BuiltInId::mod_Float4_Float1,
     BuiltInName::mod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B00B00B,
+    BuiltInParameters::p00g30B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMod,
@@ -8720,7 +8679,7 @@ constexpr const TFunction kFunction_mod_10B10B(
     BuiltInId::mod_Float2_Float2,
     BuiltInName::mod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMod,
@@ -8729,7 +8688,7 @@ constexpr const TFunction kFunction_mod_20B20B(
     BuiltInId::mod_Float3_Float3,
     BuiltInName::mod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMod,
@@ -8738,7 +8697,7 @@ constexpr const TFunction kFunction_mod_30B30B(
     BuiltInId::mod_Float4_Float4,
     BuiltInName::mod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMod,
@@ -8747,7 +8706,7 @@ constexpr const TFunction kFunction_mod_00C00C(
     BuiltInId::mod_Double1_Double1,
     BuiltInName::mod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C00C10C,
+    BuiltInParameters::p00C00C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMod,
@@ -8783,7 +8742,7 @@ constexpr const TFunction kFunction_mod_10C10C(
     BuiltInId::mod_Double2_Double2,
     BuiltInName::mod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C10C10F,
+    BuiltInParameters::p10C10C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMod,
@@ -8792,7 +8751,7 @@ constexpr const TFunction kFunction_mod_20C20C(
     BuiltInId::mod_Double3_Double3,
     BuiltInName::mod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p20C20C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMod,
@@ -8810,7 +8769,7 @@ constexpr const TFunction kFunction_min_00B00B(
     BuiltInId::min_Float1_Float1,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMin,
@@ -8819,7 +8778,7 @@ constexpr const TFunction kFunction_min_10B00B(
     BuiltInId::min_Float2_Float1,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B00B00B,
+    BuiltInParameters::p00g10B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMin,
@@ -8828,7 +8787,7 @@ constexpr const TFunction kFunction_min_20B00B(
     BuiltInId::min_Float3_Float1,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B00B00B,
+    BuiltInParameters::p00i20B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMin,
@@ -8837,7 +8796,7 @@ constexpr const TFunction kFunction_min_30B00B(
     BuiltInId::min_Float4_Float1,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B00B00B,
+    BuiltInParameters::p00g30B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMin,
@@ -8846,7 +8805,7 @@ constexpr const TFunction kFunction_min_10B10B(
     BuiltInId::min_Float2_Float2,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMin,
@@ -8855,7 +8814,7 @@ constexpr const TFunction kFunction_min_20B20B(
     BuiltInId::min_Float3_Float3,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMin,
@@ -8864,7 +8823,7 @@ constexpr const TFunction kFunction_min_30B30B(
     BuiltInId::min_Float4_Float4,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMin,
@@ -8873,7 +8832,7 @@ constexpr const TFunction kFunction_min_00C00C(
     BuiltInId::min_Double1_Double1,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C00C10C,
+    BuiltInParameters::p00C00C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMin,
@@ -8882,7 +8841,7 @@ constexpr const TFunction kFunction_min_10C10C(
     BuiltInId::min_Double2_Double2,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C10C10F,
+    BuiltInParameters::p10C10C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMin,
@@ -8891,7 +8850,7 @@ constexpr const TFunction kFunction_min_20C20C(
     BuiltInId::min_Double3_Double3,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p20C20C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMin,
@@ -8936,7 +8895,7 @@ constexpr const TFunction kFunction_min_00D00D(
     BuiltInId::min_Int1_Int1,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D_o_00D_o_00D,
+    BuiltInParameters::p01Q10D00D00D00D + 2,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMin,
@@ -8945,7 +8904,7 @@ constexpr const TFunction kFunction_min_10D10D(
     BuiltInId::min_Int2_Int2,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p10D10D00D00D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMin,
@@ -8963,7 +8922,7 @@ constexpr const TFunction kFunction_min_30D30D(
     BuiltInId::min_Int4_Int4,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p30D30D00D00D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMin,
@@ -8972,7 +8931,7 @@ constexpr const TFunction kFunction_min_10D00D(
     BuiltInId::min_Int2_Int1,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D00D00D,
+    BuiltInParameters::p01Q10D00D00D00D + 1,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMin,
@@ -8981,7 +8940,7 @@ constexpr const TFunction kFunction_min_20D00D(
     BuiltInId::min_Int3_Int1,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20D00D00D,
+    BuiltInParameters::p01T20D00D00D00D + 1,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMin,
@@ -8990,7 +8949,7 @@ constexpr const TFunction kFunction_min_30D00D(
     BuiltInId::min_Int4_Int1,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D00D00D,
+    BuiltInParameters::p30D30D00D00D + 1,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMin,
@@ -8999,7 +8958,7 @@ constexpr const TFunction kFunction_min_00E00E(
     BuiltInId::min_UInt1_UInt1,
     BuiltInName::min,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00E00E,
+    BuiltInParameters::p01Q10D00D00E00E + 3,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMin,
@@ -9062,7 +9021,7 @@ constexpr const TFunction kFunction_max_00B00B(
     BuiltInId::max_Float1_Float1,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMax,
@@ -9071,7 +9030,7 @@ constexpr const TFunction kFunction_max_10B00B(
     BuiltInId::max_Float2_Float1,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B00B00B,
+    BuiltInParameters::p00g10B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMax,
@@ -9080,7 +9039,7 @@ constexpr const TFunction kFunction_max_20B00B(
     BuiltInId::max_Float3_Float1,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B00B00B,
+    BuiltInParameters::p00i20B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMax,
@@ -9089,7 +9048,7 @@ constexpr const TFunction kFunction_max_30B00B(
     BuiltInId::max_Float4_Float1,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B00B00B,
+    BuiltInParameters::p00g30B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMax,
@@ -9098,7 +9057,7 @@ constexpr const TFunction kFunction_max_10B10B(
     BuiltInId::max_Float2_Float2,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMax,
@@ -9107,7 +9066,7 @@ constexpr const TFunction kFunction_max_20B20B(
     BuiltInId::max_Float3_Float3,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMax,
@@ -9116,7 +9075,7 @@ constexpr const TFunction kFunction_max_30B30B(
     BuiltInId::max_Float4_Float4,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMax,
@@ -9125,7 +9084,7 @@ constexpr const TFunction kFunction_max_00C00C(
     BuiltInId::max_Double1_Double1,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C00C10C,
+    BuiltInParameters::p00C00C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMax,
@@ -9134,7 +9093,7 @@ constexpr const TFunction kFunction_max_10C10C(
     BuiltInId::max_Double2_Double2,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C10C10F,
+    BuiltInParameters::p10C10C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMax,
@@ -9143,7 +9102,7 @@ constexpr const TFunction kFunction_max_20C20C(
     BuiltInId::max_Double3_Double3,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p20C20C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMax,
@@ -9188,7 +9147,7 @@ constexpr const TFunction kFunction_max_00D00D(
     BuiltInId::max_Int1_Int1,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D_o_00D_o_00D,
+    BuiltInParameters::p01Q10D00D00D00D + 2,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMax,
@@ -9197,7 +9156,7 @@ constexpr const TFunction kFunction_max_10D10D(
     BuiltInId::max_Int2_Int2,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p10D10D00D00D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMax,
@@ -9215,7 +9174,7 @@ constexpr const TFunction kFunction_max_30D30D(
     BuiltInId::max_Int4_Int4,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p30D30D00D00D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMax,
@@ -9224,7 +9183,7 @@ constexpr const TFunction kFunction_max_10D00D(
     BuiltInId::max_Int2_Int1,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D00D00D,
+    BuiltInParameters::p01Q10D00D00D00D + 1,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMax,
@@ -9233,7 +9192,7 @@ constexpr const TFunction kFunction_max_20D00D(
     BuiltInId::max_Int3_Int1,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20D00D00D,
+    BuiltInParameters::p01T20D00D00D00D + 1,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMax,
@@ -9242,7 +9201,7 @@ constexpr const TFunction kFunction_max_30D00D(
     BuiltInId::max_Int4_Int1,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D00D00D,
+    BuiltInParameters::p30D30D00D00D + 1,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpMax,
@@ -9251,7 +9210,7 @@ constexpr const TFunction kFunction_max_00E00E(
     BuiltInId::max_UInt1_UInt1,
     BuiltInName::max,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00E00E,
+    BuiltInParameters::p01Q10D00D00E00E + 3,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMax,
@@ -9314,7 +9273,7 @@ constexpr const TFunction kFunction_clamp_00B00B00B(
     BuiltInId::clamp_Float1_Float1_Float1,
     BuiltInName::clamp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B00B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpClamp,
@@ -9323,7 +9282,7 @@ constexpr const TFunction kFunction_clamp_10B00B00B(
     BuiltInId::clamp_Float2_Float1_Float1,
     BuiltInName::clamp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B00B00B,
+    BuiltInParameters::p00g10B00B00B00D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpClamp,
@@ -9332,7 +9291,7 @@ constexpr const TFunction kFunction_clamp_20B00B00B(
     BuiltInId::clamp_Float3_Float1_Float1,
     BuiltInName::clamp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B00B00B,
+    BuiltInParameters::p00i20B00B00B00D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpClamp,
@@ -9341,7 +9300,7 @@ constexpr const TFunction kFunction_clamp_30B00B00B(
     BuiltInId::clamp_Float4_Float1_Float1,
     BuiltInName::clamp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B00B00B,
+    BuiltInParameters::p00g30B00B00B00D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpClamp,
@@ -9350,7 +9309,7 @@ constexpr const TFunction kFunction_clamp_10B10B10B(
     BuiltInId::clamp_Float2_Float2_Float2,
     BuiltInName::clamp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpClamp,
@@ -9359,7 +9318,7 @@ constexpr const TFunction kFunction_clamp_20B20B20B(
     BuiltInId::clamp_Float3_Float3_Float3,
     BuiltInName::clamp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B20B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpClamp,
@@ -9440,7 +9399,7 @@ constexpr const TFunction kFunction_clamp_00D00D00D(
     BuiltInId::clamp_Int1_Int1_Int1,
     BuiltInName::clamp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D00D00D,
+    BuiltInParameters::p01Q10D00D00D00D + 2,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpClamp,
@@ -9449,7 +9408,7 @@ constexpr const TFunction kFunction_clamp_10D00D00D(
     BuiltInId::clamp_Int2_Int1_Int1,
     BuiltInName::clamp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D00D00D,
+    BuiltInParameters::p01Q10D00D00D00D + 1,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpClamp,
@@ -9458,7 +9417,7 @@ constexpr const TFunction kFunction_clamp_20D00D00D(
     BuiltInId::clamp_Int3_Int1_Int1,
     BuiltInName::clamp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20D00D00D,
+    BuiltInParameters::p01T20D00D00D00D + 1,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpClamp,
@@ -9467,7 +9426,7 @@ constexpr const TFunction kFunction_clamp_30D00D00D(
     BuiltInId::clamp_Int4_Int1_Int1,
     BuiltInName::clamp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D00D00D,
+    BuiltInParameters::p30D30D00D00D + 1,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpClamp,
@@ -9566,7 +9525,7 @@ constexpr const TFunction kFunction_mix_00B00B00B(
     BuiltInId::mix_Float1_Float1_Float1,
     BuiltInName::mix,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B00B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpMix,
@@ -9602,7 +9561,7 @@ constexpr const TFunction kFunction_mix_10B10B10B(
     BuiltInId::mix_Float2_Float2_Float2,
     BuiltInName::mix,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpMix,
@@ -9611,7 +9570,7 @@ constexpr const TFunction kFunction_mix_20B20B20B(
     BuiltInId::mix_Float3_Float3_Float3,
     BuiltInName::mix,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B20B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpMix,
@@ -9872,7 +9831,7 @@ constexpr const TFunction kFunction_step_00B00B(
     BuiltInId::step_Float1_Float1,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpStep,
@@ -9881,7 +9840,7 @@ constexpr const TFunction kFunction_step_10B10B(
     BuiltInId::step_Float2_Float2,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpStep,
@@ -9890,7 +9849,7 @@ constexpr const TFunction kFunction_step_20B20B(
     BuiltInId::step_Float3_Float3,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpStep,
@@ -9899,7 +9858,7 @@ constexpr const TFunction kFunction_step_30B30B(
     BuiltInId::step_Float4_Float4,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpStep,
@@ -9908,7 +9867,7 @@ constexpr const TFunction kFunction_step_00B10B(
     BuiltInId::step_Float1_Float2,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B10B,
+    BuiltInParameters::p00B00B10B + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpStep,
@@ -9917,7 +9876,7 @@ constexpr const TFunction kFunction_step_00B20B(
     BuiltInId::step_Float1_Float3,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B20B,
+    BuiltInParameters::p00B00B20B + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpStep,
@@ -9926,7 +9885,7 @@ constexpr const TFunction kFunction_step_00B30B(
     BuiltInId::step_Float1_Float4,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B30B,
+    BuiltInParameters::p00B00B30B + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpStep,
@@ -9935,7 +9894,7 @@ constexpr const TFunction kFunction_step_00C00C(
     BuiltInId::step_Double1_Double1,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C00C10C,
+    BuiltInParameters::p00C00C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpStep,
@@ -9944,7 +9903,7 @@ constexpr const TFunction kFunction_step_10C10C(
     BuiltInId::step_Double2_Double2,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C10C10F,
+    BuiltInParameters::p10C10C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpStep,
@@ -9953,7 +9912,7 @@ constexpr const TFunction kFunction_step_20C20C(
     BuiltInId::step_Double3_Double3,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p20C20C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpStep,
@@ -9971,7 +9930,7 @@ constexpr const TFunction kFunction_step_00C10C(
     BuiltInId::step_Double1_Double2,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C10C + 1,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpStep,
@@ -9980,7 +9939,7 @@ constexpr const TFunction kFunction_step_00C20C(
     BuiltInId::step_Double1_Double3,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C20C,
+    BuiltInParameters::p00C00C20C + 1,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpStep,
@@ -9989,7 +9948,7 @@ constexpr const TFunction kFunction_step_00C30C(
     BuiltInId::step_Double1_Double4,
     BuiltInName::step,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C30C,
+    BuiltInParameters::p00C00C30C + 1,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpStep,
@@ -10061,7 +10020,7 @@ constexpr const TFunction kFunction_smoothstep_00B00B00B(
     BuiltInId::smoothstep_Float1_Float1_Float1,
     BuiltInName::smoothstep,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B00B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpSmoothstep,
@@ -10070,7 +10029,7 @@ constexpr const TFunction kFunction_smoothstep_10B10B10B(
     BuiltInId::smoothstep_Float2_Float2_Float2,
     BuiltInName::smoothstep,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpSmoothstep,
@@ -10079,7 +10038,7 @@ constexpr const TFunction kFunction_smoothstep_20B20B20B(
     BuiltInId::smoothstep_Float3_Float3_Float3,
     BuiltInName::smoothstep,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B20B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpSmoothstep,
@@ -10196,7 +10155,7 @@ constexpr const TFunction kFunction_isnan_00B(
     BuiltInId::isnan_Float1,
     BuiltInName::isnan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpIsnan,
@@ -10205,7 +10164,7 @@ constexpr const TFunction kFunction_isnan_10B(
     BuiltInId::isnan_Float2,
     BuiltInName::isnan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpIsnan,
@@ -10214,7 +10173,7 @@ constexpr const TFunction kFunction_isnan_20B(
     BuiltInId::isnan_Float3,
     BuiltInName::isnan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpIsnan,
@@ -10223,7 +10182,7 @@ constexpr const TFunction kFunction_isnan_30B(
     BuiltInId::isnan_Float4,
     BuiltInName::isnan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpIsnan,
@@ -10232,7 +10191,7 @@ constexpr const TFunction kFunction_isnan_00C(
     BuiltInId::isnan_Double1,
     BuiltInName::isnan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpIsnan,
@@ -10241,7 +10200,7 @@ constexpr const TFunction kFunction_isnan_10C(
     BuiltInId::isnan_Double2,
     BuiltInName::isnan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpIsnan,
@@ -10250,7 +10209,7 @@ constexpr const TFunction kFunction_isnan_20C(
     BuiltInId::isnan_Double3,
     BuiltInName::isnan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpIsnan,
@@ -10259,7 +10218,7 @@ constexpr const TFunction kFunction_isnan_30C(
     BuiltInId::isnan_Double4,
     BuiltInName::isnan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpIsnan,
@@ -10268,7 +10227,7 @@ constexpr const TFunction kFunction_isinf_00B(
     BuiltInId::isinf_Float1,
     BuiltInName::isinf,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpIsinf,
@@ -10277,7 +10236,7 @@ constexpr const TFunction kFunction_isinf_10B(
     BuiltInId::isinf_Float2,
     BuiltInName::isinf,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpIsinf,
@@ -10286,7 +10245,7 @@ constexpr const TFunction kFunction_isinf_20B(
     BuiltInId::isinf_Float3,
     BuiltInName::isinf,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpIsinf,
@@ -10295,7 +10254,7 @@ constexpr const TFunction kFunction_isinf_30B(
     BuiltInId::isinf_Float4,
     BuiltInName::isinf,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpIsinf,
@@ -10304,7 +10263,7 @@ constexpr const TFunction kFunction_isinf_00C(
     BuiltInId::isinf_Double1,
     BuiltInName::isinf,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpIsinf,
@@ -10313,7 +10272,7 @@ constexpr const TFunction kFunction_isinf_10C(
     BuiltInId::isinf_Double2,
     BuiltInName::isinf,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpIsinf,
@@ -10322,7 +10281,7 @@ constexpr const TFunction kFunction_isinf_20C(
     BuiltInId::isinf_Double3,
     BuiltInName::isinf,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpIsinf,
@@ -10331,7 +10290,7 @@ constexpr const TFunction kFunction_isinf_30C(
     BuiltInId::isinf_Double4,
     BuiltInName::isinf,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpIsinf,
@@ -10340,7 +10299,7 @@ constexpr const TFunction kFunction_floatBitsToInt_00B(
     BuiltInId::floatBitsToInt_Float1,
     BuiltInName::floatBitsToInt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFloatBitsToInt,
@@ -10349,7 +10308,7 @@ constexpr const TFunction kFunction_floatBitsToInt_10B(
     BuiltInId::floatBitsToInt_Float2,
     BuiltInName::floatBitsToInt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFloatBitsToInt,
@@ -10358,7 +10317,7 @@ constexpr const TFunction kFunction_floatBitsToInt_20B(
     BuiltInId::floatBitsToInt_Float3,
     BuiltInName::floatBitsToInt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFloatBitsToInt,
@@ -10367,7 +10326,7 @@ constexpr const TFunction kFunction_floatBitsToInt_30B(
     BuiltInId::floatBitsToInt_Float4,
     BuiltInName::floatBitsToInt,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFloatBitsToInt,
@@ -10376,7 +10335,7 @@ constexpr const TFunction kFunction_floatBitsToUint_00B(
     BuiltInId::floatBitsToUint_Float1,
     BuiltInName::floatBitsToUint,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFloatBitsToUint,
@@ -10385,7 +10344,7 @@ constexpr const TFunction kFunction_floatBitsToUint_10B(
     BuiltInId::floatBitsToUint_Float2,
     BuiltInName::floatBitsToUint,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFloatBitsToUint,
@@ -10394,7 +10353,7 @@ constexpr const TFunction kFunction_floatBitsToUint_20B(
     BuiltInId::floatBitsToUint_Float3,
     BuiltInName::floatBitsToUint,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFloatBitsToUint,
@@ -10403,7 +10362,7 @@ constexpr const TFunction kFunction_floatBitsToUint_30B(
     BuiltInId::floatBitsToUint_Float4,
     BuiltInName::floatBitsToUint,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFloatBitsToUint,
@@ -10412,7 +10371,7 @@ constexpr const TFunction kFunction_intBitsToFloat_00D(
     BuiltInId::intBitsToFloat_Int1,
     BuiltInName::intBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D_o_00D_o_00D,
+    BuiltInParameters::p00g00B00B00B00D + 4,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpIntBitsToFloat,
@@ -10421,7 +10380,7 @@ constexpr const TFunction kFunction_intBitsToFloat_10D(
     BuiltInId::intBitsToFloat_Int2,
     BuiltInName::intBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p00I10B10B10B10D + 4,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpIntBitsToFloat,
@@ -10430,7 +10389,7 @@ constexpr const TFunction kFunction_intBitsToFloat_20D(
     BuiltInId::intBitsToFloat_Int3,
     BuiltInName::intBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20D20D00D00D,
+    BuiltInParameters::p00J20B20B20B20D + 4,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpIntBitsToFloat,
@@ -10439,7 +10398,7 @@ constexpr const TFunction kFunction_intBitsToFloat_30D(
     BuiltInId::intBitsToFloat_Int4,
     BuiltInName::intBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p01R10D00D30D + 3,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpIntBitsToFloat,
@@ -10448,7 +10407,7 @@ constexpr const TFunction kFunction_uintBitsToFloat_00E(
     BuiltInId::uintBitsToFloat_UInt1,
     BuiltInName::uintBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00E00E,
+    BuiltInParameters::p01Q10D00D00E00E + 3,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpUintBitsToFloat,
@@ -10475,7 +10434,7 @@ constexpr const TFunction kFunction_uintBitsToFloat_30E(
     BuiltInId::uintBitsToFloat_UInt4,
     BuiltInName::uintBitsToFloat,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30E30E00D00D,
+    BuiltInParameters::p01S10D00D30E + 3,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpUintBitsToFloat,
@@ -10484,7 +10443,7 @@ constexpr const TFunction kFunction_fma_00B00B00B(
     BuiltInId::fma_Float1_Float1_Float1,
     BuiltInName::fma,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B00B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFma,
@@ -10493,7 +10452,7 @@ constexpr const TFunction kFunction_fma_10B10B10B(
     BuiltInId::fma_Float2_Float2_Float2,
     BuiltInName::fma,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFma,
@@ -10502,7 +10461,7 @@ constexpr const TFunction kFunction_fma_20B20B20B(
     BuiltInId::fma_Float3_Float3_Float3,
     BuiltInName::fma,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B20B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFma,
@@ -10628,7 +10587,7 @@ constexpr const TFunction kFunction_ldexp_00B00D(
     BuiltInId::ldexp_Float1_Int1,
     BuiltInName::ldexp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00D,
+    BuiltInParameters::p00g00B00B00B00D + 3,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLdexp,
@@ -10637,7 +10596,7 @@ constexpr const TFunction kFunction_ldexp_10B10D(
     BuiltInId::ldexp_Float2_Int2,
     BuiltInName::ldexp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10D,
+    BuiltInParameters::p00I10B10B10B10D + 3,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLdexp,
@@ -10646,7 +10605,7 @@ constexpr const TFunction kFunction_ldexp_20B20D(
     BuiltInId::ldexp_Float3_Int3,
     BuiltInName::ldexp,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20D,
+    BuiltInParameters::p00J20B20B20B20D + 3,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpLdexp,
@@ -10700,7 +10659,7 @@ constexpr const TFunction kFunction_packSnorm2x16_10B(
     BuiltInId::packSnorm2x16_Float2,
     BuiltInName::packSnorm2x16,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpPackSnorm2x16,
@@ -10709,7 +10668,7 @@ constexpr const TFunction kFunction_packHalf2x16_10B(
     BuiltInId::packHalf2x16_Float2,
     BuiltInName::packHalf2x16,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpPackHalf2x16,
@@ -10718,7 +10677,7 @@ constexpr const TFunction kFunction_unpackSnorm2x16_00E(
     BuiltInId::unpackSnorm2x16_UInt1,
     BuiltInName::unpackSnorm2x16,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00E00E,
+    BuiltInParameters::p01Q10D00D00E00E + 3,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpUnpackSnorm2x16,
@@ -10727,7 +10686,7 @@ constexpr const TFunction kFunction_unpackHalf2x16_00E(
     BuiltInId::unpackHalf2x16_UInt1,
     BuiltInName::unpackHalf2x16,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00E00E,
+    BuiltInParameters::p01Q10D00D00E00E + 3,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpUnpackHalf2x16,
@@ -10736,7 +10695,7 @@ constexpr const TFunction kFunction_packUnorm2x16_10B(
     BuiltInId::packUnorm2x16_Float2,
     BuiltInName::packUnorm2x16,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpPackUnorm2x16,
@@ -10745,7 +10704,7 @@ constexpr const TFunction kFunction_unpackUnorm2x16_00E(
     BuiltInId::unpackUnorm2x16_UInt1,
     BuiltInName::unpackUnorm2x16,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00E00E,
+    BuiltInParameters::p01Q10D00D00E00E + 3,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpUnpackUnorm2x16,
@@ -10754,7 +10713,7 @@ constexpr const TFunction kFunction_packUnorm4x8_30B(
     BuiltInId::packUnorm4x8_Float4,
     BuiltInName::packUnorm4x8,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpPackUnorm4x8,
@@ -10763,7 +10722,7 @@ constexpr const TFunction kFunction_packSnorm4x8_30B(
     BuiltInId::packSnorm4x8_Float4,
     BuiltInName::packSnorm4x8,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpPackSnorm4x8,
@@ -10772,7 +10731,7 @@ constexpr const TFunction kFunction_unpackUnorm4x8_00E(
     BuiltInId::unpackUnorm4x8_UInt1,
     BuiltInName::unpackUnorm4x8,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00E00E,
+    BuiltInParameters::p01Q10D00D00E00E + 3,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpUnpackUnorm4x8,
@@ -10781,7 +10740,7 @@ constexpr const TFunction kFunction_unpackSnorm4x8_00E(
     BuiltInId::unpackSnorm4x8_UInt1,
     BuiltInName::unpackSnorm4x8,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00E00E,
+    BuiltInParameters::p01Q10D00D00E00E + 3,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpUnpackSnorm4x8,
@@ -10799,7 +10758,7 @@ constexpr const TFunction kFunction_unpackDouble2x32_00C(
     BuiltInId::unpackDouble2x32_Double1,
     BuiltInName::unpackDouble2x32,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpUnpackDouble2x32,
@@ -10808,7 +10767,7 @@ constexpr const TFunction kFunction_length_00B(
     BuiltInId::length_Float1,
     BuiltInName::length,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLength,
@@ -10817,7 +10776,7 @@ constexpr const TFunction kFunction_length_10B(
     BuiltInId::length_Float2,
     BuiltInName::length,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLength,
@@ -10826,7 +10785,7 @@ constexpr const TFunction kFunction_length_20B(
     BuiltInId::length_Float3,
     BuiltInName::length,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLength,
@@ -10835,7 +10794,7 @@ constexpr const TFunction kFunction_length_30B(
     BuiltInId::length_Float4,
     BuiltInName::length,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLength,
@@ -10844,7 +10803,7 @@ constexpr const TFunction kFunction_length_00C(
     BuiltInId::length_Double1,
     BuiltInName::length,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLength,
@@ -10853,7 +10812,7 @@ constexpr const TFunction kFunction_length_10C(
     BuiltInId::length_Double2,
     BuiltInName::length,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLength,
@@ -10862,7 +10821,7 @@ constexpr const TFunction kFunction_length_20C(
     BuiltInId::length_Double3,
     BuiltInName::length,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLength,
@@ -10871,7 +10830,7 @@ constexpr const TFunction kFunction_length_30C(
     BuiltInId::length_Double4,
     BuiltInName::length,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpLength,
@@ -10880,7 +10839,7 @@ constexpr const TFunction kFunction_distance_00B00B(
     BuiltInId::distance_Float1_Float1,
     BuiltInName::distance,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDistance,
@@ -10889,7 +10848,7 @@ constexpr const TFunction kFunction_distance_10B10B(
     BuiltInId::distance_Float2_Float2,
     BuiltInName::distance,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDistance,
@@ -10898,7 +10857,7 @@ constexpr const TFunction kFunction_distance_20B20B(
     BuiltInId::distance_Float3_Float3,
     BuiltInName::distance,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDistance,
@@ -10907,7 +10866,7 @@ constexpr const TFunction kFunction_distance_30B30B(
     BuiltInId::distance_Float4_Float4,
     BuiltInName::distance,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDistance,
@@ -10916,7 +10875,7 @@ constexpr const TFunction kFunction_distance_00C00C(
     BuiltInId::distance_Double1_Double1,
     BuiltInName::distance,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C00C10C,
+    BuiltInParameters::p00C00C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDistance,
@@ -10925,7 +10884,7 @@ constexpr const TFunction kFunction_distance_10C10C(
     BuiltInId::distance_Double2_Double2,
     BuiltInName::distance,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C10C10F,
+    BuiltInParameters::p10C10C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDistance,
@@ -10934,7 +10893,7 @@ constexpr const TFunction kFunction_distance_20C20C(
     BuiltInId::distance_Double3_Double3,
     BuiltInName::distance,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p20C20C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDistance,
@@ -10952,7 +10911,7 @@ constexpr const TFunction kFunction_dot_00B00B(
     BuiltInId::dot_Float1_Float1,
     BuiltInName::dot,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDot,
@@ -10961,7 +10920,7 @@ constexpr const TFunction kFunction_dot_10B10B(
     BuiltInId::dot_Float2_Float2,
     BuiltInName::dot,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDot,
@@ -10970,7 +10929,7 @@ constexpr const TFunction kFunction_dot_20B20B(
     BuiltInId::dot_Float3_Float3,
     BuiltInName::dot,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDot,
@@ -10979,7 +10938,7 @@ constexpr const TFunction kFunction_dot_30B30B(
     BuiltInId::dot_Float4_Float4,
     BuiltInName::dot,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDot,
@@ -10988,7 +10947,7 @@ constexpr const TFunction kFunction_dot_00C00C(
     BuiltInId::dot_Double1_Double1,
     BuiltInName::dot,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C00C10C,
+    BuiltInParameters::p00C00C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDot,
@@ -10997,7 +10956,7 @@ constexpr const TFunction kFunction_dot_10C10C(
     BuiltInId::dot_Double2_Double2,
     BuiltInName::dot,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C10C10F,
+    BuiltInParameters::p10C10C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDot,
@@ -11006,7 +10965,7 @@ constexpr const TFunction kFunction_dot_20C20C(
     BuiltInId::dot_Double3_Double3,
     BuiltInName::dot,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p20C20C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDot,
@@ -11024,7 +10983,7 @@ constexpr const TFunction kFunction_cross_20B20B(
     BuiltInId::cross_Float3_Float3,
     BuiltInName::cross,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCross,
@@ -11033,7 +10992,7 @@ constexpr const TFunction kFunction_cross_20C20C(
     BuiltInId::cross_Double3_Double3,
     BuiltInName::cross,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p20C20C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCross,
@@ -11042,7 +11001,7 @@ constexpr const TFunction kFunction_normalize_00B(
     BuiltInId::normalize_Float1,
     BuiltInName::normalize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpNormalize,
@@ -11051,7 +11010,7 @@ constexpr const TFunction kFunction_normalize_10B(
     BuiltInId::normalize_Float2,
     BuiltInName::normalize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpNormalize,
@@ -11060,7 +11019,7 @@ constexpr const TFunction kFunction_normalize_20B(
     BuiltInId::normalize_Float3,
     BuiltInName::normalize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpNormalize,
@@ -11069,7 +11028,7 @@ constexpr const TFunction kFunction_normalize_30B(
     BuiltInId::normalize_Float4,
     BuiltInName::normalize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpNormalize,
@@ -11078,7 +11037,7 @@ constexpr const TFunction kFunction_normalize_00C(
     BuiltInId::normalize_Double1,
     BuiltInName::normalize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C10C,
+    BuiltInParameters::p00C00C00B,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpNormalize,
@@ -11087,7 +11046,7 @@ constexpr const TFunction kFunction_normalize_10C(
     BuiltInId::normalize_Double2,
     BuiltInName::normalize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C_o_10C,
+    BuiltInParameters::p00C00C10C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpNormalize,
@@ -11096,7 +11055,7 @@ constexpr const TFunction kFunction_normalize_20C(
     BuiltInId::normalize_Double3,
     BuiltInName::normalize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p00C00C20C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpNormalize,
@@ -11105,7 +11064,7 @@ constexpr const TFunction kFunction_normalize_30C(
     BuiltInId::normalize_Double4,
     BuiltInName::normalize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30C30C00B,
+    BuiltInParameters::p00C00C30C + 2,
     1,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpNormalize,
@@ -11114,7 +11073,7 @@ constexpr const TFunction kFunction_faceforward_00B00B00B(
     BuiltInId::faceforward_Float1_Float1_Float1,
     BuiltInName::faceforward,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B00B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFaceforward,
@@ -11123,7 +11082,7 @@ constexpr const TFunction kFunction_faceforward_10B10B10B(
     BuiltInId::faceforward_Float2_Float2_Float2,
     BuiltInName::faceforward,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFaceforward,
@@ -11132,7 +11091,7 @@ constexpr const TFunction kFunction_faceforward_20B20B20B(
     BuiltInId::faceforward_Float3_Float3_Float3,
     BuiltInName::faceforward,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B20B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFaceforward,
@@ -11186,7 +11145,7 @@ constexpr const TFunction kFunction_reflect_00B00B(
     BuiltInId::reflect_Float1_Float1,
     BuiltInName::reflect,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpReflect,
@@ -11195,7 +11154,7 @@ constexpr const TFunction kFunction_reflect_10B10B(
     BuiltInId::reflect_Float2_Float2,
     BuiltInName::reflect,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpReflect,
@@ -11204,7 +11163,7 @@ constexpr const TFunction kFunction_reflect_20B20B(
     BuiltInId::reflect_Float3_Float3,
     BuiltInName::reflect,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpReflect,
@@ -11213,7 +11172,7 @@ constexpr const TFunction kFunction_reflect_30B30B(
     BuiltInId::reflect_Float4_Float4,
     BuiltInName::reflect,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpReflect,
@@ -11222,7 +11181,7 @@ constexpr const TFunction kFunction_reflect_00C00C(
     BuiltInId::reflect_Double1_Double1,
     BuiltInName::reflect,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00C00C10C,
+    BuiltInParameters::p00C00C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpReflect,
@@ -11231,7 +11190,7 @@ constexpr const TFunction kFunction_reflect_10C10C(
     BuiltInId::reflect_Double2_Double2,
     BuiltInName::reflect,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10C10C10F,
+    BuiltInParameters::p10C10C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpReflect,
@@ -11240,7 +11199,7 @@ constexpr const TFunction kFunction_reflect_20C20C(
     BuiltInId::reflect_Double3_Double3,
     BuiltInName::reflect,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20C20C20F,
+    BuiltInParameters::p20C20C00B,
     2,
     StaticType::Get<EbtDouble, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpReflect,
@@ -11258,7 +11217,7 @@ constexpr const TFunction kFunction_refract_00B00B00B(
     BuiltInId::refract_Float1_Float1_Float1,
     BuiltInName::refract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B00B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpRefract,
@@ -11420,7 +11379,7 @@ constexpr const TFunction kFunction_outerProduct_10B10B(
     BuiltInId::outerProduct_Float2_Float2,
     BuiltInName::outerProduct,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 2>(),
     EOpOuterProduct,
@@ -11429,7 +11388,7 @@ constexpr const TFunction kFunction_outerProduct_20B20B(
     BuiltInId::outerProduct_Float3_Float3,
     BuiltInName::outerProduct,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 3>(),
     EOpOuterProduct,
@@ -11438,7 +11397,7 @@ constexpr const TFunction kFunction_outerProduct_30B30B(
     BuiltInId::outerProduct_Float4_Float4,
     BuiltInName::outerProduct,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 4>(),
     EOpOuterProduct,
@@ -11447,7 +11406,7 @@ constexpr const TFunction kFunction_outerProduct_20B10B(
     BuiltInId::outerProduct_Float3_Float2,
     BuiltInName::outerProduct,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B10B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 3>(),
     EOpOuterProduct,
@@ -11465,7 +11424,7 @@ constexpr const TFunction kFunction_outerProduct_30B10B(
     BuiltInId::outerProduct_Float4_Float2,
     BuiltInName::outerProduct,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B10B,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 4>(),
     EOpOuterProduct,
@@ -11483,7 +11442,7 @@ constexpr const TFunction kFunction_outerProduct_30B20B(
     BuiltInId::outerProduct_Float4_Float3,
     BuiltInName::outerProduct,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B20B,
+    BuiltInParameters::p00J30B20B20B20D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 4>(),
     EOpOuterProduct,
@@ -11636,7 +11595,7 @@ constexpr const TFunction kFunction_lessThan_10B10B(
     BuiltInId::lessThan_Float2_Float2,
     BuiltInName::lessThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLessThanComponentWise,
@@ -11645,7 +11604,7 @@ constexpr const TFunction kFunction_lessThan_20B20B(
     BuiltInId::lessThan_Float3_Float3,
     BuiltInName::lessThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpLessThanComponentWise,
@@ -11654,7 +11613,7 @@ constexpr const TFunction kFunction_lessThan_30B30B(
     BuiltInId::lessThan_Float4_Float4,
     BuiltInName::lessThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLessThanComponentWise,
@@ -11663,7 +11622,7 @@ constexpr const TFunction kFunction_lessThan_10D10D(
     BuiltInId::lessThan_Int2_Int2,
     BuiltInName::lessThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p10D10D00D00D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLessThanComponentWise,
@@ -11681,7 +11640,7 @@ constexpr const TFunction kFunction_lessThan_30D30D(
     BuiltInId::lessThan_Int4_Int4,
     BuiltInName::lessThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p30D30D00D00D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLessThanComponentWise,
@@ -11717,7 +11676,7 @@ constexpr const TFunction kFunction_lessThanEqual_10B10B(
     BuiltInId::lessThanEqual_Float2_Float2,
     BuiltInName::lessThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLessThanEqualComponentWise,
@@ -11726,7 +11685,7 @@ constexpr const TFunction kFunction_lessThanEqual_20B20B(
     BuiltInId::lessThanEqual_Float3_Float3,
     BuiltInName::lessThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpLessThanEqualComponentWise,
@@ -11735,7 +11694,7 @@ constexpr const TFunction kFunction_lessThanEqual_30B30B(
     BuiltInId::lessThanEqual_Float4_Float4,
     BuiltInName::lessThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLessThanEqualComponentWise,
@@ -11744,7 +11703,7 @@ constexpr const TFunction kFunction_lessThanEqual_10D10D(
     BuiltInId::lessThanEqual_Int2_Int2,
     BuiltInName::lessThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p10D10D00D00D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLessThanEqualComponentWise,
@@ -11762,7 +11721,7 @@ constexpr const TFunction kFunction_lessThanEqual_30D30D(
     BuiltInId::lessThanEqual_Int4_Int4,
     BuiltInName::lessThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p30D30D00D00D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLessThanEqualComponentWise,
@@ -11798,7 +11757,7 @@ constexpr const TFunction kFunction_greaterThan_10B10B(
     BuiltInId::greaterThan_Float2_Float2,
     BuiltInName::greaterThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpGreaterThanComponentWise,
@@ -11807,7 +11766,7 @@ constexpr const TFunction kFunction_greaterThan_20B20B(
     BuiltInId::greaterThan_Float3_Float3,
     BuiltInName::greaterThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpGreaterThanComponentWise,
@@ -11816,7 +11775,7 @@ constexpr const TFunction kFunction_greaterThan_30B30B(
     BuiltInId::greaterThan_Float4_Float4,
     BuiltInName::greaterThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpGreaterThanComponentWise,
@@ -11825,7 +11784,7 @@ constexpr const TFunction kFunction_greaterThan_10D10D(
     BuiltInId::greaterThan_Int2_Int2,
     BuiltInName::greaterThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p10D10D00D00D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpGreaterThanComponentWise,
@@ -11843,7 +11802,7 @@ constexpr const TFunction kFunction_greaterThan_30D30D(
     BuiltInId::greaterThan_Int4_Int4,
     BuiltInName::greaterThan,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p30D30D00D00D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpGreaterThanComponentWise,
@@ -11879,7 +11838,7 @@ constexpr const TFunction kFunction_greaterThanEqual_10B10B(
     BuiltInId::greaterThanEqual_Float2_Float2,
     BuiltInName::greaterThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpGreaterThanEqualComponentWise,
@@ -11888,7 +11847,7 @@ constexpr const TFunction kFunction_greaterThanEqual_20B20B(
     BuiltInId::greaterThanEqual_Float3_Float3,
     BuiltInName::greaterThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpGreaterThanEqualComponentWise,
@@ -11897,7 +11856,7 @@ constexpr const TFunction kFunction_greaterThanEqual_30B30B(
     BuiltInId::greaterThanEqual_Float4_Float4,
     BuiltInName::greaterThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpGreaterThanEqualComponentWise,
@@ -11906,7 +11865,7 @@ constexpr const TFunction kFunction_greaterThanEqual_10D10D(
     BuiltInId::greaterThanEqual_Int2_Int2,
     BuiltInName::greaterThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p10D10D00D00D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpGreaterThanEqualComponentWise,
@@ -11924,7 +11883,7 @@ constexpr const TFunction kFunction_greaterThanEqual_30D30D(
     BuiltInId::greaterThanEqual_Int4_Int4,
     BuiltInName::greaterThanEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p30D30D00D00D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpGreaterThanEqualComponentWise,
@@ -11960,7 +11919,7 @@ constexpr const TFunction kFunction_equal_10B10B(
     BuiltInId::equal_Float2_Float2,
     BuiltInName::equal,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpEqualComponentWise,
@@ -11969,7 +11928,7 @@ constexpr const TFunction kFunction_equal_20B20B(
     BuiltInId::equal_Float3_Float3,
     BuiltInName::equal,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpEqualComponentWise,
@@ -11978,7 +11937,7 @@ constexpr const TFunction kFunction_equal_30B30B(
     BuiltInId::equal_Float4_Float4,
     BuiltInName::equal,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpEqualComponentWise,
@@ -11987,7 +11946,7 @@ constexpr const TFunction kFunction_equal_10D10D(
     BuiltInId::equal_Int2_Int2,
     BuiltInName::equal,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p10D10D00D00D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpEqualComponentWise,
@@ -12005,7 +11964,7 @@ constexpr const TFunction kFunction_equal_30D30D(
     BuiltInId::equal_Int4_Int4,
     BuiltInName::equal,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p30D30D00D00D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpEqualComponentWise,
@@ -12068,7 +12027,7 @@ constexpr const TFunction kFunction_notEqual_10B10B(
     BuiltInId::notEqual_Float2_Float2,
     BuiltInName::notEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpNotEqualComponentWise,
@@ -12077,7 +12036,7 @@ constexpr const TFunction kFunction_notEqual_20B20B(
     BuiltInId::notEqual_Float3_Float3,
     BuiltInName::notEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00J20B20B20B20D + 1,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpNotEqualComponentWise,
@@ -12086,7 +12045,7 @@ constexpr const TFunction kFunction_notEqual_30B30B(
     BuiltInId::notEqual_Float4_Float4,
     BuiltInName::notEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30B30F,
+    BuiltInParameters::p30B30B00B,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpNotEqualComponentWise,
@@ -12095,7 +12054,7 @@ constexpr const TFunction kFunction_notEqual_10D10D(
     BuiltInId::notEqual_Int2_Int2,
     BuiltInName::notEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p10D10D00D00D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpNotEqualComponentWise,
@@ -12113,7 +12072,7 @@ constexpr const TFunction kFunction_notEqual_30D30D(
     BuiltInId::notEqual_Int4_Int4,
     BuiltInName::notEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p30D30D00D00D,
     2,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpNotEqualComponentWise,
@@ -12176,7 +12135,7 @@ constexpr const TFunction kFunction_any_10F(
     BuiltInId::any_Bool2,
     BuiltInName::any,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10F10F10F,
+    BuiltInParameters::p10B10B10F + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAny,
@@ -12185,7 +12144,7 @@ constexpr const TFunction kFunction_any_20F(
     BuiltInId::any_Bool3,
     BuiltInName::any,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20F20F20F,
+    BuiltInParameters::p20B20B20F + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAny,
@@ -12194,7 +12153,7 @@ constexpr const TFunction kFunction_any_30F(
     BuiltInId::any_Bool4,
     BuiltInName::any,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30F30F30F,
+    BuiltInParameters::p30B30B30F + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAny,
@@ -12203,7 +12162,7 @@ constexpr const TFunction kFunction_all_10F(
     BuiltInId::all_Bool2,
     BuiltInName::all,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10F10F10F,
+    BuiltInParameters::p10B10B10F + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAll,
@@ -12212,7 +12171,7 @@ constexpr const TFunction kFunction_all_20F(
     BuiltInId::all_Bool3,
     BuiltInName::all,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20F20F20F,
+    BuiltInParameters::p20B20B20F + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAll,
@@ -12221,7 +12180,7 @@ constexpr const TFunction kFunction_all_30F(
     BuiltInId::all_Bool4,
     BuiltInName::all,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30F30F30F,
+    BuiltInParameters::p30B30B30F + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpAll,
@@ -12230,7 +12189,7 @@ constexpr const TFunction kFunction_notFunc_10F(
     BuiltInId::notFunc_Bool2,
     BuiltInName::notFunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10F10F10F,
+    BuiltInParameters::p10B10B10F + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpLogicalNotComponentWise,
@@ -12239,7 +12198,7 @@ constexpr const TFunction kFunction_notFunc_20F(
     BuiltInId::notFunc_Bool3,
     BuiltInName::notFunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20F20F20F,
+    BuiltInParameters::p20B20B20F + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpLogicalNotComponentWise,
@@ -12248,7 +12207,7 @@ constexpr const TFunction kFunction_notFunc_30F(
     BuiltInId::notFunc_Bool4,
     BuiltInName::notFunc,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30F30F30F,
+    BuiltInParameters::p30B30B30F + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpLogicalNotComponentWise,
@@ -12257,7 +12216,7 @@ constexpr const TFunction kFunction_bitfieldExtract_00D00D00D(
     BuiltInId::bitfieldExtract_Int1_Int1_Int1,
     BuiltInName::bitfieldExtract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D00D00D,
+    BuiltInParameters::p01Q10D00D00D00D + 2,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpBitfieldExtract,
@@ -12266,7 +12225,7 @@ constexpr const TFunction kFunction_bitfieldExtract_10D00D00D(
     BuiltInId::bitfieldExtract_Int2_Int1_Int1,
     BuiltInName::bitfieldExtract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D00D00D,
+    BuiltInParameters::p01Q10D00D00D00D + 1,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpBitfieldExtract,
@@ -12275,7 +12234,7 @@ constexpr const TFunction kFunction_bitfieldExtract_20D00D00D(
     BuiltInId::bitfieldExtract_Int3_Int1_Int1,
     BuiltInName::bitfieldExtract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20D00D00D,
+    BuiltInParameters::p01T20D00D00D00D + 1,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpBitfieldExtract,
@@ -12284,7 +12243,7 @@ constexpr const TFunction kFunction_bitfieldExtract_30D00D00D(
     BuiltInId::bitfieldExtract_Int4_Int1_Int1,
     BuiltInName::bitfieldExtract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D00D00D,
+    BuiltInParameters::p30D30D00D00D + 1,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpBitfieldExtract,
@@ -12293,7 +12252,7 @@ constexpr const TFunction kFunction_bitfieldExtract_00E00D00D(
     BuiltInId::bitfieldExtract_UInt1_Int1_Int1,
     BuiltInName::bitfieldExtract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00D00D,
+    BuiltInParameters::p00E00E00D00D + 1,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpBitfieldExtract,
@@ -12302,7 +12261,7 @@ constexpr const TFunction kFunction_bitfieldExtract_10E00D00D(
     BuiltInId::bitfieldExtract_UInt2_Int1_Int1,
     BuiltInName::bitfieldExtract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10E00D00D,
+    BuiltInParameters::p10E10E00D00D + 1,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpBitfieldExtract,
@@ -12311,7 +12270,7 @@ constexpr const TFunction kFunction_bitfieldExtract_20E00D00D(
     BuiltInId::bitfieldExtract_UInt3_Int1_Int1,
     BuiltInName::bitfieldExtract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20E00D00D,
+    BuiltInParameters::p20E20E00D00D + 1,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpBitfieldExtract,
@@ -12320,7 +12279,7 @@ constexpr const TFunction kFunction_bitfieldExtract_30E00D00D(
     BuiltInId::bitfieldExtract_UInt4_Int1_Int1,
     BuiltInName::bitfieldExtract,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30E00D00D,
+    BuiltInParameters::p30E30E00D00D + 1,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpBitfieldExtract,
@@ -12401,7 +12360,7 @@ constexpr const TFunction kFunction_bitfieldReverse_00D(
     BuiltInId::bitfieldReverse_Int1,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D_o_00D_o_00D,
+    BuiltInParameters::p00g00B00B00B00D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpBitfieldReverse,
@@ -12410,7 +12369,7 @@ constexpr const TFunction kFunction_bitfieldReverse_10D(
     BuiltInId::bitfieldReverse_Int2,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p00I10B10B10B10D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpBitfieldReverse,
@@ -12419,7 +12378,7 @@ constexpr const TFunction kFunction_bitfieldReverse_20D(
     BuiltInId::bitfieldReverse_Int3,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20D20D00D00D,
+    BuiltInParameters::p00J20B20B20B20D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpBitfieldReverse,
@@ -12428,7 +12387,7 @@ constexpr const TFunction kFunction_bitfieldReverse_30D(
     BuiltInId::bitfieldReverse_Int4,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p01R10D00D30D + 3,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpBitfieldReverse,
@@ -12437,7 +12396,7 @@ constexpr const TFunction kFunction_bitfieldReverse_00E(
     BuiltInId::bitfieldReverse_UInt1,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00E00E,
+    BuiltInParameters::p01Q10D00D00E00E + 3,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpBitfieldReverse,
@@ -12464,7 +12423,7 @@ constexpr const TFunction kFunction_bitfieldReverse_30E(
     BuiltInId::bitfieldReverse_UInt4,
     BuiltInName::bitfieldReverse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30E30E00D00D,
+    BuiltInParameters::p01S10D00D30E + 3,
     1,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpBitfieldReverse,
@@ -12473,7 +12432,7 @@ constexpr const TFunction kFunction_bitCount_00D(
     BuiltInId::bitCount_Int1,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D_o_00D_o_00D,
+    BuiltInParameters::p00g00B00B00B00D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpBitCount,
@@ -12482,7 +12441,7 @@ constexpr const TFunction kFunction_bitCount_10D(
     BuiltInId::bitCount_Int2,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p00I10B10B10B10D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpBitCount,
@@ -12491,7 +12450,7 @@ constexpr const TFunction kFunction_bitCount_20D(
     BuiltInId::bitCount_Int3,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20D20D00D00D,
+    BuiltInParameters::p00J20B20B20B20D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpBitCount,
@@ -12500,7 +12459,7 @@ constexpr const TFunction kFunction_bitCount_30D(
     BuiltInId::bitCount_Int4,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p01R10D00D30D + 3,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpBitCount,
@@ -12509,7 +12468,7 @@ constexpr const TFunction kFunction_bitCount_00E(
     BuiltInId::bitCount_UInt1,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00E00E,
+    BuiltInParameters::p01Q10D00D00E00E + 3,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpBitCount,
@@ -12536,7 +12495,7 @@ constexpr const TFunction kFunction_bitCount_30E(
     BuiltInId::bitCount_UInt4,
     BuiltInName::bitCount,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30E30E00D00D,
+    BuiltInParameters::p01S10D00D30E + 3,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpBitCount,
@@ -12545,7 +12504,7 @@ constexpr const TFunction kFunction_findLSB_00D(
     BuiltInId::findLSB_Int1,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D_o_00D_o_00D,
+    BuiltInParameters::p00g00B00B00B00D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFindLSB,
@@ -12554,7 +12513,7 @@ constexpr const TFunction kFunction_findLSB_10D(
     BuiltInId::findLSB_Int2,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p00I10B10B10B10D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFindLSB,
@@ -12563,7 +12522,7 @@ constexpr const TFunction kFunction_findLSB_20D(
     BuiltInId::findLSB_Int3,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20D20D00D00D,
+    BuiltInParameters::p00J20B20B20B20D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFindLSB,
@@ -12572,7 +12531,7 @@ constexpr const TFunction kFunction_findLSB_30D(
     BuiltInId::findLSB_Int4,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p01R10D00D30D + 3,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFindLSB,
@@ -12581,7 +12540,7 @@ constexpr const TFunction kFunction_findLSB_00E(
     BuiltInId::findLSB_UInt1,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00E00E,
+    BuiltInParameters::p01Q10D00D00E00E + 3,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFindLSB,
@@ -12608,7 +12567,7 @@ constexpr const TFunction kFunction_findLSB_30E(
     BuiltInId::findLSB_UInt4,
     BuiltInName::findLSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30E30E00D00D,
+    BuiltInParameters::p01S10D00D30E + 3,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFindLSB,
@@ -12617,7 +12576,7 @@ constexpr const TFunction kFunction_findMSB_00D(
     BuiltInId::findMSB_Int1,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D_o_00D_o_00D,
+    BuiltInParameters::p00g00B00B00B00D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFindMSB,
@@ -12626,7 +12585,7 @@ constexpr const TFunction kFunction_findMSB_10D(
     BuiltInId::findMSB_Int2,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10D10D_o_10D_o_10D,
+    BuiltInParameters::p00I10B10B10B10D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFindMSB,
@@ -12635,7 +12594,7 @@ constexpr const TFunction kFunction_findMSB_20D(
     BuiltInId::findMSB_Int3,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20D20D00D00D,
+    BuiltInParameters::p00J20B20B20B20D + 4,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFindMSB,
@@ -12644,7 +12603,7 @@ constexpr const TFunction kFunction_findMSB_30D(
     BuiltInId::findMSB_Int4,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30D30D30F,
+    BuiltInParameters::p01R10D00D30D + 3,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFindMSB,
@@ -12653,7 +12612,7 @@ constexpr const TFunction kFunction_findMSB_00E(
     BuiltInId::findMSB_UInt1,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00E00E00E,
+    BuiltInParameters::p01Q10D00D00E00E + 3,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFindMSB,
@@ -12680,7 +12639,7 @@ constexpr const TFunction kFunction_findMSB_30E(
     BuiltInId::findMSB_UInt4,
     BuiltInName::findMSB,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30E30E00D00D,
+    BuiltInParameters::p01S10D00D30E + 3,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFindMSB,
@@ -12833,7 +12792,7 @@ constexpr const TFunction kFunction_texture2D_00I10B(
     BuiltInId::texture2D_Sampler2D1_Float2,
     BuiltInName::texture2D,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00I10B00D,
+    BuiltInParameters::p00I10B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -12851,7 +12810,7 @@ constexpr const TFunction kFunction_texture2DProj_00I30B(
     BuiltInId::texture2DProj_Sampler2D1_Float4,
     BuiltInName::texture2DProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00I30B00B10D,
+    BuiltInParameters::p00I30B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -12878,7 +12837,7 @@ constexpr const TFunction kFunction_texture1DProj_00g10B(
     BuiltInId::texture1DProj_Sampler1D1_Float2,
     BuiltInName::texture1DProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00g10B00B00D,
+    BuiltInParameters::p00g10B00B00B00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -12887,7 +12846,7 @@ constexpr const TFunction kFunction_texture1DProj_00g30B(
     BuiltInId::texture1DProj_Sampler1D1_Float4,
     BuiltInName::texture1DProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00g30B00B00D,
+    BuiltInParameters::p00g30B00B00B00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -12896,7 +12855,7 @@ constexpr const TFunction kFunction_texture3D_00J20B(
     BuiltInId::texture3D_Sampler3D1_Float3,
     BuiltInName::texture3D,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00J20B00B20D,
+    BuiltInParameters::p00J20B20B20B20D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -12905,7 +12864,7 @@ constexpr const TFunction kFunction_texture3DProj_00J30B(
     BuiltInId::texture3DProj_Sampler3D1_Float4,
     BuiltInName::texture3DProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00J30B00B20D,
+    BuiltInParameters::p00J30B20B20B20D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -12914,7 +12873,7 @@ constexpr const TFunction kFunction_shadow1D_00m20B(
     BuiltInId::shadow1D_Sampler1DShadow1_Float3,
     BuiltInName::shadow1D,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00m20B00B00D,
+    BuiltInParameters::p00m20B00B00B00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -12923,7 +12882,7 @@ constexpr const TFunction kFunction_shadow1DProj_00m30B(
     BuiltInId::shadow1DProj_Sampler1DShadow1_Float4,
     BuiltInName::shadow1DProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00m30B00D00B,
+    BuiltInParameters::p00m30B00B00B00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -12932,7 +12891,7 @@ constexpr const TFunction kFunction_shadow2D_00d20B(
     BuiltInId::shadow2D_Sampler2DShadow1_Float3,
     BuiltInName::shadow2D,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00d20B00B10D,
+    BuiltInParameters::p00d20B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -12977,7 +12936,7 @@ constexpr const TFunction kFunction_texture2DRect_00O10B(
     BuiltInId::texture2DRect_Sampler2DRect1_Float2,
     BuiltInName::texture2DRect,
     TExtension::ARB_texture_rectangle,
-    BuiltInParameters::p00O10B70D00D,
+    BuiltInParameters::p00O10B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -12986,7 +12945,7 @@ constexpr const TFunction kFunction_texture2DRectProj_00O20B(
     BuiltInId::texture2DRectProj_Sampler2DRect1_Float3,
     BuiltInName::texture2DRectProj,
     TExtension::ARB_texture_rectangle,
-    BuiltInParameters::p00O20B00D,
+    BuiltInParameters::p00O20B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13004,7 +12963,7 @@ constexpr const TFunction kFunction_texture_00O10B(
     BuiltInId::texture_Sampler2DRect1_Float2,
     BuiltInName::texture,
     TExtension::ARB_texture_rectangle,
-    BuiltInParameters::p00O10B70D00D,
+    BuiltInParameters::p00O10B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13013,7 +12972,7 @@ constexpr const TFunction kFunction_textureProj_00O20B(
     BuiltInId::textureProj_Sampler2DRect1_Float3,
     BuiltInName::textureProj,
     TExtension::ARB_texture_rectangle,
-    BuiltInParameters::p00O20B00D,
+    BuiltInParameters::p00O20B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13148,7 +13107,7 @@ constexpr const TFunction kFunction_texture1DProj_00g10B00B(
     BuiltInId::texture1DProj_Sampler1D1_Float2_Float1,
     BuiltInName::texture1DProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00g10B00B00D,
+    BuiltInParameters::p00g10B00B00B00D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13175,7 +13134,7 @@ constexpr const TFunction kFunction_shadow1DProj_00m30B00B(
     BuiltInId::shadow1DProj_Sampler1DShadow1_Float4_Float1,
     BuiltInName::shadow1DProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00m30B00B00D,
+    BuiltInParameters::p00m30B00B00B00D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13202,7 +13161,7 @@ constexpr const TFunction kFunction_dFdxExt_00B(
     BuiltInId::dFdxExt_Float1,
     BuiltInName::dFdxExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDFdx,
@@ -13211,7 +13170,7 @@ constexpr const TFunction kFunction_dFdxExt_10B(
     BuiltInId::dFdxExt_Float2,
     BuiltInName::dFdxExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpDFdx,
@@ -13220,7 +13179,7 @@ constexpr const TFunction kFunction_dFdxExt_20B(
     BuiltInId::dFdxExt_Float3,
     BuiltInName::dFdxExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpDFdx,
@@ -13229,7 +13188,7 @@ constexpr const TFunction kFunction_dFdxExt_30B(
     BuiltInId::dFdxExt_Float4,
     BuiltInName::dFdxExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpDFdx,
@@ -13238,7 +13197,7 @@ constexpr const TFunction kFunction_dFdyExt_00B(
     BuiltInId::dFdyExt_Float1,
     BuiltInName::dFdyExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDFdy,
@@ -13247,7 +13206,7 @@ constexpr const TFunction kFunction_dFdyExt_10B(
     BuiltInId::dFdyExt_Float2,
     BuiltInName::dFdyExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpDFdy,
@@ -13256,7 +13215,7 @@ constexpr const TFunction kFunction_dFdyExt_20B(
     BuiltInId::dFdyExt_Float3,
     BuiltInName::dFdyExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpDFdy,
@@ -13265,7 +13224,7 @@ constexpr const TFunction kFunction_dFdyExt_30B(
     BuiltInId::dFdyExt_Float4,
     BuiltInName::dFdyExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpDFdy,
@@ -13274,7 +13233,7 @@ constexpr const TFunction kFunction_fwidthExt_00B(
     BuiltInId::fwidthExt_Float1,
     BuiltInName::fwidthExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFwidth,
@@ -13283,7 +13242,7 @@ constexpr const TFunction kFunction_fwidthExt_10B(
     BuiltInId::fwidthExt_Float2,
     BuiltInName::fwidthExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFwidth,
@@ -13292,7 +13251,7 @@ constexpr const TFunction kFunction_fwidthExt_20B(
     BuiltInId::fwidthExt_Float3,
     BuiltInName::fwidthExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFwidth,
@@ -13301,7 +13260,7 @@ constexpr const TFunction kFunction_fwidthExt_30B(
     BuiltInId::fwidthExt_Float4,
     BuiltInName::fwidthExt,
     TExtension::OES_standard_derivatives,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFwidth,
@@ -13391,7 +13350,7 @@ constexpr const TFunction kFunction_texture1DProjLod_00g10B00B(
     BuiltInId::texture1DProjLod_Sampler1D1_Float2_Float1,
     BuiltInName::texture1DProjLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00g10B00B00D,
+    BuiltInParameters::p00g10B00B00B00D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13418,7 +13377,7 @@ constexpr const TFunction kFunction_shadow1DProjLod_00m30B00B(
     BuiltInId::shadow1DProjLod_Sampler1DShadow1_Float4_Float1,
     BuiltInName::shadow1DProjLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00m30B00B00D,
+    BuiltInParameters::p00m30B00B00B00D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13445,7 +13404,7 @@ constexpr const TFunction kFunction_texture_00I10B(
     BuiltInId::texture_Sampler2D1_Float2,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00I10B00D,
+    BuiltInParameters::p00I10B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13454,7 +13413,7 @@ constexpr const TFunction kFunction_texture_00R10B(
     BuiltInId::texture_ISampler2D1_Float2,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00R10B70D00D,
+    BuiltInParameters::p00R10B10B10B10D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13463,7 +13422,7 @@ constexpr const TFunction kFunction_texture_00X10B(
     BuiltInId::texture_USampler2D1_Float2,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00X10B70D00D,
+    BuiltInParameters::p00X10B10B10B10D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13472,7 +13431,7 @@ constexpr const TFunction kFunction_texture_00J20B(
     BuiltInId::texture_Sampler3D1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00J20B00B20D,
+    BuiltInParameters::p00J20B20B20B20D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13508,7 +13467,7 @@ constexpr const TFunction kFunction_texture_00T20B(
     BuiltInId::texture_ISamplerCube1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00T20B00D,
+    BuiltInParameters::p00T20B20B20B,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13517,7 +13476,7 @@ constexpr const TFunction kFunction_texture_00Z20B(
     BuiltInId::texture_USamplerCube1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00Z20B00B,
+    BuiltInParameters::p00Z20B20B20B,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13526,7 +13485,7 @@ constexpr const TFunction kFunction_texture_00L20B(
     BuiltInId::texture_Sampler2DArray1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00L20B10D00D,
+    BuiltInParameters::p00L20B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13535,7 +13494,7 @@ constexpr const TFunction kFunction_texture_00U20B(
     BuiltInId::texture_ISampler2DArray1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00U20B10D00D,
+    BuiltInParameters::p00U20B10B10B10D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13553,7 +13512,7 @@ constexpr const TFunction kFunction_texture_00d20B(
     BuiltInId::texture_Sampler2DShadow1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00d20B00B10D,
+    BuiltInParameters::p00d20B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -13589,7 +13548,7 @@ constexpr const TFunction kFunction_texture_00o00B(
     BuiltInId::texture_ISampler1D1_Float1,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00o00B00B00D,
+    BuiltInParameters::p00o00B00B00B00D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13598,7 +13557,7 @@ constexpr const TFunction kFunction_texture_00t00B(
     BuiltInId::texture_USampler1D1_Float1,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00t00B00B00D,
+    BuiltInParameters::p00t00B00B00B00D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13607,7 +13566,7 @@ constexpr const TFunction kFunction_texture_00m20B(
     BuiltInId::texture_Sampler1DShadow1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00m20B00B00D,
+    BuiltInParameters::p00m20B00B00B00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -13643,7 +13602,7 @@ constexpr const TFunction kFunction_texture_00i20B(
     BuiltInId::texture_Sampler1DArrayShadow1_Float3,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00i20B00B00D,
+    BuiltInParameters::p00i20B00B00B00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -13652,7 +13611,7 @@ constexpr const TFunction kFunction_texture_00q10B(
     BuiltInId::texture_ISampler2DRect1_Float2,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00q10B10D00D,
+    BuiltInParameters::p00q10B10B10B10D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13661,7 +13620,7 @@ constexpr const TFunction kFunction_texture_00v10B(
     BuiltInId::texture_USampler2DRect1_Float2,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00v10B70D00D,
+    BuiltInParameters::p00v10B10B10B10D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13697,7 +13656,7 @@ constexpr const TFunction kFunction_textureProj_00R20B(
     BuiltInId::textureProj_ISampler2D1_Float3,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00R20B00B10D,
+    BuiltInParameters::p00R20B10B10B10D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13715,7 +13674,7 @@ constexpr const TFunction kFunction_textureProj_00I30B(
     BuiltInId::textureProj_Sampler2D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00I30B00B10D,
+    BuiltInParameters::p00I30B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13733,7 +13692,7 @@ constexpr const TFunction kFunction_textureProj_00X30B(
     BuiltInId::textureProj_USampler2D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00X30B10D00B,
+    BuiltInParameters::p00X30B10B10B10D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13742,7 +13701,7 @@ constexpr const TFunction kFunction_textureProj_00J30B(
     BuiltInId::textureProj_Sampler3D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00J30B00B20D,
+    BuiltInParameters::p00J30B20B20B20D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13751,7 +13710,7 @@ constexpr const TFunction kFunction_textureProj_00S30B(
     BuiltInId::textureProj_ISampler3D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00S30B20D00B,
+    BuiltInParameters::p00S30B20B20B20D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13760,7 +13719,7 @@ constexpr const TFunction kFunction_textureProj_00Y30B(
     BuiltInId::textureProj_USampler3D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00Y30B20D00B,
+    BuiltInParameters::p00Y30B20B20B20D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13778,7 +13737,7 @@ constexpr const TFunction kFunction_textureProj_00g10B(
     BuiltInId::textureProj_Sampler1D1_Float2,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00g10B00B00D,
+    BuiltInParameters::p00g10B00B00B00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13796,7 +13755,7 @@ constexpr const TFunction kFunction_textureProj_00t10B(
     BuiltInId::textureProj_USampler1D1_Float2,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00t10B00D00B,
+    BuiltInParameters::p00t10B00B00B00D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13805,7 +13764,7 @@ constexpr const TFunction kFunction_textureProj_00g30B(
     BuiltInId::textureProj_Sampler1D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00g30B00B00D,
+    BuiltInParameters::p00g30B00B00B00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13814,7 +13773,7 @@ constexpr const TFunction kFunction_textureProj_00o30B(
     BuiltInId::textureProj_ISampler1D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00o30B00D00B,
+    BuiltInParameters::p00o30B00B00B00D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13823,7 +13782,7 @@ constexpr const TFunction kFunction_textureProj_00t30B(
     BuiltInId::textureProj_USampler1D1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00t30B00D00B,
+    BuiltInParameters::p00t30B00B00B00D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13832,7 +13791,7 @@ constexpr const TFunction kFunction_textureProj_00m30B(
     BuiltInId::textureProj_Sampler1DShadow1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00m30B00D00B,
+    BuiltInParameters::p00m30B00B00B00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -13850,7 +13809,7 @@ constexpr const TFunction kFunction_textureProj_00v20B(
     BuiltInId::textureProj_USampler2DRect1_Float3,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00v20B00D,
+    BuiltInParameters::p00v20B10B10B10D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13859,7 +13818,7 @@ constexpr const TFunction kFunction_textureProj_00q30B(
     BuiltInId::textureProj_ISampler2DRect1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00q30B10D,
+    BuiltInParameters::p00q30B10B10B10D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13868,7 +13827,7 @@ constexpr const TFunction kFunction_textureProj_00v30B(
     BuiltInId::textureProj_USampler2DRect1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00v30B10D,
+    BuiltInParameters::p00v30B10B10B10D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -13877,7 +13836,7 @@ constexpr const TFunction kFunction_textureProj_00n30B(
     BuiltInId::textureProj_Sampler2DRectShadow1_Float4,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00n30B10D,
+    BuiltInParameters::p00n30B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -14012,7 +13971,7 @@ constexpr const TFunction kFunction_textureLod_00o00B00B(
     BuiltInId::textureLod_ISampler1D1_Float1_Float1,
     BuiltInName::textureLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00o00B00B00D,
+    BuiltInParameters::p00o00B00B00B00D,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -14021,7 +13980,7 @@ constexpr const TFunction kFunction_textureLod_00t00B00B(
     BuiltInId::textureLod_USampler1D1_Float1_Float1,
     BuiltInName::textureLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00t00B00B00D,
+    BuiltInParameters::p00t00B00B00B00D,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -14066,7 +14025,7 @@ constexpr const TFunction kFunction_textureLod_00i20B00B(
     BuiltInId::textureLod_Sampler1DArrayShadow1_Float3_Float1,
     BuiltInName::textureLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00i20B00B00D,
+    BuiltInParameters::p00i20B00B00B00D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -14309,7 +14268,7 @@ constexpr const TFunction kFunction_textureSize_00O(
     BuiltInId::textureSize_Sampler2DRect1,
     BuiltInName::textureSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00O20B00D,
+    BuiltInParameters::p00O10B10B10B10D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -14318,7 +14277,7 @@ constexpr const TFunction kFunction_textureSize_00q(
     BuiltInId::textureSize_ISampler2DRect1,
     BuiltInName::textureSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00q30B10D,
+    BuiltInParameters::p00q10B10B10B10D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -14327,7 +14286,7 @@ constexpr const TFunction kFunction_textureSize_00v(
     BuiltInId::textureSize_USampler2DRect1,
     BuiltInName::textureSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00v20B00D,
+    BuiltInParameters::p00v10B10B10B10D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -14336,7 +14295,7 @@ constexpr const TFunction kFunction_textureSize_00n(
     BuiltInId::textureSize_Sampler2DRectShadow1,
     BuiltInName::textureSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00n10B00B70D,
+    BuiltInParameters::p00n20B10B10B10D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -14498,7 +14457,7 @@ constexpr const TFunction kFunction_textureProjLod_00g10B00B(
     BuiltInId::textureProjLod_Sampler1D1_Float2_Float1,
     BuiltInName::textureProjLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00g10B00B00D,
+    BuiltInParameters::p00g10B00B00B00D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -14516,7 +14475,7 @@ constexpr const TFunction kFunction_textureProjLod_00t10B00B(
     BuiltInId::textureProjLod_USampler1D1_Float2_Float1,
     BuiltInName::textureProjLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00t10B00B00D,
+    BuiltInParameters::p00t10B00B00B00D,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -14534,7 +14493,7 @@ constexpr const TFunction kFunction_textureProjLod_00o30B00B(
     BuiltInId::textureProjLod_ISampler1D1_Float4_Float1,
     BuiltInName::textureProjLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00o30B00B00D,
+    BuiltInParameters::p00o30B00B00B00D,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -14543,7 +14502,7 @@ constexpr const TFunction kFunction_textureProjLod_00t30B00B(
     BuiltInId::textureProjLod_USampler1D1_Float4_Float1,
     BuiltInName::textureProjLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00t30B00B00D,
+    BuiltInParameters::p00t30B00B00B00D,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -14552,7 +14511,7 @@ constexpr const TFunction kFunction_textureProjLod_00m30B00B(
     BuiltInId::textureProjLod_Sampler1DShadow1_Float4_Float1,
     BuiltInName::textureProjLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00m30B00B00D,
+    BuiltInParameters::p00m30B00B00B00D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15245,7 +15204,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00o(
     BuiltInId::textureQueryLevels_ISampler1D1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00o00B00B00D,
+    BuiltInParameters::p00o00B00B00B00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15254,7 +15213,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00t(
     BuiltInId::textureQueryLevels_USampler1D1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00t10B00D00B,
+    BuiltInParameters::p00t00B00B00B00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15263,7 +15222,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00I(
     BuiltInId::textureQueryLevels_Sampler2D1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00I10B00D,
+    BuiltInParameters::p00I10B10B10B10D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15272,7 +15231,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00R(
     BuiltInId::textureQueryLevels_ISampler2D1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00R10B70D00D,
+    BuiltInParameters::p00R10B10B10B10D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15281,7 +15240,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00X(
     BuiltInId::textureQueryLevels_USampler2D1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00X10D00D10D,
+    BuiltInParameters::p00X10B10B10B10D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15290,7 +15249,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00J(
     BuiltInId::textureQueryLevels_Sampler3D1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00J30B00B20D,
+    BuiltInParameters::p00J20B20B20B20D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15299,7 +15258,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00S(
     BuiltInId::textureQueryLevels_ISampler3D1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00S30B20D00B,
+    BuiltInParameters::p00S20B20B20B20D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15317,7 +15276,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00K(
     BuiltInId::textureQueryLevels_SamplerCube1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00K00D,
+    BuiltInParameters::p00K20B20B20B,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15326,7 +15285,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00T(
     BuiltInId::textureQueryLevels_ISamplerCube1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00T00D,
+    BuiltInParameters::p00T20B20B20B,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15335,7 +15294,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00Z(
     BuiltInId::textureQueryLevels_USamplerCube1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00Z00D,
+    BuiltInParameters::p00Z20B20B20B,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15353,7 +15312,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00p(
     BuiltInId::textureQueryLevels_ISampler1DArray1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00p00B,
+    BuiltInParameters::p00p10B00B00B00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15362,7 +15321,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00u(
     BuiltInId::textureQueryLevels_USampler1DArray1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00u00B,
+    BuiltInParameters::p00u10B00B00B00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15371,7 +15330,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00L(
     BuiltInId::textureQueryLevels_Sampler2DArray1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00L20B10D00D,
+    BuiltInParameters::p00L20B10B10B10D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15380,7 +15339,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00U(
     BuiltInId::textureQueryLevels_ISampler2DArray1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00U20B10D00D,
+    BuiltInParameters::p00U20B10B10B10D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15389,7 +15348,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00a(
     BuiltInId::textureQueryLevels_USampler2DArray1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00a00D,
+    BuiltInParameters::p00a20B10B10B10D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15398,7 +15357,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00k(
     BuiltInId::textureQueryLevels_SamplerCubeArray1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00k30B00B,
+    BuiltInParameters::p00k30B20B20B,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15407,7 +15366,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00s(
     BuiltInId::textureQueryLevels_ISamplerCubeArray1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00s20B,
+    BuiltInParameters::p00s30B20B20B,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15416,7 +15375,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00x(
     BuiltInId::textureQueryLevels_USamplerCubeArray1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00x20B,
+    BuiltInParameters::p00x30B20B20B,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15425,7 +15384,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00m(
     BuiltInId::textureQueryLevels_Sampler1DShadow1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00m30B00D00B,
+    BuiltInParameters::p00m20B00B00B00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15434,7 +15393,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00d(
     BuiltInId::textureQueryLevels_Sampler2DShadow1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00d20B00B10D,
+    BuiltInParameters::p00d20B10B10B10D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15443,7 +15402,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00e(
     BuiltInId::textureQueryLevels_SamplerCubeShadow1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00e20B00B,
+    BuiltInParameters::p00e30B20B20B,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15452,7 +15411,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00i(
     BuiltInId::textureQueryLevels_Sampler1DArrayShadow1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00i00D,
+    BuiltInParameters::p00i20B00B00B00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15461,7 +15420,7 @@ constexpr const TFunction kFunction_textureQueryLevels_00f(
     BuiltInId::textureQueryLevels_Sampler2DArrayShadow1,
     BuiltInName::textureQueryLevels,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00f10B,
+    BuiltInParameters::p00f30B10B10B10D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -15974,7 +15933,7 @@ constexpr const TFunction kFunction_texture_00o00B00B(
     BuiltInId::texture_ISampler1D1_Float1_Float1,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00o00B00B00D,
+    BuiltInParameters::p00o00B00B00B00D,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -15983,7 +15942,7 @@ constexpr const TFunction kFunction_texture_00t00B00B(
     BuiltInId::texture_USampler1D1_Float1_Float1,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00t00B00B00D,
+    BuiltInParameters::p00t00B00B00B00D,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -16028,7 +15987,7 @@ constexpr const TFunction kFunction_texture_00i20B00B(
     BuiltInId::texture_Sampler1DArrayShadow1_Float3_Float1,
     BuiltInName::texture,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00i20B00B00D,
+    BuiltInParameters::p00i20B00B00B00D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -16046,7 +16005,7 @@ constexpr const TFunction kFunction_textureProj_00g10B00B(
     BuiltInId::textureProj_Sampler1D1_Float2_Float1,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00g10B00B00D,
+    BuiltInParameters::p00g10B00B00B00D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -16064,7 +16023,7 @@ constexpr const TFunction kFunction_textureProj_00t10B00B(
     BuiltInId::textureProj_USampler1D1_Float2_Float1,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00t10B00B00D,
+    BuiltInParameters::p00t10B00B00B00D,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -16082,7 +16041,7 @@ constexpr const TFunction kFunction_textureProj_00o30B00B(
     BuiltInId::textureProj_ISampler1D1_Float4_Float1,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00o30B00B00D,
+    BuiltInParameters::p00o30B00B00B00D,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -16091,7 +16050,7 @@ constexpr const TFunction kFunction_textureProj_00t30B00B(
     BuiltInId::textureProj_USampler1D1_Float4_Float1,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00t30B00B00D,
+    BuiltInParameters::p00t30B00B00B00D,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -16100,7 +16059,7 @@ constexpr const TFunction kFunction_textureProj_00m30B00B(
     BuiltInId::textureProj_Sampler1DShadow1_Float4_Float1,
     BuiltInName::textureProj,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00m30B00B00D,
+    BuiltInParameters::p00m30B00B00B00D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -16172,7 +16131,7 @@ constexpr const TFunction kFunction_textureQueryLod_00o00B(
     BuiltInId::textureQueryLod_ISampler1D1_Float1,
     BuiltInName::textureQueryLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00o00B00B00D,
+    BuiltInParameters::p00o00B00B00B00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -16181,7 +16140,7 @@ constexpr const TFunction kFunction_textureQueryLod_00t00B(
     BuiltInId::textureQueryLod_USampler1D1_Float1,
     BuiltInName::textureQueryLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00t00B00B00D,
+    BuiltInParameters::p00t00B00B00B00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -16190,7 +16149,7 @@ constexpr const TFunction kFunction_textureQueryLod_00I10B(
     BuiltInId::textureQueryLod_Sampler2D1_Float2,
     BuiltInName::textureQueryLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00I10B00D,
+    BuiltInParameters::p00I10B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -16199,7 +16158,7 @@ constexpr const TFunction kFunction_textureQueryLod_00R10B(
     BuiltInId::textureQueryLod_ISampler2D1_Float2,
     BuiltInName::textureQueryLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00R10B70D00D,
+    BuiltInParameters::p00R10B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -16208,7 +16167,7 @@ constexpr const TFunction kFunction_textureQueryLod_00X10B(
     BuiltInId::textureQueryLod_USampler2D1_Float2,
     BuiltInName::textureQueryLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00X10B70D00D,
+    BuiltInParameters::p00X10B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -16217,7 +16176,7 @@ constexpr const TFunction kFunction_textureQueryLod_00J20B(
     BuiltInId::textureQueryLod_Sampler3D1_Float3,
     BuiltInName::textureQueryLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00J20B00B20D,
+    BuiltInParameters::p00J20B20B20B20D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -16253,7 +16212,7 @@ constexpr const TFunction kFunction_textureQueryLod_00T20B(
     BuiltInId::textureQueryLod_ISamplerCube1_Float3,
     BuiltInName::textureQueryLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00T20B00D,
+    BuiltInParameters::p00T20B20B20B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -16262,7 +16221,7 @@ constexpr const TFunction kFunction_textureQueryLod_00Z20B(
     BuiltInId::textureQueryLod_USamplerCube1_Float3,
     BuiltInName::textureQueryLod,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00Z20B00B,
+    BuiltInParameters::p00Z20B20B20B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -16469,7 +16428,7 @@ constexpr const TFunction kFunction_textureOffset_00L20B10D(
     BuiltInId::textureOffset_Sampler2DArray1_Float3_Int2,
     BuiltInName::textureOffset,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00L20B10D00D,
+    BuiltInParameters::p00L20B10D00B,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -16478,7 +16437,7 @@ constexpr const TFunction kFunction_textureOffset_00U20B10D(
     BuiltInId::textureOffset_ISampler2DArray1_Float3_Int2,
     BuiltInName::textureOffset,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00U20B10D00D,
+    BuiltInParameters::p00U20B10D00B,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18152,7 +18111,7 @@ constexpr const TFunction kFunction_textureGather_00I10B(
     BuiltInId::textureGather_Sampler2D1_Float2,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00I10B00D,
+    BuiltInParameters::p00I10B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18161,7 +18120,7 @@ constexpr const TFunction kFunction_textureGather_00R10B(
     BuiltInId::textureGather_ISampler2D1_Float2,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00R10B70D00D,
+    BuiltInParameters::p00R10B10B10B10D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18170,7 +18129,7 @@ constexpr const TFunction kFunction_textureGather_00X10B(
     BuiltInId::textureGather_USampler2D1_Float2,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00X10B70D00D,
+    BuiltInParameters::p00X10B10B10B10D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18206,7 +18165,7 @@ constexpr const TFunction kFunction_textureGather_00L20B(
     BuiltInId::textureGather_Sampler2DArray1_Float3,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00L20B10D00D,
+    BuiltInParameters::p00L20B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18215,7 +18174,7 @@ constexpr const TFunction kFunction_textureGather_00U20B(
     BuiltInId::textureGather_ISampler2DArray1_Float3,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00U20B10D00D,
+    BuiltInParameters::p00U20B10B10B10D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18269,7 +18228,7 @@ constexpr const TFunction kFunction_textureGather_00T20B(
     BuiltInId::textureGather_ISamplerCube1_Float3,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00T20B00D,
+    BuiltInParameters::p00T20B20B20B,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18278,7 +18237,7 @@ constexpr const TFunction kFunction_textureGather_00Z20B(
     BuiltInId::textureGather_USamplerCube1_Float3,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00Z20B00B,
+    BuiltInParameters::p00Z20B20B20B,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18314,7 +18273,7 @@ constexpr const TFunction kFunction_textureGather_00k30B(
     BuiltInId::textureGather_SamplerCubeArray1_Float4,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00k30B00B,
+    BuiltInParameters::p00k30B20B20B,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18323,7 +18282,7 @@ constexpr const TFunction kFunction_textureGather_00s30B(
     BuiltInId::textureGather_ISamplerCubeArray1_Float4,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00s30B00B,
+    BuiltInParameters::p00s30B20B20B,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18332,7 +18291,7 @@ constexpr const TFunction kFunction_textureGather_00x30B(
     BuiltInId::textureGather_USamplerCubeArray1_Float4,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00x30B00B,
+    BuiltInParameters::p00x30B20B20B,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18368,7 +18327,7 @@ constexpr const TFunction kFunction_textureGather_00O20B(
     BuiltInId::textureGather_Sampler2DRect1_Float3,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00O20B00D,
+    BuiltInParameters::p00O20B10B10B10D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18386,7 +18345,7 @@ constexpr const TFunction kFunction_textureGather_00v20B(
     BuiltInId::textureGather_USampler2DRect1_Float3,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00v20B00D,
+    BuiltInParameters::p00v20B10B10B10D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18485,7 +18444,7 @@ constexpr const TFunction kFunction_textureGather_00n10B00B(
     BuiltInId::textureGather_Sampler2DRectShadow1_Float2_Float1,
     BuiltInName::textureGather,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00n10B00B70D,
+    BuiltInParameters::p00n10B00B10D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18548,7 +18507,7 @@ constexpr const TFunction kFunction_textureGatherOffset_00L20B10D(
     BuiltInId::textureGatherOffset_Sampler2DArray1_Float3_Int2,
     BuiltInName::textureGatherOffset,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00L20B10D00D,
+    BuiltInParameters::p00L20B10D00B,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18557,7 +18516,7 @@ constexpr const TFunction kFunction_textureGatherOffset_00U20B10D(
     BuiltInId::textureGatherOffset_ISampler2DArray1_Float3_Int2,
     BuiltInName::textureGatherOffset,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00U20B10D00D,
+    BuiltInParameters::p00U20B10D00B,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -18872,7 +18831,7 @@ constexpr const TFunction kFunction_dFdx_00B(
     BuiltInId::dFdx_Float1,
     BuiltInName::dFdx,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDFdx,
@@ -18881,7 +18840,7 @@ constexpr const TFunction kFunction_dFdx_10B(
     BuiltInId::dFdx_Float2,
     BuiltInName::dFdx,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpDFdx,
@@ -18890,7 +18849,7 @@ constexpr const TFunction kFunction_dFdx_20B(
     BuiltInId::dFdx_Float3,
     BuiltInName::dFdx,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpDFdx,
@@ -18899,7 +18858,7 @@ constexpr const TFunction kFunction_dFdx_30B(
     BuiltInId::dFdx_Float4,
     BuiltInName::dFdx,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpDFdx,
@@ -18908,7 +18867,7 @@ constexpr const TFunction kFunction_dFdy_00B(
     BuiltInId::dFdy_Float1,
     BuiltInName::dFdy,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpDFdy,
@@ -18917,7 +18876,7 @@ constexpr const TFunction kFunction_dFdy_10B(
     BuiltInId::dFdy_Float2,
     BuiltInName::dFdy,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpDFdy,
@@ -18926,7 +18885,7 @@ constexpr const TFunction kFunction_dFdy_20B(
     BuiltInId::dFdy_Float3,
     BuiltInName::dFdy,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpDFdy,
@@ -18935,7 +18894,7 @@ constexpr const TFunction kFunction_dFdy_30B(
     BuiltInId::dFdy_Float4,
     BuiltInName::dFdy,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpDFdy,
@@ -18944,7 +18903,7 @@ constexpr const TFunction kFunction_fwidth_00B(
     BuiltInId::fwidth_Float1,
     BuiltInName::fwidth,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpFwidth,
@@ -18953,7 +18912,7 @@ constexpr const TFunction kFunction_fwidth_10B(
     BuiltInId::fwidth_Float2,
     BuiltInName::fwidth,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpFwidth,
@@ -18962,7 +18921,7 @@ constexpr const TFunction kFunction_fwidth_20B(
     BuiltInId::fwidth_Float3,
     BuiltInName::fwidth,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpFwidth,
@@ -18971,7 +18930,7 @@ constexpr const TFunction kFunction_fwidth_30B(
     BuiltInId::fwidth_Float4,
     BuiltInName::fwidth,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpFwidth,
@@ -18980,7 +18939,7 @@ constexpr const TFunction kFunction_dFdxFine_00B(
     BuiltInId::dFdxFine_Float1,
     BuiltInName::dFdxFine,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -18989,7 +18948,7 @@ constexpr const TFunction kFunction_dFdxFine_10B(
     BuiltInId::dFdxFine_Float2,
     BuiltInName::dFdxFine,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -18998,7 +18957,7 @@ constexpr const TFunction kFunction_dFdxFine_20B(
     BuiltInId::dFdxFine_Float3,
     BuiltInName::dFdxFine,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19007,7 +18966,7 @@ constexpr const TFunction kFunction_dFdxFine_30B(
     BuiltInId::dFdxFine_Float4,
     BuiltInName::dFdxFine,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -19016,7 +18975,7 @@ constexpr const TFunction kFunction_dFdyFine_00B(
     BuiltInId::dFdyFine_Float1,
     BuiltInName::dFdyFine,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19025,7 +18984,7 @@ constexpr const TFunction kFunction_dFdyFine_10B(
     BuiltInId::dFdyFine_Float2,
     BuiltInName::dFdyFine,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19034,7 +18993,7 @@ constexpr const TFunction kFunction_dFdyFine_20B(
     BuiltInId::dFdyFine_Float3,
     BuiltInName::dFdyFine,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19043,7 +19002,7 @@ constexpr const TFunction kFunction_dFdyFine_30B(
     BuiltInId::dFdyFine_Float4,
     BuiltInName::dFdyFine,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -19052,7 +19011,7 @@ constexpr const TFunction kFunction_dFdxCoarse_00B(
     BuiltInId::dFdxCoarse_Float1,
     BuiltInName::dFdxCoarse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19061,7 +19020,7 @@ constexpr const TFunction kFunction_dFdxCoarse_10B(
     BuiltInId::dFdxCoarse_Float2,
     BuiltInName::dFdxCoarse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19070,7 +19029,7 @@ constexpr const TFunction kFunction_dFdxCoarse_20B(
     BuiltInId::dFdxCoarse_Float3,
     BuiltInName::dFdxCoarse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19079,7 +19038,7 @@ constexpr const TFunction kFunction_dFdxCoarse_30B(
     BuiltInId::dFdxCoarse_Float4,
     BuiltInName::dFdxCoarse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -19088,7 +19047,7 @@ constexpr const TFunction kFunction_dFdyCoarse_00B(
     BuiltInId::dFdyCoarse_Float1,
     BuiltInName::dFdyCoarse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19097,7 +19056,7 @@ constexpr const TFunction kFunction_dFdyCoarse_10B(
     BuiltInId::dFdyCoarse_Float2,
     BuiltInName::dFdyCoarse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19106,7 +19065,7 @@ constexpr const TFunction kFunction_dFdyCoarse_20B(
     BuiltInId::dFdyCoarse_Float3,
     BuiltInName::dFdyCoarse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19115,7 +19074,7 @@ constexpr const TFunction kFunction_dFdyCoarse_30B(
     BuiltInId::dFdyCoarse_Float4,
     BuiltInName::dFdyCoarse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -19124,7 +19083,7 @@ constexpr const TFunction kFunction_fwidthFine_00B(
     BuiltInId::fwidthFine_Float1,
     BuiltInName::fwidthFine,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19133,7 +19092,7 @@ constexpr const TFunction kFunction_fwidthFine_10B(
     BuiltInId::fwidthFine_Float2,
     BuiltInName::fwidthFine,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19142,7 +19101,7 @@ constexpr const TFunction kFunction_fwidthFine_20B(
     BuiltInId::fwidthFine_Float3,
     BuiltInName::fwidthFine,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19151,7 +19110,7 @@ constexpr const TFunction kFunction_fwidthFine_30B(
     BuiltInId::fwidthFine_Float4,
     BuiltInName::fwidthFine,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -19160,7 +19119,7 @@ constexpr const TFunction kFunction_fwidthCoarse_00B(
     BuiltInId::fwidthCoarse_Float1,
     BuiltInName::fwidthCoarse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19169,7 +19128,7 @@ constexpr const TFunction kFunction_fwidthCoarse_10B(
     BuiltInId::fwidthCoarse_Float2,
     BuiltInName::fwidthCoarse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19178,7 +19137,7 @@ constexpr const TFunction kFunction_fwidthCoarse_20B(
     BuiltInId::fwidthCoarse_Float3,
     BuiltInName::fwidthCoarse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19187,7 +19146,7 @@ constexpr const TFunction kFunction_fwidthCoarse_30B(
     BuiltInId::fwidthCoarse_Float4,
     BuiltInName::fwidthCoarse,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -19196,7 +19155,7 @@ constexpr const TFunction kFunction_interpolateAtCentroid_00B(
     BuiltInId::interpolateAtCentroid_Float1,
     BuiltInName::interpolateAtCentroid,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19205,7 +19164,7 @@ constexpr const TFunction kFunction_interpolateAtCentroid_10B(
     BuiltInId::interpolateAtCentroid_Float2,
     BuiltInName::interpolateAtCentroid,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19214,7 +19173,7 @@ constexpr const TFunction kFunction_interpolateAtCentroid_20B(
     BuiltInId::interpolateAtCentroid_Float3,
     BuiltInName::interpolateAtCentroid,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19223,7 +19182,7 @@ constexpr const TFunction kFunction_interpolateAtCentroid_30B(
     BuiltInId::interpolateAtCentroid_Float4,
     BuiltInName::interpolateAtCentroid,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -19232,7 +19191,7 @@ constexpr const TFunction kFunction_interpolateAtSample_00B00D(
     BuiltInId::interpolateAtSample_Float1_Int1,
     BuiltInName::interpolateAtSample,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00D,
+    BuiltInParameters::p00g00B00B00B00D + 3,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19241,7 +19200,7 @@ constexpr const TFunction kFunction_interpolateAtSample_10B00D(
     BuiltInId::interpolateAtSample_Float2_Int1,
     BuiltInName::interpolateAtSample,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B00D,
+    BuiltInParameters::p00g10B00D00B + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19250,7 +19209,7 @@ constexpr const TFunction kFunction_interpolateAtSample_20B00D(
     BuiltInId::interpolateAtSample_Float3_Int1,
     BuiltInName::interpolateAtSample,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B00D,
+    BuiltInParameters::p00i20B00D00B + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19259,7 +19218,7 @@ constexpr const TFunction kFunction_interpolateAtSample_30B00D(
     BuiltInId::interpolateAtSample_Float4_Int1,
     BuiltInName::interpolateAtSample,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B00D,
+    BuiltInParameters::p00g30B00D00B + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -19268,7 +19227,7 @@ constexpr const TFunction kFunction_interpolateAtOffset_00B10B(
     BuiltInId::interpolateAtOffset_Float1_Float2,
     BuiltInName::interpolateAtOffset,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B10B,
+    BuiltInParameters::p00B00B10B + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19277,7 +19236,7 @@ constexpr const TFunction kFunction_interpolateAtOffset_10B10B(
     BuiltInId::interpolateAtOffset_Float2_Float2,
     BuiltInName::interpolateAtOffset,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B10B00B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19286,7 +19245,7 @@ constexpr const TFunction kFunction_interpolateAtOffset_20B10B(
     BuiltInId::interpolateAtOffset_Float3_Float2,
     BuiltInName::interpolateAtOffset,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B10B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19295,7 +19254,7 @@ constexpr const TFunction kFunction_interpolateAtOffset_30B10B(
     BuiltInId::interpolateAtOffset_Float4_Float2,
     BuiltInName::interpolateAtOffset,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B10B,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -19556,7 +19515,7 @@ constexpr const TFunction kFunction_imageSize_00y(
     BuiltInId::imageSize_Image2D1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00y10D30B,
+    BuiltInParameters::p00y10D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19565,7 +19524,7 @@ constexpr const TFunction kFunction_imageSize_00z(
     BuiltInId::imageSize_IImage2D1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00z10D00B,
+    BuiltInParameters::p00z10D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19583,7 +19542,7 @@ constexpr const TFunction kFunction_imageSize_01B(
     BuiltInId::imageSize_Image3D1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01B20D00E00E,
+    BuiltInParameters::p01B20D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19601,7 +19560,7 @@ constexpr const TFunction kFunction_imageSize_01D(
     BuiltInId::imageSize_UImage3D1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01D20D00B,
+    BuiltInParameters::p01D20D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19610,7 +19569,7 @@ constexpr const TFunction kFunction_imageSize_01E(
     BuiltInId::imageSize_Image2DArray1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01E20D00E00E,
+    BuiltInParameters::p01E20D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19628,7 +19587,7 @@ constexpr const TFunction kFunction_imageSize_01G(
     BuiltInId::imageSize_UImage2DArray1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01G20D00E00E,
+    BuiltInParameters::p01G20D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19637,7 +19596,7 @@ constexpr const TFunction kFunction_imageSize_01H(
     BuiltInId::imageSize_ImageCube1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01H20D30B,
+    BuiltInParameters::p01H20D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19655,7 +19614,7 @@ constexpr const TFunction kFunction_imageSize_01J(
     BuiltInId::imageSize_UImageCube1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01J20D00E00E,
+    BuiltInParameters::p01J20D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19664,7 +19623,7 @@ constexpr const TFunction kFunction_imageSize_01K(
     BuiltInId::imageSize_Image1D1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01K00D00B,
+    BuiltInParameters::p01K00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19673,7 +19632,7 @@ constexpr const TFunction kFunction_imageSize_01L(
     BuiltInId::imageSize_IImage1D1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01L00D00E00E,
+    BuiltInParameters::p01L00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19682,7 +19641,7 @@ constexpr const TFunction kFunction_imageSize_01M(
     BuiltInId::imageSize_UImage1D1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01M00D30E,
+    BuiltInParameters::p01M00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19691,7 +19650,7 @@ constexpr const TFunction kFunction_imageSize_01Z(
     BuiltInId::imageSize_ImageCubeArray1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01Z20D00E00E,
+    BuiltInParameters::p01Z20D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19700,7 +19659,7 @@ constexpr const TFunction kFunction_imageSize_01a(
     BuiltInId::imageSize_IImageCubeArray1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01a20D00E00E,
+    BuiltInParameters::p01a20D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19745,7 +19704,7 @@ constexpr const TFunction kFunction_imageSize_01N(
     BuiltInId::imageSize_Image1DArray1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01N10D00E00E,
+    BuiltInParameters::p01N10D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19754,7 +19713,7 @@ constexpr const TFunction kFunction_imageSize_01O(
     BuiltInId::imageSize_IImage1DArray1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01O10D00E00E,
+    BuiltInParameters::p01O10D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19763,7 +19722,7 @@ constexpr const TFunction kFunction_imageSize_01P(
     BuiltInId::imageSize_UImage1DArray1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01P10D00E00E,
+    BuiltInParameters::p01P10D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19772,7 +19731,7 @@ constexpr const TFunction kFunction_imageSize_01f(
     BuiltInId::imageSize_ImageBuffer1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01f00D30B,
+    BuiltInParameters::p01f00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19781,7 +19740,7 @@ constexpr const TFunction kFunction_imageSize_01g(
     BuiltInId::imageSize_IImageBuffer1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01g00D30D,
+    BuiltInParameters::p01g00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19790,7 +19749,7 @@ constexpr const TFunction kFunction_imageSize_01h(
     BuiltInId::imageSize_UImageBuffer1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01h00D00E00E,
+    BuiltInParameters::p01h00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19799,7 +19758,7 @@ constexpr const TFunction kFunction_imageSize_01Q(
     BuiltInId::imageSize_Image2DMS1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01Q10D00D00E00E,
+    BuiltInParameters::p01Q10D00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19808,7 +19767,7 @@ constexpr const TFunction kFunction_imageSize_01R(
     BuiltInId::imageSize_IImage2DMS1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01R10D00D00B,
+    BuiltInParameters::p01R10D00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19817,7 +19776,7 @@ constexpr const TFunction kFunction_imageSize_01S(
     BuiltInId::imageSize_UImage2DMS1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01S10D00D00B,
+    BuiltInParameters::p01S10D00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -19826,7 +19785,7 @@ constexpr const TFunction kFunction_imageSize_01T(
     BuiltInId::imageSize_Image2DMSArray1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01T20D00D00E00E,
+    BuiltInParameters::p01T20D00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19835,7 +19794,7 @@ constexpr const TFunction kFunction_imageSize_01U(
     BuiltInId::imageSize_IImage2DMSArray1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01U20D00D00E00E,
+    BuiltInParameters::p01U20D00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19844,7 +19803,7 @@ constexpr const TFunction kFunction_imageSize_01V(
     BuiltInId::imageSize_UImage2DMSArray1,
     BuiltInName::imageSize,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01V20D00D00E00E,
+    BuiltInParameters::p01V20D00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -19853,7 +19812,7 @@ constexpr const TFunction kFunction_imageSamples_01Q(
     BuiltInId::imageSamples_Image2DMS1,
     BuiltInName::imageSamples,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01Q10D00D00E00E,
+    BuiltInParameters::p01Q10D00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19862,7 +19821,7 @@ constexpr const TFunction kFunction_imageSamples_01R(
     BuiltInId::imageSamples_IImage2DMS1,
     BuiltInName::imageSamples,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01R10D00D00B,
+    BuiltInParameters::p01R10D00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19871,7 +19830,7 @@ constexpr const TFunction kFunction_imageSamples_01S(
     BuiltInId::imageSamples_UImage2DMS1,
     BuiltInName::imageSamples,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01S10D00D00B,
+    BuiltInParameters::p01S10D00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19880,7 +19839,7 @@ constexpr const TFunction kFunction_imageSamples_01T(
     BuiltInId::imageSamples_Image2DMSArray1,
     BuiltInName::imageSamples,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01T20D00D00E00E,
+    BuiltInParameters::p01T20D00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19889,7 +19848,7 @@ constexpr const TFunction kFunction_imageSamples_01U(
     BuiltInId::imageSamples_IImage2DMSArray1,
     BuiltInName::imageSamples,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01U20D00D00E00E,
+    BuiltInParameters::p01U20D00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -19898,7 +19857,7 @@ constexpr const TFunction kFunction_imageSamples_01V(
     BuiltInId::imageSamples_UImage2DMSArray1,
     BuiltInName::imageSamples,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01V20D00D00E00E,
+    BuiltInParameters::p01V20D00D00D00D,
     1,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -24956,7 +24915,7 @@ constexpr const TFunction kFunction_imageLoad_00y10D(
     BuiltInId::imageLoad_Image2D1_Int2,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00y10D30B,
+    BuiltInParameters::p00y10D00D00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -24965,7 +24924,7 @@ constexpr const TFunction kFunction_imageLoad_00z10D(
     BuiltInId::imageLoad_IImage2D1_Int2,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00z10D00B,
+    BuiltInParameters::p00z10D00D00D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -24983,7 +24942,7 @@ constexpr const TFunction kFunction_imageLoad_01B20D(
     BuiltInId::imageLoad_Image3D1_Int3,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01B20D00E00E,
+    BuiltInParameters::p01B20D00D00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25001,7 +24960,7 @@ constexpr const TFunction kFunction_imageLoad_01D20D(
     BuiltInId::imageLoad_UImage3D1_Int3,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01D20D00B,
+    BuiltInParameters::p01D20D00D00D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25010,7 +24969,7 @@ constexpr const TFunction kFunction_imageLoad_01E20D(
     BuiltInId::imageLoad_Image2DArray1_Int3,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01E20D00E00E,
+    BuiltInParameters::p01E20D00D00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25028,7 +24987,7 @@ constexpr const TFunction kFunction_imageLoad_01G20D(
     BuiltInId::imageLoad_UImage2DArray1_Int3,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01G20D00E00E,
+    BuiltInParameters::p01G20D00D00D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25037,7 +24996,7 @@ constexpr const TFunction kFunction_imageLoad_01H20D(
     BuiltInId::imageLoad_ImageCube1_Int3,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01H20D30B,
+    BuiltInParameters::p01H20D00D00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25055,7 +25014,7 @@ constexpr const TFunction kFunction_imageLoad_01J20D(
     BuiltInId::imageLoad_UImageCube1_Int3,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01J20D00E00E,
+    BuiltInParameters::p01J20D00D00D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25064,7 +25023,7 @@ constexpr const TFunction kFunction_imageLoad_01f00D(
     BuiltInId::imageLoad_ImageBuffer1_Int1,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01f00D30B,
+    BuiltInParameters::p01f00D00D00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25073,7 +25032,7 @@ constexpr const TFunction kFunction_imageLoad_01g00D(
     BuiltInId::imageLoad_IImageBuffer1_Int1,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01g00D30D,
+    BuiltInParameters::p01g00D00D00D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25082,7 +25041,7 @@ constexpr const TFunction kFunction_imageLoad_01h00D(
     BuiltInId::imageLoad_UImageBuffer1_Int1,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01h00D00E00E,
+    BuiltInParameters::p01h00D00D00D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25091,7 +25050,7 @@ constexpr const TFunction kFunction_imageLoad_01Z20D(
     BuiltInId::imageLoad_ImageCubeArray1_Int3,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01Z20D00E00E,
+    BuiltInParameters::p01Z20D00D00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25100,7 +25059,7 @@ constexpr const TFunction kFunction_imageLoad_01a20D(
     BuiltInId::imageLoad_IImageCubeArray1_Int3,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01a20D00E00E,
+    BuiltInParameters::p01a20D00D00D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25118,7 +25077,7 @@ constexpr const TFunction kFunction_imageLoad_01K00D(
     BuiltInId::imageLoad_Image1D1_Int1,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01K00D00B,
+    BuiltInParameters::p01K00D00D00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25127,7 +25086,7 @@ constexpr const TFunction kFunction_imageLoad_01L00D(
     BuiltInId::imageLoad_IImage1D1_Int1,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01L00D00E00E,
+    BuiltInParameters::p01L00D00D00D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25136,7 +25095,7 @@ constexpr const TFunction kFunction_imageLoad_01M00D(
     BuiltInId::imageLoad_UImage1D1_Int1,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01M00D30E,
+    BuiltInParameters::p01M00D00D00D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25145,7 +25104,7 @@ constexpr const TFunction kFunction_imageLoad_01N10D(
     BuiltInId::imageLoad_Image1DArray1_Int2,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01N10D00E00E,
+    BuiltInParameters::p01N10D00D00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25154,7 +25113,7 @@ constexpr const TFunction kFunction_imageLoad_01O10D(
     BuiltInId::imageLoad_IImage1DArray1_Int2,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01O10D00E00E,
+    BuiltInParameters::p01O10D00D00D,
     2,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25163,7 +25122,7 @@ constexpr const TFunction kFunction_imageLoad_01P10D(
     BuiltInId::imageLoad_UImage1DArray1_Int2,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01P10D00E00E,
+    BuiltInParameters::p01P10D00D00D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25172,7 +25131,7 @@ constexpr const TFunction kFunction_imageLoad_01W10D(
     BuiltInId::imageLoad_Image2DRect1_Int2,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01W10D30B,
+    BuiltInParameters::p01W10D00D00D,
     2,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25190,7 +25149,7 @@ constexpr const TFunction kFunction_imageLoad_01Y10D(
     BuiltInId::imageLoad_UImage2DRect1_Int2,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01Y10D00B,
+    BuiltInParameters::p01Y10D00D00D,
     2,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25199,7 +25158,7 @@ constexpr const TFunction kFunction_imageLoad_01Q10D00D(
     BuiltInId::imageLoad_Image2DMS1_Int2_Int1,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01Q10D00D00E00E,
+    BuiltInParameters::p01Q10D00D00D00D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25208,7 +25167,7 @@ constexpr const TFunction kFunction_imageLoad_01R10D00D(
     BuiltInId::imageLoad_IImage2DMS1_Int2_Int1,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01R10D00D30D,
+    BuiltInParameters::p01R10D00D00D00D,
     3,
     StaticType::Get<EbtInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25217,7 +25176,7 @@ constexpr const TFunction kFunction_imageLoad_01S10D00D(
     BuiltInId::imageLoad_UImage2DMS1_Int2_Int1,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01S10D00D00B,
+    BuiltInParameters::p01S10D00D00D00D,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25226,7 +25185,7 @@ constexpr const TFunction kFunction_imageLoad_01T20D00D(
     BuiltInId::imageLoad_Image2DMSArray1_Int3_Int1,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01T20D00D30B,
+    BuiltInParameters::p01T20D00D00D00D,
     3,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25244,7 +25203,7 @@ constexpr const TFunction kFunction_imageLoad_01V20D00D(
     BuiltInId::imageLoad_UImage2DMSArray1_Int3_Int1,
     BuiltInName::imageLoad,
     TExtension::UNDEFINED,
-    BuiltInParameters::p01V20D00D00E00E,
+    BuiltInParameters::p01V20D00D00D00D,
     3,
     StaticType::Get<EbtUInt, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25550,7 +25509,7 @@ constexpr const TFunction kFunction_noise1_00B(
     BuiltInId::noise1_Float1,
     BuiltInName::noise1,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -25559,7 +25518,7 @@ constexpr const TFunction kFunction_noise1_10B(
     BuiltInId::noise1_Float2,
     BuiltInName::noise1,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -25568,7 +25527,7 @@ constexpr const TFunction kFunction_noise1_20B(
     BuiltInId::noise1_Float3,
     BuiltInName::noise1,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -25577,7 +25536,7 @@ constexpr const TFunction kFunction_noise1_30B(
     BuiltInId::noise1_Float4,
     BuiltInName::noise1,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -25586,7 +25545,7 @@ constexpr const TFunction kFunction_noise2_00B(
     BuiltInId::noise2_Float1,
     BuiltInName::noise2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -25595,7 +25554,7 @@ constexpr const TFunction kFunction_noise2_10B(
     BuiltInId::noise2_Float2,
     BuiltInName::noise2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -25604,7 +25563,7 @@ constexpr const TFunction kFunction_noise2_20B(
     BuiltInId::noise2_Float3,
     BuiltInName::noise2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -25613,7 +25572,7 @@ constexpr const TFunction kFunction_noise2_30B(
     BuiltInId::noise2_Float4,
     BuiltInName::noise2,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 2, 1>(),
     EOpCallBuiltInFunction,
@@ -25622,7 +25581,7 @@ constexpr const TFunction kFunction_noise3_00B(
     BuiltInId::noise3_Float1,
     BuiltInName::noise3,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -25631,7 +25590,7 @@ constexpr const TFunction kFunction_noise3_10B(
     BuiltInId::noise3_Float2,
     BuiltInName::noise3,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -25640,7 +25599,7 @@ constexpr const TFunction kFunction_noise3_20B(
     BuiltInId::noise3_Float3,
     BuiltInName::noise3,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -25649,7 +25608,7 @@ constexpr const TFunction kFunction_noise3_30B(
     BuiltInId::noise3_Float4,
     BuiltInName::noise3,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 3, 1>(),
     EOpCallBuiltInFunction,
@@ -25658,7 +25617,7 @@ constexpr const TFunction kFunction_noise4_00B(
     BuiltInId::noise4_Float1,
     BuiltInName::noise4,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00B00B30B,
+    BuiltInParameters::p00g00B00B00B00D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25667,7 +25626,7 @@ constexpr const TFunction kFunction_noise4_10B(
     BuiltInId::noise4_Float2,
     BuiltInName::noise4,
     TExtension::UNDEFINED,
-    BuiltInParameters::p10B_o_10B,
+    BuiltInParameters::p00I10B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25676,7 +25635,7 @@ constexpr const TFunction kFunction_noise4_20B(
     BuiltInId::noise4_Float3,
     BuiltInName::noise4,
     TExtension::UNDEFINED,
-    BuiltInParameters::p20B20B00B,
+    BuiltInParameters::p00I20B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25685,7 +25644,7 @@ constexpr const TFunction kFunction_noise4_30B(
     BuiltInId::noise4_Float4,
     BuiltInName::noise4,
     TExtension::UNDEFINED,
-    BuiltInParameters::p30B30D,
+    BuiltInParameters::p00I30B10B10B10D + 1,
     1,
     StaticType::Get<EbtFloat, EbpUndefined, EvqGlobal, 4, 1>(),
     EOpCallBuiltInFunction,
@@ -25775,7 +25734,7 @@ constexpr const TFunction kFunction_EmitStreamVertex_00D(
     BuiltInId::EmitStreamVertex_Int1,
     BuiltInName::EmitStreamVertex,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D_o_00D_o_00D,
+    BuiltInParameters::p00g00B00B00B00D + 4,
     1,
     StaticType::Get<EbtVoid, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -25784,7 +25743,7 @@ constexpr const TFunction kFunction_EndStreamPrimitive_00D(
     BuiltInId::EndStreamPrimitive_Int1,
     BuiltInName::EndStreamPrimitive,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00D00D_o_00D_o_00D,
+    BuiltInParameters::p00g00B00B00B00D + 4,
     1,
     StaticType::Get<EbtVoid, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -25847,7 +25806,7 @@ constexpr const TFunction kFunction_anyInvocation_00F(
     BuiltInId::anyInvocation_Bool1,
     BuiltInName::anyInvocation,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00F00F00F,
+    BuiltInParameters::p00B00B00F + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -25856,7 +25815,7 @@ constexpr const TFunction kFunction_allInvocations_00F(
     BuiltInId::allInvocations_Bool1,
     BuiltInName::allInvocations,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00F00F00F,
+    BuiltInParameters::p00B00B00F + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
@@ -25865,7 +25824,7 @@ constexpr const TFunction kFunction_allInvocationsEqual_00F(
     BuiltInId::allInvocationsEqual_Bool1,
     BuiltInName::allInvocationsEqual,
     TExtension::UNDEFINED,
-    BuiltInParameters::p00F00F00F,
+    BuiltInParameters::p00B00B00F + 2,
     1,
     StaticType::Get<EbtBool, EbpUndefined, EvqGlobal, 1, 1>(),
     EOpCallBuiltInFunction,
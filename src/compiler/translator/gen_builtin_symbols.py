@@ -16,7 +16,9 @@
 
 from collections import OrderedDict
 from datetime import date
-from perfect_hash import generate_hash, Hash2
+from itertools import imap
+from operator import mul
+from perfect_hash import Graph, Hash2, trails as perfect_hash_trails
 import argparse
 import hashlib
 import json
@@ -25,6 +27,9 @@ import os
 import sys
 import random
 
+sys.path.append('../../../scripts')
+import code_generation_utils
+
 template_immutablestring_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {variable_data_source_name} and
 // {function_data_source_name}.
@@ -127,6 +132,65 @@ TEST(ImmutableStringTest, ScriptGeneratedHashesMatch)
 }}  // namespace sh
 """
 
+template_symboltablelookupperf_h = """// GENERATED FILE - DO NOT EDIT.
+// Generated by {script_name} using data from {variable_data_source_name} and
+// {function_data_source_name}.
+//
+// Copyright {copyright_year} The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// SymbolTableLookupPerf_autogen.h:
+//   Built-in names for benchmarking symbol table lookups.
+
+#ifndef TESTS_PERF_TESTS_SYMBOLTABLELOOKUPPERF_AUTOGEN_H_
+#define TESTS_PERF_TESTS_SYMBOLTABLELOOKUPPERF_AUTOGEN_H_
+
+namespace sh
+{{
+
+struct BuiltInLookupName
+{{
+    const char *name;
+    const char *level;
+    // Lowest shader version the level is available at.
+    int shaderVersion;
+    // Index into kBuiltInLookupConditions.
+    int condition;
+}};
+
+// Conditions on the shader type and extensions that built-ins depend on. The first one means that
+// the built-in doesn't depend on either.
+constexpr const char *kBuiltInLookupConditions[] = {{
+{lookup_conditions}
+}};
+
+constexpr BuiltInLookupName kESSLMangledBuiltInNames[] = {{
+{essl_mangled_names}
+}};
+
+constexpr BuiltInLookupName kGLSLMangledBuiltInNames[] = {{
+{glsl_mangled_names}
+}};
+
+constexpr BuiltInLookupName kESSLUnmangledBuiltInNames[] = {{
+{essl_unmangled_names}
+}};
+
+constexpr BuiltInLookupName kGLSLUnmangledBuiltInNames[] = {{
+{glsl_unmangled_names}
+}};
+
+// Names that aren't built-ins, but only differ from one in the last character.
+constexpr const char *kNearMissBuiltInNames[] = {{
+{near_miss_names}
+}};
+
+}}  // namespace sh
+
+#endif  // TESTS_PERF_TESTS_SYMBOLTABLELOOKUPPERF_AUTOGEN_H_
+"""
+
 # The header file has a "get" function for each variable. They are used in traversers.
 # It also declares id values of built-ins with human readable names, so they can be used to identify built-ins.
 template_builtin_header = """// GENERATED FILE - DO NOT EDIT.
@@ -272,7 +336,7 @@ namespace BuiltInFunction
 {function_declarations}
 
 }}  // namespace BuiltInFunction
-
+{lookup_tables}
 void TSymbolTable::initializeBuiltInVariables(sh::GLenum shaderType,
                                               ShShaderSpec spec,
                                               const ShBuiltInResources &resources)
@@ -305,6 +369,77 @@ const UnmangledBuiltIn *TSymbolTable::getUnmangledBuiltInForShaderVersion(const
 }}  // namespace sh
 """
 
+# Used instead of the switch statements in findBuiltIn and getUnmangledBuiltInForShaderVersion
+# when generating with --lookup-table.
+template_lookup_tables = """
+namespace
+{{
+
+// The lookup tables are indexed by ImmutableString::mangledNameHash(). Each bucket refers to the
+// entries for one name, in the order they are checked.
+struct BuiltInLookupBucket
+{{
+    const ImmutableString *name;
+    uint16_t beginEntry;
+    uint16_t endEntry;
+}};
+
+template <typename SymbolT>
+struct BuiltInLookupEntry
+{{
+    // Null for the built-ins stored in TSymbolTableBase::mBuiltInMembers.
+    const SymbolT *symbol;
+    uint16_t member;
+    // Index of the bit in TSymbolTableBase::mBuiltInConditions the built-in depends on.
+    uint16_t condition;
+    // Symbol table levels the built-in is in, see GetBuiltInLevels.
+    uint32_t levels;
+}};
+
+uint32_t GetBuiltInLevels(ShShaderSpec spec, int shaderVersion)
+{{
+{get_builtin_levels}
+}}
+
+template <typename SymbolT, size_t kBucketCount>
+const BuiltInLookupEntry<SymbolT> *FindBuiltInEntry(const BuiltInLookupBucket (&buckets)[kBucketCount],
+                                                   const BuiltInLookupEntry<SymbolT> *entries,
+                                                   const ImmutableString &name,
+                                                   uint32_t nameHash,
+                                                   uint32_t levels,
+                                                   uint64_t conditions)
+{{
+    if (nameHash >= kBucketCount || buckets[nameHash].name == nullptr ||
+        name != *buckets[nameHash].name)
+    {{
+        return nullptr;
+    }}
+    for (uint16_t index = buckets[nameHash].beginEntry; index < buckets[nameHash].endEntry; ++index)
+    {{
+        const BuiltInLookupEntry<SymbolT> &entry = entries[index];
+        if ((entry.levels & levels) != 0 && ((conditions >> entry.condition) & 1u) != 0)
+        {{
+            return &entry;
+        }}
+    }}
+    return nullptr;
+}}
+
+{symbol_lookup_table}
+
+{unmangled_lookup_table}
+
+}}  // anonymous namespace
+"""
+
+template_lookup_table = """constexpr BuiltInLookupBucket k{table_name}Buckets[] = {{
+{buckets}
+}};
+
+constexpr BuiltInLookupEntry<{symbol_type}> k{table_name}Entries[] = {{
+{entries}
+}};"""
+
 template_parsecontext_header = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {variable_data_source_name} and
 // {function_data_source_name}.
@@ -337,6 +472,17 @@ namespace BuiltInGroup
 
 parsed_variables = None
 
+# Local, untracked cache of the parsed function declarations.
+parsed_functions_cache_filename = '.builtin_functions_cache.json'
+parsed_functions_cache_version = 1
+
+# TTypes parsed from the function declarations, keyed by their spelling.
+parsed_types = {}
+
+# Shared instances of equal TTypes and parameter lists.
+shared_types = {}
+shared_parameter_lists = {}
+
 basic_types_enumeration = [
     'Void',
     'Float',
@@ -534,6 +680,97 @@ def get_specific_switch_code(level_dict, hashfn, script_generated_hash_tests):
     return code
 
 
+def get_level_bit(spec, level):
+    # Bit of |level| in the masks used by the lookup tables. ESSL levels come first.
+    if spec == 'essl':
+        return 1 << essl_levels.index(level)
+    return 1 << (len(essl_levels) + glsl_levels.index(level))
+
+
+def get_spec_level_mask(spec):
+    if spec == 'essl':
+        return (1 << len(essl_levels)) - 1
+    return ((1 << len(glsl_levels)) - 1) << len(essl_levels)
+
+
+def get_builtin_levels_code():
+    code = ['uint32_t levels = 0;', 'if (!IsDesktopGLSpec(spec))\n{']
+    for spec, levels, get_condition in [
+        ('essl', essl_levels, get_essl_shader_version_condition_for_level),
+        ('glsl', glsl_levels, get_glsl_shader_version_condition_for_level)
+    ]:
+        if spec == 'glsl':
+            code.append('}\nelse\n{')
+        for level in levels:
+            level_condition = get_condition(level)
+            add_level = 'levels |= 0x%08xu;  // %s' % (get_level_bit(spec, level), level)
+            if level_condition != '':
+                code.append('if ({condition})\n{{\n{add_level}\n}}'.format(
+                    condition=level_condition, add_level=add_level))
+            else:
+                code.append(add_level)
+    code.append('}')
+    code.append('return levels;')
+    return '\n'.join(code)
+
+
+def get_lookup_condition(condition, obj):
+    # Folds the extension check of a mangled function into the condition it's looked up under.
+    conditions = []
+    if condition != 'NO_CONDITION':
+        conditions.append(condition.replace('shaderType', 'mShaderType'))
+    if obj.get('required_extension', 'UNDEFINED') != 'UNDEFINED':
+        conditions.append('mResources.' + obj['required_extension'])
+    if len(conditions) == 0:
+        return 'NO_CONDITION'
+    if len(conditions) == 1:
+        return conditions[0]
+    return '({condition}) && {extension}'.format(condition=conditions[0], extension=conditions[1])
+
+
+def get_lookup_condition_init_code(lookup_conditions):
+    code = ['    mBuiltInConditions = 1u;']
+    for condition, index in lookup_conditions.iteritems():
+        if condition == 'NO_CONDITION':
+            continue
+        code.append('    if ({condition})\n    {{\n        mBuiltInConditions |= uint64_t(1) << {index};\n    }}'.
+                    format(condition=condition, index=index))
+    return code
+
+
+def get_lookup_member_init_code(lookup_members):
+    return [
+        '    mBuiltInMembers[{index}] = {member};'.format(index=index, member=member)
+        for member, index in lookup_members.iteritems()
+    ]
+
+
+def get_lowest_shader_version_for_level(spec, level):
+    if spec == 'essl':
+        level_condition = get_essl_shader_version_condition_for_level(level)
+        lowest_version = 100
+    else:
+        level_condition = get_glsl_shader_version_condition_for_level(level)
+        lowest_version = 110
+    if level_condition == '':
+        return lowest_version
+    return int(level_condition.split(' ')[-1])
+
+
+def get_near_miss_names(names):
+    # Replaces the last character of each name so that the result isn't a name.
+    all_names = set(names)
+    near_miss_names = []
+    for name in names:
+        for last_character in 'xyz_0123':
+            near_miss_name = name[:-1] + last_character
+            if near_miss_name not in all_names:
+                near_miss_names.append(near_miss_name)
+                all_names.add(near_miss_name)
+                break
+    return near_miss_names
+
+
 class GroupedList:
     """"Class for storing a list of objects grouped by symbol table level and condition."""
 
@@ -632,88 +869,208 @@ class GroupedList:
         code.append('return nullptr;')
         return '\n'.join(code)
 
+    def get_perf_test_names(self, spec, lookup_conditions):
+        # Lists every name with the level and condition it's available under.
+        code = []
+        for level in self.objs[spec].iterkeys():
+            shader_version = get_lowest_shader_version_for_level(spec, level)
+            for condition, objs in self.objs[spec][level].iteritems():
+                for name, obj in objs.iteritems():
+                    lookup_condition = get_lookup_condition(condition, obj)
+                    if lookup_condition not in lookup_conditions:
+                        lookup_conditions[lookup_condition] = len(lookup_conditions)
+                    code.append('    {{"{name}", "{level}", {shader_version}, {condition}}},'.format(
+                        name=name,
+                        level=level,
+                        shader_version=shader_version,
+                        condition=lookup_conditions[lookup_condition]))
+        return '\n'.join(code)
+
+    def get_lookup_table_code(self, table_name, symbol_type, hashfn, script_generated_hash_tests,
+                              lookup_conditions, lookup_members):
+        # Lists the entries of each name in the order get_switch_code checks them. An entry can
+        # be merged with an earlier one with the same result as long as no entry in between could
+        # be visible to the same shader.
+        name_entries = OrderedDict()
+        for spec, levels in [('essl', essl_levels), ('glsl', glsl_levels)]:
+            spec_mask = get_spec_level_mask(spec)
+            for level in levels:
+                level_bit = get_level_bit(spec, level)
+                for condition, objs in self.objs[spec][level].iteritems():
+                    for name, obj in objs.iteritems():
+                        name_hash = mangledNameHash(name, hashfn, script_generated_hash_tests)
+                        if name_hash not in name_entries:
+                            name_entries[name_hash] = (name, obj['name'], [])
+                        elif name_entries[name_hash][0] != name:
+                            raise Exception('Hash collision between ' + name + ' and ' +
+                                            name_entries[name_hash][0])
+
+                        lookup_condition = get_lookup_condition(condition, obj)
+                        if lookup_condition not in lookup_conditions:
+                            lookup_conditions[lookup_condition] = len(lookup_conditions)
+                        member = 0
+                        if 'member' in obj:
+                            if obj['member'] not in lookup_members:
+                                lookup_members[obj['member']] = len(lookup_members)
+                            member = lookup_members[obj['member']]
+                        key = (obj.get('symbol', 'nullptr'), member,
+                               lookup_conditions[lookup_condition])
+
+                        entries = name_entries[name_hash][2]
+                        for entry in reversed(entries):
+                            if entry[1] == key:
+                                entry[0] |= level_bit
+                                break
+                            if entry[0] & spec_mask:
+                                entries.append([level_bit, key])
+                                break
+                        else:
+                            entries.append([level_bit, key])
+
+        buckets = []
+        entries = []
+        for name_hash in range(max(name_entries.iterkeys()) + 1):
+            if name_hash not in name_entries:
+                buckets.append('{nullptr, 0, 0},')
+                continue
+            name, name_variable, name_hash_entries = name_entries[name_hash]
+            begin_entry = len(entries)
+            for levels, (symbol, member, condition) in name_hash_entries:
+                entries.append('{%s, %d, %d, 0x%08xu},' % (symbol, member, condition, levels))
+            buckets.append('{&%s, %d, %d},  // %s' % (name_variable, begin_entry, len(entries),
+                                                       name))
+
+        if len(entries) > 0xFFFF:
+            raise Exception('Too many entries in the ' + table_name + ' lookup table')
+        return template_lookup_table.format(
+            table_name=table_name,
+            symbol_type=symbol_type,
+            buckets='\n'.join(buckets),
+            entries='\n'.join(entries))
+
+
+class TType(object):
+    """Immutable GLSL type. Equal types hash the same, so they and lists of them can be shared."""
 
-class TType:
+    __slots__ = ('basic', 'precision', 'qualifier', 'primary_size', 'secondary_size', 'gen_type',
+                 '_key', '_mangled_name', '_human_readable_name')
 
     def __init__(self, glsl_header_type):
         if isinstance(glsl_header_type, basestring):
-            self.data = self.parse_type(glsl_header_type)
+            data = self.parse_type(glsl_header_type)
         else:
-            self.data = glsl_header_type
-        self.normalize()
+            data = dict(glsl_header_type)
+        self.normalize(data)
+
+        key = (data.get('basic'), data['precision'], data['qualifier'], data['primarySize'],
+               data['secondarySize'], data.get('genType'))
+        for field, value in zip(TType.__slots__, key):
+            object.__setattr__(self, field, value)
+        object.__setattr__(self, '_key', key)
+        object.__setattr__(self, '_mangled_name', None)
+        object.__setattr__(self, '_human_readable_name', None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('TType is immutable')
 
-    def normalize(self):
+    def __eq__(self, other):
+        return isinstance(other, TType) and self._key == other._key
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def normalize(self, data):
         # Note that this will set primarySize and secondarySize also on genTypes. In that case they
         # are overridden when the specific types are generated.
-        if 'primarySize' not in self.data:
-            if ('secondarySize' in self.data):
+        if 'primarySize' not in data:
+            if ('secondarySize' in data):
                 raise Exception(
                     'Unexpected secondarySize on type that does not have primarySize set')
-            self.data['primarySize'] = 1
-        if 'secondarySize' not in self.data:
-            self.data['secondarySize'] = 1
-        if 'precision' not in self.data:
-            self.data['precision'] = 'Undefined'
-        if 'qualifier' not in self.data:
-            self.data['qualifier'] = 'Global'
+            data['primarySize'] = 1
+        if 'secondarySize' not in data:
+            data['secondarySize'] = 1
+        if 'precision' not in data:
+            data['precision'] = 'Undefined'
+        if 'qualifier' not in data:
+            data['qualifier'] = 'Global'
+
+    def get_data(self):
+        # The fields in the format of the type dicts in builtin_variables.json.
+        data = {}
+        if self.basic is not None:
+            data['basic'] = self.basic
+        if self.gen_type is not None:
+            data['genType'] = self.gen_type
+        data['primarySize'] = self.primary_size
+        data['secondarySize'] = self.secondary_size
+        data['precision'] = self.precision
+        data['qualifier'] = self.qualifier
+        return data
 
     def get_statictype_string(self):
         template_type = 'StaticType::Get<Ebt{basic}, Ebp{precision}, Evq{qualifier}, {primarySize}, {secondarySize}>()'
-        return template_type.format(**self.data)
+        return template_type.format(**self.get_data())
 
     def get_dynamic_type_string(self):
         template_type = 'new TType(Ebt{basic}, Ebp{precision}, Evq{qualifier}, {primarySize}, {secondarySize})'
-        return template_type.format(**self.data)
+        return template_type.format(**self.get_data())
 
     def get_mangled_name(self):
-        mangled_name = ''
+        if self._mangled_name is None:
+            mangled_name = ''
 
-        size_key = (self.data['secondarySize'] - 1) * 4 + self.data['primarySize'] - 1
-        if size_key < 10:
-            mangled_name += chr(ord('0') + size_key)
-        else:
-            mangled_name += chr(ord('A') + size_key - 10)
-        mangled_name += get_basic_mangled_name(self.data['basic'])
-        return mangled_name
+            size_key = (self.secondary_size - 1) * 4 + self.primary_size - 1
+            if size_key < 10:
+                mangled_name += chr(ord('0') + size_key)
+            else:
+                mangled_name += chr(ord('A') + size_key - 10)
+            mangled_name += get_basic_mangled_name(self.basic)
+            object.__setattr__(self, '_mangled_name', mangled_name)
+        return self._mangled_name
 
     def get_human_readable_name(self):
-        name = self.data['basic']
-        name += str(self.data['primarySize'])
-        if self.data['secondarySize'] > 1:
-            name += 'x' + str(self.data['secondarySize'])
-        return name
+        if self._human_readable_name is None:
+            name = self.basic
+            name += str(self.primary_size)
+            if self.secondary_size > 1:
+                name += 'x' + str(self.secondary_size)
+            object.__setattr__(self, '_human_readable_name', name)
+        return self._human_readable_name
 
     def is_vector(self):
-        return self.data['primarySize'] > 1 and self.data['secondarySize'] == 1
+        return self.primary_size > 1 and self.secondary_size == 1
 
     def is_matrix(self):
-        return self.data['secondarySize'] > 1
+        return self.secondary_size > 1
 
     def get_object_size(self):
-        return self.data['primarySize'] * self.data['secondarySize']
+        return self.primary_size * self.secondary_size
 
     def specific_sampler_or_image_or_subpass_type(self, basic_type_prefix):
-        if 'genType' in self.data and self.data['genType'] == 'sampler_or_image_or_subpass':
+        if self.gen_type == 'sampler_or_image_or_subpass':
             type = {}
-            if 'basic' not in self.data:
+            if self.basic is None:
                 type['basic'] = {'': 'Float', 'I': 'Int', 'U': 'UInt'}[basic_type_prefix]
-                type['primarySize'] = self.data['primarySize']
+                type['primarySize'] = self.primary_size
             else:
-                type['basic'] = basic_type_prefix + self.data['basic']
+                type['basic'] = basic_type_prefix + self.basic
                 type['primarySize'] = 1
             type['precision'] = 'Undefined'
-            return TType(type)
+            return get_shared_type(TType(type))
         return self
 
     def specific_type(self, vec_size):
         type = {}
-        if 'genType' in self.data:
-            type['basic'] = self.data['basic']
-            type['precision'] = self.data['precision']
-            type['qualifier'] = self.data['qualifier']
+        if self.gen_type is not None:
+            type['basic'] = self.basic
+            type['precision'] = self.precision
+            type['qualifier'] = self.qualifier
             type['primarySize'] = vec_size
             type['secondarySize'] = 1
-            return TType(type)
+            return get_shared_type(TType(type))
         return self
 
     def parse_type(self, glsl_header_type):
@@ -829,22 +1186,95 @@ class HashFunction:
         self.f1 = f1
         self.f2 = f2
         self.G = G
+        # Names are hashed many times while generating the switch statements.
+        self.hashes = {}
 
     def hash(self, key):
-        return (self.G[self.f1(key)] + self.G[self.f2(key)]) % len(self.G)
+        if key not in self.hashes:
+            self.hashes[key] = (self.G[self.f1(key)] + self.G[self.f2(key)]) % len(self.G)
+        return self.hashes[key]
+
+
+def generate_perfect_hash(keys_dict):
+    """Equivalent to perfect_hash.generate_hash(keys_dict, Hash2), including the random numbers
+    it draws, so it finds the same hash function.  It is a lot faster though: the characters of the
+    keys are converted once instead of for every trial graph, and cycles are detected with a
+    union-find while the edges are added, so most failed trials stop early."""
+    items = keys_dict.items()
+    key_ords = [[ord(c) for c in key] for key, _ in items]
+    N = max(keys_dict.values()) + 1
+
+    trial = 0
+    while True:
+        # After a number of failures, increase N slightly.
+        if trial > 0 and trial % perfect_hash_trails == 0:
+            N = max(N + 1, int(1.05 * N))
+        trial += 1
+
+        # Hash2 adds salt when it sees a key longer than its salt, f1 first and then f2 for every
+        # key.  Draw all of it up front, in the same order.
+        f1 = Hash2(N)
+        f2 = Hash2(N)
+        for ords in key_ords:
+            if len(ords) > len(f1.salt):
+                f1.salt += [random.randint(0, N - 1) for _ in range(len(ords) - len(f1.salt))]
+                f2.salt += [random.randint(0, N - 1) for _ in range(len(ords) - len(f2.salt))]
+
+        # The graph with an edge between f1(key) and f2(key) for every key must be acyclic.
+        salt1 = f1.salt
+        salt2 = f2.salt
+        component = range(N)
+        acyclic = True
+        for ords in key_ords:
+            vertex1 = sum(imap(mul, salt1, ords)) % N
+            while component[vertex1] != vertex1:
+                vertex1 = component[vertex1]
+            vertex2 = sum(imap(mul, salt2, ords)) % N
+            while component[vertex2] != vertex2:
+                vertex2 = component[vertex2]
+            if vertex1 == vertex2:
+                acyclic = False
+                break
+            component[vertex1] = vertex2
+        if acyclic:
+            break
 
+    # Assign the vertex values like perfect_hash does, the result depends on the order of edges.
+    edges = [(sum(imap(mul, salt1, ords)) % N, sum(imap(mul, salt2, ords)) % N)
+             for ords in key_ords]
+    G = Graph(N)
+    for (vertex1, vertex2), (_, hashval) in zip(edges, items):
+        G.connect(vertex1, vertex2, hashval)
+    if not G.assign_vertex_values():
+        raise Exception('Perfect hash graph unexpectedly cyclic')
 
-def get_parsed_functions(functions_txt_filename):
+    for (vertex1, vertex2), (_, hashval) in zip(edges, items):
+        assert hashval == (G.vertex_values[vertex1] + G.vertex_values[vertex2]) % N
+
+    return f1, f2, G.vertex_values
+
+
+def get_shared_type(type):
+    return shared_types.setdefault(type, type)
 
-    def parse_function_parameters(parameters):
-        if parameters == '':
-            return []
-        parametersOut = []
-        parameters = parameters.split(', ')
-        for parameter in parameters:
-            parametersOut.append(TType(parameter.strip()))
-        return parametersOut
 
+def get_shared_parameter_list(parameters):
+    # Parameter lists are tuples, so a shared list can't be modified by accident.
+    parameters = tuple(parameters)
+    return shared_parameter_lists.setdefault(parameters, parameters)
+
+
+def get_parsed_type(glsl_header_type):
+    # Types with the same spelling share one TType.
+    if glsl_header_type not in parsed_types:
+        parsed_types[glsl_header_type] = get_shared_type(TType(glsl_header_type))
+    return parsed_types[glsl_header_type]
+
+
+def read_function_declarations(functions_txt_filename):
+    # Splits the declarations into records for group boundaries, default metadata and functions.
+    # Metadata is kept as JSON text so the dicts built from it are the same whether the records
+    # come from the cache or not.
     lines = []
     with open(functions_txt_filename) as f:
         lines = f.readlines()
@@ -854,22 +1284,81 @@ def get_parsed_functions(functions_txt_filename):
 
     fun_re = re.compile(r'^(\w+) (\w+)\((.*)\);$')
 
-    parsed_functions = OrderedDict()
-    group_stack = []
-    default_metadata = {}
+    declarations = []
 
     for line in lines:
         fun_match = fun_re.match(line)
         if line.startswith('GROUP BEGIN '):
             group_rest = line[12:].strip()
             group_parts = group_rest.split(' ', 1)
-            current_group = {'functions': [], 'name': group_parts[0], 'subgroups': {}}
-            if len(group_parts) > 1:
-                group_metadata = json.loads(group_parts[1])
+            group_metadata = group_parts[1] if len(group_parts) > 1 else None
+            declarations.append(['GROUP BEGIN', group_parts[0], group_metadata])
+        elif line.startswith('GROUP END '):
+            declarations.append(['GROUP END', line[10:].strip()])
+        elif line.startswith('DEFAULT METADATA'):
+            declarations.append(['DEFAULT METADATA', line[16:].strip()])
+        elif fun_match:
+            parameters = fun_match.group(3)
+            parameters = [] if parameters == '' else [
+                parameter.strip() for parameter in parameters.split(', ')
+            ]
+            declarations.append(
+                ['FUNCTION', fun_match.group(1),
+                 fun_match.group(2), parameters])
+        else:
+            raise Exception('Unexpected function input line: ' + line)
+
+    return declarations
+
+
+def get_function_declarations(functions_txt_filename):
+    # The declarations are cached, keyed by the hash of the declarations file.
+    with open(functions_txt_filename, 'rb') as f:
+        declarations_hash = hashlib.sha1(f.read()).hexdigest()
+
+    cache = code_generation_utils.read_file(parsed_functions_cache_filename)
+    if cache is not None:
+        try:
+            cache = json.loads(cache)
+        except ValueError:
+            cache = None
+    if cache is not None and cache.get('version') == parsed_functions_cache_version and cache.get(
+            'hash') == declarations_hash:
+        # JSON strings are loaded as unicode.
+        def to_str(value):
+            if isinstance(value, list):
+                return [to_str(item) for item in value]
+            if isinstance(value, basestring):
+                return str(value)
+            return value
+
+        return to_str(cache['declarations'])
+
+    declarations = read_function_declarations(functions_txt_filename)
+    cache = {
+        'version': parsed_functions_cache_version,
+        'hash': declarations_hash,
+        'declarations': declarations
+    }
+    code_generation_utils.write_file_if_changed(parsed_functions_cache_filename,
+                                                json.dumps(cache, separators=(',', ':')))
+    return declarations
+
+
+def get_parsed_functions(functions_txt_filename):
+    parsed_functions = OrderedDict()
+    group_stack = []
+    default_metadata = {}
+
+    for declaration in get_function_declarations(functions_txt_filename):
+        if declaration[0] == 'GROUP BEGIN':
+            current_group = {'functions': [], 'name': declaration[1], 'subgroups': {}}
+            if declaration[2] is not None:
+                group_metadata = json.loads(declaration[2])
                 current_group.update(group_metadata)
             group_stack.append(current_group)
-        elif line.startswith('GROUP END '):
-            group_end_name = line[10:].strip()
+        elif declaration[0] == 'GROUP END':
+            group_end_name = declaration[1]
             current_group = group_stack[-1]
             if current_group['name'] != group_end_name:
                 raise Exception('GROUP END: Unexpected function group name "' + group_end_name +
@@ -882,22 +1371,18 @@ def get_parsed_functions(functions_txt_filename):
             else:
                 super_group = group_stack[-1]
                 super_group['subgroups'][current_group['name']] = current_group
-        elif line.startswith('DEFAULT METADATA'):
-            line_rest = line[16:].strip()
-            default_metadata = json.loads(line_rest)
-        elif fun_match:
-            return_type = fun_match.group(1)
-            name = fun_match.group(2)
-            parameters = fun_match.group(3)
+        elif declaration[0] == 'DEFAULT METADATA':
+            default_metadata = json.loads(declaration[1])
+        else:
             function_props = {
-                'name': name,
-                'returnType': TType(return_type),
-                'parameters': parse_function_parameters(parameters)
+                'name': declaration[2],
+                'returnType': get_parsed_type(declaration[1]),
+                'parameters':
+                    get_shared_parameter_list(
+                        [get_parsed_type(parameter) for parameter in declaration[3]])
             }
             function_props.update(default_metadata)
             group_stack[-1]['functions'].append(function_props)
-        else:
-            raise Exception('Unexpected function input line: ' + line)
 
     return parsed_functions
 
@@ -960,8 +1445,7 @@ def get_known_to_not_have_side_effects(function_props):
             return 'false'
         else:
             for param in get_parameters(function_props):
-                if 'qualifier' in param.data and (param.data['qualifier'] == 'Out' or
-                                                  param.data['qualifier'] == 'InOut'):
+                if param.qualifier == 'Out' or param.qualifier == 'InOut':
                     return 'false'
             return 'true'
     return 'false'
@@ -970,7 +1454,7 @@ def get_known_to_not_have_side_effects(function_props):
 def get_parameters(function_props):
     if 'parameters' in function_props:
         return function_props['parameters']
-    return []
+    return ()
 
 
 def get_function_mangled_name(function_name, parameters):
@@ -996,11 +1480,10 @@ def get_unique_identifier_name(function_name, parameters):
 
 def get_variable_name_to_store_parameter(param):
     unique_name = 'pt'
-    if 'qualifier' in param.data:
-        if param.data['qualifier'] == 'Out':
-            unique_name += '_o_'
-        if param.data['qualifier'] == 'InOut':
-            unique_name += '_io_'
+    if param.qualifier == 'Out':
+        unique_name += '_o_'
+    if param.qualifier == 'InOut':
+        unique_name += '_io_'
     unique_name += param.get_mangled_name()
     return unique_name
 
@@ -1010,11 +1493,10 @@ def get_variable_name_to_store_parameters(parameters):
         return 'empty'
     unique_name = 'p'
     for param in parameters:
-        if 'qualifier' in param.data:
-            if param.data['qualifier'] == 'Out':
-                unique_name += '_o_'
-            if param.data['qualifier'] == 'InOut':
-                unique_name += '_io_'
+        if param.qualifier == 'Out':
+            unique_name += '_o_'
+        if param.qualifier == 'InOut':
+            unique_name += '_io_'
         unique_name += param.get_mangled_name()
     return unique_name
 
@@ -1030,17 +1512,17 @@ def gen_function_variants(function_props):
     function_is_gen_type = False
     gen_type = set()
     image_params_index = 0
-    for param in parameters + [function_props['returnType']]:
-        if 'genType' in param.data:
-            if param.data['genType'] not in [
+    for index, param in enumerate(parameters + (function_props['returnType'],)):
+        if param.gen_type is not None:
+            if param.gen_type not in [
                     'sampler_or_image_or_subpass', 'vec', 'yes', 'image_params'
             ]:
                 raise Exception(
-                    'Unexpected value of genType "' + str(param.data['genType']) +
+                    'Unexpected value of genType "' + str(param.gen_type) +
                     '" should be "sampler_or_image_or_subpass", "vec", "yes", or "image_params"')
-            gen_type.add(param.data['genType'])
-            if param.data['genType'] == 'image_params':
-                image_params_index = parameters.index(param)
+            gen_type.add(param.gen_type)
+            if param.gen_type == 'image_params':
+                image_params_index = index
 
     if len(gen_type) == 0:
         function_variants.append(function_props)
@@ -1056,10 +1538,10 @@ def gen_function_variants(function_props):
                     ['gimage2DMSArray', 'ivec3', 'int']]
         for variant in variants:
             image_variant_parameters = []
-            for param in parameters:
-                if parameters.index(param) == image_params_index:
+            for index, param in enumerate(parameters):
+                if index == image_params_index:
                     for variant_param in variant:
-                        image_variant_parameters.append(TType(variant_param))
+                        image_variant_parameters.append(get_parsed_type(variant_param))
                 else:
                     image_variant_parameters.append(param)
             types = ['', 'I', 'U']
@@ -1069,7 +1551,7 @@ def gen_function_variants(function_props):
                 for param in image_variant_parameters:
                     variant_parameters.append(
                         param.specific_sampler_or_image_or_subpass_type(type))
-                variant_props['parameters'] = variant_parameters
+                variant_props['parameters'] = get_shared_parameter_list(variant_parameters)
                 variant_props['returnType'] = function_props[
                     'returnType'].specific_sampler_or_image_or_subpass_type(type)
                 function_variants.append(variant_props)
@@ -1084,7 +1566,7 @@ def gen_function_variants(function_props):
             variant_parameters = []
             for param in parameters:
                 variant_parameters.append(param.specific_sampler_or_image_or_subpass_type(type))
-            variant_props['parameters'] = variant_parameters
+            variant_props['parameters'] = get_shared_parameter_list(variant_parameters)
             variant_props['returnType'] = function_props[
                 'returnType'].specific_sampler_or_image_or_subpass_type(type)
             function_variants.append(variant_props)
@@ -1099,7 +1581,7 @@ def gen_function_variants(function_props):
         variant_parameters = []
         for param in parameters:
             variant_parameters.append(param.specific_type(size))
-        variant_props['parameters'] = variant_parameters
+        variant_props['parameters'] = get_shared_parameter_list(variant_parameters)
         variant_props['returnType'] = function_props['returnType'].specific_type(size)
         function_variants.append(variant_props)
     return function_variants
@@ -1152,11 +1634,13 @@ def process_single_function_group(
         elif (not unmangled_function_if_statements.has_key(
                 essl_level, glsl_level, condition, function_name)) or extension == 'UNDEFINED':
             # We don't have this unmangled builtin recorded yet or we might replace an unmangled builtin from an extension with one from core.
-            unmangled_function_if_statements.add_obj(essl_level, glsl_level, condition,
-                                                     function_name, {
-                                                         'hash_matched_code': unmangled_if,
-                                                         'extension': extension
-                                                     })
+            unmangled_function_if_statements.add_obj(
+                essl_level, glsl_level, condition, function_name, {
+                    'hash_matched_code': unmangled_if,
+                    'extension': extension,
+                    'name': 'BuiltInName::{name_with_suffix}'.format(**template_args),
+                    'symbol': '&UnmangledBuiltIns::{extension}'.format(**template_args)
+                })
             unmangled_builtin_declarations.add(
                 'constexpr const UnmangledBuiltIn {extension}(TExtension::{extension});'.format(
                     **template_args))
@@ -1182,9 +1666,13 @@ def process_single_function_group(
     return &BuiltInFunction::kFunction_{unique_name};
 }}"""
             mangled_if = template_mangled_if.format(**template_args)
-            get_builtin_if_statements.add_obj(essl_level, glsl_level, condition,
-                                              template_args['mangled_name'],
-                                              {'hash_matched_code': mangled_if})
+            get_builtin_if_statements.add_obj(
+                essl_level, glsl_level, condition, template_args['mangled_name'], {
+                    'hash_matched_code': mangled_if,
+                    'name': 'BuiltInName::{unique_name}'.format(**template_args),
+                    'symbol': '&BuiltInFunction::kFunction_{unique_name}'.format(**template_args),
+                    'required_extension': extension
+                })
 
             if template_args['unique_name'] in defined_function_variants:
                 continue
@@ -1217,17 +1705,7 @@ def process_single_function_group(
 
             template_args['parameters_var_name'] = get_variable_name_to_store_parameters(
                 parameters)
-            if len(parameters) > 0:
-                template_args['parameters_list'] = ', '.join(parameters_list)
-                template_parameter_list_declaration = 'constexpr const TVariable *{parameters_var_name}[{param_count}] = {{ {parameters_list} }};'
-                parameter_declarations[template_args[
-                    'parameters_var_name']] = template_parameter_list_declaration.format(
-                        **template_args)
-            else:
-                template_parameter_list_declaration = 'constexpr const TVariable **{parameters_var_name} = nullptr;'
-                parameter_declarations[template_args[
-                    'parameters_var_name']] = template_parameter_list_declaration.format(
-                        **template_args)
+            parameter_declarations[template_args['parameters_var_name']] = tuple(parameters_list)
 
             template_function_declaration = 'constexpr const TFunction kFunction_{unique_name}(BuiltInId::{human_readable_name}, BuiltInName::{name_with_suffix}, TExtension::{extension}, BuiltInParameters::{parameters_var_name}, {param_count}, {return_type}, EOp{op}, {known_to_not_have_side_effects});'
             function_declarations.append(template_function_declaration.format(**template_args))
@@ -1277,30 +1755,61 @@ def process_function_group(group_name, group, parameter_declarations, name_decla
         is_in_group_definitions.append(template_is_in_group_definition.format(**template_args))
 
 
-def prune_parameters_arrays(parameter_declarations, function_declarations):
-    # We can share parameters arrays between functions in case one array is a subarray of another.
+def find_parameters_subarray(parameters, arrays):
+    # Returns the name of an array in |arrays| that contains |parameters| and the offset they're
+    # at, or None.
+    count = len(parameters)
+    for array_name, array in arrays:
+        for offset in xrange(len(array) - count + 1):
+            if array[offset:offset + count] == parameters:
+                return array_name, offset
+    return None
+
+
+def prune_parameters_arrays(parameter_declarations, function_declarations, print_sizes):
+    # We can share parameters arrays between functions in case one array is a subarray of another,
+    # for example a prefix or a suffix of it. Arrays are placed longest first, and each one either
+    # points into an array placed before it or is declared on its own.
     parameter_variable_name_replacements = {}
-    used_param_variable_names = set()
-    for param_variable_name, param_declaration in sorted(
-            parameter_declarations.iteritems(), key=lambda item: -len(item[0])):
-        replaced = False
-        for used in used_param_variable_names:
-            if used.startswith(param_variable_name):
-                parameter_variable_name_replacements[param_variable_name] = used
-                replaced = True
-                break
-        if not replaced:
-            used_param_variable_names.add(param_variable_name)
+    used_arrays = []
+    for param_variable_name, parameters in sorted(
+            parameter_declarations.iteritems(), key=lambda item: (-len(item[1]), item[0])):
+        if len(parameters) == 0:
+            continue
+        subarray = find_parameters_subarray(parameters, used_arrays)
+        if subarray:
+            array_name, offset = subarray
+            replacement = 'BuiltInParameters::' + array_name
+            if offset > 0:
+                replacement += ' + ' + str(offset)
+            parameter_variable_name_replacements[param_variable_name] = replacement
+        else:
+            used_arrays.append((param_variable_name, parameters))
 
-    for i in xrange(len(function_declarations)):
-        for replaced, replacement in parameter_variable_name_replacements.iteritems():
-            function_declarations[i] = function_declarations[i].replace(
-                'BuiltInParameters::' + replaced + ',', 'BuiltInParameters::' + replacement + ',')
+    parameters_re = re.compile(r'BuiltInParameters::(\w+)(?=,)')
 
-    return [
-        value for key, value in parameter_declarations.iteritems()
-        if key in used_param_variable_names
-    ]
+    def replace_parameters(match):
+        return parameter_variable_name_replacements.get(match.group(1), match.group(0))
+
+    for i in xrange(len(function_declarations)):
+        function_declarations[i] = parameters_re.sub(replace_parameters, function_declarations[i])
+
+    if print_sizes:
+        arrays = [parameters for parameters in parameter_declarations.itervalues() if parameters]
+        pointer_count = sum(len(parameters) for parameters in arrays)
+        shared_pointer_count = sum(len(parameters) for array_name, parameters in used_arrays)
+        print('Parameter arrays: {} of {} arrays and {} of {} TVariable pointers are emitted'.
+              format(len(used_arrays), len(arrays), shared_pointer_count, pointer_count))
+
+    template_parameter_list_declaration = 'constexpr const TVariable *{name}[{count}] = {{ {parameters} }};'
+    declarations = []
+    if 'empty' in parameter_declarations:
+        declarations.append('constexpr const TVariable **empty = nullptr;')
+    for array_name, parameters in used_arrays:
+        declarations.append(
+            template_parameter_list_declaration.format(
+                name=array_name, count=len(parameters), parameters=', '.join(parameters)))
+    return declarations
 
 
 def process_single_variable_group(condition, group_name, group, builtin_id_declarations,
@@ -1419,9 +1928,12 @@ def process_single_variable_group(condition, group_name, group, builtin_id_decla
     return &BuiltInVariable::var_{name_with_suffix};
 }}"""
                 name_if = template_name_if.format(**template_args)
-                get_builtin_if_statements.add_obj(level, 'COMMON_BUILTINS', condition,
-                                                  template_args['name'],
-                                                  {'hash_matched_code': name_if})
+                get_builtin_if_statements.add_obj(
+                    level, 'COMMON_BUILTINS', condition, template_args['name'], {
+                        'hash_matched_code': name_if,
+                        'name': 'BuiltInName::{name}'.format(**template_args),
+                        'symbol': '&BuiltInVariable::var_{name_with_suffix}'.format(**template_args)
+                    })
 
         if is_member:
             get_condition = condition
@@ -1450,8 +1962,12 @@ def process_single_variable_group(condition, group_name, group, builtin_id_decla
     return mVar_{name_with_suffix};
 }}"""
             name_if = template_name_if.format(**template_args)
-            get_builtin_if_statements.add_obj(level, 'COMMON_BUILTINS', get_condition,
-                                              variable_name, {'hash_matched_code': name_if})
+            get_builtin_if_statements.add_obj(
+                level, 'COMMON_BUILTINS', get_condition, variable_name, {
+                    'hash_matched_code': name_if,
+                    'name': 'BuiltInName::{name}'.format(**template_args),
+                    'member': 'mVar_{name_with_suffix}'.format(**template_args)
+                })
 
         id_counter += 1
 
@@ -1508,10 +2024,19 @@ def main():
         '--dump-intermediate-json',
         help='Dump parsed function data as a JSON file builtin_functions.json',
         action="store_true")
+    parser.add_argument(
+        '--lookup-table',
+        help='Look up built-ins in tables indexed by the name hash instead of switch statements',
+        action="store_true")
+    parser.add_argument(
+        '--print-parameter-array-sizes',
+        help='Print how much sharing parameter arrays between functions saves',
+        action="store_true")
     parser.add_argument('auto_script_command', nargs='?', default='')
     args = parser.parse_args()
 
     test_filename = '../../tests/compiler_tests/ImmutableString_test_autogen.cpp'
+    perf_test_filename = '../../tests/perf_tests/SymbolTableLookupPerf_autogen.h'
     variables_json_filename = 'builtin_variables.json'
     functions_txt_filename = 'builtin_function_declarations.txt'
 
@@ -1520,6 +2045,7 @@ def main():
         inputs = [
             functions_txt_filename,
             variables_json_filename,
+            '../../../scripts/code_generation_utils.py',
         ]
         outputs = [
             'ImmutableString_autogen.cpp',
@@ -1528,6 +2054,7 @@ def main():
             'SymbolTable_autogen.h',
             'tree_util/BuiltIn_autogen.h',
             test_filename,
+            perf_test_filename,
         ]
 
         if args.auto_script_command == 'inputs':
@@ -1580,8 +2107,7 @@ def main():
     # Counts of variables with a certain name string:
     variable_name_count = {}
 
-    # Declarations of parameter arrays for builtin TFunctions. Map from C++ variable name to the full
-    # declaration.
+    # Parameter arrays for builtin TFunctions. Map from C++ variable name to the array elements.
     parameter_declarations = {}
 
     defined_function_variants = set()
@@ -1594,7 +2120,7 @@ def main():
 
             def serialize_obj(obj):
                 if isinstance(obj, TType):
-                    return obj.data
+                    return obj.get_data()
                 else:
                     raise "Cannot serialize to JSON: " + str(obj)
 
@@ -1614,7 +2140,7 @@ def main():
     names = list(dict.fromkeys(names))
     names_dict = dict(zip(names, range(1, len(names) + 1)))
     # Generate the perfect hash function
-    f1, f2, G = generate_hash(names_dict, Hash2)
+    f1, f2, G = generate_perfect_hash(names_dict)
     hashfn = HashFunction(f1, f2, G)
     S1 = f1.salt
     S2 = f2.salt
@@ -1627,7 +2153,8 @@ def main():
             defined_parameter_names, variable_declarations, function_declarations,
             script_generated_hash_tests, get_builtin_if_statements, is_in_group_definitions)
 
-    parameter_declarations = prune_parameters_arrays(parameter_declarations, function_declarations)
+    parameter_declarations = prune_parameters_arrays(parameter_declarations, function_declarations,
+                                                     args.print_parameter_array_sizes)
 
     for group_name, group in parsed_variables.iteritems():
         count_variable_names(group, variable_name_count)
@@ -1639,6 +2166,66 @@ def main():
                                declare_member_variables, variable_declarations,
                                get_variable_definitions, variable_name_count)
 
+    if args.lookup_table:
+        # Conditions and member variables referred to by the lookup tables, mapped to their index.
+        lookup_conditions = OrderedDict([('NO_CONDITION', 0)])
+        lookup_members = OrderedDict()
+        unmangled_lookup_table = unmangled_function_if_statements.get_lookup_table_code(
+            'UnmangledBuiltIn', 'UnmangledBuiltIn', hashfn, script_generated_hash_tests,
+            lookup_conditions, lookup_members)
+        symbol_lookup_table = get_builtin_if_statements.get_lookup_table_code(
+            'Symbol', 'TSymbol', hashfn, script_generated_hash_tests, lookup_conditions,
+            lookup_members)
+        if len(lookup_conditions) > 64:
+            raise Exception('Too many built-in lookup conditions')
+
+        lookup_tables = '\n' + template_lookup_tables.format(
+            get_builtin_levels=get_builtin_levels_code(),
+            symbol_lookup_table=symbol_lookup_table,
+            unmangled_lookup_table=unmangled_lookup_table)
+        get_unmangled_builtin = """const BuiltInLookupEntry<UnmangledBuiltIn> *entry = FindBuiltInEntry(
+    kUnmangledBuiltInBuckets, kUnmangledBuiltInEntries, name, nameHash,
+    GetBuiltInLevels(mShaderSpec, shaderVersion), mBuiltInConditions);
+return entry != nullptr ? entry->symbol : nullptr;"""
+        get_builtin = """const BuiltInLookupEntry<TSymbol> *entry = FindBuiltInEntry(
+    kSymbolBuckets, kSymbolEntries, name, nameHash, GetBuiltInLevels(mShaderSpec, shaderVersion),
+    mBuiltInConditions);
+if (entry == nullptr)
+{
+    return nullptr;
+}
+return entry->symbol != nullptr ? entry->symbol : mBuiltInMembers[entry->member];"""
+
+        declare_member_variables.append('// Bit i is set if condition i of the lookup tables holds.')
+        declare_member_variables.append('uint64_t mBuiltInConditions = 0;')
+        declare_member_variables.append('const TSymbol *mBuiltInMembers[{count}] = {{}};'.format(
+            count=len(lookup_members)))
+        init_member_variables.extend(get_lookup_condition_init_code(lookup_conditions))
+        init_member_variables.extend(get_lookup_member_init_code(lookup_members))
+    else:
+        lookup_tables = ''
+        get_unmangled_builtin = unmangled_function_if_statements.get_switch_code(
+            hashfn, script_generated_hash_tests)
+        get_builtin = get_builtin_if_statements.get_switch_code(hashfn, script_generated_hash_tests)
+
+    perf_test_conditions = OrderedDict([('NO_CONDITION', 0)])
+    perf_test_names = {
+        'essl_mangled_names':
+            get_builtin_if_statements.get_perf_test_names('essl', perf_test_conditions),
+        'glsl_mangled_names':
+            get_builtin_if_statements.get_perf_test_names('glsl', perf_test_conditions),
+        'essl_unmangled_names':
+            unmangled_function_if_statements.get_perf_test_names('essl', perf_test_conditions),
+        'glsl_unmangled_names':
+            unmangled_function_if_statements.get_perf_test_names('glsl', perf_test_conditions),
+    }
+    perf_test_names['lookup_conditions'] = '\n'.join([
+        '    "{condition}",'.format(condition='' if condition == 'NO_CONDITION' else condition)
+        for condition in perf_test_conditions.iterkeys()
+    ])
+    perf_test_names['near_miss_names'] = '\n'.join(
+        ['    "{name}",'.format(name=name) for name in get_near_miss_names(names)])
+
     output_strings = {
         'script_name':
             os.path.basename(__file__),
@@ -1674,10 +2261,12 @@ def main():
             '\n'.join(declare_member_variables),
         'init_member_variables':
             '\n'.join(init_member_variables),
+        'lookup_tables':
+            lookup_tables,
         'get_unmangled_builtin':
-            unmangled_function_if_statements.get_switch_code(hashfn, script_generated_hash_tests),
+            get_unmangled_builtin,
         'get_builtin':
-            get_builtin_if_statements.get_switch_code(hashfn, script_generated_hash_tests),
+            get_builtin,
         'max_unmangled_name_length':
             unmangled_function_if_statements.get_max_name_length(),
         'max_mangled_name_length':
@@ -1696,29 +2285,27 @@ def main():
             len(S1)
     }
 
-    with open('ImmutableString_autogen.cpp', 'wt') as outfile_cpp:
-        output_cpp = template_immutablestring_cpp.format(**output_strings)
-        outfile_cpp.write(output_cpp)
+    output_cpp = template_immutablestring_cpp.format(**output_strings)
+    code_generation_utils.write_file_if_changed('ImmutableString_autogen.cpp', output_cpp)
+
+    output_cpp = template_immutablestringtest_cpp.format(**output_strings)
+    code_generation_utils.write_file_if_changed(test_filename, output_cpp)
 
-    with open(test_filename, 'wt') as outfile_cpp:
-        output_cpp = template_immutablestringtest_cpp.format(**output_strings)
-        outfile_cpp.write(output_cpp)
+    perf_test_names.update(output_strings)
+    output_header = template_symboltablelookupperf_h.format(**perf_test_names)
+    code_generation_utils.write_file_if_changed(perf_test_filename, output_header)
 
-    with open('tree_util/BuiltIn_autogen.h', 'wt') as outfile_header:
-        output_header = template_builtin_header.format(**output_strings)
-        outfile_header.write(output_header)
+    output_header = template_builtin_header.format(**output_strings)
+    code_generation_utils.write_file_if_changed('tree_util/BuiltIn_autogen.h', output_header)
 
-    with open('SymbolTable_autogen.cpp', 'wt') as outfile_cpp:
-        output_cpp = template_symboltable_cpp.format(**output_strings)
-        outfile_cpp.write(output_cpp)
+    output_cpp = template_symboltable_cpp.format(**output_strings)
+    code_generation_utils.write_file_if_changed('SymbolTable_autogen.cpp', output_cpp)
 
-    with open('ParseContext_autogen.h', 'wt') as outfile_header:
-        output_header = template_parsecontext_header.format(**output_strings)
-        outfile_header.write(output_header)
+    output_header = template_parsecontext_header.format(**output_strings)
+    code_generation_utils.write_file_if_changed('ParseContext_autogen.h', output_header)
 
-    with open('SymbolTable_autogen.h', 'wt') as outfile_h:
-        output_h = template_symboltable_h.format(**output_strings)
-        outfile_h.write(output_h)
+    output_h = template_symboltable_h.format(**output_strings)
+    code_generation_utils.write_file_if_changed('SymbolTable_autogen.h', output_h)
 
     return 0
 
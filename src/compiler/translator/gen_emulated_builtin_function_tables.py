@@ -11,6 +11,9 @@ from datetime import date
 import json
 import os, sys
 
+sys.path.append('../../../scripts')
+import code_generation_utils
+
 template_emulated_builtin_functions_hlsl = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
 //
@@ -119,7 +122,7 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = [input_script]
+        inputs = [input_script, '../../../scripts/code_generation_utils.py']
         outputs = [hlsl_fname]
 
         if sys.argv[1] == 'inputs':
@@ -143,9 +146,7 @@ def main():
         copyright_year=date.today().year,
         emulated_functions="".join(emulated_functions))
 
-    with open(hlsl_fname, 'wt') as f:
-        f.write(hlsl_gen)
-        f.close()
+    code_generation_utils.write_file_if_changed(hlsl_fname, hlsl_gen)
 
     return 0
 
@@ -680,11 +680,6 @@ void FrameCapture::writeCallReplay(const CallCapture &call,
     out << callOut.str();
 }
 
-bool FrameCapture::enabled() const
-{
-    return mFrameIndex < 100;
-}
-
 void FrameCapture::reset()
 {
     mCalls.clear();
@@ -103,7 +103,7 @@ class FrameCapture final : angle::NonCopyable
 
     void captureCall(const gl::Context *context, CallCapture &&call);
     void onEndFrame();
-    bool enabled() const;
+    bool enabled() const { return mFrameIndex < 100; }
 
   private:
     // <CallName, ParamName>
@@ -146,19 +146,31 @@ class FrameCapture final : angle::NonCopyable
 };
 
 template <typename CaptureFuncT, typename... ArgsT>
-void CaptureCallToFrameCapture(CaptureFuncT captureFunc,
-                               bool isCallValid,
-                               gl::Context *context,
-                               ArgsT... captureParams)
+ANGLE_NOINLINE void CaptureCall(FrameCapture *frameCapture,
+                                CaptureFuncT captureFunc,
+                                bool isCallValid,
+                                gl::Context *context,
+                                ArgsT... captureParams)
 {
-    FrameCapture *frameCapture = context->getFrameCapture();
-    if (!frameCapture->enabled())
-        return;
-
     CallCapture call = captureFunc(context, isCallValid, captureParams...);
     frameCapture->captureCall(context, std::move(call));
 }
 
+// Called by every entry point when capture is compiled in. Only the check is inlined, capturing the
+// call is kept out of line so that the entry points stay small when the capture is not enabled.
+template <typename CaptureFuncT, typename... ArgsT>
+ANGLE_INLINE void CaptureCallToFrameCapture(CaptureFuncT captureFunc,
+                                            bool isCallValid,
+                                            gl::Context *context,
+                                            ArgsT... captureParams)
+{
+    FrameCapture *frameCapture = context->getFrameCapture();
+    if (ANGLE_UNLIKELY(frameCapture->enabled()))
+    {
+        CaptureCall(frameCapture, captureFunc, isCallValid, context, captureParams...);
+    }
+}
+
 template <typename T>
 void ParamBuffer::addValueParam(const char *paramName, ParamType paramType, T paramValue)
 {
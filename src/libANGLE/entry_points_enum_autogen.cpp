@@ -14,2713 +14,1489 @@
 
 namespace gl
 {
+namespace
+{
+// clang-format off
+// The entry point names, separated by NUL characters.
+constexpr char kEntryPointNames[] =
+    "glAccum\0"
+    "glActiveShaderProgram\0"
+    "glActiveTexture\0"
+    "glAlphaFunc\0"
+    "glAlphaFuncx\0"
+    "glAreTexturesResident\0"
+    "glArrayElement\0"
+    "glAttachShader\0"
+    "glBegin\0"
+    "glBeginConditionalRender\0"
+    "glBeginQuery\0"
+    "glBeginQueryEXT\0"
+    "glBeginQueryIndexed\0"
+    "glBeginTransformFeedback\0"
+    "glBindAttribLocation\0"
+    "glBindBuffer\0"
+    "glBindBufferBase\0"
+    "glBindBufferRange\0"
+    "glBindBuffersBase\0"
+    "glBindBuffersRange\0"
+    "glBindFragDataLocation\0"
+    "glBindFragDataLocationEXT\0"
+    "glBindFragDataLocationIndexed\0"
+    "glBindFragDataLocationIndexedEXT\0"
+    "glBindFragmentInputLocationCHROMIUM\0"
+    "glBindFramebuffer\0"
+    "glBindFramebufferOES\0"
+    "glBindImageTexture\0"
+    "glBindImageTextures\0"
+    "glBindProgramPipeline\0"
+    "glBindRenderbuffer\0"
+    "glBindRenderbufferOES\0"
+    "glBindSampler\0"
+    "glBindSamplers\0"
+    "glBindTexture\0"
+    "glBindTextureUnit\0"
+    "glBindTextures\0"
+    "glBindTransformFeedback\0"
+    "glBindUniformLocationCHROMIUM\0"
+    "glBindVertexArray\0"
+    "glBindVertexArrayOES\0"
+    "glBindVertexBuffer\0"
+    "glBindVertexBuffers\0"
+    "glBitmap\0"
+    "glBlendColor\0"
+    "glBlendEquation\0"
+    "glBlendEquationSeparate\0"
+    "glBlendEquationSeparatei\0"
+    "glBlendEquationi\0"
+    "glBlendFunc\0"
+    "glBlendFuncSeparate\0"
+    "glBlendFuncSeparatei\0"
+    "glBlendFunci\0"
+    "glBlitFramebuffer\0"
+    "glBlitFramebufferANGLE\0"
+    "glBlitNamedFramebuffer\0"
+    "glBufferData\0"
+    "glBufferStorage\0"
+    "glBufferStorageMemEXT\0"
+    "glBufferSubData\0"
+    "glCallList\0"
+    "glCallLists\0"
+    "glCheckFramebufferStatus\0"
+    "glCheckFramebufferStatusOES\0"
+    "glCheckNamedFramebufferStatus\0"
+    "glClampColor\0"
+    "glClear\0"
+    "glClearAccum\0"
+    "glClearBufferData\0"
+    "glClearBufferSubData\0"
+    "glClearBufferfi\0"
+    "glClearBufferfv\0"
+    "glClearBufferiv\0"
+    "glClearBufferuiv\0"
+    "glClearColor\0"
+    "glClearColorx\0"
+    "glClearDepth\0"
+    "glClearDepthf\0"
+    "glClearDepthx\0"
+    "glClearIndex\0"
+    "glClearNamedBufferData\0"
+    "glClearNamedBufferSubData\0"
+    "glClearNamedFramebufferfi\0"
+    "glClearNamedFramebufferfv\0"
+    "glClearNamedFramebufferiv\0"
+    "glClearNamedFramebufferuiv\0"
+    "glClearStencil\0"
+    "glClearTexImage\0"
+    "glClearTexSubImage\0"
+    "glClientActiveTexture\0"
+    "glClientWaitSync\0"
+    "glClipControl\0"
+    "glClipPlane\0"
+    "glClipPlanef\0"
+    "glClipPlanex\0"
+    "glColor3b\0"
+    "glColor3bv\0"
+    "glColor3d\0"
+    "glColor3dv\0"
+    "glColor3f\0"
+    "glColor3fv\0"
+    "glColor3i\0"
+    "glColor3iv\0"
+    "glColor3s\0"
+    "glColor3sv\0"
+    "glColor3ub\0"
+    "glColor3ubv\0"
+    "glColor3ui\0"
+    "glColor3uiv\0"
+    "glColor3us\0"
+    "glColor3usv\0"
+    "glColor4b\0"
+    "glColor4bv\0"
+    "glColor4d\0"
+    "glColor4dv\0"
+    "glColor4f\0"
+    "glColor4fv\0"
+    "glColor4i\0"
+    "glColor4iv\0"
+    "glColor4s\0"
+    "glColor4sv\0"
+    "glColor4ub\0"
+    "glColor4ubv\0"
+    "glColor4ui\0"
+    "glColor4uiv\0"
+    "glColor4us\0"
+    "glColor4usv\0"
+    "glColor4x\0"
+    "glColorMask\0"
+    "glColorMaski\0"
+    "glColorMaterial\0"
+    "glColorP3ui\0"
+    "glColorP3uiv\0"
+    "glColorP4ui\0"
+    "glColorP4uiv\0"
+    "glColorPointer\0"
+    "glCompileShader\0"
+    "glCompressedCopyTextureCHROMIUM\0"
+    "glCompressedTexImage1D\0"
+    "glCompressedTexImage2D\0"
+    "glCompressedTexImage2DRobustANGLE\0"
+    "glCompressedTexImage3D\0"
+    "glCompressedTexImage3DOES\0"
+    "glCompressedTexImage3DRobustANGLE\0"
+    "glCompressedTexSubImage1D\0"
+    "glCompressedTexSubImage2D\0"
+    "glCompressedTexSubImage2DRobustANGLE\0"
+    "glCompressedTexSubImage3D\0"
+    "glCompressedTexSubImage3DOES\0"
+    "glCompressedTexSubImage3DRobustANGLE\0"
+    "glCompressedTextureSubImage1D\0"
+    "glCompressedTextureSubImage2D\0"
+    "glCompressedTextureSubImage3D\0"
+    "glCopyBufferSubData\0"
+    "glCopyImageSubData\0"
+    "glCopyNamedBufferSubData\0"
+    "glCopyPixels\0"
+    "glCopySubTexture3DANGLE\0"
+    "glCopySubTextureCHROMIUM\0"
+    "glCopyTexImage1D\0"
+    "glCopyTexImage2D\0"
+    "glCopyTexSubImage1D\0"
+    "glCopyTexSubImage2D\0"
+    "glCopyTexSubImage3D\0"
+    "glCopyTexSubImage3DOES\0"
+    "glCopyTexture3DANGLE\0"
+    "glCopyTextureCHROMIUM\0"
+    "glCopyTextureSubImage1D\0"
+    "glCopyTextureSubImage2D\0"
+    "glCopyTextureSubImage3D\0"
+    "glCoverFillPathCHROMIUM\0"
+    "glCoverFillPathInstancedCHROMIUM\0"
+    "glCoverStrokePathCHROMIUM\0"
+    "glCoverStrokePathInstancedCHROMIUM\0"
+    "glCoverageModulationCHROMIUM\0"
+    "glCreateBuffers\0"
+    "glCreateFramebuffers\0"
+    "glCreateMemoryObjectsEXT\0"
+    "glCreateProgram\0"
+    "glCreateProgramPipelines\0"
+    "glCreateQueries\0"
+    "glCreateRenderbuffers\0"
+    "glCreateSamplers\0"
+    "glCreateShader\0"
+    "glCreateShaderProgramv\0"
+    "glCreateTextures\0"
+    "glCreateTransformFeedbacks\0"
+    "glCreateVertexArrays\0"
+    "glCullFace\0"
+    "glCurrentPaletteMatrixOES\0"
+    "glDebugMessageCallback\0"
+    "glDebugMessageCallbackKHR\0"
+    "glDebugMessageControl\0"
+    "glDebugMessageControlKHR\0"
+    "glDebugMessageInsert\0"
+    "glDebugMessageInsertKHR\0"
+    "glDeleteBuffers\0"
+    "glDeleteFencesNV\0"
+    "glDeleteFramebuffers\0"
+    "glDeleteFramebuffersOES\0"
+    "glDeleteLists\0"
+    "glDeleteMemoryObjectsEXT\0"
+    "glDeletePathsCHROMIUM\0"
+    "glDeleteProgram\0"
+    "glDeleteProgramPipelines\0"
+    "glDeleteQueries\0"
+    "glDeleteQueriesEXT\0"
+    "glDeleteRenderbuffers\0"
+    "glDeleteRenderbuffersOES\0"
+    "glDeleteSamplers\0"
+    "glDeleteSemaphoresEXT\0"
+    "glDeleteShader\0"
+    "glDeleteSync\0"
+    "glDeleteTextures\0"
+    "glDeleteTransformFeedbacks\0"
+    "glDeleteVertexArrays\0"
+    "glDeleteVertexArraysOES\0"
+    "glDepthFunc\0"
+    "glDepthMask\0"
+    "glDepthRange\0"
+    "glDepthRangeArrayv\0"
+    "glDepthRangeIndexed\0"
+    "glDepthRangef\0"
+    "glDepthRangex\0"
+    "glDetachShader\0"
+    "glDisable\0"
+    "glDisableClientState\0"
+    "glDisableVertexArrayAttrib\0"
+    "glDisableVertexAttribArray\0"
+    "glDisablei\0"
+    "glDiscardFramebufferEXT\0"
+    "glDispatchCompute\0"
+    "glDispatchComputeIndirect\0"
+    "glDrawArrays\0"
+    "glDrawArraysIndirect\0"
+    "glDrawArraysInstanced\0"
+    "glDrawArraysInstancedANGLE\0"
+    "glDrawArraysInstancedBaseInstance\0"
+    "glDrawArraysInstancedBaseInstanceANGLE\0"
+    "glDrawArraysInstancedEXT\0"
+    "glDrawBuffer\0"
+    "glDrawBuffers\0"
+    "glDrawBuffersEXT\0"
+    "glDrawElements\0"
+    "glDrawElementsBaseVertex\0"
+    "glDrawElementsIndirect\0"
+    "glDrawElementsInstanced\0"
+    "glDrawElementsInstancedANGLE\0"
+    "glDrawElementsInstancedBaseInstance\0"
+    "glDrawElementsInstancedBaseVertex\0"
+    "glDrawElementsInstancedBaseVertexBaseInstance\0"
+    "glDrawElementsInstancedBaseVertexBaseInstanceANGLE\0"
+    "glDrawElementsInstancedEXT\0"
+    "glDrawPixels\0"
+    "glDrawRangeElements\0"
+    "glDrawRangeElementsBaseVertex\0"
+    "glDrawTexfOES\0"
+    "glDrawTexfvOES\0"
+    "glDrawTexiOES\0"
+    "glDrawTexivOES\0"
+    "glDrawTexsOES\0"
+    "glDrawTexsvOES\0"
+    "glDrawTexxOES\0"
+    "glDrawTexxvOES\0"
+    "glDrawTransformFeedback\0"
+    "glDrawTransformFeedbackInstanced\0"
+    "glDrawTransformFeedbackStream\0"
+    "glDrawTransformFeedbackStreamInstanced\0"
+    "glEGLImageTargetRenderbufferStorageOES\0"
+    "glEGLImageTargetTexture2DOES\0"
+    "glEdgeFlag\0"
+    "glEdgeFlagPointer\0"
+    "glEdgeFlagv\0"
+    "glEnable\0"
+    "glEnableClientState\0"
+    "glEnableVertexArrayAttrib\0"
+    "glEnableVertexAttribArray\0"
+    "glEnablei\0"
+    "glEnd\0"
+    "glEndConditionalRender\0"
+    "glEndList\0"
+    "glEndQuery\0"
+    "glEndQueryEXT\0"
+    "glEndQueryIndexed\0"
+    "glEndTransformFeedback\0"
+    "glEvalCoord1d\0"
+    "glEvalCoord1dv\0"
+    "glEvalCoord1f\0"
+    "glEvalCoord1fv\0"
+    "glEvalCoord2d\0"
+    "glEvalCoord2dv\0"
+    "glEvalCoord2f\0"
+    "glEvalCoord2fv\0"
+    "glEvalMesh1\0"
+    "glEvalMesh2\0"
+    "glEvalPoint1\0"
+    "glEvalPoint2\0"
+    "glFeedbackBuffer\0"
+    "glFenceSync\0"
+    "glFinish\0"
+    "glFinishFenceNV\0"
+    "glFlush\0"
+    "glFlushMappedBufferRange\0"
+    "glFlushMappedBufferRangeEXT\0"
+    "glFlushMappedNamedBufferRange\0"
+    "glFogCoordPointer\0"
+    "glFogCoordd\0"
+    "glFogCoorddv\0"
+    "glFogCoordf\0"
+    "glFogCoordfv\0"
+    "glFogf\0"
+    "glFogfv\0"
+    "glFogi\0"
+    "glFogiv\0"
+    "glFogx\0"
+    "glFogxv\0"
+    "glFramebufferParameteri\0"
+    "glFramebufferRenderbuffer\0"
+    "glFramebufferRenderbufferOES\0"
+    "glFramebufferTexture\0"
+    "glFramebufferTexture1D\0"
+    "glFramebufferTexture2D\0"
+    "glFramebufferTexture2DOES\0"
+    "glFramebufferTexture3D\0"
+    "glFramebufferTexture3DOES\0"
+    "glFramebufferTextureEXT\0"
+    "glFramebufferTextureLayer\0"
+    "glFramebufferTextureMultiviewOVR\0"
+    "glFrontFace\0"
+    "glFrustum\0"
+    "glFrustumf\0"
+    "glFrustumx\0"
+    "glGenBuffers\0"
+    "glGenFencesNV\0"
+    "glGenFramebuffers\0"
+    "glGenFramebuffersOES\0"
+    "glGenLists\0"
+    "glGenPathsCHROMIUM\0"
+    "glGenProgramPipelines\0"
+    "glGenQueries\0"
+    "glGenQueriesEXT\0"
+    "glGenRenderbuffers\0"
+    "glGenRenderbuffersOES\0"
+    "glGenSamplers\0"
+    "glGenSemaphoresEXT\0"
+    "glGenTextures\0"
+    "glGenTransformFeedbacks\0"
+    "glGenVertexArrays\0"
+    "glGenVertexArraysOES\0"
+    "glGenerateMipmap\0"
+    "glGenerateMipmapOES\0"
+    "glGenerateTextureMipmap\0"
+    "glGetActiveAtomicCounterBufferiv\0"
+    "glGetActiveAttrib\0"
+    "glGetActiveSubroutineName\0"
+    "glGetActiveSubroutineUniformName\0"
+    "glGetActiveSubroutineUniformiv\0"
+    "glGetActiveUniform\0"
+    "glGetActiveUniformBlockName\0"
+    "glGetActiveUniformBlockiv\0"
+    "glGetActiveUniformBlockivRobustANGLE\0"
+    "glGetActiveUniformName\0"
+    "glGetActiveUniformsiv\0"
+    "glGetAttachedShaders\0"
+    "glGetAttribLocation\0"
+    "glGetBooleani_v\0"
+    "glGetBooleani_vRobustANGLE\0"
+    "glGetBooleanv\0"
+    "glGetBooleanvRobustANGLE\0"
+    "glGetBufferParameteri64v\0"
+    "glGetBufferParameteri64vRobustANGLE\0"
+    "glGetBufferParameteriv\0"
+    "glGetBufferParameterivRobustANGLE\0"
+    "glGetBufferPointerv\0"
+    "glGetBufferPointervOES\0"
+    "glGetBufferPointervRobustANGLE\0"
+    "glGetBufferSubData\0"
+    "glGetClipPlane\0"
+    "glGetClipPlanef\0"
+    "glGetClipPlanex\0"
+    "glGetCompressedTexImage\0"
+    "glGetCompressedTextureImage\0"
+    "glGetCompressedTextureSubImage\0"
+    "glGetDebugMessageLog\0"
+    "glGetDebugMessageLogKHR\0"
+    "glGetDoublei_v\0"
+    "glGetDoublev\0"
+    "glGetError\0"
+    "glGetFenceivNV\0"
+    "glGetFixedv\0"
+    "glGetFloati_v\0"
+    "glGetFloatv\0"
+    "glGetFloatvRobustANGLE\0"
+    "glGetFragDataIndex\0"
+    "glGetFragDataIndexEXT\0"
+    "glGetFragDataLocation\0"
+    "glGetFramebufferAttachmentParameteriv\0"
+    "glGetFramebufferAttachmentParameterivOES\0"
+    "glGetFramebufferAttachmentParameterivRobustANGLE\0"
+    "glGetFramebufferParameteriv\0"
+    "glGetFramebufferParameterivRobustANGLE\0"
+    "glGetGraphicsResetStatus\0"
+    "glGetGraphicsResetStatusEXT\0"
+    "glGetInteger64i_v\0"
+    "glGetInteger64i_vRobustANGLE\0"
+    "glGetInteger64v\0"
+    "glGetInteger64vRobustANGLE\0"
+    "glGetIntegeri_v\0"
+    "glGetIntegeri_vRobustANGLE\0"
+    "glGetIntegerv\0"
+    "glGetIntegervRobustANGLE\0"
+    "glGetInternalformati64v\0"
+    "glGetInternalformativ\0"
+    "glGetInternalformativRobustANGLE\0"
+    "glGetLightfv\0"
+    "glGetLightiv\0"
+    "glGetLightxv\0"
+    "glGetMapdv\0"
+    "glGetMapfv\0"
+    "glGetMapiv\0"
+    "glGetMaterialfv\0"
+    "glGetMaterialiv\0"
+    "glGetMaterialxv\0"
+    "glGetMemoryObjectParameterivEXT\0"
+    "glGetMultisamplefv\0"
+    "glGetMultisamplefvANGLE\0"
+    "glGetMultisamplefvRobustANGLE\0"
+    "glGetNamedBufferParameteri64v\0"
+    "glGetNamedBufferParameteriv\0"
+    "glGetNamedBufferPointerv\0"
+    "glGetNamedBufferSubData\0"
+    "glGetNamedFramebufferAttachmentParameteriv\0"
+    "glGetNamedFramebufferParameteriv\0"
+    "glGetNamedRenderbufferParameteriv\0"
+    "glGetObjectLabel\0"
+    "glGetObjectLabelKHR\0"
+    "glGetObjectPtrLabel\0"
+    "glGetObjectPtrLabelKHR\0"
+    "glGetPathParameterfvCHROMIUM\0"
+    "glGetPathParameterivCHROMIUM\0"
+    "glGetPixelMapfv\0"
+    "glGetPixelMapuiv\0"
+    "glGetPixelMapusv\0"
+    "glGetPointerv\0"
+    "glGetPointervKHR\0"
+    "glGetPointervRobustANGLERobustANGLE\0"
+    "glGetPolygonStipple\0"
+    "glGetProgramBinary\0"
+    "glGetProgramBinaryOES\0"
+    "glGetProgramInfoLog\0"
+    "glGetProgramInterfaceiv\0"
+    "glGetProgramInterfaceivRobustANGLE\0"
+    "glGetProgramPipelineInfoLog\0"
+    "glGetProgramPipelineiv\0"
+    "glGetProgramResourceIndex\0"
+    "glGetProgramResourceLocation\0"
+    "glGetProgramResourceLocationIndex\0"
+    "glGetProgramResourceLocationIndexEXT\0"
+    "glGetProgramResourceName\0"
+    "glGetProgramResourceiv\0"
+    "glGetProgramStageiv\0"
+    "glGetProgramiv\0"
+    "glGetProgramivRobustANGLE\0"
+    "glGetQueryBufferObjecti64v\0"
+    "glGetQueryBufferObjectiv\0"
+    "glGetQueryBufferObjectui64v\0"
+    "glGetQueryBufferObjectuiv\0"
+    "glGetQueryIndexediv\0"
+    "glGetQueryObjecti64v\0"
+    "glGetQueryObjecti64vEXT\0"
+    "glGetQueryObjecti64vRobustANGLE\0"
+    "glGetQueryObjectiv\0"
+    "glGetQueryObjectivEXT\0"
+    "glGetQueryObjectivRobustANGLE\0"
+    "glGetQueryObjectui64v\0"
+    "glGetQueryObjectui64vEXT\0"
+    "glGetQueryObjectui64vRobustANGLE\0"
+    "glGetQueryObjectuiv\0"
+    "glGetQueryObjectuivEXT\0"
+    "glGetQueryObjectuivRobustANGLE\0"
+    "glGetQueryiv\0"
+    "glGetQueryivEXT\0"
+    "glGetQueryivRobustANGLE\0"
+    "glGetRenderbufferParameteriv\0"
+    "glGetRenderbufferParameterivOES\0"
+    "glGetRenderbufferParameterivRobustANGLE\0"
+    "glGetSamplerParameterIiv\0"
+    "glGetSamplerParameterIivOES\0"
+    "glGetSamplerParameterIivRobustANGLE\0"
+    "glGetSamplerParameterIuiv\0"
+    "glGetSamplerParameterIuivOES\0"
+    "glGetSamplerParameterIuivRobustANGLE\0"
+    "glGetSamplerParameterfv\0"
+    "glGetSamplerParameterfvRobustANGLE\0"
+    "glGetSamplerParameteriv\0"
+    "glGetSamplerParameterivRobustANGLE\0"
+    "glGetSemaphoreParameterui64vEXT\0"
+    "glGetShaderInfoLog\0"
+    "glGetShaderPrecisionFormat\0"
+    "glGetShaderSource\0"
+    "glGetShaderiv\0"
+    "glGetShaderivRobustANGLE\0"
+    "glGetString\0"
+    "glGetStringi\0"
+    "glGetSubroutineIndex\0"
+    "glGetSubroutineUniformLocation\0"
+    "glGetSynciv\0"
+    "glGetTexEnvfv\0"
+    "glGetTexEnviv\0"
+    "glGetTexEnvxv\0"
+    "glGetTexGendv\0"
+    "glGetTexGenfv\0"
+    "glGetTexGenfvOES\0"
+    "glGetTexGeniv\0"
+    "glGetTexGenivOES\0"
+    "glGetTexGenxvOES\0"
+    "glGetTexImage\0"
+    "glGetTexLevelParameterfv\0"
+    "glGetTexLevelParameterfvANGLE\0"
+    "glGetTexLevelParameterfvRobustANGLE\0"
+    "glGetTexLevelParameteriv\0"
+    "glGetTexLevelParameterivANGLE\0"
+    "glGetTexLevelParameterivRobustANGLE\0"
+    "glGetTexParameterIiv\0"
+    "glGetTexParameterIivOES\0"
+    "glGetTexParameterIivRobustANGLE\0"
+    "glGetTexParameterIuiv\0"
+    "glGetTexParameterIuivOES\0"
+    "glGetTexParameterIuivRobustANGLE\0"
+    "glGetTexParameterfv\0"
+    "glGetTexParameterfvRobustANGLE\0"
+    "glGetTexParameteriv\0"
+    "glGetTexParameterivRobustANGLE\0"
+    "glGetTexParameterxv\0"
+    "glGetTextureImage\0"
+    "glGetTextureLevelParameterfv\0"
+    "glGetTextureLevelParameteriv\0"
+    "glGetTextureParameterIiv\0"
+    "glGetTextureParameterIuiv\0"
+    "glGetTextureParameterfv\0"
+    "glGetTextureParameteriv\0"
+    "glGetTextureSubImage\0"
+    "glGetTransformFeedbackVarying\0"
+    "glGetTransformFeedbacki64_v\0"
+    "glGetTransformFeedbacki_v\0"
+    "glGetTransformFeedbackiv\0"
+    "glGetTranslatedShaderSourceANGLE\0"
+    "glGetUniformBlockIndex\0"
+    "glGetUniformIndices\0"
+    "glGetUniformLocation\0"
+    "glGetUniformSubroutineuiv\0"
+    "glGetUniformdv\0"
+    "glGetUniformfv\0"
+    "glGetUniformfvRobustANGLE\0"
+    "glGetUniformiv\0"
+    "glGetUniformivRobustANGLE\0"
+    "glGetUniformuiv\0"
+    "glGetUniformuivRobustANGLE\0"
+    "glGetUnsignedBytei_vEXT\0"
+    "glGetUnsignedBytevEXT\0"
+    "glGetVertexArrayIndexed64iv\0"
+    "glGetVertexArrayIndexediv\0"
+    "glGetVertexArrayiv\0"
+    "glGetVertexAttribIiv\0"
+    "glGetVertexAttribIivRobustANGLE\0"
+    "glGetVertexAttribIuiv\0"
+    "glGetVertexAttribIuivRobustANGLE\0"
+    "glGetVertexAttribLdv\0"
+    "glGetVertexAttribPointerv\0"
+    "glGetVertexAttribPointervRobustANGLE\0"
+    "glGetVertexAttribdv\0"
+    "glGetVertexAttribfv\0"
+    "glGetVertexAttribfvRobustANGLE\0"
+    "glGetVertexAttribiv\0"
+    "glGetVertexAttribivRobustANGLE\0"
+    "glGetnColorTable\0"
+    "glGetnCompressedTexImage\0"
+    "glGetnConvolutionFilter\0"
+    "glGetnHistogram\0"
+    "glGetnMapdv\0"
+    "glGetnMapfv\0"
+    "glGetnMapiv\0"
+    "glGetnMinmax\0"
+    "glGetnPixelMapfv\0"
+    "glGetnPixelMapuiv\0"
+    "glGetnPixelMapusv\0"
+    "glGetnPolygonStipple\0"
+    "glGetnSeparableFilter\0"
+    "glGetnTexImage\0"
+    "glGetnUniformdv\0"
+    "glGetnUniformfv\0"
+    "glGetnUniformfvEXT\0"
+    "glGetnUniformfvRobustANGLE\0"
+    "glGetnUniformiv\0"
+    "glGetnUniformivEXT\0"
+    "glGetnUniformivRobustANGLE\0"
+    "glGetnUniformuiv\0"
+    "glGetnUniformuivRobustANGLE\0"
+    "glHint\0"
+    "glImportMemoryFdEXT\0"
+    "glImportSemaphoreFdEXT\0"
+    "glIndexMask\0"
+    "glIndexPointer\0"
+    "glIndexd\0"
+    "glIndexdv\0"
+    "glIndexf\0"
+    "glIndexfv\0"
+    "glIndexi\0"
+    "glIndexiv\0"
+    "glIndexs\0"
+    "glIndexsv\0"
+    "glIndexub\0"
+    "glIndexubv\0"
+    "glInitNames\0"
+    "glInsertEventMarkerEXT\0"
+    "glInterleavedArrays\0"
+    "glInvalid\0"
+    "glInvalidateBufferData\0"
+    "glInvalidateBufferSubData\0"
+    "glInvalidateFramebuffer\0"
+    "glInvalidateNamedFramebufferData\0"
+    "glInvalidateNamedFramebufferSubData\0"
+    "glInvalidateSubFramebuffer\0"
+    "glInvalidateTexImage\0"
+    "glInvalidateTexSubImage\0"
+    "glInvalidateTextureANGLE\0"
+    "glIsBuffer\0"
+    "glIsEnabled\0"
+    "glIsEnabledi\0"
+    "glIsFenceNV\0"
+    "glIsFramebuffer\0"
+    "glIsFramebufferOES\0"
+    "glIsList\0"
+    "glIsMemoryObjectEXT\0"
+    "glIsPathCHROMIUM\0"
+    "glIsProgram\0"
+    "glIsProgramPipeline\0"
+    "glIsQuery\0"
+    "glIsQueryEXT\0"
+    "glIsRenderbuffer\0"
+    "glIsRenderbufferOES\0"
+    "glIsSampler\0"
+    "glIsSemaphoreEXT\0"
+    "glIsShader\0"
+    "glIsSync\0"
+    "glIsTexture\0"
+    "glIsTransformFeedback\0"
+    "glIsVertexArray\0"
+    "glIsVertexArrayOES\0"
+    "glLightModelf\0"
+    "glLightModelfv\0"
+    "glLightModeli\0"
+    "glLightModeliv\0"
+    "glLightModelx\0"
+    "glLightModelxv\0"
+    "glLightf\0"
+    "glLightfv\0"
+    "glLighti\0"
+    "glLightiv\0"
+    "glLightx\0"
+    "glLightxv\0"
+    "glLineStipple\0"
+    "glLineWidth\0"
+    "glLineWidthx\0"
+    "glLinkProgram\0"
+    "glListBase\0"
+    "glLoadIdentity\0"
+    "glLoadMatrixd\0"
+    "glLoadMatrixf\0"
+    "glLoadMatrixx\0"
+    "glLoadName\0"
+    "glLoadPaletteFromModelViewMatrixOES\0"
+    "glLoadTransposeMatrixd\0"
+    "glLoadTransposeMatrixf\0"
+    "glLogicOp\0"
+    "glLoseContextCHROMIUM\0"
+    "glMap1d\0"
+    "glMap1f\0"
+    "glMap2d\0"
+    "glMap2f\0"
+    "glMapBuffer\0"
+    "glMapBufferOES\0"
+    "glMapBufferRange\0"
+    "glMapBufferRangeEXT\0"
+    "glMapGrid1d\0"
+    "glMapGrid1f\0"
+    "glMapGrid2d\0"
+    "glMapGrid2f\0"
+    "glMapNamedBuffer\0"
+    "glMapNamedBufferRange\0"
+    "glMaterialf\0"
+    "glMaterialfv\0"
+    "glMateriali\0"
+    "glMaterialiv\0"
+    "glMaterialx\0"
+    "glMaterialxv\0"
+    "glMatrixIndexPointerOES\0"
+    "glMatrixLoadIdentityCHROMIUM\0"
+    "glMatrixLoadfCHROMIUM\0"
+    "glMatrixMode\0"
+    "glMaxShaderCompilerThreadsKHR\0"
+    "glMemoryBarrier\0"
+    "glMemoryBarrierByRegion\0"
+    "glMemoryObjectParameterivEXT\0"
+    "glMinSampleShading\0"
+    "glMultMatrixd\0"
+    "glMultMatrixf\0"
+    "glMultMatrixx\0"
+    "glMultTransposeMatrixd\0"
+    "glMultTransposeMatrixf\0"
+    "glMultiDrawArrays\0"
+    "glMultiDrawArraysANGLE\0"
+    "glMultiDrawArraysIndirect\0"
+    "glMultiDrawArraysIndirectCount\0"
+    "glMultiDrawArraysInstancedANGLE\0"
+    "glMultiDrawArraysInstancedBaseInstanceANGLE\0"
+    "glMultiDrawElements\0"
+    "glMultiDrawElementsANGLE\0"
+    "glMultiDrawElementsBaseVertex\0"
+    "glMultiDrawElementsIndirect\0"
+    "glMultiDrawElementsIndirectCount\0"
+    "glMultiDrawElementsInstancedANGLE\0"
+    "glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE\0"
+    "glMultiTexCoord1d\0"
+    "glMultiTexCoord1dv\0"
+    "glMultiTexCoord1f\0"
+    "glMultiTexCoord1fv\0"
+    "glMultiTexCoord1i\0"
+    "glMultiTexCoord1iv\0"
+    "glMultiTexCoord1s\0"
+    "glMultiTexCoord1sv\0"
+    "glMultiTexCoord2d\0"
+    "glMultiTexCoord2dv\0"
+    "glMultiTexCoord2f\0"
+    "glMultiTexCoord2fv\0"
+    "glMultiTexCoord2i\0"
+    "glMultiTexCoord2iv\0"
+    "glMultiTexCoord2s\0"
+    "glMultiTexCoord2sv\0"
+    "glMultiTexCoord3d\0"
+    "glMultiTexCoord3dv\0"
+    "glMultiTexCoord3f\0"
+    "glMultiTexCoord3fv\0"
+    "glMultiTexCoord3i\0"
+    "glMultiTexCoord3iv\0"
+    "glMultiTexCoord3s\0"
+    "glMultiTexCoord3sv\0"
+    "glMultiTexCoord4d\0"
+    "glMultiTexCoord4dv\0"
+    "glMultiTexCoord4f\0"
+    "glMultiTexCoord4fv\0"
+    "glMultiTexCoord4i\0"
+    "glMultiTexCoord4iv\0"
+    "glMultiTexCoord4s\0"
+    "glMultiTexCoord4sv\0"
+    "glMultiTexCoord4x\0"
+    "glMultiTexCoordP1ui\0"
+    "glMultiTexCoordP1uiv\0"
+    "glMultiTexCoordP2ui\0"
+    "glMultiTexCoordP2uiv\0"
+    "glMultiTexCoordP3ui\0"
+    "glMultiTexCoordP3uiv\0"
+    "glMultiTexCoordP4ui\0"
+    "glMultiTexCoordP4uiv\0"
+    "glNamedBufferData\0"
+    "glNamedBufferStorage\0"
+    "glNamedBufferSubData\0"
+    "glNamedFramebufferDrawBuffer\0"
+    "glNamedFramebufferDrawBuffers\0"
+    "glNamedFramebufferParameteri\0"
+    "glNamedFramebufferReadBuffer\0"
+    "glNamedFramebufferRenderbuffer\0"
+    "glNamedFramebufferTexture\0"
+    "glNamedFramebufferTextureLayer\0"
+    "glNamedRenderbufferStorage\0"
+    "glNamedRenderbufferStorageMultisample\0"
+    "glNewList\0"
+    "glNormal3b\0"
+    "glNormal3bv\0"
+    "glNormal3d\0"
+    "glNormal3dv\0"
+    "glNormal3f\0"
+    "glNormal3fv\0"
+    "glNormal3i\0"
+    "glNormal3iv\0"
+    "glNormal3s\0"
+    "glNormal3sv\0"
+    "glNormal3x\0"
+    "glNormalP3ui\0"
+    "glNormalP3uiv\0"
+    "glNormalPointer\0"
+    "glObjectLabel\0"
+    "glObjectLabelKHR\0"
+    "glObjectPtrLabel\0"
+    "glObjectPtrLabelKHR\0"
+    "glOrtho\0"
+    "glOrthof\0"
+    "glOrthox\0"
+    "glPassThrough\0"
+    "glPatchParameterfv\0"
+    "glPatchParameteri\0"
+    "glPathCommandsCHROMIUM\0"
+    "glPathParameterfCHROMIUM\0"
+    "glPathParameteriCHROMIUM\0"
+    "glPathStencilFuncCHROMIUM\0"
+    "glPauseTransformFeedback\0"
+    "glPixelMapfv\0"
+    "glPixelMapuiv\0"
+    "glPixelMapusv\0"
+    "glPixelStoref\0"
+    "glPixelStorei\0"
+    "glPixelTransferf\0"
+    "glPixelTransferi\0"
+    "glPixelZoom\0"
+    "glPointParameterf\0"
+    "glPointParameterfv\0"
+    "glPointParameteri\0"
+    "glPointParameteriv\0"
+    "glPointParameterx\0"
+    "glPointParameterxv\0"
+    "glPointSize\0"
+    "glPointSizePointerOES\0"
+    "glPointSizex\0"
+    "glPolygonMode\0"
+    "glPolygonOffset\0"
+    "glPolygonOffsetClamp\0"
+    "glPolygonOffsetx\0"
+    "glPolygonStipple\0"
+    "glPopAttrib\0"
+    "glPopClientAttrib\0"
+    "glPopDebugGroup\0"
+    "glPopDebugGroupKHR\0"
+    "glPopGroupMarkerEXT\0"
+    "glPopMatrix\0"
+    "glPopName\0"
+    "glPrimitiveRestartIndex\0"
+    "glPrioritizeTextures\0"
+    "glProgramBinary\0"
+    "glProgramBinaryOES\0"
+    "glProgramParameteri\0"
+    "glProgramPathFragmentInputGenCHROMIUM\0"
+    "glProgramUniform1d\0"
+    "glProgramUniform1dv\0"
+    "glProgramUniform1f\0"
+    "glProgramUniform1fv\0"
+    "glProgramUniform1i\0"
+    "glProgramUniform1iv\0"
+    "glProgramUniform1ui\0"
+    "glProgramUniform1uiv\0"
+    "glProgramUniform2d\0"
+    "glProgramUniform2dv\0"
+    "glProgramUniform2f\0"
+    "glProgramUniform2fv\0"
+    "glProgramUniform2i\0"
+    "glProgramUniform2iv\0"
+    "glProgramUniform2ui\0"
+    "glProgramUniform2uiv\0"
+    "glProgramUniform3d\0"
+    "glProgramUniform3dv\0"
+    "glProgramUniform3f\0"
+    "glProgramUniform3fv\0"
+    "glProgramUniform3i\0"
+    "glProgramUniform3iv\0"
+    "glProgramUniform3ui\0"
+    "glProgramUniform3uiv\0"
+    "glProgramUniform4d\0"
+    "glProgramUniform4dv\0"
+    "glProgramUniform4f\0"
+    "glProgramUniform4fv\0"
+    "glProgramUniform4i\0"
+    "glProgramUniform4iv\0"
+    "glProgramUniform4ui\0"
+    "glProgramUniform4uiv\0"
+    "glProgramUniformMatrix2dv\0"
+    "glProgramUniformMatrix2fv\0"
+    "glProgramUniformMatrix2x3dv\0"
+    "glProgramUniformMatrix2x3fv\0"
+    "glProgramUniformMatrix2x4dv\0"
+    "glProgramUniformMatrix2x4fv\0"
+    "glProgramUniformMatrix3dv\0"
+    "glProgramUniformMatrix3fv\0"
+    "glProgramUniformMatrix3x2dv\0"
+    "glProgramUniformMatrix3x2fv\0"
+    "glProgramUniformMatrix3x4dv\0"
+    "glProgramUniformMatrix3x4fv\0"
+    "glProgramUniformMatrix4dv\0"
+    "glProgramUniformMatrix4fv\0"
+    "glProgramUniformMatrix4x2dv\0"
+    "glProgramUniformMatrix4x2fv\0"
+    "glProgramUniformMatrix4x3dv\0"
+    "glProgramUniformMatrix4x3fv\0"
+    "glProvokingVertex\0"
+    "glProvokingVertexANGLE\0"
+    "glPushAttrib\0"
+    "glPushClientAttrib\0"
+    "glPushDebugGroup\0"
+    "glPushDebugGroupKHR\0"
+    "glPushGroupMarkerEXT\0"
+    "glPushMatrix\0"
+    "glPushName\0"
+    "glQueryCounter\0"
+    "glQueryCounterEXT\0"
+    "glQueryMatrixxOES\0"
+    "glRasterPos2d\0"
+    "glRasterPos2dv\0"
+    "glRasterPos2f\0"
+    "glRasterPos2fv\0"
+    "glRasterPos2i\0"
+    "glRasterPos2iv\0"
+    "glRasterPos2s\0"
+    "glRasterPos2sv\0"
+    "glRasterPos3d\0"
+    "glRasterPos3dv\0"
+    "glRasterPos3f\0"
+    "glRasterPos3fv\0"
+    "glRasterPos3i\0"
+    "glRasterPos3iv\0"
+    "glRasterPos3s\0"
+    "glRasterPos3sv\0"
+    "glRasterPos4d\0"
+    "glRasterPos4dv\0"
+    "glRasterPos4f\0"
+    "glRasterPos4fv\0"
+    "glRasterPos4i\0"
+    "glRasterPos4iv\0"
+    "glRasterPos4s\0"
+    "glRasterPos4sv\0"
+    "glReadBuffer\0"
+    "glReadPixels\0"
+    "glReadPixelsRobustANGLE\0"
+    "glReadnPixels\0"
+    "glReadnPixelsEXT\0"
+    "glReadnPixelsRobustANGLE\0"
+    "glRectd\0"
+    "glRectdv\0"
+    "glRectf\0"
+    "glRectfv\0"
+    "glRecti\0"
+    "glRectiv\0"
+    "glRects\0"
+    "glRectsv\0"
+    "glReleaseShaderCompiler\0"
+    "glRenderMode\0"
+    "glRenderbufferStorage\0"
+    "glRenderbufferStorageMultisample\0"
+    "glRenderbufferStorageMultisampleANGLE\0"
+    "glRenderbufferStorageOES\0"
+    "glRequestExtensionANGLE\0"
+    "glResumeTransformFeedback\0"
+    "glRotated\0"
+    "glRotatef\0"
+    "glRotatex\0"
+    "glSampleCoverage\0"
+    "glSampleCoveragex\0"
+    "glSampleMaski\0"
+    "glSampleMaskiANGLE\0"
+    "glSamplerParameterIiv\0"
+    "glSamplerParameterIivOES\0"
+    "glSamplerParameterIivRobustANGLE\0"
+    "glSamplerParameterIuiv\0"
+    "glSamplerParameterIuivOES\0"
+    "glSamplerParameterIuivRobustANGLE\0"
+    "glSamplerParameterf\0"
+    "glSamplerParameterfv\0"
+    "glSamplerParameterfvRobustANGLE\0"
+    "glSamplerParameteri\0"
+    "glSamplerParameteriv\0"
+    "glSamplerParameterivRobustANGLE\0"
+    "glScaled\0"
+    "glScalef\0"
+    "glScalex\0"
+    "glScissor\0"
+    "glScissorArrayv\0"
+    "glScissorIndexed\0"
+    "glScissorIndexedv\0"
+    "glSecondaryColor3b\0"
+    "glSecondaryColor3bv\0"
+    "glSecondaryColor3d\0"
+    "glSecondaryColor3dv\0"
+    "glSecondaryColor3f\0"
+    "glSecondaryColor3fv\0"
+    "glSecondaryColor3i\0"
+    "glSecondaryColor3iv\0"
+    "glSecondaryColor3s\0"
+    "glSecondaryColor3sv\0"
+    "glSecondaryColor3ub\0"
+    "glSecondaryColor3ubv\0"
+    "glSecondaryColor3ui\0"
+    "glSecondaryColor3uiv\0"
+    "glSecondaryColor3us\0"
+    "glSecondaryColor3usv\0"
+    "glSecondaryColorP3ui\0"
+    "glSecondaryColorP3uiv\0"
+    "glSecondaryColorPointer\0"
+    "glSelectBuffer\0"
+    "glSemaphoreParameterui64vEXT\0"
+    "glSetFenceNV\0"
+    "glShadeModel\0"
+    "glShaderBinary\0"
+    "glShaderSource\0"
+    "glShaderStorageBlockBinding\0"
+    "glSignalSemaphoreEXT\0"
+    "glSpecializeShader\0"
+    "glStencilFillPathCHROMIUM\0"
+    "glStencilFillPathInstancedCHROMIUM\0"
+    "glStencilFunc\0"
+    "glStencilFuncSeparate\0"
+    "glStencilMask\0"
+    "glStencilMaskSeparate\0"
+    "glStencilOp\0"
+    "glStencilOpSeparate\0"
+    "glStencilStrokePathCHROMIUM\0"
+    "glStencilStrokePathInstancedCHROMIUM\0"
+    "glStencilThenCoverFillPathCHROMIUM\0"
+    "glStencilThenCoverFillPathInstancedCHROMIUM\0"
+    "glStencilThenCoverStrokePathCHROMIUM\0"
+    "glStencilThenCoverStrokePathInstancedCHROMIUM\0"
+    "glTestFenceNV\0"
+    "glTexBuffer\0"
+    "glTexBufferRange\0"
+    "glTexCoord1d\0"
+    "glTexCoord1dv\0"
+    "glTexCoord1f\0"
+    "glTexCoord1fv\0"
+    "glTexCoord1i\0"
+    "glTexCoord1iv\0"
+    "glTexCoord1s\0"
+    "glTexCoord1sv\0"
+    "glTexCoord2d\0"
+    "glTexCoord2dv\0"
+    "glTexCoord2f\0"
+    "glTexCoord2fv\0"
+    "glTexCoord2i\0"
+    "glTexCoord2iv\0"
+    "glTexCoord2s\0"
+    "glTexCoord2sv\0"
+    "glTexCoord3d\0"
+    "glTexCoord3dv\0"
+    "glTexCoord3f\0"
+    "glTexCoord3fv\0"
+    "glTexCoord3i\0"
+    "glTexCoord3iv\0"
+    "glTexCoord3s\0"
+    "glTexCoord3sv\0"
+    "glTexCoord4d\0"
+    "glTexCoord4dv\0"
+    "glTexCoord4f\0"
+    "glTexCoord4fv\0"
+    "glTexCoord4i\0"
+    "glTexCoord4iv\0"
+    "glTexCoord4s\0"
+    "glTexCoord4sv\0"
+    "glTexCoordP1ui\0"
+    "glTexCoordP1uiv\0"
+    "glTexCoordP2ui\0"
+    "glTexCoordP2uiv\0"
+    "glTexCoordP3ui\0"
+    "glTexCoordP3uiv\0"
+    "glTexCoordP4ui\0"
+    "glTexCoordP4uiv\0"
+    "glTexCoordPointer\0"
+    "glTexEnvf\0"
+    "glTexEnvfv\0"
+    "glTexEnvi\0"
+    "glTexEnviv\0"
+    "glTexEnvx\0"
+    "glTexEnvxv\0"
+    "glTexGend\0"
+    "glTexGendv\0"
+    "glTexGenf\0"
+    "glTexGenfOES\0"
+    "glTexGenfv\0"
+    "glTexGenfvOES\0"
+    "glTexGeni\0"
+    "glTexGeniOES\0"
+    "glTexGeniv\0"
+    "glTexGenivOES\0"
+    "glTexGenxOES\0"
+    "glTexGenxvOES\0"
+    "glTexImage1D\0"
+    "glTexImage2D\0"
+    "glTexImage2DExternalANGLE\0"
+    "glTexImage2DMultisample\0"
+    "glTexImage2DRobustANGLE\0"
+    "glTexImage3D\0"
+    "glTexImage3DMultisample\0"
+    "glTexImage3DOES\0"
+    "glTexImage3DRobustANGLE\0"
+    "glTexParameterIiv\0"
+    "glTexParameterIivOES\0"
+    "glTexParameterIivRobustANGLE\0"
+    "glTexParameterIuiv\0"
+    "glTexParameterIuivOES\0"
+    "glTexParameterIuivRobustANGLE\0"
+    "glTexParameterf\0"
+    "glTexParameterfv\0"
+    "glTexParameterfvRobustANGLE\0"
+    "glTexParameteri\0"
+    "glTexParameteriv\0"
+    "glTexParameterivRobustANGLE\0"
+    "glTexParameterx\0"
+    "glTexParameterxv\0"
+    "glTexStorage1D\0"
+    "glTexStorage1DEXT\0"
+    "glTexStorage2D\0"
+    "glTexStorage2DEXT\0"
+    "glTexStorage2DMultisample\0"
+    "glTexStorage2DMultisampleANGLE\0"
+    "glTexStorage3D\0"
+    "glTexStorage3DEXT\0"
+    "glTexStorage3DMultisample\0"
+    "glTexStorage3DMultisampleOES\0"
+    "glTexStorageMem2DEXT\0"
+    "glTexStorageMem2DMultisampleEXT\0"
+    "glTexStorageMem3DEXT\0"
+    "glTexStorageMem3DMultisampleEXT\0"
+    "glTexSubImage1D\0"
+    "glTexSubImage2D\0"
+    "glTexSubImage2DRobustANGLE\0"
+    "glTexSubImage3D\0"
+    "glTexSubImage3DOES\0"
+    "glTexSubImage3DRobustANGLE\0"
+    "glTextureBarrier\0"
+    "glTextureBuffer\0"
+    "glTextureBufferRange\0"
+    "glTextureParameterIiv\0"
+    "glTextureParameterIuiv\0"
+    "glTextureParameterf\0"
+    "glTextureParameterfv\0"
+    "glTextureParameteri\0"
+    "glTextureParameteriv\0"
+    "glTextureStorage1D\0"
+    "glTextureStorage2D\0"
+    "glTextureStorage2DMultisample\0"
+    "glTextureStorage3D\0"
+    "glTextureStorage3DMultisample\0"
+    "glTextureSubImage1D\0"
+    "glTextureSubImage2D\0"
+    "glTextureSubImage3D\0"
+    "glTextureView\0"
+    "glTransformFeedbackBufferBase\0"
+    "glTransformFeedbackBufferRange\0"
+    "glTransformFeedbackVaryings\0"
+    "glTranslated\0"
+    "glTranslatef\0"
+    "glTranslatex\0"
+    "glUniform1d\0"
+    "glUniform1dv\0"
+    "glUniform1f\0"
+    "glUniform1fv\0"
+    "glUniform1i\0"
+    "glUniform1iv\0"
+    "glUniform1ui\0"
+    "glUniform1uiv\0"
+    "glUniform2d\0"
+    "glUniform2dv\0"
+    "glUniform2f\0"
+    "glUniform2fv\0"
+    "glUniform2i\0"
+    "glUniform2iv\0"
+    "glUniform2ui\0"
+    "glUniform2uiv\0"
+    "glUniform3d\0"
+    "glUniform3dv\0"
+    "glUniform3f\0"
+    "glUniform3fv\0"
+    "glUniform3i\0"
+    "glUniform3iv\0"
+    "glUniform3ui\0"
+    "glUniform3uiv\0"
+    "glUniform4d\0"
+    "glUniform4dv\0"
+    "glUniform4f\0"
+    "glUniform4fv\0"
+    "glUniform4i\0"
+    "glUniform4iv\0"
+    "glUniform4ui\0"
+    "glUniform4uiv\0"
+    "glUniformBlockBinding\0"
+    "glUniformMatrix2dv\0"
+    "glUniformMatrix2fv\0"
+    "glUniformMatrix2x3dv\0"
+    "glUniformMatrix2x3fv\0"
+    "glUniformMatrix2x4dv\0"
+    "glUniformMatrix2x4fv\0"
+    "glUniformMatrix3dv\0"
+    "glUniformMatrix3fv\0"
+    "glUniformMatrix3x2dv\0"
+    "glUniformMatrix3x2fv\0"
+    "glUniformMatrix3x4dv\0"
+    "glUniformMatrix3x4fv\0"
+    "glUniformMatrix4dv\0"
+    "glUniformMatrix4fv\0"
+    "glUniformMatrix4x2dv\0"
+    "glUniformMatrix4x2fv\0"
+    "glUniformMatrix4x3dv\0"
+    "glUniformMatrix4x3fv\0"
+    "glUniformSubroutinesuiv\0"
+    "glUnmapBuffer\0"
+    "glUnmapBufferOES\0"
+    "glUnmapNamedBuffer\0"
+    "glUseProgram\0"
+    "glUseProgramStages\0"
+    "glValidateProgram\0"
+    "glValidateProgramPipeline\0"
+    "glVertex2d\0"
+    "glVertex2dv\0"
+    "glVertex2f\0"
+    "glVertex2fv\0"
+    "glVertex2i\0"
+    "glVertex2iv\0"
+    "glVertex2s\0"
+    "glVertex2sv\0"
+    "glVertex3d\0"
+    "glVertex3dv\0"
+    "glVertex3f\0"
+    "glVertex3fv\0"
+    "glVertex3i\0"
+    "glVertex3iv\0"
+    "glVertex3s\0"
+    "glVertex3sv\0"
+    "glVertex4d\0"
+    "glVertex4dv\0"
+    "glVertex4f\0"
+    "glVertex4fv\0"
+    "glVertex4i\0"
+    "glVertex4iv\0"
+    "glVertex4s\0"
+    "glVertex4sv\0"
+    "glVertexArrayAttribBinding\0"
+    "glVertexArrayAttribFormat\0"
+    "glVertexArrayAttribIFormat\0"
+    "glVertexArrayAttribLFormat\0"
+    "glVertexArrayBindingDivisor\0"
+    "glVertexArrayElementBuffer\0"
+    "glVertexArrayVertexBuffer\0"
+    "glVertexArrayVertexBuffers\0"
+    "glVertexAttrib1d\0"
+    "glVertexAttrib1dv\0"
+    "glVertexAttrib1f\0"
+    "glVertexAttrib1fv\0"
+    "glVertexAttrib1s\0"
+    "glVertexAttrib1sv\0"
+    "glVertexAttrib2d\0"
+    "glVertexAttrib2dv\0"
+    "glVertexAttrib2f\0"
+    "glVertexAttrib2fv\0"
+    "glVertexAttrib2s\0"
+    "glVertexAttrib2sv\0"
+    "glVertexAttrib3d\0"
+    "glVertexAttrib3dv\0"
+    "glVertexAttrib3f\0"
+    "glVertexAttrib3fv\0"
+    "glVertexAttrib3s\0"
+    "glVertexAttrib3sv\0"
+    "glVertexAttrib4Nbv\0"
+    "glVertexAttrib4Niv\0"
+    "glVertexAttrib4Nsv\0"
+    "glVertexAttrib4Nub\0"
+    "glVertexAttrib4Nubv\0"
+    "glVertexAttrib4Nuiv\0"
+    "glVertexAttrib4Nusv\0"
+    "glVertexAttrib4bv\0"
+    "glVertexAttrib4d\0"
+    "glVertexAttrib4dv\0"
+    "glVertexAttrib4f\0"
+    "glVertexAttrib4fv\0"
+    "glVertexAttrib4iv\0"
+    "glVertexAttrib4s\0"
+    "glVertexAttrib4sv\0"
+    "glVertexAttrib4ubv\0"
+    "glVertexAttrib4uiv\0"
+    "glVertexAttrib4usv\0"
+    "glVertexAttribBinding\0"
+    "glVertexAttribDivisor\0"
+    "glVertexAttribDivisorANGLE\0"
+    "glVertexAttribDivisorEXT\0"
+    "glVertexAttribFormat\0"
+    "glVertexAttribI1i\0"
+    "glVertexAttribI1iv\0"
+    "glVertexAttribI1ui\0"
+    "glVertexAttribI1uiv\0"
+    "glVertexAttribI2i\0"
+    "glVertexAttribI2iv\0"
+    "glVertexAttribI2ui\0"
+    "glVertexAttribI2uiv\0"
+    "glVertexAttribI3i\0"
+    "glVertexAttribI3iv\0"
+    "glVertexAttribI3ui\0"
+    "glVertexAttribI3uiv\0"
+    "glVertexAttribI4bv\0"
+    "glVertexAttribI4i\0"
+    "glVertexAttribI4iv\0"
+    "glVertexAttribI4sv\0"
+    "glVertexAttribI4ubv\0"
+    "glVertexAttribI4ui\0"
+    "glVertexAttribI4uiv\0"
+    "glVertexAttribI4usv\0"
+    "glVertexAttribIFormat\0"
+    "glVertexAttribIPointer\0"
+    "glVertexAttribL1d\0"
+    "glVertexAttribL1dv\0"
+    "glVertexAttribL2d\0"
+    "glVertexAttribL2dv\0"
+    "glVertexAttribL3d\0"
+    "glVertexAttribL3dv\0"
+    "glVertexAttribL4d\0"
+    "glVertexAttribL4dv\0"
+    "glVertexAttribLFormat\0"
+    "glVertexAttribLPointer\0"
+    "glVertexAttribP1ui\0"
+    "glVertexAttribP1uiv\0"
+    "glVertexAttribP2ui\0"
+    "glVertexAttribP2uiv\0"
+    "glVertexAttribP3ui\0"
+    "glVertexAttribP3uiv\0"
+    "glVertexAttribP4ui\0"
+    "glVertexAttribP4uiv\0"
+    "glVertexAttribPointer\0"
+    "glVertexBindingDivisor\0"
+    "glVertexP2ui\0"
+    "glVertexP2uiv\0"
+    "glVertexP3ui\0"
+    "glVertexP3uiv\0"
+    "glVertexP4ui\0"
+    "glVertexP4uiv\0"
+    "glVertexPointer\0"
+    "glViewport\0"
+    "glViewportArrayv\0"
+    "glViewportIndexedf\0"
+    "glViewportIndexedfv\0"
+    "glWaitSemaphoreEXT\0"
+    "glWaitSync\0"
+    "glWeightPointerOES\0"
+    "glWindowPos2d\0"
+    "glWindowPos2dv\0"
+    "glWindowPos2f\0"
+    "glWindowPos2fv\0"
+    "glWindowPos2i\0"
+    "glWindowPos2iv\0"
+    "glWindowPos2s\0"
+    "glWindowPos2sv\0"
+    "glWindowPos3d\0"
+    "glWindowPos3dv\0"
+    "glWindowPos3f\0"
+    "glWindowPos3fv\0"
+    "glWindowPos3i\0"
+    "glWindowPos3iv\0"
+    "glWindowPos3s\0"
+    "glWindowPos3sv\0";
+
+// The offset of each name in kEntryPointNames, indexed by EntryPoint.
+constexpr uint32_t kEntryPointNameOffsets[] = {
+    0, 8, 30, 46, 58, 71, 93, 108, 123, 131, 156, 169,
+    185, 205, 230, 251, 264, 281, 299, 317, 336, 359, 385, 415,
+    448, 484, 502, 523, 542, 562, 584, 603, 625, 639, 654, 668,
+    686, 701, 725, 755, 773, 794, 813, 833, 842, 855, 871, 895,
+    920, 937, 949, 969, 990, 1003, 1021, 1044, 1067, 1080, 1096, 1118,
+    1134, 1145, 1157, 1182, 1210, 1240, 1253, 1261, 1274, 1292, 1313, 1329,
+    1345, 1361, 1378, 1391, 1405, 1418, 1432, 1446, 1459, 1482, 1508, 1534,
+    1560, 1586, 1613, 1628, 1644, 1663, 1685, 1702, 1716, 1728, 1741, 1754,
+    1764, 1775, 1785, 1796, 1806, 1817, 1827, 1838, 1848, 1859, 1870, 1882,
+    1893, 1905, 1916, 1928, 1938, 1949, 1959, 1970, 1980, 1991, 2001, 2012,
+    2022, 2033, 2044, 2056, 2067, 2079, 2090, 2102, 2112, 2124, 2137, 2153,
+    2165, 2178, 2190, 2203, 2218, 2234, 2266, 2289, 2312, 2346, 2369, 2395,
+    2429, 2455, 2481, 2518, 2544, 2573, 2610, 2640, 2670, 2700, 2720, 2739,
+    2764, 2777, 2801, 2826, 2843, 2860, 2880, 2900, 2920, 2943, 2964, 2986,
+    3010, 3034, 3058, 3082, 3115, 3141, 3176, 3205, 3221, 3242, 3267, 3283,
+    3308, 3324, 3346, 3363, 3378, 3401, 3418, 3445, 3466, 3477, 3503, 3526,
+    3552, 3574, 3599, 3620, 3644, 3660, 3677, 3698, 3722, 3736, 3761, 3783,
+    3799, 3824, 3840, 3859, 3881, 3906, 3923, 3945, 3960, 3973, 3990, 4017,
+    4038, 4062, 4074, 4086, 4099, 4118, 4138, 4152, 4166, 4181, 4191, 4212,
+    4239, 4266, 4277, 4301, 4319, 4345, 4358, 4379, 4401, 4428, 4462, 4501,
+    4526, 4539, 4553, 4570, 4585, 4610, 4633, 4657, 4686, 4722, 4756, 4802,
+    4853, 4880, 4893, 4913, 4943, 4957, 4972, 4986, 5001, 5015, 5030, 5044,
+    5059, 5083, 5116, 5146, 5185, 5224, 5253, 5264, 5282, 5294, 5303, 5323,
+    5349, 5375, 5385, 5391, 5414, 5424, 5435, 5449, 5467, 5490, 5504, 5519,
+    5533, 5548, 5562, 5577, 5591, 5606, 5618, 5630, 5643, 5656, 5673, 5685,
+    5694, 5710, 5718, 5743, 5771, 5801, 5819, 5831, 5844, 5856, 5869, 5876,
+    5884, 5891, 5899, 5906, 5914, 5938, 5964, 5993, 6014, 6037, 6060, 6086,
+    6109, 6135, 6159, 6185, 6218, 6230, 6240, 6251, 6262, 6275, 6289, 6307,
+    6328, 6339, 6358, 6380, 6393, 6409, 6428, 6450, 6464, 6483, 6497, 6521,
+    6539, 6560, 6577, 6597, 6621, 6654, 6672, 6698, 6731, 6762, 6781, 6809,
+    6835, 6872, 6895, 6917, 6938, 6958, 6974, 7001, 7015, 7040, 7065, 7101,
+    7124, 7158, 7178, 7201, 7232, 7251, 7266, 7282, 7298, 7322, 7350, 7381,
+    7402, 7426, 7441, 7454, 7465, 7480, 7492, 7506, 7518, 7541, 7560, 7582,
+    7604, 7642, 7683, 7732, 7760, 7799, 7824, 7852, 7870, 7899, 7915, 7942,
+    7958, 7985, 7999, 8024, 8048, 8070, 8103, 8116, 8129, 8142, 8153, 8164,
+    8175, 8191, 8207, 8223, 8255, 8274, 8298, 8328, 8358, 8386, 8411, 8435,
+    8478, 8511, 8545, 8562, 8582, 8602, 8625, 8654, 8683, 8699, 8716, 8733,
+    8747, 8764, 8800, 8820, 8839, 8861, 8881, 8905, 8940, 8968, 8991, 9017,
+    9046, 9080, 9117, 9142, 9165, 9185, 9200, 9226, 9253, 9278, 9306, 9332,
+    9352, 9373, 9397, 9429, 9448, 9470, 9500, 9522, 9547, 9580, 9600, 9623,
+    9654, 9667, 9683, 9707, 9736, 9768, 9808, 9833, 9861, 9897, 9923, 9952,
+    9989, 10013, 10048, 10072, 10107, 10139, 10158, 10185, 10203, 10217, 10242, 10254,
+    10267, 10288, 10319, 10331, 10345, 10359, 10373, 10387, 10401, 10418, 10432, 10449,
+    10466, 10480, 10505, 10535, 10571, 10596, 10626, 10662, 10683, 10707, 10739, 10761,
+    10786, 10819, 10839, 10870, 10890, 10921, 10941, 10959, 10988, 11017, 11042, 11068,
+    11092, 11116, 11137, 11167, 11195, 11221, 11246, 11279, 11302, 11322, 11343, 11369,
+    11384, 11399, 11425, 11440, 11466, 11482, 11509, 11533, 11555, 11583, 11609, 11628,
+    11649, 11681, 11703, 11736, 11757, 11783, 11820, 11840, 11860, 11891, 11911, 11942,
+    11959, 11984, 12008, 12024, 12036, 12048, 12060, 12073, 12090, 12108, 12126, 12147,
+    12169, 12184, 12200, 12216, 12235, 12262, 12278, 12297, 12324, 12341, 12369, 12376,
+    12396, 12419, 12431, 12446, 12455, 12465, 12474, 12484, 12493, 12503, 12512, 12522,
+    12532, 12543, 12555, 12578, 12598, 12608, 12631, 12657, 12681, 12714, 12750, 12777,
+    12798, 12822, 12847, 12858, 12870, 12883, 12895, 12911, 12930, 12939, 12959, 12976,
+    12988, 13008, 13018, 13031, 13048, 13068, 13080, 13097, 13108, 13117, 13129, 13151,
+    13167, 13186, 13200, 13215, 13229, 13244, 13258, 13273, 13282, 13292, 13301, 13311,
+    13320, 13330, 13344, 13356, 13369, 13383, 13394, 13409, 13423, 13437, 13451, 13462,
+    13498, 13521, 13544, 13554, 13576, 13584, 13592, 13600, 13608, 13620, 13635, 13652,
+    13672, 13684, 13696, 13708, 13720, 13737, 13759, 13771, 13784, 13796, 13809, 13821,
+    13834, 13858, 13887, 13909, 13922, 13952, 13968, 13992, 14021, 14040, 14054, 14068,
+    14082, 14105, 14128, 14146, 14169, 14195, 14226, 14258, 14302, 14322, 14347, 14377,
+    14405, 14438, 14472, 14528, 14546, 14565, 14583, 14602, 14620, 14639, 14657, 14676,
+    14694, 14713, 14731, 14750, 14768, 14787, 14805, 14824, 14842, 14861, 14879, 14898,
+    14916, 14935, 14953, 14972, 14990, 15009, 15027, 15046, 15064, 15083, 15101, 15120,
+    15138, 15158, 15179, 15199, 15220, 15240, 15261, 15281, 15302, 15320, 15341, 15362,
+    15391, 15421, 15450, 15479, 15510, 15536, 15567, 15594, 15632, 15642, 15653, 15665,
+    15676, 15688, 15699, 15711, 15722, 15734, 15745, 15757, 15768, 15781, 15795, 15811,
+    15825, 15842, 15859, 15879, 15887, 15896, 15905, 15919, 15938, 15956, 15979, 16004,
+    16029, 16055, 16080, 16093, 16107, 16121, 16135, 16149, 16166, 16183, 16195, 16213,
+    16232, 16250, 16269, 16287, 16306, 16318, 16340, 16353, 16367, 16383, 16404, 16421,
+    16438, 16450, 16468, 16484, 16503, 16523, 16535, 16545, 16569, 16590, 16606, 16625,
+    16645, 16683, 16702, 16722, 16741, 16761, 16780, 16800, 16820, 16841, 16860, 16880,
+    16899, 16919, 16938, 16958, 16978, 16999, 17018, 17038, 17057, 17077, 17096, 17116,
+    17136, 17157, 17176, 17196, 17215, 17235, 17254, 17274, 17294, 17315, 17341, 17367,
+    17395, 17423, 17451, 17479, 17505, 17531, 17559, 17587, 17615, 17643, 17669, 17695,
+    17723, 17751, 17779, 17807, 17825, 17848, 17861, 17880, 17897, 17917, 17938, 17951,
+    17962, 17977, 17995, 18013, 18027, 18042, 18056, 18071, 18085, 18100, 18114, 18129,
+    18143, 18158, 18172, 18187, 18201, 18216, 18230, 18245, 18259, 18274, 18288, 18303,
+    18317, 18332, 18346, 18361, 18374, 18387, 18411, 18425, 18442, 18467, 18475, 18484,
+    18492, 18501, 18509, 18518, 18526, 18535, 18559, 18572, 18594, 18627, 18665, 18690,
+    18714, 18740, 18750, 18760, 18770, 18787, 18805, 18819, 18838, 18860, 18885, 18918,
+    18941, 18967, 19001, 19021, 19042, 19074, 19094, 19115, 19147, 19156, 19165, 19174,
+    19184, 19200, 19217, 19235, 19254, 19274, 19293, 19313, 19332, 19352, 19371, 19391,
+    19410, 19430, 19450, 19471, 19491, 19512, 19532, 19553, 19574, 19596, 19620, 19635,
+    19664, 19677, 19690, 19705, 19720, 19748, 19769, 19788, 19814, 19849, 19863, 19885,
+    19899, 19921, 19933, 19953, 19981, 20018, 20053, 20097, 20134, 20180, 20194, 20206,
+    20223, 20236, 20250, 20263, 20277, 20290, 20304, 20317, 20331, 20344, 20358, 20371,
+    20385, 20398, 20412, 20425, 20439, 20452, 20466, 20479, 20493, 20506, 20520, 20533,
+    20547, 20560, 20574, 20587, 20601, 20614, 20628, 20641, 20655, 20670, 20686, 20701,
+    20717, 20732, 20748, 20763, 20779, 20797, 20807, 20818, 20828, 20839, 20849, 20860,
+    20870, 20881, 20891, 20904, 20915, 20929, 20939, 20952, 20963, 20977, 20990, 21004,
+    21017, 21030, 21056, 21080, 21104, 21117, 21141, 21157, 21181, 21199, 21220, 21249,
+    21268, 21290, 21320, 21336, 21353, 21381, 21397, 21414, 21442, 21458, 21475, 21490,
+    21508, 21523, 21541, 21567, 21598, 21613, 21631, 21657, 21686, 21707, 21739, 21760,
+    21792, 21808, 21824, 21851, 21867, 21886, 21913, 21930, 21946, 21967, 21989, 22012,
+    22032, 22053, 22073, 22094, 22113, 22132, 22162, 22181, 22211, 22231, 22251, 22271,
+    22285, 22315, 22346, 22374, 22387, 22400, 22413, 22425, 22438, 22450, 22463, 22475,
+    22488, 22501, 22515, 22527, 22540, 22552, 22565, 22577, 22590, 22603, 22617, 22629,
+    22642, 22654, 22667, 22679, 22692, 22705, 22719, 22731, 22744, 22756, 22769, 22781,
+    22794, 22807, 22821, 22843, 22862, 22881, 22902, 22923, 22944, 22965, 22984, 23003,
+    23024, 23045, 23066, 23087, 23106, 23125, 23146, 23167, 23188, 23209, 23233, 23247,
+    23264, 23283, 23296, 23315, 23333, 23359, 23370, 23382, 23393, 23405, 23416, 23428,
+    23439, 23451, 23462, 23474, 23485, 23497, 23508, 23520, 23531, 23543, 23554, 23566,
+    23577, 23589, 23600, 23612, 23623, 23635, 23662, 23688, 23715, 23742, 23770, 23797,
+    23823, 23850, 23867, 23885, 23902, 23920, 23937, 23955, 23972, 23990, 24007, 24025,
+    24042, 24060, 24077, 24095, 24112, 24130, 24147, 24165, 24184, 24203, 24222, 24241,
+    24261, 24281, 24301, 24319, 24336, 24354, 24371, 24389, 24407, 24424, 24442, 24461,
+    24480, 24499, 24521, 24543, 24570, 24595, 24616, 24634, 24653, 24672, 24692, 24710,
+    24729, 24748, 24768, 24786, 24805, 24824, 24844, 24863, 24881, 24900, 24919, 24939,
+    24958, 24978, 24998, 25020, 25043, 25061, 25080, 25098, 25117, 25135, 25154, 25172,
+    25191, 25213, 25236, 25255, 25275, 25294, 25314, 25333, 25353, 25372, 25392, 25414,
+    25437, 25450, 25464, 25477, 25491, 25504, 25518, 25534, 25545, 25562, 25581, 25601,
+    25620, 25631, 25650, 25664, 25679, 25693, 25708, 25722, 25737, 25751, 25766, 25780,
+    25795, 25809, 25824, 25838, 25853, 25867,
+};
+// clang-format on
+}  // anonymous namespace
+
 const char *GetEntryPointName(EntryPoint ep)
 {
-    switch (ep)
+    size_t index = static_cast<size_t>(ep);
+    if (index >= ArraySize(kEntryPointNameOffsets))
     {
-        case EntryPoint::Accum:
-            return "glAccum";
-        case EntryPoint::ActiveShaderProgram:
-            return "glActiveShaderProgram";
-        case EntryPoint::ActiveTexture:
-            return "glActiveTexture";
-        case EntryPoint::AlphaFunc:
-            return "glAlphaFunc";
-        case EntryPoint::AlphaFuncx:
-            return "glAlphaFuncx";
-        case EntryPoint::AreTexturesResident:
-            return "glAreTexturesResident";
-        case EntryPoint::ArrayElement:
-            return "glArrayElement";
-        case EntryPoint::AttachShader:
-            return "glAttachShader";
-        case EntryPoint::Begin:
-            return "glBegin";
-        case EntryPoint::BeginConditionalRender:
-            return "glBeginConditionalRender";
-        case EntryPoint::BeginQuery:
-            return "glBeginQuery";
-        case EntryPoint::BeginQueryEXT:
-            return "glBeginQueryEXT";
-        case EntryPoint::BeginQueryIndexed:
-            return "glBeginQueryIndexed";
-        case EntryPoint::BeginTransformFeedback:
-            return "glBeginTransformFeedback";
-        case EntryPoint::BindAttribLocation:
-            return "glBindAttribLocation";
-        case EntryPoint::BindBuffer:
-            return "glBindBuffer";
-        case EntryPoint::BindBufferBase:
-            return "glBindBufferBase";
-        case EntryPoint::BindBufferRange:
-            return "glBindBufferRange";
-        case EntryPoint::BindBuffersBase:
-            return "glBindBuffersBase";
-        case EntryPoint::BindBuffersRange:
-            return "glBindBuffersRange";
-        case EntryPoint::BindFragDataLocation:
-            return "glBindFragDataLocation";
-        case EntryPoint::BindFragDataLocationEXT:
-            return "glBindFragDataLocationEXT";
-        case EntryPoint::BindFragDataLocationIndexed:
-            return "glBindFragDataLocationIndexed";
-        case EntryPoint::BindFragDataLocationIndexedEXT:
-            return "glBindFragDataLocationIndexedEXT";
-        case EntryPoint::BindFragmentInputLocationCHROMIUM:
-            return "glBindFragmentInputLocationCHROMIUM";
-        case EntryPoint::BindFramebuffer:
-            return "glBindFramebuffer";
-        case EntryPoint::BindFramebufferOES:
-            return "glBindFramebufferOES";
-        case EntryPoint::BindImageTexture:
-            return "glBindImageTexture";
-        case EntryPoint::BindImageTextures:
-            return "glBindImageTextures";
-        case EntryPoint::BindProgramPipeline:
-            return "glBindProgramPipeline";
-        case EntryPoint::BindRenderbuffer:
-            return "glBindRenderbuffer";
-        case EntryPoint::BindRenderbufferOES:
-            return "glBindRenderbufferOES";
-        case EntryPoint::BindSampler:
-            return "glBindSampler";
-        case EntryPoint::BindSamplers:
-            return "glBindSamplers";
-        case EntryPoint::BindTexture:
-            return "glBindTexture";
-        case EntryPoint::BindTextureUnit:
-            return "glBindTextureUnit";
-        case EntryPoint::BindTextures:
-            return "glBindTextures";
-        case EntryPoint::BindTransformFeedback:
-            return "glBindTransformFeedback";
-        case EntryPoint::BindUniformLocationCHROMIUM:
-            return "glBindUniformLocationCHROMIUM";
-        case EntryPoint::BindVertexArray:
-            return "glBindVertexArray";
-        case EntryPoint::BindVertexArrayOES:
-            return "glBindVertexArrayOES";
-        case EntryPoint::BindVertexBuffer:
-            return "glBindVertexBuffer";
-        case EntryPoint::BindVertexBuffers:
-            return "glBindVertexBuffers";
-        case EntryPoint::Bitmap:
-            return "glBitmap";
-        case EntryPoint::BlendColor:
-            return "glBlendColor";
-        case EntryPoint::BlendEquation:
-            return "glBlendEquation";
-        case EntryPoint::BlendEquationSeparate:
-            return "glBlendEquationSeparate";
-        case EntryPoint::BlendEquationSeparatei:
-            return "glBlendEquationSeparatei";
-        case EntryPoint::BlendEquationi:
-            return "glBlendEquationi";
-        case EntryPoint::BlendFunc:
-            return "glBlendFunc";
-        case EntryPoint::BlendFuncSeparate:
-            return "glBlendFuncSeparate";
-        case EntryPoint::BlendFuncSeparatei:
-            return "glBlendFuncSeparatei";
-        case EntryPoint::BlendFunci:
-            return "glBlendFunci";
-        case EntryPoint::BlitFramebuffer:
-            return "glBlitFramebuffer";
-        case EntryPoint::BlitFramebufferANGLE:
-            return "glBlitFramebufferANGLE";
-        case EntryPoint::BlitNamedFramebuffer:
-            return "glBlitNamedFramebuffer";
-        case EntryPoint::BufferData:
-            return "glBufferData";
-        case EntryPoint::BufferStorage:
-            return "glBufferStorage";
-        case EntryPoint::BufferStorageMemEXT:
-            return "glBufferStorageMemEXT";
-        case EntryPoint::BufferSubData:
-            return "glBufferSubData";
-        case EntryPoint::CallList:
-            return "glCallList";
-        case EntryPoint::CallLists:
-            return "glCallLists";
-        case EntryPoint::CheckFramebufferStatus:
-            return "glCheckFramebufferStatus";
-        case EntryPoint::CheckFramebufferStatusOES:
-            return "glCheckFramebufferStatusOES";
-        case EntryPoint::CheckNamedFramebufferStatus:
-            return "glCheckNamedFramebufferStatus";
-        case EntryPoint::ClampColor:
-            return "glClampColor";
-        case EntryPoint::Clear:
-            return "glClear";
-        case EntryPoint::ClearAccum:
-            return "glClearAccum";
-        case EntryPoint::ClearBufferData:
-            return "glClearBufferData";
-        case EntryPoint::ClearBufferSubData:
-            return "glClearBufferSubData";
-        case EntryPoint::ClearBufferfi:
-            return "glClearBufferfi";
-        case EntryPoint::ClearBufferfv:
-            return "glClearBufferfv";
-        case EntryPoint::ClearBufferiv:
-            return "glClearBufferiv";
-        case EntryPoint::ClearBufferuiv:
-            return "glClearBufferuiv";
-        case EntryPoint::ClearColor:
-            return "glClearColor";
-        case EntryPoint::ClearColorx:
-            return "glClearColorx";
-        case EntryPoint::ClearDepth:
-            return "glClearDepth";
-        case EntryPoint::ClearDepthf:
-            return "glClearDepthf";
-        case EntryPoint::ClearDepthx:
-            return "glClearDepthx";
-        case EntryPoint::ClearIndex:
-            return "glClearIndex";
-        case EntryPoint::ClearNamedBufferData:
-            return "glClearNamedBufferData";
-        case EntryPoint::ClearNamedBufferSubData:
-            return "glClearNamedBufferSubData";
-        case EntryPoint::ClearNamedFramebufferfi:
-            return "glClearNamedFramebufferfi";
-        case EntryPoint::ClearNamedFramebufferfv:
-            return "glClearNamedFramebufferfv";
-        case EntryPoint::ClearNamedFramebufferiv:
-            return "glClearNamedFramebufferiv";
-        case EntryPoint::ClearNamedFramebufferuiv:
-            return "glClearNamedFramebufferuiv";
-        case EntryPoint::ClearStencil:
-            return "glClearStencil";
-        case EntryPoint::ClearTexImage:
-            return "glClearTexImage";
-        case EntryPoint::ClearTexSubImage:
-            return "glClearTexSubImage";
-        case EntryPoint::ClientActiveTexture:
-            return "glClientActiveTexture";
-        case EntryPoint::ClientWaitSync:
-            return "glClientWaitSync";
-        case EntryPoint::ClipControl:
-            return "glClipControl";
-        case EntryPoint::ClipPlane:
-            return "glClipPlane";
-        case EntryPoint::ClipPlanef:
-            return "glClipPlanef";
-        case EntryPoint::ClipPlanex:
-            return "glClipPlanex";
-        case EntryPoint::Color3b:
-            return "glColor3b";
-        case EntryPoint::Color3bv:
-            return "glColor3bv";
-        case EntryPoint::Color3d:
-            return "glColor3d";
-        case EntryPoint::Color3dv:
-            return "glColor3dv";
-        case EntryPoint::Color3f:
-            return "glColor3f";
-        case EntryPoint::Color3fv:
-            return "glColor3fv";
-        case EntryPoint::Color3i:
-            return "glColor3i";
-        case EntryPoint::Color3iv:
-            return "glColor3iv";
-        case EntryPoint::Color3s:
-            return "glColor3s";
-        case EntryPoint::Color3sv:
-            return "glColor3sv";
-        case EntryPoint::Color3ub:
-            return "glColor3ub";
-        case EntryPoint::Color3ubv:
-            return "glColor3ubv";
-        case EntryPoint::Color3ui:
-            return "glColor3ui";
-        case EntryPoint::Color3uiv:
-            return "glColor3uiv";
-        case EntryPoint::Color3us:
-            return "glColor3us";
-        case EntryPoint::Color3usv:
-            return "glColor3usv";
-        case EntryPoint::Color4b:
-            return "glColor4b";
-        case EntryPoint::Color4bv:
-            return "glColor4bv";
-        case EntryPoint::Color4d:
-            return "glColor4d";
-        case EntryPoint::Color4dv:
-            return "glColor4dv";
-        case EntryPoint::Color4f:
-            return "glColor4f";
-        case EntryPoint::Color4fv:
-            return "glColor4fv";
-        case EntryPoint::Color4i:
-            return "glColor4i";
-        case EntryPoint::Color4iv:
-            return "glColor4iv";
-        case EntryPoint::Color4s:
-            return "glColor4s";
-        case EntryPoint::Color4sv:
-            return "glColor4sv";
-        case EntryPoint::Color4ub:
-            return "glColor4ub";
-        case EntryPoint::Color4ubv:
-            return "glColor4ubv";
-        case EntryPoint::Color4ui:
-            return "glColor4ui";
-        case EntryPoint::Color4uiv:
-            return "glColor4uiv";
-        case EntryPoint::Color4us:
-            return "glColor4us";
-        case EntryPoint::Color4usv:
-            return "glColor4usv";
-        case EntryPoint::Color4x:
-            return "glColor4x";
-        case EntryPoint::ColorMask:
-            return "glColorMask";
-        case EntryPoint::ColorMaski:
-            return "glColorMaski";
-        case EntryPoint::ColorMaterial:
-            return "glColorMaterial";
-        case EntryPoint::ColorP3ui:
-            return "glColorP3ui";
-        case EntryPoint::ColorP3uiv:
-            return "glColorP3uiv";
-        case EntryPoint::ColorP4ui:
-            return "glColorP4ui";
-        case EntryPoint::ColorP4uiv:
-            return "glColorP4uiv";
-        case EntryPoint::ColorPointer:
-            return "glColorPointer";
-        case EntryPoint::CompileShader:
-            return "glCompileShader";
-        case EntryPoint::CompressedCopyTextureCHROMIUM:
-            return "glCompressedCopyTextureCHROMIUM";
-        case EntryPoint::CompressedTexImage1D:
-            return "glCompressedTexImage1D";
-        case EntryPoint::CompressedTexImage2D:
-            return "glCompressedTexImage2D";
-        case EntryPoint::CompressedTexImage2DRobustANGLE:
-            return "glCompressedTexImage2DRobustANGLE";
-        case EntryPoint::CompressedTexImage3D:
-            return "glCompressedTexImage3D";
-        case EntryPoint::CompressedTexImage3DOES:
-            return "glCompressedTexImage3DOES";
-        case EntryPoint::CompressedTexImage3DRobustANGLE:
-            return "glCompressedTexImage3DRobustANGLE";
-        case EntryPoint::CompressedTexSubImage1D:
-            return "glCompressedTexSubImage1D";
-        case EntryPoint::CompressedTexSubImage2D:
-            return "glCompressedTexSubImage2D";
-        case EntryPoint::CompressedTexSubImage2DRobustANGLE:
-            return "glCompressedTexSubImage2DRobustANGLE";
-        case EntryPoint::CompressedTexSubImage3D:
-            return "glCompressedTexSubImage3D";
-        case EntryPoint::CompressedTexSubImage3DOES:
-            return "glCompressedTexSubImage3DOES";
-        case EntryPoint::CompressedTexSubImage3DRobustANGLE:
-            return "glCompressedTexSubImage3DRobustANGLE";
-        case EntryPoint::CompressedTextureSubImage1D:
-            return "glCompressedTextureSubImage1D";
-        case EntryPoint::CompressedTextureSubImage2D:
-            return "glCompressedTextureSubImage2D";
-        case EntryPoint::CompressedTextureSubImage3D:
-            return "glCompressedTextureSubImage3D";
-        case EntryPoint::CopyBufferSubData:
-            return "glCopyBufferSubData";
-        case EntryPoint::CopyImageSubData:
-            return "glCopyImageSubData";
-        case EntryPoint::CopyNamedBufferSubData:
-            return "glCopyNamedBufferSubData";
-        case EntryPoint::CopyPixels:
-            return "glCopyPixels";
-        case EntryPoint::CopySubTexture3DANGLE:
-            return "glCopySubTexture3DANGLE";
-        case EntryPoint::CopySubTextureCHROMIUM:
-            return "glCopySubTextureCHROMIUM";
-        case EntryPoint::CopyTexImage1D:
-            return "glCopyTexImage1D";
-        case EntryPoint::CopyTexImage2D:
-            return "glCopyTexImage2D";
-        case EntryPoint::CopyTexSubImage1D:
-            return "glCopyTexSubImage1D";
-        case EntryPoint::CopyTexSubImage2D:
-            return "glCopyTexSubImage2D";
-        case EntryPoint::CopyTexSubImage3D:
-            return "glCopyTexSubImage3D";
-        case EntryPoint::CopyTexSubImage3DOES:
-            return "glCopyTexSubImage3DOES";
-        case EntryPoint::CopyTexture3DANGLE:
-            return "glCopyTexture3DANGLE";
-        case EntryPoint::CopyTextureCHROMIUM:
-            return "glCopyTextureCHROMIUM";
-        case EntryPoint::CopyTextureSubImage1D:
-            return "glCopyTextureSubImage1D";
-        case EntryPoint::CopyTextureSubImage2D:
-            return "glCopyTextureSubImage2D";
-        case EntryPoint::CopyTextureSubImage3D:
-            return "glCopyTextureSubImage3D";
-        case EntryPoint::CoverFillPathCHROMIUM:
-            return "glCoverFillPathCHROMIUM";
-        case EntryPoint::CoverFillPathInstancedCHROMIUM:
-            return "glCoverFillPathInstancedCHROMIUM";
-        case EntryPoint::CoverStrokePathCHROMIUM:
-            return "glCoverStrokePathCHROMIUM";
-        case EntryPoint::CoverStrokePathInstancedCHROMIUM:
-            return "glCoverStrokePathInstancedCHROMIUM";
-        case EntryPoint::CoverageModulationCHROMIUM:
-            return "glCoverageModulationCHROMIUM";
-        case EntryPoint::CreateBuffers:
-            return "glCreateBuffers";
-        case EntryPoint::CreateFramebuffers:
-            return "glCreateFramebuffers";
-        case EntryPoint::CreateMemoryObjectsEXT:
-            return "glCreateMemoryObjectsEXT";
-        case EntryPoint::CreateProgram:
-            return "glCreateProgram";
-        case EntryPoint::CreateProgramPipelines:
-            return "glCreateProgramPipelines";
-        case EntryPoint::CreateQueries:
-            return "glCreateQueries";
-        case EntryPoint::CreateRenderbuffers:
-            return "glCreateRenderbuffers";
-        case EntryPoint::CreateSamplers:
-            return "glCreateSamplers";
-        case EntryPoint::CreateShader:
-            return "glCreateShader";
-        case EntryPoint::CreateShaderProgramv:
-            return "glCreateShaderProgramv";
-        case EntryPoint::CreateTextures:
-            return "glCreateTextures";
-        case EntryPoint::CreateTransformFeedbacks:
-            return "glCreateTransformFeedbacks";
-        case EntryPoint::CreateVertexArrays:
-            return "glCreateVertexArrays";
-        case EntryPoint::CullFace:
-            return "glCullFace";
-        case EntryPoint::CurrentPaletteMatrixOES:
-            return "glCurrentPaletteMatrixOES";
-        case EntryPoint::DebugMessageCallback:
-            return "glDebugMessageCallback";
-        case EntryPoint::DebugMessageCallbackKHR:
-            return "glDebugMessageCallbackKHR";
-        case EntryPoint::DebugMessageControl:
-            return "glDebugMessageControl";
-        case EntryPoint::DebugMessageControlKHR:
-            return "glDebugMessageControlKHR";
-        case EntryPoint::DebugMessageInsert:
-            return "glDebugMessageInsert";
-        case EntryPoint::DebugMessageInsertKHR:
-            return "glDebugMessageInsertKHR";
-        case EntryPoint::DeleteBuffers:
-            return "glDeleteBuffers";
-        case EntryPoint::DeleteFencesNV:
-            return "glDeleteFencesNV";
-        case EntryPoint::DeleteFramebuffers:
-            return "glDeleteFramebuffers";
-        case EntryPoint::DeleteFramebuffersOES:
-            return "glDeleteFramebuffersOES";
-        case EntryPoint::DeleteLists:
-            return "glDeleteLists";
-        case EntryPoint::DeleteMemoryObjectsEXT:
-            return "glDeleteMemoryObjectsEXT";
-        case EntryPoint::DeletePathsCHROMIUM:
-            return "glDeletePathsCHROMIUM";
-        case EntryPoint::DeleteProgram:
-            return "glDeleteProgram";
-        case EntryPoint::DeleteProgramPipelines:
-            return "glDeleteProgramPipelines";
-        case EntryPoint::DeleteQueries:
-            return "glDeleteQueries";
-        case EntryPoint::DeleteQueriesEXT:
-            return "glDeleteQueriesEXT";
-        case EntryPoint::DeleteRenderbuffers:
-            return "glDeleteRenderbuffers";
-        case EntryPoint::DeleteRenderbuffersOES:
-            return "glDeleteRenderbuffersOES";
-        case EntryPoint::DeleteSamplers:
-            return "glDeleteSamplers";
-        case EntryPoint::DeleteSemaphoresEXT:
-            return "glDeleteSemaphoresEXT";
-        case EntryPoint::DeleteShader:
-            return "glDeleteShader";
-        case EntryPoint::DeleteSync:
-            return "glDeleteSync";
-        case EntryPoint::DeleteTextures:
-            return "glDeleteTextures";
-        case EntryPoint::DeleteTransformFeedbacks:
-            return "glDeleteTransformFeedbacks";
-        case EntryPoint::DeleteVertexArrays:
-            return "glDeleteVertexArrays";
-        case EntryPoint::DeleteVertexArraysOES:
-            return "glDeleteVertexArraysOES";
-        case EntryPoint::DepthFunc:
-            return "glDepthFunc";
-        case EntryPoint::DepthMask:
-            return "glDepthMask";
-        case EntryPoint::DepthRange:
-            return "glDepthRange";
-        case EntryPoint::DepthRangeArrayv:
-            return "glDepthRangeArrayv";
-        case EntryPoint::DepthRangeIndexed:
-            return "glDepthRangeIndexed";
-        case EntryPoint::DepthRangef:
-            return "glDepthRangef";
-        case EntryPoint::DepthRangex:
-            return "glDepthRangex";
-        case EntryPoint::DetachShader:
-            return "glDetachShader";
-        case EntryPoint::Disable:
-            return "glDisable";
-        case EntryPoint::DisableClientState:
-            return "glDisableClientState";
-        case EntryPoint::DisableVertexArrayAttrib:
-            return "glDisableVertexArrayAttrib";
-        case EntryPoint::DisableVertexAttribArray:
-            return "glDisableVertexAttribArray";
-        case EntryPoint::Disablei:
-            return "glDisablei";
-        case EntryPoint::DiscardFramebufferEXT:
-            return "glDiscardFramebufferEXT";
-        case EntryPoint::DispatchCompute:
-            return "glDispatchCompute";
-        case EntryPoint::DispatchComputeIndirect:
-            return "glDispatchComputeIndirect";
-        case EntryPoint::DrawArrays:
-            return "glDrawArrays";
-        case EntryPoint::DrawArraysIndirect:
-            return "glDrawArraysIndirect";
-        case EntryPoint::DrawArraysInstanced:
-            return "glDrawArraysInstanced";
-        case EntryPoint::DrawArraysInstancedANGLE:
-            return "glDrawArraysInstancedANGLE";
-        case EntryPoint::DrawArraysInstancedBaseInstance:
-            return "glDrawArraysInstancedBaseInstance";
-        case EntryPoint::DrawArraysInstancedBaseInstanceANGLE:
-            return "glDrawArraysInstancedBaseInstanceANGLE";
-        case EntryPoint::DrawArraysInstancedEXT:
-            return "glDrawArraysInstancedEXT";
-        case EntryPoint::DrawBuffer:
-            return "glDrawBuffer";
-        case EntryPoint::DrawBuffers:
-            return "glDrawBuffers";
-        case EntryPoint::DrawBuffersEXT:
-            return "glDrawBuffersEXT";
-        case EntryPoint::DrawElements:
-            return "glDrawElements";
-        case EntryPoint::DrawElementsBaseVertex:
-            return "glDrawElementsBaseVertex";
-        case EntryPoint::DrawElementsIndirect:
-            return "glDrawElementsIndirect";
-        case EntryPoint::DrawElementsInstanced:
-            return "glDrawElementsInstanced";
-        case EntryPoint::DrawElementsInstancedANGLE:
-            return "glDrawElementsInstancedANGLE";
-        case EntryPoint::DrawElementsInstancedBaseInstance:
-            return "glDrawElementsInstancedBaseInstance";
-        case EntryPoint::DrawElementsInstancedBaseVertex:
-            return "glDrawElementsInstancedBaseVertex";
-        case EntryPoint::DrawElementsInstancedBaseVertexBaseInstance:
-            return "glDrawElementsInstancedBaseVertexBaseInstance";
-        case EntryPoint::DrawElementsInstancedBaseVertexBaseInstanceANGLE:
-            return "glDrawElementsInstancedBaseVertexBaseInstanceANGLE";
-        case EntryPoint::DrawElementsInstancedEXT:
-            return "glDrawElementsInstancedEXT";
-        case EntryPoint::DrawPixels:
-            return "glDrawPixels";
-        case EntryPoint::DrawRangeElements:
-            return "glDrawRangeElements";
-        case EntryPoint::DrawRangeElementsBaseVertex:
-            return "glDrawRangeElementsBaseVertex";
-        case EntryPoint::DrawTexfOES:
-            return "glDrawTexfOES";
-        case EntryPoint::DrawTexfvOES:
-            return "glDrawTexfvOES";
-        case EntryPoint::DrawTexiOES:
-            return "glDrawTexiOES";
-        case EntryPoint::DrawTexivOES:
-            return "glDrawTexivOES";
-        case EntryPoint::DrawTexsOES:
-            return "glDrawTexsOES";
-        case EntryPoint::DrawTexsvOES:
-            return "glDrawTexsvOES";
-        case EntryPoint::DrawTexxOES:
-            return "glDrawTexxOES";
-        case EntryPoint::DrawTexxvOES:
-            return "glDrawTexxvOES";
-        case EntryPoint::DrawTransformFeedback:
-            return "glDrawTransformFeedback";
-        case EntryPoint::DrawTransformFeedbackInstanced:
-            return "glDrawTransformFeedbackInstanced";
-        case EntryPoint::DrawTransformFeedbackStream:
-            return "glDrawTransformFeedbackStream";
-        case EntryPoint::DrawTransformFeedbackStreamInstanced:
-            return "glDrawTransformFeedbackStreamInstanced";
-        case EntryPoint::EGLImageTargetRenderbufferStorageOES:
-            return "glEGLImageTargetRenderbufferStorageOES";
-        case EntryPoint::EGLImageTargetTexture2DOES:
-            return "glEGLImageTargetTexture2DOES";
-        case EntryPoint::EdgeFlag:
-            return "glEdgeFlag";
-        case EntryPoint::EdgeFlagPointer:
-            return "glEdgeFlagPointer";
-        case EntryPoint::EdgeFlagv:
-            return "glEdgeFlagv";
-        case EntryPoint::Enable:
-            return "glEnable";
-        case EntryPoint::EnableClientState:
-            return "glEnableClientState";
-        case EntryPoint::EnableVertexArrayAttrib:
-            return "glEnableVertexArrayAttrib";
-        case EntryPoint::EnableVertexAttribArray:
-            return "glEnableVertexAttribArray";
-        case EntryPoint::Enablei:
-            return "glEnablei";
-        case EntryPoint::End:
-            return "glEnd";
-        case EntryPoint::EndConditionalRender:
-            return "glEndConditionalRender";
-        case EntryPoint::EndList:
-            return "glEndList";
-        case EntryPoint::EndQuery:
-            return "glEndQuery";
-        case EntryPoint::EndQueryEXT:
-            return "glEndQueryEXT";
-        case EntryPoint::EndQueryIndexed:
-            return "glEndQueryIndexed";
-        case EntryPoint::EndTransformFeedback:
-            return "glEndTransformFeedback";
-        case EntryPoint::EvalCoord1d:
-            return "glEvalCoord1d";
-        case EntryPoint::EvalCoord1dv:
-            return "glEvalCoord1dv";
-        case EntryPoint::EvalCoord1f:
-            return "glEvalCoord1f";
-        case EntryPoint::EvalCoord1fv:
-            return "glEvalCoord1fv";
-        case EntryPoint::EvalCoord2d:
-            return "glEvalCoord2d";
-        case EntryPoint::EvalCoord2dv:
-            return "glEvalCoord2dv";
-        case EntryPoint::EvalCoord2f:
-            return "glEvalCoord2f";
-        case EntryPoint::EvalCoord2fv:
-            return "glEvalCoord2fv";
-        case EntryPoint::EvalMesh1:
-            return "glEvalMesh1";
-        case EntryPoint::EvalMesh2:
-            return "glEvalMesh2";
-        case EntryPoint::EvalPoint1:
-            return "glEvalPoint1";
-        case EntryPoint::EvalPoint2:
-            return "glEvalPoint2";
-        case EntryPoint::FeedbackBuffer:
-            return "glFeedbackBuffer";
-        case EntryPoint::FenceSync:
-            return "glFenceSync";
-        case EntryPoint::Finish:
-            return "glFinish";
-        case EntryPoint::FinishFenceNV:
-            return "glFinishFenceNV";
-        case EntryPoint::Flush:
-            return "glFlush";
-        case EntryPoint::FlushMappedBufferRange:
-            return "glFlushMappedBufferRange";
-        case EntryPoint::FlushMappedBufferRangeEXT:
-            return "glFlushMappedBufferRangeEXT";
-        case EntryPoint::FlushMappedNamedBufferRange:
-            return "glFlushMappedNamedBufferRange";
-        case EntryPoint::FogCoordPointer:
-            return "glFogCoordPointer";
-        case EntryPoint::FogCoordd:
-            return "glFogCoordd";
-        case EntryPoint::FogCoorddv:
-            return "glFogCoorddv";
-        case EntryPoint::FogCoordf:
-            return "glFogCoordf";
-        case EntryPoint::FogCoordfv:
-            return "glFogCoordfv";
-        case EntryPoint::Fogf:
-            return "glFogf";
-        case EntryPoint::Fogfv:
-            return "glFogfv";
-        case EntryPoint::Fogi:
-            return "glFogi";
-        case EntryPoint::Fogiv:
-            return "glFogiv";
-        case EntryPoint::Fogx:
-            return "glFogx";
-        case EntryPoint::Fogxv:
-            return "glFogxv";
-        case EntryPoint::FramebufferParameteri:
-            return "glFramebufferParameteri";
-        case EntryPoint::FramebufferRenderbuffer:
-            return "glFramebufferRenderbuffer";
-        case EntryPoint::FramebufferRenderbufferOES:
-            return "glFramebufferRenderbufferOES";
-        case EntryPoint::FramebufferTexture:
-            return "glFramebufferTexture";
-        case EntryPoint::FramebufferTexture1D:
-            return "glFramebufferTexture1D";
-        case EntryPoint::FramebufferTexture2D:
-            return "glFramebufferTexture2D";
-        case EntryPoint::FramebufferTexture2DOES:
-            return "glFramebufferTexture2DOES";
-        case EntryPoint::FramebufferTexture3D:
-            return "glFramebufferTexture3D";
-        case EntryPoint::FramebufferTexture3DOES:
-            return "glFramebufferTexture3DOES";
-        case EntryPoint::FramebufferTextureEXT:
-            return "glFramebufferTextureEXT";
-        case EntryPoint::FramebufferTextureLayer:
-            return "glFramebufferTextureLayer";
-        case EntryPoint::FramebufferTextureMultiviewOVR:
-            return "glFramebufferTextureMultiviewOVR";
-        case EntryPoint::FrontFace:
-            return "glFrontFace";
-        case EntryPoint::Frustum:
-            return "glFrustum";
-        case EntryPoint::Frustumf:
-            return "glFrustumf";
-        case EntryPoint::Frustumx:
-            return "glFrustumx";
-        case EntryPoint::GenBuffers:
-            return "glGenBuffers";
-        case EntryPoint::GenFencesNV:
-            return "glGenFencesNV";
-        case EntryPoint::GenFramebuffers:
-            return "glGenFramebuffers";
-        case EntryPoint::GenFramebuffersOES:
-            return "glGenFramebuffersOES";
-        case EntryPoint::GenLists:
-            return "glGenLists";
-        case EntryPoint::GenPathsCHROMIUM:
-            return "glGenPathsCHROMIUM";
-        case EntryPoint::GenProgramPipelines:
-            return "glGenProgramPipelines";
-        case EntryPoint::GenQueries:
-            return "glGenQueries";
-        case EntryPoint::GenQueriesEXT:
-            return "glGenQueriesEXT";
-        case EntryPoint::GenRenderbuffers:
-            return "glGenRenderbuffers";
-        case EntryPoint::GenRenderbuffersOES:
-            return "glGenRenderbuffersOES";
-        case EntryPoint::GenSamplers:
-            return "glGenSamplers";
-        case EntryPoint::GenSemaphoresEXT:
-            return "glGenSemaphoresEXT";
-        case EntryPoint::GenTextures:
-            return "glGenTextures";
-        case EntryPoint::GenTransformFeedbacks:
-            return "glGenTransformFeedbacks";
-        case EntryPoint::GenVertexArrays:
-            return "glGenVertexArrays";
-        case EntryPoint::GenVertexArraysOES:
-            return "glGenVertexArraysOES";
-        case EntryPoint::GenerateMipmap:
-            return "glGenerateMipmap";
-        case EntryPoint::GenerateMipmapOES:
-            return "glGenerateMipmapOES";
-        case EntryPoint::GenerateTextureMipmap:
-            return "glGenerateTextureMipmap";
-        case EntryPoint::GetActiveAtomicCounterBufferiv:
-            return "glGetActiveAtomicCounterBufferiv";
-        case EntryPoint::GetActiveAttrib:
-            return "glGetActiveAttrib";
-        case EntryPoint::GetActiveSubroutineName:
-            return "glGetActiveSubroutineName";
-        case EntryPoint::GetActiveSubroutineUniformName:
-            return "glGetActiveSubroutineUniformName";
-        case EntryPoint::GetActiveSubroutineUniformiv:
-            return "glGetActiveSubroutineUniformiv";
-        case EntryPoint::GetActiveUniform:
-            return "glGetActiveUniform";
-        case EntryPoint::GetActiveUniformBlockName:
-            return "glGetActiveUniformBlockName";
-        case EntryPoint::GetActiveUniformBlockiv:
-            return "glGetActiveUniformBlockiv";
-        case EntryPoint::GetActiveUniformBlockivRobustANGLE:
-            return "glGetActiveUniformBlockivRobustANGLE";
-        case EntryPoint::GetActiveUniformName:
-            return "glGetActiveUniformName";
-        case EntryPoint::GetActiveUniformsiv:
-            return "glGetActiveUniformsiv";
-        case EntryPoint::GetAttachedShaders:
-            return "glGetAttachedShaders";
-        case EntryPoint::GetAttribLocation:
-            return "glGetAttribLocation";
-        case EntryPoint::GetBooleani_v:
-            return "glGetBooleani_v";
-        case EntryPoint::GetBooleani_vRobustANGLE:
-            return "glGetBooleani_vRobustANGLE";
-        case EntryPoint::GetBooleanv:
-            return "glGetBooleanv";
-        case EntryPoint::GetBooleanvRobustANGLE:
-            return "glGetBooleanvRobustANGLE";
-        case EntryPoint::GetBufferParameteri64v:
-            return "glGetBufferParameteri64v";
-        case EntryPoint::GetBufferParameteri64vRobustANGLE:
-            return "glGetBufferParameteri64vRobustANGLE";
-        case EntryPoint::GetBufferParameteriv:
-            return "glGetBufferParameteriv";
-        case EntryPoint::GetBufferParameterivRobustANGLE:
-            return "glGetBufferParameterivRobustANGLE";
-        case EntryPoint::GetBufferPointerv:
-            return "glGetBufferPointerv";
-        case EntryPoint::GetBufferPointervOES:
-            return "glGetBufferPointervOES";
-        case EntryPoint::GetBufferPointervRobustANGLE:
-            return "glGetBufferPointervRobustANGLE";
-        case EntryPoint::GetBufferSubData:
-            return "glGetBufferSubData";
-        case EntryPoint::GetClipPlane:
-            return "glGetClipPlane";
-        case EntryPoint::GetClipPlanef:
-            return "glGetClipPlanef";
-        case EntryPoint::GetClipPlanex:
-            return "glGetClipPlanex";
-        case EntryPoint::GetCompressedTexImage:
-            return "glGetCompressedTexImage";
-        case EntryPoint::GetCompressedTextureImage:
-            return "glGetCompressedTextureImage";
-        case EntryPoint::GetCompressedTextureSubImage:
-            return "glGetCompressedTextureSubImage";
-        case EntryPoint::GetDebugMessageLog:
-            return "glGetDebugMessageLog";
-        case EntryPoint::GetDebugMessageLogKHR:
-            return "glGetDebugMessageLogKHR";
-        case EntryPoint::GetDoublei_v:
-            return "glGetDoublei_v";
-        case EntryPoint::GetDoublev:
-            return "glGetDoublev";
-        case EntryPoint::GetError:
-            return "glGetError";
-        case EntryPoint::GetFenceivNV:
-            return "glGetFenceivNV";
-        case EntryPoint::GetFixedv:
-            return "glGetFixedv";
-        case EntryPoint::GetFloati_v:
-            return "glGetFloati_v";
-        case EntryPoint::GetFloatv:
-            return "glGetFloatv";
-        case EntryPoint::GetFloatvRobustANGLE:
-            return "glGetFloatvRobustANGLE";
-        case EntryPoint::GetFragDataIndex:
-            return "glGetFragDataIndex";
-        case EntryPoint::GetFragDataIndexEXT:
-            return "glGetFragDataIndexEXT";
-        case EntryPoint::GetFragDataLocation:
-            return "glGetFragDataLocation";
-        case EntryPoint::GetFramebufferAttachmentParameteriv:
-            return "glGetFramebufferAttachmentParameteriv";
-        case EntryPoint::GetFramebufferAttachmentParameterivOES:
-            return "glGetFramebufferAttachmentParameterivOES";
-        case EntryPoint::GetFramebufferAttachmentParameterivRobustANGLE:
-            return "glGetFramebufferAttachmentParameterivRobustANGLE";
-        case EntryPoint::GetFramebufferParameteriv:
-            return "glGetFramebufferParameteriv";
-        case EntryPoint::GetFramebufferParameterivRobustANGLE:
-            return "glGetFramebufferParameterivRobustANGLE";
-        case EntryPoint::GetGraphicsResetStatus:
-            return "glGetGraphicsResetStatus";
-        case EntryPoint::GetGraphicsResetStatusEXT:
-            return "glGetGraphicsResetStatusEXT";
-        case EntryPoint::GetInteger64i_v:
-            return "glGetInteger64i_v";
-        case EntryPoint::GetInteger64i_vRobustANGLE:
-            return "glGetInteger64i_vRobustANGLE";
-        case EntryPoint::GetInteger64v:
-            return "glGetInteger64v";
-        case EntryPoint::GetInteger64vRobustANGLE:
-            return "glGetInteger64vRobustANGLE";
-        case EntryPoint::GetIntegeri_v:
-            return "glGetIntegeri_v";
-        case EntryPoint::GetIntegeri_vRobustANGLE:
-            return "glGetIntegeri_vRobustANGLE";
-        case EntryPoint::GetIntegerv:
-            return "glGetIntegerv";
-        case EntryPoint::GetIntegervRobustANGLE:
-            return "glGetIntegervRobustANGLE";
-        case EntryPoint::GetInternalformati64v:
-            return "glGetInternalformati64v";
-        case EntryPoint::GetInternalformativ:
-            return "glGetInternalformativ";
-        case EntryPoint::GetInternalformativRobustANGLE:
-            return "glGetInternalformativRobustANGLE";
-        case EntryPoint::GetLightfv:
-            return "glGetLightfv";
-        case EntryPoint::GetLightiv:
-            return "glGetLightiv";
-        case EntryPoint::GetLightxv:
-            return "glGetLightxv";
-        case EntryPoint::GetMapdv:
-            return "glGetMapdv";
-        case EntryPoint::GetMapfv:
-            return "glGetMapfv";
-        case EntryPoint::GetMapiv:
-            return "glGetMapiv";
-        case EntryPoint::GetMaterialfv:
-            return "glGetMaterialfv";
-        case EntryPoint::GetMaterialiv:
-            return "glGetMaterialiv";
-        case EntryPoint::GetMaterialxv:
-            return "glGetMaterialxv";
-        case EntryPoint::GetMemoryObjectParameterivEXT:
-            return "glGetMemoryObjectParameterivEXT";
-        case EntryPoint::GetMultisamplefv:
-            return "glGetMultisamplefv";
-        case EntryPoint::GetMultisamplefvANGLE:
-            return "glGetMultisamplefvANGLE";
-        case EntryPoint::GetMultisamplefvRobustANGLE:
-            return "glGetMultisamplefvRobustANGLE";
-        case EntryPoint::GetNamedBufferParameteri64v:
-            return "glGetNamedBufferParameteri64v";
-        case EntryPoint::GetNamedBufferParameteriv:
-            return "glGetNamedBufferParameteriv";
-        case EntryPoint::GetNamedBufferPointerv:
-            return "glGetNamedBufferPointerv";
-        case EntryPoint::GetNamedBufferSubData:
-            return "glGetNamedBufferSubData";
-        case EntryPoint::GetNamedFramebufferAttachmentParameteriv:
-            return "glGetNamedFramebufferAttachmentParameteriv";
-        case EntryPoint::GetNamedFramebufferParameteriv:
-            return "glGetNamedFramebufferParameteriv";
-        case EntryPoint::GetNamedRenderbufferParameteriv:
-            return "glGetNamedRenderbufferParameteriv";
-        case EntryPoint::GetObjectLabel:
-            return "glGetObjectLabel";
-        case EntryPoint::GetObjectLabelKHR:
-            return "glGetObjectLabelKHR";
-        case EntryPoint::GetObjectPtrLabel:
-            return "glGetObjectPtrLabel";
-        case EntryPoint::GetObjectPtrLabelKHR:
-            return "glGetObjectPtrLabelKHR";
-        case EntryPoint::GetPathParameterfvCHROMIUM:
-            return "glGetPathParameterfvCHROMIUM";
-        case EntryPoint::GetPathParameterivCHROMIUM:
-            return "glGetPathParameterivCHROMIUM";
-        case EntryPoint::GetPixelMapfv:
-            return "glGetPixelMapfv";
-        case EntryPoint::GetPixelMapuiv:
-            return "glGetPixelMapuiv";
-        case EntryPoint::GetPixelMapusv:
-            return "glGetPixelMapusv";
-        case EntryPoint::GetPointerv:
-            return "glGetPointerv";
-        case EntryPoint::GetPointervKHR:
-            return "glGetPointervKHR";
-        case EntryPoint::GetPointervRobustANGLERobustANGLE:
-            return "glGetPointervRobustANGLERobustANGLE";
-        case EntryPoint::GetPolygonStipple:
-            return "glGetPolygonStipple";
-        case EntryPoint::GetProgramBinary:
-            return "glGetProgramBinary";
-        case EntryPoint::GetProgramBinaryOES:
-            return "glGetProgramBinaryOES";
-        case EntryPoint::GetProgramInfoLog:
-            return "glGetProgramInfoLog";
-        case EntryPoint::GetProgramInterfaceiv:
-            return "glGetProgramInterfaceiv";
-        case EntryPoint::GetProgramInterfaceivRobustANGLE:
-            return "glGetProgramInterfaceivRobustANGLE";
-        case EntryPoint::GetProgramPipelineInfoLog:
-            return "glGetProgramPipelineInfoLog";
-        case EntryPoint::GetProgramPipelineiv:
-            return "glGetProgramPipelineiv";
-        case EntryPoint::GetProgramResourceIndex:
-            return "glGetProgramResourceIndex";
-        case EntryPoint::GetProgramResourceLocation:
-            return "glGetProgramResourceLocation";
-        case EntryPoint::GetProgramResourceLocationIndex:
-            return "glGetProgramResourceLocationIndex";
-        case EntryPoint::GetProgramResourceLocationIndexEXT:
-            return "glGetProgramResourceLocationIndexEXT";
-        case EntryPoint::GetProgramResourceName:
-            return "glGetProgramResourceName";
-        case EntryPoint::GetProgramResourceiv:
-            return "glGetProgramResourceiv";
-        case EntryPoint::GetProgramStageiv:
-            return "glGetProgramStageiv";
-        case EntryPoint::GetProgramiv:
-            return "glGetProgramiv";
-        case EntryPoint::GetProgramivRobustANGLE:
-            return "glGetProgramivRobustANGLE";
-        case EntryPoint::GetQueryBufferObjecti64v:
-            return "glGetQueryBufferObjecti64v";
-        case EntryPoint::GetQueryBufferObjectiv:
-            return "glGetQueryBufferObjectiv";
-        case EntryPoint::GetQueryBufferObjectui64v:
-            return "glGetQueryBufferObjectui64v";
-        case EntryPoint::GetQueryBufferObjectuiv:
-            return "glGetQueryBufferObjectuiv";
-        case EntryPoint::GetQueryIndexediv:
-            return "glGetQueryIndexediv";
-        case EntryPoint::GetQueryObjecti64v:
-            return "glGetQueryObjecti64v";
-        case EntryPoint::GetQueryObjecti64vEXT:
-            return "glGetQueryObjecti64vEXT";
-        case EntryPoint::GetQueryObjecti64vRobustANGLE:
-            return "glGetQueryObjecti64vRobustANGLE";
-        case EntryPoint::GetQueryObjectiv:
-            return "glGetQueryObjectiv";
-        case EntryPoint::GetQueryObjectivEXT:
-            return "glGetQueryObjectivEXT";
-        case EntryPoint::GetQueryObjectivRobustANGLE:
-            return "glGetQueryObjectivRobustANGLE";
-        case EntryPoint::GetQueryObjectui64v:
-            return "glGetQueryObjectui64v";
-        case EntryPoint::GetQueryObjectui64vEXT:
-            return "glGetQueryObjectui64vEXT";
-        case EntryPoint::GetQueryObjectui64vRobustANGLE:
-            return "glGetQueryObjectui64vRobustANGLE";
-        case EntryPoint::GetQueryObjectuiv:
-            return "glGetQueryObjectuiv";
-        case EntryPoint::GetQueryObjectuivEXT:
-            return "glGetQueryObjectuivEXT";
-        case EntryPoint::GetQueryObjectuivRobustANGLE:
-            return "glGetQueryObjectuivRobustANGLE";
-        case EntryPoint::GetQueryiv:
-            return "glGetQueryiv";
-        case EntryPoint::GetQueryivEXT:
-            return "glGetQueryivEXT";
-        case EntryPoint::GetQueryivRobustANGLE:
-            return "glGetQueryivRobustANGLE";
-        case EntryPoint::GetRenderbufferParameteriv:
-            return "glGetRenderbufferParameteriv";
-        case EntryPoint::GetRenderbufferParameterivOES:
-            return "glGetRenderbufferParameterivOES";
-        case EntryPoint::GetRenderbufferParameterivRobustANGLE:
-            return "glGetRenderbufferParameterivRobustANGLE";
-        case EntryPoint::GetSamplerParameterIiv:
-            return "glGetSamplerParameterIiv";
-        case EntryPoint::GetSamplerParameterIivOES:
-            return "glGetSamplerParameterIivOES";
-        case EntryPoint::GetSamplerParameterIivRobustANGLE:
-            return "glGetSamplerParameterIivRobustANGLE";
-        case EntryPoint::GetSamplerParameterIuiv:
-            return "glGetSamplerParameterIuiv";
-        case EntryPoint::GetSamplerParameterIuivOES:
-            return "glGetSamplerParameterIuivOES";
-        case EntryPoint::GetSamplerParameterIuivRobustANGLE:
-            return "glGetSamplerParameterIuivRobustANGLE";
-        case EntryPoint::GetSamplerParameterfv:
-            return "glGetSamplerParameterfv";
-        case EntryPoint::GetSamplerParameterfvRobustANGLE:
-            return "glGetSamplerParameterfvRobustANGLE";
-        case EntryPoint::GetSamplerParameteriv:
-            return "glGetSamplerParameteriv";
-        case EntryPoint::GetSamplerParameterivRobustANGLE:
-            return "glGetSamplerParameterivRobustANGLE";
-        case EntryPoint::GetSemaphoreParameterui64vEXT:
-            return "glGetSemaphoreParameterui64vEXT";
-        case EntryPoint::GetShaderInfoLog:
-            return "glGetShaderInfoLog";
-        case EntryPoint::GetShaderPrecisionFormat:
-            return "glGetShaderPrecisionFormat";
-        case EntryPoint::GetShaderSource:
-            return "glGetShaderSource";
-        case EntryPoint::GetShaderiv:
-            return "glGetShaderiv";
-        case EntryPoint::GetShaderivRobustANGLE:
-            return "glGetShaderivRobustANGLE";
-        case EntryPoint::GetString:
-            return "glGetString";
-        case EntryPoint::GetStringi:
-            return "glGetStringi";
-        case EntryPoint::GetSubroutineIndex:
-            return "glGetSubroutineIndex";
-        case EntryPoint::GetSubroutineUniformLocation:
-            return "glGetSubroutineUniformLocation";
-        case EntryPoint::GetSynciv:
-            return "glGetSynciv";
-        case EntryPoint::GetTexEnvfv:
-            return "glGetTexEnvfv";
-        case EntryPoint::GetTexEnviv:
-            return "glGetTexEnviv";
-        case EntryPoint::GetTexEnvxv:
-            return "glGetTexEnvxv";
-        case EntryPoint::GetTexGendv:
-            return "glGetTexGendv";
-        case EntryPoint::GetTexGenfv:
-            return "glGetTexGenfv";
-        case EntryPoint::GetTexGenfvOES:
-            return "glGetTexGenfvOES";
-        case EntryPoint::GetTexGeniv:
-            return "glGetTexGeniv";
-        case EntryPoint::GetTexGenivOES:
-            return "glGetTexGenivOES";
-        case EntryPoint::GetTexGenxvOES:
-            return "glGetTexGenxvOES";
-        case EntryPoint::GetTexImage:
-            return "glGetTexImage";
-        case EntryPoint::GetTexLevelParameterfv:
-            return "glGetTexLevelParameterfv";
-        case EntryPoint::GetTexLevelParameterfvANGLE:
-            return "glGetTexLevelParameterfvANGLE";
-        case EntryPoint::GetTexLevelParameterfvRobustANGLE:
-            return "glGetTexLevelParameterfvRobustANGLE";
-        case EntryPoint::GetTexLevelParameteriv:
-            return "glGetTexLevelParameteriv";
-        case EntryPoint::GetTexLevelParameterivANGLE:
-            return "glGetTexLevelParameterivANGLE";
-        case EntryPoint::GetTexLevelParameterivRobustANGLE:
-            return "glGetTexLevelParameterivRobustANGLE";
-        case EntryPoint::GetTexParameterIiv:
-            return "glGetTexParameterIiv";
-        case EntryPoint::GetTexParameterIivOES:
-            return "glGetTexParameterIivOES";
-        case EntryPoint::GetTexParameterIivRobustANGLE:
-            return "glGetTexParameterIivRobustANGLE";
-        case EntryPoint::GetTexParameterIuiv:
-            return "glGetTexParameterIuiv";
-        case EntryPoint::GetTexParameterIuivOES:
-            return "glGetTexParameterIuivOES";
-        case EntryPoint::GetTexParameterIuivRobustANGLE:
-            return "glGetTexParameterIuivRobustANGLE";
-        case EntryPoint::GetTexParameterfv:
-            return "glGetTexParameterfv";
-        case EntryPoint::GetTexParameterfvRobustANGLE:
-            return "glGetTexParameterfvRobustANGLE";
-        case EntryPoint::GetTexParameteriv:
-            return "glGetTexParameteriv";
-        case EntryPoint::GetTexParameterivRobustANGLE:
-            return "glGetTexParameterivRobustANGLE";
-        case EntryPoint::GetTexParameterxv:
-            return "glGetTexParameterxv";
-        case EntryPoint::GetTextureImage:
-            return "glGetTextureImage";
-        case EntryPoint::GetTextureLevelParameterfv:
-            return "glGetTextureLevelParameterfv";
-        case EntryPoint::GetTextureLevelParameteriv:
-            return "glGetTextureLevelParameteriv";
-        case EntryPoint::GetTextureParameterIiv:
-            return "glGetTextureParameterIiv";
-        case EntryPoint::GetTextureParameterIuiv:
-            return "glGetTextureParameterIuiv";
-        case EntryPoint::GetTextureParameterfv:
-            return "glGetTextureParameterfv";
-        case EntryPoint::GetTextureParameteriv:
-            return "glGetTextureParameteriv";
-        case EntryPoint::GetTextureSubImage:
-            return "glGetTextureSubImage";
-        case EntryPoint::GetTransformFeedbackVarying:
-            return "glGetTransformFeedbackVarying";
-        case EntryPoint::GetTransformFeedbacki64_v:
-            return "glGetTransformFeedbacki64_v";
-        case EntryPoint::GetTransformFeedbacki_v:
-            return "glGetTransformFeedbacki_v";
-        case EntryPoint::GetTransformFeedbackiv:
-            return "glGetTransformFeedbackiv";
-        case EntryPoint::GetTranslatedShaderSourceANGLE:
-            return "glGetTranslatedShaderSourceANGLE";
-        case EntryPoint::GetUniformBlockIndex:
-            return "glGetUniformBlockIndex";
-        case EntryPoint::GetUniformIndices:
-            return "glGetUniformIndices";
-        case EntryPoint::GetUniformLocation:
-            return "glGetUniformLocation";
-        case EntryPoint::GetUniformSubroutineuiv:
-            return "glGetUniformSubroutineuiv";
-        case EntryPoint::GetUniformdv:
-            return "glGetUniformdv";
-        case EntryPoint::GetUniformfv:
-            return "glGetUniformfv";
-        case EntryPoint::GetUniformfvRobustANGLE:
-            return "glGetUniformfvRobustANGLE";
-        case EntryPoint::GetUniformiv:
-            return "glGetUniformiv";
-        case EntryPoint::GetUniformivRobustANGLE:
-            return "glGetUniformivRobustANGLE";
-        case EntryPoint::GetUniformuiv:
-            return "glGetUniformuiv";
-        case EntryPoint::GetUniformuivRobustANGLE:
-            return "glGetUniformuivRobustANGLE";
-        case EntryPoint::GetUnsignedBytei_vEXT:
-            return "glGetUnsignedBytei_vEXT";
-        case EntryPoint::GetUnsignedBytevEXT:
-            return "glGetUnsignedBytevEXT";
-        case EntryPoint::GetVertexArrayIndexed64iv:
-            return "glGetVertexArrayIndexed64iv";
-        case EntryPoint::GetVertexArrayIndexediv:
-            return "glGetVertexArrayIndexediv";
-        case EntryPoint::GetVertexArrayiv:
-            return "glGetVertexArrayiv";
-        case EntryPoint::GetVertexAttribIiv:
-            return "glGetVertexAttribIiv";
-        case EntryPoint::GetVertexAttribIivRobustANGLE:
-            return "glGetVertexAttribIivRobustANGLE";
-        case EntryPoint::GetVertexAttribIuiv:
-            return "glGetVertexAttribIuiv";
-        case EntryPoint::GetVertexAttribIuivRobustANGLE:
-            return "glGetVertexAttribIuivRobustANGLE";
-        case EntryPoint::GetVertexAttribLdv:
-            return "glGetVertexAttribLdv";
-        case EntryPoint::GetVertexAttribPointerv:
-            return "glGetVertexAttribPointerv";
-        case EntryPoint::GetVertexAttribPointervRobustANGLE:
-            return "glGetVertexAttribPointervRobustANGLE";
-        case EntryPoint::GetVertexAttribdv:
-            return "glGetVertexAttribdv";
-        case EntryPoint::GetVertexAttribfv:
-            return "glGetVertexAttribfv";
-        case EntryPoint::GetVertexAttribfvRobustANGLE:
-            return "glGetVertexAttribfvRobustANGLE";
-        case EntryPoint::GetVertexAttribiv:
-            return "glGetVertexAttribiv";
-        case EntryPoint::GetVertexAttribivRobustANGLE:
-            return "glGetVertexAttribivRobustANGLE";
-        case EntryPoint::GetnColorTable:
-            return "glGetnColorTable";
-        case EntryPoint::GetnCompressedTexImage:
-            return "glGetnCompressedTexImage";
-        case EntryPoint::GetnConvolutionFilter:
-            return "glGetnConvolutionFilter";
-        case EntryPoint::GetnHistogram:
-            return "glGetnHistogram";
-        case EntryPoint::GetnMapdv:
-            return "glGetnMapdv";
-        case EntryPoint::GetnMapfv:
-            return "glGetnMapfv";
-        case EntryPoint::GetnMapiv:
-            return "glGetnMapiv";
-        case EntryPoint::GetnMinmax:
-            return "glGetnMinmax";
-        case EntryPoint::GetnPixelMapfv:
-            return "glGetnPixelMapfv";
-        case EntryPoint::GetnPixelMapuiv:
-            return "glGetnPixelMapuiv";
-        case EntryPoint::GetnPixelMapusv:
-            return "glGetnPixelMapusv";
-        case EntryPoint::GetnPolygonStipple:
-            return "glGetnPolygonStipple";
-        case EntryPoint::GetnSeparableFilter:
-            return "glGetnSeparableFilter";
-        case EntryPoint::GetnTexImage:
-            return "glGetnTexImage";
-        case EntryPoint::GetnUniformdv:
-            return "glGetnUniformdv";
-        case EntryPoint::GetnUniformfv:
-            return "glGetnUniformfv";
-        case EntryPoint::GetnUniformfvEXT:
-            return "glGetnUniformfvEXT";
-        case EntryPoint::GetnUniformfvRobustANGLE:
-            return "glGetnUniformfvRobustANGLE";
-        case EntryPoint::GetnUniformiv:
-            return "glGetnUniformiv";
-        case EntryPoint::GetnUniformivEXT:
-            return "glGetnUniformivEXT";
-        case EntryPoint::GetnUniformivRobustANGLE:
-            return "glGetnUniformivRobustANGLE";
-        case EntryPoint::GetnUniformuiv:
-            return "glGetnUniformuiv";
-        case EntryPoint::GetnUniformuivRobustANGLE:
-            return "glGetnUniformuivRobustANGLE";
-        case EntryPoint::Hint:
-            return "glHint";
-        case EntryPoint::ImportMemoryFdEXT:
-            return "glImportMemoryFdEXT";
-        case EntryPoint::ImportSemaphoreFdEXT:
-            return "glImportSemaphoreFdEXT";
-        case EntryPoint::IndexMask:
-            return "glIndexMask";
-        case EntryPoint::IndexPointer:
-            return "glIndexPointer";
-        case EntryPoint::Indexd:
-            return "glIndexd";
-        case EntryPoint::Indexdv:
-            return "glIndexdv";
-        case EntryPoint::Indexf:
-            return "glIndexf";
-        case EntryPoint::Indexfv:
-            return "glIndexfv";
-        case EntryPoint::Indexi:
-            return "glIndexi";
-        case EntryPoint::Indexiv:
-            return "glIndexiv";
-        case EntryPoint::Indexs:
-            return "glIndexs";
-        case EntryPoint::Indexsv:
-            return "glIndexsv";
-        case EntryPoint::Indexub:
-            return "glIndexub";
-        case EntryPoint::Indexubv:
-            return "glIndexubv";
-        case EntryPoint::InitNames:
-            return "glInitNames";
-        case EntryPoint::InsertEventMarkerEXT:
-            return "glInsertEventMarkerEXT";
-        case EntryPoint::InterleavedArrays:
-            return "glInterleavedArrays";
-        case EntryPoint::Invalid:
-            return "glInvalid";
-        case EntryPoint::InvalidateBufferData:
-            return "glInvalidateBufferData";
-        case EntryPoint::InvalidateBufferSubData:
-            return "glInvalidateBufferSubData";
-        case EntryPoint::InvalidateFramebuffer:
-            return "glInvalidateFramebuffer";
-        case EntryPoint::InvalidateNamedFramebufferData:
-            return "glInvalidateNamedFramebufferData";
-        case EntryPoint::InvalidateNamedFramebufferSubData:
-            return "glInvalidateNamedFramebufferSubData";
-        case EntryPoint::InvalidateSubFramebuffer:
-            return "glInvalidateSubFramebuffer";
-        case EntryPoint::InvalidateTexImage:
-            return "glInvalidateTexImage";
-        case EntryPoint::InvalidateTexSubImage:
-            return "glInvalidateTexSubImage";
-        case EntryPoint::InvalidateTextureANGLE:
-            return "glInvalidateTextureANGLE";
-        case EntryPoint::IsBuffer:
-            return "glIsBuffer";
-        case EntryPoint::IsEnabled:
-            return "glIsEnabled";
-        case EntryPoint::IsEnabledi:
-            return "glIsEnabledi";
-        case EntryPoint::IsFenceNV:
-            return "glIsFenceNV";
-        case EntryPoint::IsFramebuffer:
-            return "glIsFramebuffer";
-        case EntryPoint::IsFramebufferOES:
-            return "glIsFramebufferOES";
-        case EntryPoint::IsList:
-            return "glIsList";
-        case EntryPoint::IsMemoryObjectEXT:
-            return "glIsMemoryObjectEXT";
-        case EntryPoint::IsPathCHROMIUM:
-            return "glIsPathCHROMIUM";
-        case EntryPoint::IsProgram:
-            return "glIsProgram";
-        case EntryPoint::IsProgramPipeline:
-            return "glIsProgramPipeline";
-        case EntryPoint::IsQuery:
-            return "glIsQuery";
-        case EntryPoint::IsQueryEXT:
-            return "glIsQueryEXT";
-        case EntryPoint::IsRenderbuffer:
-            return "glIsRenderbuffer";
-        case EntryPoint::IsRenderbufferOES:
-            return "glIsRenderbufferOES";
-        case EntryPoint::IsSampler:
-            return "glIsSampler";
-        case EntryPoint::IsSemaphoreEXT:
-            return "glIsSemaphoreEXT";
-        case EntryPoint::IsShader:
-            return "glIsShader";
-        case EntryPoint::IsSync:
-            return "glIsSync";
-        case EntryPoint::IsTexture:
-            return "glIsTexture";
-        case EntryPoint::IsTransformFeedback:
-            return "glIsTransformFeedback";
-        case EntryPoint::IsVertexArray:
-            return "glIsVertexArray";
-        case EntryPoint::IsVertexArrayOES:
-            return "glIsVertexArrayOES";
-        case EntryPoint::LightModelf:
-            return "glLightModelf";
-        case EntryPoint::LightModelfv:
-            return "glLightModelfv";
-        case EntryPoint::LightModeli:
-            return "glLightModeli";
-        case EntryPoint::LightModeliv:
-            return "glLightModeliv";
-        case EntryPoint::LightModelx:
-            return "glLightModelx";
-        case EntryPoint::LightModelxv:
-            return "glLightModelxv";
-        case EntryPoint::Lightf:
-            return "glLightf";
-        case EntryPoint::Lightfv:
-            return "glLightfv";
-        case EntryPoint::Lighti:
-            return "glLighti";
-        case EntryPoint::Lightiv:
-            return "glLightiv";
-        case EntryPoint::Lightx:
-            return "glLightx";
-        case EntryPoint::Lightxv:
-            return "glLightxv";
-        case EntryPoint::LineStipple:
-            return "glLineStipple";
-        case EntryPoint::LineWidth:
-            return "glLineWidth";
-        case EntryPoint::LineWidthx:
-            return "glLineWidthx";
-        case EntryPoint::LinkProgram:
-            return "glLinkProgram";
-        case EntryPoint::ListBase:
-            return "glListBase";
-        case EntryPoint::LoadIdentity:
-            return "glLoadIdentity";
-        case EntryPoint::LoadMatrixd:
-            return "glLoadMatrixd";
-        case EntryPoint::LoadMatrixf:
-            return "glLoadMatrixf";
-        case EntryPoint::LoadMatrixx:
-            return "glLoadMatrixx";
-        case EntryPoint::LoadName:
-            return "glLoadName";
-        case EntryPoint::LoadPaletteFromModelViewMatrixOES:
-            return "glLoadPaletteFromModelViewMatrixOES";
-        case EntryPoint::LoadTransposeMatrixd:
-            return "glLoadTransposeMatrixd";
-        case EntryPoint::LoadTransposeMatrixf:
-            return "glLoadTransposeMatrixf";
-        case EntryPoint::LogicOp:
-            return "glLogicOp";
-        case EntryPoint::LoseContextCHROMIUM:
-            return "glLoseContextCHROMIUM";
-        case EntryPoint::Map1d:
-            return "glMap1d";
-        case EntryPoint::Map1f:
-            return "glMap1f";
-        case EntryPoint::Map2d:
-            return "glMap2d";
-        case EntryPoint::Map2f:
-            return "glMap2f";
-        case EntryPoint::MapBuffer:
-            return "glMapBuffer";
-        case EntryPoint::MapBufferOES:
-            return "glMapBufferOES";
-        case EntryPoint::MapBufferRange:
-            return "glMapBufferRange";
-        case EntryPoint::MapBufferRangeEXT:
-            return "glMapBufferRangeEXT";
-        case EntryPoint::MapGrid1d:
-            return "glMapGrid1d";
-        case EntryPoint::MapGrid1f:
-            return "glMapGrid1f";
-        case EntryPoint::MapGrid2d:
-            return "glMapGrid2d";
-        case EntryPoint::MapGrid2f:
-            return "glMapGrid2f";
-        case EntryPoint::MapNamedBuffer:
-            return "glMapNamedBuffer";
-        case EntryPoint::MapNamedBufferRange:
-            return "glMapNamedBufferRange";
-        case EntryPoint::Materialf:
-            return "glMaterialf";
-        case EntryPoint::Materialfv:
-            return "glMaterialfv";
-        case EntryPoint::Materiali:
-            return "glMateriali";
-        case EntryPoint::Materialiv:
-            return "glMaterialiv";
-        case EntryPoint::Materialx:
-            return "glMaterialx";
-        case EntryPoint::Materialxv:
-            return "glMaterialxv";
-        case EntryPoint::MatrixIndexPointerOES:
-            return "glMatrixIndexPointerOES";
-        case EntryPoint::MatrixLoadIdentityCHROMIUM:
-            return "glMatrixLoadIdentityCHROMIUM";
-        case EntryPoint::MatrixLoadfCHROMIUM:
-            return "glMatrixLoadfCHROMIUM";
-        case EntryPoint::MatrixMode:
-            return "glMatrixMode";
-        case EntryPoint::MaxShaderCompilerThreadsKHR:
-            return "glMaxShaderCompilerThreadsKHR";
-        case EntryPoint::MemoryBarrier:
-            return "glMemoryBarrier";
-        case EntryPoint::MemoryBarrierByRegion:
-            return "glMemoryBarrierByRegion";
-        case EntryPoint::MemoryObjectParameterivEXT:
-            return "glMemoryObjectParameterivEXT";
-        case EntryPoint::MinSampleShading:
-            return "glMinSampleShading";
-        case EntryPoint::MultMatrixd:
-            return "glMultMatrixd";
-        case EntryPoint::MultMatrixf:
-            return "glMultMatrixf";
-        case EntryPoint::MultMatrixx:
-            return "glMultMatrixx";
-        case EntryPoint::MultTransposeMatrixd:
-            return "glMultTransposeMatrixd";
-        case EntryPoint::MultTransposeMatrixf:
-            return "glMultTransposeMatrixf";
-        case EntryPoint::MultiDrawArrays:
-            return "glMultiDrawArrays";
-        case EntryPoint::MultiDrawArraysANGLE:
-            return "glMultiDrawArraysANGLE";
-        case EntryPoint::MultiDrawArraysIndirect:
-            return "glMultiDrawArraysIndirect";
-        case EntryPoint::MultiDrawArraysIndirectCount:
-            return "glMultiDrawArraysIndirectCount";
-        case EntryPoint::MultiDrawArraysInstancedANGLE:
-            return "glMultiDrawArraysInstancedANGLE";
-        case EntryPoint::MultiDrawArraysInstancedBaseInstanceANGLE:
-            return "glMultiDrawArraysInstancedBaseInstanceANGLE";
-        case EntryPoint::MultiDrawElements:
-            return "glMultiDrawElements";
-        case EntryPoint::MultiDrawElementsANGLE:
-            return "glMultiDrawElementsANGLE";
-        case EntryPoint::MultiDrawElementsBaseVertex:
-            return "glMultiDrawElementsBaseVertex";
-        case EntryPoint::MultiDrawElementsIndirect:
-            return "glMultiDrawElementsIndirect";
-        case EntryPoint::MultiDrawElementsIndirectCount:
-            return "glMultiDrawElementsIndirectCount";
-        case EntryPoint::MultiDrawElementsInstancedANGLE:
-            return "glMultiDrawElementsInstancedANGLE";
-        case EntryPoint::MultiDrawElementsInstancedBaseVertexBaseInstanceANGLE:
-            return "glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE";
-        case EntryPoint::MultiTexCoord1d:
-            return "glMultiTexCoord1d";
-        case EntryPoint::MultiTexCoord1dv:
-            return "glMultiTexCoord1dv";
-        case EntryPoint::MultiTexCoord1f:
-            return "glMultiTexCoord1f";
-        case EntryPoint::MultiTexCoord1fv:
-            return "glMultiTexCoord1fv";
-        case EntryPoint::MultiTexCoord1i:
-            return "glMultiTexCoord1i";
-        case EntryPoint::MultiTexCoord1iv:
-            return "glMultiTexCoord1iv";
-        case EntryPoint::MultiTexCoord1s:
-            return "glMultiTexCoord1s";
-        case EntryPoint::MultiTexCoord1sv:
-            return "glMultiTexCoord1sv";
-        case EntryPoint::MultiTexCoord2d:
-            return "glMultiTexCoord2d";
-        case EntryPoint::MultiTexCoord2dv:
-            return "glMultiTexCoord2dv";
-        case EntryPoint::MultiTexCoord2f:
-            return "glMultiTexCoord2f";
-        case EntryPoint::MultiTexCoord2fv:
-            return "glMultiTexCoord2fv";
-        case EntryPoint::MultiTexCoord2i:
-            return "glMultiTexCoord2i";
-        case EntryPoint::MultiTexCoord2iv:
-            return "glMultiTexCoord2iv";
-        case EntryPoint::MultiTexCoord2s:
-            return "glMultiTexCoord2s";
-        case EntryPoint::MultiTexCoord2sv:
-            return "glMultiTexCoord2sv";
-        case EntryPoint::MultiTexCoord3d:
-            return "glMultiTexCoord3d";
-        case EntryPoint::MultiTexCoord3dv:
-            return "glMultiTexCoord3dv";
-        case EntryPoint::MultiTexCoord3f:
-            return "glMultiTexCoord3f";
-        case EntryPoint::MultiTexCoord3fv:
-            return "glMultiTexCoord3fv";
-        case EntryPoint::MultiTexCoord3i:
-            return "glMultiTexCoord3i";
-        case EntryPoint::MultiTexCoord3iv:
-            return "glMultiTexCoord3iv";
-        case EntryPoint::MultiTexCoord3s:
-            return "glMultiTexCoord3s";
-        case EntryPoint::MultiTexCoord3sv:
-            return "glMultiTexCoord3sv";
-        case EntryPoint::MultiTexCoord4d:
-            return "glMultiTexCoord4d";
-        case EntryPoint::MultiTexCoord4dv:
-            return "glMultiTexCoord4dv";
-        case EntryPoint::MultiTexCoord4f:
-            return "glMultiTexCoord4f";
-        case EntryPoint::MultiTexCoord4fv:
-            return "glMultiTexCoord4fv";
-        case EntryPoint::MultiTexCoord4i:
-            return "glMultiTexCoord4i";
-        case EntryPoint::MultiTexCoord4iv:
-            return "glMultiTexCoord4iv";
-        case EntryPoint::MultiTexCoord4s:
-            return "glMultiTexCoord4s";
-        case EntryPoint::MultiTexCoord4sv:
-            return "glMultiTexCoord4sv";
-        case EntryPoint::MultiTexCoord4x:
-            return "glMultiTexCoord4x";
-        case EntryPoint::MultiTexCoordP1ui:
-            return "glMultiTexCoordP1ui";
-        case EntryPoint::MultiTexCoordP1uiv:
-            return "glMultiTexCoordP1uiv";
-        case EntryPoint::MultiTexCoordP2ui:
-            return "glMultiTexCoordP2ui";
-        case EntryPoint::MultiTexCoordP2uiv:
-            return "glMultiTexCoordP2uiv";
-        case EntryPoint::MultiTexCoordP3ui:
-            return "glMultiTexCoordP3ui";
-        case EntryPoint::MultiTexCoordP3uiv:
-            return "glMultiTexCoordP3uiv";
-        case EntryPoint::MultiTexCoordP4ui:
-            return "glMultiTexCoordP4ui";
-        case EntryPoint::MultiTexCoordP4uiv:
-            return "glMultiTexCoordP4uiv";
-        case EntryPoint::NamedBufferData:
-            return "glNamedBufferData";
-        case EntryPoint::NamedBufferStorage:
-            return "glNamedBufferStorage";
-        case EntryPoint::NamedBufferSubData:
-            return "glNamedBufferSubData";
-        case EntryPoint::NamedFramebufferDrawBuffer:
-            return "glNamedFramebufferDrawBuffer";
-        case EntryPoint::NamedFramebufferDrawBuffers:
-            return "glNamedFramebufferDrawBuffers";
-        case EntryPoint::NamedFramebufferParameteri:
-            return "glNamedFramebufferParameteri";
-        case EntryPoint::NamedFramebufferReadBuffer:
-            return "glNamedFramebufferReadBuffer";
-        case EntryPoint::NamedFramebufferRenderbuffer:
-            return "glNamedFramebufferRenderbuffer";
-        case EntryPoint::NamedFramebufferTexture:
-            return "glNamedFramebufferTexture";
-        case EntryPoint::NamedFramebufferTextureLayer:
-            return "glNamedFramebufferTextureLayer";
-        case EntryPoint::NamedRenderbufferStorage:
-            return "glNamedRenderbufferStorage";
-        case EntryPoint::NamedRenderbufferStorageMultisample:
-            return "glNamedRenderbufferStorageMultisample";
-        case EntryPoint::NewList:
-            return "glNewList";
-        case EntryPoint::Normal3b:
-            return "glNormal3b";
-        case EntryPoint::Normal3bv:
-            return "glNormal3bv";
-        case EntryPoint::Normal3d:
-            return "glNormal3d";
-        case EntryPoint::Normal3dv:
-            return "glNormal3dv";
-        case EntryPoint::Normal3f:
-            return "glNormal3f";
-        case EntryPoint::Normal3fv:
-            return "glNormal3fv";
-        case EntryPoint::Normal3i:
-            return "glNormal3i";
-        case EntryPoint::Normal3iv:
-            return "glNormal3iv";
-        case EntryPoint::Normal3s:
-            return "glNormal3s";
-        case EntryPoint::Normal3sv:
-            return "glNormal3sv";
-        case EntryPoint::Normal3x:
-            return "glNormal3x";
-        case EntryPoint::NormalP3ui:
-            return "glNormalP3ui";
-        case EntryPoint::NormalP3uiv:
-            return "glNormalP3uiv";
-        case EntryPoint::NormalPointer:
-            return "glNormalPointer";
-        case EntryPoint::ObjectLabel:
-            return "glObjectLabel";
-        case EntryPoint::ObjectLabelKHR:
-            return "glObjectLabelKHR";
-        case EntryPoint::ObjectPtrLabel:
-            return "glObjectPtrLabel";
-        case EntryPoint::ObjectPtrLabelKHR:
-            return "glObjectPtrLabelKHR";
-        case EntryPoint::Ortho:
-            return "glOrtho";
-        case EntryPoint::Orthof:
-            return "glOrthof";
-        case EntryPoint::Orthox:
-            return "glOrthox";
-        case EntryPoint::PassThrough:
-            return "glPassThrough";
-        case EntryPoint::PatchParameterfv:
-            return "glPatchParameterfv";
-        case EntryPoint::PatchParameteri:
-            return "glPatchParameteri";
-        case EntryPoint::PathCommandsCHROMIUM:
-            return "glPathCommandsCHROMIUM";
-        case EntryPoint::PathParameterfCHROMIUM:
-            return "glPathParameterfCHROMIUM";
-        case EntryPoint::PathParameteriCHROMIUM:
-            return "glPathParameteriCHROMIUM";
-        case EntryPoint::PathStencilFuncCHROMIUM:
-            return "glPathStencilFuncCHROMIUM";
-        case EntryPoint::PauseTransformFeedback:
-            return "glPauseTransformFeedback";
-        case EntryPoint::PixelMapfv:
-            return "glPixelMapfv";
-        case EntryPoint::PixelMapuiv:
-            return "glPixelMapuiv";
-        case EntryPoint::PixelMapusv:
-            return "glPixelMapusv";
-        case EntryPoint::PixelStoref:
-            return "glPixelStoref";
-        case EntryPoint::PixelStorei:
-            return "glPixelStorei";
-        case EntryPoint::PixelTransferf:
-            return "glPixelTransferf";
-        case EntryPoint::PixelTransferi:
-            return "glPixelTransferi";
-        case EntryPoint::PixelZoom:
-            return "glPixelZoom";
-        case EntryPoint::PointParameterf:
-            return "glPointParameterf";
-        case EntryPoint::PointParameterfv:
-            return "glPointParameterfv";
-        case EntryPoint::PointParameteri:
-            return "glPointParameteri";
-        case EntryPoint::PointParameteriv:
-            return "glPointParameteriv";
-        case EntryPoint::PointParameterx:
-            return "glPointParameterx";
-        case EntryPoint::PointParameterxv:
-            return "glPointParameterxv";
-        case EntryPoint::PointSize:
-            return "glPointSize";
-        case EntryPoint::PointSizePointerOES:
-            return "glPointSizePointerOES";
-        case EntryPoint::PointSizex:
-            return "glPointSizex";
-        case EntryPoint::PolygonMode:
-            return "glPolygonMode";
-        case EntryPoint::PolygonOffset:
-            return "glPolygonOffset";
-        case EntryPoint::PolygonOffsetClamp:
-            return "glPolygonOffsetClamp";
-        case EntryPoint::PolygonOffsetx:
-            return "glPolygonOffsetx";
-        case EntryPoint::PolygonStipple:
-            return "glPolygonStipple";
-        case EntryPoint::PopAttrib:
-            return "glPopAttrib";
-        case EntryPoint::PopClientAttrib:
-            return "glPopClientAttrib";
-        case EntryPoint::PopDebugGroup:
-            return "glPopDebugGroup";
-        case EntryPoint::PopDebugGroupKHR:
-            return "glPopDebugGroupKHR";
-        case EntryPoint::PopGroupMarkerEXT:
-            return "glPopGroupMarkerEXT";
-        case EntryPoint::PopMatrix:
-            return "glPopMatrix";
-        case EntryPoint::PopName:
-            return "glPopName";
-        case EntryPoint::PrimitiveRestartIndex:
-            return "glPrimitiveRestartIndex";
-        case EntryPoint::PrioritizeTextures:
-            return "glPrioritizeTextures";
-        case EntryPoint::ProgramBinary:
-            return "glProgramBinary";
-        case EntryPoint::ProgramBinaryOES:
-            return "glProgramBinaryOES";
-        case EntryPoint::ProgramParameteri:
-            return "glProgramParameteri";
-        case EntryPoint::ProgramPathFragmentInputGenCHROMIUM:
-            return "glProgramPathFragmentInputGenCHROMIUM";
-        case EntryPoint::ProgramUniform1d:
-            return "glProgramUniform1d";
-        case EntryPoint::ProgramUniform1dv:
-            return "glProgramUniform1dv";
-        case EntryPoint::ProgramUniform1f:
-            return "glProgramUniform1f";
-        case EntryPoint::ProgramUniform1fv:
-            return "glProgramUniform1fv";
-        case EntryPoint::ProgramUniform1i:
-            return "glProgramUniform1i";
-        case EntryPoint::ProgramUniform1iv:
-            return "glProgramUniform1iv";
-        case EntryPoint::ProgramUniform1ui:
-            return "glProgramUniform1ui";
-        case EntryPoint::ProgramUniform1uiv:
-            return "glProgramUniform1uiv";
-        case EntryPoint::ProgramUniform2d:
-            return "glProgramUniform2d";
-        case EntryPoint::ProgramUniform2dv:
-            return "glProgramUniform2dv";
-        case EntryPoint::ProgramUniform2f:
-            return "glProgramUniform2f";
-        case EntryPoint::ProgramUniform2fv:
-            return "glProgramUniform2fv";
-        case EntryPoint::ProgramUniform2i:
-            return "glProgramUniform2i";
-        case EntryPoint::ProgramUniform2iv:
-            return "glProgramUniform2iv";
-        case EntryPoint::ProgramUniform2ui:
-            return "glProgramUniform2ui";
-        case EntryPoint::ProgramUniform2uiv:
-            return "glProgramUniform2uiv";
-        case EntryPoint::ProgramUniform3d:
-            return "glProgramUniform3d";
-        case EntryPoint::ProgramUniform3dv:
-            return "glProgramUniform3dv";
-        case EntryPoint::ProgramUniform3f:
-            return "glProgramUniform3f";
-        case EntryPoint::ProgramUniform3fv:
-            return "glProgramUniform3fv";
-        case EntryPoint::ProgramUniform3i:
-            return "glProgramUniform3i";
-        case EntryPoint::ProgramUniform3iv:
-            return "glProgramUniform3iv";
-        case EntryPoint::ProgramUniform3ui:
-            return "glProgramUniform3ui";
-        case EntryPoint::ProgramUniform3uiv:
-            return "glProgramUniform3uiv";
-        case EntryPoint::ProgramUniform4d:
-            return "glProgramUniform4d";
-        case EntryPoint::ProgramUniform4dv:
-            return "glProgramUniform4dv";
-        case EntryPoint::ProgramUniform4f:
-            return "glProgramUniform4f";
-        case EntryPoint::ProgramUniform4fv:
-            return "glProgramUniform4fv";
-        case EntryPoint::ProgramUniform4i:
-            return "glProgramUniform4i";
-        case EntryPoint::ProgramUniform4iv:
-            return "glProgramUniform4iv";
-        case EntryPoint::ProgramUniform4ui:
-            return "glProgramUniform4ui";
-        case EntryPoint::ProgramUniform4uiv:
-            return "glProgramUniform4uiv";
-        case EntryPoint::ProgramUniformMatrix2dv:
-            return "glProgramUniformMatrix2dv";
-        case EntryPoint::ProgramUniformMatrix2fv:
-            return "glProgramUniformMatrix2fv";
-        case EntryPoint::ProgramUniformMatrix2x3dv:
-            return "glProgramUniformMatrix2x3dv";
-        case EntryPoint::ProgramUniformMatrix2x3fv:
-            return "glProgramUniformMatrix2x3fv";
-        case EntryPoint::ProgramUniformMatrix2x4dv:
-            return "glProgramUniformMatrix2x4dv";
-        case EntryPoint::ProgramUniformMatrix2x4fv:
-            return "glProgramUniformMatrix2x4fv";
-        case EntryPoint::ProgramUniformMatrix3dv:
-            return "glProgramUniformMatrix3dv";
-        case EntryPoint::ProgramUniformMatrix3fv:
-            return "glProgramUniformMatrix3fv";
-        case EntryPoint::ProgramUniformMatrix3x2dv:
-            return "glProgramUniformMatrix3x2dv";
-        case EntryPoint::ProgramUniformMatrix3x2fv:
-            return "glProgramUniformMatrix3x2fv";
-        case EntryPoint::ProgramUniformMatrix3x4dv:
-            return "glProgramUniformMatrix3x4dv";
-        case EntryPoint::ProgramUniformMatrix3x4fv:
-            return "glProgramUniformMatrix3x4fv";
-        case EntryPoint::ProgramUniformMatrix4dv:
-            return "glProgramUniformMatrix4dv";
-        case EntryPoint::ProgramUniformMatrix4fv:
-            return "glProgramUniformMatrix4fv";
-        case EntryPoint::ProgramUniformMatrix4x2dv:
-            return "glProgramUniformMatrix4x2dv";
-        case EntryPoint::ProgramUniformMatrix4x2fv:
-            return "glProgramUniformMatrix4x2fv";
-        case EntryPoint::ProgramUniformMatrix4x3dv:
-            return "glProgramUniformMatrix4x3dv";
-        case EntryPoint::ProgramUniformMatrix4x3fv:
-            return "glProgramUniformMatrix4x3fv";
-        case EntryPoint::ProvokingVertex:
-            return "glProvokingVertex";
-        case EntryPoint::ProvokingVertexANGLE:
-            return "glProvokingVertexANGLE";
-        case EntryPoint::PushAttrib:
-            return "glPushAttrib";
-        case EntryPoint::PushClientAttrib:
-            return "glPushClientAttrib";
-        case EntryPoint::PushDebugGroup:
-            return "glPushDebugGroup";
-        case EntryPoint::PushDebugGroupKHR:
-            return "glPushDebugGroupKHR";
-        case EntryPoint::PushGroupMarkerEXT:
-            return "glPushGroupMarkerEXT";
-        case EntryPoint::PushMatrix:
-            return "glPushMatrix";
-        case EntryPoint::PushName:
-            return "glPushName";
-        case EntryPoint::QueryCounter:
-            return "glQueryCounter";
-        case EntryPoint::QueryCounterEXT:
-            return "glQueryCounterEXT";
-        case EntryPoint::QueryMatrixxOES:
-            return "glQueryMatrixxOES";
-        case EntryPoint::RasterPos2d:
-            return "glRasterPos2d";
-        case EntryPoint::RasterPos2dv:
-            return "glRasterPos2dv";
-        case EntryPoint::RasterPos2f:
-            return "glRasterPos2f";
-        case EntryPoint::RasterPos2fv:
-            return "glRasterPos2fv";
-        case EntryPoint::RasterPos2i:
-            return "glRasterPos2i";
-        case EntryPoint::RasterPos2iv:
-            return "glRasterPos2iv";
-        case EntryPoint::RasterPos2s:
-            return "glRasterPos2s";
-        case EntryPoint::RasterPos2sv:
-            return "glRasterPos2sv";
-        case EntryPoint::RasterPos3d:
-            return "glRasterPos3d";
-        case EntryPoint::RasterPos3dv:
-            return "glRasterPos3dv";
-        case EntryPoint::RasterPos3f:
-            return "glRasterPos3f";
-        case EntryPoint::RasterPos3fv:
-            return "glRasterPos3fv";
-        case EntryPoint::RasterPos3i:
-            return "glRasterPos3i";
-        case EntryPoint::RasterPos3iv:
-            return "glRasterPos3iv";
-        case EntryPoint::RasterPos3s:
-            return "glRasterPos3s";
-        case EntryPoint::RasterPos3sv:
-            return "glRasterPos3sv";
-        case EntryPoint::RasterPos4d:
-            return "glRasterPos4d";
-        case EntryPoint::RasterPos4dv:
-            return "glRasterPos4dv";
-        case EntryPoint::RasterPos4f:
-            return "glRasterPos4f";
-        case EntryPoint::RasterPos4fv:
-            return "glRasterPos4fv";
-        case EntryPoint::RasterPos4i:
-            return "glRasterPos4i";
-        case EntryPoint::RasterPos4iv:
-            return "glRasterPos4iv";
-        case EntryPoint::RasterPos4s:
-            return "glRasterPos4s";
-        case EntryPoint::RasterPos4sv:
-            return "glRasterPos4sv";
-        case EntryPoint::ReadBuffer:
-            return "glReadBuffer";
-        case EntryPoint::ReadPixels:
-            return "glReadPixels";
-        case EntryPoint::ReadPixelsRobustANGLE:
-            return "glReadPixelsRobustANGLE";
-        case EntryPoint::ReadnPixels:
-            return "glReadnPixels";
-        case EntryPoint::ReadnPixelsEXT:
-            return "glReadnPixelsEXT";
-        case EntryPoint::ReadnPixelsRobustANGLE:
-            return "glReadnPixelsRobustANGLE";
-        case EntryPoint::Rectd:
-            return "glRectd";
-        case EntryPoint::Rectdv:
-            return "glRectdv";
-        case EntryPoint::Rectf:
-            return "glRectf";
-        case EntryPoint::Rectfv:
-            return "glRectfv";
-        case EntryPoint::Recti:
-            return "glRecti";
-        case EntryPoint::Rectiv:
-            return "glRectiv";
-        case EntryPoint::Rects:
-            return "glRects";
-        case EntryPoint::Rectsv:
-            return "glRectsv";
-        case EntryPoint::ReleaseShaderCompiler:
-            return "glReleaseShaderCompiler";
-        case EntryPoint::RenderMode:
-            return "glRenderMode";
-        case EntryPoint::RenderbufferStorage:
-            return "glRenderbufferStorage";
-        case EntryPoint::RenderbufferStorageMultisample:
-            return "glRenderbufferStorageMultisample";
-        case EntryPoint::RenderbufferStorageMultisampleANGLE:
-            return "glRenderbufferStorageMultisampleANGLE";
-        case EntryPoint::RenderbufferStorageOES:
-            return "glRenderbufferStorageOES";
-        case EntryPoint::RequestExtensionANGLE:
-            return "glRequestExtensionANGLE";
-        case EntryPoint::ResumeTransformFeedback:
-            return "glResumeTransformFeedback";
-        case EntryPoint::Rotated:
-            return "glRotated";
-        case EntryPoint::Rotatef:
-            return "glRotatef";
-        case EntryPoint::Rotatex:
-            return "glRotatex";
-        case EntryPoint::SampleCoverage:
-            return "glSampleCoverage";
-        case EntryPoint::SampleCoveragex:
-            return "glSampleCoveragex";
-        case EntryPoint::SampleMaski:
-            return "glSampleMaski";
-        case EntryPoint::SampleMaskiANGLE:
-            return "glSampleMaskiANGLE";
-        case EntryPoint::SamplerParameterIiv:
-            return "glSamplerParameterIiv";
-        case EntryPoint::SamplerParameterIivOES:
-            return "glSamplerParameterIivOES";
-        case EntryPoint::SamplerParameterIivRobustANGLE:
-            return "glSamplerParameterIivRobustANGLE";
-        case EntryPoint::SamplerParameterIuiv:
-            return "glSamplerParameterIuiv";
-        case EntryPoint::SamplerParameterIuivOES:
-            return "glSamplerParameterIuivOES";
-        case EntryPoint::SamplerParameterIuivRobustANGLE:
-            return "glSamplerParameterIuivRobustANGLE";
-        case EntryPoint::SamplerParameterf:
-            return "glSamplerParameterf";
-        case EntryPoint::SamplerParameterfv:
-            return "glSamplerParameterfv";
-        case EntryPoint::SamplerParameterfvRobustANGLE:
-            return "glSamplerParameterfvRobustANGLE";
-        case EntryPoint::SamplerParameteri:
-            return "glSamplerParameteri";
-        case EntryPoint::SamplerParameteriv:
-            return "glSamplerParameteriv";
-        case EntryPoint::SamplerParameterivRobustANGLE:
-            return "glSamplerParameterivRobustANGLE";
-        case EntryPoint::Scaled:
-            return "glScaled";
-        case EntryPoint::Scalef:
-            return "glScalef";
-        case EntryPoint::Scalex:
-            return "glScalex";
-        case EntryPoint::Scissor:
-            return "glScissor";
-        case EntryPoint::ScissorArrayv:
-            return "glScissorArrayv";
-        case EntryPoint::ScissorIndexed:
-            return "glScissorIndexed";
-        case EntryPoint::ScissorIndexedv:
-            return "glScissorIndexedv";
-        case EntryPoint::SecondaryColor3b:
-            return "glSecondaryColor3b";
-        case EntryPoint::SecondaryColor3bv:
-            return "glSecondaryColor3bv";
-        case EntryPoint::SecondaryColor3d:
-            return "glSecondaryColor3d";
-        case EntryPoint::SecondaryColor3dv:
-            return "glSecondaryColor3dv";
-        case EntryPoint::SecondaryColor3f:
-            return "glSecondaryColor3f";
-        case EntryPoint::SecondaryColor3fv:
-            return "glSecondaryColor3fv";
-        case EntryPoint::SecondaryColor3i:
-            return "glSecondaryColor3i";
-        case EntryPoint::SecondaryColor3iv:
-            return "glSecondaryColor3iv";
-        case EntryPoint::SecondaryColor3s:
-            return "glSecondaryColor3s";
-        case EntryPoint::SecondaryColor3sv:
-            return "glSecondaryColor3sv";
-        case EntryPoint::SecondaryColor3ub:
-            return "glSecondaryColor3ub";
-        case EntryPoint::SecondaryColor3ubv:
-            return "glSecondaryColor3ubv";
-        case EntryPoint::SecondaryColor3ui:
-            return "glSecondaryColor3ui";
-        case EntryPoint::SecondaryColor3uiv:
-            return "glSecondaryColor3uiv";
-        case EntryPoint::SecondaryColor3us:
-            return "glSecondaryColor3us";
-        case EntryPoint::SecondaryColor3usv:
-            return "glSecondaryColor3usv";
-        case EntryPoint::SecondaryColorP3ui:
-            return "glSecondaryColorP3ui";
-        case EntryPoint::SecondaryColorP3uiv:
-            return "glSecondaryColorP3uiv";
-        case EntryPoint::SecondaryColorPointer:
-            return "glSecondaryColorPointer";
-        case EntryPoint::SelectBuffer:
-            return "glSelectBuffer";
-        case EntryPoint::SemaphoreParameterui64vEXT:
-            return "glSemaphoreParameterui64vEXT";
-        case EntryPoint::SetFenceNV:
-            return "glSetFenceNV";
-        case EntryPoint::ShadeModel:
-            return "glShadeModel";
-        case EntryPoint::ShaderBinary:
-            return "glShaderBinary";
-        case EntryPoint::ShaderSource:
-            return "glShaderSource";
-        case EntryPoint::ShaderStorageBlockBinding:
-            return "glShaderStorageBlockBinding";
-        case EntryPoint::SignalSemaphoreEXT:
-            return "glSignalSemaphoreEXT";
-        case EntryPoint::SpecializeShader:
-            return "glSpecializeShader";
-        case EntryPoint::StencilFillPathCHROMIUM:
-            return "glStencilFillPathCHROMIUM";
-        case EntryPoint::StencilFillPathInstancedCHROMIUM:
-            return "glStencilFillPathInstancedCHROMIUM";
-        case EntryPoint::StencilFunc:
-            return "glStencilFunc";
-        case EntryPoint::StencilFuncSeparate:
-            return "glStencilFuncSeparate";
-        case EntryPoint::StencilMask:
-            return "glStencilMask";
-        case EntryPoint::StencilMaskSeparate:
-            return "glStencilMaskSeparate";
-        case EntryPoint::StencilOp:
-            return "glStencilOp";
-        case EntryPoint::StencilOpSeparate:
-            return "glStencilOpSeparate";
-        case EntryPoint::StencilStrokePathCHROMIUM:
-            return "glStencilStrokePathCHROMIUM";
-        case EntryPoint::StencilStrokePathInstancedCHROMIUM:
-            return "glStencilStrokePathInstancedCHROMIUM";
-        case EntryPoint::StencilThenCoverFillPathCHROMIUM:
-            return "glStencilThenCoverFillPathCHROMIUM";
-        case EntryPoint::StencilThenCoverFillPathInstancedCHROMIUM:
-            return "glStencilThenCoverFillPathInstancedCHROMIUM";
-        case EntryPoint::StencilThenCoverStrokePathCHROMIUM:
-            return "glStencilThenCoverStrokePathCHROMIUM";
-        case EntryPoint::StencilThenCoverStrokePathInstancedCHROMIUM:
-            return "glStencilThenCoverStrokePathInstancedCHROMIUM";
-        case EntryPoint::TestFenceNV:
-            return "glTestFenceNV";
-        case EntryPoint::TexBuffer:
-            return "glTexBuffer";
-        case EntryPoint::TexBufferRange:
-            return "glTexBufferRange";
-        case EntryPoint::TexCoord1d:
-            return "glTexCoord1d";
-        case EntryPoint::TexCoord1dv:
-            return "glTexCoord1dv";
-        case EntryPoint::TexCoord1f:
-            return "glTexCoord1f";
-        case EntryPoint::TexCoord1fv:
-            return "glTexCoord1fv";
-        case EntryPoint::TexCoord1i:
-            return "glTexCoord1i";
-        case EntryPoint::TexCoord1iv:
-            return "glTexCoord1iv";
-        case EntryPoint::TexCoord1s:
-            return "glTexCoord1s";
-        case EntryPoint::TexCoord1sv:
-            return "glTexCoord1sv";
-        case EntryPoint::TexCoord2d:
-            return "glTexCoord2d";
-        case EntryPoint::TexCoord2dv:
-            return "glTexCoord2dv";
-        case EntryPoint::TexCoord2f:
-            return "glTexCoord2f";
-        case EntryPoint::TexCoord2fv:
-            return "glTexCoord2fv";
-        case EntryPoint::TexCoord2i:
-            return "glTexCoord2i";
-        case EntryPoint::TexCoord2iv:
-            return "glTexCoord2iv";
-        case EntryPoint::TexCoord2s:
-            return "glTexCoord2s";
-        case EntryPoint::TexCoord2sv:
-            return "glTexCoord2sv";
-        case EntryPoint::TexCoord3d:
-            return "glTexCoord3d";
-        case EntryPoint::TexCoord3dv:
-            return "glTexCoord3dv";
-        case EntryPoint::TexCoord3f:
-            return "glTexCoord3f";
-        case EntryPoint::TexCoord3fv:
-            return "glTexCoord3fv";
-        case EntryPoint::TexCoord3i:
-            return "glTexCoord3i";
-        case EntryPoint::TexCoord3iv:
-            return "glTexCoord3iv";
-        case EntryPoint::TexCoord3s:
-            return "glTexCoord3s";
-        case EntryPoint::TexCoord3sv:
-            return "glTexCoord3sv";
-        case EntryPoint::TexCoord4d:
-            return "glTexCoord4d";
-        case EntryPoint::TexCoord4dv:
-            return "glTexCoord4dv";
-        case EntryPoint::TexCoord4f:
-            return "glTexCoord4f";
-        case EntryPoint::TexCoord4fv:
-            return "glTexCoord4fv";
-        case EntryPoint::TexCoord4i:
-            return "glTexCoord4i";
-        case EntryPoint::TexCoord4iv:
-            return "glTexCoord4iv";
-        case EntryPoint::TexCoord4s:
-            return "glTexCoord4s";
-        case EntryPoint::TexCoord4sv:
-            return "glTexCoord4sv";
-        case EntryPoint::TexCoordP1ui:
-            return "glTexCoordP1ui";
-        case EntryPoint::TexCoordP1uiv:
-            return "glTexCoordP1uiv";
-        case EntryPoint::TexCoordP2ui:
-            return "glTexCoordP2ui";
-        case EntryPoint::TexCoordP2uiv:
-            return "glTexCoordP2uiv";
-        case EntryPoint::TexCoordP3ui:
-            return "glTexCoordP3ui";
-        case EntryPoint::TexCoordP3uiv:
-            return "glTexCoordP3uiv";
-        case EntryPoint::TexCoordP4ui:
-            return "glTexCoordP4ui";
-        case EntryPoint::TexCoordP4uiv:
-            return "glTexCoordP4uiv";
-        case EntryPoint::TexCoordPointer:
-            return "glTexCoordPointer";
-        case EntryPoint::TexEnvf:
-            return "glTexEnvf";
-        case EntryPoint::TexEnvfv:
-            return "glTexEnvfv";
-        case EntryPoint::TexEnvi:
-            return "glTexEnvi";
-        case EntryPoint::TexEnviv:
-            return "glTexEnviv";
-        case EntryPoint::TexEnvx:
-            return "glTexEnvx";
-        case EntryPoint::TexEnvxv:
-            return "glTexEnvxv";
-        case EntryPoint::TexGend:
-            return "glTexGend";
-        case EntryPoint::TexGendv:
-            return "glTexGendv";
-        case EntryPoint::TexGenf:
-            return "glTexGenf";
-        case EntryPoint::TexGenfOES:
-            return "glTexGenfOES";
-        case EntryPoint::TexGenfv:
-            return "glTexGenfv";
-        case EntryPoint::TexGenfvOES:
-            return "glTexGenfvOES";
-        case EntryPoint::TexGeni:
-            return "glTexGeni";
-        case EntryPoint::TexGeniOES:
-            return "glTexGeniOES";
-        case EntryPoint::TexGeniv:
-            return "glTexGeniv";
-        case EntryPoint::TexGenivOES:
-            return "glTexGenivOES";
-        case EntryPoint::TexGenxOES:
-            return "glTexGenxOES";
-        case EntryPoint::TexGenxvOES:
-            return "glTexGenxvOES";
-        case EntryPoint::TexImage1D:
-            return "glTexImage1D";
-        case EntryPoint::TexImage2D:
-            return "glTexImage2D";
-        case EntryPoint::TexImage2DExternalANGLE:
-            return "glTexImage2DExternalANGLE";
-        case EntryPoint::TexImage2DMultisample:
-            return "glTexImage2DMultisample";
-        case EntryPoint::TexImage2DRobustANGLE:
-            return "glTexImage2DRobustANGLE";
-        case EntryPoint::TexImage3D:
-            return "glTexImage3D";
-        case EntryPoint::TexImage3DMultisample:
-            return "glTexImage3DMultisample";
-        case EntryPoint::TexImage3DOES:
-            return "glTexImage3DOES";
-        case EntryPoint::TexImage3DRobustANGLE:
-            return "glTexImage3DRobustANGLE";
-        case EntryPoint::TexParameterIiv:
-            return "glTexParameterIiv";
-        case EntryPoint::TexParameterIivOES:
-            return "glTexParameterIivOES";
-        case EntryPoint::TexParameterIivRobustANGLE:
-            return "glTexParameterIivRobustANGLE";
-        case EntryPoint::TexParameterIuiv:
-            return "glTexParameterIuiv";
-        case EntryPoint::TexParameterIuivOES:
-            return "glTexParameterIuivOES";
-        case EntryPoint::TexParameterIuivRobustANGLE:
-            return "glTexParameterIuivRobustANGLE";
-        case EntryPoint::TexParameterf:
-            return "glTexParameterf";
-        case EntryPoint::TexParameterfv:
-            return "glTexParameterfv";
-        case EntryPoint::TexParameterfvRobustANGLE:
-            return "glTexParameterfvRobustANGLE";
-        case EntryPoint::TexParameteri:
-            return "glTexParameteri";
-        case EntryPoint::TexParameteriv:
-            return "glTexParameteriv";
-        case EntryPoint::TexParameterivRobustANGLE:
-            return "glTexParameterivRobustANGLE";
-        case EntryPoint::TexParameterx:
-            return "glTexParameterx";
-        case EntryPoint::TexParameterxv:
-            return "glTexParameterxv";
-        case EntryPoint::TexStorage1D:
-            return "glTexStorage1D";
-        case EntryPoint::TexStorage1DEXT:
-            return "glTexStorage1DEXT";
-        case EntryPoint::TexStorage2D:
-            return "glTexStorage2D";
-        case EntryPoint::TexStorage2DEXT:
-            return "glTexStorage2DEXT";
-        case EntryPoint::TexStorage2DMultisample:
-            return "glTexStorage2DMultisample";
-        case EntryPoint::TexStorage2DMultisampleANGLE:
-            return "glTexStorage2DMultisampleANGLE";
-        case EntryPoint::TexStorage3D:
-            return "glTexStorage3D";
-        case EntryPoint::TexStorage3DEXT:
-            return "glTexStorage3DEXT";
-        case EntryPoint::TexStorage3DMultisample:
-            return "glTexStorage3DMultisample";
-        case EntryPoint::TexStorage3DMultisampleOES:
-            return "glTexStorage3DMultisampleOES";
-        case EntryPoint::TexStorageMem2DEXT:
-            return "glTexStorageMem2DEXT";
-        case EntryPoint::TexStorageMem2DMultisampleEXT:
-            return "glTexStorageMem2DMultisampleEXT";
-        case EntryPoint::TexStorageMem3DEXT:
-            return "glTexStorageMem3DEXT";
-        case EntryPoint::TexStorageMem3DMultisampleEXT:
-            return "glTexStorageMem3DMultisampleEXT";
-        case EntryPoint::TexSubImage1D:
-            return "glTexSubImage1D";
-        case EntryPoint::TexSubImage2D:
-            return "glTexSubImage2D";
-        case EntryPoint::TexSubImage2DRobustANGLE:
-            return "glTexSubImage2DRobustANGLE";
-        case EntryPoint::TexSubImage3D:
-            return "glTexSubImage3D";
-        case EntryPoint::TexSubImage3DOES:
-            return "glTexSubImage3DOES";
-        case EntryPoint::TexSubImage3DRobustANGLE:
-            return "glTexSubImage3DRobustANGLE";
-        case EntryPoint::TextureBarrier:
-            return "glTextureBarrier";
-        case EntryPoint::TextureBuffer:
-            return "glTextureBuffer";
-        case EntryPoint::TextureBufferRange:
-            return "glTextureBufferRange";
-        case EntryPoint::TextureParameterIiv:
-            return "glTextureParameterIiv";
-        case EntryPoint::TextureParameterIuiv:
-            return "glTextureParameterIuiv";
-        case EntryPoint::TextureParameterf:
-            return "glTextureParameterf";
-        case EntryPoint::TextureParameterfv:
-            return "glTextureParameterfv";
-        case EntryPoint::TextureParameteri:
-            return "glTextureParameteri";
-        case EntryPoint::TextureParameteriv:
-            return "glTextureParameteriv";
-        case EntryPoint::TextureStorage1D:
-            return "glTextureStorage1D";
-        case EntryPoint::TextureStorage2D:
-            return "glTextureStorage2D";
-        case EntryPoint::TextureStorage2DMultisample:
-            return "glTextureStorage2DMultisample";
-        case EntryPoint::TextureStorage3D:
-            return "glTextureStorage3D";
-        case EntryPoint::TextureStorage3DMultisample:
-            return "glTextureStorage3DMultisample";
-        case EntryPoint::TextureSubImage1D:
-            return "glTextureSubImage1D";
-        case EntryPoint::TextureSubImage2D:
-            return "glTextureSubImage2D";
-        case EntryPoint::TextureSubImage3D:
-            return "glTextureSubImage3D";
-        case EntryPoint::TextureView:
-            return "glTextureView";
-        case EntryPoint::TransformFeedbackBufferBase:
-            return "glTransformFeedbackBufferBase";
-        case EntryPoint::TransformFeedbackBufferRange:
-            return "glTransformFeedbackBufferRange";
-        case EntryPoint::TransformFeedbackVaryings:
-            return "glTransformFeedbackVaryings";
-        case EntryPoint::Translated:
-            return "glTranslated";
-        case EntryPoint::Translatef:
-            return "glTranslatef";
-        case EntryPoint::Translatex:
-            return "glTranslatex";
-        case EntryPoint::Uniform1d:
-            return "glUniform1d";
-        case EntryPoint::Uniform1dv:
-            return "glUniform1dv";
-        case EntryPoint::Uniform1f:
-            return "glUniform1f";
-        case EntryPoint::Uniform1fv:
-            return "glUniform1fv";
-        case EntryPoint::Uniform1i:
-            return "glUniform1i";
-        case EntryPoint::Uniform1iv:
-            return "glUniform1iv";
-        case EntryPoint::Uniform1ui:
-            return "glUniform1ui";
-        case EntryPoint::Uniform1uiv:
-            return "glUniform1uiv";
-        case EntryPoint::Uniform2d:
-            return "glUniform2d";
-        case EntryPoint::Uniform2dv:
-            return "glUniform2dv";
-        case EntryPoint::Uniform2f:
-            return "glUniform2f";
-        case EntryPoint::Uniform2fv:
-            return "glUniform2fv";
-        case EntryPoint::Uniform2i:
-            return "glUniform2i";
-        case EntryPoint::Uniform2iv:
-            return "glUniform2iv";
-        case EntryPoint::Uniform2ui:
-            return "glUniform2ui";
-        case EntryPoint::Uniform2uiv:
-            return "glUniform2uiv";
-        case EntryPoint::Uniform3d:
-            return "glUniform3d";
-        case EntryPoint::Uniform3dv:
-            return "glUniform3dv";
-        case EntryPoint::Uniform3f:
-            return "glUniform3f";
-        case EntryPoint::Uniform3fv:
-            return "glUniform3fv";
-        case EntryPoint::Uniform3i:
-            return "glUniform3i";
-        case EntryPoint::Uniform3iv:
-            return "glUniform3iv";
-        case EntryPoint::Uniform3ui:
-            return "glUniform3ui";
-        case EntryPoint::Uniform3uiv:
-            return "glUniform3uiv";
-        case EntryPoint::Uniform4d:
-            return "glUniform4d";
-        case EntryPoint::Uniform4dv:
-            return "glUniform4dv";
-        case EntryPoint::Uniform4f:
-            return "glUniform4f";
-        case EntryPoint::Uniform4fv:
-            return "glUniform4fv";
-        case EntryPoint::Uniform4i:
-            return "glUniform4i";
-        case EntryPoint::Uniform4iv:
-            return "glUniform4iv";
-        case EntryPoint::Uniform4ui:
-            return "glUniform4ui";
-        case EntryPoint::Uniform4uiv:
-            return "glUniform4uiv";
-        case EntryPoint::UniformBlockBinding:
-            return "glUniformBlockBinding";
-        case EntryPoint::UniformMatrix2dv:
-            return "glUniformMatrix2dv";
-        case EntryPoint::UniformMatrix2fv:
-            return "glUniformMatrix2fv";
-        case EntryPoint::UniformMatrix2x3dv:
-            return "glUniformMatrix2x3dv";
-        case EntryPoint::UniformMatrix2x3fv:
-            return "glUniformMatrix2x3fv";
-        case EntryPoint::UniformMatrix2x4dv:
-            return "glUniformMatrix2x4dv";
-        case EntryPoint::UniformMatrix2x4fv:
-            return "glUniformMatrix2x4fv";
-        case EntryPoint::UniformMatrix3dv:
-            return "glUniformMatrix3dv";
-        case EntryPoint::UniformMatrix3fv:
-            return "glUniformMatrix3fv";
-        case EntryPoint::UniformMatrix3x2dv:
-            return "glUniformMatrix3x2dv";
-        case EntryPoint::UniformMatrix3x2fv:
-            return "glUniformMatrix3x2fv";
-        case EntryPoint::UniformMatrix3x4dv:
-            return "glUniformMatrix3x4dv";
-        case EntryPoint::UniformMatrix3x4fv:
-            return "glUniformMatrix3x4fv";
-        case EntryPoint::UniformMatrix4dv:
-            return "glUniformMatrix4dv";
-        case EntryPoint::UniformMatrix4fv:
-            return "glUniformMatrix4fv";
-        case EntryPoint::UniformMatrix4x2dv:
-            return "glUniformMatrix4x2dv";
-        case EntryPoint::UniformMatrix4x2fv:
-            return "glUniformMatrix4x2fv";
-        case EntryPoint::UniformMatrix4x3dv:
-            return "glUniformMatrix4x3dv";
-        case EntryPoint::UniformMatrix4x3fv:
-            return "glUniformMatrix4x3fv";
-        case EntryPoint::UniformSubroutinesuiv:
-            return "glUniformSubroutinesuiv";
-        case EntryPoint::UnmapBuffer:
-            return "glUnmapBuffer";
-        case EntryPoint::UnmapBufferOES:
-            return "glUnmapBufferOES";
-        case EntryPoint::UnmapNamedBuffer:
-            return "glUnmapNamedBuffer";
-        case EntryPoint::UseProgram:
-            return "glUseProgram";
-        case EntryPoint::UseProgramStages:
-            return "glUseProgramStages";
-        case EntryPoint::ValidateProgram:
-            return "glValidateProgram";
-        case EntryPoint::ValidateProgramPipeline:
-            return "glValidateProgramPipeline";
-        case EntryPoint::Vertex2d:
-            return "glVertex2d";
-        case EntryPoint::Vertex2dv:
-            return "glVertex2dv";
-        case EntryPoint::Vertex2f:
-            return "glVertex2f";
-        case EntryPoint::Vertex2fv:
-            return "glVertex2fv";
-        case EntryPoint::Vertex2i:
-            return "glVertex2i";
-        case EntryPoint::Vertex2iv:
-            return "glVertex2iv";
-        case EntryPoint::Vertex2s:
-            return "glVertex2s";
-        case EntryPoint::Vertex2sv:
-            return "glVertex2sv";
-        case EntryPoint::Vertex3d:
-            return "glVertex3d";
-        case EntryPoint::Vertex3dv:
-            return "glVertex3dv";
-        case EntryPoint::Vertex3f:
-            return "glVertex3f";
-        case EntryPoint::Vertex3fv:
-            return "glVertex3fv";
-        case EntryPoint::Vertex3i:
-            return "glVertex3i";
-        case EntryPoint::Vertex3iv:
-            return "glVertex3iv";
-        case EntryPoint::Vertex3s:
-            return "glVertex3s";
-        case EntryPoint::Vertex3sv:
-            return "glVertex3sv";
-        case EntryPoint::Vertex4d:
-            return "glVertex4d";
-        case EntryPoint::Vertex4dv:
-            return "glVertex4dv";
-        case EntryPoint::Vertex4f:
-            return "glVertex4f";
-        case EntryPoint::Vertex4fv:
-            return "glVertex4fv";
-        case EntryPoint::Vertex4i:
-            return "glVertex4i";
-        case EntryPoint::Vertex4iv:
-            return "glVertex4iv";
-        case EntryPoint::Vertex4s:
-            return "glVertex4s";
-        case EntryPoint::Vertex4sv:
-            return "glVertex4sv";
-        case EntryPoint::VertexArrayAttribBinding:
-            return "glVertexArrayAttribBinding";
-        case EntryPoint::VertexArrayAttribFormat:
-            return "glVertexArrayAttribFormat";
-        case EntryPoint::VertexArrayAttribIFormat:
-            return "glVertexArrayAttribIFormat";
-        case EntryPoint::VertexArrayAttribLFormat:
-            return "glVertexArrayAttribLFormat";
-        case EntryPoint::VertexArrayBindingDivisor:
-            return "glVertexArrayBindingDivisor";
-        case EntryPoint::VertexArrayElementBuffer:
-            return "glVertexArrayElementBuffer";
-        case EntryPoint::VertexArrayVertexBuffer:
-            return "glVertexArrayVertexBuffer";
-        case EntryPoint::VertexArrayVertexBuffers:
-            return "glVertexArrayVertexBuffers";
-        case EntryPoint::VertexAttrib1d:
-            return "glVertexAttrib1d";
-        case EntryPoint::VertexAttrib1dv:
-            return "glVertexAttrib1dv";
-        case EntryPoint::VertexAttrib1f:
-            return "glVertexAttrib1f";
-        case EntryPoint::VertexAttrib1fv:
-            return "glVertexAttrib1fv";
-        case EntryPoint::VertexAttrib1s:
-            return "glVertexAttrib1s";
-        case EntryPoint::VertexAttrib1sv:
-            return "glVertexAttrib1sv";
-        case EntryPoint::VertexAttrib2d:
-            return "glVertexAttrib2d";
-        case EntryPoint::VertexAttrib2dv:
-            return "glVertexAttrib2dv";
-        case EntryPoint::VertexAttrib2f:
-            return "glVertexAttrib2f";
-        case EntryPoint::VertexAttrib2fv:
-            return "glVertexAttrib2fv";
-        case EntryPoint::VertexAttrib2s:
-            return "glVertexAttrib2s";
-        case EntryPoint::VertexAttrib2sv:
-            return "glVertexAttrib2sv";
-        case EntryPoint::VertexAttrib3d:
-            return "glVertexAttrib3d";
-        case EntryPoint::VertexAttrib3dv:
-            return "glVertexAttrib3dv";
-        case EntryPoint::VertexAttrib3f:
-            return "glVertexAttrib3f";
-        case EntryPoint::VertexAttrib3fv:
-            return "glVertexAttrib3fv";
-        case EntryPoint::VertexAttrib3s:
-            return "glVertexAttrib3s";
-        case EntryPoint::VertexAttrib3sv:
-            return "glVertexAttrib3sv";
-        case EntryPoint::VertexAttrib4Nbv:
-            return "glVertexAttrib4Nbv";
-        case EntryPoint::VertexAttrib4Niv:
-            return "glVertexAttrib4Niv";
-        case EntryPoint::VertexAttrib4Nsv:
-            return "glVertexAttrib4Nsv";
-        case EntryPoint::VertexAttrib4Nub:
-            return "glVertexAttrib4Nub";
-        case EntryPoint::VertexAttrib4Nubv:
-            return "glVertexAttrib4Nubv";
-        case EntryPoint::VertexAttrib4Nuiv:
-            return "glVertexAttrib4Nuiv";
-        case EntryPoint::VertexAttrib4Nusv:
-            return "glVertexAttrib4Nusv";
-        case EntryPoint::VertexAttrib4bv:
-            return "glVertexAttrib4bv";
-        case EntryPoint::VertexAttrib4d:
-            return "glVertexAttrib4d";
-        case EntryPoint::VertexAttrib4dv:
-            return "glVertexAttrib4dv";
-        case EntryPoint::VertexAttrib4f:
-            return "glVertexAttrib4f";
-        case EntryPoint::VertexAttrib4fv:
-            return "glVertexAttrib4fv";
-        case EntryPoint::VertexAttrib4iv:
-            return "glVertexAttrib4iv";
-        case EntryPoint::VertexAttrib4s:
-            return "glVertexAttrib4s";
-        case EntryPoint::VertexAttrib4sv:
-            return "glVertexAttrib4sv";
-        case EntryPoint::VertexAttrib4ubv:
-            return "glVertexAttrib4ubv";
-        case EntryPoint::VertexAttrib4uiv:
-            return "glVertexAttrib4uiv";
-        case EntryPoint::VertexAttrib4usv:
-            return "glVertexAttrib4usv";
-        case EntryPoint::VertexAttribBinding:
-            return "glVertexAttribBinding";
-        case EntryPoint::VertexAttribDivisor:
-            return "glVertexAttribDivisor";
-        case EntryPoint::VertexAttribDivisorANGLE:
-            return "glVertexAttribDivisorANGLE";
-        case EntryPoint::VertexAttribDivisorEXT:
-            return "glVertexAttribDivisorEXT";
-        case EntryPoint::VertexAttribFormat:
-            return "glVertexAttribFormat";
-        case EntryPoint::VertexAttribI1i:
-            return "glVertexAttribI1i";
-        case EntryPoint::VertexAttribI1iv:
-            return "glVertexAttribI1iv";
-        case EntryPoint::VertexAttribI1ui:
-            return "glVertexAttribI1ui";
-        case EntryPoint::VertexAttribI1uiv:
-            return "glVertexAttribI1uiv";
-        case EntryPoint::VertexAttribI2i:
-            return "glVertexAttribI2i";
-        case EntryPoint::VertexAttribI2iv:
-            return "glVertexAttribI2iv";
-        case EntryPoint::VertexAttribI2ui:
-            return "glVertexAttribI2ui";
-        case EntryPoint::VertexAttribI2uiv:
-            return "glVertexAttribI2uiv";
-        case EntryPoint::VertexAttribI3i:
-            return "glVertexAttribI3i";
-        case EntryPoint::VertexAttribI3iv:
-            return "glVertexAttribI3iv";
-        case EntryPoint::VertexAttribI3ui:
-            return "glVertexAttribI3ui";
-        case EntryPoint::VertexAttribI3uiv:
-            return "glVertexAttribI3uiv";
-        case EntryPoint::VertexAttribI4bv:
-            return "glVertexAttribI4bv";
-        case EntryPoint::VertexAttribI4i:
-            return "glVertexAttribI4i";
-        case EntryPoint::VertexAttribI4iv:
-            return "glVertexAttribI4iv";
-        case EntryPoint::VertexAttribI4sv:
-            return "glVertexAttribI4sv";
-        case EntryPoint::VertexAttribI4ubv:
-            return "glVertexAttribI4ubv";
-        case EntryPoint::VertexAttribI4ui:
-            return "glVertexAttribI4ui";
-        case EntryPoint::VertexAttribI4uiv:
-            return "glVertexAttribI4uiv";
-        case EntryPoint::VertexAttribI4usv:
-            return "glVertexAttribI4usv";
-        case EntryPoint::VertexAttribIFormat:
-            return "glVertexAttribIFormat";
-        case EntryPoint::VertexAttribIPointer:
-            return "glVertexAttribIPointer";
-        case EntryPoint::VertexAttribL1d:
-            return "glVertexAttribL1d";
-        case EntryPoint::VertexAttribL1dv:
-            return "glVertexAttribL1dv";
-        case EntryPoint::VertexAttribL2d:
-            return "glVertexAttribL2d";
-        case EntryPoint::VertexAttribL2dv:
-            return "glVertexAttribL2dv";
-        case EntryPoint::VertexAttribL3d:
-            return "glVertexAttribL3d";
-        case EntryPoint::VertexAttribL3dv:
-            return "glVertexAttribL3dv";
-        case EntryPoint::VertexAttribL4d:
-            return "glVertexAttribL4d";
-        case EntryPoint::VertexAttribL4dv:
-            return "glVertexAttribL4dv";
-        case EntryPoint::VertexAttribLFormat:
-            return "glVertexAttribLFormat";
-        case EntryPoint::VertexAttribLPointer:
-            return "glVertexAttribLPointer";
-        case EntryPoint::VertexAttribP1ui:
-            return "glVertexAttribP1ui";
-        case EntryPoint::VertexAttribP1uiv:
-            return "glVertexAttribP1uiv";
-        case EntryPoint::VertexAttribP2ui:
-            return "glVertexAttribP2ui";
-        case EntryPoint::VertexAttribP2uiv:
-            return "glVertexAttribP2uiv";
-        case EntryPoint::VertexAttribP3ui:
-            return "glVertexAttribP3ui";
-        case EntryPoint::VertexAttribP3uiv:
-            return "glVertexAttribP3uiv";
-        case EntryPoint::VertexAttribP4ui:
-            return "glVertexAttribP4ui";
-        case EntryPoint::VertexAttribP4uiv:
-            return "glVertexAttribP4uiv";
-        case EntryPoint::VertexAttribPointer:
-            return "glVertexAttribPointer";
-        case EntryPoint::VertexBindingDivisor:
-            return "glVertexBindingDivisor";
-        case EntryPoint::VertexP2ui:
-            return "glVertexP2ui";
-        case EntryPoint::VertexP2uiv:
-            return "glVertexP2uiv";
-        case EntryPoint::VertexP3ui:
-            return "glVertexP3ui";
-        case EntryPoint::VertexP3uiv:
-            return "glVertexP3uiv";
-        case EntryPoint::VertexP4ui:
-            return "glVertexP4ui";
-        case EntryPoint::VertexP4uiv:
-            return "glVertexP4uiv";
-        case EntryPoint::VertexPointer:
-            return "glVertexPointer";
-        case EntryPoint::Viewport:
-            return "glViewport";
-        case EntryPoint::ViewportArrayv:
-            return "glViewportArrayv";
-        case EntryPoint::ViewportIndexedf:
-            return "glViewportIndexedf";
-        case EntryPoint::ViewportIndexedfv:
-            return "glViewportIndexedfv";
-        case EntryPoint::WaitSemaphoreEXT:
-            return "glWaitSemaphoreEXT";
-        case EntryPoint::WaitSync:
-            return "glWaitSync";
-        case EntryPoint::WeightPointerOES:
-            return "glWeightPointerOES";
-        case EntryPoint::WindowPos2d:
-            return "glWindowPos2d";
-        case EntryPoint::WindowPos2dv:
-            return "glWindowPos2dv";
-        case EntryPoint::WindowPos2f:
-            return "glWindowPos2f";
-        case EntryPoint::WindowPos2fv:
-            return "glWindowPos2fv";
-        case EntryPoint::WindowPos2i:
-            return "glWindowPos2i";
-        case EntryPoint::WindowPos2iv:
-            return "glWindowPos2iv";
-        case EntryPoint::WindowPos2s:
-            return "glWindowPos2s";
-        case EntryPoint::WindowPos2sv:
-            return "glWindowPos2sv";
-        case EntryPoint::WindowPos3d:
-            return "glWindowPos3d";
-        case EntryPoint::WindowPos3dv:
-            return "glWindowPos3dv";
-        case EntryPoint::WindowPos3f:
-            return "glWindowPos3f";
-        case EntryPoint::WindowPos3fv:
-            return "glWindowPos3fv";
-        case EntryPoint::WindowPos3i:
-            return "glWindowPos3i";
-        case EntryPoint::WindowPos3iv:
-            return "glWindowPos3iv";
-        case EntryPoint::WindowPos3s:
-            return "glWindowPos3s";
-        case EntryPoint::WindowPos3sv:
-            return "glWindowPos3sv";
-        default:
-            UNREACHABLE();
-            return "error";
+        UNREACHABLE();
+        return "error";
     }
+    return &kEntryPointNames[kEntryPointNameOffsets[index]];
 }
 }  // namespace gl
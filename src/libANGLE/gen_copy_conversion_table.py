@@ -12,6 +12,8 @@ import sys
 
 sys.path.append('renderer')
 import angle_format
+sys.path.append('../../scripts')
+import code_generation_utils
 
 template_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
@@ -74,7 +76,7 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = [data_source_name]
+        inputs = [data_source_name, '../../scripts/code_generation_utils.py']
         outputs = [out_file_name]
 
         if sys.argv[1] == 'inputs':
@@ -101,14 +103,12 @@ def main():
     for texture_format, framebuffer_formats in sorted(format_map.iteritems()):
         texture_format_cases += parse_texture_format_case(texture_format, framebuffer_formats)
 
-    with open(out_file_name, 'wt') as out_file:
-        output_cpp = template_cpp.format(
-            script_name=sys.argv[0],
-            data_source_name=data_source_name,
-            copyright_year=date.today().year,
-            texture_format_cases=texture_format_cases)
-        out_file.write(output_cpp)
-        out_file.close()
+    output_cpp = template_cpp.format(
+        script_name=sys.argv[0],
+        data_source_name=data_source_name,
+        copyright_year=date.today().year,
+        texture_format_cases=texture_format_cases)
+    code_generation_utils.write_file_if_changed(out_file_name, output_cpp)
     return 0
 
 
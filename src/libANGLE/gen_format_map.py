@@ -13,6 +13,8 @@ import sys
 
 sys.path.append('renderer')
 import angle_format
+sys.path.append('../../scripts')
+import code_generation_utils
 
 template_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
@@ -127,7 +129,11 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['es3_format_type_combinations.json', 'format_map_data.json']
+        inputs = [
+            '../../scripts/code_generation_utils.py',
+            'es3_format_type_combinations.json',
+            'format_map_data.json',
+        ]
         outputs = ['format_map_autogen.cpp']
 
         if sys.argv[1] == 'inputs':
@@ -190,17 +196,16 @@ def main():
 
         es3_combo_cases += template_format_case.format(format=format, type_cases=this_type_cases)
 
-    with open('format_map_autogen.cpp', 'wt') as out_file:
-        output_cpp = template_cpp.format(
-            script_name=sys.argv[0],
-            data_source_name=input_script,
-            es3_data_source_name=combo_data_file,
-            copyright_year=date.today().year,
-            format_cases=format_cases,
-            es3_format_cases=es3_format_cases,
-            es3_type_cases=es3_type_cases,
-            es3_combo_cases=es3_combo_cases)
-        out_file.write(output_cpp)
+    output_cpp = template_cpp.format(
+        script_name=sys.argv[0],
+        data_source_name=input_script,
+        es3_data_source_name=combo_data_file,
+        copyright_year=date.today().year,
+        format_cases=format_cases,
+        es3_format_cases=es3_format_cases,
+        es3_type_cases=es3_type_cases,
+        es3_combo_cases=es3_combo_cases)
+    code_generation_utils.write_file_if_changed('format_map_autogen.cpp', output_cpp)
     return 0
 
 
@@ -12,9 +12,16 @@ import re
 
 kChannels = "ABDEGLRSX"
 
+# Parsed JSON files, shared by all generators running in the same process. The returned tables
+# must be treated as read-only.
+_json_cache = {}
+
+# Resolved at import time since __file__ may be relative to the importing script's directory.
+_angle_format_dir = os.path.dirname(os.path.realpath(__file__))
+
 
 def get_angle_format_map_abs_path():
-    return os.path.join(os.path.dirname(os.path.realpath(__file__)), 'angle_format_map.json')
+    return os.path.join(_angle_format_dir, 'angle_format_map.json')
 
 
 def reject_duplicate_keys(pairs):
@@ -28,8 +35,12 @@ def reject_duplicate_keys(pairs):
 
 
 def load_json(path):
-    with open(path) as map_file:
-        return json.loads(map_file.read(), object_pairs_hook=reject_duplicate_keys)
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_size, st.st_mtime)
+    if key not in _json_cache:
+        with open(path) as map_file:
+            _json_cache[key] = json.loads(map_file.read(), object_pairs_hook=reject_duplicate_keys)
+    return _json_cache[key]
 
 
 def load_forward_table(path):
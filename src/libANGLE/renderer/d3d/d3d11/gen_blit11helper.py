@@ -11,6 +11,9 @@
 import sys, os, pprint
 from datetime import date
 
+sys.path.append('../../../../../scripts')
+import code_generation_utils
+
 template_blitshader_source = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name}.
 //
@@ -296,9 +299,7 @@ def write_inc_file(get_blitshaders_case_list, add_blitshader_case_list, shader_i
 
     path = os.path.join("Blit11Helper_autogen.inc")
 
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
+    code_generation_utils.write_file_if_changed(path, content)
 
 
 def write_gni_file(shader_filename_list):
@@ -309,16 +310,14 @@ def write_gni_file(shader_filename_list):
 
     path = os.path.join("d3d11_blit_shaders_autogen.gni")
 
-    with open(path, "w") as out:
-        out.write(content)
-        out.close()
+    code_generation_utils.write_file_if_changed(path, content)
 
 
 def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = []
+        inputs = ['../../../../../scripts/code_generation_utils.py']
         outputs = ['Blit11Helper_autogen.inc', 'd3d11_blit_shaders_autogen.gni']
 
         if sys.argv[1] == 'inputs':
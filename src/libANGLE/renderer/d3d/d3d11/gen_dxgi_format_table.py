@@ -12,6 +12,8 @@ import sys
 
 sys.path.append('../..')
 import angle_format
+sys.path.append('../../../../../scripts')
+import code_generation_utils
 
 template_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}.
@@ -92,6 +94,7 @@ def main():
             '../../angle_format.py',
             '../../angle_format_map.json',
             'dxgi_format_data.json',
+            '../../../../../scripts/code_generation_utils.py',
         ]
         outputs = ['dxgi_format_map_autogen.cpp']
 
@@ -144,15 +147,13 @@ def main():
         else:
             format_cases += undefined_case(dxgi_format)
 
-    with open('dxgi_format_map_autogen.cpp', 'wt') as out_file:
-        output_cpp = template_cpp.format(
-            script_name=sys.argv[0],
-            data_source_name=input_data,
-            copyright_year=date.today().year,
-            component_type_cases=component_cases,
-            format_cases=format_cases)
-        out_file.write(output_cpp)
-        out_file.close()
+    output_cpp = template_cpp.format(
+        script_name=sys.argv[0],
+        data_source_name=input_data,
+        copyright_year=date.today().year,
+        component_type_cases=component_cases,
+        format_cases=format_cases)
+    code_generation_utils.write_file_if_changed('dxgi_format_map_autogen.cpp', output_cpp)
     return 0
 
 
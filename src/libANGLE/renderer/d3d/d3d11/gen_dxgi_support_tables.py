@@ -22,6 +22,9 @@
 import sys
 import json
 
+sys.path.append('../../../../../scripts')
+import code_generation_utils
+
 macro_prefix = 'F_'
 
 template = """// GENERATED FILE - DO NOT EDIT. See dxgi_support_data.json.
@@ -302,7 +305,7 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['dxgi_support_data.json']
+        inputs = ['dxgi_support_data.json', '../../../../../scripts/code_generation_utils.py']
         outputs = ['dxgi_support_table_autogen.cpp']
 
         if sys.argv[1] == 'inputs':
@@ -332,9 +335,7 @@ def main():
             table_data_11_0=table_data['11_0'],
             table_data_11_1=table_data['11_1'])
 
-        with open('dxgi_support_table_autogen.cpp', 'wt') as out_file:
-            out_file.write(out_data)
-            out_file.close()
+        code_generation_utils.write_file_if_changed('dxgi_support_table_autogen.cpp', out_data)
     return 0
 
 
@@ -17,6 +17,8 @@ import sys
 
 sys.path.append('../..')
 import angle_format
+sys.path.append('../../../../../scripts')
+import code_generation_utils
 
 template_texture_format_table_autogen_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}
@@ -286,7 +288,12 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['../../angle_format.py', 'texture_format_data.json', 'texture_format_map.json']
+        inputs = [
+            '../../angle_format.py',
+            '../../../../../scripts/code_generation_utils.py',
+            'texture_format_data.json',
+            'texture_format_map.json',
+        ]
         outputs = ['texture_format_table_autogen.cpp']
 
         if sys.argv[1] == 'inputs':
@@ -308,9 +315,7 @@ def main():
         copyright_year=date.today().year,
         angle_format_info_cases=angle_format_cases,
         data_source_name=data_source_name)
-    with open('texture_format_table_autogen.cpp', 'wt') as out_file:
-        out_file.write(output_cpp)
-        out_file.close()
+    code_generation_utils.write_file_if_changed('texture_format_table_autogen.cpp', output_cpp)
     return 0
 
 
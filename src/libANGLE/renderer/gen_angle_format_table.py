@@ -16,6 +16,9 @@ import pprint
 import re
 import sys
 
+sys.path.append('../../../scripts')
+import code_generation_utils
+
 template_autogen_h = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name}
 //
@@ -366,7 +369,12 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['angle_format.py', 'angle_format_data.json', 'angle_format_map.json']
+        inputs = [
+            'angle_format.py',
+            'angle_format_data.json',
+            'angle_format_map.json',
+            '../../../scripts/code_generation_utils.py',
+        ]
         outputs = ['Format_table_autogen.cpp', 'FormatID_autogen.h']
 
         if sys.argv[1] == 'inputs':
@@ -392,9 +400,7 @@ def main():
         angle_format_info_cases=angle_format_cases,
         angle_format_switch=switch_data,
         data_source_name=data_source_name)
-    with open('Format_table_autogen.cpp', 'wt') as out_file:
-        out_file.write(output_cpp)
-        out_file.close()
+    code_generation_utils.write_file_if_changed('Format_table_autogen.cpp', output_cpp)
 
     enum_data = gen_enum_string(all_angle)
     num_angle_formats = len(all_angle)
@@ -404,9 +410,7 @@ def main():
         angle_format_enum=enum_data,
         data_source_name=data_source_name,
         num_angle_formats=num_angle_formats)
-    with open('FormatID_autogen.h', 'wt') as out_file:
-        out_file.write(output_h)
-        out_file.close()
+    code_generation_utils.write_file_if_changed('FormatID_autogen.h', output_h)
 
     return 0
 
@@ -15,6 +15,8 @@ from datetime import date
 
 sys.path.append('../..')
 import angle_format
+sys.path.append('../../../scripts')
+import code_generation_utils
 
 template = """// GENERATED FILE - DO NOT EDIT.
 // Generated by gen_load_functions_table.py using data from load_functions_data.json
@@ -198,7 +200,7 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['load_functions_data.json']
+        inputs = ['load_functions_data.json', '../../../scripts/code_generation_utils.py']
         outputs = ['load_functions_table_autogen.cpp']
 
         if sys.argv[1] == 'inputs':
@@ -220,9 +222,7 @@ def main():
         load_functions_data=load_functions_data,
         copyright_year=date.today().year)
 
-    with open('load_functions_table_autogen.cpp', 'wt') as out_file:
-        out_file.write(output)
-        out_file.close()
+    code_generation_utils.write_file_if_changed('load_functions_table_autogen.cpp', output)
     return 0
 
 
@@ -10,7 +10,6 @@
 import sys
 import os
 import re
-import xml.etree.ElementTree as etree
 from datetime import date
 
 # Set the CWD to the script directory.
@@ -18,6 +17,9 @@ os.chdir(os.path.dirname(os.path.abspath(sys.argv[0])))
 
 sys.path.append('..')
 import angle_format
+sys.path.append('../../../../scripts')
+import code_generation_utils
+import registry_xml
 
 
 def safe_append(the_dict, key, element):
@@ -197,10 +199,6 @@ def nullify(data):
     return [assign_null(entry) for entry in data]
 
 
-def format_param(param):
-    return "".join(param.itertext())
-
-
 null_functions_header_template = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {data_source_name} and gl.xml.
 //
@@ -248,7 +246,9 @@ def main():
     # auto_script parameters.
     if len(sys.argv) > 1:
         inputs = [
+            '../../../../scripts/code_generation_utils.py',
             '../../../../scripts/gl.xml',
+            '../../../../scripts/registry_xml.py',
             '../angle_format.py',
             'gl_bindings_data.json',
         ]
@@ -268,7 +268,6 @@ def main():
             return 1
         return 0
 
-    gl_xml_path = os.path.join('..', '..', '..', '..', 'scripts', 'gl.xml')
     dispatch_header_path = 'DispatchTableGL_autogen.h'
     dispatch_source_path = 'DispatchTableGL_autogen.cpp'
     null_functions_header_path = 'null_functions.h'
@@ -277,49 +276,43 @@ def main():
     # Load the JSON and XML data.
     data_source_name = 'gl_bindings_data.json'
     json_data = angle_format.load_json(data_source_name)
-    xml_root = etree.parse(gl_xml_path).getroot()
+    xml = registry_xml.RegistryXML('gl.xml')
 
     api_feature_info = {}
 
     core_removed_eps = []
-    for core_removed_ep in xml_root.findall('feature/remove'):
-        assert (core_removed_ep.attrib['profile'] == 'core')
-        for command in core_removed_ep.findall('./command'):
-            core_removed_eps.append(command.attrib['name'])
-
-    for feature in xml_root.findall('feature'):
-        api = feature.attrib['api']
-        name = feature.attrib['name']
-        number = feature.attrib['number']
+    for _, _, _, _, removed in xml.feature_requirements:
+        for profile, commands in removed:
+            assert (profile == 'core')
+            core_removed_eps += commands
 
+    for name, api, number, commands, _ in xml.feature_requirements:
         # OpenGL ES 3.x versions are listed as api 'gles2'
         if api != 'gl' and api != 'gles2':
             continue
 
-        for command in feature.findall('./require/command'):
-            command_name = command.attrib['name']
+        for command_name in commands:
             safe_append(api_feature_info, command_name, (api, name, number))
 
     gl_extension_commands = {}
     gles2_extension_commands = {}
     both_extension_commands = {}
 
-    for extension in xml_root.findall('extensions/extension'):
-        extension_name = extension.attrib['name']
-        support = extension.attrib['supported'].split('|')
-        for command in extension.findall('./require/command'):
-            command_name = command.attrib['name']
-            if 'gl' in support and 'gles2' in support:
-                # Special case for KHR extensions, since in GLES they are suffixed.
-                if '_KHR_' in extension_name and not command_name.endswith('KHR'):
+    for extension_name, supported, requires in xml.extensions:
+        support = supported.split('|')
+        for _, _, commands, _ in requires:
+            for command_name in commands:
+                if 'gl' in support and 'gles2' in support:
+                    # Special case for KHR extensions, since in GLES they are suffixed.
+                    if '_KHR_' in extension_name and not command_name.endswith('KHR'):
+                        safe_append(gl_extension_commands, command_name, extension_name)
+                        safe_append(gles2_extension_commands, command_name, extension_name)
+                    else:
+                        safe_append(both_extension_commands, command_name, extension_name)
+                elif 'gl' in support:
                     safe_append(gl_extension_commands, command_name, extension_name)
+                elif 'gles2' in support:
                     safe_append(gles2_extension_commands, command_name, extension_name)
-                else:
-                    safe_append(both_extension_commands, command_name, extension_name)
-            elif 'gl' in support:
-                safe_append(gl_extension_commands, command_name, extension_name)
-            elif 'gles2' in support:
-                safe_append(gles2_extension_commands, command_name, extension_name)
 
     gl_requirements = {}
     gles2_requirements = {}
@@ -410,8 +403,7 @@ def main():
         file_name=dispatch_header_path,
         table_data="\n\n".join(table_data))
 
-    with open(dispatch_header_path, "w") as out:
-        out.write(dispatch_table_header)
+    code_generation_utils.write_file_if_changed(dispatch_header_path, dispatch_table_header)
 
     gl_data = []
     for gl_required, entry_points in sorted(gl_requirements.iteritems()):
@@ -452,8 +444,7 @@ def main():
         gles2_null_extensions_data="\n\n".join(nullify(gles2_extensions_data)),
         both_null_extensions_data="\n\n".join(nullify(both_extensions_data)))
 
-    with open(dispatch_source_path, "w") as out:
-        out.write(dispatch_table_source)
+    code_generation_utils.write_file_if_changed(dispatch_source_path, dispatch_table_source)
 
     # Generate the NULL/stub entry points.
     # Process the whole set of commands
@@ -461,14 +452,13 @@ def main():
     command_defs = {}
     command_decls = {}
 
-    for command in xml_root.findall('commands/command'):
-        proto = command.find('proto')
-        command_name = proto.find('name').text
-        entry = ''.join(proto.itertext())
+    for command in xml.command_signatures:
+        command_name = command.name
+        entry = command.proto
         return_type = entry[:-len(command_name)]
         entry = return_type + ' INTERNAL_GL_APIENTRY ' + entry[len(return_type):] + 'NULL('
 
-        param_text = [format_param(param) for param in command.findall('param')]
+        param_text = [param.text for param in command.params]
         entry += ', '.join(param_text) + ')'
 
         command_decls[command_name] = entry + ';'
@@ -490,8 +480,7 @@ def main():
         file_name=null_functions_header_path,
         table_data="\n".join(null_decls))
 
-    with open(null_functions_header_path, "w") as out:
-        out.write(null_functions_header)
+    code_generation_utils.write_file_if_changed(null_functions_header_path, null_functions_header)
 
     null_functions_source = null_functions_source_template.format(
         script_name=os.path.basename(sys.argv[0]),
@@ -500,8 +489,7 @@ def main():
         file_name=null_functions_source_path,
         table_data="\n\n".join(null_stubs))
 
-    with open(null_functions_source_path, "w") as out:
-        out.write(null_functions_source)
+    code_generation_utils.write_file_if_changed(null_functions_source_path, null_functions_source)
     return 0
 
 
@@ -17,6 +17,8 @@ import sys
 
 sys.path.append('..')
 import angle_format
+sys.path.append('../../../../scripts')
+import code_generation_utils
 
 template_table_autogen_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {input_file_name}
@@ -204,7 +206,12 @@ def main():
 
     # auto_script parameters.
     if len(sys.argv) > 1:
-        inputs = ['../angle_format.py', '../angle_format_map.json', input_file_name]
+        inputs = [
+            '../angle_format.py',
+            '../angle_format_map.json',
+            '../../../../scripts/code_generation_utils.py',
+            input_file_name,
+        ]
         outputs = [out_file_name]
 
         if sys.argv[1] == 'inputs':
@@ -233,9 +240,7 @@ def main():
         out_file_name=out_file_name,
         input_file_name=input_file_name)
 
-    with open(out_file_name, 'wt') as out_file:
-        out_file.write(output_cpp)
-        out_file.close()
+    code_generation_utils.write_file_if_changed(out_file_name, output_cpp)
     return 0
 
 
@@ -10,19 +10,31 @@
 #  code upload please run scripts/run_code_generation.py.
 
 from datetime import date
-import io
+import hashlib
 import json
 import multiprocessing
 import os
 import platform
 import re
+import shutil
 import subprocess
 import sys
+import threading
+from multiprocessing.pool import ThreadPool
+
+sys.path.append('../../../../scripts')
+import code_generation_utils
 
 out_file_cpp = 'vk_internal_shaders_autogen.cpp'
 out_file_h = 'vk_internal_shaders_autogen.h'
 out_file_gni = 'vk_internal_shaders_autogen.gni'
 
+# Optional list of the variations the back-end uses, per shader. See get_used_variations.
+used_variations_file = os.path.join('shaders', 'used_variations.json')
+
+# Content-addressed cache of compiled shaders. See CompileCache.
+compile_cache_dir = os.path.join('shaders', '.cache')
+
 is_windows = platform.system() == 'Windows'
 is_linux = platform.system() == 'Linux'
 
@@ -74,7 +86,8 @@ angle::Result GetShader(Context *context,
 
     // Create shader lazily. Access will need to be locked for multi-threading.
     const ShaderBlob &shaderCode = shaderBlobs[shaderFlags];
-    ASSERT(shaderCode.code != nullptr);
+    // Variations left out of the build aren't available.
+    ANGLE_VK_CHECK(context, shaderCode.code != nullptr, VK_ERROR_FEATURE_NOT_PRESENT);
 
     return InitShaderAndSerial(context, &shader.get(), shaderCode.code, shaderCode.codeSize);
 }}
@@ -200,12 +213,51 @@ def get_glslang_exe_path():
     return glslang_exe
 
 
+# Identifies the glslang binary by its checked-in sha1, falling back to hashing the binary itself
+# for locally built binaries.
+def get_glslang_hash(glslang_exe):
+    sha1_file = glslang_exe + '.sha1'
+    if os.path.isfile(sha1_file):
+        with open(sha1_file) as f:
+            return f.read().strip()
+    with open(glslang_exe, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
 # Generates the code for a shader blob array entry.
 def gen_shader_blob_entry(shader):
     var_name = get_var_name(os.path.basename(shader))[0:-4]
     return "{%s, %s}" % (var_name, "sizeof(%s)" % var_name)
 
 
+spirv_array_regex = re.compile(r'const uint32_t (\w+)\[\] = \{(.*?)\};', re.DOTALL)
+
+
+# Returns the variable name and the SPIR-V words defined in a generated .inc file.
+def read_spirv(shader):
+    with open(shader) as incfile:
+        match = spirv_array_regex.search(incfile.read())
+    if not match:
+        raise Exception('Could not find the SPIR-V in %s' % shader)
+    return (match.group(1), [int(word, 16) for word in match.group(2).replace(',', ' ').split()])
+
+
+# Many variations compile to the same SPIR-V.  Returns the .inc files with distinct SPIR-V, and a
+# map from every variable name to the one holding the same SPIR-V among those.
+def dedup_shader_blobs(output_shaders):
+    unique_shaders = []
+    blob_names = {}
+    names_by_words = {}
+    for shader in output_shaders:
+        (var_name, words) = read_spirv(shader)
+        words = tuple(words)
+        if words not in names_by_words:
+            names_by_words[words] = var_name
+            unique_shaders.append((shader, var_name))
+        blob_names[var_name] = names_by_words[words]
+    return (unique_shaders, blob_names)
+
+
 def slash(s):
     return s.replace('\\', '/')
 
@@ -245,6 +297,49 @@ def get_variation_bits(flags, enums):
     return (flags_bits, enum_bits)
 
 
+def load_used_variations():
+    if not os.path.exists(used_variations_file):
+        return {}
+    with open(used_variations_file) as fin:
+        manifest = json.loads(fin.read())
+    manifest.pop('Description', None)
+    return manifest
+
+
+def get_used_variations(shader_file, manifest, flags, enums, flags_bits, enum_bits):
+    """Returns the set of variation indices of shader_file listed in the used variations
+    manifest, or None if all variations are used.  The manifest maps shader names to lists of
+    variations, either as indices (as collected at runtime) or as the '|' separated names of their
+    active flags and enum values, for example "SrcIsArray|SrcIsFloat|DestIsUint"."""
+    shader_name = os.path.basename(shader_file)
+    if shader_name not in manifest:
+        return None
+
+    # Bit pattern of every flag and enum value, see compile_variation.
+    name_bits = {}
+    for f in range(len(flags)):
+        name_bits[flags[f]] = 1 << f
+    current_bit_start = flags_bits
+    for e in range(len(enums)):
+        for v in range(len(enums[e][1])):
+            name_bits[enums[e][1][v]] = v << current_bit_start
+        current_bit_start += enum_bits[e]
+
+    used_variations = set()
+    for variation in manifest[shader_name]:
+        if isinstance(variation, int):
+            used_variations.add(variation)
+            continue
+        variation_bits = 0
+        for name in filter(None, variation.split('|')):
+            if name not in name_bits:
+                raise Exception('Unknown variation "%s" of %s in %s' %
+                                (name, shader_name, used_variations_file))
+            variation_bits |= name_bits[name]
+        used_variations.add(variation_bits)
+    return used_variations
+
+
 def next_enum_variation(enums, enum_indices):
     """Loop through indices from [0, 0, ...] to [L0-1, L1-1, ...]
     where Li is len(enums[i]).  The list can be thought of as a number with many
@@ -270,74 +365,229 @@ def cleanup_preprocessed_shader(shader_text):
     return compact_newlines_regex.sub('\n\n', shader_text.strip())
 
 
-class CompileQueue:
+include_regex = re.compile(r'^\s*#\s*include\s*"([^"]+)"', re.MULTILINE)
+
+
+# Hashes the shader source together with the files it #includes, transitively.
+def get_shader_source_hash(shader_file):
+    sha1 = hashlib.sha1()
+    pending = [shader_file]
+    visited = set()
+    while pending:
+        path = pending.pop()
+        if path in visited:
+            continue
+        visited.add(path)
+        sha1.update(path + '\0')
+        if not os.path.isfile(path):
+            # Let glslang report the missing file.
+            continue
+        with open(path, 'rb') as f:
+            source = f.read()
+        sha1.update(source + '\0')
+        pending += [
+            os.path.normpath(os.path.join(os.path.dirname(path), include))
+            for include in include_regex.findall(source)
+        ]
+    return sha1.hexdigest()
+
+
+class CompileCache:
+    # Keeps a copy of every generated .inc file, SPIR-V and preprocessed source comment included,
+    # named after a hash of everything that determines its contents: the shader and its includes,
+    # the glslang arguments (which hold the variation's defines) and the glslang binary. Variations
+    # whose key is found are restored from the cache instead of being compiled again.
+
+    # Bump when the format of the generated .inc files changes.
+    version = 1
+
+    def __init__(self, cache_dir, glslang_hash):
+        self.cache_dir = cache_dir
+        self.glslang_hash = glslang_hash
+        self.source_hashes = {}
+        self.used_entries = set()
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+    def _get_entry_path(self, key):
+        return os.path.join(self.cache_dir, key + '.inc')
+
+    # |glslang_args| shouldn't include the glslang path, the binary is identified by its hash.
+    def get_key(self, shader_file, glslang_args):
+        if shader_file not in self.source_hashes:
+            self.source_hashes[shader_file] = get_shader_source_hash(shader_file)
+        args = '\0'.join(glslang_args)
+        key = '%d\0%s\0%s\0%s' % (CompileCache.version, self.glslang_hash,
+                                   self.source_hashes[shader_file], args)
+        return hashlib.sha1(key).hexdigest()
+
+    # Copies the cached output for |key| to |output_path|. Returns False if there is none.
+    def restore(self, key, output_path):
+        entry_path = self._get_entry_path(key)
+        if not os.path.isfile(entry_path):
+            return False
+        self.used_entries.add(key)
+        with open(entry_path, 'rb') as f:
+            cached = f.read()
+        if os.path.isfile(output_path):
+            with open(output_path, 'rb') as f:
+                if f.read() == cached:
+                    # Leave the timestamp alone so the build doesn't consider it changed.
+                    return True
+        shutil.copyfile(entry_path, output_path)
+        return True
+
+    def store(self, key, output_path):
+        self.used_entries.add(key)
+        entry_path = self._get_entry_path(key)
+        temp_path = '%s.%d.tmp' % (entry_path, os.getpid())
+        shutil.copyfile(output_path, temp_path)
+        if is_windows and os.path.exists(entry_path):
+            os.remove(entry_path)
+        os.rename(temp_path, entry_path)
+
+    # Removes the entries that weren't used, so the cache only holds the current shaders.
+    def prune(self):
+        for entry in os.listdir(self.cache_dir):
+            if os.path.splitext(entry)[0] not in self.used_entries:
+                os.remove(os.path.join(self.cache_dir, entry))
 
-    class AppendPreprocessorOutput:
 
-        def __init__(self, shader_file, preprocessor_args, output_path):
-            # Asynchronously launch the preprocessor job.
-            self.process = subprocess.Popen(
-                preprocessor_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            # Store the file name for output to be appended to.
-            self.output_path = output_path
-            # Store info for error description.
-            self.shader_file = shader_file
+class CompileQueue:
 
-        def wait(self, queue):
-            (out, err) = self.process.communicate()
-            if self.process.returncode == 0:
-                # Use unix line endings.
-                out = out.replace('\r\n', '\n')
-                # Clean up excessive empty lines.
-                out = cleanup_preprocessed_shader(out)
-                # Comment it out!
-                out = '\n'.join([('// ' + line).strip() for line in out.splitlines()])
-                # Append preprocessor output to the output file.
-                with open(self.output_path, 'ab') as incfile:
-                    incfile.write('\n\n// Generated from:\n//\n')
-                    incfile.write(out + '\n')
-                out = None
-            return (out, err, self.process.returncode, None,
-                    "Error running preprocessor on " + self.shader_file)
+    class CompiledSource:
+        # The SPIR-V compiled from a preprocessed source.  Variations that preprocess to the same
+        # text share it instead of compiling it again.
 
-    class CompileToSPIRV:
+        def __init__(self, variable_name):
+            self.variable_name = variable_name
+            self.spirv = None
+            self.done = threading.Event()
+
+    class CompileJob:
 
         def __init__(self, shader_file, shader_basename, variation_string, output_path,
-                     compile_args, preprocessor_args):
-            # Asynchronously launch the compile job.
-            self.process = subprocess.Popen(
-                compile_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            # Store info for launching the preprocessor.
+                     variable_name, compile_args, preprocessor_args, compile_cache, cache_key):
+            # Store info for the preprocessor and compile steps.
+            self.compile_args = compile_args
             self.preprocessor_args = preprocessor_args
             self.output_path = output_path
+            self.variable_name = variable_name
+            self.compile_cache = compile_cache
+            self.cache_key = cache_key
             # Store info for job and error description.
             self.shader_file = shader_file
             self.shader_basename = shader_basename
             self.variation_string = variation_string
 
-        def wait(self, queue):
-            (out, err) = self.process.communicate()
-            if self.process.returncode == 0:
-                # Insert the preprocessor job in the queue.
-                queue.append(
-                    CompileQueue.AppendPreprocessorOutput(self.shader_file, self.preprocessor_args,
-                                                          self.output_path))
+        def _run_process(self, args):
+            # Don't let the other jobs' children inherit this job's pipes, or reading the output
+            # would wait for them to exit too.
+            process = subprocess.Popen(
+                args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=not is_windows)
+            (out, err) = process.communicate()
+            return (out, err, process.returncode)
+
+        def _compile(self):
+            # The shader file itself is compiled, not the preprocessed source, so the SPIR-V is the
+            # same as compiling each variation on its own.
+            (out, err, returncode) = self._run_process(self.compile_args)
             # If all the output says is the source file name, don't bother printing it.
             if out.strip() == self.shader_file:
                 out = None
-            description = self.output_path + ': ' + self.shader_basename + self.variation_string
-            return (out, err, self.process.returncode, description,
-                    "Error compiling " + self.shader_file)
+            return (out, err, returncode)
 
-    def __init__(self):
-        # Compile with as many CPU threads are detected.  Once a shader is compiled, another job is
-        # automatically added to the queue to append the preprocessor output to the generated file.
-        self.queue = []
+        # Preprocesses the shader, compiles it unless another variation with the same preprocessed
+        # source already did, and appends the preprocessed source to the generated file as a
+        # comment.
+        def run(self, queue):
+            description = self.output_path + ': ' + self.shader_basename + self.variation_string
+            (preprocessed, err, returncode) = self._run_process(self.preprocessor_args)
+            if returncode != 0:
+                return (preprocessed, err, returncode, description,
+                        "Error running preprocessor on " + self.shader_file)
+
+            (compiled, is_owner) = queue.get_compiled_source(self.shader_file, preprocessed,
+                                                             self.variable_name)
+            if not is_owner:
+                compiled.done.wait()
+
+            out = None
+            err = None
+            if is_owner or compiled.spirv is None:
+                try:
+                    (out, err, returncode) = self._compile()
+                    if is_owner and returncode == 0:
+                        with open(self.output_path, 'rb') as incfile:
+                            compiled.spirv = incfile.read()
+                finally:
+                    if is_owner:
+                        compiled.done.set()
+                if returncode != 0:
+                    return (out, err, returncode, description,
+                            "Error compiling " + self.shader_file)
+            else:
+                # Reuse the SPIR-V, only the variable name differs.
+                with open(self.output_path, 'wb') as incfile:
+                    incfile.write(
+                        compiled.spirv.replace(compiled.variable_name + '[]',
+                                               self.variable_name + '[]', 1))
+
+            # Use unix line endings.
+            preprocessed = preprocessed.replace('\r\n', '\n')
+            # Clean up excessive empty lines.
+            preprocessed = cleanup_preprocessed_shader(preprocessed)
+            # Comment it out!
+            preprocessed = '\n'.join([('// ' + line).strip() for line in preprocessed.splitlines()])
+            # Append preprocessor output to the output file.
+            with open(self.output_path, 'ab') as incfile:
+                incfile.write('\n\n// Generated from:\n//\n')
+                incfile.write(preprocessed + '\n')
+            if self.compile_cache:
+                self.compile_cache.store(self.cache_key, self.output_path)
+            return (out, err, returncode, description, None)
+
+    def __init__(self, compile_cache=None):
+        # Compile with as many CPU threads are detected.  Each job runs on a pool thread that picks
+        # up the next job as soon as its current one finishes, regardless of the order the jobs
+        # were added in.  Results are still reported in that order so the output is deterministic.
         self.thread_count = multiprocessing.cpu_count()
-
+        self.pool = ThreadPool(self.thread_count)
+        self.results = []
+        # Compiled SPIR-V by shader stage and preprocessed source.
+        self.compiled_sources = {}
+        self.compiled_sources_lock = threading.Lock()
+        # Set when a job fails, so the jobs that haven't started yet are skipped.
+        self.failed = threading.Event()
+        # Completed outputs are added to the cache, if any.
+        self.compile_cache = compile_cache
+
+    # Returns the CompiledSource for |preprocessed|, and whether the caller is the one that has to
+    # compile it.
+    def get_compiled_source(self, shader_file, preprocessed, variable_name):
+        key = (os.path.splitext(shader_file)[1], preprocessed)
+        with self.compiled_sources_lock:
+            if key in self.compiled_sources:
+                return (self.compiled_sources[key], False)
+            compiled = CompileQueue.CompiledSource(variable_name)
+            self.compiled_sources[key] = compiled
+            return (compiled, True)
+
+    def _run_job(self, job):
+        if self.failed.is_set():
+            return None
+        result = job.run(self)
+        if result[2] != 0:
+            self.failed.set()
+        return result
+
+    # Reports the result of the oldest job, waiting for it if needed.
     def _wait_first(self, ignore_output=False):
-        (out, err, returncode, description, exception_description) = self.queue[0].wait(self.queue)
-        self.queue.pop(0)
+        result = self.results.pop(0).get()
+        if result is None:
+            # The job was skipped after an earlier failure.
+            return None
+        (out, err, returncode, description, exception_description) = result
         if not ignore_output:
             if description:
                 print description
@@ -355,7 +605,7 @@ class CompileQueue:
     # outputting the same error multiple times is not useful.
     def _wait_all(self, ignore_output=False):
         exception_description = None
-        while len(self.queue) > 0:
+        while len(self.results) > 0:
             this_job_exception = self._wait_first(ignore_output)
             # If encountered an error, keep it to be raised, ignoring errors from following jobs.
             if this_job_exception and not ignore_output:
@@ -364,30 +614,47 @@ class CompileQueue:
 
         return exception_description
 
-    def add_job(self, shader_file, shader_basename, variation_string, output_path, compile_args,
-                preprocessor_args):
-        # If the queue is full, wait until there is at least one slot available.
-        while len(self.queue) >= self.thread_count:
+    def add_job(self, shader_file, shader_basename, variation_string, output_path, variable_name,
+                compile_args, preprocessor_args):
+        cache_key = None
+        if self.compile_cache:
+            cache_key = self.compile_cache.get_key(shader_file,
+                                                   compile_args[1:] + preprocessor_args[1:])
+            if self.compile_cache.restore(cache_key, output_path):
+                return
+
+        # If a job failed, stop adding jobs and raise its error.
+        if self.failed.is_set():
+            self.finish()
+
+        # Report the jobs that are done so far.
+        while len(self.results) > 0 and self.results[0].ready():
             exception = self._wait_first(False)
             # If encountered an exception, cleanup following jobs and raise it.
             if exception:
+                self.failed.set()
                 self._wait_all(True)
                 raise Exception(exception)
 
-        # Add a compile job
-        self.queue.append(
-            CompileQueue.CompileToSPIRV(shader_file, shader_basename, variation_string,
-                                        output_path, compile_args, preprocessor_args))
+        job = CompileQueue.CompileJob(shader_file, shader_basename, variation_string, output_path,
+                                      variable_name, compile_args, preprocessor_args,
+                                      self.compile_cache, cache_key)
+        self.results.append(self.pool.apply_async(self._run_job, (job,)))
 
     def finish(self):
-        exception = self._wait_all(False)
+        try:
+            exception = self._wait_all(False)
+        finally:
+            self.pool.close()
+            self.pool.join()
         # If encountered an exception, cleanup following jobs and raise it.
         if exception is not None:
             raise Exception(exception)
 
 
 def compile_variation(glslang_path, compile_queue, shader_file, shader_basename, flags, enums,
-                      flags_active, enum_indices, flags_bits, enum_bits, output_shaders):
+                      flags_active, enum_indices, flags_bits, enum_bits, used_variations,
+                      output_shaders):
 
     glslang_args = [glslang_path]
 
@@ -416,6 +683,10 @@ def compile_variation(glslang_path, compile_queue, shader_file, shader_basename,
         current_bit_start += enum_bits[e]
         variation_string += '|' + enum_name
 
+    # Skip the variations the manifest leaves out.
+    if used_variations is not None and variation_bits not in used_variations:
+        return
+
     output_name = '%s.%08X' % (shader_basename, variation_bits)
     output_path = get_output_path(output_name)
     output_shaders.append(output_path)
@@ -424,22 +695,26 @@ def compile_variation(glslang_path, compile_queue, shader_file, shader_basename,
         glslang_preprocessor_output_args = glslang_args + ['-E']
         glslang_preprocessor_output_args.append(shader_file)  # Input GLSL shader
 
+        variable_name = get_var_name(output_name)
         glslang_args += ['-V']  # Output mode is Vulkan
-        glslang_args += ['--variable-name', get_var_name(output_name)]  # C-style variable name
+        glslang_args += ['--variable-name', variable_name]  # C-style variable name
         glslang_args += ['-o', output_path]  # Output file
         glslang_args.append(shader_file)  # Input GLSL shader
 
         compile_queue.add_job(shader_file, shader_basename, variation_string, output_path,
-                              glslang_args, glslang_preprocessor_output_args)
+                              variable_name, glslang_args, glslang_preprocessor_output_args)
 
 
 class ShaderAndVariations:
 
-    def __init__(self, shader_file):
+    def __init__(self, shader_file, used_variations_manifest):
         self.shader_file = shader_file
         (self.flags, self.enums) = get_shader_variations(shader_file)
         get_variation_bits(self.flags, self.enums)
         (self.flags_bits, self.enum_bits) = get_variation_bits(self.flags, self.enums)
+        self.used_variations = get_used_variations(shader_file, used_variations_manifest,
+                                                   self.flags, self.enums, self.flags_bits,
+                                                   self.enum_bits)
         # Maximum index value has all flags set and all enums at max value.
         max_index = (1 << self.flags_bits) - 1
         current_bit_start = self.flags_bits
@@ -501,12 +776,13 @@ def get_shader_table_h(shader_and_variation):
     return table
 
 
-def get_shader_table_cpp(shader_and_variation):
+def get_shader_table_cpp(shader_and_variation, blob_names):
     shader_file = shader_and_variation.shader_file
     enums = shader_and_variation.enums
     flags_bits = shader_and_variation.flags_bits
     enum_bits = shader_and_variation.enum_bits
     array_len = shader_and_variation.array_len
+    used_variations = shader_and_variation.used_variations
 
     # Cache max and mask value of each enum to quickly know when a possible variation is invalid
     enum_maxes = []
@@ -528,8 +804,10 @@ def get_shader_table_cpp(shader_and_variation):
         # if any variation is invalid, output an empty entry
         if any([(variation & enum_masks[e]) > enum_maxes[e] for e in range(len(enums))]):
             table += '{nullptr, 0}, // 0x%08X\n' % variation
+        elif used_variations is not None and variation not in used_variations:
+            table += '{nullptr, 0}, // 0x%08X (unused)\n' % variation
         else:
-            entry = '%s_%08X' % (var_name, variation)
+            entry = blob_names['%s_%08X' % (var_name, variation)]
             table += '{%s, sizeof(%s)},\n' % (entry, entry)
 
     table += '};'
@@ -601,23 +879,40 @@ def main():
     if print_inputs:
         glslang_binaries = [get_linux_glslang_exe_path(), get_win_glslang_exe_path()]
         glslang_binary_hashes = [path + '.sha1' for path in glslang_binaries]
-        print(",".join(input_shaders + glslang_binary_hashes))
+        # The variation files determine the set of generated outputs, so they are inputs too.
+        variation_files = [
+            shader + '.json' for shader in input_shaders if os.path.exists(shader + '.json')
+        ]
+        if os.path.exists(used_variations_file):
+            variation_files.append(used_variations_file)
+        print(",".join(input_shaders + variation_files + glslang_binary_hashes +
+                       ['../../../../scripts/code_generation_utils.py']))
         return 0
 
     # STEP 1: Call glslang to generate the internal shaders into small .inc files.
     # Iterates over the shaders and call glslang with the right arguments.
 
     glslang_path = None
+    compile_cache = None
     if not print_outputs:
         glslang_path = get_glslang_exe_path()
+        compile_cache = CompileCache(compile_cache_dir, get_glslang_hash(glslang_path))
 
     output_shaders = []
 
+    used_variations_manifest = load_used_variations()
+    unknown_shaders = set(used_variations_manifest.keys()) - set(
+        [os.path.basename(shader_file) for shader_file in input_shaders])
+    if unknown_shaders:
+        raise Exception('Unknown shaders in %s: %s' % (used_variations_file,
+                                                       ', '.join(sorted(unknown_shaders))))
+
     input_shaders_and_variations = [
-        ShaderAndVariations(shader_file) for shader_file in input_shaders
+        ShaderAndVariations(shader_file, used_variations_manifest)
+        for shader_file in input_shaders
     ]
 
-    compile_queue = CompileQueue()
+    compile_queue = CompileQueue(compile_cache)
 
     for shader_and_variation in input_shaders_and_variations:
         shader_file = shader_and_variation.shader_file
@@ -625,6 +920,7 @@ def main():
         enums = shader_and_variation.enums
         flags_bits = shader_and_variation.flags_bits
         enum_bits = shader_and_variation.enum_bits
+        used_variations = shader_and_variation.used_variations
 
         # an array where each element i is in [0, len(enums[i])),
         # telling which enum is currently selected
@@ -639,7 +935,7 @@ def main():
             for flags_active in range(1 << len(flags)):
                 compile_variation(glslang_path if do_compile else None, compile_queue, shader_file,
                                   output_name, flags, enums, flags_active, enum_indices,
-                                  flags_bits, enum_bits, output_shaders)
+                                  flags_bits, enum_bits, used_variations, output_shaders)
 
             if not next_enum_variation(enums, enum_indices):
                 break
@@ -653,55 +949,53 @@ def main():
 
     compile_queue.finish()
 
+    # Only a full run knows which entries are still in use.
+    if len(sys.argv) < 2:
+        compile_cache.prune()
+
     # STEP 2: Consolidate the .inc files into an auto-generated cpp/h library.
-    with open(out_file_cpp, 'w') as outfile:
-        includes = "\n".join([gen_shader_include(shader) for shader in output_shaders])
-        shader_tables_cpp = '\n'.join(
-            [get_shader_table_cpp(s) for s in input_shaders_and_variations])
-        shader_destroy_calls = '\n'.join(
-            [get_destroy_call(s) for s in input_shaders_and_variations])
-        shader_get_functions_cpp = '\n'.join(
-            [get_get_function_cpp(s) for s in input_shaders_and_variations])
-
-        outcode = template_shader_library_cpp.format(
-            script_name=__file__,
-            copyright_year=date.today().year,
-            out_file_name=out_file_cpp,
-            input_file_name='shaders/src/*',
-            internal_shader_includes=includes,
-            shader_tables_cpp=shader_tables_cpp,
-            shader_destroy_calls=shader_destroy_calls,
-            shader_get_functions_cpp=shader_get_functions_cpp)
-        outfile.write(outcode)
-        outfile.close()
-
-    with open(out_file_h, 'w') as outfile:
-        shader_variation_definitions = '\n'.join(
-            [get_variation_definition(s) for s in input_shaders_and_variations])
-        shader_get_functions_h = '\n'.join(
-            [get_get_function_h(s) for s in input_shaders_and_variations])
-        shader_tables_h = '\n'.join([get_shader_table_h(s) for s in input_shaders_and_variations])
-        outcode = template_shader_library_h.format(
-            script_name=__file__,
-            copyright_year=date.today().year,
-            out_file_name=out_file_h,
-            input_file_name='shaders/src/*',
-            shader_variation_definitions=shader_variation_definitions,
-            shader_get_functions_h=shader_get_functions_h,
-            shader_tables_h=shader_tables_h)
-        outfile.write(outcode)
-        outfile.close()
+    (unique_shaders, blob_names) = dedup_shader_blobs(output_shaders)
+    includes = "\n".join([gen_shader_include(shader) for shader, _ in unique_shaders])
+    shader_tables_cpp = '\n'.join(
+        [get_shader_table_cpp(s, blob_names) for s in input_shaders_and_variations])
+    shader_destroy_calls = '\n'.join([get_destroy_call(s) for s in input_shaders_and_variations])
+    shader_get_functions_cpp = '\n'.join(
+        [get_get_function_cpp(s) for s in input_shaders_and_variations])
+
+    outcode = template_shader_library_cpp.format(
+        script_name=__file__,
+        copyright_year=date.today().year,
+        out_file_name=out_file_cpp,
+        input_file_name='shaders/src/*',
+        internal_shader_includes=includes,
+        shader_tables_cpp=shader_tables_cpp,
+        shader_destroy_calls=shader_destroy_calls,
+        shader_get_functions_cpp=shader_get_functions_cpp)
+    code_generation_utils.write_file_if_changed(out_file_cpp, outcode)
+
+    shader_variation_definitions = '\n'.join(
+        [get_variation_definition(s) for s in input_shaders_and_variations])
+    shader_get_functions_h = '\n'.join(
+        [get_get_function_h(s) for s in input_shaders_and_variations])
+    shader_tables_h = '\n'.join([get_shader_table_h(s) for s in input_shaders_and_variations])
+    outcode = template_shader_library_h.format(
+        script_name=__file__,
+        copyright_year=date.today().year,
+        out_file_name=out_file_h,
+        input_file_name='shaders/src/*',
+        shader_variation_definitions=shader_variation_definitions,
+        shader_get_functions_h=shader_get_functions_h,
+        shader_tables_h=shader_tables_h)
+    code_generation_utils.write_file_if_changed(out_file_h, outcode)
 
     # STEP 3: Create a gni file with the generated files.
-    with io.open(out_file_gni, 'w', newline='\n') as outfile:
-        outcode = template_shader_includes_gni.format(
-            script_name=__file__,
-            copyright_year=date.today().year,
-            out_file_name=out_file_gni,
-            input_file_name='shaders/src/*',
-            shaders_list=',\n'.join([shader_path(shader) for shader in output_shaders]))
-        outfile.write(outcode)
-        outfile.close()
+    outcode = template_shader_includes_gni.format(
+        script_name=__file__,
+        copyright_year=date.today().year,
+        out_file_name=out_file_gni,
+        input_file_name='shaders/src/*',
+        shaders_list=',\n'.join([shader_path(shader) for shader in output_shaders]))
+    code_generation_utils.write_file_if_changed(out_file_gni, outcode, newline='\n')
 
     return 0
 
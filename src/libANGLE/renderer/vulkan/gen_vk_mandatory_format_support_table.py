@@ -15,6 +15,9 @@ import angle_format
 import xml.etree.ElementTree as etree
 import sys, os
 
+sys.path.append('../../../../scripts')
+import code_generation_utils
+
 template_table_autogen_cpp = """// GENERATED FILE - DO NOT EDIT.
 // Generated by {script_name} using data from {input_file_name} and
 // the vk.xml file situated at
@@ -95,6 +98,7 @@ def main():
     if len(sys.argv) > 1:
         inputs = [
             '../angle_format.py',
+            '../../../../scripts/code_generation_utils.py',
             input_file_name,
             vk_xml_file,
         ]
@@ -133,9 +137,7 @@ def main():
         out_file_name=out_file_name,
         input_file_name=input_file_name)
 
-    with open(out_file_name, 'wt') as out_file:
-        out_file.write(output_cpp)
-        out_file.close()
+    code_generation_utils.write_file_if_changed(out_file_name, output_cpp)
     return 0
 
 
@@ -285,7 +285,8 @@ angle::Result GetShader(Context *context,
 
     // Create shader lazily. Access will need to be locked for multi-threading.
     const ShaderBlob &shaderCode = shaderBlobs[shaderFlags];
-    ASSERT(shaderCode.code != nullptr);
+    // Variations left out of the build aren't available.
+    ANGLE_VK_CHECK(context, shaderCode.code != nullptr, VK_ERROR_FEATURE_NOT_PRESENT);
 
     return InitShaderAndSerial(context, &shader.get(), shaderCode.code, shaderCode.codeSize);
 }
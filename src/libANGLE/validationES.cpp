@@ -684,6 +684,57 @@ bool ValidateDrawArraysInstancedBase(Context *context,
     return ValidateDrawInstancedAttribs(context, primcount);
 }
 
+bool ValidateDrawArraysInstancedParams(Context *context,
+                                       GLint first,
+                                       GLsizei count,
+                                       GLsizei primcount)
+{
+    if (primcount < 0)
+    {
+        context->validationError(GL_INVALID_VALUE, kNegativePrimcount);
+        return false;
+    }
+
+    if (!ValidateDrawArraysParams(context, first, count, primcount))
+    {
+        return false;
+    }
+
+    if (count == 0 || primcount == 0)
+    {
+        // Early exit.
+        return true;
+    }
+
+    return ValidateDrawInstancedAttribs(context, primcount);
+}
+
+bool ValidateDrawElementsInstancedParams(Context *context,
+                                         GLsizei count,
+                                         DrawElementsType type,
+                                         const void *indices,
+                                         GLsizei primcount)
+{
+    if (primcount < 0)
+    {
+        context->validationError(GL_INVALID_VALUE, kNegativePrimcount);
+        return false;
+    }
+
+    if (!ValidateDrawElementsParams(context, count, type, indices, primcount))
+    {
+        return false;
+    }
+
+    if (count == 0 || primcount == 0)
+    {
+        // Early exit.
+        return true;
+    }
+
+    return ValidateDrawInstancedAttribs(context, primcount);
+}
+
 bool ValidateDrawInstancedANGLE(Context *context)
 {
     // Verify there is at least one active attribute with a divisor of zero
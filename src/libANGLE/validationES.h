@@ -355,6 +355,18 @@ bool ValidateDrawElementsInstancedEXT(Context *context,
                                       const void *indices,
                                       GLsizei primcount);
 
+// Validates one draw of an instanced multi-draw call. The draw states are validated once for all
+// the draws with ValidateDrawBase and ValidateDrawElementsBase.
+bool ValidateDrawArraysInstancedParams(Context *context,
+                                       GLint first,
+                                       GLsizei count,
+                                       GLsizei primcount);
+bool ValidateDrawElementsInstancedParams(Context *context,
+                                         GLsizei count,
+                                         DrawElementsType type,
+                                         const void *indices,
+                                         GLsizei primcount);
+
 bool ValidateDrawInstancedANGLE(Context *context);
 bool ValidateDrawInstancedEXT(Context *context);
 
@@ -752,11 +764,10 @@ ANGLE_INLINE bool ValidateDrawInstancedAttribs(Context *context, GLint primcount
     return true;
 }
 
-ANGLE_INLINE bool ValidateDrawArraysCommon(Context *context,
-                                           PrimitiveMode mode,
-                                           GLint first,
-                                           GLsizei count,
-                                           GLsizei primcount)
+// The draw validation is split into the checks of the draw states, done by ValidateDrawBase, and
+// the checks of each draw's own parameters below. Multi-draw calls check the draw states once and
+// the parameters of every draw.
+ANGLE_INLINE bool ValidateDrawArraysRange(Context *context, GLint first, GLsizei count)
 {
     if (first < 0)
     {
@@ -764,23 +775,21 @@ ANGLE_INLINE bool ValidateDrawArraysCommon(Context *context,
         return false;
     }
 
-    if (count <= 0)
-    {
-        if (count < 0)
-        {
-            context->validationError(GL_INVALID_VALUE, err::kNegativeCount);
-            return false;
-        }
-
-        // Early exit.
-        return ValidateDrawBase(context, mode);
-    }
-
-    if (!ValidateDrawBase(context, mode))
+    if (count < 0)
     {
+        context->validationError(GL_INVALID_VALUE, err::kNegativeCount);
         return false;
     }
 
+    return true;
+}
+
+// Requires count > 0.
+ANGLE_INLINE bool ValidateDrawArraysBuffers(Context *context,
+                                            GLint first,
+                                            GLsizei count,
+                                            GLsizei primcount)
+{
     if (context->getStateCache().isTransformFeedbackActiveUnpaused())
     {
         const State &state                      = context->getState();
@@ -795,6 +804,50 @@ ANGLE_INLINE bool ValidateDrawArraysCommon(Context *context,
     return ValidateDrawArraysAttribs(context, first, count);
 }
 
+ANGLE_INLINE bool ValidateDrawArraysParams(Context *context,
+                                           GLint first,
+                                           GLsizei count,
+                                           GLsizei primcount)
+{
+    if (!ValidateDrawArraysRange(context, first, count))
+    {
+        return false;
+    }
+
+    if (count == 0)
+    {
+        // Early exit.
+        return true;
+    }
+
+    return ValidateDrawArraysBuffers(context, first, count, primcount);
+}
+
+ANGLE_INLINE bool ValidateDrawArraysCommon(Context *context,
+                                           PrimitiveMode mode,
+                                           GLint first,
+                                           GLsizei count,
+                                           GLsizei primcount)
+{
+    if (!ValidateDrawArraysRange(context, first, count))
+    {
+        return false;
+    }
+
+    if (!ValidateDrawBase(context, mode))
+    {
+        return false;
+    }
+
+    if (count == 0)
+    {
+        // Early exit.
+        return true;
+    }
+
+    return ValidateDrawArraysBuffers(context, first, count, primcount);
+}
+
 ANGLE_INLINE bool ValidateDrawElementsBase(Context *context,
                                            PrimitiveMode mode,
                                            DrawElementsType type)
@@ -825,18 +878,11 @@ ANGLE_INLINE bool ValidateDrawElementsBase(Context *context,
     return true;
 }
 
-ANGLE_INLINE bool ValidateDrawElementsCommon(Context *context,
-                                             PrimitiveMode mode,
-                                             GLsizei count,
-                                             DrawElementsType type,
-                                             const void *indices,
-                                             GLsizei primcount)
+ANGLE_INLINE bool ValidateDrawElementsRange(Context *context,
+                                            GLsizei count,
+                                            DrawElementsType type,
+                                            const void *indices)
 {
-    if (!ValidateDrawElementsBase(context, mode, type))
-    {
-        return false;
-    }
-
     ASSERT(isPow2(GetDrawElementsTypeSize(type)) && GetDrawElementsTypeSize(type) > 0);
 
     if (context->getExtensions().webglCompatibility)
@@ -862,23 +908,22 @@ ANGLE_INLINE bool ValidateDrawElementsCommon(Context *context,
         }
     }
 
-    if (count <= 0)
-    {
-        if (count < 0)
-        {
-            context->validationError(GL_INVALID_VALUE, err::kNegativeCount);
-            return false;
-        }
-
-        // Early exit.
-        return ValidateDrawBase(context, mode);
-    }
-
-    if (!ValidateDrawBase(context, mode))
+    if (count < 0)
     {
+        context->validationError(GL_INVALID_VALUE, err::kNegativeCount);
         return false;
     }
 
+    return true;
+}
+
+// Requires count > 0.
+ANGLE_INLINE bool ValidateDrawElementsBuffers(Context *context,
+                                              GLsizei count,
+                                              DrawElementsType type,
+                                              const void *indices,
+                                              GLsizei primcount)
+{
     const State &state         = context->getState();
     const VertexArray *vao     = state.getVertexArray();
     Buffer *elementArrayBuffer = vao->getElementArrayBuffer();
@@ -951,6 +996,57 @@ ANGLE_INLINE bool ValidateDrawElementsCommon(Context *context,
 
     return true;
 }
+
+ANGLE_INLINE bool ValidateDrawElementsParams(Context *context,
+                                             GLsizei count,
+                                             DrawElementsType type,
+                                             const void *indices,
+                                             GLsizei primcount)
+{
+    if (!ValidateDrawElementsRange(context, count, type, indices))
+    {
+        return false;
+    }
+
+    if (count == 0)
+    {
+        // Early exit.
+        return true;
+    }
+
+    return ValidateDrawElementsBuffers(context, count, type, indices, primcount);
+}
+
+ANGLE_INLINE bool ValidateDrawElementsCommon(Context *context,
+                                             PrimitiveMode mode,
+                                             GLsizei count,
+                                             DrawElementsType type,
+                                             const void *indices,
+                                             GLsizei primcount)
+{
+    if (!ValidateDrawElementsBase(context, mode, type))
+    {
+        return false;
+    }
+
+    if (!ValidateDrawElementsRange(context, count, type, indices))
+    {
+        return false;
+    }
+
+    if (!ValidateDrawBase(context, mode))
+    {
+        return false;
+    }
+
+    if (count == 0)
+    {
+        // Early exit.
+        return true;
+    }
+
+    return ValidateDrawElementsBuffers(context, count, type, indices, primcount);
+}
 }  // namespace gl
 
 #endif  // LIBANGLE_VALIDATION_ES_H_
@@ -7138,47 +7138,56 @@ bool ValidateMaxShaderCompilerThreadsKHR(Context *context, GLuint count)
     return true;
 }
 
-bool ValidateMultiDrawArraysANGLE(Context *context,
-                                  PrimitiveMode mode,
-                                  const GLint *firsts,
-                                  const GLsizei *counts,
-                                  GLsizei drawcount)
+bool ValidateMultiDrawArraysANGLEShared(Context *context, PrimitiveMode mode, GLsizei drawcount)
 {
     if (!context->getExtensions().multiDraw)
     {
         context->validationError(GL_INVALID_OPERATION, kExtensionNotEnabled);
         return false;
     }
-    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    if (drawcount <= 0)
     {
-        if (!ValidateDrawArrays(context, mode, firsts[drawID], counts[drawID]))
-        {
-            return false;
-        }
+        return true;
     }
-    return true;
+    return ValidateDrawBase(context, mode);
 }
 
-bool ValidateMultiDrawElementsANGLE(Context *context,
-                                    PrimitiveMode mode,
-                                    const GLsizei *counts,
-                                    DrawElementsType type,
-                                    const GLvoid *const *indices,
-                                    GLsizei drawcount)
+bool ValidateMultiDrawArraysANGLEDraw(Context *context,
+                                      PrimitiveMode mode,
+                                      GLint first,
+                                      GLsizei count)
+{
+    return ValidateDrawArraysParams(context, first, count, 1);
+}
+
+bool ValidateMultiDrawElementsANGLEShared(Context *context,
+                                          PrimitiveMode mode,
+                                          DrawElementsType type,
+                                          GLsizei drawcount)
 {
     if (!context->getExtensions().multiDraw)
     {
         context->validationError(GL_INVALID_OPERATION, kExtensionNotEnabled);
         return false;
     }
-    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    if (drawcount <= 0)
     {
-        if (!ValidateDrawElements(context, mode, counts[drawID], type, indices[drawID]))
-        {
-            return false;
-        }
+        return true;
     }
-    return true;
+    if (!ValidateDrawElementsBase(context, mode, type))
+    {
+        return false;
+    }
+    return ValidateDrawBase(context, mode);
+}
+
+bool ValidateMultiDrawElementsANGLEDraw(Context *context,
+                                        PrimitiveMode mode,
+                                        GLsizei count,
+                                        DrawElementsType type,
+                                        const GLvoid *indices)
+{
+    return ValidateDrawElementsParams(context, count, type, indices, 1);
 }
 
 bool ValidateProvokingVertexANGLE(Context *context, ProvokingVertexConvention modePacked)
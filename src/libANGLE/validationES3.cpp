@@ -3155,12 +3155,9 @@ bool ValidateDrawElementsInstanced(Context *context,
     return ValidateDrawElementsInstancedBase(context, mode, count, type, indices, instanceCount);
 }
 
-bool ValidateMultiDrawArraysInstancedANGLE(Context *context,
-                                           PrimitiveMode mode,
-                                           const GLint *firsts,
-                                           const GLsizei *counts,
-                                           const GLsizei *instanceCounts,
-                                           GLsizei drawcount)
+bool ValidateMultiDrawArraysInstancedANGLEShared(Context *context,
+                                                 PrimitiveMode mode,
+                                                 GLsizei drawcount)
 {
     if (!context->getExtensions().multiDraw)
     {
@@ -3179,24 +3176,26 @@ bool ValidateMultiDrawArraysInstancedANGLE(Context *context,
             return false;
         }
     }
-    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    if (drawcount <= 0)
     {
-        if (!ValidateDrawArraysInstancedBase(context, mode, firsts[drawID], counts[drawID],
-                                             instanceCounts[drawID]))
-        {
-            return false;
-        }
+        return true;
     }
-    return true;
+    return ValidateDrawBase(context, mode);
 }
 
-bool ValidateMultiDrawElementsInstancedANGLE(Context *context,
-                                             PrimitiveMode mode,
-                                             const GLsizei *counts,
-                                             DrawElementsType type,
-                                             const GLvoid *const *indices,
-                                             const GLsizei *instanceCounts,
-                                             GLsizei drawcount)
+bool ValidateMultiDrawArraysInstancedANGLEDraw(Context *context,
+                                               PrimitiveMode mode,
+                                               GLint first,
+                                               GLsizei count,
+                                               GLsizei instanceCount)
+{
+    return ValidateDrawArraysInstancedParams(context, first, count, instanceCount);
+}
+
+bool ValidateMultiDrawElementsInstancedANGLEShared(Context *context,
+                                                   PrimitiveMode mode,
+                                                   DrawElementsType type,
+                                                   GLsizei drawcount)
 {
     if (!context->getExtensions().multiDraw)
     {
@@ -3215,15 +3214,25 @@ bool ValidateMultiDrawElementsInstancedANGLE(Context *context,
             return false;
         }
     }
-    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    if (drawcount <= 0)
     {
-        if (!ValidateDrawElementsInstancedBase(context, mode, counts[drawID], type, indices[drawID],
-                                               instanceCounts[drawID]))
-        {
-            return false;
-        }
+        return true;
     }
-    return true;
+    if (!ValidateDrawElementsBase(context, mode, type))
+    {
+        return false;
+    }
+    return ValidateDrawBase(context, mode);
+}
+
+bool ValidateMultiDrawElementsInstancedANGLEDraw(Context *context,
+                                                 PrimitiveMode mode,
+                                                 GLsizei count,
+                                                 DrawElementsType type,
+                                                 const GLvoid *indices,
+                                                 GLsizei instanceCount)
+{
+    return ValidateDrawElementsInstancedParams(context, count, type, indices, instanceCount);
 }
 
 bool ValidateDrawArraysInstancedBaseInstanceANGLE(Context *context,
@@ -3266,13 +3275,9 @@ bool ValidateDrawElementsInstancedBaseVertexBaseInstanceANGLE(Context *context,
     return true;
 }
 
-bool ValidateMultiDrawArraysInstancedBaseInstanceANGLE(Context *context,
-                                                       PrimitiveMode mode,
-                                                       GLsizei drawcount,
-                                                       const GLsizei *counts,
-                                                       const GLsizei *instanceCounts,
-                                                       const GLint *firsts,
-                                                       const GLuint *baseInstances)
+bool ValidateMultiDrawArraysInstancedBaseInstanceANGLEShared(Context *context,
+                                                             PrimitiveMode mode,
+                                                             GLsizei drawcount)
 {
     if (!context->getExtensions().multiDraw)
     {
@@ -3283,26 +3288,27 @@ bool ValidateMultiDrawArraysInstancedBaseInstanceANGLE(Context *context,
     {
         return false;
     }
-    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    if (drawcount == 0)
     {
-        if (!ValidateDrawArraysInstancedBase(context, mode, firsts[drawID], counts[drawID],
-                                             instanceCounts[drawID]))
-        {
-            return false;
-        }
+        return true;
     }
-    return true;
+    return ValidateDrawBase(context, mode);
 }
 
-bool ValidateMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE(Context *context,
-                                                                   PrimitiveMode mode,
-                                                                   DrawElementsType type,
-                                                                   GLsizei drawcount,
-                                                                   const GLsizei *counts,
-                                                                   const GLsizei *instanceCounts,
-                                                                   const GLvoid *const *indices,
-                                                                   const GLint *baseVertices,
-                                                                   const GLuint *baseInstances)
+bool ValidateMultiDrawArraysInstancedBaseInstanceANGLEDraw(Context *context,
+                                                           PrimitiveMode mode,
+                                                           GLsizei count,
+                                                           GLsizei instanceCount,
+                                                           GLint first,
+                                                           GLuint baseInstance)
+{
+    return ValidateDrawArraysInstancedParams(context, first, count, instanceCount);
+}
+
+bool ValidateMultiDrawElementsInstancedBaseVertexBaseInstanceANGLEShared(Context *context,
+                                                                         PrimitiveMode mode,
+                                                                         DrawElementsType type,
+                                                                         GLsizei drawcount)
 {
     if (!context->getExtensions().multiDraw)
     {
@@ -3313,15 +3319,27 @@ bool ValidateMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE(Context *cont
     {
         return false;
     }
-    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    if (drawcount == 0)
     {
-        if (!ValidateDrawElementsInstancedBase(context, mode, counts[drawID], type, indices[drawID],
-                                               instanceCounts[drawID]))
-        {
-            return false;
-        }
+        return true;
     }
-    return true;
+    if (!ValidateDrawElementsBase(context, mode, type))
+    {
+        return false;
+    }
+    return ValidateDrawBase(context, mode);
+}
+
+bool ValidateMultiDrawElementsInstancedBaseVertexBaseInstanceANGLEDraw(Context *context,
+                                                                       PrimitiveMode mode,
+                                                                       DrawElementsType type,
+                                                                       GLsizei count,
+                                                                       GLsizei instanceCount,
+                                                                       const GLvoid *indices,
+                                                                       GLint baseVertex,
+                                                                       GLuint baseInstance)
+{
+    return ValidateDrawElementsInstancedParams(context, count, type, indices, instanceCount);
 }
 
 bool ValidateFramebufferTextureMultiviewOVR(Context *context,
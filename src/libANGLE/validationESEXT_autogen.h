@@ -32,22 +32,79 @@ bool ValidateDrawElementsInstancedBaseVertexBaseInstanceANGLE(Context *context,
                                                               GLsizei instanceCounts,
                                                               GLint baseVertex,
                                                               GLuint baseInstance);
-bool ValidateMultiDrawArraysInstancedBaseInstanceANGLE(Context *context,
-                                                       PrimitiveMode modePacked,
-                                                       GLsizei drawcount,
-                                                       const GLsizei *counts,
-                                                       const GLsizei *instanceCounts,
-                                                       const GLint *firsts,
-                                                       const GLuint *baseInstances);
-bool ValidateMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE(Context *context,
-                                                                   PrimitiveMode modePacked,
-                                                                   DrawElementsType typePacked,
-                                                                   GLsizei drawcount,
-                                                                   const GLsizei *counts,
-                                                                   const GLsizei *instanceCounts,
-                                                                   const GLvoid *const *indices,
-                                                                   const GLint *baseVertices,
-                                                                   const GLuint *baseInstances);
+bool ValidateMultiDrawArraysInstancedBaseInstanceANGLEShared(Context *context,
+                                                             PrimitiveMode modePacked,
+                                                             GLsizei drawcount);
+bool ValidateMultiDrawArraysInstancedBaseInstanceANGLEDraw(Context *context,
+                                                           PrimitiveMode modePacked,
+                                                           GLsizei count,
+                                                           GLsizei instanceCount,
+                                                           GLint first,
+                                                           GLuint baseInstance);
+ANGLE_INLINE bool ValidateMultiDrawArraysInstancedBaseInstanceANGLE(Context *context,
+                                                                    PrimitiveMode modePacked,
+                                                                    GLsizei drawcount,
+                                                                    const GLsizei *counts,
+                                                                    const GLsizei *instanceCounts,
+                                                                    const GLint *firsts,
+                                                                    const GLuint *baseInstances)
+{
+    if (!ValidateMultiDrawArraysInstancedBaseInstanceANGLEShared(context, modePacked, drawcount))
+    {
+        return false;
+    }
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        if (!ValidateMultiDrawArraysInstancedBaseInstanceANGLEDraw(
+                context, modePacked, counts[drawID], instanceCounts[drawID], firsts[drawID],
+                baseInstances[drawID]))
+        {
+            return false;
+        }
+    }
+    return true;
+}
+
+bool ValidateMultiDrawElementsInstancedBaseVertexBaseInstanceANGLEShared(
+    Context *context,
+    PrimitiveMode modePacked,
+    DrawElementsType typePacked,
+    GLsizei drawcount);
+bool ValidateMultiDrawElementsInstancedBaseVertexBaseInstanceANGLEDraw(Context *context,
+                                                                       PrimitiveMode modePacked,
+                                                                       DrawElementsType typePacked,
+                                                                       GLsizei count,
+                                                                       GLsizei instanceCount,
+                                                                       const GLvoid *indices,
+                                                                       GLint baseVertex,
+                                                                       GLuint baseInstance);
+ANGLE_INLINE bool ValidateMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE(
+    Context *context,
+    PrimitiveMode modePacked,
+    DrawElementsType typePacked,
+    GLsizei drawcount,
+    const GLsizei *counts,
+    const GLsizei *instanceCounts,
+    const GLvoid *const *indices,
+    const GLint *baseVertices,
+    const GLuint *baseInstances)
+{
+    if (!ValidateMultiDrawElementsInstancedBaseVertexBaseInstanceANGLEShared(context, modePacked,
+                                                                             typePacked, drawcount))
+    {
+        return false;
+    }
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        if (!ValidateMultiDrawElementsInstancedBaseVertexBaseInstanceANGLEDraw(
+                context, modePacked, typePacked, counts[drawID], instanceCounts[drawID],
+                indices[drawID], baseVertices[drawID], baseInstances[drawID]))
+        {
+            return false;
+        }
+    }
+    return true;
+}
 
 // GL_ANGLE_copy_texture_3d
 bool ValidateCopyTexture3DANGLE(Context *context,
@@ -116,30 +173,127 @@ bool ValidateDrawElementsInstancedANGLE(Context *context,
 bool ValidateVertexAttribDivisorANGLE(Context *context, GLuint index, GLuint divisor);
 
 // GL_ANGLE_multi_draw
-bool ValidateMultiDrawArraysANGLE(Context *context,
-                                  PrimitiveMode modePacked,
-                                  const GLint *firsts,
-                                  const GLsizei *counts,
-                                  GLsizei drawcount);
-bool ValidateMultiDrawArraysInstancedANGLE(Context *context,
-                                           PrimitiveMode modePacked,
-                                           const GLint *firsts,
-                                           const GLsizei *counts,
-                                           const GLsizei *instanceCounts,
-                                           GLsizei drawcount);
-bool ValidateMultiDrawElementsANGLE(Context *context,
-                                    PrimitiveMode modePacked,
-                                    const GLsizei *counts,
-                                    DrawElementsType typePacked,
-                                    const GLvoid *const *indices,
-                                    GLsizei drawcount);
-bool ValidateMultiDrawElementsInstancedANGLE(Context *context,
-                                             PrimitiveMode modePacked,
-                                             const GLsizei *counts,
-                                             DrawElementsType typePacked,
-                                             const GLvoid *const *indices,
-                                             const GLsizei *instanceCounts,
-                                             GLsizei drawcount);
+bool ValidateMultiDrawArraysANGLEShared(Context *context,
+                                        PrimitiveMode modePacked,
+                                        GLsizei drawcount);
+bool ValidateMultiDrawArraysANGLEDraw(Context *context,
+                                      PrimitiveMode modePacked,
+                                      GLint first,
+                                      GLsizei count);
+ANGLE_INLINE bool ValidateMultiDrawArraysANGLE(Context *context,
+                                               PrimitiveMode modePacked,
+                                               const GLint *firsts,
+                                               const GLsizei *counts,
+                                               GLsizei drawcount)
+{
+    if (!ValidateMultiDrawArraysANGLEShared(context, modePacked, drawcount))
+    {
+        return false;
+    }
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        if (!ValidateMultiDrawArraysANGLEDraw(context, modePacked, firsts[drawID], counts[drawID]))
+        {
+            return false;
+        }
+    }
+    return true;
+}
+
+bool ValidateMultiDrawArraysInstancedANGLEShared(Context *context,
+                                                 PrimitiveMode modePacked,
+                                                 GLsizei drawcount);
+bool ValidateMultiDrawArraysInstancedANGLEDraw(Context *context,
+                                               PrimitiveMode modePacked,
+                                               GLint first,
+                                               GLsizei count,
+                                               GLsizei instanceCount);
+ANGLE_INLINE bool ValidateMultiDrawArraysInstancedANGLE(Context *context,
+                                                        PrimitiveMode modePacked,
+                                                        const GLint *firsts,
+                                                        const GLsizei *counts,
+                                                        const GLsizei *instanceCounts,
+                                                        GLsizei drawcount)
+{
+    if (!ValidateMultiDrawArraysInstancedANGLEShared(context, modePacked, drawcount))
+    {
+        return false;
+    }
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        if (!ValidateMultiDrawArraysInstancedANGLEDraw(context, modePacked, firsts[drawID],
+                                                       counts[drawID], instanceCounts[drawID]))
+        {
+            return false;
+        }
+    }
+    return true;
+}
+
+bool ValidateMultiDrawElementsANGLEShared(Context *context,
+                                          PrimitiveMode modePacked,
+                                          DrawElementsType typePacked,
+                                          GLsizei drawcount);
+bool ValidateMultiDrawElementsANGLEDraw(Context *context,
+                                        PrimitiveMode modePacked,
+                                        GLsizei count,
+                                        DrawElementsType typePacked,
+                                        const GLvoid *indices);
+ANGLE_INLINE bool ValidateMultiDrawElementsANGLE(Context *context,
+                                                 PrimitiveMode modePacked,
+                                                 const GLsizei *counts,
+                                                 DrawElementsType typePacked,
+                                                 const GLvoid *const *indices,
+                                                 GLsizei drawcount)
+{
+    if (!ValidateMultiDrawElementsANGLEShared(context, modePacked, typePacked, drawcount))
+    {
+        return false;
+    }
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        if (!ValidateMultiDrawElementsANGLEDraw(context, modePacked, counts[drawID], typePacked,
+                                                indices[drawID]))
+        {
+            return false;
+        }
+    }
+    return true;
+}
+
+bool ValidateMultiDrawElementsInstancedANGLEShared(Context *context,
+                                                   PrimitiveMode modePacked,
+                                                   DrawElementsType typePacked,
+                                                   GLsizei drawcount);
+bool ValidateMultiDrawElementsInstancedANGLEDraw(Context *context,
+                                                 PrimitiveMode modePacked,
+                                                 GLsizei count,
+                                                 DrawElementsType typePacked,
+                                                 const GLvoid *indices,
+                                                 GLsizei instanceCount);
+ANGLE_INLINE bool ValidateMultiDrawElementsInstancedANGLE(Context *context,
+                                                          PrimitiveMode modePacked,
+                                                          const GLsizei *counts,
+                                                          DrawElementsType typePacked,
+                                                          const GLvoid *const *indices,
+                                                          const GLsizei *instanceCounts,
+                                                          GLsizei drawcount)
+{
+    if (!ValidateMultiDrawElementsInstancedANGLEShared(context, modePacked, typePacked, drawcount))
+    {
+        return false;
+    }
+    for (GLsizei drawID = 0; drawID < drawcount; ++drawID)
+    {
+        if (!ValidateMultiDrawElementsInstancedANGLEDraw(context, modePacked, counts[drawID],
+                                                         typePacked, indices[drawID],
+                                                         instanceCounts[drawID]))
+        {
+            return false;
+        }
+    }
+    return true;
+}
 
 // GL_ANGLE_provoking_vertex
 bool ValidateProvokingVertexANGLE(Context *context, ProvokingVertexConvention modePacked);
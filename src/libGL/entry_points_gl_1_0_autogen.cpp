@@ -33,7 +33,7 @@ void GL_APIENTRY Accum(GLenum op, GLfloat value)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateAccum(context, op, value));
         if (isCallValid)
         {
@@ -51,8 +51,8 @@ void GL_APIENTRY AlphaFunc(GLenum func, GLfloat ref)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        AlphaTestFunc funcPacked                      = FromGL<AlphaTestFunc>(func);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        AlphaTestFunc funcPacked = FromGL<AlphaTestFunc>(func);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateAlphaFunc(context, funcPacked, ref));
         if (isCallValid)
@@ -70,7 +70,7 @@ void GL_APIENTRY Begin(GLenum mode)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateBegin(context, mode));
         if (isCallValid)
         {
@@ -96,7 +96,7 @@ void GL_APIENTRY Bitmap(GLsizei width,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateBitmap(context, width, height, xorig, yorig, xmove, ymove, bitmap));
@@ -118,7 +118,7 @@ void GL_APIENTRY BlendFunc(GLenum sfactor, GLenum dfactor)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateBlendFunc(context, sfactor, dfactor));
         if (isCallValid)
@@ -136,7 +136,7 @@ void GL_APIENTRY CallList(GLuint list)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateCallList(context, list));
         if (isCallValid)
         {
@@ -154,7 +154,7 @@ void GL_APIENTRY CallLists(GLsizei n, GLenum type, const void *lists)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateCallLists(context, n, type, lists));
         if (isCallValid)
@@ -172,7 +172,7 @@ void GL_APIENTRY Clear(GLbitfield mask)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateClear(context, mask));
         if (isCallValid)
         {
@@ -190,7 +190,7 @@ void GL_APIENTRY ClearAccum(GLfloat red, GLfloat green, GLfloat blue, GLfloat al
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateClearAccum(context, red, green, blue, alpha));
         if (isCallValid)
@@ -209,7 +209,7 @@ void GL_APIENTRY ClearColor(GLfloat red, GLfloat green, GLfloat blue, GLfloat al
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateClearColor(context, red, green, blue, alpha));
         if (isCallValid)
@@ -227,7 +227,7 @@ void GL_APIENTRY ClearDepth(GLdouble depth)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateClearDepth(context, depth));
         if (isCallValid)
         {
@@ -244,7 +244,7 @@ void GL_APIENTRY ClearIndex(GLfloat c)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateClearIndex(context, c));
         if (isCallValid)
         {
@@ -261,7 +261,7 @@ void GL_APIENTRY ClearStencil(GLint s)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateClearStencil(context, s));
         if (isCallValid)
         {
@@ -279,7 +279,7 @@ void GL_APIENTRY ClipPlane(GLenum plane, const GLdouble *equation)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateClipPlane(context, plane, equation));
         if (isCallValid)
@@ -297,7 +297,7 @@ void GL_APIENTRY Color3b(GLbyte red, GLbyte green, GLbyte blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor3b(context, red, green, blue));
         if (isCallValid)
@@ -315,7 +315,7 @@ void GL_APIENTRY Color3bv(const GLbyte *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor3bv(context, v));
         if (isCallValid)
         {
@@ -332,7 +332,7 @@ void GL_APIENTRY Color3d(GLdouble red, GLdouble green, GLdouble blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor3d(context, red, green, blue));
         if (isCallValid)
@@ -350,7 +350,7 @@ void GL_APIENTRY Color3dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor3dv(context, v));
         if (isCallValid)
         {
@@ -367,7 +367,7 @@ void GL_APIENTRY Color3f(GLfloat red, GLfloat green, GLfloat blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor3f(context, red, green, blue));
         if (isCallValid)
@@ -385,7 +385,7 @@ void GL_APIENTRY Color3fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor3fv(context, v));
         if (isCallValid)
         {
@@ -402,7 +402,7 @@ void GL_APIENTRY Color3i(GLint red, GLint green, GLint blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor3i(context, red, green, blue));
         if (isCallValid)
@@ -420,7 +420,7 @@ void GL_APIENTRY Color3iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor3iv(context, v));
         if (isCallValid)
         {
@@ -437,7 +437,7 @@ void GL_APIENTRY Color3s(GLshort red, GLshort green, GLshort blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor3s(context, red, green, blue));
         if (isCallValid)
@@ -455,7 +455,7 @@ void GL_APIENTRY Color3sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor3sv(context, v));
         if (isCallValid)
         {
@@ -472,7 +472,7 @@ void GL_APIENTRY Color3ub(GLubyte red, GLubyte green, GLubyte blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor3ub(context, red, green, blue));
         if (isCallValid)
@@ -490,7 +490,7 @@ void GL_APIENTRY Color3ubv(const GLubyte *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor3ubv(context, v));
         if (isCallValid)
         {
@@ -507,7 +507,7 @@ void GL_APIENTRY Color3ui(GLuint red, GLuint green, GLuint blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor3ui(context, red, green, blue));
         if (isCallValid)
@@ -525,7 +525,7 @@ void GL_APIENTRY Color3uiv(const GLuint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor3uiv(context, v));
         if (isCallValid)
         {
@@ -542,7 +542,7 @@ void GL_APIENTRY Color3us(GLushort red, GLushort green, GLushort blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor3us(context, red, green, blue));
         if (isCallValid)
@@ -560,7 +560,7 @@ void GL_APIENTRY Color3usv(const GLushort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor3usv(context, v));
         if (isCallValid)
         {
@@ -578,7 +578,7 @@ void GL_APIENTRY Color4b(GLbyte red, GLbyte green, GLbyte blue, GLbyte alpha)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor4b(context, red, green, blue, alpha));
         if (isCallValid)
@@ -596,7 +596,7 @@ void GL_APIENTRY Color4bv(const GLbyte *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor4bv(context, v));
         if (isCallValid)
         {
@@ -614,7 +614,7 @@ void GL_APIENTRY Color4d(GLdouble red, GLdouble green, GLdouble blue, GLdouble a
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor4d(context, red, green, blue, alpha));
         if (isCallValid)
@@ -632,7 +632,7 @@ void GL_APIENTRY Color4dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor4dv(context, v));
         if (isCallValid)
         {
@@ -650,7 +650,7 @@ void GL_APIENTRY Color4f(GLfloat red, GLfloat green, GLfloat blue, GLfloat alpha
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor4f(context, red, green, blue, alpha));
         if (isCallValid)
@@ -668,7 +668,7 @@ void GL_APIENTRY Color4fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor4fv(context, v));
         if (isCallValid)
         {
@@ -686,7 +686,7 @@ void GL_APIENTRY Color4i(GLint red, GLint green, GLint blue, GLint alpha)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor4i(context, red, green, blue, alpha));
         if (isCallValid)
@@ -704,7 +704,7 @@ void GL_APIENTRY Color4iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor4iv(context, v));
         if (isCallValid)
         {
@@ -722,7 +722,7 @@ void GL_APIENTRY Color4s(GLshort red, GLshort green, GLshort blue, GLshort alpha
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor4s(context, red, green, blue, alpha));
         if (isCallValid)
@@ -740,7 +740,7 @@ void GL_APIENTRY Color4sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor4sv(context, v));
         if (isCallValid)
         {
@@ -758,7 +758,7 @@ void GL_APIENTRY Color4ub(GLubyte red, GLubyte green, GLubyte blue, GLubyte alph
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor4ub(context, red, green, blue, alpha));
         if (isCallValid)
@@ -776,7 +776,7 @@ void GL_APIENTRY Color4ubv(const GLubyte *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor4ubv(context, v));
         if (isCallValid)
         {
@@ -794,7 +794,7 @@ void GL_APIENTRY Color4ui(GLuint red, GLuint green, GLuint blue, GLuint alpha)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor4ui(context, red, green, blue, alpha));
         if (isCallValid)
@@ -812,7 +812,7 @@ void GL_APIENTRY Color4uiv(const GLuint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor4uiv(context, v));
         if (isCallValid)
         {
@@ -830,7 +830,7 @@ void GL_APIENTRY Color4us(GLushort red, GLushort green, GLushort blue, GLushort
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColor4us(context, red, green, blue, alpha));
         if (isCallValid)
@@ -848,7 +848,7 @@ void GL_APIENTRY Color4usv(const GLushort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateColor4usv(context, v));
         if (isCallValid)
         {
@@ -867,7 +867,7 @@ void GL_APIENTRY ColorMask(GLboolean red, GLboolean green, GLboolean blue, GLboo
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColorMask(context, red, green, blue, alpha));
         if (isCallValid)
@@ -886,7 +886,7 @@ void GL_APIENTRY ColorMaterial(GLenum face, GLenum mode)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateColorMaterial(context, face, mode));
         if (isCallValid)
@@ -905,7 +905,7 @@ void GL_APIENTRY CopyPixels(GLint x, GLint y, GLsizei width, GLsizei height, GLe
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateCopyPixels(context, x, y, width, height, type));
         if (isCallValid)
@@ -923,8 +923,8 @@ void GL_APIENTRY CullFace(GLenum mode)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        CullFaceMode modePacked                       = FromGL<CullFaceMode>(mode);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        CullFaceMode modePacked = FromGL<CullFaceMode>(mode);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateCullFace(context, modePacked));
         if (isCallValid)
         {
@@ -941,7 +941,7 @@ void GL_APIENTRY DeleteLists(GLuint list, GLsizei range)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateDeleteLists(context, list, range));
         if (isCallValid)
         {
@@ -958,7 +958,7 @@ void GL_APIENTRY DepthFunc(GLenum func)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateDepthFunc(context, func));
         if (isCallValid)
         {
@@ -975,7 +975,7 @@ void GL_APIENTRY DepthMask(GLboolean flag)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateDepthMask(context, flag));
         if (isCallValid)
         {
@@ -992,7 +992,7 @@ void GL_APIENTRY DepthRange(GLdouble n, GLdouble f)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateDepthRange(context, n, f));
         if (isCallValid)
         {
@@ -1009,7 +1009,7 @@ void GL_APIENTRY Disable(GLenum cap)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateDisable(context, cap));
         if (isCallValid)
         {
@@ -1026,7 +1026,7 @@ void GL_APIENTRY DrawBuffer(GLenum buf)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateDrawBuffer(context, buf));
         if (isCallValid)
         {
@@ -1048,8 +1048,8 @@ DrawPixels(GLsizei width, GLsizei height, GLenum format, GLenum type, const void
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateDrawPixels(context, width, height, format, type, pixels));
         if (isCallValid)
         {
@@ -1066,7 +1066,7 @@ void GL_APIENTRY EdgeFlag(GLboolean flag)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEdgeFlag(context, flag));
         if (isCallValid)
         {
@@ -1083,7 +1083,7 @@ void GL_APIENTRY EdgeFlagv(const GLboolean *flag)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEdgeFlagv(context, flag));
         if (isCallValid)
         {
@@ -1100,7 +1100,7 @@ void GL_APIENTRY Enable(GLenum cap)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEnable(context, cap));
         if (isCallValid)
         {
@@ -1117,7 +1117,7 @@ void GL_APIENTRY End()
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEnd(context));
         if (isCallValid)
         {
@@ -1134,7 +1134,7 @@ void GL_APIENTRY EndList()
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEndList(context));
         if (isCallValid)
         {
@@ -1151,7 +1151,7 @@ void GL_APIENTRY EvalCoord1d(GLdouble u)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEvalCoord1d(context, u));
         if (isCallValid)
         {
@@ -1168,7 +1168,7 @@ void GL_APIENTRY EvalCoord1dv(const GLdouble *u)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEvalCoord1dv(context, u));
         if (isCallValid)
         {
@@ -1185,7 +1185,7 @@ void GL_APIENTRY EvalCoord1f(GLfloat u)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEvalCoord1f(context, u));
         if (isCallValid)
         {
@@ -1202,7 +1202,7 @@ void GL_APIENTRY EvalCoord1fv(const GLfloat *u)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEvalCoord1fv(context, u));
         if (isCallValid)
         {
@@ -1219,7 +1219,7 @@ void GL_APIENTRY EvalCoord2d(GLdouble u, GLdouble v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEvalCoord2d(context, u, v));
         if (isCallValid)
         {
@@ -1236,7 +1236,7 @@ void GL_APIENTRY EvalCoord2dv(const GLdouble *u)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEvalCoord2dv(context, u));
         if (isCallValid)
         {
@@ -1253,7 +1253,7 @@ void GL_APIENTRY EvalCoord2f(GLfloat u, GLfloat v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEvalCoord2f(context, u, v));
         if (isCallValid)
         {
@@ -1270,7 +1270,7 @@ void GL_APIENTRY EvalCoord2fv(const GLfloat *u)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEvalCoord2fv(context, u));
         if (isCallValid)
         {
@@ -1288,7 +1288,7 @@ void GL_APIENTRY EvalMesh1(GLenum mode, GLint i1, GLint i2)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEvalMesh1(context, mode, i1, i2));
         if (isCallValid)
         {
@@ -1306,7 +1306,7 @@ void GL_APIENTRY EvalMesh2(GLenum mode, GLint i1, GLint i2, GLint j1, GLint j2)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateEvalMesh2(context, mode, i1, i2, j1, j2));
         if (isCallValid)
@@ -1324,7 +1324,7 @@ void GL_APIENTRY EvalPoint1(GLint i)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEvalPoint1(context, i));
         if (isCallValid)
         {
@@ -1341,7 +1341,7 @@ void GL_APIENTRY EvalPoint2(GLint i, GLint j)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateEvalPoint2(context, i, j));
         if (isCallValid)
         {
@@ -1359,7 +1359,7 @@ void GL_APIENTRY FeedbackBuffer(GLsizei size, GLenum type, GLfloat *buffer)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateFeedbackBuffer(context, size, type, buffer));
         if (isCallValid)
@@ -1377,7 +1377,7 @@ void GL_APIENTRY Finish()
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateFinish(context));
         if (isCallValid)
         {
@@ -1394,7 +1394,7 @@ void GL_APIENTRY Flush()
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateFlush(context));
         if (isCallValid)
         {
@@ -1412,7 +1412,7 @@ void GL_APIENTRY Fogf(GLenum pname, GLfloat param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateFogf(context, pname, param));
         if (isCallValid)
         {
@@ -1430,7 +1430,7 @@ void GL_APIENTRY Fogfv(GLenum pname, const GLfloat *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateFogfv(context, pname, params));
         if (isCallValid)
         {
@@ -1448,7 +1448,7 @@ void GL_APIENTRY Fogi(GLenum pname, GLint param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateFogi(context, pname, param));
         if (isCallValid)
         {
@@ -1466,7 +1466,7 @@ void GL_APIENTRY Fogiv(GLenum pname, const GLint *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateFogiv(context, pname, params));
         if (isCallValid)
         {
@@ -1483,7 +1483,7 @@ void GL_APIENTRY FrontFace(GLenum mode)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateFrontFace(context, mode));
         if (isCallValid)
         {
@@ -1504,8 +1504,8 @@ Frustum(GLdouble left, GLdouble right, GLdouble bottom, GLdouble top, GLdouble z
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateFrustum(context, left, right, bottom, top, zNear, zFar));
         if (isCallValid)
         {
@@ -1523,7 +1523,7 @@ GLuint GL_APIENTRY GenLists(GLsizei range)
     GLuint returnValue;
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateGenLists(context, range));
         if (isCallValid)
         {
@@ -1550,7 +1550,7 @@ void GL_APIENTRY GetBooleanv(GLenum pname, GLboolean *data)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateGetBooleanv(context, pname, data));
         if (isCallValid)
         {
@@ -1568,7 +1568,7 @@ void GL_APIENTRY GetClipPlane(GLenum plane, GLdouble *equation)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetClipPlane(context, plane, equation));
         if (isCallValid)
@@ -1587,7 +1587,7 @@ void GL_APIENTRY GetDoublev(GLenum pname, GLdouble *data)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateGetDoublev(context, pname, data));
         if (isCallValid)
         {
@@ -1605,7 +1605,7 @@ GLenum GL_APIENTRY GetError()
     GLenum returnValue;
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateGetError(context));
         if (isCallValid)
         {
@@ -1632,7 +1632,7 @@ void GL_APIENTRY GetFloatv(GLenum pname, GLfloat *data)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateGetFloatv(context, pname, data));
         if (isCallValid)
         {
@@ -1650,7 +1650,7 @@ void GL_APIENTRY GetIntegerv(GLenum pname, GLint *data)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateGetIntegerv(context, pname, data));
         if (isCallValid)
         {
@@ -1669,8 +1669,8 @@ void GL_APIENTRY GetLightfv(GLenum light, GLenum pname, GLfloat *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        LightParameter pnamePacked                    = FromGL<LightParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        LightParameter pnamePacked = FromGL<LightParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetLightfv(context, light, pnamePacked, params));
         if (isCallValid)
@@ -1690,7 +1690,7 @@ void GL_APIENTRY GetLightiv(GLenum light, GLenum pname, GLint *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetLightiv(context, light, pname, params));
         if (isCallValid)
@@ -1710,7 +1710,7 @@ void GL_APIENTRY GetMapdv(GLenum target, GLenum query, GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetMapdv(context, target, query, v));
         if (isCallValid)
@@ -1730,7 +1730,7 @@ void GL_APIENTRY GetMapfv(GLenum target, GLenum query, GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetMapfv(context, target, query, v));
         if (isCallValid)
@@ -1750,7 +1750,7 @@ void GL_APIENTRY GetMapiv(GLenum target, GLenum query, GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetMapiv(context, target, query, v));
         if (isCallValid)
@@ -1770,9 +1770,9 @@ void GL_APIENTRY GetMaterialfv(GLenum face, GLenum pname, GLfloat *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        MaterialParameter pnamePacked                 = FromGL<MaterialParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        MaterialParameter pnamePacked = FromGL<MaterialParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateGetMaterialfv(context, face, pnamePacked, params));
         if (isCallValid)
         {
@@ -1791,7 +1791,7 @@ void GL_APIENTRY GetMaterialiv(GLenum face, GLenum pname, GLint *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetMaterialiv(context, face, pname, params));
         if (isCallValid)
@@ -1810,7 +1810,7 @@ void GL_APIENTRY GetPixelMapfv(GLenum map, GLfloat *values)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetPixelMapfv(context, map, values));
         if (isCallValid)
@@ -1829,7 +1829,7 @@ void GL_APIENTRY GetPixelMapuiv(GLenum map, GLuint *values)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetPixelMapuiv(context, map, values));
         if (isCallValid)
@@ -1848,7 +1848,7 @@ void GL_APIENTRY GetPixelMapusv(GLenum map, GLushort *values)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetPixelMapusv(context, map, values));
         if (isCallValid)
@@ -1866,7 +1866,7 @@ void GL_APIENTRY GetPolygonStipple(GLubyte *mask)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateGetPolygonStipple(context, mask));
         if (isCallValid)
         {
@@ -1884,7 +1884,7 @@ const GLubyte *GL_APIENTRY GetString(GLenum name)
     const GLubyte *returnValue;
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateGetString(context, name));
         if (isCallValid)
         {
@@ -1912,10 +1912,10 @@ void GL_APIENTRY GetTexEnvfv(GLenum target, GLenum pname, GLfloat *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked                 = FromGL<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked               = FromGL<TextureEnvParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureEnvTarget targetPacked   = FromGL<TextureEnvTarget>(target);
+        TextureEnvParameter pnamePacked = FromGL<TextureEnvParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateGetTexEnvfv(context, targetPacked, pnamePacked, params));
         if (isCallValid)
         {
@@ -1934,10 +1934,10 @@ void GL_APIENTRY GetTexEnviv(GLenum target, GLenum pname, GLint *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked                 = FromGL<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked               = FromGL<TextureEnvParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureEnvTarget targetPacked   = FromGL<TextureEnvTarget>(target);
+        TextureEnvParameter pnamePacked = FromGL<TextureEnvParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateGetTexEnviv(context, targetPacked, pnamePacked, params));
         if (isCallValid)
         {
@@ -1956,7 +1956,7 @@ void GL_APIENTRY GetTexGendv(GLenum coord, GLenum pname, GLdouble *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetTexGendv(context, coord, pname, params));
         if (isCallValid)
@@ -1976,7 +1976,7 @@ void GL_APIENTRY GetTexGenfv(GLenum coord, GLenum pname, GLfloat *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetTexGenfv(context, coord, pname, params));
         if (isCallValid)
@@ -1996,7 +1996,7 @@ void GL_APIENTRY GetTexGeniv(GLenum coord, GLenum pname, GLint *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetTexGeniv(context, coord, pname, params));
         if (isCallValid)
@@ -2019,8 +2019,8 @@ void GL_APIENTRY GetTexImage(GLenum target, GLint level, GLenum format, GLenum t
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateGetTexImage(context, target, level, format, type, pixels));
         if (isCallValid)
         {
@@ -2041,8 +2041,8 @@ void GL_APIENTRY GetTexLevelParameterfv(GLenum target, GLint level, GLenum pname
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked                    = FromGL<TextureTarget>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        TextureTarget targetPacked = FromGL<TextureTarget>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateGetTexLevelParameterfv(context, targetPacked, level, pname, params));
@@ -2065,8 +2065,8 @@ void GL_APIENTRY GetTexLevelParameteriv(GLenum target, GLint level, GLenum pname
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked                    = FromGL<TextureTarget>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        TextureTarget targetPacked = FromGL<TextureTarget>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateGetTexLevelParameteriv(context, targetPacked, level, pname, params));
@@ -2088,9 +2088,9 @@ void GL_APIENTRY GetTexParameterfv(GLenum target, GLenum pname, GLfloat *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureType targetPacked                      = FromGL<TextureType>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureType targetPacked = FromGL<TextureType>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateGetTexParameterfv(context, targetPacked, pname, params));
         if (isCallValid)
         {
@@ -2109,9 +2109,9 @@ void GL_APIENTRY GetTexParameteriv(GLenum target, GLenum pname, GLint *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureType targetPacked                      = FromGL<TextureType>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureType targetPacked = FromGL<TextureType>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateGetTexParameteriv(context, targetPacked, pname, params));
         if (isCallValid)
         {
@@ -2129,7 +2129,7 @@ void GL_APIENTRY Hint(GLenum target, GLenum mode)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateHint(context, target, mode));
         if (isCallValid)
         {
@@ -2146,7 +2146,7 @@ void GL_APIENTRY IndexMask(GLuint mask)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIndexMask(context, mask));
         if (isCallValid)
         {
@@ -2163,7 +2163,7 @@ void GL_APIENTRY Indexd(GLdouble c)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIndexd(context, c));
         if (isCallValid)
         {
@@ -2180,7 +2180,7 @@ void GL_APIENTRY Indexdv(const GLdouble *c)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIndexdv(context, c));
         if (isCallValid)
         {
@@ -2197,7 +2197,7 @@ void GL_APIENTRY Indexf(GLfloat c)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIndexf(context, c));
         if (isCallValid)
         {
@@ -2214,7 +2214,7 @@ void GL_APIENTRY Indexfv(const GLfloat *c)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIndexfv(context, c));
         if (isCallValid)
         {
@@ -2231,7 +2231,7 @@ void GL_APIENTRY Indexi(GLint c)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIndexi(context, c));
         if (isCallValid)
         {
@@ -2248,7 +2248,7 @@ void GL_APIENTRY Indexiv(const GLint *c)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIndexiv(context, c));
         if (isCallValid)
         {
@@ -2265,7 +2265,7 @@ void GL_APIENTRY Indexs(GLshort c)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIndexs(context, c));
         if (isCallValid)
         {
@@ -2282,7 +2282,7 @@ void GL_APIENTRY Indexsv(const GLshort *c)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIndexsv(context, c));
         if (isCallValid)
         {
@@ -2299,7 +2299,7 @@ void GL_APIENTRY InitNames()
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateInitNames(context));
         if (isCallValid)
         {
@@ -2317,7 +2317,7 @@ GLboolean GL_APIENTRY IsEnabled(GLenum cap)
     GLboolean returnValue;
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIsEnabled(context, cap));
         if (isCallValid)
         {
@@ -2344,7 +2344,7 @@ GLboolean GL_APIENTRY IsList(GLuint list)
     GLboolean returnValue;
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIsList(context, list));
         if (isCallValid)
         {
@@ -2371,7 +2371,7 @@ void GL_APIENTRY LightModelf(GLenum pname, GLfloat param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateLightModelf(context, pname, param));
         if (isCallValid)
@@ -2390,7 +2390,7 @@ void GL_APIENTRY LightModelfv(GLenum pname, const GLfloat *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateLightModelfv(context, pname, params));
         if (isCallValid)
@@ -2409,7 +2409,7 @@ void GL_APIENTRY LightModeli(GLenum pname, GLint param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateLightModeli(context, pname, param));
         if (isCallValid)
@@ -2428,7 +2428,7 @@ void GL_APIENTRY LightModeliv(GLenum pname, const GLint *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateLightModeliv(context, pname, params));
         if (isCallValid)
@@ -2448,8 +2448,8 @@ void GL_APIENTRY Lightf(GLenum light, GLenum pname, GLfloat param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        LightParameter pnamePacked                    = FromGL<LightParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        LightParameter pnamePacked = FromGL<LightParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateLightf(context, light, pnamePacked, param));
         if (isCallValid)
@@ -2469,8 +2469,8 @@ void GL_APIENTRY Lightfv(GLenum light, GLenum pname, const GLfloat *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        LightParameter pnamePacked                    = FromGL<LightParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        LightParameter pnamePacked = FromGL<LightParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateLightfv(context, light, pnamePacked, params));
         if (isCallValid)
@@ -2490,7 +2490,7 @@ void GL_APIENTRY Lighti(GLenum light, GLenum pname, GLint param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateLighti(context, light, pname, param));
         if (isCallValid)
@@ -2510,7 +2510,7 @@ void GL_APIENTRY Lightiv(GLenum light, GLenum pname, const GLint *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateLightiv(context, light, pname, params));
         if (isCallValid)
@@ -2528,7 +2528,7 @@ void GL_APIENTRY LineStipple(GLint factor, GLushort pattern)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateLineStipple(context, factor, pattern));
         if (isCallValid)
@@ -2546,7 +2546,7 @@ void GL_APIENTRY LineWidth(GLfloat width)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateLineWidth(context, width));
         if (isCallValid)
         {
@@ -2563,7 +2563,7 @@ void GL_APIENTRY ListBase(GLuint base)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateListBase(context, base));
         if (isCallValid)
         {
@@ -2580,7 +2580,7 @@ void GL_APIENTRY LoadIdentity()
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateLoadIdentity(context));
         if (isCallValid)
         {
@@ -2597,7 +2597,7 @@ void GL_APIENTRY LoadMatrixd(const GLdouble *m)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateLoadMatrixd(context, m));
         if (isCallValid)
         {
@@ -2614,7 +2614,7 @@ void GL_APIENTRY LoadMatrixf(const GLfloat *m)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateLoadMatrixf(context, m));
         if (isCallValid)
         {
@@ -2631,7 +2631,7 @@ void GL_APIENTRY LoadName(GLuint name)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateLoadName(context, name));
         if (isCallValid)
         {
@@ -2648,8 +2648,8 @@ void GL_APIENTRY LogicOp(GLenum opcode)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        LogicalOperation opcodePacked                 = FromGL<LogicalOperation>(opcode);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        LogicalOperation opcodePacked = FromGL<LogicalOperation>(opcode);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateLogicOp(context, opcodePacked));
         if (isCallValid)
         {
@@ -2670,8 +2670,8 @@ Map1d(GLenum target, GLdouble u1, GLdouble u2, GLint stride, GLint order, const
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateMap1d(context, target, u1, u2, stride, order, points));
         if (isCallValid)
         {
@@ -2692,8 +2692,8 @@ Map1f(GLenum target, GLfloat u1, GLfloat u2, GLint stride, GLint order, const GL
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateMap1f(context, target, u1, u2, stride, order, points));
         if (isCallValid)
         {
@@ -2724,7 +2724,7 @@ void GL_APIENTRY Map2d(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMap2d(context, target, u1, u2, ustride, uorder,
                                                         v1, v2, vstride, vorder, points));
@@ -2758,7 +2758,7 @@ void GL_APIENTRY Map2f(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMap2f(context, target, u1, u2, ustride, uorder,
                                                         v1, v2, vstride, vorder, points));
@@ -2778,7 +2778,7 @@ void GL_APIENTRY MapGrid1d(GLint un, GLdouble u1, GLdouble u2)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateMapGrid1d(context, un, u1, u2));
         if (isCallValid)
         {
@@ -2795,7 +2795,7 @@ void GL_APIENTRY MapGrid1f(GLint un, GLfloat u1, GLfloat u2)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateMapGrid1f(context, un, u1, u2));
         if (isCallValid)
         {
@@ -2815,7 +2815,7 @@ void GL_APIENTRY MapGrid2d(GLint un, GLdouble u1, GLdouble u2, GLint vn, GLdoubl
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMapGrid2d(context, un, u1, u2, vn, v1, v2));
         if (isCallValid)
@@ -2836,7 +2836,7 @@ void GL_APIENTRY MapGrid2f(GLint un, GLfloat u1, GLfloat u2, GLint vn, GLfloat v
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMapGrid2f(context, un, u1, u2, vn, v1, v2));
         if (isCallValid)
@@ -2856,8 +2856,8 @@ void GL_APIENTRY Materialf(GLenum face, GLenum pname, GLfloat param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        MaterialParameter pnamePacked                 = FromGL<MaterialParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        MaterialParameter pnamePacked = FromGL<MaterialParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMaterialf(context, face, pnamePacked, param));
         if (isCallValid)
@@ -2877,8 +2877,8 @@ void GL_APIENTRY Materialfv(GLenum face, GLenum pname, const GLfloat *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        MaterialParameter pnamePacked                 = FromGL<MaterialParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        MaterialParameter pnamePacked = FromGL<MaterialParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMaterialfv(context, face, pnamePacked, params));
         if (isCallValid)
@@ -2898,7 +2898,7 @@ void GL_APIENTRY Materiali(GLenum face, GLenum pname, GLint param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMateriali(context, face, pname, param));
         if (isCallValid)
@@ -2918,7 +2918,7 @@ void GL_APIENTRY Materialiv(GLenum face, GLenum pname, const GLint *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMaterialiv(context, face, pname, params));
         if (isCallValid)
@@ -2936,8 +2936,8 @@ void GL_APIENTRY MatrixMode(GLenum mode)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        MatrixType modePacked                         = FromGL<MatrixType>(mode);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        MatrixType modePacked = FromGL<MatrixType>(mode);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateMatrixMode(context, modePacked));
         if (isCallValid)
         {
@@ -2954,7 +2954,7 @@ void GL_APIENTRY MultMatrixd(const GLdouble *m)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateMultMatrixd(context, m));
         if (isCallValid)
         {
@@ -2971,7 +2971,7 @@ void GL_APIENTRY MultMatrixf(const GLfloat *m)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateMultMatrixf(context, m));
         if (isCallValid)
         {
@@ -2989,7 +2989,7 @@ void GL_APIENTRY NewList(GLuint list, GLenum mode)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateNewList(context, list, mode));
         if (isCallValid)
         {
@@ -3006,7 +3006,7 @@ void GL_APIENTRY Normal3b(GLbyte nx, GLbyte ny, GLbyte nz)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateNormal3b(context, nx, ny, nz));
         if (isCallValid)
         {
@@ -3023,7 +3023,7 @@ void GL_APIENTRY Normal3bv(const GLbyte *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateNormal3bv(context, v));
         if (isCallValid)
         {
@@ -3040,7 +3040,7 @@ void GL_APIENTRY Normal3d(GLdouble nx, GLdouble ny, GLdouble nz)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateNormal3d(context, nx, ny, nz));
         if (isCallValid)
         {
@@ -3057,7 +3057,7 @@ void GL_APIENTRY Normal3dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateNormal3dv(context, v));
         if (isCallValid)
         {
@@ -3074,7 +3074,7 @@ void GL_APIENTRY Normal3f(GLfloat nx, GLfloat ny, GLfloat nz)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateNormal3f(context, nx, ny, nz));
         if (isCallValid)
         {
@@ -3091,7 +3091,7 @@ void GL_APIENTRY Normal3fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateNormal3fv(context, v));
         if (isCallValid)
         {
@@ -3108,7 +3108,7 @@ void GL_APIENTRY Normal3i(GLint nx, GLint ny, GLint nz)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateNormal3i(context, nx, ny, nz));
         if (isCallValid)
         {
@@ -3125,7 +3125,7 @@ void GL_APIENTRY Normal3iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateNormal3iv(context, v));
         if (isCallValid)
         {
@@ -3142,7 +3142,7 @@ void GL_APIENTRY Normal3s(GLshort nx, GLshort ny, GLshort nz)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateNormal3s(context, nx, ny, nz));
         if (isCallValid)
         {
@@ -3159,7 +3159,7 @@ void GL_APIENTRY Normal3sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateNormal3sv(context, v));
         if (isCallValid)
         {
@@ -3180,8 +3180,8 @@ Ortho(GLdouble left, GLdouble right, GLdouble bottom, GLdouble top, GLdouble zNe
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateOrtho(context, left, right, bottom, top, zNear, zFar));
         if (isCallValid)
         {
@@ -3198,7 +3198,7 @@ void GL_APIENTRY PassThrough(GLfloat token)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidatePassThrough(context, token));
         if (isCallValid)
         {
@@ -3216,7 +3216,7 @@ void GL_APIENTRY PixelMapfv(GLenum map, GLsizei mapsize, const GLfloat *values)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePixelMapfv(context, map, mapsize, values));
         if (isCallValid)
@@ -3235,7 +3235,7 @@ void GL_APIENTRY PixelMapuiv(GLenum map, GLsizei mapsize, const GLuint *values)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePixelMapuiv(context, map, mapsize, values));
         if (isCallValid)
@@ -3254,7 +3254,7 @@ void GL_APIENTRY PixelMapusv(GLenum map, GLsizei mapsize, const GLushort *values
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePixelMapusv(context, map, mapsize, values));
         if (isCallValid)
@@ -3273,7 +3273,7 @@ void GL_APIENTRY PixelStoref(GLenum pname, GLfloat param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePixelStoref(context, pname, param));
         if (isCallValid)
@@ -3292,7 +3292,7 @@ void GL_APIENTRY PixelStorei(GLenum pname, GLint param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePixelStorei(context, pname, param));
         if (isCallValid)
@@ -3311,7 +3311,7 @@ void GL_APIENTRY PixelTransferf(GLenum pname, GLfloat param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePixelTransferf(context, pname, param));
         if (isCallValid)
@@ -3330,7 +3330,7 @@ void GL_APIENTRY PixelTransferi(GLenum pname, GLint param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePixelTransferi(context, pname, param));
         if (isCallValid)
@@ -3348,7 +3348,7 @@ void GL_APIENTRY PixelZoom(GLfloat xfactor, GLfloat yfactor)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePixelZoom(context, xfactor, yfactor));
         if (isCallValid)
@@ -3366,7 +3366,7 @@ void GL_APIENTRY PointSize(GLfloat size)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidatePointSize(context, size));
         if (isCallValid)
         {
@@ -3384,7 +3384,7 @@ void GL_APIENTRY PolygonMode(GLenum face, GLenum mode)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidatePolygonMode(context, face, mode));
         if (isCallValid)
         {
@@ -3401,7 +3401,7 @@ void GL_APIENTRY PolygonStipple(const GLubyte *mask)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidatePolygonStipple(context, mask));
         if (isCallValid)
         {
@@ -3418,7 +3418,7 @@ void GL_APIENTRY PopAttrib()
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidatePopAttrib(context));
         if (isCallValid)
         {
@@ -3435,7 +3435,7 @@ void GL_APIENTRY PopMatrix()
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidatePopMatrix(context));
         if (isCallValid)
         {
@@ -3452,7 +3452,7 @@ void GL_APIENTRY PopName()
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidatePopName(context));
         if (isCallValid)
         {
@@ -3469,7 +3469,7 @@ void GL_APIENTRY PushAttrib(GLbitfield mask)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidatePushAttrib(context, mask));
         if (isCallValid)
         {
@@ -3486,7 +3486,7 @@ void GL_APIENTRY PushMatrix()
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidatePushMatrix(context));
         if (isCallValid)
         {
@@ -3503,7 +3503,7 @@ void GL_APIENTRY PushName(GLuint name)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidatePushName(context, name));
         if (isCallValid)
         {
@@ -3520,7 +3520,7 @@ void GL_APIENTRY RasterPos2d(GLdouble x, GLdouble y)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos2d(context, x, y));
         if (isCallValid)
         {
@@ -3537,7 +3537,7 @@ void GL_APIENTRY RasterPos2dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos2dv(context, v));
         if (isCallValid)
         {
@@ -3554,7 +3554,7 @@ void GL_APIENTRY RasterPos2f(GLfloat x, GLfloat y)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos2f(context, x, y));
         if (isCallValid)
         {
@@ -3571,7 +3571,7 @@ void GL_APIENTRY RasterPos2fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos2fv(context, v));
         if (isCallValid)
         {
@@ -3588,7 +3588,7 @@ void GL_APIENTRY RasterPos2i(GLint x, GLint y)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos2i(context, x, y));
         if (isCallValid)
         {
@@ -3605,7 +3605,7 @@ void GL_APIENTRY RasterPos2iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos2iv(context, v));
         if (isCallValid)
         {
@@ -3622,7 +3622,7 @@ void GL_APIENTRY RasterPos2s(GLshort x, GLshort y)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos2s(context, x, y));
         if (isCallValid)
         {
@@ -3639,7 +3639,7 @@ void GL_APIENTRY RasterPos2sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos2sv(context, v));
         if (isCallValid)
         {
@@ -3656,7 +3656,7 @@ void GL_APIENTRY RasterPos3d(GLdouble x, GLdouble y, GLdouble z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos3d(context, x, y, z));
         if (isCallValid)
         {
@@ -3673,7 +3673,7 @@ void GL_APIENTRY RasterPos3dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos3dv(context, v));
         if (isCallValid)
         {
@@ -3690,7 +3690,7 @@ void GL_APIENTRY RasterPos3f(GLfloat x, GLfloat y, GLfloat z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos3f(context, x, y, z));
         if (isCallValid)
         {
@@ -3707,7 +3707,7 @@ void GL_APIENTRY RasterPos3fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos3fv(context, v));
         if (isCallValid)
         {
@@ -3724,7 +3724,7 @@ void GL_APIENTRY RasterPos3i(GLint x, GLint y, GLint z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos3i(context, x, y, z));
         if (isCallValid)
         {
@@ -3741,7 +3741,7 @@ void GL_APIENTRY RasterPos3iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos3iv(context, v));
         if (isCallValid)
         {
@@ -3758,7 +3758,7 @@ void GL_APIENTRY RasterPos3s(GLshort x, GLshort y, GLshort z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos3s(context, x, y, z));
         if (isCallValid)
         {
@@ -3775,7 +3775,7 @@ void GL_APIENTRY RasterPos3sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos3sv(context, v));
         if (isCallValid)
         {
@@ -3792,7 +3792,7 @@ void GL_APIENTRY RasterPos4d(GLdouble x, GLdouble y, GLdouble z, GLdouble w)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos4d(context, x, y, z, w));
         if (isCallValid)
         {
@@ -3809,7 +3809,7 @@ void GL_APIENTRY RasterPos4dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos4dv(context, v));
         if (isCallValid)
         {
@@ -3826,7 +3826,7 @@ void GL_APIENTRY RasterPos4f(GLfloat x, GLfloat y, GLfloat z, GLfloat w)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos4f(context, x, y, z, w));
         if (isCallValid)
         {
@@ -3843,7 +3843,7 @@ void GL_APIENTRY RasterPos4fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos4fv(context, v));
         if (isCallValid)
         {
@@ -3860,7 +3860,7 @@ void GL_APIENTRY RasterPos4i(GLint x, GLint y, GLint z, GLint w)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos4i(context, x, y, z, w));
         if (isCallValid)
         {
@@ -3877,7 +3877,7 @@ void GL_APIENTRY RasterPos4iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos4iv(context, v));
         if (isCallValid)
         {
@@ -3894,7 +3894,7 @@ void GL_APIENTRY RasterPos4s(GLshort x, GLshort y, GLshort z, GLshort w)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos4s(context, x, y, z, w));
         if (isCallValid)
         {
@@ -3911,7 +3911,7 @@ void GL_APIENTRY RasterPos4sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRasterPos4sv(context, v));
         if (isCallValid)
         {
@@ -3928,7 +3928,7 @@ void GL_APIENTRY ReadBuffer(GLenum src)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateReadBuffer(context, src));
         if (isCallValid)
         {
@@ -3955,8 +3955,8 @@ void GL_APIENTRY ReadPixels(GLint x,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateReadPixels(context, x, y, width, height, format, type, pixels));
         if (isCallValid)
         {
@@ -3974,7 +3974,7 @@ void GL_APIENTRY Rectd(GLdouble x1, GLdouble y1, GLdouble x2, GLdouble y2)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRectd(context, x1, y1, x2, y2));
         if (isCallValid)
         {
@@ -3992,7 +3992,7 @@ void GL_APIENTRY Rectdv(const GLdouble *v1, const GLdouble *v2)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRectdv(context, v1, v2));
         if (isCallValid)
         {
@@ -4009,7 +4009,7 @@ void GL_APIENTRY Rectf(GLfloat x1, GLfloat y1, GLfloat x2, GLfloat y2)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRectf(context, x1, y1, x2, y2));
         if (isCallValid)
         {
@@ -4027,7 +4027,7 @@ void GL_APIENTRY Rectfv(const GLfloat *v1, const GLfloat *v2)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRectfv(context, v1, v2));
         if (isCallValid)
         {
@@ -4044,7 +4044,7 @@ void GL_APIENTRY Recti(GLint x1, GLint y1, GLint x2, GLint y2)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRecti(context, x1, y1, x2, y2));
         if (isCallValid)
         {
@@ -4062,7 +4062,7 @@ void GL_APIENTRY Rectiv(const GLint *v1, const GLint *v2)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRectiv(context, v1, v2));
         if (isCallValid)
         {
@@ -4079,7 +4079,7 @@ void GL_APIENTRY Rects(GLshort x1, GLshort y1, GLshort x2, GLshort y2)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRects(context, x1, y1, x2, y2));
         if (isCallValid)
         {
@@ -4097,7 +4097,7 @@ void GL_APIENTRY Rectsv(const GLshort *v1, const GLshort *v2)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRectsv(context, v1, v2));
         if (isCallValid)
         {
@@ -4115,7 +4115,7 @@ GLint GL_APIENTRY RenderMode(GLenum mode)
     GLint returnValue;
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRenderMode(context, mode));
         if (isCallValid)
         {
@@ -4142,7 +4142,7 @@ void GL_APIENTRY Rotated(GLdouble angle, GLdouble x, GLdouble y, GLdouble z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRotated(context, angle, x, y, z));
         if (isCallValid)
         {
@@ -4159,7 +4159,7 @@ void GL_APIENTRY Rotatef(GLfloat angle, GLfloat x, GLfloat y, GLfloat z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateRotatef(context, angle, x, y, z));
         if (isCallValid)
         {
@@ -4176,7 +4176,7 @@ void GL_APIENTRY Scaled(GLdouble x, GLdouble y, GLdouble z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateScaled(context, x, y, z));
         if (isCallValid)
         {
@@ -4193,7 +4193,7 @@ void GL_APIENTRY Scalef(GLfloat x, GLfloat y, GLfloat z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateScalef(context, x, y, z));
         if (isCallValid)
         {
@@ -4211,7 +4211,7 @@ void GL_APIENTRY Scissor(GLint x, GLint y, GLsizei width, GLsizei height)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateScissor(context, x, y, width, height));
         if (isCallValid)
@@ -4229,7 +4229,7 @@ void GL_APIENTRY SelectBuffer(GLsizei size, GLuint *buffer)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateSelectBuffer(context, size, buffer));
         if (isCallValid)
@@ -4247,8 +4247,8 @@ void GL_APIENTRY ShadeModel(GLenum mode)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        ShadingModel modePacked                       = FromGL<ShadingModel>(mode);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        ShadingModel modePacked = FromGL<ShadingModel>(mode);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateShadeModel(context, modePacked));
         if (isCallValid)
         {
@@ -4266,7 +4266,7 @@ void GL_APIENTRY StencilFunc(GLenum func, GLint ref, GLuint mask)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateStencilFunc(context, func, ref, mask));
         if (isCallValid)
@@ -4284,7 +4284,7 @@ void GL_APIENTRY StencilMask(GLuint mask)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateStencilMask(context, mask));
         if (isCallValid)
         {
@@ -4304,7 +4304,7 @@ void GL_APIENTRY StencilOp(GLenum fail, GLenum zfail, GLenum zpass)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateStencilOp(context, fail, zfail, zpass));
         if (isCallValid)
@@ -4322,7 +4322,7 @@ void GL_APIENTRY TexCoord1d(GLdouble s)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord1d(context, s));
         if (isCallValid)
         {
@@ -4339,7 +4339,7 @@ void GL_APIENTRY TexCoord1dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord1dv(context, v));
         if (isCallValid)
         {
@@ -4356,7 +4356,7 @@ void GL_APIENTRY TexCoord1f(GLfloat s)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord1f(context, s));
         if (isCallValid)
         {
@@ -4373,7 +4373,7 @@ void GL_APIENTRY TexCoord1fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord1fv(context, v));
         if (isCallValid)
         {
@@ -4390,7 +4390,7 @@ void GL_APIENTRY TexCoord1i(GLint s)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord1i(context, s));
         if (isCallValid)
         {
@@ -4407,7 +4407,7 @@ void GL_APIENTRY TexCoord1iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord1iv(context, v));
         if (isCallValid)
         {
@@ -4424,7 +4424,7 @@ void GL_APIENTRY TexCoord1s(GLshort s)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord1s(context, s));
         if (isCallValid)
         {
@@ -4441,7 +4441,7 @@ void GL_APIENTRY TexCoord1sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord1sv(context, v));
         if (isCallValid)
         {
@@ -4458,7 +4458,7 @@ void GL_APIENTRY TexCoord2d(GLdouble s, GLdouble t)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord2d(context, s, t));
         if (isCallValid)
         {
@@ -4475,7 +4475,7 @@ void GL_APIENTRY TexCoord2dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord2dv(context, v));
         if (isCallValid)
         {
@@ -4492,7 +4492,7 @@ void GL_APIENTRY TexCoord2f(GLfloat s, GLfloat t)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord2f(context, s, t));
         if (isCallValid)
         {
@@ -4509,7 +4509,7 @@ void GL_APIENTRY TexCoord2fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord2fv(context, v));
         if (isCallValid)
         {
@@ -4526,7 +4526,7 @@ void GL_APIENTRY TexCoord2i(GLint s, GLint t)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord2i(context, s, t));
         if (isCallValid)
         {
@@ -4543,7 +4543,7 @@ void GL_APIENTRY TexCoord2iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord2iv(context, v));
         if (isCallValid)
         {
@@ -4560,7 +4560,7 @@ void GL_APIENTRY TexCoord2s(GLshort s, GLshort t)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord2s(context, s, t));
         if (isCallValid)
         {
@@ -4577,7 +4577,7 @@ void GL_APIENTRY TexCoord2sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord2sv(context, v));
         if (isCallValid)
         {
@@ -4594,7 +4594,7 @@ void GL_APIENTRY TexCoord3d(GLdouble s, GLdouble t, GLdouble r)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord3d(context, s, t, r));
         if (isCallValid)
         {
@@ -4611,7 +4611,7 @@ void GL_APIENTRY TexCoord3dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord3dv(context, v));
         if (isCallValid)
         {
@@ -4628,7 +4628,7 @@ void GL_APIENTRY TexCoord3f(GLfloat s, GLfloat t, GLfloat r)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord3f(context, s, t, r));
         if (isCallValid)
         {
@@ -4645,7 +4645,7 @@ void GL_APIENTRY TexCoord3fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord3fv(context, v));
         if (isCallValid)
         {
@@ -4662,7 +4662,7 @@ void GL_APIENTRY TexCoord3i(GLint s, GLint t, GLint r)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord3i(context, s, t, r));
         if (isCallValid)
         {
@@ -4679,7 +4679,7 @@ void GL_APIENTRY TexCoord3iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord3iv(context, v));
         if (isCallValid)
         {
@@ -4696,7 +4696,7 @@ void GL_APIENTRY TexCoord3s(GLshort s, GLshort t, GLshort r)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord3s(context, s, t, r));
         if (isCallValid)
         {
@@ -4713,7 +4713,7 @@ void GL_APIENTRY TexCoord3sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord3sv(context, v));
         if (isCallValid)
         {
@@ -4730,7 +4730,7 @@ void GL_APIENTRY TexCoord4d(GLdouble s, GLdouble t, GLdouble r, GLdouble q)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord4d(context, s, t, r, q));
         if (isCallValid)
         {
@@ -4747,7 +4747,7 @@ void GL_APIENTRY TexCoord4dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord4dv(context, v));
         if (isCallValid)
         {
@@ -4764,7 +4764,7 @@ void GL_APIENTRY TexCoord4f(GLfloat s, GLfloat t, GLfloat r, GLfloat q)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord4f(context, s, t, r, q));
         if (isCallValid)
         {
@@ -4781,7 +4781,7 @@ void GL_APIENTRY TexCoord4fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord4fv(context, v));
         if (isCallValid)
         {
@@ -4798,7 +4798,7 @@ void GL_APIENTRY TexCoord4i(GLint s, GLint t, GLint r, GLint q)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord4i(context, s, t, r, q));
         if (isCallValid)
         {
@@ -4815,7 +4815,7 @@ void GL_APIENTRY TexCoord4iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord4iv(context, v));
         if (isCallValid)
         {
@@ -4832,7 +4832,7 @@ void GL_APIENTRY TexCoord4s(GLshort s, GLshort t, GLshort r, GLshort q)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord4s(context, s, t, r, q));
         if (isCallValid)
         {
@@ -4849,7 +4849,7 @@ void GL_APIENTRY TexCoord4sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTexCoord4sv(context, v));
         if (isCallValid)
         {
@@ -4868,10 +4868,10 @@ void GL_APIENTRY TexEnvf(GLenum target, GLenum pname, GLfloat param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked                 = FromGL<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked               = FromGL<TextureEnvParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureEnvTarget targetPacked   = FromGL<TextureEnvTarget>(target);
+        TextureEnvParameter pnamePacked = FromGL<TextureEnvParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateTexEnvf(context, targetPacked, pnamePacked, param));
         if (isCallValid)
         {
@@ -4890,10 +4890,10 @@ void GL_APIENTRY TexEnvfv(GLenum target, GLenum pname, const GLfloat *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked                 = FromGL<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked               = FromGL<TextureEnvParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureEnvTarget targetPacked   = FromGL<TextureEnvTarget>(target);
+        TextureEnvParameter pnamePacked = FromGL<TextureEnvParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateTexEnvfv(context, targetPacked, pnamePacked, params));
         if (isCallValid)
         {
@@ -4912,10 +4912,10 @@ void GL_APIENTRY TexEnvi(GLenum target, GLenum pname, GLint param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked                 = FromGL<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked               = FromGL<TextureEnvParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureEnvTarget targetPacked   = FromGL<TextureEnvTarget>(target);
+        TextureEnvParameter pnamePacked = FromGL<TextureEnvParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateTexEnvi(context, targetPacked, pnamePacked, param));
         if (isCallValid)
         {
@@ -4934,10 +4934,10 @@ void GL_APIENTRY TexEnviv(GLenum target, GLenum pname, const GLint *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureEnvTarget targetPacked                 = FromGL<TextureEnvTarget>(target);
-        TextureEnvParameter pnamePacked               = FromGL<TextureEnvParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureEnvTarget targetPacked   = FromGL<TextureEnvTarget>(target);
+        TextureEnvParameter pnamePacked = FromGL<TextureEnvParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateTexEnviv(context, targetPacked, pnamePacked, params));
         if (isCallValid)
         {
@@ -4956,7 +4956,7 @@ void GL_APIENTRY TexGend(GLenum coord, GLenum pname, GLdouble param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateTexGend(context, coord, pname, param));
         if (isCallValid)
@@ -4976,7 +4976,7 @@ void GL_APIENTRY TexGendv(GLenum coord, GLenum pname, const GLdouble *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateTexGendv(context, coord, pname, params));
         if (isCallValid)
@@ -4996,7 +4996,7 @@ void GL_APIENTRY TexGenf(GLenum coord, GLenum pname, GLfloat param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateTexGenf(context, coord, pname, param));
         if (isCallValid)
@@ -5016,7 +5016,7 @@ void GL_APIENTRY TexGenfv(GLenum coord, GLenum pname, const GLfloat *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateTexGenfv(context, coord, pname, params));
         if (isCallValid)
@@ -5036,7 +5036,7 @@ void GL_APIENTRY TexGeni(GLenum coord, GLenum pname, GLint param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateTexGeni(context, coord, pname, param));
         if (isCallValid)
@@ -5056,7 +5056,7 @@ void GL_APIENTRY TexGeniv(GLenum coord, GLenum pname, const GLint *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateTexGeniv(context, coord, pname, params));
         if (isCallValid)
@@ -5087,7 +5087,7 @@ void GL_APIENTRY TexImage1D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateTexImage1D(context, target, level, internalformat,
                                                              width, border, format, type, pixels));
@@ -5121,9 +5121,9 @@ void GL_APIENTRY TexImage2D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked                    = FromGL<TextureTarget>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureTarget targetPacked = FromGL<TextureTarget>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateTexImage2D(context, targetPacked, level, internalformat, width,
                                                height, border, format, type, pixels));
         if (isCallValid)
@@ -5145,9 +5145,9 @@ void GL_APIENTRY TexParameterf(GLenum target, GLenum pname, GLfloat param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureType targetPacked                      = FromGL<TextureType>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureType targetPacked = FromGL<TextureType>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateTexParameterf(context, targetPacked, pname, param));
         if (isCallValid)
         {
@@ -5166,9 +5166,9 @@ void GL_APIENTRY TexParameterfv(GLenum target, GLenum pname, const GLfloat *para
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureType targetPacked                      = FromGL<TextureType>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureType targetPacked = FromGL<TextureType>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateTexParameterfv(context, targetPacked, pname, params));
         if (isCallValid)
         {
@@ -5187,9 +5187,9 @@ void GL_APIENTRY TexParameteri(GLenum target, GLenum pname, GLint param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureType targetPacked                      = FromGL<TextureType>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureType targetPacked = FromGL<TextureType>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateTexParameteri(context, targetPacked, pname, param));
         if (isCallValid)
         {
@@ -5208,9 +5208,9 @@ void GL_APIENTRY TexParameteriv(GLenum target, GLenum pname, const GLint *params
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureType targetPacked                      = FromGL<TextureType>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureType targetPacked = FromGL<TextureType>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateTexParameteriv(context, targetPacked, pname, params));
         if (isCallValid)
         {
@@ -5227,7 +5227,7 @@ void GL_APIENTRY Translated(GLdouble x, GLdouble y, GLdouble z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTranslated(context, x, y, z));
         if (isCallValid)
         {
@@ -5244,7 +5244,7 @@ void GL_APIENTRY Translatef(GLfloat x, GLfloat y, GLfloat z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateTranslatef(context, x, y, z));
         if (isCallValid)
         {
@@ -5261,7 +5261,7 @@ void GL_APIENTRY Vertex2d(GLdouble x, GLdouble y)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex2d(context, x, y));
         if (isCallValid)
         {
@@ -5278,7 +5278,7 @@ void GL_APIENTRY Vertex2dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex2dv(context, v));
         if (isCallValid)
         {
@@ -5295,7 +5295,7 @@ void GL_APIENTRY Vertex2f(GLfloat x, GLfloat y)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex2f(context, x, y));
         if (isCallValid)
         {
@@ -5312,7 +5312,7 @@ void GL_APIENTRY Vertex2fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex2fv(context, v));
         if (isCallValid)
         {
@@ -5329,7 +5329,7 @@ void GL_APIENTRY Vertex2i(GLint x, GLint y)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex2i(context, x, y));
         if (isCallValid)
         {
@@ -5346,7 +5346,7 @@ void GL_APIENTRY Vertex2iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex2iv(context, v));
         if (isCallValid)
         {
@@ -5363,7 +5363,7 @@ void GL_APIENTRY Vertex2s(GLshort x, GLshort y)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex2s(context, x, y));
         if (isCallValid)
         {
@@ -5380,7 +5380,7 @@ void GL_APIENTRY Vertex2sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex2sv(context, v));
         if (isCallValid)
         {
@@ -5397,7 +5397,7 @@ void GL_APIENTRY Vertex3d(GLdouble x, GLdouble y, GLdouble z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex3d(context, x, y, z));
         if (isCallValid)
         {
@@ -5414,7 +5414,7 @@ void GL_APIENTRY Vertex3dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex3dv(context, v));
         if (isCallValid)
         {
@@ -5431,7 +5431,7 @@ void GL_APIENTRY Vertex3f(GLfloat x, GLfloat y, GLfloat z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex3f(context, x, y, z));
         if (isCallValid)
         {
@@ -5448,7 +5448,7 @@ void GL_APIENTRY Vertex3fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex3fv(context, v));
         if (isCallValid)
         {
@@ -5465,7 +5465,7 @@ void GL_APIENTRY Vertex3i(GLint x, GLint y, GLint z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex3i(context, x, y, z));
         if (isCallValid)
         {
@@ -5482,7 +5482,7 @@ void GL_APIENTRY Vertex3iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex3iv(context, v));
         if (isCallValid)
         {
@@ -5499,7 +5499,7 @@ void GL_APIENTRY Vertex3s(GLshort x, GLshort y, GLshort z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex3s(context, x, y, z));
         if (isCallValid)
         {
@@ -5516,7 +5516,7 @@ void GL_APIENTRY Vertex3sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex3sv(context, v));
         if (isCallValid)
         {
@@ -5533,7 +5533,7 @@ void GL_APIENTRY Vertex4d(GLdouble x, GLdouble y, GLdouble z, GLdouble w)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex4d(context, x, y, z, w));
         if (isCallValid)
         {
@@ -5550,7 +5550,7 @@ void GL_APIENTRY Vertex4dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex4dv(context, v));
         if (isCallValid)
         {
@@ -5567,7 +5567,7 @@ void GL_APIENTRY Vertex4f(GLfloat x, GLfloat y, GLfloat z, GLfloat w)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex4f(context, x, y, z, w));
         if (isCallValid)
         {
@@ -5584,7 +5584,7 @@ void GL_APIENTRY Vertex4fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex4fv(context, v));
         if (isCallValid)
         {
@@ -5601,7 +5601,7 @@ void GL_APIENTRY Vertex4i(GLint x, GLint y, GLint z, GLint w)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex4i(context, x, y, z, w));
         if (isCallValid)
         {
@@ -5618,7 +5618,7 @@ void GL_APIENTRY Vertex4iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex4iv(context, v));
         if (isCallValid)
         {
@@ -5635,7 +5635,7 @@ void GL_APIENTRY Vertex4s(GLshort x, GLshort y, GLshort z, GLshort w)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex4s(context, x, y, z, w));
         if (isCallValid)
         {
@@ -5652,7 +5652,7 @@ void GL_APIENTRY Vertex4sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateVertex4sv(context, v));
         if (isCallValid)
         {
@@ -5670,7 +5670,7 @@ void GL_APIENTRY Viewport(GLint x, GLint y, GLsizei width, GLsizei height)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateViewport(context, x, y, width, height));
         if (isCallValid)
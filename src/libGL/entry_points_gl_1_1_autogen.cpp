@@ -36,8 +36,8 @@ GLboolean GL_APIENTRY AreTexturesResident(GLsizei n, const GLuint *textures, GLb
     GLboolean returnValue;
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateAreTexturesResident(context, n, textures, residences));
         if (isCallValid)
         {
@@ -64,7 +64,7 @@ void GL_APIENTRY ArrayElement(GLint i)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateArrayElement(context, i));
         if (isCallValid)
         {
@@ -82,10 +82,10 @@ void GL_APIENTRY BindTexture(GLenum target, GLuint texture)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureType targetPacked                      = FromGL<TextureType>(target);
-        TextureID texturePacked                       = FromGL<TextureID>(texture);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureType targetPacked = FromGL<TextureType>(target);
+        TextureID texturePacked  = FromGL<TextureID>(texture);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateBindTexture(context, targetPacked, texturePacked));
         if (isCallValid)
         {
@@ -105,9 +105,9 @@ void GL_APIENTRY ColorPointer(GLint size, GLenum type, GLsizei stride, const voi
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked                   = FromGL<VertexAttribType>(type);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        VertexAttribType typePacked = FromGL<VertexAttribType>(type);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateColorPointer(context, size, typePacked, stride, pointer));
         if (isCallValid)
         {
@@ -134,7 +134,7 @@ void GL_APIENTRY CopyTexImage1D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateCopyTexImage1D(context, target, level, internalformat, x, y, width, border));
@@ -165,9 +165,9 @@ void GL_APIENTRY CopyTexImage2D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked                    = FromGL<TextureTarget>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureTarget targetPacked = FromGL<TextureTarget>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateCopyTexImage2D(context, targetPacked, level, internalformat, x,
                                                    y, width, height, border));
         if (isCallValid)
@@ -191,7 +191,7 @@ CopyTexSubImage1D(GLenum target, GLint level, GLint xoffset, GLint x, GLint y, G
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateCopyTexSubImage1D(context, target, level, xoffset, x, y, width));
@@ -221,9 +221,9 @@ void GL_APIENTRY CopyTexSubImage2D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked                    = FromGL<TextureTarget>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureTarget targetPacked = FromGL<TextureTarget>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateCopyTexSubImage2D(context, targetPacked, level, xoffset,
                                                       yoffset, x, y, width, height));
         if (isCallValid)
@@ -242,8 +242,8 @@ void GL_APIENTRY DeleteTextures(GLsizei n, const GLuint *textures)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        const TextureID *texturesPacked               = FromGL<const TextureID *>(textures);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        const TextureID *texturesPacked = FromGL<const TextureID *>(textures);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateDeleteTextures(context, n, texturesPacked));
         if (isCallValid)
@@ -261,8 +261,8 @@ void GL_APIENTRY DisableClientState(GLenum array)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        ClientVertexArrayType arrayPacked             = FromGL<ClientVertexArrayType>(array);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        ClientVertexArrayType arrayPacked = FromGL<ClientVertexArrayType>(array);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateDisableClientState(context, arrayPacked));
         if (isCallValid)
@@ -281,8 +281,8 @@ void GL_APIENTRY DrawArrays(GLenum mode, GLint first, GLsizei count)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked                      = FromGL<PrimitiveMode>(mode);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        PrimitiveMode modePacked = FromGL<PrimitiveMode>(mode);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateDrawArrays(context, modePacked, first, count));
         if (isCallValid)
@@ -304,10 +304,10 @@ void GL_APIENTRY DrawElements(GLenum mode, GLsizei count, GLenum type, const voi
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked                      = FromGL<PrimitiveMode>(mode);
-        DrawElementsType typePacked                   = FromGL<DrawElementsType>(type);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        PrimitiveMode modePacked    = FromGL<PrimitiveMode>(mode);
+        DrawElementsType typePacked = FromGL<DrawElementsType>(type);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateDrawElements(context, modePacked, count, typePacked, indices));
         if (isCallValid)
         {
@@ -325,7 +325,7 @@ void GL_APIENTRY EdgeFlagPointer(GLsizei stride, const void *pointer)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateEdgeFlagPointer(context, stride, pointer));
         if (isCallValid)
@@ -343,8 +343,8 @@ void GL_APIENTRY EnableClientState(GLenum array)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        ClientVertexArrayType arrayPacked             = FromGL<ClientVertexArrayType>(array);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        ClientVertexArrayType arrayPacked = FromGL<ClientVertexArrayType>(array);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateEnableClientState(context, arrayPacked));
         if (isCallValid)
@@ -362,8 +362,8 @@ void GL_APIENTRY GenTextures(GLsizei n, GLuint *textures)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureID *texturesPacked                     = FromGL<TextureID *>(textures);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        TextureID *texturesPacked = FromGL<TextureID *>(textures);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGenTextures(context, n, texturesPacked));
         if (isCallValid)
@@ -382,7 +382,7 @@ void GL_APIENTRY GetPointerv(GLenum pname, void **params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateGetPointerv(context, pname, params));
         if (isCallValid)
@@ -401,7 +401,7 @@ void GL_APIENTRY IndexPointer(GLenum type, GLsizei stride, const void *pointer)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateIndexPointer(context, type, stride, pointer));
         if (isCallValid)
@@ -419,7 +419,7 @@ void GL_APIENTRY Indexub(GLubyte c)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIndexub(context, c));
         if (isCallValid)
         {
@@ -436,7 +436,7 @@ void GL_APIENTRY Indexubv(const GLubyte *c)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIndexubv(context, c));
         if (isCallValid)
         {
@@ -454,8 +454,8 @@ void GL_APIENTRY InterleavedArrays(GLenum format, GLsizei stride, const void *po
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateInterleavedArrays(context, format, stride, pointer));
         if (isCallValid)
         {
@@ -473,8 +473,8 @@ GLboolean GL_APIENTRY IsTexture(GLuint texture)
     GLboolean returnValue;
     if (context)
     {
-        TextureID texturePacked                       = FromGL<TextureID>(texture);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        TextureID texturePacked = FromGL<TextureID>(texture);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateIsTexture(context, texturePacked));
         if (isCallValid)
         {
@@ -501,9 +501,9 @@ void GL_APIENTRY NormalPointer(GLenum type, GLsizei stride, const void *pointer)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked                   = FromGL<VertexAttribType>(type);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        VertexAttribType typePacked = FromGL<VertexAttribType>(type);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateNormalPointer(context, typePacked, stride, pointer));
         if (isCallValid)
         {
@@ -520,7 +520,7 @@ void GL_APIENTRY PolygonOffset(GLfloat factor, GLfloat units)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePolygonOffset(context, factor, units));
         if (isCallValid)
@@ -538,7 +538,7 @@ void GL_APIENTRY PopClientAttrib()
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidatePopClientAttrib(context));
         if (isCallValid)
         {
@@ -557,8 +557,8 @@ void GL_APIENTRY PrioritizeTextures(GLsizei n, const GLuint *textures, const GLf
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidatePrioritizeTextures(context, n, textures, priorities));
         if (isCallValid)
         {
@@ -576,7 +576,7 @@ void GL_APIENTRY PushClientAttrib(GLbitfield mask)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidatePushClientAttrib(context, mask));
         if (isCallValid)
         {
@@ -596,9 +596,9 @@ void GL_APIENTRY TexCoordPointer(GLint size, GLenum type, GLsizei stride, const
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked                   = FromGL<VertexAttribType>(type);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        VertexAttribType typePacked = FromGL<VertexAttribType>(type);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateTexCoordPointer(context, size, typePacked, stride, pointer));
         if (isCallValid)
         {
@@ -626,7 +626,7 @@ void GL_APIENTRY TexSubImage1D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateTexSubImage1D(context, target, level, xoffset, width, format, type, pixels));
@@ -660,9 +660,9 @@ void GL_APIENTRY TexSubImage2D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked                    = FromGL<TextureTarget>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureTarget targetPacked = FromGL<TextureTarget>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateTexSubImage2D(context, targetPacked, level, xoffset, yoffset,
                                                   width, height, format, type, pixels));
         if (isCallValid)
@@ -685,9 +685,9 @@ void GL_APIENTRY VertexPointer(GLint size, GLenum type, GLsizei stride, const vo
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        VertexAttribType typePacked                   = FromGL<VertexAttribType>(type);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        VertexAttribType typePacked = FromGL<VertexAttribType>(type);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateVertexPointer(context, size, typePacked, stride, pointer));
         if (isCallValid)
         {
@@ -33,7 +33,7 @@ void GL_APIENTRY ActiveTexture(GLenum texture)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateActiveTexture(context, texture));
         if (isCallValid)
         {
@@ -50,7 +50,7 @@ void GL_APIENTRY ClientActiveTexture(GLenum texture)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateClientActiveTexture(context, texture));
         if (isCallValid)
@@ -79,8 +79,8 @@ void GL_APIENTRY CompressedTexImage1D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateCompressedTexImage1D(context, target, level, internalformat,
                                                          width, border, imageSize, data));
         if (isCallValid)
@@ -113,8 +113,8 @@ void GL_APIENTRY CompressedTexImage2D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked                    = FromGL<TextureTarget>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        TextureTarget targetPacked = FromGL<TextureTarget>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateCompressedTexImage2D(context, targetPacked, level, internalformat, width,
@@ -150,8 +150,8 @@ void GL_APIENTRY CompressedTexImage3D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked                    = FromGL<TextureTarget>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        TextureTarget targetPacked = FromGL<TextureTarget>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateCompressedTexImage3D(context, targetPacked, level, internalformat, width,
@@ -183,8 +183,8 @@ void GL_APIENTRY CompressedTexSubImage1D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateCompressedTexSubImage1D(context, target, level, xoffset, width,
                                                             format, imageSize, data));
         if (isCallValid)
@@ -217,8 +217,8 @@ void GL_APIENTRY CompressedTexSubImage2D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked                    = FromGL<TextureTarget>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        TextureTarget targetPacked = FromGL<TextureTarget>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateCompressedTexSubImage2D(context, targetPacked, level, xoffset, yoffset, width,
@@ -256,9 +256,9 @@ void GL_APIENTRY CompressedTexSubImage3D(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureTarget targetPacked                    = FromGL<TextureTarget>(target);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        TextureTarget targetPacked = FromGL<TextureTarget>(target);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateCompressedTexSubImage3D(context, targetPacked, level, xoffset,
                                                             yoffset, zoffset, width, height, depth,
                                                             format, imageSize, data));
@@ -280,8 +280,8 @@ void GL_APIENTRY GetCompressedTexImage(GLenum target, GLint level, void *img)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateGetCompressedTexImage(context, target, level, img));
         if (isCallValid)
         {
@@ -298,7 +298,7 @@ void GL_APIENTRY LoadTransposeMatrixd(const GLdouble *m)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateLoadTransposeMatrixd(context, m));
         if (isCallValid)
         {
@@ -315,7 +315,7 @@ void GL_APIENTRY LoadTransposeMatrixf(const GLfloat *m)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateLoadTransposeMatrixf(context, m));
         if (isCallValid)
         {
@@ -332,7 +332,7 @@ void GL_APIENTRY MultTransposeMatrixd(const GLdouble *m)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateMultTransposeMatrixd(context, m));
         if (isCallValid)
         {
@@ -349,7 +349,7 @@ void GL_APIENTRY MultTransposeMatrixf(const GLfloat *m)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateMultTransposeMatrixf(context, m));
         if (isCallValid)
         {
@@ -367,7 +367,7 @@ void GL_APIENTRY MultiTexCoord1d(GLenum target, GLdouble s)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord1d(context, target, s));
         if (isCallValid)
@@ -386,7 +386,7 @@ void GL_APIENTRY MultiTexCoord1dv(GLenum target, const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord1dv(context, target, v));
         if (isCallValid)
@@ -405,7 +405,7 @@ void GL_APIENTRY MultiTexCoord1f(GLenum target, GLfloat s)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord1f(context, target, s));
         if (isCallValid)
@@ -424,7 +424,7 @@ void GL_APIENTRY MultiTexCoord1fv(GLenum target, const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord1fv(context, target, v));
         if (isCallValid)
@@ -443,7 +443,7 @@ void GL_APIENTRY MultiTexCoord1i(GLenum target, GLint s)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord1i(context, target, s));
         if (isCallValid)
@@ -462,7 +462,7 @@ void GL_APIENTRY MultiTexCoord1iv(GLenum target, const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord1iv(context, target, v));
         if (isCallValid)
@@ -481,7 +481,7 @@ void GL_APIENTRY MultiTexCoord1s(GLenum target, GLshort s)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord1s(context, target, s));
         if (isCallValid)
@@ -500,7 +500,7 @@ void GL_APIENTRY MultiTexCoord1sv(GLenum target, const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord1sv(context, target, v));
         if (isCallValid)
@@ -519,7 +519,7 @@ void GL_APIENTRY MultiTexCoord2d(GLenum target, GLdouble s, GLdouble t)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord2d(context, target, s, t));
         if (isCallValid)
@@ -538,7 +538,7 @@ void GL_APIENTRY MultiTexCoord2dv(GLenum target, const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord2dv(context, target, v));
         if (isCallValid)
@@ -557,7 +557,7 @@ void GL_APIENTRY MultiTexCoord2f(GLenum target, GLfloat s, GLfloat t)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord2f(context, target, s, t));
         if (isCallValid)
@@ -576,7 +576,7 @@ void GL_APIENTRY MultiTexCoord2fv(GLenum target, const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord2fv(context, target, v));
         if (isCallValid)
@@ -595,7 +595,7 @@ void GL_APIENTRY MultiTexCoord2i(GLenum target, GLint s, GLint t)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord2i(context, target, s, t));
         if (isCallValid)
@@ -614,7 +614,7 @@ void GL_APIENTRY MultiTexCoord2iv(GLenum target, const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord2iv(context, target, v));
         if (isCallValid)
@@ -633,7 +633,7 @@ void GL_APIENTRY MultiTexCoord2s(GLenum target, GLshort s, GLshort t)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord2s(context, target, s, t));
         if (isCallValid)
@@ -652,7 +652,7 @@ void GL_APIENTRY MultiTexCoord2sv(GLenum target, const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord2sv(context, target, v));
         if (isCallValid)
@@ -671,7 +671,7 @@ void GL_APIENTRY MultiTexCoord3d(GLenum target, GLdouble s, GLdouble t, GLdouble
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord3d(context, target, s, t, r));
         if (isCallValid)
@@ -690,7 +690,7 @@ void GL_APIENTRY MultiTexCoord3dv(GLenum target, const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord3dv(context, target, v));
         if (isCallValid)
@@ -709,7 +709,7 @@ void GL_APIENTRY MultiTexCoord3f(GLenum target, GLfloat s, GLfloat t, GLfloat r)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord3f(context, target, s, t, r));
         if (isCallValid)
@@ -728,7 +728,7 @@ void GL_APIENTRY MultiTexCoord3fv(GLenum target, const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord3fv(context, target, v));
         if (isCallValid)
@@ -747,7 +747,7 @@ void GL_APIENTRY MultiTexCoord3i(GLenum target, GLint s, GLint t, GLint r)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord3i(context, target, s, t, r));
         if (isCallValid)
@@ -766,7 +766,7 @@ void GL_APIENTRY MultiTexCoord3iv(GLenum target, const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord3iv(context, target, v));
         if (isCallValid)
@@ -785,7 +785,7 @@ void GL_APIENTRY MultiTexCoord3s(GLenum target, GLshort s, GLshort t, GLshort r)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord3s(context, target, s, t, r));
         if (isCallValid)
@@ -804,7 +804,7 @@ void GL_APIENTRY MultiTexCoord3sv(GLenum target, const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord3sv(context, target, v));
         if (isCallValid)
@@ -824,7 +824,7 @@ void GL_APIENTRY MultiTexCoord4d(GLenum target, GLdouble s, GLdouble t, GLdouble
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord4d(context, target, s, t, r, q));
         if (isCallValid)
@@ -843,7 +843,7 @@ void GL_APIENTRY MultiTexCoord4dv(GLenum target, const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord4dv(context, target, v));
         if (isCallValid)
@@ -862,7 +862,7 @@ void GL_APIENTRY MultiTexCoord4f(GLenum target, GLfloat s, GLfloat t, GLfloat r,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord4f(context, target, s, t, r, q));
         if (isCallValid)
@@ -881,7 +881,7 @@ void GL_APIENTRY MultiTexCoord4fv(GLenum target, const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord4fv(context, target, v));
         if (isCallValid)
@@ -900,7 +900,7 @@ void GL_APIENTRY MultiTexCoord4i(GLenum target, GLint s, GLint t, GLint r, GLint
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord4i(context, target, s, t, r, q));
         if (isCallValid)
@@ -919,7 +919,7 @@ void GL_APIENTRY MultiTexCoord4iv(GLenum target, const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord4iv(context, target, v));
         if (isCallValid)
@@ -938,7 +938,7 @@ void GL_APIENTRY MultiTexCoord4s(GLenum target, GLshort s, GLshort t, GLshort r,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord4s(context, target, s, t, r, q));
         if (isCallValid)
@@ -957,7 +957,7 @@ void GL_APIENTRY MultiTexCoord4sv(GLenum target, const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateMultiTexCoord4sv(context, target, v));
         if (isCallValid)
@@ -975,7 +975,7 @@ void GL_APIENTRY SampleCoverage(GLfloat value, GLboolean invert)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateSampleCoverage(context, value, invert));
         if (isCallValid)
@@ -34,7 +34,7 @@ void GL_APIENTRY BlendColor(GLfloat red, GLfloat green, GLfloat blue, GLfloat al
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateBlendColor(context, red, green, blue, alpha));
         if (isCallValid)
@@ -52,7 +52,7 @@ void GL_APIENTRY BlendEquation(GLenum mode)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateBlendEquation(context, mode));
         if (isCallValid)
         {
@@ -78,7 +78,7 @@ void GL_APIENTRY BlendFuncSeparate(GLenum sfactorRGB,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateBlendFuncSeparate(context, sfactorRGB, dfactorRGB,
                                                                     sfactorAlpha, dfactorAlpha));
@@ -99,7 +99,7 @@ void GL_APIENTRY FogCoordPointer(GLenum type, GLsizei stride, const void *pointe
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateFogCoordPointer(context, type, stride, pointer));
         if (isCallValid)
@@ -117,7 +117,7 @@ void GL_APIENTRY FogCoordd(GLdouble coord)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateFogCoordd(context, coord));
         if (isCallValid)
         {
@@ -134,7 +134,7 @@ void GL_APIENTRY FogCoorddv(const GLdouble *coord)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateFogCoorddv(context, coord));
         if (isCallValid)
         {
@@ -151,7 +151,7 @@ void GL_APIENTRY FogCoordf(GLfloat coord)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateFogCoordf(context, coord));
         if (isCallValid)
         {
@@ -168,7 +168,7 @@ void GL_APIENTRY FogCoordfv(const GLfloat *coord)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateFogCoordfv(context, coord));
         if (isCallValid)
         {
@@ -191,9 +191,9 @@ void GL_APIENTRY MultiDrawArrays(GLenum mode,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked                      = FromGL<PrimitiveMode>(mode);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        PrimitiveMode modePacked = FromGL<PrimitiveMode>(mode);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateMultiDrawArrays(context, modePacked, first, count, drawcount));
         if (isCallValid)
         {
@@ -218,9 +218,9 @@ void GL_APIENTRY MultiDrawElements(GLenum mode,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        PrimitiveMode modePacked                      = FromGL<PrimitiveMode>(mode);
-        DrawElementsType typePacked                   = FromGL<DrawElementsType>(type);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        PrimitiveMode modePacked    = FromGL<PrimitiveMode>(mode);
+        DrawElementsType typePacked = FromGL<DrawElementsType>(type);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateMultiDrawElements(context, modePacked, count, typePacked, indices, drawcount));
@@ -241,8 +241,8 @@ void GL_APIENTRY PointParameterf(GLenum pname, GLfloat param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        PointParameter pnamePacked                    = FromGL<PointParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        PointParameter pnamePacked = FromGL<PointParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePointParameterf(context, pnamePacked, param));
         if (isCallValid)
@@ -261,8 +261,8 @@ void GL_APIENTRY PointParameterfv(GLenum pname, const GLfloat *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        PointParameter pnamePacked                    = FromGL<PointParameter>(pname);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        PointParameter pnamePacked = FromGL<PointParameter>(pname);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePointParameterfv(context, pnamePacked, params));
         if (isCallValid)
@@ -281,7 +281,7 @@ void GL_APIENTRY PointParameteri(GLenum pname, GLint param)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePointParameteri(context, pname, param));
         if (isCallValid)
@@ -300,7 +300,7 @@ void GL_APIENTRY PointParameteriv(GLenum pname, const GLint *params)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidatePointParameteriv(context, pname, params));
         if (isCallValid)
@@ -318,7 +318,7 @@ void GL_APIENTRY SecondaryColor3b(GLbyte red, GLbyte green, GLbyte blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateSecondaryColor3b(context, red, green, blue));
         if (isCallValid)
@@ -336,7 +336,7 @@ void GL_APIENTRY SecondaryColor3bv(const GLbyte *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateSecondaryColor3bv(context, v));
         if (isCallValid)
         {
@@ -353,7 +353,7 @@ void GL_APIENTRY SecondaryColor3d(GLdouble red, GLdouble green, GLdouble blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateSecondaryColor3d(context, red, green, blue));
         if (isCallValid)
@@ -371,7 +371,7 @@ void GL_APIENTRY SecondaryColor3dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateSecondaryColor3dv(context, v));
         if (isCallValid)
         {
@@ -388,7 +388,7 @@ void GL_APIENTRY SecondaryColor3f(GLfloat red, GLfloat green, GLfloat blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateSecondaryColor3f(context, red, green, blue));
         if (isCallValid)
@@ -406,7 +406,7 @@ void GL_APIENTRY SecondaryColor3fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateSecondaryColor3fv(context, v));
         if (isCallValid)
         {
@@ -423,7 +423,7 @@ void GL_APIENTRY SecondaryColor3i(GLint red, GLint green, GLint blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateSecondaryColor3i(context, red, green, blue));
         if (isCallValid)
@@ -441,7 +441,7 @@ void GL_APIENTRY SecondaryColor3iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateSecondaryColor3iv(context, v));
         if (isCallValid)
         {
@@ -458,7 +458,7 @@ void GL_APIENTRY SecondaryColor3s(GLshort red, GLshort green, GLshort blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateSecondaryColor3s(context, red, green, blue));
         if (isCallValid)
@@ -476,7 +476,7 @@ void GL_APIENTRY SecondaryColor3sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateSecondaryColor3sv(context, v));
         if (isCallValid)
         {
@@ -493,7 +493,7 @@ void GL_APIENTRY SecondaryColor3ub(GLubyte red, GLubyte green, GLubyte blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateSecondaryColor3ub(context, red, green, blue));
         if (isCallValid)
@@ -511,7 +511,7 @@ void GL_APIENTRY SecondaryColor3ubv(const GLubyte *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateSecondaryColor3ubv(context, v));
         if (isCallValid)
         {
@@ -528,7 +528,7 @@ void GL_APIENTRY SecondaryColor3ui(GLuint red, GLuint green, GLuint blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateSecondaryColor3ui(context, red, green, blue));
         if (isCallValid)
@@ -546,7 +546,7 @@ void GL_APIENTRY SecondaryColor3uiv(const GLuint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateSecondaryColor3uiv(context, v));
         if (isCallValid)
         {
@@ -563,7 +563,7 @@ void GL_APIENTRY SecondaryColor3us(GLushort red, GLushort green, GLushort blue)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateSecondaryColor3us(context, red, green, blue));
         if (isCallValid)
@@ -581,7 +581,7 @@ void GL_APIENTRY SecondaryColor3usv(const GLushort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateSecondaryColor3usv(context, v));
         if (isCallValid)
         {
@@ -601,8 +601,8 @@ void GL_APIENTRY SecondaryColorPointer(GLint size, GLenum type, GLsizei stride,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateSecondaryColorPointer(context, size, type, stride, pointer));
         if (isCallValid)
         {
@@ -619,7 +619,7 @@ void GL_APIENTRY WindowPos2d(GLdouble x, GLdouble y)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos2d(context, x, y));
         if (isCallValid)
         {
@@ -636,7 +636,7 @@ void GL_APIENTRY WindowPos2dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos2dv(context, v));
         if (isCallValid)
         {
@@ -653,7 +653,7 @@ void GL_APIENTRY WindowPos2f(GLfloat x, GLfloat y)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos2f(context, x, y));
         if (isCallValid)
         {
@@ -670,7 +670,7 @@ void GL_APIENTRY WindowPos2fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos2fv(context, v));
         if (isCallValid)
         {
@@ -687,7 +687,7 @@ void GL_APIENTRY WindowPos2i(GLint x, GLint y)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos2i(context, x, y));
         if (isCallValid)
         {
@@ -704,7 +704,7 @@ void GL_APIENTRY WindowPos2iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos2iv(context, v));
         if (isCallValid)
         {
@@ -721,7 +721,7 @@ void GL_APIENTRY WindowPos2s(GLshort x, GLshort y)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos2s(context, x, y));
         if (isCallValid)
         {
@@ -738,7 +738,7 @@ void GL_APIENTRY WindowPos2sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos2sv(context, v));
         if (isCallValid)
         {
@@ -755,7 +755,7 @@ void GL_APIENTRY WindowPos3d(GLdouble x, GLdouble y, GLdouble z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos3d(context, x, y, z));
         if (isCallValid)
         {
@@ -772,7 +772,7 @@ void GL_APIENTRY WindowPos3dv(const GLdouble *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos3dv(context, v));
         if (isCallValid)
         {
@@ -789,7 +789,7 @@ void GL_APIENTRY WindowPos3f(GLfloat x, GLfloat y, GLfloat z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos3f(context, x, y, z));
         if (isCallValid)
         {
@@ -806,7 +806,7 @@ void GL_APIENTRY WindowPos3fv(const GLfloat *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos3fv(context, v));
         if (isCallValid)
         {
@@ -823,7 +823,7 @@ void GL_APIENTRY WindowPos3i(GLint x, GLint y, GLint z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos3i(context, x, y, z));
         if (isCallValid)
         {
@@ -840,7 +840,7 @@ void GL_APIENTRY WindowPos3iv(const GLint *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos3iv(context, v));
         if (isCallValid)
         {
@@ -857,7 +857,7 @@ void GL_APIENTRY WindowPos3s(GLshort x, GLshort y, GLshort z)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos3s(context, x, y, z));
         if (isCallValid)
         {
@@ -874,7 +874,7 @@ void GL_APIENTRY WindowPos3sv(const GLshort *v)
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid = (context->skipValidation() || ValidateWindowPos3sv(context, v));
         if (isCallValid)
         {
@@ -36,9 +36,9 @@ void GL_APIENTRY BindBuffersBase(GLenum target, GLuint first, GLsizei count, con
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        const BufferID *buffersPacked                 = FromGL<const BufferID *>(buffers);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        const BufferID *buffersPacked = FromGL<const BufferID *>(buffers);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateBindBuffersBase(context, target, first, count, buffersPacked));
         if (isCallValid)
         {
@@ -65,8 +65,8 @@ void GL_APIENTRY BindBuffersRange(GLenum target,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        const BufferID *buffersPacked                 = FromGL<const BufferID *>(buffers);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        const BufferID *buffersPacked = FromGL<const BufferID *>(buffers);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateBindBuffersRange(context, target, first, count,
                                                                    buffersPacked, offsets, sizes));
@@ -87,8 +87,8 @@ void GL_APIENTRY BindImageTextures(GLuint first, GLsizei count, const GLuint *te
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateBindImageTextures(context, first, count, textures));
         if (isCallValid)
         {
@@ -106,7 +106,7 @@ void GL_APIENTRY BindSamplers(GLuint first, GLsizei count, const GLuint *sampler
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateBindSamplers(context, first, count, samplers));
         if (isCallValid)
@@ -125,7 +125,7 @@ void GL_APIENTRY BindTextures(GLuint first, GLsizei count, const GLuint *texture
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() || ValidateBindTextures(context, first, count, textures));
         if (isCallValid)
@@ -150,8 +150,8 @@ void GL_APIENTRY BindVertexBuffers(GLuint first,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        const BufferID *buffersPacked                 = FromGL<const BufferID *>(buffers);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        const BufferID *buffersPacked = FromGL<const BufferID *>(buffers);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateBindVertexBuffers(context, first, count, buffersPacked, offsets, strides));
@@ -175,8 +175,8 @@ void GL_APIENTRY BufferStorage(GLenum target, GLsizeiptr size, const void *data,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateBufferStorage(context, target, size, data, flags));
         if (isCallValid)
         {
@@ -198,8 +198,8 @@ ClearTexImage(GLuint texture, GLint level, GLenum format, GLenum type, const voi
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureID texturePacked                       = FromGL<TextureID>(texture);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        TextureID texturePacked = FromGL<TextureID>(texture);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateClearTexImage(context, texturePacked, level, format, type, data));
@@ -235,8 +235,8 @@ void GL_APIENTRY ClearTexSubImage(GLuint texture,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        TextureID texturePacked                       = FromGL<TextureID>(texture);
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        TextureID texturePacked = FromGL<TextureID>(texture);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateClearTexSubImage(context, texturePacked, level, xoffset, yoffset, zoffset,
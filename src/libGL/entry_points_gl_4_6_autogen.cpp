@@ -40,8 +40,8 @@ void GL_APIENTRY MultiDrawArraysIndirectCount(GLenum mode,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateMultiDrawArraysIndirectCount(context, mode, indirect, drawcount,
                                                                  maxdrawcount, stride));
         if (isCallValid)
@@ -69,8 +69,8 @@ void GL_APIENTRY MultiDrawElementsIndirectCount(GLenum mode,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidateMultiDrawElementsIndirectCount(
                                 context, mode, type, indirect, drawcount, maxdrawcount, stride));
         if (isCallValid)
@@ -90,8 +90,8 @@ void GL_APIENTRY PolygonOffsetClamp(GLfloat factor, GLfloat units, GLfloat clamp
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
-        bool isCallValid                              = (context->skipValidation() ||
+        SCOPED_SHARE_CONTEXT_LOCK(context);
+        bool isCallValid = (context->skipValidation() ||
                             ValidatePolygonOffsetClamp(context, factor, units, clamp));
         if (isCallValid)
         {
@@ -116,7 +116,7 @@ void GL_APIENTRY SpecializeShader(GLuint shader,
     Context *context = GetValidGlobalContext();
     if (context)
     {
-        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context);
+        SCOPED_SHARE_CONTEXT_LOCK(context);
         bool isCallValid =
             (context->skipValidation() ||
              ValidateSpecializeShader(context, shader, pEntryPoint, numSpecializationConstants,
@@ -28,11 +28,6 @@ using namespace egl;
 namespace
 {
 
-bool CompareProc(const ProcEntry &a, const char *b)
-{
-    return strcmp(a.first, b) < 0;
-}
-
 void ClipConfigs(const std::vector<const Config *> &filteredConfigs,
                  EGLConfig *output_configs,
                  EGLint config_size,
@@ -224,12 +219,11 @@ PROC GL_APIENTRY wglGetProcAddress(LPCSTR lpszProc)
     EVENT("(const char *procname = \"%s\")", lpszProc);
     egl::Thread *thread = egl::GetCurrentThread();
 
-    ProcEntry *entry =
-        std::lower_bound(&g_procTable[0], &g_procTable[g_numProcs], lpszProc, CompareProc);
+    const ProcEntry *entry = FindProcEntry(lpszProc);
 
     thread->setSuccess();
 
-    if (entry == &g_procTable[g_numProcs] || strcmp(entry->first, lpszProc) != 0)
+    if (entry == nullptr)
     {
         return nullptr;
     }
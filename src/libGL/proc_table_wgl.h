@@ -32,6 +32,9 @@ using ProcEntry = std::pair<const char *, PROC>;
 
 extern wgl::ProcEntry g_procTable[];
 extern size_t g_numProcs;
+
+// Returns the entry for |name|, or nullptr if it isn't an entry point.
+const ProcEntry *FindProcEntry(const char *name);
 }  // namespace wgl
 
 #endif  // LIBGL_PROC_TABLE_H_
@@ -6,11 +6,14 @@
 // found in the LICENSE file.
 //
 // getProcAddress loader table:
-//   Mapping from a string entry point name to function address.
+//   Mapping from a string entry point name to function address. The entries are found with a
+//   perfect hash function from gen_proc_table.py.
 //
 
 #include "libGL/proc_table_wgl.h"
 
+#include <cstring>
+
 #include "libGL/entry_points_gl_1_0_autogen.h"
 #include "libGL/entry_points_gl_1_1_autogen.h"
 #include "libGL/entry_points_gl_1_2_autogen.h"
@@ -35,6 +38,174 @@
 
 #define P(FUNC) reinterpret_cast<PROC>(FUNC)
 
+namespace
+{
+// clang-format off
+constexpr int kT1[] = {
+    1090, 1002, 910, 1146, 624, 231, 1944, 1824, 1388, 890, 1797, 939, 1297, 1868, 359, 1545,
+    1636, 1853, 1863, 792, 1439, 40, 1277, 1955, 1149, 599, 44, 855, 602, 622, 1660, 1484,
+    851, 1638, 629, 361, 917, 260, 1903, 1862, 559, 639, 537, 1315, 863,
+};
+constexpr int kT2[] = {
+    1885, 830, 1132, 668, 1879, 677, 491, 791, 195, 321, 195, 1436, 670, 75, 1394, 603,
+    1181, 1881, 1089, 771, 596, 906, 455, 956, 481, 36, 79, 1648, 198, 865, 1548, 523,
+    1622, 882, 1420, 270, 1137, 8, 2009, 1164, 641, 2010, 242, 518, 1424,
+};
+constexpr int kG[] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 1689, 1456, 0, 0, 0, 0, 0,
+    0, 0, 368, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    479, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 546, 0, 0, 0, 1201,
+    0, 0, 964, 578, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1068, 0, 0,
+    0, 0, 0, 1676, 0, 1870, 0, 499, 0, 0, 0, 0, 0, 808, 1888, 0,
+    389, 0, 0, 0, 0, 1528, 0, 0, 10, 0, 0, 0, 1753, 1480, 1281, 0,
+    0, 0, 62, 271, 0, 0, 1704, 667, 174, 0, 0, 1833, 463, 0, 0, 0,
+    1662, 0, 0, 0, 0, 1471, 0, 0, 0, 0, 0, 0, 1087, 0, 0, 0,
+    0, 0, 0, 1063, 0, 0, 0, 0, 0, 0, 1299, 62, 0, 904, 0, 1115,
+    0, 0, 0, 0, 378, 1116, 0, 0, 0, 0, 0, 0, 0, 799, 1030, 0,
+    1332, 0, 1781, 1938, 0, 0, 61, 1591, 0, 1009, 1653, 0, 868, 0, 0, 912,
+    1603, 0, 0, 0, 1813, 0, 0, 0, 0, 0, 669, 0, 0, 389, 0, 490,
+    0, 1645, 0, 0, 622, 625, 218, 586, 1746, 0, 0, 2008, 0, 0, 0, 694,
+    0, 0, 1779, 0, 1720, 0, 0, 0, 1407, 0, 287, 906, 699, 0, 1987, 0,
+    0, 0, 0, 0, 321, 0, 0, 299, 0, 0, 502, 587, 14, 0, 1008, 60,
+    0, 0, 0, 0, 99, 0, 0, 591, 305, 1695, 0, 0, 0, 301, 0, 0,
+    1189, 235, 685, 437, 572, 594, 0, 0, 1060, 0, 0, 878, 0, 0, 215, 407,
+    582, 0, 390, 0, 0, 0, 394, 0, 328, 0, 0, 0, 0, 0, 2003, 0,
+    0, 1636, 0, 1514, 0, 1865, 1958, 0, 0, 0, 0, 0, 0, 0, 490, 0,
+    1775, 0, 612, 359, 0, 0, 0, 0, 1026, 1173, 171, 0, 165, 330, 0, 0,
+    0, 0, 729, 0, 1477, 0, 1084, 1624, 0, 0, 1155, 0, 1527, 0, 0, 161,
+    1841, 0, 1885, 428, 0, 0, 240, 0, 925, 0, 0, 506, 0, 0, 1011, 0,
+    0, 888, 0, 0, 697, 298, 0, 0, 0, 1423, 0, 0, 720, 0, 1514, 0,
+    1324, 0, 494, 0, 2004, 422, 0, 0, 0, 0, 0, 0, 239, 0, 0, 1289,
+    0, 0, 1454, 0, 0, 0, 687, 0, 0, 1768, 298, 0, 0, 493, 633, 381,
+    0, 348, 0, 0, 0, 0, 0, 0, 760, 0, 0, 0, 1904, 0, 0, 0,
+    0, 0, 1743, 253, 548, 0, 0, 992, 0, 341, 0, 0, 1479, 862, 0, 8,
+    276, 0, 0, 0, 496, 0, 1046, 992, 0, 0, 1953, 0, 1448, 0, 0, 0,
+    0, 450, 0, 0, 1699, 1331, 453, 0, 2013, 0, 0, 0, 0, 540, 1029, 0,
+    0, 146, 370, 0, 0, 0, 1409, 0, 629, 0, 55, 0, 0, 0, 13, 1941,
+    0, 73, 1062, 0, 250, 1984, 0, 0, 987, 1886, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 1949, 0, 1465, 229, 1271, 0, 0, 252, 990, 1632, 299, 192, 0,
+    0, 1935, 0, 1827, 1375, 270, 0, 0, 0, 0, 303, 1048, 0, 521, 476, 0,
+    112, 0, 0, 948, 411, 781, 124, 0, 0, 16, 0, 0, 1527, 0, 681, 0,
+    0, 741, 135, 1050, 242, 0, 0, 194, 0, 0, 38, 0, 0, 0, 0, 513,
+    0, 39, 0, 0, 0, 851, 0, 1049, 0, 357, 152, 1262, 0, 0, 0, 0,
+    758, 1613, 0, 1922, 0, 852, 0, 386, 0, 0, 0, 316, 125, 0, 1044, 1225,
+    1285, 0, 58, 1395, 602, 0, 0, 564, 0, 0, 0, 710, 1705, 39, 0, 1444,
+    0, 1854, 1750, 817, 1686, 1862, 96, 1088, 0, 0, 0, 365, 0, 0, 0, 0,
+    0, 0, 0, 0, 255, 737, 0, 0, 0, 1504, 924, 419, 0, 898, 0, 0,
+    0, 0, 1642, 0, 773, 0, 533, 0, 0, 0, 1713, 1939, 0, 153, 0, 792,
+    0, 130, 955, 0, 1671, 0, 0, 0, 0, 64, 587, 1289, 0, 195, 0, 65,
+    951, 139, 0, 0, 1746, 0, 1328, 439, 0, 262, 1772, 1951, 251, 0, 0, 347,
+    0, 1642, 0, 0, 0, 0, 0, 237, 0, 0, 0, 1416, 0, 0, 960, 137,
+    131, 324, 0, 0, 0, 1707, 1547, 1541, 0, 0, 0, 1715, 0, 0, 0, 0,
+    1725, 1717, 0, 1303, 0, 739, 360, 0, 0, 330, 731, 106, 0, 0, 0, 0,
+    0, 1042, 0, 893, 0, 0, 100, 859, 190, 892, 0, 1879, 1481, 612, 0, 434,
+    1180, 1810, 0, 0, 55, 0, 11, 1031, 342, 0, 0, 0, 893, 0, 752, 886,
+    0, 0, 1795, 1846, 570, 0, 1982, 1893, 1520, 622, 1978, 0, 0, 0, 2000, 0,
+    562, 527, 674, 1807, 566, 2009, 1554, 597, 0, 0, 0, 469, 0, 128, 483, 0,
+    579, 0, 0, 753, 641, 0, 0, 926, 519, 608, 1936, 0, 1678, 177, 144, 1396,
+    0, 219, 0, 0, 0, 0, 0, 0, 36, 0, 0, 1447, 0, 0, 534, 776,
+    0, 866, 0, 805, 1210, 273, 0, 0, 0, 623, 841, 0, 0, 0, 0, 147,
+    0, 0, 0, 201, 0, 0, 1914, 0, 0, 0, 1546, 1380, 1769, 148, 0, 1745,
+    692, 1694, 1248, 806, 525, 149, 0, 0, 57, 0, 678, 1830, 0, 0, 1783, 1764,
+    1000, 0, 464, 1508, 610, 0, 0, 0, 0, 545, 339, 159, 1011, 789, 0, 0,
+    1822, 748, 1981, 0, 1051, 0, 0, 1373, 0, 83, 0, 887, 0, 0, 0, 67,
+    523, 0, 0, 0, 1004, 31, 937, 441, 0, 577, 0, 342, 0, 28, 0, 0,
+    1083, 0, 1438, 0, 1692, 0, 487, 0, 375, 1305, 0, 673, 0, 1020, 730, 835,
+    1065, 1065, 0, 871, 0, 1118, 0, 1848, 1397, 1114, 1026, 0, 0, 0, 0, 406,
+    347, 0, 0, 62, 810, 0, 977, 1432, 0, 421, 0, 839, 815, 0, 0, 0,
+    335, 798, 0, 0, 1996, 134, 1876, 9, 0, 1798, 0, 427, 106, 411, 107, 0,
+    173, 1679, 236, 506, 896, 0, 408, 0, 775, 115, 0, 73, 0, 0, 0, 452,
+    840, 921, 518, 455, 1812, 1034, 0, 891, 205, 0, 1409, 0, 163, 0, 820, 1424,
+    0, 0, 1251, 0, 0, 1713, 1137, 856, 949, 0, 1895, 0, 176, 706, 621, 0,
+    1086, 1890, 0, 0, 809, 122, 1237, 0, 872, 669, 77, 1025, 984, 1303, 0, 0,
+    638, 0, 1663, 215, 533, 2017, 1222, 816, 0, 0, 661, 305, 155, 2007, 0, 0,
+    571, 495, 0, 240, 0, 890, 0, 443, 1805, 581, 0, 0, 0, 1644, 189, 307,
+    0, 672, 1278, 1098, 649, 0, 45, 0, 0, 302, 227, 1579, 0, 0, 1236, 0,
+    540, 1035, 0, 0, 0, 884, 48, 0, 253, 914, 0, 561, 691, 1259, 112, 0,
+    456, 0, 1580, 1058, 0, 0, 358, 733, 932, 1051, 143, 274, 1879, 0, 0, 0,
+    0, 0, 433, 0, 1509, 0, 680, 0, 1127, 1532, 0, 0, 645, 0, 579, 0,
+    0, 0, 664, 0, 942, 1714, 85, 26, 0, 676, 427, 0, 980, 1098, 605, 1196,
+    1021, 0, 0, 0, 860, 745, 1596, 571, 210, 505, 500, 0, 1851, 1590, 0, 51,
+    977, 1784, 1418, 0, 0, 0, 636, 543, 91, 0, 0, 0, 1461, 262, 0, 648,
+    1479, 1120, 0, 201, 0, 481, 291, 1130, 0, 0, 0, 944, 1983, 1265, 915, 95,
+    0, 0, 0, 0, 0, 0, 0, 322, 1794, 0, 279, 0, 0, 1368, 1968, 697,
+    912, 0, 505, 207, 755, 607, 0, 37, 0, 140, 144, 190, 491, 0, 689, 2,
+    1928, 0, 0, 1043, 872, 153, 338, 0, 1526, 0, 0, 0, 0, 816, 0, 0,
+    0, 1506, 0, 1598, 1576, 0, 628, 0, 776, 0, 0, 1906, 612, 0, 191, 0,
+    9, 1101, 0, 1243, 0, 0, 1391, 846, 559, 0, 0, 0, 1855, 0, 0, 0,
+    0, 1632, 1562, 0, 223, 979, 1449, 1494, 116, 51, 0, 1625, 0, 926, 0, 140,
+    0, 0, 394, 0, 0, 0, 250, 583, 0, 898, 962, 0, 1387, 1462, 69, 0,
+    0, 0, 0, 0, 0, 1559, 0, 703, 0, 314, 564, 0, 191, 0, 1655, 1742,
+    624, 1613, 0, 292, 0, 24, 0, 143, 1360, 1977, 463, 550, 728, 0, 167, 832,
+    1449, 329, 606, 1690, 993, 1932, 0, 0, 0, 1708, 996, 883, 757, 1620, 0, 324,
+    0, 210, 0, 592, 1295, 220, 1028, 537, 0, 884, 1610, 968, 0, 0, 0, 0,
+    0, 0, 574, 687, 0, 1031, 0, 1634, 1396, 217, 0, 322, 1575, 0, 2018, 1568,
+    0, 1462, 1575, 0, 0, 0, 0, 782, 0, 0, 325, 0, 0, 1589, 0, 1417,
+    828, 1562, 0, 288, 0, 0, 568, 1305, 0, 1298, 1459, 167, 0, 957, 1634, 0,
+    0, 0, 1393, 261, 0, 0, 924, 1720, 675, 594, 0, 0, 0, 256, 1953, 0,
+    370, 265, 663, 186, 797, 0, 0, 1126, 1417, 402, 1275, 0, 0, 693, 337, 0,
+    151, 1456, 1656, 653, 0, 0, 0, 0, 899, 1961, 798, 0, 0, 697, 0, 610,
+    1007, 1744, 0, 64, 0, 1819, 827, 354, 0, 715, 1258, 0, 770, 0, 0, 0,
+    1550, 1984, 0, 0, 1059, 0, 147, 0, 0, 0, 265, 1655, 0, 1016, 653, 1006,
+    523, 0, 224, 986, 0, 0, 30, 512, 0, 0, 240, 0, 569, 13, 727, 325,
+    130, 162, 1853, 213, 0, 617, 964, 185, 876, 0, 941, 655, 1274, 0, 838, 614,
+    0, 1003, 133, 981, 0, 1876, 0, 0, 0, 0, 411, 0, 0, 432, 998, 1691,
+    1748, 0, 72, 721, 0, 0, 0, 1454, 1605, 50, 0, 27, 0, 732, 388, 54,
+    1347, 766, 0, 1616, 1736, 567, 494, 0, 157, 0, 1856, 1573, 140, 1001, 511, 853,
+    0, 1039, 1263, 836, 392, 622, 660, 296, 1608, 215, 148, 0, 0, 1783, 655, 498,
+    858, 677, 1402, 0, 1443, 0, 0, 1198, 702, 0, 956, 0, 48, 0, 864, 479,
+    1935, 0, 1370, 249, 133, 634, 0, 684, 538, 258, 759, 436, 0, 506, 465, 67,
+    0, 0, 0, 1913, 164, 0, 1709, 468, 729, 910, 1718, 336, 0, 0, 1052, 942,
+    1265, 0, 0, 0, 0, 0, 1257, 0, 1823, 888, 1156, 0, 0, 1485, 0, 804,
+    381, 963, 0, 42, 1251, 0, 0, 486, 1268, 0, 596, 0, 665, 0, 815, 0,
+    0, 0, 369, 170, 245, 0, 268, 0, 0, 0, 498, 165, 409, 563, 670, 663,
+    0, 442, 0, 1704, 0, 0, 984, 1430, 143, 1390, 762, 1632, 0, 704, 1016, 857,
+    0, 1457, 36, 1642, 570, 0, 733, 1623, 0, 0, 0, 135, 674, 477, 212, 245,
+    660, 69, 11, 0, 0, 0, 0, 0, 0, 99, 1273, 271, 131, 0, 0, 1037,
+    1108, 1879, 952, 1396, 1065, 0, 0, 295, 1035, 1788, 1710, 666, 1136, 0, 177, 0,
+    556, 270, 1945, 1864, 0, 337, 0, 0, 1231, 1543, 0, 723, 247, 1451, 57, 1532,
+    303, 399, 1719, 404, 581, 0, 758, 1022, 1266, 0, 120, 0, 0, 0, 457, 769,
+    870, 402, 1269, 151, 322, 0, 1506, 0, 682, 798, 999, 25, 492, 881, 196, 1972,
+    489, 0, 1084, 297, 94, 378, 917, 1022, 1304, 0, 0, 0, 0, 0, 662, 0,
+    1413, 0, 0, 1445, 765, 1247, 0, 0, 788, 781, 1145, 0, 663, 876, 0, 1755,
+    371, 1988, 0, 1205, 0, 817, 0, 76, 1233, 1262, 0, 0, 0, 0, 200, 1131,
+    1154, 1292, 0, 787, 0, 0, 459, 535, 407, 0, 0, 1835, 1256, 11, 0, 0,
+    1897, 0, 21, 1638, 0, 0, 332, 811, 1208, 1909, 894, 675, 0, 0, 1792, 0,
+    983, 848, 0, 754, 724, 0, 1722, 0, 823, 0, 183, 113, 677, 259, 1834, 0,
+    0, 0, 447, 700, 0, 810, 0, 1845, 1995, 0, 0, 689, 198, 406, 0, 0,
+    137, 0, 89, 0, 1064, 1157, 155, 985, 9, 0, 184, 0, 0, 814, 0, 300,
+    1890, 1624, 0, 544, 185, 0, 0, 0, 0, 0, 811, 387, 217, 913, 0, 108,
+    0, 131, 493, 1684, 344, 0, 0, 122, 0, 709, 910, 2010, 0, 1008, 0, 1803,
+    1014, 0, 1724, 0, 122, 1429, 642, 1476, 1039, 1217, 0, 0, 886, 982, 559, 1053,
+    844, 0, 1030, 802, 1531, 18, 0, 0, 812, 0, 503, 601, 2018, 284, 580, 697,
+    447, 1650, 1115,
+};
+// clang-format on
+
+int HashG(const char *key, const int *T)
+{
+    int sum = 0;
+
+    for (int i = 0; key[i] != '\0'; i++)
+    {
+        // Names from applications may contain any byte, so it's read unsigned to keep |sum| in
+        // range of kG.
+        sum += T[i] * static_cast<unsigned char>(key[i]);
+        sum %= 2019;
+    }
+    return kG[sum];
+}
+
+// Returns the index of the entry that |key| would be at, if |key| is in the table.
+int PerfectHash(const char *key)
+{
+    if (strlen(key) > 45)
+        return 0;
+
+    return (HashG(key, kT1) + HashG(key, kT2)) % 2019;
+}
+}  // anonymous namespace
+
 namespace wgl
 {
 ProcEntry g_procTable[] = {
@@ -1115,4 +1286,14 @@ ProcEntry g_procTable[] = {
     {"wglUseFontOutlinesW", P(wglUseFontOutlinesW)}};
 
 size_t g_numProcs = 1074;
+
+const ProcEntry *FindProcEntry(const char *name)
+{
+    size_t index = static_cast<size_t>(PerfectHash(name));
+    if (index >= g_numProcs || strcmp(g_procTable[index].first, name) != 0)
+    {
+        return nullptr;
+    }
+    return &g_procTable[index];
+}
 }  // namespace wgl
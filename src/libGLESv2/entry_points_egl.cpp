@@ -27,11 +27,6 @@ using namespace egl;
 namespace
 {
 
-bool CompareProc(const ProcEntry &a, const char *b)
-{
-    return strcmp(a.first, b) < 0;
-}
-
 void ClipConfigs(const std::vector<const Config *> &filteredConfigs,
                  EGLConfig *output_configs,
                  EGLint config_size,
@@ -1081,12 +1076,11 @@ __eglMustCastToProperFunctionPointerType EGLAPIENTRY EGL_GetProcAddress(const ch
     EVENT("(const char *procname = \"%s\")", procname);
     Thread *thread = egl::GetCurrentThread();
 
-    ProcEntry *entry =
-        std::lower_bound(&g_procTable[0], &g_procTable[g_numProcs], procname, CompareProc);
+    const ProcEntry *entry = FindProcEntry(procname);
 
     thread->setSuccess();
 
-    if (entry == &g_procTable[g_numProcs] || strcmp(entry->first, procname) != 0)
+    if (entry == nullptr)
     {
         return nullptr;
     }
@@ -63,4 +63,13 @@ ANGLE_INLINE std::unique_lock<std::mutex> GetShareGroupLock(const Context *conte
 }
 }  // namespace gl
 
+// Locks the share group for the rest of the scope if the context is shared. Builds that only use GL
+// from one thread can define ANGLE_DISABLE_SHARE_CONTEXT_LOCK to skip it entirely.
+#if defined(ANGLE_DISABLE_SHARE_CONTEXT_LOCK)
+#    define SCOPED_SHARE_CONTEXT_LOCK(context)
+#else
+#    define SCOPED_SHARE_CONTEXT_LOCK(context) \
+        std::unique_lock<std::mutex> shareContextLock = GetShareGroupLock(context)
+#endif
+
 #endif  // LIBGLESV2_GLOBALSTATE_H_
@@ -20,6 +20,9 @@ using ProcEntry = std::pair<const char *, __eglMustCastToProperFunctionPointerTy
 
 extern ProcEntry g_procTable[];
 extern size_t g_numProcs;
+
+// Returns the entry for |name|, or nullptr if it isn't an entry point.
+const ProcEntry *FindProcEntry(const char *name);
 }  // namespace egl
 
 #endif  // LIBGLESV2_PROC_TABLE_H_
@@ -7,11 +7,14 @@
 // found in the LICENSE file.
 //
 // getProcAddress loader table:
-//   Mapping from a string entry point name to function address.
+//   Mapping from a string entry point name to function address. The entries are found with a
+//   perfect hash function from gen_proc_table.py.
 //
 
 #include "libGLESv2/proc_table_egl.h"
 
+#include <cstring>
+
 #include "libGLESv2/entry_points_egl.h"
 #include "libGLESv2/entry_points_egl_ext.h"
 #include "libGLESv2/entry_points_gles_1_0_autogen.h"
@@ -23,6 +26,225 @@
 
 #define P(FUNC) reinterpret_cast<__eglMustCastToProperFunctionPointerType>(FUNC)
 
+namespace
+{
+// clang-format off
+constexpr int kT1[] = {
+    1122, 1044, 353, 1438, 1055, 517, 1359, 1083, 696, 1138, 1500, 1338, 492, 2403, 1412, 1872,
+    1218, 1180, 842, 386, 1490, 2775, 85, 2119, 1437, 1642, 1422, 647, 1997, 1301, 1521, 1649,
+    1581, 121, 2161, 1997, 440, 612, 1889, 1196, 2763, 1747, 1626, 1335, 1825, 1373, 253, 69,
+    1617, 2086, 446, 2721, 2041, 1839, 1394, 1895, 1326, 1528, 393, 2779, 1020, 2649, 2206, 2527,
+    2356, 759, 1656,
+};
+constexpr int kT2[] = {
+    101, 1704, 2197, 860, 2643, 681, 887, 1121, 203, 1799, 1942, 2177, 249, 904, 1643, 1484,
+    1816, 1303, 2416, 2566, 2163, 135, 387, 491, 2483, 8, 1101, 2680, 2609, 2277, 1480, 963,
+    2042, 1687, 1919, 1572, 1396, 1059, 2408, 168, 1723, 504, 1185, 924, 2159, 1291, 357, 2175,
+    1153, 410, 2163, 888, 425, 1127, 320, 977, 618, 1038, 288, 1958, 2726, 125, 2508, 2481,
+    2398, 2452, 2021,
+};
+constexpr int kG[] = {
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 211, 0,
+    0, 0, 2314, 0, 0, 0, 0, 0, 2180, 0, 0, 1084, 0, 0, 0, 0,
+    0, 0, 2032, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    2554, 2182, 0, 0, 73, 0, 0, 510, 0, 0, 0, 0, 0, 0, 0, 0,
+    792, 0, 1921, 2255, 0, 0, 1129, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 985, 0, 0, 807, 0, 516,
+    1598, 1885, 1004, 447, 243, 1540, 924, 0, 1916, 1594, 549, 1926, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 1571, 2473, 0, 0, 0, 0, 1564, 0, 0, 0,
+    2491, 0, 0, 0, 0, 0, 0, 1107, 878, 0, 0, 0, 390, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 208, 0, 0,
+    0, 0, 0, 0, 0, 0, 2056, 1519, 745, 0, 0, 0, 0, 2070, 0, 959,
+    0, 0, 0, 0, 0, 0, 0, 0, 2552, 0, 1367, 0, 97, 0, 0, 0,
+    43, 0, 0, 1302, 0, 0, 680, 0, 2632, 1191, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2088, 2451, 0, 0,
+    511, 0, 632, 0, 0, 963, 0, 25, 3, 656, 2014, 0, 0, 0, 1177, 1348,
+    0, 0, 1785, 1704, 184, 1952, 0, 1418, 290, 0, 0, 0, 0, 2367, 0, 0,
+    0, 0, 513, 0, 911, 0, 620, 0, 0, 0, 0, 214, 0, 0, 2026, 1619,
+    0, 0, 0, 928, 1723, 0, 2245, 543, 0, 0, 0, 0, 2454, 1727, 0, 514,
+    0, 0, 2693, 0, 0, 0, 0, 0, 933, 2375, 1289, 0, 0, 0, 0, 106,
+    2215, 1106, 0, 0, 0, 0, 0, 0, 0, 0, 1521, 0, 1158, 0, 0, 1891,
+    0, 1502, 0, 222, 2315, 0, 0, 0, 55, 0, 0, 616, 0, 0, 0, 1229,
+    0, 270, 0, 0, 802, 2036, 0, 0, 1188, 0, 343, 0, 0, 0, 0, 0,
+    0, 2356, 0, 1881, 0, 0, 0, 0, 1195, 1531, 0, 1362, 2519, 646, 336, 0,
+    190, 677, 0, 0, 0, 0, 548, 0, 0, 0, 0, 811, 2620, 0, 683, 856,
+    0, 0, 0, 1112, 0, 0, 0, 0, 0, 249, 0, 145, 0, 0, 1728, 1990,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2024, 0, 1265,
+    0, 0, 0, 2280, 0, 0, 0, 1437, 0, 583, 0, 0, 0, 0, 1271, 0,
+    0, 0, 0, 0, 2127, 0, 0, 2759, 1758, 0, 0, 0, 0, 0, 874, 0,
+    0, 0, 0, 1297, 0, 1414, 0, 0, 920, 0, 0, 1966, 2044, 1228, 0, 1150,
+    256, 310, 1070, 2779, 0, 633, 2399, 0, 31, 1183, 1169, 0, 2152, 0, 2681, 752,
+    0, 0, 0, 0, 0, 319, 0, 0, 779, 1596, 0, 1199, 1950, 0, 2357, 0,
+    0, 219, 0, 1668, 0, 0, 0, 0, 0, 589, 0, 0, 0, 271, 0, 1730,
+    0, 877, 0, 0, 0, 729, 0, 452, 0, 0, 2260, 2332, 0, 0, 1394, 234,
+    0, 164, 0, 2350, 0, 0, 0, 0, 172, 1121, 0, 498, 512, 918, 0, 2196,
+    0, 0, 0, 0, 393, 543, 0, 1041, 0, 0, 0, 0, 2568, 0, 0, 971,
+    0, 1301, 0, 0, 0, 532, 98, 0, 104, 0, 1434, 1054, 249, 1583, 0, 132,
+    2221, 0, 0, 0, 53, 1330, 253, 0, 0, 0, 207, 2380, 2405, 0, 0, 331,
+    0, 0, 0, 0, 0, 111, 175, 9, 0, 1536, 0, 0, 208, 2397, 0, 1444,
+    0, 327, 0, 1266, 306, 0, 513, 0, 2407, 363, 2561, 0, 0, 1003, 0, 0,
+    1671, 148, 0, 919, 0, 250, 709, 519, 276, 545, 0, 945, 329, 0, 0, 1850,
+    448, 0, 160, 1831, 0, 974, 0, 0, 0, 1278, 344, 382, 424, 0, 876, 0,
+    2749, 1088, 0, 0, 1640, 0, 0, 0, 1152, 664, 2084, 0, 0, 0, 2270, 2728,
+    862, 2278, 2757, 2709, 1694, 0, 2700, 445, 0, 1374, 303, 0, 704, 0, 0, 712,
+    0, 1631, 793, 506, 0, 0, 0, 0, 0, 0, 0, 2224, 1210, 891, 1649, 0,
+    0, 0, 0, 272, 0, 0, 1581, 1053, 0, 0, 2203, 0, 0, 0, 0, 0,
+    2334, 0, 1694, 221, 1163, 0, 1574, 854, 1922, 0, 0, 0, 539, 0, 0, 2132,
+    131, 950, 0, 0, 720, 0, 38, 0, 0, 2635, 163, 1767, 0, 903, 0, 219,
+    0, 2675, 2670, 2767, 0, 0, 252, 0, 1283, 775, 390, 0, 1634, 941, 713, 0,
+    1422, 262, 0, 408, 0, 1645, 2588, 273, 1322, 0, 0, 436, 608, 0, 0, 339,
+    1559, 2196, 0, 1387, 0, 0, 0, 990, 0, 0, 0, 0, 1215, 0, 1122, 0,
+    1674, 0, 757, 786, 0, 0, 893, 1134, 327, 918, 585, 907, 0, 0, 1714, 2000,
+    2528, 1173, 0, 359, 0, 0, 1325, 0, 0, 0, 349, 663, 1298, 0, 0, 388,
+    0, 0, 1380, 0, 0, 1245, 86, 260, 0, 328, 0, 0, 0, 0, 1135, 0,
+    795, 2685, 2359, 474, 1610, 1300, 0, 1084, 373, 0, 612, 2351, 1998, 0, 2686, 2519,
+    0, 1068, 1370, 2495, 0, 0, 997, 0, 0, 0, 409, 204, 0, 29, 1593, 371,
+    1044, 74, 0, 2315, 2651, 0, 818, 0, 48, 174, 1457, 0, 502, 0, 0, 0,
+    0, 156, 113, 0, 965, 147, 0, 0, 0, 0, 0, 0, 0, 0, 0, 2606,
+    632, 2311, 0, 0, 0, 2464, 0, 0, 0, 583, 858, 0, 398, 0, 1362, 0,
+    0, 1176, 0, 777, 2198, 1140, 632, 1660, 291, 0, 0, 1040, 0, 0, 0, 0,
+    0, 146, 0, 0, 609, 0, 0, 0, 2442, 2748, 0, 709, 694, 0, 819, 2352,
+    0, 247, 0, 0, 0, 830, 0, 1194, 0, 0, 2726, 0, 2260, 635, 0, 2300,
+    2488, 0, 526, 631, 622, 295, 0, 0, 2284, 0, 0, 0, 0, 2526, 0, 0,
+    478, 190, 0, 0, 687, 0, 0, 928, 2437, 2313, 0, 0, 2626, 402, 123, 1234,
+    526, 0, 0, 0, 2439, 0, 0, 1329, 204, 38, 914, 0, 1299, 228, 0, 0,
+    1878, 0, 0, 0, 2525, 0, 1540, 0, 0, 964, 1197, 0, 0, 2110, 1303, 2343,
+    806, 0, 0, 0, 0, 0, 777, 2053, 358, 0, 2260, 0, 0, 1076, 201, 0,
+    1302, 0, 2548, 0, 0, 301, 0, 2417, 0, 683, 2559, 1062, 8, 789, 2078, 1022,
+    0, 0, 0, 137, 1327, 0, 0, 1912, 2746, 2375, 924, 0, 110, 0, 692, 767,
+    658, 0, 0, 503, 808, 467, 104, 0, 205, 1457, 0, 0, 0, 129, 83, 0,
+    0, 1195, 1379, 1343, 229, 488, 0, 233, 0, 0, 0, 251, 634, 1342, 0, 1455,
+    1203, 589, 0, 1189, 263, 994, 2504, 444, 0, 0, 48, 2468, 857, 0, 1273, 127,
+    0, 1925, 1408, 2034, 0, 0, 933, 2074, 299, 0, 2716, 2178, 0, 915, 0, 0,
+    2480, 0, 22, 2229, 0, 2584, 0, 1806, 427, 734, 0, 2461, 0, 0, 628, 240,
+    0, 0, 14, 0, 0, 0, 0, 1281, 0, 0, 354, 0, 0, 0, 0, 0,
+    0, 0, 0, 1308, 0, 2037, 0, 1308, 0, 0, 970, 2397, 0, 0, 1234, 0,
+    0, 2696, 0, 2381, 0, 1772, 530, 0, 278, 2260, 0, 0, 917, 1466, 0, 2108,
+    114, 811, 1968, 0, 558, 2167, 377, 0, 67, 75, 580, 161, 1851, 0, 0, 0,
+    40, 0, 0, 345, 1629, 773, 908, 0, 1110, 0, 0, 2385, 946, 0, 0, 11,
+    0, 396, 1087, 0, 0, 0, 0, 0, 0, 0, 1296, 2778, 0, 167, 309, 2427,
+    2601, 0, 0, 2007, 0, 123, 1334, 1833, 0, 0, 0, 0, 1019, 0, 2253, 0,
+    571, 296, 0, 2762, 159, 845, 1640, 2180, 0, 867, 0, 0, 0, 0, 1037, 0,
+    0, 2627, 1390, 60, 0, 0, 0, 1729, 0, 837, 422, 0, 0, 0, 0, 318,
+    0, 0, 476, 0, 0, 0, 1253, 407, 0, 1602, 0, 0, 1149, 1489, 0, 0,
+    0, 1968, 2217, 0, 0, 439, 1496, 0, 1417, 0, 0, 2433, 1118, 203, 0, 1374,
+    1118, 0, 1040, 485, 2705, 0, 0, 5, 325, 0, 2579, 0, 523, 208, 0, 2681,
+    0, 0, 0, 0, 0, 0, 1120, 760, 0, 2378, 0, 651, 0, 0, 47, 0,
+    84, 0, 0, 0, 1738, 2546, 665, 0, 1148, 2766, 356, 0, 666, 608, 0, 0,
+    0, 2716, 430, 0, 1233, 0, 895, 1324, 0, 0, 0, 0, 0, 0, 0, 2712,
+    0, 929, 185, 0, 0, 282, 0, 543, 0, 0, 0, 0, 2259, 0, 0, 0,
+    0, 0, 2549, 773, 0, 0, 0, 2388, 2148, 2309, 0, 643, 342, 0, 0, 0,
+    562, 2733, 950, 746, 0, 1346, 572, 1142, 121, 1404, 0, 213, 1051, 500, 0, 1236,
+    0, 787, 728, 309, 0, 0, 0, 0, 0, 640, 1235, 0, 0, 0, 0, 0,
+    0, 774, 1293, 2573, 0, 0, 0, 415, 0, 313, 2764, 0, 0, 0, 0, 2,
+    0, 0, 455, 354, 1602, 431, 0, 788, 1552, 337, 511, 0, 2503, 539, 874, 0,
+    0, 2272, 0, 0, 1909, 0, 1055, 0, 0, 1300, 402, 13, 611, 0, 2639, 0,
+    0, 0, 0, 0, 700, 4, 0, 0, 895, 941, 0, 0, 2579, 0, 0, 225,
+    0, 0, 0, 2459, 669, 0, 1914, 90, 643, 2052, 0, 0, 0, 993, 2748, 242,
+    0, 1234, 0, 0, 945, 0, 2020, 337, 625, 0, 0, 0, 471, 1777, 78, 1384,
+    0, 260, 1367, 0, 7, 2226, 1056, 905, 1143, 2298, 1397, 2772, 2510, 36, 0, 594,
+    570, 0, 354, 1333, 0, 0, 214, 0, 0, 495, 1534, 947, 1446, 0, 0, 235,
+    172, 922, 0, 526, 2769, 2349, 0, 887, 1250, 0, 0, 0, 197, 2563, 0, 940,
+    964, 1164, 1063, 1730, 0, 18, 370, 1944, 2127, 2521, 295, 0, 0, 0, 116, 655,
+    0, 569, 662, 0, 0, 0, 0, 0, 901, 1015, 1978, 2569, 137, 462, 0, 892,
+    953, 0, 0, 0, 1358, 0, 1072, 507, 152, 126, 0, 0, 0, 360, 0, 0,
+    0, 1232, 96, 2642, 0, 903, 347, 1021, 1284, 0, 0, 0, 1606, 0, 0, 177,
+    1258, 0, 1886, 52, 185, 920, 2571, 0, 0, 0, 373, 0, 619, 2224, 0, 248,
+    2230, 0, 1706, 0, 2726, 631, 0, 1001, 975, 235, 0, 0, 726, 0, 2504, 1108,
+    2753, 828, 0, 243, 0, 0, 0, 684, 0, 1018, 0, 0, 0, 214, 542, 0,
+    745, 0, 0, 0, 0, 1980, 383, 0, 0, 1469, 0, 400, 0, 0, 0, 378,
+    0, 0, 1337, 2025, 0, 2465, 1145, 2563, 347, 1515, 0, 42, 0, 0, 602, 220,
+    551, 0, 1660, 26, 764, 2267, 0, 3, 0, 0, 0, 759, 0, 65, 0, 0,
+    0, 0, 0, 1376, 2362, 0, 0, 0, 2045, 0, 539, 69, 0, 0, 1093, 570,
+    350, 1483, 1069, 982, 0, 987, 0, 0, 2418, 0, 1607, 713, 0, 1298, 0, 0,
+    0, 392, 0, 0, 0, 0, 1714, 2534, 0, 0, 1382, 1254, 0, 476, 0, 0,
+    0, 28, 967, 817, 0, 0, 789, 256, 0, 322, 0, 1323, 0, 0, 485, 0,
+    607, 0, 2566, 176, 215, 1179, 0, 0, 338, 0, 0, 0, 0, 54, 274, 0,
+    0, 0, 406, 249, 0, 2669, 1340, 0, 0, 605, 1387, 1661, 606, 0, 1858, 2003,
+    1755, 0, 449, 0, 638, 0, 50, 1006, 875, 1999, 796, 0, 1410, 332, 0, 1039,
+    527, 0, 0, 438, 0, 175, 367, 1397, 1193, 0, 213, 1010, 496, 479, 576, 0,
+    2148, 0, 655, 2157, 1025, 1009, 0, 0, 2053, 624, 284, 825, 0, 1849, 1079, 804,
+    0, 2642, 0, 2209, 421, 0, 0, 1478, 0, 312, 2634, 459, 0, 2243, 957, 0,
+    329, 255, 0, 0, 297, 0, 0, 2542, 960, 0, 786, 0, 0, 1253, 325, 0,
+    1691, 0, 0, 0, 904, 2228, 2378, 1514, 2254, 0, 0, 2188, 0, 0, 1583, 183,
+    1260, 0, 2637, 0, 2335, 1094, 2280, 0, 1893, 0, 0, 563, 415, 0, 0, 0,
+    1095, 0, 0, 1206, 1074, 673, 2021, 0, 116, 0, 0, 922, 2375, 0, 42, 0,
+    0, 0, 1237, 477, 1093, 0, 1925, 1142, 0, 603, 0, 0, 337, 0, 2013, 0,
+    2455, 0, 1387, 2649, 797, 910, 0, 0, 1994, 0, 463, 14, 671, 743, 0, 1339,
+    2223, 0, 549, 1789, 2782, 1004, 0, 330, 0, 0, 816, 1191, 923, 2418, 0, 0,
+    0, 2412, 0, 0, 126, 642, 1777, 0, 0, 1678, 508, 0, 0, 1940, 0, 209,
+    0, 0, 0, 474, 0, 0, 91, 900, 169, 192, 0, 1748, 980, 1207, 0, 30,
+    678, 0, 0, 531, 0, 122, 0, 1045, 403, 2707, 0, 881, 2000, 800, 1011, 2569,
+    51, 2116, 2744, 0, 587, 2689, 2444, 277, 2151, 2306, 1259, 0, 468, 0, 291, 0,
+    293, 1636, 0, 0, 1286, 2506, 2665, 0, 1795, 0, 0, 0, 1398, 1184, 339, 0,
+    309, 0, 0, 533, 0, 63, 0, 0, 0, 958, 972, 100, 1104, 0, 0, 253,
+    0, 0, 836, 0, 0, 1587, 2764, 0, 1311, 1340, 0, 1089, 1376, 0, 2107, 737,
+    0, 2332, 2618, 1061, 194, 523, 0, 0, 0, 0, 421, 770, 1355, 0, 0, 212,
+    0, 513, 2533, 0, 510, 68, 0, 999, 0, 2083, 171, 133, 0, 948, 2249, 1102,
+    0, 2225, 0, 254, 0, 1219, 0, 0, 2131, 2240, 0, 0, 0, 916, 390, 0,
+    491, 700, 0, 2303, 207, 961, 0, 0, 0, 0, 484, 2463, 1618, 0, 963, 0,
+    20, 2037, 790, 971, 1205, 2605, 1190, 527, 0, 1121, 0, 2519, 0, 1222, 0, 1651,
+    559, 1210, 1155, 1128, 2776, 0, 2557, 107, 2382, 1190, 1309, 998, 0, 254, 0, 0,
+    1386, 0, 1138, 964, 0, 0, 699, 1279, 643, 1779, 1276, 686, 2659, 2466, 281, 965,
+    1422, 1083, 0, 0, 484, 2699, 1140, 86, 0, 0, 2140, 206, 472, 307, 0, 1745,
+    0, 971, 0, 0, 2288, 475, 989, 140, 1921, 988, 0, 59, 0, 0, 1226, 1320,
+    0, 1163, 2640, 0, 17, 0, 2655, 0, 939, 2778, 0, 465, 0, 1515, 0, 0,
+    2769, 2227, 10, 487, 1487, 2209, 112, 379, 1359, 1406, 0, 0, 0, 160, 0, 728,
+    2393, 0, 0, 0, 164, 0, 0, 0, 0, 0, 2575, 1712, 0, 504, 0, 0,
+    0, 0, 0, 1177, 1220, 0, 105, 0, 1382, 0, 724, 824, 0, 587, 0, 0,
+    0, 310, 217, 0, 0, 0, 171, 0, 0, 1373, 0, 0, 1044, 93, 155, 0,
+    2403, 0, 21, 1188, 466, 1845, 0, 2282, 0, 0, 0, 1898, 133, 230, 2313, 0,
+    248, 0, 2439, 762, 1298, 0, 0, 0, 2731, 0, 0, 0, 1127, 0, 0, 0,
+    345, 1168, 202, 1282, 0, 779, 196, 0, 0, 0, 531, 0, 130, 1085, 0, 0,
+    2090, 0, 1253, 482, 561, 2033, 0, 764, 0, 1192, 0, 0, 0, 2011, 0, 0,
+    2744, 1045, 0, 0, 1399, 1152, 1027, 2602, 392, 2098, 0, 372, 1613, 0, 514, 615,
+    0, 1539, 599, 1313, 0, 0, 668, 349, 0, 2347, 0, 0, 0, 0, 1424, 0,
+    0, 0, 454, 2471, 2111, 2430, 15, 0, 2742, 182, 1262, 0, 590, 292, 822, 1013,
+    2074, 850, 0, 0, 0, 668, 2758, 0, 1663, 1197, 1012, 2746, 2548, 162, 428, 676,
+    1035, 2297, 0, 0, 2452, 762, 2283, 0, 457, 1276, 2748, 0, 1359, 1346, 935, 2329,
+    1255, 0, 0, 0, 0, 951, 0, 0, 2449, 820, 0, 513, 0, 2279, 0, 2462,
+    28, 0, 108, 1135, 0, 0, 1058, 0, 0, 0, 0, 1104, 532, 216, 0, 0,
+    0, 2733, 0, 0, 0, 540, 0, 0, 144, 144, 2477, 1011, 0, 0, 0, 0,
+    2273, 115, 1218, 2623, 412, 1524, 400, 2200, 1976, 321, 123, 429, 30, 0, 0, 1820,
+    2416, 0, 2777, 0, 0, 1258, 226, 1783, 2508, 0, 932, 0, 0, 982, 460, 765,
+    1741, 0, 0, 778, 2067, 1230, 801, 1227, 0, 0, 311, 1330, 163, 1061, 0, 0,
+    0, 0, 2590, 1389, 660, 788, 0, 646, 0, 0, 92, 407, 851, 0, 0, 657,
+    0, 352, 192, 1653, 357, 0, 432, 353, 0, 1666, 0, 2537, 0, 0, 111, 0,
+    0, 1152, 430, 194, 1067, 243, 0, 1408, 0, 1688, 0, 0, 979, 0, 0, 0,
+    1071, 12, 0, 2625, 285, 740, 2395, 0, 0, 1818, 1185, 0, 1321, 0, 1679, 2665,
+    0, 0, 1065, 366, 805, 145, 405, 0, 955, 2409, 0, 1271, 0, 1938, 1524, 1905,
+    0, 561, 0, 828, 55, 726, 91, 0, 0, 1073, 913, 1086, 1266, 0, 417, 1172,
+    1124, 841, 2692, 712, 2455, 0, 0, 538, 2173, 0, 1109, 150, 41, 0, 751, 0,
+    0, 0, 1280, 298, 2365, 0, 2291, 881, 753, 0, 0, 2265, 0, 0, 1918, 595,
+    669, 257, 865, 0, 0, 0, 0, 2777, 149, 2407, 0, 0, 0, 1383, 2052, 243,
+    1395, 0, 0, 143, 639, 0, 1108, 556, 1295, 0, 0, 0, 0, 0, 0,
+};
+// clang-format on
+
+int HashG(const char *key, const int *T)
+{
+    int sum = 0;
+
+    for (int i = 0; key[i] != '\0'; i++)
+    {
+        // Names from applications may contain any byte, so it's read unsigned to keep |sum| in
+        // range of kG.
+        sum += T[i] * static_cast<unsigned char>(key[i]);
+        sum %= 2783;
+    }
+    return kG[sum];
+}
+
+// Returns the index of the entry that |key| would be at, if |key| is in the table.
+int PerfectHash(const char *key)
+{
+    if (strlen(key) > 67)
+        return 0;
+
+    return (HashG(key, kT1) + HashG(key, kT2)) % 2783;
+}
+}  // anonymous namespace
+
 namespace egl
 {
 ProcEntry g_procTable[] = {
@@ -1507,4 +1729,14 @@ ProcEntry g_procTable[] = {
     {"glWeightPointerOESContextANGLE", P(gl::WeightPointerOESContextANGLE)}};
 
 size_t g_numProcs = 1410;
+
+const ProcEntry *FindProcEntry(const char *name)
+{
+    size_t index = static_cast<size_t>(PerfectHash(name));
+    if (index >= g_numProcs || strcmp(g_procTable[index].first, name) != 0)
+    {
+        return nullptr;
+    }
+    return &g_procTable[index];
+}
 }  // namespace egl
@@ -0,0 +1,55 @@
+//
+// Copyright 2020 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// EGLProcTableTest:
+//   Tests the perfect hash lookup in the eglGetProcAddress table.
+
+#include <gtest/gtest.h>
+
+#include <string>
+
+#include "libGLESv2/proc_table_egl.h"
+
+namespace
+{
+// Every entry point is found at its own index.
+TEST(EGLProcTableTest, FindsEveryEntryPoint)
+{
+    for (size_t index = 0; index < egl::g_numProcs; ++index)
+    {
+        const egl::ProcEntry &entry = egl::g_procTable[index];
+        EXPECT_EQ(&entry, egl::FindProcEntry(entry.first)) << entry.first;
+    }
+}
+
+// Names that aren't entry points aren't found.
+TEST(EGLProcTableTest, UnknownNames)
+{
+    EXPECT_EQ(nullptr, egl::FindProcEntry(""));
+    EXPECT_EQ(nullptr, egl::FindProcEntry("gl"));
+    EXPECT_EQ(nullptr, egl::FindProcEntry("glFoo"));
+    EXPECT_EQ(nullptr, egl::FindProcEntry("glDrawArray"));
+    EXPECT_EQ(nullptr, egl::FindProcEntry("glDrawArraysX"));
+    EXPECT_EQ(nullptr, egl::FindProcEntry("gldrawarrays"));
+    EXPECT_EQ(nullptr, egl::FindProcEntry(std::string(1000, 'a').c_str()));
+}
+
+// Names from applications can contain any byte, which must not be hashed out of range.
+TEST(EGLProcTableTest, NonASCIINames)
+{
+    EXPECT_EQ(nullptr, egl::FindProcEntry("gl\xe9"));
+    EXPECT_EQ(nullptr, egl::FindProcEntry("glDrawArrays\xff"));
+    EXPECT_EQ(nullptr, egl::FindProcEntry("\x80gl"));
+
+    for (int byte = 0x80; byte <= 0xff; ++byte)
+    {
+        for (size_t length : {1, 2, 16, 64})
+        {
+            std::string name(length, static_cast<char>(byte));
+            EXPECT_EQ(nullptr, egl::FindProcEntry(name.c_str()));
+        }
+    }
+}
+}  // anonymous namespace
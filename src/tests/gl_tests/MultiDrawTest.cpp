@@ -307,6 +307,49 @@ void main()
         }
     }
 
+    // Multi-draws |drawcount| draws with the given per-draw arrays, using the instanced entry
+    // point for instanced tests
+    void DoMultiDrawArrays(const GLint *firsts,
+                           const GLsizei *counts,
+                           const GLsizei *instanceCounts,
+                           GLsizei drawcount)
+    {
+        glBindBuffer(GL_ARRAY_BUFFER, mNonIndexedVertexBuffer);
+        glEnableVertexAttribArray(mPositionLoc);
+        glVertexAttribPointer(mPositionLoc, 3, GL_FLOAT, GL_FALSE, 0, 0);
+
+        if (IsInstancedTest())
+        {
+            glMultiDrawArraysInstancedANGLE(GL_TRIANGLES, firsts, counts, instanceCounts,
+                                            drawcount);
+        }
+        else
+        {
+            glMultiDrawArraysANGLE(GL_TRIANGLES, firsts, counts, drawcount);
+        }
+    }
+
+    void DoMultiDrawElements(const GLsizei *counts,
+                             const GLvoid *const *indices,
+                             const GLsizei *instanceCounts,
+                             GLsizei drawcount)
+    {
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, mIndexBuffer);
+        glBindBuffer(GL_ARRAY_BUFFER, mVertexBuffer);
+        glEnableVertexAttribArray(mPositionLoc);
+        glVertexAttribPointer(mPositionLoc, 3, GL_FLOAT, GL_FALSE, 0, 0);
+
+        if (IsInstancedTest())
+        {
+            glMultiDrawElementsInstancedANGLE(GL_TRIANGLES, counts, GL_UNSIGNED_SHORT, indices,
+                                              instanceCounts, drawcount);
+        }
+        else
+        {
+            glMultiDrawElementsANGLE(GL_TRIANGLES, counts, GL_UNSIGNED_SHORT, indices, drawcount);
+        }
+    }
+
     void CheckDrawResult()
     {
         for (uint32_t y = 0; y < kCountY; ++y)
@@ -401,6 +444,21 @@ void main()
         return true;
     }
 
+    bool requestBaseVertexBaseInstanceExtension()
+    {
+        if (IsGLExtensionRequestable("GL_ANGLE_base_vertex_base_instance"))
+        {
+            glRequestExtensionANGLE("GL_ANGLE_base_vertex_base_instance");
+        }
+
+        if (!IsGLExtensionEnabled("GL_ANGLE_base_vertex_base_instance"))
+        {
+            return false;
+        }
+
+        return true;
+    }
+
     bool requestExtensions()
     {
         if (IsInstancedTest() && getClientMajorVersion() <= 2)
@@ -470,6 +528,180 @@ TEST_P(MultiDrawTest, MultiDrawElements)
     CheckDrawResult();
 }
 
+// Check that a multi-draw with both an invalid draw state and a negative first or count reports
+// the state error, which is validated once for all draws before the per-draw parameters
+TEST_P(MultiDrawTest, StateErrorBeforeParameterError)
+{
+    ANGLE_SKIP_TEST_IF(!requestExtensions());
+    SetupBuffers();
+    SetupProgram();
+
+    GLFramebuffer framebuffer;
+    glBindFramebuffer(GL_FRAMEBUFFER, framebuffer);
+    ASSERT_GLENUM_NE(GL_FRAMEBUFFER_COMPLETE, glCheckFramebufferStatus(GL_FRAMEBUFFER));
+
+    std::array<GLint, 2> firsts           = {0, -1};
+    std::array<GLsizei, 2> counts         = {6, 6};
+    std::array<GLsizei, 2> instanceCounts = {1, 1};
+    DoMultiDrawArrays(firsts.data(), counts.data(), instanceCounts.data(), 2);
+    EXPECT_GL_ERROR(GL_INVALID_FRAMEBUFFER_OPERATION);
+
+    firsts = {0, 6};
+    counts = {6, -1};
+    DoMultiDrawArrays(firsts.data(), counts.data(), instanceCounts.data(), 2);
+    EXPECT_GL_ERROR(GL_INVALID_FRAMEBUFFER_OPERATION);
+
+    std::array<const GLvoid *, 2> indices = {nullptr, reinterpret_cast<GLvoid *>(6 * 2)};
+    DoMultiDrawElements(counts.data(), indices.data(), instanceCounts.data(), 2);
+    EXPECT_GL_ERROR(GL_INVALID_FRAMEBUFFER_OPERATION);
+
+    // Single draws still report the parameter error first.
+    glDrawArrays(GL_TRIANGLES, 0, -1);
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+}
+
+// Check that a multi-draw with a drawcount of 0 doesn't generate an error, even if the draw state
+// is invalid
+TEST_P(MultiDrawTest, ZeroDrawCount)
+{
+    ANGLE_SKIP_TEST_IF(!requestExtensions());
+    SetupBuffers();
+    SetupProgram();
+
+    GLFramebuffer framebuffer;
+    glBindFramebuffer(GL_FRAMEBUFFER, framebuffer);
+    ASSERT_GLENUM_NE(GL_FRAMEBUFFER_COMPLETE, glCheckFramebufferStatus(GL_FRAMEBUFFER));
+
+    GLint first           = 0;
+    GLsizei count         = 6;
+    GLsizei instanceCount = 1;
+    const GLvoid *indices = nullptr;
+    DoMultiDrawArrays(&first, &count, &instanceCount, 0);
+    EXPECT_GL_NO_ERROR();
+
+    DoMultiDrawElements(&count, &indices, &instanceCount, 0);
+    EXPECT_GL_NO_ERROR();
+}
+
+// Check that an invalid parameter in a draw after the first one generates an error and that none
+// of the draws are done
+TEST_P(MultiDrawTest, ErrorInLaterDraw)
+{
+    ANGLE_SKIP_TEST_IF(!requestExtensions());
+    SetupBuffers();
+    SetupProgram();
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT);
+
+    std::array<GLint, 2> firsts           = {0, -1};
+    std::array<GLsizei, 2> counts         = {6, 6};
+    std::array<GLsizei, 2> instanceCounts = {1, 1};
+    DoMultiDrawArrays(firsts.data(), counts.data(), instanceCounts.data(), 2);
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+
+    firsts = {0, 6};
+    counts = {6, -1};
+    DoMultiDrawArrays(firsts.data(), counts.data(), instanceCounts.data(), 2);
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+
+    std::array<const GLvoid *, 2> indices = {nullptr, reinterpret_cast<GLvoid *>(6 * 2)};
+    DoMultiDrawElements(counts.data(), indices.data(), instanceCounts.data(), 2);
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+
+    if (IsInstancedTest())
+    {
+        counts         = {6, 6};
+        instanceCounts = {1, -1};
+        DoMultiDrawArrays(firsts.data(), counts.data(), instanceCounts.data(), 2);
+        EXPECT_GL_ERROR(GL_INVALID_VALUE);
+
+        DoMultiDrawElements(counts.data(), indices.data(), instanceCounts.data(), 2);
+        EXPECT_GL_ERROR(GL_INVALID_VALUE);
+    }
+
+    EXPECT_PIXEL_RECT_EQ(0, 0, kWidth, kHeight, GLColor::transparentBlack);
+}
+
+// Check the validation of the GL_ANGLE_base_vertex_base_instance multi-draw entry points: a state
+// error is reported before the per-draw parameter errors, a drawcount of 0 doesn't generate an
+// error, and an invalid parameter in a later draw generates an error
+TEST_P(MultiDrawTest, BaseVertexBaseInstanceValidation)
+{
+    ANGLE_SKIP_TEST_IF(getClientMajorVersion() < 3);
+    ANGLE_SKIP_TEST_IF(!requestExtensions());
+    ANGLE_SKIP_TEST_IF(!requestBaseVertexBaseInstanceExtension());
+    SetupBuffers();
+    SetupProgram();
+    glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT);
+
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, mIndexBuffer);
+    glBindBuffer(GL_ARRAY_BUFFER, mVertexBuffer);
+    glEnableVertexAttribArray(mPositionLoc);
+    glVertexAttribPointer(mPositionLoc, 3, GL_FLOAT, GL_FALSE, 0, 0);
+
+    std::array<GLint, 2> firsts           = {0, 4};
+    std::array<GLsizei, 2> counts         = {4, 4};
+    std::array<GLsizei, 2> elementCounts  = {6, 6};
+    std::array<GLsizei, 2> instanceCounts = {1, 1};
+    std::array<const GLvoid *, 2> indices = {nullptr, reinterpret_cast<GLvoid *>(6 * 2)};
+    std::array<GLint, 2> baseVertices     = {0, 0};
+    std::array<GLuint, 2> baseInstances   = {0, 0};
+
+    {
+        GLFramebuffer framebuffer;
+        glBindFramebuffer(GL_FRAMEBUFFER, framebuffer);
+        ASSERT_GLENUM_NE(GL_FRAMEBUFFER_COMPLETE, glCheckFramebufferStatus(GL_FRAMEBUFFER));
+
+        counts = {4, -1};
+        glMultiDrawArraysInstancedBaseInstanceANGLE(GL_TRIANGLE_FAN, 2, counts.data(),
+                                                    instanceCounts.data(), firsts.data(),
+                                                    baseInstances.data());
+        EXPECT_GL_ERROR(GL_INVALID_FRAMEBUFFER_OPERATION);
+
+        elementCounts = {6, -1};
+        glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE(
+            GL_TRIANGLES, GL_UNSIGNED_SHORT, 2, elementCounts.data(), instanceCounts.data(),
+            indices.data(), baseVertices.data(), baseInstances.data());
+        EXPECT_GL_ERROR(GL_INVALID_FRAMEBUFFER_OPERATION);
+
+        glMultiDrawArraysInstancedBaseInstanceANGLE(GL_TRIANGLE_FAN, 0, counts.data(),
+                                                    instanceCounts.data(), firsts.data(),
+                                                    baseInstances.data());
+        EXPECT_GL_NO_ERROR();
+
+        glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE(
+            GL_TRIANGLES, GL_UNSIGNED_SHORT, 0, elementCounts.data(), instanceCounts.data(),
+            indices.data(), baseVertices.data(), baseInstances.data());
+        EXPECT_GL_NO_ERROR();
+
+        glBindFramebuffer(GL_FRAMEBUFFER, 0);
+    }
+
+    glMultiDrawArraysInstancedBaseInstanceANGLE(GL_TRIANGLE_FAN, 2, counts.data(),
+                                                instanceCounts.data(), firsts.data(),
+                                                baseInstances.data());
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+
+    glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE(
+        GL_TRIANGLES, GL_UNSIGNED_SHORT, 2, elementCounts.data(), instanceCounts.data(),
+        indices.data(), baseVertices.data(), baseInstances.data());
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+
+    counts         = {4, 4};
+    elementCounts  = {6, 6};
+    instanceCounts = {1, -1};
+    glMultiDrawArraysInstancedBaseInstanceANGLE(GL_TRIANGLE_FAN, 2, counts.data(),
+                                                instanceCounts.data(), firsts.data(),
+                                                baseInstances.data());
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+
+    glMultiDrawElementsInstancedBaseVertexBaseInstanceANGLE(
+        GL_TRIANGLES, GL_UNSIGNED_SHORT, 2, elementCounts.data(), instanceCounts.data(),
+        indices.data(), baseVertices.data(), baseInstances.data());
+    EXPECT_GL_ERROR(GL_INVALID_VALUE);
+
+    EXPECT_PIXEL_RECT_EQ(0, 0, kWidth, kHeight, GLColor::transparentBlack);
+}
+
 // Check that glMultiDraw*Instanced without instancing support results in GL_INVALID_OPERATION
 TEST_P(MultiDrawNoInstancingSupportTest, InvalidOperation)
 {
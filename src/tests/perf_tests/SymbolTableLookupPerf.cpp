@@ -0,0 +1,227 @@
+//
+// Copyright 2020 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// SymbolTableLookupPerf:
+//   Performance test for looking up built-ins in the shader translator's symbol table. The names
+//   looked up come from SymbolTableLookupPerf_autogen.h, which is generated along with the symbol
+//   table. There are variations of the test for mangled and unmangled names, and for names that
+//   are built-ins and names that only differ from one in the last character.
+//
+
+#include "ANGLEPerfTest.h"
+
+#include <cstring>
+#include <limits>
+#include <sstream>
+#include <vector>
+
+#include "GLSLANG/ShaderLang.h"
+#include "SymbolTableLookupPerf_autogen.h"
+#include "common/angleutils.h"
+#include "compiler/translator/ImmutableString.h"
+#include "compiler/translator/InitializeGlobals.h"
+#include "compiler/translator/PoolAlloc.h"
+#include "compiler/translator/SymbolTable.h"
+
+namespace
+{
+constexpr int kNumIterationsPerStep = 10;
+
+// The highest shader versions of each spec, used to look up names that aren't built-ins.
+constexpr int kMaxESSLShaderVersion = 310;
+constexpr int kMaxGLSLShaderVersion = 460;
+
+struct SymbolTableLookupParameters
+{
+    ShShaderSpec spec;
+    bool mangled;
+    bool nearMiss;
+};
+
+std::ostream &operator<<(std::ostream &stream, const SymbolTableLookupParameters &p)
+{
+    stream << (p.spec == SH_GL_COMPATIBILITY_SPEC ? "_GLSL" : "_ESSL");
+    stream << (p.mangled ? "_Mangled" : "_Unmangled");
+    stream << (p.nearMiss ? "_NearMiss" : "_Hit");
+    return stream;
+}
+
+std::string GetTestSuffix(const SymbolTableLookupParameters &p)
+{
+    std::stringstream suffix;
+    suffix << p;
+    return suffix.str();
+}
+
+struct LookupName
+{
+    sh::ImmutableString name;
+    int shaderVersion;
+};
+
+class SymbolTableLookupPerfTest : public ANGLEPerfTest,
+                                  public ::testing::WithParamInterface<SymbolTableLookupParameters>
+{
+  public:
+    SymbolTableLookupPerfTest();
+
+    void step() override;
+
+    void SetUp() override;
+    void TearDown() override;
+
+  private:
+    void addBuiltInNames(const sh::BuiltInLookupName *names, size_t count);
+    void addNearMissNames(bool mangled, int shaderVersion);
+
+    std::vector<LookupName> mNames;
+    size_t mFoundCount;
+
+    angle::PoolAllocator mAllocator;
+    sh::TSymbolTable *mSymbolTable;
+};
+
+SymbolTableLookupPerfTest::SymbolTableLookupPerfTest()
+    : ANGLEPerfTest("SymbolTableLookupPerf", GetTestSuffix(GetParam()), kNumIterationsPerStep),
+      mFoundCount(0),
+      mSymbolTable(nullptr)
+{}
+
+void SymbolTableLookupPerfTest::addBuiltInNames(const sh::BuiltInLookupName *names, size_t count)
+{
+    for (size_t index = 0; index < count; ++index)
+    {
+        // Built-ins that depend on the shader type or on extensions aren't necessarily found, so
+        // only the unconditional ones are used.
+        if (names[index].condition == 0)
+        {
+            mNames.push_back({sh::ImmutableString(names[index].name), names[index].shaderVersion});
+        }
+    }
+}
+
+void SymbolTableLookupPerfTest::addNearMissNames(bool mangled, int shaderVersion)
+{
+    for (const char *name : sh::kNearMissBuiltInNames)
+    {
+        bool isMangled = strchr(name, '(') != nullptr;
+        if (isMangled == mangled)
+        {
+            mNames.push_back({sh::ImmutableString(name), shaderVersion});
+        }
+    }
+}
+
+void SymbolTableLookupPerfTest::SetUp()
+{
+    ANGLEPerfTest::SetUp();
+
+    InitializePoolIndex();
+    mAllocator.push();
+    SetGlobalPoolAllocator(&mAllocator);
+
+    const SymbolTableLookupParameters &params = GetParam();
+
+    ShBuiltInResources resources;
+    sh::InitBuiltInResources(&resources);
+
+    mSymbolTable = new sh::TSymbolTable();
+    mSymbolTable->initializeBuiltIns(GL_FRAGMENT_SHADER, params.spec, resources);
+
+    bool isGLSL = params.spec == SH_GL_COMPATIBILITY_SPEC;
+    if (params.nearMiss)
+    {
+        addNearMissNames(params.mangled, isGLSL ? kMaxGLSLShaderVersion : kMaxESSLShaderVersion);
+    }
+    else if (params.mangled)
+    {
+        if (isGLSL)
+        {
+            addBuiltInNames(sh::kGLSLMangledBuiltInNames, ArraySize(sh::kGLSLMangledBuiltInNames));
+        }
+        else
+        {
+            addBuiltInNames(sh::kESSLMangledBuiltInNames, ArraySize(sh::kESSLMangledBuiltInNames));
+        }
+    }
+    else
+    {
+        if (isGLSL)
+        {
+            addBuiltInNames(sh::kGLSLUnmangledBuiltInNames,
+                            ArraySize(sh::kGLSLUnmangledBuiltInNames));
+        }
+        else
+        {
+            addBuiltInNames(sh::kESSLUnmangledBuiltInNames,
+                            ArraySize(sh::kESSLUnmangledBuiltInNames));
+        }
+    }
+}
+
+void SymbolTableLookupPerfTest::TearDown()
+{
+    SafeDelete(mSymbolTable);
+
+    SetGlobalPoolAllocator(nullptr);
+    mAllocator.pop();
+
+    FreePoolIndex();
+
+    ANGLEPerfTest::TearDown();
+}
+
+void SymbolTableLookupPerfTest::step()
+{
+    const bool mangled = GetParam().mangled;
+
+    for (unsigned int iteration = 0; iteration < kNumIterationsPerStep; ++iteration)
+    {
+        for (const LookupName &lookupName : mNames)
+        {
+            bool found;
+            if (mangled)
+            {
+                found =
+                    mSymbolTable->findBuiltIn(lookupName.name, lookupName.shaderVersion) != nullptr;
+            }
+            else
+            {
+                found = mSymbolTable->getUnmangledBuiltInForShaderVersion(
+                            lookupName.name, lookupName.shaderVersion) != nullptr;
+            }
+            mFoundCount += found ? 1 : 0;
+        }
+    }
+
+    // Keep the lookups from being optimized out.
+    if (mFoundCount == std::numeric_limits<size_t>::max())
+    {
+        std::cout << "Found " << mFoundCount << " built-ins.\n";
+    }
+}
+
+SymbolTableLookupParameters Params(ShShaderSpec spec, bool mangled, bool nearMiss)
+{
+    return {spec, mangled, nearMiss};
+}
+
+TEST_P(SymbolTableLookupPerfTest, Run)
+{
+    run();
+}
+
+INSTANTIATE_TEST_SUITE_P(,
+                         SymbolTableLookupPerfTest,
+                         ::testing::Values(Params(SH_GLES3_1_SPEC, true, false),
+                                           Params(SH_GLES3_1_SPEC, true, true),
+                                           Params(SH_GLES3_1_SPEC, false, false),
+                                           Params(SH_GLES3_1_SPEC, false, true),
+                                           Params(SH_GL_COMPATIBILITY_SPEC, true, false),
+                                           Params(SH_GL_COMPATIBILITY_SPEC, true, true),
+                                           Params(SH_GL_COMPATIBILITY_SPEC, false, false),
+                                           Params(SH_GL_COMPATIBILITY_SPEC, false, true)));
+
+}  // anonymous namespace
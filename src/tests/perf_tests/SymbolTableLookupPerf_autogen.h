@@ -0,0 +1,5835 @@
+// GENERATED FILE - DO NOT EDIT.
+// Generated by gen_builtin_symbols.py using data from builtin_variables.json and
+// builtin_function_declarations.txt.
+//
+// Copyright 2026 The ANGLE Project Authors. All rights reserved.
+// Use of this source code is governed by a BSD-style license that can be
+// found in the LICENSE file.
+//
+// SymbolTableLookupPerf_autogen.h:
+//   Built-in names for benchmarking symbol table lookups.
+
+#ifndef TESTS_PERF_TESTS_SYMBOLTABLELOOKUPPERF_AUTOGEN_H_
+#define TESTS_PERF_TESTS_SYMBOLTABLELOOKUPPERF_AUTOGEN_H_
+
+namespace sh
+{
+
+struct BuiltInLookupName
+{
+    const char *name;
+    const char *level;
+    // Lowest shader version the level is available at.
+    int shaderVersion;
+    // Index into kBuiltInLookupConditions.
+    int condition;
+};
+
+// Conditions on the shader type and extensions that built-ins depend on. The first one means that
+// the built-in doesn't depend on either.
+constexpr const char *kBuiltInLookupConditions[] = {
+    "",
+    "mResources.OES_texture_storage_multisample_2d_array",
+    "mShaderType == GL_COMPUTE_SHADER",
+    "(mShaderType == GL_GEOMETRY_SHADER_EXT) && mResources.EXT_geometry_shader",
+    "mShaderType == GL_GEOMETRY_SHADER_EXT",
+    "(mShaderType == GL_FRAGMENT_SHADER) && (mResources.EXT_geometry_shader)",
+    "mResources.ARB_texture_rectangle",
+    "mResources.ANGLE_texture_multisample",
+    "mResources.OES_EGL_image_external_essl3",
+    "mResources.EXT_YUV_target",
+    "mShaderType == GL_FRAGMENT_SHADER",
+    "(mShaderType == GL_FRAGMENT_SHADER) && mResources.OES_EGL_image_external_essl3",
+    "(mShaderType == GL_FRAGMENT_SHADER) && mResources.EXT_YUV_target",
+    "mShaderType == GL_VERTEX_SHADER",
+    "(mShaderType == GL_VERTEX_SHADER) && (mResources.ANGLE_multi_draw)",
+    "(mShaderType == GL_VERTEX_SHADER) && (mResources.ANGLE_base_vertex_base_instance)",
+    "mResources.OVR_multiview && mShaderType != GL_COMPUTE_SHADER",
+    "mResources.EXT_shader_texture_lod",
+    "(mShaderType == GL_FRAGMENT_SHADER) && mResources.OES_standard_derivatives",
+    "(mShaderType == GL_FRAGMENT_SHADER) && mResources.EXT_shader_texture_lod",
+    "(mShaderType == GL_FRAGMENT_SHADER) && mResources.OES_texture_3D",
+    "(mShaderType == GL_FRAGMENT_SHADER) && (mResources.EXT_blend_func_extended)",
+    "(mShaderType == GL_FRAGMENT_SHADER) && (mResources.EXT_shader_framebuffer_fetch)",
+    "(mShaderType == GL_FRAGMENT_SHADER) && (mResources.NV_shader_framebuffer_fetch)",
+    "(mShaderType == GL_FRAGMENT_SHADER) && (mResources.ARM_shader_framebuffer_fetch)",
+    "mShaderType == GL_GEOMETRY_SHADER",
+};
+
+constexpr BuiltInLookupName kESSLMangledBuiltInNames[] = {
+    {"frexp(00B00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"frexp(10B10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"frexp(20B20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"frexp(30B30D", "ESSL3_1_BUILTINS", 310, 0},
+    {"ldexp(00B00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"ldexp(10B10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"ldexp(20B20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"ldexp(30B30D", "ESSL3_1_BUILTINS", 310, 0},
+    {"packUnorm4x8(30B", "ESSL3_1_BUILTINS", 310, 0},
+    {"packSnorm4x8(30B", "ESSL3_1_BUILTINS", 310, 0},
+    {"unpackUnorm4x8(00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"unpackSnorm4x8(00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldExtract(00D00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldExtract(10D00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldExtract(20D00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldExtract(30D00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldExtract(00E00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldExtract(10E00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldExtract(20E00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldExtract(30E00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldInsert(00D00D00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldInsert(10D10D00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldInsert(20D20D00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldInsert(30D30D00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldInsert(00E00E00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldInsert(10E10E00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldInsert(20E20E00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldInsert(30E30E00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldReverse(00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldReverse(10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldReverse(20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldReverse(30D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldReverse(00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldReverse(10E", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldReverse(20E", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldReverse(30E", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitCount(00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitCount(10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitCount(20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitCount(30D", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitCount(00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitCount(10E", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitCount(20E", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitCount(30E", "ESSL3_1_BUILTINS", 310, 0},
+    {"findLSB(00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"findLSB(10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"findLSB(20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"findLSB(30D", "ESSL3_1_BUILTINS", 310, 0},
+    {"findLSB(00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"findLSB(10E", "ESSL3_1_BUILTINS", 310, 0},
+    {"findLSB(20E", "ESSL3_1_BUILTINS", 310, 0},
+    {"findLSB(30E", "ESSL3_1_BUILTINS", 310, 0},
+    {"findMSB(00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"findMSB(10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"findMSB(20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"findMSB(30D", "ESSL3_1_BUILTINS", 310, 0},
+    {"findMSB(00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"findMSB(10E", "ESSL3_1_BUILTINS", 310, 0},
+    {"findMSB(20E", "ESSL3_1_BUILTINS", 310, 0},
+    {"findMSB(30E", "ESSL3_1_BUILTINS", 310, 0},
+    {"uaddCarry(00E00E00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"uaddCarry(10E10E10E", "ESSL3_1_BUILTINS", 310, 0},
+    {"uaddCarry(20E20E20E", "ESSL3_1_BUILTINS", 310, 0},
+    {"uaddCarry(30E30E30E", "ESSL3_1_BUILTINS", 310, 0},
+    {"usubBorrow(00E00E00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"usubBorrow(10E10E10E", "ESSL3_1_BUILTINS", 310, 0},
+    {"usubBorrow(20E20E20E", "ESSL3_1_BUILTINS", 310, 0},
+    {"usubBorrow(30E30E30E", "ESSL3_1_BUILTINS", 310, 0},
+    {"umulExtended(00E00E00E00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"umulExtended(10E10E10E10E", "ESSL3_1_BUILTINS", 310, 0},
+    {"umulExtended(20E20E20E20E", "ESSL3_1_BUILTINS", 310, 0},
+    {"umulExtended(30E30E30E30E", "ESSL3_1_BUILTINS", 310, 0},
+    {"imulExtended(00D00D00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imulExtended(10D10D10D10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imulExtended(20D20D20D20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imulExtended(30D30D30D30D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureSize(00P", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureSize(00V", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureSize(00b", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureSize(00Q", "ESSL3_1_BUILTINS", 310, 1},
+    {"textureSize(00W", "ESSL3_1_BUILTINS", 310, 1},
+    {"textureSize(00c", "ESSL3_1_BUILTINS", 310, 1},
+    {"texelFetch(00P10D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"texelFetch(00V10D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"texelFetch(00b10D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"texelFetch(00Q20D00D", "ESSL3_1_BUILTINS", 310, 1},
+    {"texelFetch(00W20D00D", "ESSL3_1_BUILTINS", 310, 1},
+    {"texelFetch(00c20D00D", "ESSL3_1_BUILTINS", 310, 1},
+    {"textureGather(00I10B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00R10B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00X10B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00I10B00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00R10B00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00X10B00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00L20B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00U20B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00a20B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00L20B00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00U20B00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00a20B00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00K20B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00T20B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00Z20B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00K20B00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00T20B00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00Z20B00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00d10B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00d10B00B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00f20B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00f20B00B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00e20B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather(00e20B00B", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00I10B10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00R10B10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00X10B10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00I10B10D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00R10B10D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00X10B10D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00L20B10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00U20B10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00a20B10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00L20B10D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00U20B10D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00a20B10D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00d10B00B10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset(00f20B00B10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicCounter(00G", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicCounterIncrement(00G", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicCounterDecrement(00G", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicAdd(00E00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicAdd(00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicMin(00E00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicMin(00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicMax(00E00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicMax(00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicAnd(00E00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicAnd(00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicOr(00E00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicOr(00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicXor(00E00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicXor(00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicExchange(00E00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicExchange(00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicCompSwap(00E00E00E", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicCompSwap(00D00D00D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize(00y", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize(00z", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize(01A", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize(01B", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize(01C", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize(01D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize(01E", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize(01F", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize(01G", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize(01H", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize(01I", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize(01J", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad(00y10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad(00z10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad(01A10D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad(01B20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad(01C20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad(01D20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad(01E20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad(01F20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad(01G20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad(01H20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad(01I20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad(01J20D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore(00y10D30B", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore(00z10D30D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore(01A10D30E", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore(01B20D30B", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore(01C20D30D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore(01D20D30E", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore(01E20D30B", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore(01F20D30D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore(01G20D30E", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore(01H20D30B", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore(01I20D30D", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore(01J20D30E", "ESSL3_1_BUILTINS", 310, 0},
+    {"memoryBarrier(", "ESSL3_1_BUILTINS", 310, 0},
+    {"memoryBarrierAtomicCounter(", "ESSL3_1_BUILTINS", 310, 0},
+    {"memoryBarrierBuffer(", "ESSL3_1_BUILTINS", 310, 0},
+    {"memoryBarrierImage(", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxImageUnits", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxVertexImageUniforms", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxFragmentImageUniforms", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxComputeImageUniforms", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxCombinedImageUniforms", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxCombinedShaderOutputResources", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxComputeWorkGroupCount", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxComputeWorkGroupSize", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxComputeUniformComponents", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxComputeTextureImageUnits", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxComputeAtomicCounters", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxComputeAtomicCounterBuffers", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxVertexAtomicCounters", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxFragmentAtomicCounters", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxCombinedAtomicCounters", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxAtomicCounterBindings", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxVertexAtomicCounterBuffers", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxFragmentAtomicCounterBuffers", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxCombinedAtomicCounterBuffers", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxAtomicCounterBufferSize", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxGeometryInputComponents", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxGeometryOutputComponents", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxGeometryImageUniforms", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxGeometryTextureImageUnits", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxGeometryOutputVertices", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxGeometryTotalOutputComponents", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxGeometryUniformComponents", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxGeometryAtomicCounters", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_MaxGeometryAtomicCounterBuffers", "ESSL3_1_BUILTINS", 310, 0},
+    {"gl_in", "ESSL3_1_BUILTINS", 310, 0},
+    {"barrier(", "ESSL3_1_BUILTINS", 310, 2},
+    {"memoryBarrierShared(", "ESSL3_1_BUILTINS", 310, 2},
+    {"groupMemoryBarrier(", "ESSL3_1_BUILTINS", 310, 2},
+    {"gl_NumWorkGroups", "ESSL3_1_BUILTINS", 310, 2},
+    {"gl_WorkGroupSize", "ESSL3_1_BUILTINS", 310, 2},
+    {"gl_WorkGroupID", "ESSL3_1_BUILTINS", 310, 2},
+    {"gl_LocalInvocationID", "ESSL3_1_BUILTINS", 310, 2},
+    {"gl_GlobalInvocationID", "ESSL3_1_BUILTINS", 310, 2},
+    {"gl_LocalInvocationIndex", "ESSL3_1_BUILTINS", 310, 2},
+    {"EmitVertex(", "ESSL3_1_BUILTINS", 310, 3},
+    {"EndPrimitive(", "ESSL3_1_BUILTINS", 310, 3},
+    {"gl_PrimitiveIDIn", "ESSL3_1_BUILTINS", 310, 4},
+    {"gl_InvocationID", "ESSL3_1_BUILTINS", 310, 4},
+    {"gl_PrimitiveID", "ESSL3_1_BUILTINS", 310, 4},
+    {"gl_Layer", "ESSL3_1_BUILTINS", 310, 4},
+    {"gl_PerVertex", "ESSL3_1_BUILTINS", 310, 4},
+    {"gl_Position", "ESSL3_1_BUILTINS", 310, 4},
+    {"gl_PrimitiveID", "ESSL3_1_BUILTINS", 310, 5},
+    {"gl_Layer", "ESSL3_1_BUILTINS", 310, 5},
+    {"sinh(00B", "ESSL3_BUILTINS", 300, 0},
+    {"sinh(10B", "ESSL3_BUILTINS", 300, 0},
+    {"sinh(20B", "ESSL3_BUILTINS", 300, 0},
+    {"sinh(30B", "ESSL3_BUILTINS", 300, 0},
+    {"cosh(00B", "ESSL3_BUILTINS", 300, 0},
+    {"cosh(10B", "ESSL3_BUILTINS", 300, 0},
+    {"cosh(20B", "ESSL3_BUILTINS", 300, 0},
+    {"cosh(30B", "ESSL3_BUILTINS", 300, 0},
+    {"tanh(00B", "ESSL3_BUILTINS", 300, 0},
+    {"tanh(10B", "ESSL3_BUILTINS", 300, 0},
+    {"tanh(20B", "ESSL3_BUILTINS", 300, 0},
+    {"tanh(30B", "ESSL3_BUILTINS", 300, 0},
+    {"asinh(00B", "ESSL3_BUILTINS", 300, 0},
+    {"asinh(10B", "ESSL3_BUILTINS", 300, 0},
+    {"asinh(20B", "ESSL3_BUILTINS", 300, 0},
+    {"asinh(30B", "ESSL3_BUILTINS", 300, 0},
+    {"acosh(00B", "ESSL3_BUILTINS", 300, 0},
+    {"acosh(10B", "ESSL3_BUILTINS", 300, 0},
+    {"acosh(20B", "ESSL3_BUILTINS", 300, 0},
+    {"acosh(30B", "ESSL3_BUILTINS", 300, 0},
+    {"atanh(00B", "ESSL3_BUILTINS", 300, 0},
+    {"atanh(10B", "ESSL3_BUILTINS", 300, 0},
+    {"atanh(20B", "ESSL3_BUILTINS", 300, 0},
+    {"atanh(30B", "ESSL3_BUILTINS", 300, 0},
+    {"abs(00D", "ESSL3_BUILTINS", 300, 0},
+    {"abs(10D", "ESSL3_BUILTINS", 300, 0},
+    {"abs(20D", "ESSL3_BUILTINS", 300, 0},
+    {"abs(30D", "ESSL3_BUILTINS", 300, 0},
+    {"sign(00D", "ESSL3_BUILTINS", 300, 0},
+    {"sign(10D", "ESSL3_BUILTINS", 300, 0},
+    {"sign(20D", "ESSL3_BUILTINS", 300, 0},
+    {"sign(30D", "ESSL3_BUILTINS", 300, 0},
+    {"trunc(00B", "ESSL3_BUILTINS", 300, 0},
+    {"trunc(10B", "ESSL3_BUILTINS", 300, 0},
+    {"trunc(20B", "ESSL3_BUILTINS", 300, 0},
+    {"trunc(30B", "ESSL3_BUILTINS", 300, 0},
+    {"round(00B", "ESSL3_BUILTINS", 300, 0},
+    {"round(10B", "ESSL3_BUILTINS", 300, 0},
+    {"round(20B", "ESSL3_BUILTINS", 300, 0},
+    {"round(30B", "ESSL3_BUILTINS", 300, 0},
+    {"roundEven(00B", "ESSL3_BUILTINS", 300, 0},
+    {"roundEven(10B", "ESSL3_BUILTINS", 300, 0},
+    {"roundEven(20B", "ESSL3_BUILTINS", 300, 0},
+    {"roundEven(30B", "ESSL3_BUILTINS", 300, 0},
+    {"min(00D00D", "ESSL3_BUILTINS", 300, 0},
+    {"min(10D10D", "ESSL3_BUILTINS", 300, 0},
+    {"min(20D20D", "ESSL3_BUILTINS", 300, 0},
+    {"min(30D30D", "ESSL3_BUILTINS", 300, 0},
+    {"min(10D00D", "ESSL3_BUILTINS", 300, 0},
+    {"min(20D00D", "ESSL3_BUILTINS", 300, 0},
+    {"min(30D00D", "ESSL3_BUILTINS", 300, 0},
+    {"min(00E00E", "ESSL3_BUILTINS", 300, 0},
+    {"min(10E10E", "ESSL3_BUILTINS", 300, 0},
+    {"min(20E20E", "ESSL3_BUILTINS", 300, 0},
+    {"min(30E30E", "ESSL3_BUILTINS", 300, 0},
+    {"min(10E00E", "ESSL3_BUILTINS", 300, 0},
+    {"min(20E00E", "ESSL3_BUILTINS", 300, 0},
+    {"min(30E00E", "ESSL3_BUILTINS", 300, 0},
+    {"max(00D00D", "ESSL3_BUILTINS", 300, 0},
+    {"max(10D10D", "ESSL3_BUILTINS", 300, 0},
+    {"max(20D20D", "ESSL3_BUILTINS", 300, 0},
+    {"max(30D30D", "ESSL3_BUILTINS", 300, 0},
+    {"max(10D00D", "ESSL3_BUILTINS", 300, 0},
+    {"max(20D00D", "ESSL3_BUILTINS", 300, 0},
+    {"max(30D00D", "ESSL3_BUILTINS", 300, 0},
+    {"max(00E00E", "ESSL3_BUILTINS", 300, 0},
+    {"max(10E10E", "ESSL3_BUILTINS", 300, 0},
+    {"max(20E20E", "ESSL3_BUILTINS", 300, 0},
+    {"max(30E30E", "ESSL3_BUILTINS", 300, 0},
+    {"max(10E00E", "ESSL3_BUILTINS", 300, 0},
+    {"max(20E00E", "ESSL3_BUILTINS", 300, 0},
+    {"max(30E00E", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(00D00D00D", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(10D00D00D", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(20D00D00D", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(30D00D00D", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(10D10D10D", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(20D20D20D", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(30D30D30D", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(00E00E00E", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(10E00E00E", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(20E00E00E", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(30E00E00E", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(10E10E10E", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(20E20E20E", "ESSL3_BUILTINS", 300, 0},
+    {"clamp(30E30E30E", "ESSL3_BUILTINS", 300, 0},
+    {"mix(00B00B00F", "ESSL3_BUILTINS", 300, 0},
+    {"mix(10B10B10F", "ESSL3_BUILTINS", 300, 0},
+    {"mix(20B20B20F", "ESSL3_BUILTINS", 300, 0},
+    {"mix(30B30B30F", "ESSL3_BUILTINS", 300, 0},
+    {"modf(00B00B", "ESSL3_BUILTINS", 300, 0},
+    {"modf(10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"modf(20B20B", "ESSL3_BUILTINS", 300, 0},
+    {"modf(30B30B", "ESSL3_BUILTINS", 300, 0},
+    {"isnan(00B", "ESSL3_BUILTINS", 300, 0},
+    {"isnan(10B", "ESSL3_BUILTINS", 300, 0},
+    {"isnan(20B", "ESSL3_BUILTINS", 300, 0},
+    {"isnan(30B", "ESSL3_BUILTINS", 300, 0},
+    {"isinf(00B", "ESSL3_BUILTINS", 300, 0},
+    {"isinf(10B", "ESSL3_BUILTINS", 300, 0},
+    {"isinf(20B", "ESSL3_BUILTINS", 300, 0},
+    {"isinf(30B", "ESSL3_BUILTINS", 300, 0},
+    {"floatBitsToInt(00B", "ESSL3_BUILTINS", 300, 0},
+    {"floatBitsToInt(10B", "ESSL3_BUILTINS", 300, 0},
+    {"floatBitsToInt(20B", "ESSL3_BUILTINS", 300, 0},
+    {"floatBitsToInt(30B", "ESSL3_BUILTINS", 300, 0},
+    {"floatBitsToUint(00B", "ESSL3_BUILTINS", 300, 0},
+    {"floatBitsToUint(10B", "ESSL3_BUILTINS", 300, 0},
+    {"floatBitsToUint(20B", "ESSL3_BUILTINS", 300, 0},
+    {"floatBitsToUint(30B", "ESSL3_BUILTINS", 300, 0},
+    {"intBitsToFloat(00D", "ESSL3_BUILTINS", 300, 0},
+    {"intBitsToFloat(10D", "ESSL3_BUILTINS", 300, 0},
+    {"intBitsToFloat(20D", "ESSL3_BUILTINS", 300, 0},
+    {"intBitsToFloat(30D", "ESSL3_BUILTINS", 300, 0},
+    {"uintBitsToFloat(00E", "ESSL3_BUILTINS", 300, 0},
+    {"uintBitsToFloat(10E", "ESSL3_BUILTINS", 300, 0},
+    {"uintBitsToFloat(20E", "ESSL3_BUILTINS", 300, 0},
+    {"uintBitsToFloat(30E", "ESSL3_BUILTINS", 300, 0},
+    {"packSnorm2x16(10B", "ESSL3_BUILTINS", 300, 0},
+    {"packHalf2x16(10B", "ESSL3_BUILTINS", 300, 0},
+    {"unpackSnorm2x16(00E", "ESSL3_BUILTINS", 300, 0},
+    {"unpackHalf2x16(00E", "ESSL3_BUILTINS", 300, 0},
+    {"packUnorm2x16(10B", "ESSL3_BUILTINS", 300, 0},
+    {"unpackUnorm2x16(00E", "ESSL3_BUILTINS", 300, 0},
+    {"matrixCompMult(90B90B", "ESSL3_BUILTINS", 300, 0},
+    {"matrixCompMult(60B60B", "ESSL3_BUILTINS", 300, 0},
+    {"matrixCompMult(D0BD0B", "ESSL3_BUILTINS", 300, 0},
+    {"matrixCompMult(70B70B", "ESSL3_BUILTINS", 300, 0},
+    {"matrixCompMult(E0BE0B", "ESSL3_BUILTINS", 300, 0},
+    {"matrixCompMult(B0BB0B", "ESSL3_BUILTINS", 300, 0},
+    {"outerProduct(10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"outerProduct(20B20B", "ESSL3_BUILTINS", 300, 0},
+    {"outerProduct(30B30B", "ESSL3_BUILTINS", 300, 0},
+    {"outerProduct(20B10B", "ESSL3_BUILTINS", 300, 0},
+    {"outerProduct(10B20B", "ESSL3_BUILTINS", 300, 0},
+    {"outerProduct(30B10B", "ESSL3_BUILTINS", 300, 0},
+    {"outerProduct(10B30B", "ESSL3_BUILTINS", 300, 0},
+    {"outerProduct(30B20B", "ESSL3_BUILTINS", 300, 0},
+    {"outerProduct(20B30B", "ESSL3_BUILTINS", 300, 0},
+    {"transpose(50B", "ESSL3_BUILTINS", 300, 0},
+    {"transpose(A0B", "ESSL3_BUILTINS", 300, 0},
+    {"transpose(F0B", "ESSL3_BUILTINS", 300, 0},
+    {"transpose(60B", "ESSL3_BUILTINS", 300, 0},
+    {"transpose(90B", "ESSL3_BUILTINS", 300, 0},
+    {"transpose(70B", "ESSL3_BUILTINS", 300, 0},
+    {"transpose(D0B", "ESSL3_BUILTINS", 300, 0},
+    {"transpose(B0B", "ESSL3_BUILTINS", 300, 0},
+    {"transpose(E0B", "ESSL3_BUILTINS", 300, 0},
+    {"determinant(50B", "ESSL3_BUILTINS", 300, 0},
+    {"determinant(A0B", "ESSL3_BUILTINS", 300, 0},
+    {"determinant(F0B", "ESSL3_BUILTINS", 300, 0},
+    {"inverse(50B", "ESSL3_BUILTINS", 300, 0},
+    {"inverse(A0B", "ESSL3_BUILTINS", 300, 0},
+    {"inverse(F0B", "ESSL3_BUILTINS", 300, 0},
+    {"lessThan(10E10E", "ESSL3_BUILTINS", 300, 0},
+    {"lessThan(20E20E", "ESSL3_BUILTINS", 300, 0},
+    {"lessThan(30E30E", "ESSL3_BUILTINS", 300, 0},
+    {"lessThanEqual(10E10E", "ESSL3_BUILTINS", 300, 0},
+    {"lessThanEqual(20E20E", "ESSL3_BUILTINS", 300, 0},
+    {"lessThanEqual(30E30E", "ESSL3_BUILTINS", 300, 0},
+    {"greaterThan(10E10E", "ESSL3_BUILTINS", 300, 0},
+    {"greaterThan(20E20E", "ESSL3_BUILTINS", 300, 0},
+    {"greaterThan(30E30E", "ESSL3_BUILTINS", 300, 0},
+    {"greaterThanEqual(10E10E", "ESSL3_BUILTINS", 300, 0},
+    {"greaterThanEqual(20E20E", "ESSL3_BUILTINS", 300, 0},
+    {"greaterThanEqual(30E30E", "ESSL3_BUILTINS", 300, 0},
+    {"equal(10E10E", "ESSL3_BUILTINS", 300, 0},
+    {"equal(20E20E", "ESSL3_BUILTINS", 300, 0},
+    {"equal(30E30E", "ESSL3_BUILTINS", 300, 0},
+    {"notEqual(10E10E", "ESSL3_BUILTINS", 300, 0},
+    {"notEqual(20E20E", "ESSL3_BUILTINS", 300, 0},
+    {"notEqual(30E30E", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00O10B", "ESSL3_BUILTINS", 300, 6},
+    {"textureProj(00O20B", "ESSL3_BUILTINS", 300, 6},
+    {"textureProj(00O30B", "ESSL3_BUILTINS", 300, 6},
+    {"texture(00I10B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00R10B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00X10B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00J20B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00S20B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00Y20B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00K20B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00T20B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00Z20B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00L20B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00U20B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00a20B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00d20B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00e30B", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00f30B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProj(00I20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProj(00R20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProj(00X20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProj(00I30B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProj(00R30B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProj(00X30B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProj(00J30B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProj(00S30B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProj(00Y30B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProj(00d30B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00I10B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00R10B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00X10B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00J20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00S20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00Y20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00K20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00T20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00Z20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00L20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00U20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00a20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod(00d20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00I00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00R00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00X00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00J00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00S00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00Y00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00K00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00T00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00Z00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00L00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00U00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00a00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00d00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00e00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00f00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLod(00I20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLod(00R20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLod(00X20B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLod(00I30B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLod(00R30B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLod(00X30B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLod(00J30B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLod(00S30B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLod(00Y30B00B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLod(00d30B00B", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetch(00I10D00D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetch(00R10D00D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetch(00X10D00D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetch(00J20D00D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetch(00S20D00D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetch(00Y20D00D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetch(00L20D00D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetch(00U20D00D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetch(00a20D00D", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00I10B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00R10B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00X10B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00J20B20B20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00S20B20B20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00Y20B20B20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00K20B20B20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00T20B20B20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00Z20B20B20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00d20B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00e30B20B20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00L20B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00U20B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00a20B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad(00f30B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGrad(00I20B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGrad(00R20B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGrad(00X20B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGrad(00I30B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGrad(00R30B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGrad(00X30B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGrad(00J30B20B20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGrad(00S30B20B20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGrad(00Y30B20B20B", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGrad(00d30B10B10B", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize(00P", "ESSL3_BUILTINS", 300, 7},
+    {"textureSize(00V", "ESSL3_BUILTINS", 300, 7},
+    {"textureSize(00b", "ESSL3_BUILTINS", 300, 7},
+    {"texelFetch(00P10D00D", "ESSL3_BUILTINS", 300, 7},
+    {"texelFetch(00V10D00D", "ESSL3_BUILTINS", 300, 7},
+    {"texelFetch(00b10D00D", "ESSL3_BUILTINS", 300, 7},
+    {"textureOffset(00I10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureOffset(00R10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureOffset(00X10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureOffset(00J20B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureOffset(00S20B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureOffset(00Y20B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureOffset(00d20B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureOffset(00L20B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureOffset(00U20B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureOffset(00a20B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjOffset(00I20B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjOffset(00R20B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjOffset(00X20B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjOffset(00I30B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjOffset(00R30B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjOffset(00X30B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjOffset(00J30B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjOffset(00S30B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjOffset(00Y30B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjOffset(00d30B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureLodOffset(00I10B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureLodOffset(00R10B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureLodOffset(00X10B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureLodOffset(00J20B00B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureLodOffset(00S20B00B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureLodOffset(00Y20B00B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureLodOffset(00d20B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureLodOffset(00L20B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureLodOffset(00U20B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureLodOffset(00a20B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLodOffset(00I20B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLodOffset(00R20B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLodOffset(00X20B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLodOffset(00I30B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLodOffset(00R30B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLodOffset(00X30B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLodOffset(00J30B00B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLodOffset(00S30B00B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLodOffset(00Y30B00B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLodOffset(00d30B00B10D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetchOffset(00I10D00D10D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetchOffset(00R10D00D10D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetchOffset(00X10D00D10D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetchOffset(00J20D00D20D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetchOffset(00S20D00D20D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetchOffset(00Y20D00D20D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetchOffset(00L20D00D10D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetchOffset(00U20D00D10D", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetchOffset(00a20D00D10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureGradOffset(00I10B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureGradOffset(00R10B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureGradOffset(00X10B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureGradOffset(00J20B20B20B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureGradOffset(00S20B20B20B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureGradOffset(00Y20B20B20B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureGradOffset(00d20B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureGradOffset(00L20B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureGradOffset(00U20B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureGradOffset(00a20B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureGradOffset(00f30B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGradOffset(00I20B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGradOffset(00R20B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGradOffset(00X20B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGradOffset(00I30B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGradOffset(00R30B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGradOffset(00X30B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGradOffset(00J30B20B20B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGradOffset(00S30B20B20B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGradOffset(00Y30B20B20B20D", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGradOffset(00d30B10B10B10D", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00M10B", "ESSL3_BUILTINS", 300, 8},
+    {"textureProj(00M20B", "ESSL3_BUILTINS", 300, 8},
+    {"textureProj(00M30B", "ESSL3_BUILTINS", 300, 8},
+    {"textureSize(00M00D", "ESSL3_BUILTINS", 300, 8},
+    {"texelFetch(00M10D00D", "ESSL3_BUILTINS", 300, 8},
+    {"texture(00N10B", "ESSL3_BUILTINS", 300, 9},
+    {"textureProj(00N20B", "ESSL3_BUILTINS", 300, 9},
+    {"textureProj(00N30B", "ESSL3_BUILTINS", 300, 9},
+    {"rgb_2_yuv(20B00H", "ESSL3_BUILTINS", 300, 9},
+    {"yuv_2_rgb(20B00H", "ESSL3_BUILTINS", 300, 9},
+    {"textureSize(00N00D", "ESSL3_BUILTINS", 300, 9},
+    {"texelFetch(00N10D00D", "ESSL3_BUILTINS", 300, 9},
+    {"gl_MaxVertexOutputVectors", "ESSL3_BUILTINS", 300, 0},
+    {"gl_MaxFragmentInputVectors", "ESSL3_BUILTINS", 300, 0},
+    {"gl_MinProgramTexelOffset", "ESSL3_BUILTINS", 300, 0},
+    {"gl_MaxProgramTexelOffset", "ESSL3_BUILTINS", 300, 0},
+    {"texture(00I10B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00R10B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00X10B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00J20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00S20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00Y20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00K20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00T20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00Z20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00L20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00U20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00a20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProj(00I20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProj(00R20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProj(00X20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProj(00I30B00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProj(00R30B00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProj(00X30B00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProj(00J30B00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProj(00S30B00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProj(00Y30B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00d20B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00e30B00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProj(00d30B00B", "ESSL3_BUILTINS", 300, 10},
+    {"texture(00M10B00B", "ESSL3_BUILTINS", 300, 11},
+    {"textureProj(00M20B00B", "ESSL3_BUILTINS", 300, 11},
+    {"textureProj(00M30B00B", "ESSL3_BUILTINS", 300, 11},
+    {"texture(00N10B00B", "ESSL3_BUILTINS", 300, 12},
+    {"textureProj(00N20B00B", "ESSL3_BUILTINS", 300, 12},
+    {"textureProj(00N30B00B", "ESSL3_BUILTINS", 300, 12},
+    {"textureOffset(00I10B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureOffset(00R10B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureOffset(00X10B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureOffset(00J20B20D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureOffset(00S20B20D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureOffset(00Y20B20D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureOffset(00d20B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureOffset(00L20B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureOffset(00U20B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureOffset(00a20B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProjOffset(00I20B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProjOffset(00R20B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProjOffset(00X20B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProjOffset(00I30B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProjOffset(00R30B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProjOffset(00X30B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProjOffset(00J30B20D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProjOffset(00S30B20D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProjOffset(00Y30B20D00B", "ESSL3_BUILTINS", 300, 10},
+    {"textureProjOffset(00d30B10D00B", "ESSL3_BUILTINS", 300, 10},
+    {"dFdx(00B", "ESSL3_BUILTINS", 300, 10},
+    {"dFdx(10B", "ESSL3_BUILTINS", 300, 10},
+    {"dFdx(20B", "ESSL3_BUILTINS", 300, 10},
+    {"dFdx(30B", "ESSL3_BUILTINS", 300, 10},
+    {"dFdy(00B", "ESSL3_BUILTINS", 300, 10},
+    {"dFdy(10B", "ESSL3_BUILTINS", 300, 10},
+    {"dFdy(20B", "ESSL3_BUILTINS", 300, 10},
+    {"dFdy(30B", "ESSL3_BUILTINS", 300, 10},
+    {"fwidth(00B", "ESSL3_BUILTINS", 300, 10},
+    {"fwidth(10B", "ESSL3_BUILTINS", 300, 10},
+    {"fwidth(20B", "ESSL3_BUILTINS", 300, 10},
+    {"fwidth(30B", "ESSL3_BUILTINS", 300, 10},
+    {"gl_FragDepth", "ESSL3_BUILTINS", 300, 10},
+    {"gl_InstanceID", "ESSL3_BUILTINS", 300, 13},
+    {"gl_VertexID", "ESSL3_BUILTINS", 300, 13},
+    {"gl_DrawID", "ESSL3_BUILTINS", 300, 14},
+    {"gl_BaseVertex", "ESSL3_BUILTINS", 300, 15},
+    {"gl_BaseInstance", "ESSL3_BUILTINS", 300, 15},
+    {"gl_ViewID_OVR", "ESSL3_BUILTINS", 300, 16},
+    {"texture2D(00I10B", "ESSL1_BUILTINS", 100, 0},
+    {"texture2DProj(00I20B", "ESSL1_BUILTINS", 100, 0},
+    {"texture2DProj(00I30B", "ESSL1_BUILTINS", 100, 0},
+    {"textureCube(00K20B", "ESSL1_BUILTINS", 100, 0},
+    {"texture2D(00M10B", "ESSL1_BUILTINS", 100, 0},
+    {"texture2DProj(00M20B", "ESSL1_BUILTINS", 100, 0},
+    {"texture2DProj(00M30B", "ESSL1_BUILTINS", 100, 0},
+    {"texture2DRect(00O10B", "ESSL1_BUILTINS", 100, 6},
+    {"texture2DRectProj(00O20B", "ESSL1_BUILTINS", 100, 6},
+    {"texture2DRectProj(00O30B", "ESSL1_BUILTINS", 100, 6},
+    {"texture2DGradEXT(00I10B10B10B", "ESSL1_BUILTINS", 100, 17},
+    {"texture2DProjGradEXT(00I20B10B10B", "ESSL1_BUILTINS", 100, 17},
+    {"texture2DProjGradEXT(00I30B10B10B", "ESSL1_BUILTINS", 100, 17},
+    {"textureCubeGradEXT(00K20B20B20B", "ESSL1_BUILTINS", 100, 17},
+    {"gl_MaxVaryingVectors", "ESSL1_BUILTINS", 100, 0},
+    {"gl_FragData", "ESSL1_BUILTINS", 100, 0},
+    {"gl_SecondaryFragDataEXT", "ESSL1_BUILTINS", 100, 0},
+    {"gl_FragDepthEXT", "ESSL1_BUILTINS", 100, 0},
+    {"texture2D(00I10B00B", "ESSL1_BUILTINS", 100, 10},
+    {"texture2DProj(00I20B00B", "ESSL1_BUILTINS", 100, 10},
+    {"texture2DProj(00I30B00B", "ESSL1_BUILTINS", 100, 10},
+    {"textureCube(00K20B00B", "ESSL1_BUILTINS", 100, 10},
+    {"dFdx(00B", "ESSL1_BUILTINS", 100, 18},
+    {"dFdx(10B", "ESSL1_BUILTINS", 100, 18},
+    {"dFdx(20B", "ESSL1_BUILTINS", 100, 18},
+    {"dFdx(30B", "ESSL1_BUILTINS", 100, 18},
+    {"dFdy(00B", "ESSL1_BUILTINS", 100, 18},
+    {"dFdy(10B", "ESSL1_BUILTINS", 100, 18},
+    {"dFdy(20B", "ESSL1_BUILTINS", 100, 18},
+    {"dFdy(30B", "ESSL1_BUILTINS", 100, 18},
+    {"fwidth(00B", "ESSL1_BUILTINS", 100, 18},
+    {"fwidth(10B", "ESSL1_BUILTINS", 100, 18},
+    {"fwidth(20B", "ESSL1_BUILTINS", 100, 18},
+    {"fwidth(30B", "ESSL1_BUILTINS", 100, 18},
+    {"texture2DLodEXT(00I10B00B", "ESSL1_BUILTINS", 100, 19},
+    {"texture2DProjLodEXT(00I20B00B", "ESSL1_BUILTINS", 100, 19},
+    {"texture2DProjLodEXT(00I30B00B", "ESSL1_BUILTINS", 100, 19},
+    {"textureCubeLodEXT(00K20B00B", "ESSL1_BUILTINS", 100, 19},
+    {"texture3D(00J20B", "ESSL1_BUILTINS", 100, 20},
+    {"texture3DProj(00J30B", "ESSL1_BUILTINS", 100, 20},
+    {"texture3D(00J20B00B", "ESSL1_BUILTINS", 100, 20},
+    {"texture3DProj(00J30B00B", "ESSL1_BUILTINS", 100, 20},
+    {"texture3DLod(00J20B00B", "ESSL1_BUILTINS", 100, 20},
+    {"texture3DProjLod(00J30B00B", "ESSL1_BUILTINS", 100, 20},
+    {"gl_FragColor", "ESSL1_BUILTINS", 100, 10},
+    {"texture2DLod(00I10B00B", "ESSL1_BUILTINS", 100, 13},
+    {"texture2DProjLod(00I20B00B", "ESSL1_BUILTINS", 100, 13},
+    {"texture2DProjLod(00I30B00B", "ESSL1_BUILTINS", 100, 13},
+    {"textureCubeLod(00K20B00B", "ESSL1_BUILTINS", 100, 13},
+    {"gl_SecondaryFragColorEXT", "ESSL1_BUILTINS", 100, 21},
+    {"gl_LastFragData", "ESSL1_BUILTINS", 100, 22},
+    {"gl_LastFragColor", "ESSL1_BUILTINS", 100, 23},
+    {"gl_LastFragData", "ESSL1_BUILTINS", 100, 23},
+    {"gl_LastFragColorARM", "ESSL1_BUILTINS", 100, 24},
+    {"gl_DrawID", "ESSL1_BUILTINS", 100, 14},
+    {"gl_ViewID_OVR", "ESSL1_BUILTINS", 100, 16},
+    {"radians(00B", "COMMON_BUILTINS", 100, 0},
+    {"radians(10B", "COMMON_BUILTINS", 100, 0},
+    {"radians(20B", "COMMON_BUILTINS", 100, 0},
+    {"radians(30B", "COMMON_BUILTINS", 100, 0},
+    {"degrees(00B", "COMMON_BUILTINS", 100, 0},
+    {"degrees(10B", "COMMON_BUILTINS", 100, 0},
+    {"degrees(20B", "COMMON_BUILTINS", 100, 0},
+    {"degrees(30B", "COMMON_BUILTINS", 100, 0},
+    {"sin(00B", "COMMON_BUILTINS", 100, 0},
+    {"sin(10B", "COMMON_BUILTINS", 100, 0},
+    {"sin(20B", "COMMON_BUILTINS", 100, 0},
+    {"sin(30B", "COMMON_BUILTINS", 100, 0},
+    {"cos(00B", "COMMON_BUILTINS", 100, 0},
+    {"cos(10B", "COMMON_BUILTINS", 100, 0},
+    {"cos(20B", "COMMON_BUILTINS", 100, 0},
+    {"cos(30B", "COMMON_BUILTINS", 100, 0},
+    {"tan(00B", "COMMON_BUILTINS", 100, 0},
+    {"tan(10B", "COMMON_BUILTINS", 100, 0},
+    {"tan(20B", "COMMON_BUILTINS", 100, 0},
+    {"tan(30B", "COMMON_BUILTINS", 100, 0},
+    {"asin(00B", "COMMON_BUILTINS", 100, 0},
+    {"asin(10B", "COMMON_BUILTINS", 100, 0},
+    {"asin(20B", "COMMON_BUILTINS", 100, 0},
+    {"asin(30B", "COMMON_BUILTINS", 100, 0},
+    {"acos(00B", "COMMON_BUILTINS", 100, 0},
+    {"acos(10B", "COMMON_BUILTINS", 100, 0},
+    {"acos(20B", "COMMON_BUILTINS", 100, 0},
+    {"acos(30B", "COMMON_BUILTINS", 100, 0},
+    {"atan(00B00B", "COMMON_BUILTINS", 100, 0},
+    {"atan(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"atan(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"atan(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"atan(00B", "COMMON_BUILTINS", 100, 0},
+    {"atan(10B", "COMMON_BUILTINS", 100, 0},
+    {"atan(20B", "COMMON_BUILTINS", 100, 0},
+    {"atan(30B", "COMMON_BUILTINS", 100, 0},
+    {"pow(00B00B", "COMMON_BUILTINS", 100, 0},
+    {"pow(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"pow(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"pow(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"exp(00B", "COMMON_BUILTINS", 100, 0},
+    {"exp(10B", "COMMON_BUILTINS", 100, 0},
+    {"exp(20B", "COMMON_BUILTINS", 100, 0},
+    {"exp(30B", "COMMON_BUILTINS", 100, 0},
+    {"log(00B", "COMMON_BUILTINS", 100, 0},
+    {"log(10B", "COMMON_BUILTINS", 100, 0},
+    {"log(20B", "COMMON_BUILTINS", 100, 0},
+    {"log(30B", "COMMON_BUILTINS", 100, 0},
+    {"exp2(00B", "COMMON_BUILTINS", 100, 0},
+    {"exp2(10B", "COMMON_BUILTINS", 100, 0},
+    {"exp2(20B", "COMMON_BUILTINS", 100, 0},
+    {"exp2(30B", "COMMON_BUILTINS", 100, 0},
+    {"log2(00B", "COMMON_BUILTINS", 100, 0},
+    {"log2(10B", "COMMON_BUILTINS", 100, 0},
+    {"log2(20B", "COMMON_BUILTINS", 100, 0},
+    {"log2(30B", "COMMON_BUILTINS", 100, 0},
+    {"sqrt(00B", "COMMON_BUILTINS", 100, 0},
+    {"sqrt(10B", "COMMON_BUILTINS", 100, 0},
+    {"sqrt(20B", "COMMON_BUILTINS", 100, 0},
+    {"sqrt(30B", "COMMON_BUILTINS", 100, 0},
+    {"inversesqrt(00B", "COMMON_BUILTINS", 100, 0},
+    {"inversesqrt(10B", "COMMON_BUILTINS", 100, 0},
+    {"inversesqrt(20B", "COMMON_BUILTINS", 100, 0},
+    {"inversesqrt(30B", "COMMON_BUILTINS", 100, 0},
+    {"abs(00B", "COMMON_BUILTINS", 100, 0},
+    {"abs(10B", "COMMON_BUILTINS", 100, 0},
+    {"abs(20B", "COMMON_BUILTINS", 100, 0},
+    {"abs(30B", "COMMON_BUILTINS", 100, 0},
+    {"sign(00B", "COMMON_BUILTINS", 100, 0},
+    {"sign(10B", "COMMON_BUILTINS", 100, 0},
+    {"sign(20B", "COMMON_BUILTINS", 100, 0},
+    {"sign(30B", "COMMON_BUILTINS", 100, 0},
+    {"floor(00B", "COMMON_BUILTINS", 100, 0},
+    {"floor(10B", "COMMON_BUILTINS", 100, 0},
+    {"floor(20B", "COMMON_BUILTINS", 100, 0},
+    {"floor(30B", "COMMON_BUILTINS", 100, 0},
+    {"ceil(00B", "COMMON_BUILTINS", 100, 0},
+    {"ceil(10B", "COMMON_BUILTINS", 100, 0},
+    {"ceil(20B", "COMMON_BUILTINS", 100, 0},
+    {"ceil(30B", "COMMON_BUILTINS", 100, 0},
+    {"fract(00B", "COMMON_BUILTINS", 100, 0},
+    {"fract(10B", "COMMON_BUILTINS", 100, 0},
+    {"fract(20B", "COMMON_BUILTINS", 100, 0},
+    {"fract(30B", "COMMON_BUILTINS", 100, 0},
+    {"mod(00B00B", "COMMON_BUILTINS", 100, 0},
+    {"mod(10B00B", "COMMON_BUILTINS", 100, 0},
+    {"mod(20B00B", "COMMON_BUILTINS", 100, 0},
+    {"mod(30B00B", "COMMON_BUILTINS", 100, 0},
+    {"mod(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"mod(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"mod(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"min(00B00B", "COMMON_BUILTINS", 100, 0},
+    {"min(10B00B", "COMMON_BUILTINS", 100, 0},
+    {"min(20B00B", "COMMON_BUILTINS", 100, 0},
+    {"min(30B00B", "COMMON_BUILTINS", 100, 0},
+    {"min(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"min(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"min(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"max(00B00B", "COMMON_BUILTINS", 100, 0},
+    {"max(10B00B", "COMMON_BUILTINS", 100, 0},
+    {"max(20B00B", "COMMON_BUILTINS", 100, 0},
+    {"max(30B00B", "COMMON_BUILTINS", 100, 0},
+    {"max(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"max(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"max(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"clamp(00B00B00B", "COMMON_BUILTINS", 100, 0},
+    {"clamp(10B00B00B", "COMMON_BUILTINS", 100, 0},
+    {"clamp(20B00B00B", "COMMON_BUILTINS", 100, 0},
+    {"clamp(30B00B00B", "COMMON_BUILTINS", 100, 0},
+    {"clamp(10B10B10B", "COMMON_BUILTINS", 100, 0},
+    {"clamp(20B20B20B", "COMMON_BUILTINS", 100, 0},
+    {"clamp(30B30B30B", "COMMON_BUILTINS", 100, 0},
+    {"mix(00B00B00B", "COMMON_BUILTINS", 100, 0},
+    {"mix(10B10B00B", "COMMON_BUILTINS", 100, 0},
+    {"mix(20B20B00B", "COMMON_BUILTINS", 100, 0},
+    {"mix(30B30B00B", "COMMON_BUILTINS", 100, 0},
+    {"mix(10B10B10B", "COMMON_BUILTINS", 100, 0},
+    {"mix(20B20B20B", "COMMON_BUILTINS", 100, 0},
+    {"mix(30B30B30B", "COMMON_BUILTINS", 100, 0},
+    {"step(00B00B", "COMMON_BUILTINS", 100, 0},
+    {"step(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"step(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"step(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"step(00B10B", "COMMON_BUILTINS", 100, 0},
+    {"step(00B20B", "COMMON_BUILTINS", 100, 0},
+    {"step(00B30B", "COMMON_BUILTINS", 100, 0},
+    {"smoothstep(00B00B00B", "COMMON_BUILTINS", 100, 0},
+    {"smoothstep(10B10B10B", "COMMON_BUILTINS", 100, 0},
+    {"smoothstep(20B20B20B", "COMMON_BUILTINS", 100, 0},
+    {"smoothstep(30B30B30B", "COMMON_BUILTINS", 100, 0},
+    {"smoothstep(00B00B10B", "COMMON_BUILTINS", 100, 0},
+    {"smoothstep(00B00B20B", "COMMON_BUILTINS", 100, 0},
+    {"smoothstep(00B00B30B", "COMMON_BUILTINS", 100, 0},
+    {"length(00B", "COMMON_BUILTINS", 100, 0},
+    {"length(10B", "COMMON_BUILTINS", 100, 0},
+    {"length(20B", "COMMON_BUILTINS", 100, 0},
+    {"length(30B", "COMMON_BUILTINS", 100, 0},
+    {"distance(00B00B", "COMMON_BUILTINS", 100, 0},
+    {"distance(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"distance(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"distance(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"dot(00B00B", "COMMON_BUILTINS", 100, 0},
+    {"dot(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"dot(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"dot(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"cross(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"normalize(00B", "COMMON_BUILTINS", 100, 0},
+    {"normalize(10B", "COMMON_BUILTINS", 100, 0},
+    {"normalize(20B", "COMMON_BUILTINS", 100, 0},
+    {"normalize(30B", "COMMON_BUILTINS", 100, 0},
+    {"faceforward(00B00B00B", "COMMON_BUILTINS", 100, 0},
+    {"faceforward(10B10B10B", "COMMON_BUILTINS", 100, 0},
+    {"faceforward(20B20B20B", "COMMON_BUILTINS", 100, 0},
+    {"faceforward(30B30B30B", "COMMON_BUILTINS", 100, 0},
+    {"reflect(00B00B", "COMMON_BUILTINS", 100, 0},
+    {"reflect(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"reflect(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"reflect(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"refract(00B00B00B", "COMMON_BUILTINS", 100, 0},
+    {"refract(10B10B00B", "COMMON_BUILTINS", 100, 0},
+    {"refract(20B20B00B", "COMMON_BUILTINS", 100, 0},
+    {"refract(30B30B00B", "COMMON_BUILTINS", 100, 0},
+    {"matrixCompMult(50B50B", "COMMON_BUILTINS", 100, 0},
+    {"matrixCompMult(A0BA0B", "COMMON_BUILTINS", 100, 0},
+    {"matrixCompMult(F0BF0B", "COMMON_BUILTINS", 100, 0},
+    {"lessThan(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"lessThan(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"lessThan(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"lessThan(10D10D", "COMMON_BUILTINS", 100, 0},
+    {"lessThan(20D20D", "COMMON_BUILTINS", 100, 0},
+    {"lessThan(30D30D", "COMMON_BUILTINS", 100, 0},
+    {"lessThanEqual(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"lessThanEqual(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"lessThanEqual(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"lessThanEqual(10D10D", "COMMON_BUILTINS", 100, 0},
+    {"lessThanEqual(20D20D", "COMMON_BUILTINS", 100, 0},
+    {"lessThanEqual(30D30D", "COMMON_BUILTINS", 100, 0},
+    {"greaterThan(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"greaterThan(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"greaterThan(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"greaterThan(10D10D", "COMMON_BUILTINS", 100, 0},
+    {"greaterThan(20D20D", "COMMON_BUILTINS", 100, 0},
+    {"greaterThan(30D30D", "COMMON_BUILTINS", 100, 0},
+    {"greaterThanEqual(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"greaterThanEqual(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"greaterThanEqual(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"greaterThanEqual(10D10D", "COMMON_BUILTINS", 100, 0},
+    {"greaterThanEqual(20D20D", "COMMON_BUILTINS", 100, 0},
+    {"greaterThanEqual(30D30D", "COMMON_BUILTINS", 100, 0},
+    {"equal(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"equal(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"equal(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"equal(10D10D", "COMMON_BUILTINS", 100, 0},
+    {"equal(20D20D", "COMMON_BUILTINS", 100, 0},
+    {"equal(30D30D", "COMMON_BUILTINS", 100, 0},
+    {"equal(10F10F", "COMMON_BUILTINS", 100, 0},
+    {"equal(20F20F", "COMMON_BUILTINS", 100, 0},
+    {"equal(30F30F", "COMMON_BUILTINS", 100, 0},
+    {"notEqual(10B10B", "COMMON_BUILTINS", 100, 0},
+    {"notEqual(20B20B", "COMMON_BUILTINS", 100, 0},
+    {"notEqual(30B30B", "COMMON_BUILTINS", 100, 0},
+    {"notEqual(10D10D", "COMMON_BUILTINS", 100, 0},
+    {"notEqual(20D20D", "COMMON_BUILTINS", 100, 0},
+    {"notEqual(30D30D", "COMMON_BUILTINS", 100, 0},
+    {"notEqual(10F10F", "COMMON_BUILTINS", 100, 0},
+    {"notEqual(20F20F", "COMMON_BUILTINS", 100, 0},
+    {"notEqual(30F30F", "COMMON_BUILTINS", 100, 0},
+    {"any(10F", "COMMON_BUILTINS", 100, 0},
+    {"any(20F", "COMMON_BUILTINS", 100, 0},
+    {"any(30F", "COMMON_BUILTINS", 100, 0},
+    {"all(10F", "COMMON_BUILTINS", 100, 0},
+    {"all(20F", "COMMON_BUILTINS", 100, 0},
+    {"all(30F", "COMMON_BUILTINS", 100, 0},
+    {"not(10F", "COMMON_BUILTINS", 100, 0},
+    {"not(20F", "COMMON_BUILTINS", 100, 0},
+    {"not(30F", "COMMON_BUILTINS", 100, 0},
+    {"gl_DepthRangeParameters", "COMMON_BUILTINS", 100, 0},
+    {"gl_DepthRange", "COMMON_BUILTINS", 100, 0},
+    {"gl_MaxVertexAttribs", "COMMON_BUILTINS", 100, 0},
+    {"gl_MaxVertexUniformVectors", "COMMON_BUILTINS", 100, 0},
+    {"gl_MaxVertexTextureImageUnits", "COMMON_BUILTINS", 100, 0},
+    {"gl_MaxCombinedTextureImageUnits", "COMMON_BUILTINS", 100, 0},
+    {"gl_MaxTextureImageUnits", "COMMON_BUILTINS", 100, 0},
+    {"gl_MaxFragmentUniformVectors", "COMMON_BUILTINS", 100, 0},
+    {"gl_MaxDrawBuffers", "COMMON_BUILTINS", 100, 0},
+    {"gl_MaxDualSourceDrawBuffersEXT", "COMMON_BUILTINS", 100, 0},
+    {"gl_FragCoord", "COMMON_BUILTINS", 100, 10},
+    {"gl_FrontFacing", "COMMON_BUILTINS", 100, 10},
+    {"gl_PointCoord", "COMMON_BUILTINS", 100, 10},
+    {"gl_Position", "COMMON_BUILTINS", 100, 13},
+    {"gl_PointSize", "COMMON_BUILTINS", 100, 13},
+};
+
+constexpr BuiltInLookupName kGLSLMangledBuiltInNames[] = {
+    {"atomicCounterAdd(00G00E", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterSubtract(00G00E", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterMin(00G00E", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterMax(00G00E", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterAnd(00G00E", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterOr(00G00E", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterXor(00G00E", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterExchange(00G00E", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterCompSwap(00G00E00E", "GLSL4_6_BUILTINS", 460, 0},
+    {"subpassLoad(01i", "GLSL4_6_BUILTINS", 460, 0},
+    {"subpassLoad(01j", "GLSL4_6_BUILTINS", 460, 0},
+    {"subpassLoad(01k", "GLSL4_6_BUILTINS", 460, 0},
+    {"subpassLoad(01l00D", "GLSL4_6_BUILTINS", 460, 0},
+    {"subpassLoad(01m00D", "GLSL4_6_BUILTINS", 460, 0},
+    {"subpassLoad(01n00D", "GLSL4_6_BUILTINS", 460, 0},
+    {"anyInvocation(00F", "GLSL4_6_BUILTINS", 460, 0},
+    {"allInvocations(00F", "GLSL4_6_BUILTINS", 460, 0},
+    {"allInvocationsEqual(00F", "GLSL4_6_BUILTINS", 460, 0},
+    {"mix(00D00D00F", "GLSL4_5_BUILTINS", 450, 0},
+    {"mix(10D10D10F", "GLSL4_5_BUILTINS", 450, 0},
+    {"mix(20D20D20F", "GLSL4_5_BUILTINS", 450, 0},
+    {"mix(30D30D30F", "GLSL4_5_BUILTINS", 450, 0},
+    {"mix(00E00E00F", "GLSL4_5_BUILTINS", 450, 0},
+    {"mix(10E10E10F", "GLSL4_5_BUILTINS", 450, 0},
+    {"mix(20E20E20F", "GLSL4_5_BUILTINS", 450, 0},
+    {"mix(30E30E30F", "GLSL4_5_BUILTINS", 450, 0},
+    {"mix(00F00F00F", "GLSL4_5_BUILTINS", 450, 0},
+    {"mix(10F10F10F", "GLSL4_5_BUILTINS", 450, 0},
+    {"mix(20F20F20F", "GLSL4_5_BUILTINS", 450, 0},
+    {"mix(30F30F30F", "GLSL4_5_BUILTINS", 450, 0},
+    {"textureSamples(00P", "GLSL4_5_BUILTINS", 450, 0},
+    {"textureSamples(00V", "GLSL4_5_BUILTINS", 450, 0},
+    {"textureSamples(00b", "GLSL4_5_BUILTINS", 450, 0},
+    {"textureSamples(00Q", "GLSL4_5_BUILTINS", 450, 0},
+    {"textureSamples(00W", "GLSL4_5_BUILTINS", 450, 0},
+    {"textureSamples(00c", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageSamples(01Q", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageSamples(01R", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageSamples(01S", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageSamples(01T", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageSamples(01U", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageSamples(01V", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(00y10D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(00z10D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01A10D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01B20D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01C20D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01D20D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01H20D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01I20D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01J20D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01f00D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01g00D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01h00D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01E20D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01F20D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01G20D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01Z20D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01a20D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01b20D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01K00D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01L00D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01M00D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01N10D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01O10D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01P10D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01W10D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01X10D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01Y10D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01Q10D00D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01R10D00D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01S10D00D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01T20D00D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01U20D00D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange(01V20D00D00B", "GLSL4_5_BUILTINS", 450, 0},
+    {"dFdxFine(00B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdxFine(10B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdxFine(20B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdxFine(30B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdyFine(00B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdyFine(10B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdyFine(20B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdyFine(30B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdxCoarse(00B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdxCoarse(10B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdxCoarse(20B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdxCoarse(30B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdyCoarse(00B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdyCoarse(10B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdyCoarse(20B", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdyCoarse(30B", "GLSL4_5_BUILTINS", 450, 10},
+    {"fwidthFine(00B", "GLSL4_5_BUILTINS", 450, 10},
+    {"fwidthFine(10B", "GLSL4_5_BUILTINS", 450, 10},
+    {"fwidthFine(20B", "GLSL4_5_BUILTINS", 450, 10},
+    {"fwidthFine(30B", "GLSL4_5_BUILTINS", 450, 10},
+    {"fwidthCoarse(00B", "GLSL4_5_BUILTINS", 450, 10},
+    {"fwidthCoarse(10B", "GLSL4_5_BUILTINS", 450, 10},
+    {"fwidthCoarse(20B", "GLSL4_5_BUILTINS", 450, 10},
+    {"fwidthCoarse(30B", "GLSL4_5_BUILTINS", 450, 10},
+    {"textureQueryLevels(00g", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00o", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00t", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00I", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00R", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00X", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00J", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00S", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00Y", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00K", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00T", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00Z", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00h", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00p", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00u", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00L", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00U", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00a", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00k", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00s", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00x", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00m", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00d", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00e", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00i", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00f", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureQueryLevels(00l", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureOffset(00f30B10D", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicAdd(00E00E", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicAdd(00D00D", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicMin(00E00E", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicMin(00D00D", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicMax(00E00E", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicMax(00D00D", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicAnd(00E00E", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicAnd(00D00D", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicOr(00E00E", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicOr(00D00D", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicXor(00E00E", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicXor(00D00D", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicExchange(00E00E", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicExchange(00D00D", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicCompSwap(00E00E00E", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicCompSwap(00D00D00D", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01K", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01L", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01M", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(00y", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(00z", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01A", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01B", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01C", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01D", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01H", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01I", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01J", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01Z", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01a", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01b", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01c", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01d", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01e", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01N", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01O", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01P", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01E", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01F", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01G", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01f", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01g", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01h", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01Q", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01R", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01S", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01T", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01U", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize(01V", "GLSL4_3_BUILTINS", 430, 0},
+    {"memoryBarrierAtomicCounter(", "GLSL4_3_BUILTINS", 430, 0},
+    {"memoryBarrierBuffer(", "GLSL4_3_BUILTINS", 430, 0},
+    {"memoryBarrierImage(", "GLSL4_3_BUILTINS", 430, 0},
+    {"memoryBarrierShared(", "GLSL4_3_BUILTINS", 430, 2},
+    {"groupMemoryBarrier(", "GLSL4_3_BUILTINS", 430, 2},
+    {"packSnorm2x16(10B", "GLSL4_2_BUILTINS", 420, 0},
+    {"packHalf2x16(10B", "GLSL4_2_BUILTINS", 420, 0},
+    {"unpackSnorm2x16(00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"unpackHalf2x16(00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"atomicCounter(00G", "GLSL4_2_BUILTINS", 420, 0},
+    {"atomicCounterIncrement(00G", "GLSL4_2_BUILTINS", 420, 0},
+    {"atomicCounterDecrement(00G", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(00y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(00z10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01A10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01B20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01C20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01D20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01H20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01I20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01J20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01f00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01g00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01h00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01E20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01F20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01G20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01Z20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01a20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01b20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01K00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01L00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01M00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01N10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01O10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01P10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01W10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01X10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01Y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01Q10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01R10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01S10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01T20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01U20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01V20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(00y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(00z10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01A10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01B20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01C20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01D20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01H20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01I20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01J20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01f00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01g00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01h00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01E20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01F20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01G20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01Z20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01a20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01b20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01K00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01L00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01M00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01N10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01O10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01P10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01W10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01X10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01Y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01Q10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01R10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01S10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01T20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01U20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd(01V20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(00y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(00z10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01A10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01B20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01C20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01D20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01H20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01I20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01J20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01f00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01g00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01h00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01E20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01F20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01G20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01Z20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01a20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01b20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01K00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01L00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01M00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01N10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01O10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01P10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01W10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01X10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01Y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01Q10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01R10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01S10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01T20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01U20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01V20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(00y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(00z10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01A10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01B20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01C20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01D20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01H20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01I20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01J20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01f00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01g00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01h00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01E20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01F20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01G20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01Z20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01a20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01b20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01K00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01L00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01M00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01N10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01O10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01P10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01W10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01X10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01Y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01Q10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01R10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01S10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01T20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01U20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin(01V20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(00y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(00z10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01A10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01B20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01C20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01D20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01H20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01I20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01J20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01f00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01g00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01h00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01E20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01F20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01G20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01Z20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01a20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01b20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01K00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01L00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01M00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01N10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01O10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01P10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01W10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01X10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01Y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01Q10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01R10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01S10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01T20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01U20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01V20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(00y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(00z10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01A10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01B20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01C20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01D20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01H20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01I20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01J20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01f00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01g00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01h00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01E20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01F20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01G20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01Z20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01a20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01b20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01K00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01L00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01M00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01N10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01O10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01P10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01W10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01X10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01Y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01Q10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01R10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01S10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01T20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01U20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax(01V20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(00y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(00z10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01A10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01B20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01C20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01D20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01H20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01I20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01J20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01f00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01g00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01h00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01E20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01F20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01G20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01Z20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01a20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01b20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01K00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01L00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01M00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01N10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01O10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01P10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01W10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01X10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01Y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01Q10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01R10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01S10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01T20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01U20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01V20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(00y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(00z10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01A10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01B20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01C20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01D20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01H20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01I20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01J20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01f00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01g00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01h00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01E20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01F20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01G20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01Z20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01a20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01b20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01K00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01L00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01M00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01N10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01O10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01P10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01W10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01X10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01Y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01Q10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01R10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01S10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01T20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01U20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd(01V20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(00y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(00z10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01A10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01B20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01C20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01D20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01H20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01I20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01J20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01f00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01g00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01h00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01E20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01F20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01G20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01Z20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01a20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01b20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01K00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01L00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01M00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01N10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01O10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01P10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01W10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01X10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01Y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01Q10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01R10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01S10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01T20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01U20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01V20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(00y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(00z10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01A10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01B20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01C20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01D20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01H20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01I20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01J20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01f00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01g00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01h00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01E20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01F20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01G20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01Z20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01a20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01b20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01K00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01L00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01M00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01N10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01O10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01P10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01W10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01X10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01Y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01Q10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01R10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01S10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01T20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01U20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr(01V20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(00y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(00z10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01A10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01B20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01C20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01D20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01H20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01I20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01J20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01f00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01g00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01h00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01E20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01F20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01G20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01Z20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01a20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01b20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01K00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01L00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01M00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01N10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01O10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01P10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01W10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01X10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01Y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01Q10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01R10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01S10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01T20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01U20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01V20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(00y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(00z10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01A10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01B20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01C20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01D20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01H20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01I20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01J20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01f00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01g00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01h00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01E20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01F20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01G20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01Z20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01a20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01b20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01K00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01L00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01M00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01N10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01O10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01P10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01W10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01X10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01Y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01Q10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01R10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01S10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01T20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01U20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor(01V20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(00y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(00z10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01A10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01B20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01C20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01D20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01H20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01I20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01J20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01f00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01g00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01h00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01E20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01F20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01G20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01Z20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01a20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01b20D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01K00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01L00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01M00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01N10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01O10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01P10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01W10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01X10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01Y10D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01Q10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01R10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01S10D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01T20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01U20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01V20D00D00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(00y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(00z10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01A10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01B20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01C20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01D20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01H20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01I20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01J20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01f00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01g00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01h00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01E20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01F20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01G20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01Z20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01a20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01b20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01K00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01L00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01M00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01N10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01O10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01P10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01W10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01X10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01Y10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01Q10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01R10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01S10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01T20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01U20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange(01V20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(00y10D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(00z10D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01A10D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01B20D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01C20D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01D20D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01H20D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01I20D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01J20D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01f00D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01g00D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01h00D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01E20D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01F20D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01G20D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01Z20D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01a20D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01b20D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01K00D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01L00D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01M00D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01N10D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01O10D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01P10D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01W10D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01X10D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01Y10D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01Q10D00D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01R10D00D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01S10D00D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01T20D00D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01U20D00D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01V20D00D00E00E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(00y10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(00z10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01A10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01B20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01C20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01D20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01H20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01I20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01J20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01f00D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01g00D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01h00D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01E20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01F20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01G20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01Z20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01a20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01b20D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01K00D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01L00D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01M00D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01N10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01O10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01P10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01W10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01X10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01Y10D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01Q10D00D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01R10D00D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01S10D00D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01T20D00D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01U20D00D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap(01V20D00D00D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(00y10D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(00z10D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01A10D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01B20D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01C20D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01D20D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01H20D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01I20D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01J20D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01f00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01g00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01h00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01E20D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01F20D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01G20D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01Z20D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01a20D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01b20D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01K00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01L00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01M00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01N10D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01O10D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01P10D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01W10D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01X10D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01Y10D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01Q10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01R10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01S10D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01T20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01U20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad(01V20D00D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(00y10D30B", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(00z10D30D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01A10D30E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01B20D30B", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01C20D30D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01D20D30E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01H20D30B", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01I20D30D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01J20D30E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01f00D30B", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01g00D30D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01h00D30E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01E20D30B", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01F20D30D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01G20D30E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01Z20D30B", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01a20D30D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01b20D30E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01K00D30B", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01L00D30D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01M00D30E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01N10D30B", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01O10D30D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01P10D30E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01W10D30B", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01X10D30D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01Y10D30E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01Q10D00D30B", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01R10D00D30D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01S10D00D30E", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01T20D00D30B", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01U20D00D30D", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore(01V20D00D30E", "GLSL4_2_BUILTINS", 420, 0},
+    {"memoryBarrier(", "GLSL4_2_BUILTINS", 420, 0},
+    {"sqrt(00C", "GLSL4_BUILTINS", 400, 0},
+    {"sqrt(10C", "GLSL4_BUILTINS", 400, 0},
+    {"sqrt(20C", "GLSL4_BUILTINS", 400, 0},
+    {"sqrt(30C", "GLSL4_BUILTINS", 400, 0},
+    {"inversesqrt(00C", "GLSL4_BUILTINS", 400, 0},
+    {"inversesqrt(10C", "GLSL4_BUILTINS", 400, 0},
+    {"inversesqrt(20C", "GLSL4_BUILTINS", 400, 0},
+    {"inversesqrt(30C", "GLSL4_BUILTINS", 400, 0},
+    {"abs(00C", "GLSL4_BUILTINS", 400, 0},
+    {"abs(10C", "GLSL4_BUILTINS", 400, 0},
+    {"abs(20C", "GLSL4_BUILTINS", 400, 0},
+    {"abs(30C", "GLSL4_BUILTINS", 400, 0},
+    {"sign(00C", "GLSL4_BUILTINS", 400, 0},
+    {"sign(10C", "GLSL4_BUILTINS", 400, 0},
+    {"sign(20C", "GLSL4_BUILTINS", 400, 0},
+    {"sign(30C", "GLSL4_BUILTINS", 400, 0},
+    {"floor(00C", "GLSL4_BUILTINS", 400, 0},
+    {"floor(10C", "GLSL4_BUILTINS", 400, 0},
+    {"floor(20C", "GLSL4_BUILTINS", 400, 0},
+    {"floor(30C", "GLSL4_BUILTINS", 400, 0},
+    {"trunc(00C", "GLSL4_BUILTINS", 400, 0},
+    {"trunc(10C", "GLSL4_BUILTINS", 400, 0},
+    {"trunc(20C", "GLSL4_BUILTINS", 400, 0},
+    {"trunc(30C", "GLSL4_BUILTINS", 400, 0},
+    {"round(00C", "GLSL4_BUILTINS", 400, 0},
+    {"round(10C", "GLSL4_BUILTINS", 400, 0},
+    {"round(20C", "GLSL4_BUILTINS", 400, 0},
+    {"round(30C", "GLSL4_BUILTINS", 400, 0},
+    {"roundEven(00C", "GLSL4_BUILTINS", 400, 0},
+    {"roundEven(10C", "GLSL4_BUILTINS", 400, 0},
+    {"roundEven(20C", "GLSL4_BUILTINS", 400, 0},
+    {"roundEven(30C", "GLSL4_BUILTINS", 400, 0},
+    {"ceil(00C", "GLSL4_BUILTINS", 400, 0},
+    {"ceil(10C", "GLSL4_BUILTINS", 400, 0},
+    {"ceil(20C", "GLSL4_BUILTINS", 400, 0},
+    {"ceil(30C", "GLSL4_BUILTINS", 400, 0},
+    {"fract(00C", "GLSL4_BUILTINS", 400, 0},
+    {"fract(10C", "GLSL4_BUILTINS", 400, 0},
+    {"fract(20C", "GLSL4_BUILTINS", 400, 0},
+    {"fract(30C", "GLSL4_BUILTINS", 400, 0},
+    {"mod(00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"mod(10C00C", "GLSL4_BUILTINS", 400, 0},
+    {"mod(20C00C", "GLSL4_BUILTINS", 400, 0},
+    {"mod(30C00C", "GLSL4_BUILTINS", 400, 0},
+    {"mod(10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"mod(20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"mod(30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"min(00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"min(10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"min(20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"min(30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"min(10C00C", "GLSL4_BUILTINS", 400, 0},
+    {"min(20C00C", "GLSL4_BUILTINS", 400, 0},
+    {"min(30C00C", "GLSL4_BUILTINS", 400, 0},
+    {"max(00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"max(10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"max(20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"max(30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"max(10C00C", "GLSL4_BUILTINS", 400, 0},
+    {"max(20C00C", "GLSL4_BUILTINS", 400, 0},
+    {"max(30C00C", "GLSL4_BUILTINS", 400, 0},
+    {"clamp(00C00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"clamp(10C00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"clamp(20C00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"clamp(30C00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"clamp(10C10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"clamp(20C20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"clamp(30C30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"mix(00C00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"mix(10C10C00C", "GLSL4_BUILTINS", 400, 0},
+    {"mix(20C20C00C", "GLSL4_BUILTINS", 400, 0},
+    {"mix(30C30C00C", "GLSL4_BUILTINS", 400, 0},
+    {"mix(10C10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"mix(20C20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"mix(30C30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"mix(00C00C00F", "GLSL4_BUILTINS", 400, 0},
+    {"mix(10C10C10F", "GLSL4_BUILTINS", 400, 0},
+    {"mix(20C20C20F", "GLSL4_BUILTINS", 400, 0},
+    {"mix(30C30C30F", "GLSL4_BUILTINS", 400, 0},
+    {"step(00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"step(10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"step(20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"step(30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"step(00C10C", "GLSL4_BUILTINS", 400, 0},
+    {"step(00C20C", "GLSL4_BUILTINS", 400, 0},
+    {"step(00C30C", "GLSL4_BUILTINS", 400, 0},
+    {"smoothstep(00C00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"smoothstep(10C10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"smoothstep(20C20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"smoothstep(30C30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"smoothstep(00C00C10C", "GLSL4_BUILTINS", 400, 0},
+    {"smoothstep(00C00C20C", "GLSL4_BUILTINS", 400, 0},
+    {"smoothstep(00C00C30C", "GLSL4_BUILTINS", 400, 0},
+    {"modf(00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"modf(10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"modf(20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"modf(30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"isnan(00C", "GLSL4_BUILTINS", 400, 0},
+    {"isnan(10C", "GLSL4_BUILTINS", 400, 0},
+    {"isnan(20C", "GLSL4_BUILTINS", 400, 0},
+    {"isnan(30C", "GLSL4_BUILTINS", 400, 0},
+    {"isinf(00C", "GLSL4_BUILTINS", 400, 0},
+    {"isinf(10C", "GLSL4_BUILTINS", 400, 0},
+    {"isinf(20C", "GLSL4_BUILTINS", 400, 0},
+    {"isinf(30C", "GLSL4_BUILTINS", 400, 0},
+    {"fma(00B00B00B", "GLSL4_BUILTINS", 400, 0},
+    {"fma(10B10B10B", "GLSL4_BUILTINS", 400, 0},
+    {"fma(20B20B20B", "GLSL4_BUILTINS", 400, 0},
+    {"fma(30B30B30B", "GLSL4_BUILTINS", 400, 0},
+    {"fma(00C00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"fma(10C10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"fma(20C20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"fma(30C30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"frexp(00B00D", "GLSL4_BUILTINS", 400, 0},
+    {"frexp(10B10D", "GLSL4_BUILTINS", 400, 0},
+    {"frexp(20B20D", "GLSL4_BUILTINS", 400, 0},
+    {"frexp(30B30D", "GLSL4_BUILTINS", 400, 0},
+    {"frexp(00C00D", "GLSL4_BUILTINS", 400, 0},
+    {"frexp(10C10D", "GLSL4_BUILTINS", 400, 0},
+    {"frexp(20C20D", "GLSL4_BUILTINS", 400, 0},
+    {"frexp(30C30D", "GLSL4_BUILTINS", 400, 0},
+    {"ldexp(00B00D", "GLSL4_BUILTINS", 400, 0},
+    {"ldexp(10B10D", "GLSL4_BUILTINS", 400, 0},
+    {"ldexp(20B20D", "GLSL4_BUILTINS", 400, 0},
+    {"ldexp(30B30D", "GLSL4_BUILTINS", 400, 0},
+    {"ldexp(00C00D", "GLSL4_BUILTINS", 400, 0},
+    {"ldexp(10C10D", "GLSL4_BUILTINS", 400, 0},
+    {"ldexp(20C20D", "GLSL4_BUILTINS", 400, 0},
+    {"ldexp(30C30D", "GLSL4_BUILTINS", 400, 0},
+    {"packUnorm2x16(10B", "GLSL4_BUILTINS", 400, 0},
+    {"unpackUnorm2x16(00E", "GLSL4_BUILTINS", 400, 0},
+    {"packUnorm4x8(30B", "GLSL4_BUILTINS", 400, 0},
+    {"packSnorm4x8(30B", "GLSL4_BUILTINS", 400, 0},
+    {"unpackUnorm4x8(00E", "GLSL4_BUILTINS", 400, 0},
+    {"unpackSnorm4x8(00E", "GLSL4_BUILTINS", 400, 0},
+    {"packDouble2x32(10E", "GLSL4_BUILTINS", 400, 0},
+    {"unpackDouble2x32(00C", "GLSL4_BUILTINS", 400, 0},
+    {"length(00C", "GLSL4_BUILTINS", 400, 0},
+    {"length(10C", "GLSL4_BUILTINS", 400, 0},
+    {"length(20C", "GLSL4_BUILTINS", 400, 0},
+    {"length(30C", "GLSL4_BUILTINS", 400, 0},
+    {"distance(00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"distance(10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"distance(20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"distance(30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"dot(00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"dot(10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"dot(20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"dot(30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"cross(20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"normalize(00C", "GLSL4_BUILTINS", 400, 0},
+    {"normalize(10C", "GLSL4_BUILTINS", 400, 0},
+    {"normalize(20C", "GLSL4_BUILTINS", 400, 0},
+    {"normalize(30C", "GLSL4_BUILTINS", 400, 0},
+    {"faceforward(00C00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"faceforward(10C10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"faceforward(20C20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"faceforward(30C30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"reflect(00C00C", "GLSL4_BUILTINS", 400, 0},
+    {"reflect(10C10C", "GLSL4_BUILTINS", 400, 0},
+    {"reflect(20C20C", "GLSL4_BUILTINS", 400, 0},
+    {"reflect(30C30C", "GLSL4_BUILTINS", 400, 0},
+    {"refract(00C00C00B", "GLSL4_BUILTINS", 400, 0},
+    {"refract(10C10C00B", "GLSL4_BUILTINS", 400, 0},
+    {"refract(20C20C00B", "GLSL4_BUILTINS", 400, 0},
+    {"refract(30C30C00B", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldExtract(00D00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldExtract(10D00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldExtract(20D00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldExtract(30D00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldExtract(00E00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldExtract(10E00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldExtract(20E00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldExtract(30E00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldInsert(00D00D00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldInsert(10D10D00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldInsert(20D20D00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldInsert(30D30D00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldInsert(00E00E00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldInsert(10E10E00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldInsert(20E20E00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldInsert(30E30E00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldReverse(00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldReverse(10D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldReverse(20D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldReverse(30D", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldReverse(00E", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldReverse(10E", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldReverse(20E", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldReverse(30E", "GLSL4_BUILTINS", 400, 0},
+    {"bitCount(00D", "GLSL4_BUILTINS", 400, 0},
+    {"bitCount(10D", "GLSL4_BUILTINS", 400, 0},
+    {"bitCount(20D", "GLSL4_BUILTINS", 400, 0},
+    {"bitCount(30D", "GLSL4_BUILTINS", 400, 0},
+    {"bitCount(00E", "GLSL4_BUILTINS", 400, 0},
+    {"bitCount(10E", "GLSL4_BUILTINS", 400, 0},
+    {"bitCount(20E", "GLSL4_BUILTINS", 400, 0},
+    {"bitCount(30E", "GLSL4_BUILTINS", 400, 0},
+    {"findLSB(00D", "GLSL4_BUILTINS", 400, 0},
+    {"findLSB(10D", "GLSL4_BUILTINS", 400, 0},
+    {"findLSB(20D", "GLSL4_BUILTINS", 400, 0},
+    {"findLSB(30D", "GLSL4_BUILTINS", 400, 0},
+    {"findLSB(00E", "GLSL4_BUILTINS", 400, 0},
+    {"findLSB(10E", "GLSL4_BUILTINS", 400, 0},
+    {"findLSB(20E", "GLSL4_BUILTINS", 400, 0},
+    {"findLSB(30E", "GLSL4_BUILTINS", 400, 0},
+    {"findMSB(00D", "GLSL4_BUILTINS", 400, 0},
+    {"findMSB(10D", "GLSL4_BUILTINS", 400, 0},
+    {"findMSB(20D", "GLSL4_BUILTINS", 400, 0},
+    {"findMSB(30D", "GLSL4_BUILTINS", 400, 0},
+    {"findMSB(00E", "GLSL4_BUILTINS", 400, 0},
+    {"findMSB(10E", "GLSL4_BUILTINS", 400, 0},
+    {"findMSB(20E", "GLSL4_BUILTINS", 400, 0},
+    {"findMSB(30E", "GLSL4_BUILTINS", 400, 0},
+    {"uaddCarry(00E00E00E", "GLSL4_BUILTINS", 400, 0},
+    {"uaddCarry(10E10E10E", "GLSL4_BUILTINS", 400, 0},
+    {"uaddCarry(20E20E20E", "GLSL4_BUILTINS", 400, 0},
+    {"uaddCarry(30E30E30E", "GLSL4_BUILTINS", 400, 0},
+    {"usubBorrow(00E00E00E", "GLSL4_BUILTINS", 400, 0},
+    {"usubBorrow(10E10E10E", "GLSL4_BUILTINS", 400, 0},
+    {"usubBorrow(20E20E20E", "GLSL4_BUILTINS", 400, 0},
+    {"usubBorrow(30E30E30E", "GLSL4_BUILTINS", 400, 0},
+    {"umulExtended(00E00E00E00E", "GLSL4_BUILTINS", 400, 0},
+    {"umulExtended(10E10E10E10E", "GLSL4_BUILTINS", 400, 0},
+    {"umulExtended(20E20E20E20E", "GLSL4_BUILTINS", 400, 0},
+    {"umulExtended(30E30E30E30E", "GLSL4_BUILTINS", 400, 0},
+    {"imulExtended(00D00D00D00D", "GLSL4_BUILTINS", 400, 0},
+    {"imulExtended(10D10D10D10D", "GLSL4_BUILTINS", 400, 0},
+    {"imulExtended(20D20D20D20D", "GLSL4_BUILTINS", 400, 0},
+    {"imulExtended(30D30D30D30D", "GLSL4_BUILTINS", 400, 0},
+    {"texture(00l30B00B", "GLSL4_BUILTINS", 400, 0},
+    {"textureLod(00k30B00B", "GLSL4_BUILTINS", 400, 0},
+    {"textureLod(00s30B00B", "GLSL4_BUILTINS", 400, 0},
+    {"textureLod(00x30B00B", "GLSL4_BUILTINS", 400, 0},
+    {"textureSize(00k00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureSize(00s00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureSize(00x00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureSize(00l00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGrad(00k30B20B20B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGrad(00s30B20B20B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGrad(00x30B20B20B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00I10B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00R10B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00X10B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00I10B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00R10B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00X10B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00L20B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00U20B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00a20B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00L20B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00U20B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00a20B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00K20B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00T20B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00Z20B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00K20B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00T20B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00Z20B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00k30B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00s30B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00x30B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00k30B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00s30B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00x30B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00O20B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00q20B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00v20B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00O20B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00q20B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00v20B00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00d10B00B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00f20B00B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00e20B00B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00l30B00B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather(00n10B00B", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00I10B10D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00R10B10D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00X10B10D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00I10B10D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00R10B10D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00X10B10D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00L20B10D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00U20B10D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00a20B10D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00L20B10D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00U20B10D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00a20B10D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00d10B00B10D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00f20B00B10D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00O10B10D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00q10B10D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00v10B10D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00O10B10D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00q10B10D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00v10B10D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset(00n10B00B10D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00I10B70D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00R10B70D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00X10B70D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00I10B70D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00R10B70D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00X10B70D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00L20B70D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00U20B70D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00a20B70D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00L20B70D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00U20B70D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00a20B70D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00O10B70D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00q10B70D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00v10B70D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00O10B70D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00q10B70D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00v10B70D00D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00d10B00B70D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00f20B00B70D", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets(00n10B00B70D", "GLSL4_BUILTINS", 400, 0},
+    {"textureQueryLod(00g00B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00o00B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00t00B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00I10B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00R10B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00X10B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00J20B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00S20B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00Y20B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00K20B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00T20B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00Z20B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00h00B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00p00B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00u00B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00L10B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00U10B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00a10B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00k20B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00s20B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00x20B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00m00B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00d10B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00e20B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00i00B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00f10B", "GLSL4_BUILTINS", 400, 10},
+    {"textureQueryLod(00l20B", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtCentroid(00B", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtCentroid(10B", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtCentroid(20B", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtCentroid(30B", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtSample(00B00D", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtSample(10B00D", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtSample(20B00D", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtSample(30B00D", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtOffset(00B10B", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtOffset(10B10B", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtOffset(20B10B", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtOffset(30B10B", "GLSL4_BUILTINS", 400, 10},
+    {"barrier(", "GLSL4_BUILTINS", 400, 2},
+    {"EmitStreamVertex(00D", "GLSL4_BUILTINS", 400, 25},
+    {"EndStreamPrimitive(00D", "GLSL4_BUILTINS", 400, 25},
+    {"floatBitsToInt(00B", "GLSL3_3_BUILTINS", 330, 0},
+    {"floatBitsToInt(10B", "GLSL3_3_BUILTINS", 330, 0},
+    {"floatBitsToInt(20B", "GLSL3_3_BUILTINS", 330, 0},
+    {"floatBitsToInt(30B", "GLSL3_3_BUILTINS", 330, 0},
+    {"floatBitsToUint(00B", "GLSL3_3_BUILTINS", 330, 0},
+    {"floatBitsToUint(10B", "GLSL3_3_BUILTINS", 330, 0},
+    {"floatBitsToUint(20B", "GLSL3_3_BUILTINS", 330, 0},
+    {"floatBitsToUint(30B", "GLSL3_3_BUILTINS", 330, 0},
+    {"intBitsToFloat(00D", "GLSL3_3_BUILTINS", 330, 0},
+    {"intBitsToFloat(10D", "GLSL3_3_BUILTINS", 330, 0},
+    {"intBitsToFloat(20D", "GLSL3_3_BUILTINS", 330, 0},
+    {"intBitsToFloat(30D", "GLSL3_3_BUILTINS", 330, 0},
+    {"uintBitsToFloat(00E", "GLSL3_3_BUILTINS", 330, 0},
+    {"uintBitsToFloat(10E", "GLSL3_3_BUILTINS", 330, 0},
+    {"uintBitsToFloat(20E", "GLSL3_3_BUILTINS", 330, 0},
+    {"uintBitsToFloat(30E", "GLSL3_3_BUILTINS", 330, 0},
+    {"textureSize(00P", "GLSL1_5_BUILTINS", 150, 0},
+    {"textureSize(00V", "GLSL1_5_BUILTINS", 150, 0},
+    {"textureSize(00b", "GLSL1_5_BUILTINS", 150, 0},
+    {"textureSize(00Q", "GLSL1_5_BUILTINS", 150, 0},
+    {"textureSize(00W", "GLSL1_5_BUILTINS", 150, 0},
+    {"textureSize(00c", "GLSL1_5_BUILTINS", 150, 0},
+    {"texelFetch(00P10D00D", "GLSL1_5_BUILTINS", 150, 0},
+    {"texelFetch(00V10D00D", "GLSL1_5_BUILTINS", 150, 0},
+    {"texelFetch(00b10D00D", "GLSL1_5_BUILTINS", 150, 0},
+    {"texelFetch(00Q20D00D", "GLSL1_5_BUILTINS", 150, 0},
+    {"texelFetch(00W20D00D", "GLSL1_5_BUILTINS", 150, 0},
+    {"texelFetch(00c20D00D", "GLSL1_5_BUILTINS", 150, 0},
+    {"EmitVertex(", "GLSL1_5_BUILTINS", 150, 25},
+    {"EndPrimitive(", "GLSL1_5_BUILTINS", 150, 25},
+    {"inverse(50B", "GLSL1_4_BUILTINS", 140, 0},
+    {"inverse(A0B", "GLSL1_4_BUILTINS", 140, 0},
+    {"inverse(F0B", "GLSL1_4_BUILTINS", 140, 0},
+    {"texture(00O10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"texture(00q10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"texture(00v10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"texture(00n20B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProj(00O20B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProj(00q20B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProj(00v20B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProj(00O30B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProj(00q30B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProj(00v30B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProj(00n30B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureSize(00O", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureSize(00q", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureSize(00v", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureSize(00n", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureSize(00j", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureSize(00r", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureSize(00w", "GLSL1_4_BUILTINS", 140, 0},
+    {"texelFetch(00O10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"texelFetch(00q10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"texelFetch(00v10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"texelFetch(00j00D", "GLSL1_4_BUILTINS", 140, 0},
+    {"texelFetch(00r00D", "GLSL1_4_BUILTINS", 140, 0},
+    {"texelFetch(00w00D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureGrad(00O10B10B10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureGrad(00q10B10B10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureGrad(00v10B10B10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureGrad(00n20B10B10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGrad(00O20B10B10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGrad(00q20B10B10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGrad(00v20B10B10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGrad(00O30B10B10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGrad(00q30B10B10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGrad(00v30B10B10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGrad(00n30B10B10B", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureOffset(00O10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureOffset(00q10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureOffset(00v10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureOffset(00n20B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjOffset(00O20B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjOffset(00q20B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjOffset(00v20B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjOffset(00O30B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjOffset(00q30B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjOffset(00v30B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjOffset(00n30B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"texelFetchOffset(00O10D10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"texelFetchOffset(00q10D10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"texelFetchOffset(00v10D10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureGradOffset(00O10B10B10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureGradOffset(00q10B10B10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureGradOffset(00v10B10B10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureGradOffset(00n20B10B10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGradOffset(00O20B10B10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGradOffset(00q20B10B10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGradOffset(00v20B10B10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGradOffset(00O30B10B10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGradOffset(00q30B10B10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGradOffset(00v30B10B10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGradOffset(00n30B10B10B10D", "GLSL1_4_BUILTINS", 140, 0},
+    {"sinh(00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"sinh(10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"sinh(20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"sinh(30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"cosh(00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"cosh(10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"cosh(20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"cosh(30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"tanh(00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"tanh(10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"tanh(20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"tanh(30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"asinh(00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"asinh(10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"asinh(20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"asinh(30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"acosh(00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"acosh(10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"acosh(20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"acosh(30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"atanh(00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"atanh(10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"atanh(20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"atanh(30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"abs(00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"abs(10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"abs(20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"abs(30D", "GLSL1_3_BUILTINS", 130, 0},
+    {"sign(00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"sign(10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"sign(20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"sign(30D", "GLSL1_3_BUILTINS", 130, 0},
+    {"trunc(00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"trunc(10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"trunc(20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"trunc(30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"round(00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"round(10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"round(20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"round(30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"roundEven(00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"roundEven(10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"roundEven(20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"roundEven(30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(10D10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(20D20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(30D30D", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(10D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(20D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(30D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(00E00E", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(10E10E", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(20E20E", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(30E30E", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(10E00E", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(20E00E", "GLSL1_3_BUILTINS", 130, 0},
+    {"min(30E00E", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(10D10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(20D20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(30D30D", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(10D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(20D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(30D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(00E00E", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(10E10E", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(20E20E", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(30E30E", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(10E00E", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(20E00E", "GLSL1_3_BUILTINS", 130, 0},
+    {"max(30E00E", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(00D00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(10D00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(20D00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(30D00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(10D10D10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(20D20D20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(30D30D30D", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(00E00E00E", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(10E00E00E", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(20E00E00E", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(30E00E00E", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(10E10E10E", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(20E20E20E", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp(30E30E30E", "GLSL1_3_BUILTINS", 130, 0},
+    {"mix(00B00B00F", "GLSL1_3_BUILTINS", 130, 0},
+    {"mix(10B10B10F", "GLSL1_3_BUILTINS", 130, 0},
+    {"mix(20B20B20F", "GLSL1_3_BUILTINS", 130, 0},
+    {"mix(30B30B30F", "GLSL1_3_BUILTINS", 130, 0},
+    {"modf(00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"modf(10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"modf(20B20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"modf(30B30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"isnan(00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"isnan(10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"isnan(20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"isnan(30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"isinf(00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"isinf(10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"isinf(20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"isinf(30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"lessThan(10E10E", "GLSL1_3_BUILTINS", 130, 0},
+    {"lessThan(20E20E", "GLSL1_3_BUILTINS", 130, 0},
+    {"lessThan(30E30E", "GLSL1_3_BUILTINS", 130, 0},
+    {"lessThanEqual(10E10E", "GLSL1_3_BUILTINS", 130, 0},
+    {"lessThanEqual(20E20E", "GLSL1_3_BUILTINS", 130, 0},
+    {"lessThanEqual(30E30E", "GLSL1_3_BUILTINS", 130, 0},
+    {"greaterThan(10E10E", "GLSL1_3_BUILTINS", 130, 0},
+    {"greaterThan(20E20E", "GLSL1_3_BUILTINS", 130, 0},
+    {"greaterThan(30E30E", "GLSL1_3_BUILTINS", 130, 0},
+    {"greaterThanEqual(10E10E", "GLSL1_3_BUILTINS", 130, 0},
+    {"greaterThanEqual(20E20E", "GLSL1_3_BUILTINS", 130, 0},
+    {"greaterThanEqual(30E30E", "GLSL1_3_BUILTINS", 130, 0},
+    {"equal(10E10E", "GLSL1_3_BUILTINS", 130, 0},
+    {"equal(20E20E", "GLSL1_3_BUILTINS", 130, 0},
+    {"equal(30E30E", "GLSL1_3_BUILTINS", 130, 0},
+    {"notEqual(10E10E", "GLSL1_3_BUILTINS", 130, 0},
+    {"notEqual(20E20E", "GLSL1_3_BUILTINS", 130, 0},
+    {"notEqual(30E30E", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00I10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00R10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00X10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00J20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00S20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00Y20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00K20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00T20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00Z20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00L20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00U20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00a20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00d20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00e30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00f30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00g00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00o00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00t00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00m20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00h20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00p20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00u20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00i20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00I20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00R20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00X20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00I30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00R30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00X30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00J30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00S30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00Y30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00d30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00g10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00o10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00t10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00g30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00o30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00t30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj(00m30B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00I10B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00R10B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00X10B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00J20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00S20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00Y20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00K20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00T20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00Z20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00L20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00U20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00a20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00d20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00g00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00o00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00t00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00m20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00h10B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00p10B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00u10B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod(00i20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00I00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00R00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00X00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00J00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00S00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00Y00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00K00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00T00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00Z00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00L00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00U00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00a00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00d00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00e00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00f00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00g00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00o00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00t00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00m00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00h00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00p00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00u00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize(00i00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00I20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00R20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00X20B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00I30B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00R30B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00X30B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00J30B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00S30B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00Y30B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00d30B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00g10B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00o10B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00t10B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00g30B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00o30B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00t30B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod(00m30B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00I10D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00R10D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00X10D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00J20D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00S20D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00Y20D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00L20D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00U20D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00a20D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00g00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00o00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00t00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00h10D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00p10D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch(00u10D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00I10B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00R10B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00X10B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00J20B20B20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00S20B20B20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00Y20B20B20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00K20B20B20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00T20B20B20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00Z20B20B20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00I00B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00R00B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00X00B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00d20B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00e30B20B20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00L20B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00U20B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00a20B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00f30B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00m20B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00h10B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00p10B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00u10B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad(00i20B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00I20B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00R20B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00X20B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00I30B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00R30B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00X30B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00J30B20B20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00S30B20B20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00Y30B20B20B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00d30B10B10B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00g10B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00o10B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00t10B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00g30B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00o30B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00t30B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad(00m30B00B00B", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00I10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00R10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00X10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00J20B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00S20B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00Y20B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00d20B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00L20B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00U20B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00a20B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00g00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00o00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00t00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00m20B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00h10B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00p10B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00u10B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset(00i20B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00I20B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00R20B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00X20B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00I30B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00R30B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00X30B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00J30B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00S30B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00Y30B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00d30B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00g10B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00o10B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00t10B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00g30B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00o30B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00t30B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset(00m30B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00I10B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00R10B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00X10B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00J20B00B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00S20B00B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00Y20B00B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00d20B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00L20B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00U20B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00a20B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00g00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00o00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00t00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00m20B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00h10B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00p10B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00u10B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset(00i20B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00I20B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00R20B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00X20B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00I30B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00R30B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00X30B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00J30B00B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00S30B00B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00Y30B00B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00d30B00B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00g10B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00o10B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00t10B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00g30B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00o30B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00t30B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset(00m30B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00I10D00D10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00R10D00D10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00X10D00D10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00J20D00D20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00S20D00D20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00Y20D00D20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00L20D00D10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00U20D00D10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00a20D00D10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00g00D00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00o00D00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00t00D00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00h10D00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00p10D00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset(00u10D00D00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00I10B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00R10B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00X10B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00J20B20B20B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00S20B20B20B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00Y20B20B20B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00d20B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00L20B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00U20B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00a20B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00f30B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00g00B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00o00B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00t00B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00m20B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00h10B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00p10B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00u10B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset(00i20B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00I20B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00R20B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00X20B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00I30B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00R30B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00X30B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00J30B20B20B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00S30B20B20B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00Y30B20B20B20D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00d30B10B10B10D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00g10B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00o10B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00t10B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00g30B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00o30B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00t30B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset(00m30B00B00B00D", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture(00I10B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00R10B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00X10B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00J20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00S20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00Y20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00K20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00T20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00Z20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00L20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00U20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00a20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00I20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00R20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00X20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00I30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00R30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00X30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00J30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00S30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00Y30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00d20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00e30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00d30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00g00B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00o00B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00t00B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00m20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00h20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00p20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00u20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00i20B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"texture(00f30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00g10B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00o10B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00t10B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00g30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00o30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00t30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProj(00m30B00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00I10B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00R10B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00X10B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00J20B20D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00S20B20D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00Y20B20D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00d20B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00L20B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00U20B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00a20B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00g00B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00o00B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00t00B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00m20B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00h10B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00p10B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00u10B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureOffset(00i20B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00I20B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00R20B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00X20B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00I30B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00R30B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00X30B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00J30B20D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00S30B20D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00Y30B20D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00d30B10D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00g10B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00o10B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00t10B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00g30B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00o30B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00t30B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"textureProjOffset(00m30B00D00B", "GLSL1_3_BUILTINS", 130, 10},
+    {"outerProduct(10B10B", "GLSL1_2_BUILTINS", 120, 0},
+    {"outerProduct(20B20B", "GLSL1_2_BUILTINS", 120, 0},
+    {"outerProduct(30B30B", "GLSL1_2_BUILTINS", 120, 0},
+    {"outerProduct(20B10B", "GLSL1_2_BUILTINS", 120, 0},
+    {"outerProduct(10B20B", "GLSL1_2_BUILTINS", 120, 0},
+    {"outerProduct(30B10B", "GLSL1_2_BUILTINS", 120, 0},
+    {"outerProduct(10B30B", "GLSL1_2_BUILTINS", 120, 0},
+    {"outerProduct(30B20B", "GLSL1_2_BUILTINS", 120, 0},
+    {"outerProduct(20B30B", "GLSL1_2_BUILTINS", 120, 0},
+    {"transpose(50B", "GLSL1_2_BUILTINS", 120, 0},
+    {"transpose(A0B", "GLSL1_2_BUILTINS", 120, 0},
+    {"transpose(F0B", "GLSL1_2_BUILTINS", 120, 0},
+    {"transpose(60B", "GLSL1_2_BUILTINS", 120, 0},
+    {"transpose(90B", "GLSL1_2_BUILTINS", 120, 0},
+    {"transpose(70B", "GLSL1_2_BUILTINS", 120, 0},
+    {"transpose(D0B", "GLSL1_2_BUILTINS", 120, 0},
+    {"transpose(B0B", "GLSL1_2_BUILTINS", 120, 0},
+    {"transpose(E0B", "GLSL1_2_BUILTINS", 120, 0},
+    {"radians(00B", "COMMON_BUILTINS", 110, 0},
+    {"radians(10B", "COMMON_BUILTINS", 110, 0},
+    {"radians(20B", "COMMON_BUILTINS", 110, 0},
+    {"radians(30B", "COMMON_BUILTINS", 110, 0},
+    {"degrees(00B", "COMMON_BUILTINS", 110, 0},
+    {"degrees(10B", "COMMON_BUILTINS", 110, 0},
+    {"degrees(20B", "COMMON_BUILTINS", 110, 0},
+    {"degrees(30B", "COMMON_BUILTINS", 110, 0},
+    {"sin(00B", "COMMON_BUILTINS", 110, 0},
+    {"sin(10B", "COMMON_BUILTINS", 110, 0},
+    {"sin(20B", "COMMON_BUILTINS", 110, 0},
+    {"sin(30B", "COMMON_BUILTINS", 110, 0},
+    {"cos(00B", "COMMON_BUILTINS", 110, 0},
+    {"cos(10B", "COMMON_BUILTINS", 110, 0},
+    {"cos(20B", "COMMON_BUILTINS", 110, 0},
+    {"cos(30B", "COMMON_BUILTINS", 110, 0},
+    {"tan(00B", "COMMON_BUILTINS", 110, 0},
+    {"tan(10B", "COMMON_BUILTINS", 110, 0},
+    {"tan(20B", "COMMON_BUILTINS", 110, 0},
+    {"tan(30B", "COMMON_BUILTINS", 110, 0},
+    {"asin(00B", "COMMON_BUILTINS", 110, 0},
+    {"asin(10B", "COMMON_BUILTINS", 110, 0},
+    {"asin(20B", "COMMON_BUILTINS", 110, 0},
+    {"asin(30B", "COMMON_BUILTINS", 110, 0},
+    {"acos(00B", "COMMON_BUILTINS", 110, 0},
+    {"acos(10B", "COMMON_BUILTINS", 110, 0},
+    {"acos(20B", "COMMON_BUILTINS", 110, 0},
+    {"acos(30B", "COMMON_BUILTINS", 110, 0},
+    {"atan(00B00B", "COMMON_BUILTINS", 110, 0},
+    {"atan(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"atan(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"atan(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"atan(00B", "COMMON_BUILTINS", 110, 0},
+    {"atan(10B", "COMMON_BUILTINS", 110, 0},
+    {"atan(20B", "COMMON_BUILTINS", 110, 0},
+    {"atan(30B", "COMMON_BUILTINS", 110, 0},
+    {"pow(00B00B", "COMMON_BUILTINS", 110, 0},
+    {"pow(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"pow(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"pow(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"exp(00B", "COMMON_BUILTINS", 110, 0},
+    {"exp(10B", "COMMON_BUILTINS", 110, 0},
+    {"exp(20B", "COMMON_BUILTINS", 110, 0},
+    {"exp(30B", "COMMON_BUILTINS", 110, 0},
+    {"log(00B", "COMMON_BUILTINS", 110, 0},
+    {"log(10B", "COMMON_BUILTINS", 110, 0},
+    {"log(20B", "COMMON_BUILTINS", 110, 0},
+    {"log(30B", "COMMON_BUILTINS", 110, 0},
+    {"exp2(00B", "COMMON_BUILTINS", 110, 0},
+    {"exp2(10B", "COMMON_BUILTINS", 110, 0},
+    {"exp2(20B", "COMMON_BUILTINS", 110, 0},
+    {"exp2(30B", "COMMON_BUILTINS", 110, 0},
+    {"log2(00B", "COMMON_BUILTINS", 110, 0},
+    {"log2(10B", "COMMON_BUILTINS", 110, 0},
+    {"log2(20B", "COMMON_BUILTINS", 110, 0},
+    {"log2(30B", "COMMON_BUILTINS", 110, 0},
+    {"sqrt(00B", "COMMON_BUILTINS", 110, 0},
+    {"sqrt(10B", "COMMON_BUILTINS", 110, 0},
+    {"sqrt(20B", "COMMON_BUILTINS", 110, 0},
+    {"sqrt(30B", "COMMON_BUILTINS", 110, 0},
+    {"inversesqrt(00B", "COMMON_BUILTINS", 110, 0},
+    {"inversesqrt(10B", "COMMON_BUILTINS", 110, 0},
+    {"inversesqrt(20B", "COMMON_BUILTINS", 110, 0},
+    {"inversesqrt(30B", "COMMON_BUILTINS", 110, 0},
+    {"abs(00B", "COMMON_BUILTINS", 110, 0},
+    {"abs(10B", "COMMON_BUILTINS", 110, 0},
+    {"abs(20B", "COMMON_BUILTINS", 110, 0},
+    {"abs(30B", "COMMON_BUILTINS", 110, 0},
+    {"sign(00B", "COMMON_BUILTINS", 110, 0},
+    {"sign(10B", "COMMON_BUILTINS", 110, 0},
+    {"sign(20B", "COMMON_BUILTINS", 110, 0},
+    {"sign(30B", "COMMON_BUILTINS", 110, 0},
+    {"floor(00B", "COMMON_BUILTINS", 110, 0},
+    {"floor(10B", "COMMON_BUILTINS", 110, 0},
+    {"floor(20B", "COMMON_BUILTINS", 110, 0},
+    {"floor(30B", "COMMON_BUILTINS", 110, 0},
+    {"ceil(00B", "COMMON_BUILTINS", 110, 0},
+    {"ceil(10B", "COMMON_BUILTINS", 110, 0},
+    {"ceil(20B", "COMMON_BUILTINS", 110, 0},
+    {"ceil(30B", "COMMON_BUILTINS", 110, 0},
+    {"fract(00B", "COMMON_BUILTINS", 110, 0},
+    {"fract(10B", "COMMON_BUILTINS", 110, 0},
+    {"fract(20B", "COMMON_BUILTINS", 110, 0},
+    {"fract(30B", "COMMON_BUILTINS", 110, 0},
+    {"mod(00B00B", "COMMON_BUILTINS", 110, 0},
+    {"mod(10B00B", "COMMON_BUILTINS", 110, 0},
+    {"mod(20B00B", "COMMON_BUILTINS", 110, 0},
+    {"mod(30B00B", "COMMON_BUILTINS", 110, 0},
+    {"mod(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"mod(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"mod(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"min(00B00B", "COMMON_BUILTINS", 110, 0},
+    {"min(10B00B", "COMMON_BUILTINS", 110, 0},
+    {"min(20B00B", "COMMON_BUILTINS", 110, 0},
+    {"min(30B00B", "COMMON_BUILTINS", 110, 0},
+    {"min(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"min(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"min(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"max(00B00B", "COMMON_BUILTINS", 110, 0},
+    {"max(10B00B", "COMMON_BUILTINS", 110, 0},
+    {"max(20B00B", "COMMON_BUILTINS", 110, 0},
+    {"max(30B00B", "COMMON_BUILTINS", 110, 0},
+    {"max(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"max(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"max(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"clamp(00B00B00B", "COMMON_BUILTINS", 110, 0},
+    {"clamp(10B00B00B", "COMMON_BUILTINS", 110, 0},
+    {"clamp(20B00B00B", "COMMON_BUILTINS", 110, 0},
+    {"clamp(30B00B00B", "COMMON_BUILTINS", 110, 0},
+    {"clamp(10B10B10B", "COMMON_BUILTINS", 110, 0},
+    {"clamp(20B20B20B", "COMMON_BUILTINS", 110, 0},
+    {"clamp(30B30B30B", "COMMON_BUILTINS", 110, 0},
+    {"mix(00B00B00B", "COMMON_BUILTINS", 110, 0},
+    {"mix(10B10B00B", "COMMON_BUILTINS", 110, 0},
+    {"mix(20B20B00B", "COMMON_BUILTINS", 110, 0},
+    {"mix(30B30B00B", "COMMON_BUILTINS", 110, 0},
+    {"mix(10B10B10B", "COMMON_BUILTINS", 110, 0},
+    {"mix(20B20B20B", "COMMON_BUILTINS", 110, 0},
+    {"mix(30B30B30B", "COMMON_BUILTINS", 110, 0},
+    {"step(00B00B", "COMMON_BUILTINS", 110, 0},
+    {"step(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"step(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"step(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"step(00B10B", "COMMON_BUILTINS", 110, 0},
+    {"step(00B20B", "COMMON_BUILTINS", 110, 0},
+    {"step(00B30B", "COMMON_BUILTINS", 110, 0},
+    {"smoothstep(00B00B00B", "COMMON_BUILTINS", 110, 0},
+    {"smoothstep(10B10B10B", "COMMON_BUILTINS", 110, 0},
+    {"smoothstep(20B20B20B", "COMMON_BUILTINS", 110, 0},
+    {"smoothstep(30B30B30B", "COMMON_BUILTINS", 110, 0},
+    {"smoothstep(00B00B10B", "COMMON_BUILTINS", 110, 0},
+    {"smoothstep(00B00B20B", "COMMON_BUILTINS", 110, 0},
+    {"smoothstep(00B00B30B", "COMMON_BUILTINS", 110, 0},
+    {"length(00B", "COMMON_BUILTINS", 110, 0},
+    {"length(10B", "COMMON_BUILTINS", 110, 0},
+    {"length(20B", "COMMON_BUILTINS", 110, 0},
+    {"length(30B", "COMMON_BUILTINS", 110, 0},
+    {"distance(00B00B", "COMMON_BUILTINS", 110, 0},
+    {"distance(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"distance(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"distance(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"dot(00B00B", "COMMON_BUILTINS", 110, 0},
+    {"dot(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"dot(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"dot(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"cross(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"normalize(00B", "COMMON_BUILTINS", 110, 0},
+    {"normalize(10B", "COMMON_BUILTINS", 110, 0},
+    {"normalize(20B", "COMMON_BUILTINS", 110, 0},
+    {"normalize(30B", "COMMON_BUILTINS", 110, 0},
+    {"faceforward(00B00B00B", "COMMON_BUILTINS", 110, 0},
+    {"faceforward(10B10B10B", "COMMON_BUILTINS", 110, 0},
+    {"faceforward(20B20B20B", "COMMON_BUILTINS", 110, 0},
+    {"faceforward(30B30B30B", "COMMON_BUILTINS", 110, 0},
+    {"reflect(00B00B", "COMMON_BUILTINS", 110, 0},
+    {"reflect(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"reflect(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"reflect(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"refract(00B00B00B", "COMMON_BUILTINS", 110, 0},
+    {"refract(10B10B00B", "COMMON_BUILTINS", 110, 0},
+    {"refract(20B20B00B", "COMMON_BUILTINS", 110, 0},
+    {"refract(30B30B00B", "COMMON_BUILTINS", 110, 0},
+    {"matrixCompMult(50B50B", "COMMON_BUILTINS", 110, 0},
+    {"matrixCompMult(A0BA0B", "COMMON_BUILTINS", 110, 0},
+    {"matrixCompMult(F0BF0B", "COMMON_BUILTINS", 110, 0},
+    {"lessThan(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"lessThan(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"lessThan(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"lessThan(10D10D", "COMMON_BUILTINS", 110, 0},
+    {"lessThan(20D20D", "COMMON_BUILTINS", 110, 0},
+    {"lessThan(30D30D", "COMMON_BUILTINS", 110, 0},
+    {"lessThanEqual(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"lessThanEqual(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"lessThanEqual(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"lessThanEqual(10D10D", "COMMON_BUILTINS", 110, 0},
+    {"lessThanEqual(20D20D", "COMMON_BUILTINS", 110, 0},
+    {"lessThanEqual(30D30D", "COMMON_BUILTINS", 110, 0},
+    {"greaterThan(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"greaterThan(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"greaterThan(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"greaterThan(10D10D", "COMMON_BUILTINS", 110, 0},
+    {"greaterThan(20D20D", "COMMON_BUILTINS", 110, 0},
+    {"greaterThan(30D30D", "COMMON_BUILTINS", 110, 0},
+    {"greaterThanEqual(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"greaterThanEqual(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"greaterThanEqual(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"greaterThanEqual(10D10D", "COMMON_BUILTINS", 110, 0},
+    {"greaterThanEqual(20D20D", "COMMON_BUILTINS", 110, 0},
+    {"greaterThanEqual(30D30D", "COMMON_BUILTINS", 110, 0},
+    {"equal(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"equal(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"equal(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"equal(10D10D", "COMMON_BUILTINS", 110, 0},
+    {"equal(20D20D", "COMMON_BUILTINS", 110, 0},
+    {"equal(30D30D", "COMMON_BUILTINS", 110, 0},
+    {"equal(10F10F", "COMMON_BUILTINS", 110, 0},
+    {"equal(20F20F", "COMMON_BUILTINS", 110, 0},
+    {"equal(30F30F", "COMMON_BUILTINS", 110, 0},
+    {"notEqual(10B10B", "COMMON_BUILTINS", 110, 0},
+    {"notEqual(20B20B", "COMMON_BUILTINS", 110, 0},
+    {"notEqual(30B30B", "COMMON_BUILTINS", 110, 0},
+    {"notEqual(10D10D", "COMMON_BUILTINS", 110, 0},
+    {"notEqual(20D20D", "COMMON_BUILTINS", 110, 0},
+    {"notEqual(30D30D", "COMMON_BUILTINS", 110, 0},
+    {"notEqual(10F10F", "COMMON_BUILTINS", 110, 0},
+    {"notEqual(20F20F", "COMMON_BUILTINS", 110, 0},
+    {"notEqual(30F30F", "COMMON_BUILTINS", 110, 0},
+    {"any(10F", "COMMON_BUILTINS", 110, 0},
+    {"any(20F", "COMMON_BUILTINS", 110, 0},
+    {"any(30F", "COMMON_BUILTINS", 110, 0},
+    {"all(10F", "COMMON_BUILTINS", 110, 0},
+    {"all(20F", "COMMON_BUILTINS", 110, 0},
+    {"all(30F", "COMMON_BUILTINS", 110, 0},
+    {"not(10F", "COMMON_BUILTINS", 110, 0},
+    {"not(20F", "COMMON_BUILTINS", 110, 0},
+    {"not(30F", "COMMON_BUILTINS", 110, 0},
+    {"texture2D(00I10B", "COMMON_BUILTINS", 110, 0},
+    {"texture2DProj(00I20B", "COMMON_BUILTINS", 110, 0},
+    {"texture2DProj(00I30B", "COMMON_BUILTINS", 110, 0},
+    {"textureCube(00K20B", "COMMON_BUILTINS", 110, 0},
+    {"texture1D(00g00B", "COMMON_BUILTINS", 110, 0},
+    {"texture1DProj(00g10B", "COMMON_BUILTINS", 110, 0},
+    {"texture1DProj(00g30B", "COMMON_BUILTINS", 110, 0},
+    {"texture3D(00J20B", "COMMON_BUILTINS", 110, 0},
+    {"texture3DProj(00J30B", "COMMON_BUILTINS", 110, 0},
+    {"shadow1D(00m20B", "COMMON_BUILTINS", 110, 0},
+    {"shadow1DProj(00m30B", "COMMON_BUILTINS", 110, 0},
+    {"shadow2D(00d20B", "COMMON_BUILTINS", 110, 0},
+    {"shadow2DProj(00d30B", "COMMON_BUILTINS", 110, 0},
+    {"noise1(00B", "COMMON_BUILTINS", 110, 0},
+    {"noise1(10B", "COMMON_BUILTINS", 110, 0},
+    {"noise1(20B", "COMMON_BUILTINS", 110, 0},
+    {"noise1(30B", "COMMON_BUILTINS", 110, 0},
+    {"noise2(00B", "COMMON_BUILTINS", 110, 0},
+    {"noise2(10B", "COMMON_BUILTINS", 110, 0},
+    {"noise2(20B", "COMMON_BUILTINS", 110, 0},
+    {"noise2(30B", "COMMON_BUILTINS", 110, 0},
+    {"noise3(00B", "COMMON_BUILTINS", 110, 0},
+    {"noise3(10B", "COMMON_BUILTINS", 110, 0},
+    {"noise3(20B", "COMMON_BUILTINS", 110, 0},
+    {"noise3(30B", "COMMON_BUILTINS", 110, 0},
+    {"noise4(00B", "COMMON_BUILTINS", 110, 0},
+    {"noise4(10B", "COMMON_BUILTINS", 110, 0},
+    {"noise4(20B", "COMMON_BUILTINS", 110, 0},
+    {"noise4(30B", "COMMON_BUILTINS", 110, 0},
+    {"gl_DepthRangeParameters", "COMMON_BUILTINS", 110, 0},
+    {"gl_DepthRange", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxVertexAttribs", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxVertexUniformVectors", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxVertexTextureImageUnits", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxCombinedTextureImageUnits", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxTextureImageUnits", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxFragmentUniformVectors", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxVaryingVectors", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxDrawBuffers", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxDualSourceDrawBuffersEXT", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxVertexOutputVectors", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxFragmentInputVectors", "COMMON_BUILTINS", 110, 0},
+    {"gl_MinProgramTexelOffset", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxProgramTexelOffset", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxImageUnits", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxVertexImageUniforms", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxFragmentImageUniforms", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxComputeImageUniforms", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxCombinedImageUniforms", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxCombinedShaderOutputResources", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxComputeWorkGroupCount", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxComputeWorkGroupSize", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxComputeUniformComponents", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxComputeTextureImageUnits", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxComputeAtomicCounters", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxComputeAtomicCounterBuffers", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxVertexAtomicCounters", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxFragmentAtomicCounters", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxCombinedAtomicCounters", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxAtomicCounterBindings", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxVertexAtomicCounterBuffers", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxFragmentAtomicCounterBuffers", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxCombinedAtomicCounterBuffers", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxAtomicCounterBufferSize", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxGeometryInputComponents", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxGeometryOutputComponents", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxGeometryImageUniforms", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxGeometryTextureImageUnits", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxGeometryOutputVertices", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxGeometryTotalOutputComponents", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxGeometryUniformComponents", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxGeometryAtomicCounters", "COMMON_BUILTINS", 110, 0},
+    {"gl_MaxGeometryAtomicCounterBuffers", "COMMON_BUILTINS", 110, 0},
+    {"gl_FragData", "COMMON_BUILTINS", 110, 0},
+    {"gl_SecondaryFragDataEXT", "COMMON_BUILTINS", 110, 0},
+    {"gl_FragDepthEXT", "COMMON_BUILTINS", 110, 0},
+    {"gl_in", "COMMON_BUILTINS", 110, 0},
+    {"ftransform(", "COMMON_BUILTINS", 110, 13},
+    {"texture2DLod(00I10B00B", "COMMON_BUILTINS", 110, 13},
+    {"texture2DProjLod(00I20B00B", "COMMON_BUILTINS", 110, 13},
+    {"texture2DProjLod(00I30B00B", "COMMON_BUILTINS", 110, 13},
+    {"textureCubeLod(00K20B00B", "COMMON_BUILTINS", 110, 13},
+    {"texture1DLod(00g00B00B", "COMMON_BUILTINS", 110, 13},
+    {"texture1DProjLod(00g10B00B", "COMMON_BUILTINS", 110, 13},
+    {"texture1DProjLod(00g30B00B", "COMMON_BUILTINS", 110, 13},
+    {"shadow1DLod(00m20B00B", "COMMON_BUILTINS", 110, 13},
+    {"shadow1DProjLod(00m30B00B", "COMMON_BUILTINS", 110, 13},
+    {"shadow2DLod(00d20B00B", "COMMON_BUILTINS", 110, 13},
+    {"shadow2DProjLod(00d30B00B", "COMMON_BUILTINS", 110, 13},
+    {"gl_Position", "COMMON_BUILTINS", 110, 13},
+    {"gl_PointSize", "COMMON_BUILTINS", 110, 13},
+    {"gl_InstanceID", "COMMON_BUILTINS", 110, 13},
+    {"gl_VertexID", "COMMON_BUILTINS", 110, 13},
+    {"texture2D(00I10B00B", "COMMON_BUILTINS", 110, 10},
+    {"texture2DProj(00I20B00B", "COMMON_BUILTINS", 110, 10},
+    {"texture2DProj(00I30B00B", "COMMON_BUILTINS", 110, 10},
+    {"textureCube(00K20B00B", "COMMON_BUILTINS", 110, 10},
+    {"texture3D(00J20B00B", "COMMON_BUILTINS", 110, 10},
+    {"texture3DProj(00J30B00B", "COMMON_BUILTINS", 110, 10},
+    {"texture3DLod(00J20B00B", "COMMON_BUILTINS", 110, 10},
+    {"texture3DProjLod(00J30B00B", "COMMON_BUILTINS", 110, 10},
+    {"texture1D(00g00B00B", "COMMON_BUILTINS", 110, 10},
+    {"texture1DProj(00g10B00B", "COMMON_BUILTINS", 110, 10},
+    {"texture1DProj(00g30B00B", "COMMON_BUILTINS", 110, 10},
+    {"shadow1D(00m20B00B", "COMMON_BUILTINS", 110, 10},
+    {"shadow1DProj(00m30B00B", "COMMON_BUILTINS", 110, 10},
+    {"shadow2D(00d20B00B", "COMMON_BUILTINS", 110, 10},
+    {"shadow2DProj(00d30B00B", "COMMON_BUILTINS", 110, 10},
+    {"dFdx(00B", "COMMON_BUILTINS", 110, 10},
+    {"dFdx(10B", "COMMON_BUILTINS", 110, 10},
+    {"dFdx(20B", "COMMON_BUILTINS", 110, 10},
+    {"dFdx(30B", "COMMON_BUILTINS", 110, 10},
+    {"dFdy(00B", "COMMON_BUILTINS", 110, 10},
+    {"dFdy(10B", "COMMON_BUILTINS", 110, 10},
+    {"dFdy(20B", "COMMON_BUILTINS", 110, 10},
+    {"dFdy(30B", "COMMON_BUILTINS", 110, 10},
+    {"fwidth(00B", "COMMON_BUILTINS", 110, 10},
+    {"fwidth(10B", "COMMON_BUILTINS", 110, 10},
+    {"fwidth(20B", "COMMON_BUILTINS", 110, 10},
+    {"fwidth(30B", "COMMON_BUILTINS", 110, 10},
+    {"gl_FragCoord", "COMMON_BUILTINS", 110, 10},
+    {"gl_FrontFacing", "COMMON_BUILTINS", 110, 10},
+    {"gl_PointCoord", "COMMON_BUILTINS", 110, 10},
+    {"gl_FragColor", "COMMON_BUILTINS", 110, 10},
+    {"gl_FragDepth", "COMMON_BUILTINS", 110, 10},
+    {"gl_SecondaryFragColorEXT", "COMMON_BUILTINS", 110, 21},
+    {"gl_LastFragData", "COMMON_BUILTINS", 110, 22},
+    {"gl_LastFragColor", "COMMON_BUILTINS", 110, 23},
+    {"gl_LastFragData", "COMMON_BUILTINS", 110, 23},
+    {"gl_LastFragColorARM", "COMMON_BUILTINS", 110, 24},
+    {"gl_PrimitiveID", "COMMON_BUILTINS", 110, 5},
+    {"gl_Layer", "COMMON_BUILTINS", 110, 5},
+    {"gl_DrawID", "COMMON_BUILTINS", 110, 14},
+    {"gl_BaseVertex", "COMMON_BUILTINS", 110, 15},
+    {"gl_BaseInstance", "COMMON_BUILTINS", 110, 15},
+    {"gl_NumWorkGroups", "COMMON_BUILTINS", 110, 2},
+    {"gl_WorkGroupSize", "COMMON_BUILTINS", 110, 2},
+    {"gl_WorkGroupID", "COMMON_BUILTINS", 110, 2},
+    {"gl_LocalInvocationID", "COMMON_BUILTINS", 110, 2},
+    {"gl_GlobalInvocationID", "COMMON_BUILTINS", 110, 2},
+    {"gl_LocalInvocationIndex", "COMMON_BUILTINS", 110, 2},
+    {"gl_PrimitiveIDIn", "COMMON_BUILTINS", 110, 4},
+    {"gl_InvocationID", "COMMON_BUILTINS", 110, 4},
+    {"gl_PrimitiveID", "COMMON_BUILTINS", 110, 4},
+    {"gl_Layer", "COMMON_BUILTINS", 110, 4},
+    {"gl_PerVertex", "COMMON_BUILTINS", 110, 4},
+    {"gl_Position", "COMMON_BUILTINS", 110, 4},
+    {"gl_ViewID_OVR", "COMMON_BUILTINS", 110, 16},
+};
+
+constexpr BuiltInLookupName kESSLUnmangledBuiltInNames[] = {
+    {"frexp", "ESSL3_1_BUILTINS", 310, 0},
+    {"ldexp", "ESSL3_1_BUILTINS", 310, 0},
+    {"packUnorm4x8", "ESSL3_1_BUILTINS", 310, 0},
+    {"packSnorm4x8", "ESSL3_1_BUILTINS", 310, 0},
+    {"unpackUnorm4x8", "ESSL3_1_BUILTINS", 310, 0},
+    {"unpackSnorm4x8", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldExtract", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldInsert", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitfieldReverse", "ESSL3_1_BUILTINS", 310, 0},
+    {"bitCount", "ESSL3_1_BUILTINS", 310, 0},
+    {"findLSB", "ESSL3_1_BUILTINS", 310, 0},
+    {"findMSB", "ESSL3_1_BUILTINS", 310, 0},
+    {"uaddCarry", "ESSL3_1_BUILTINS", 310, 0},
+    {"usubBorrow", "ESSL3_1_BUILTINS", 310, 0},
+    {"umulExtended", "ESSL3_1_BUILTINS", 310, 0},
+    {"imulExtended", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureSize", "ESSL3_1_BUILTINS", 310, 0},
+    {"texelFetch", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGather", "ESSL3_1_BUILTINS", 310, 0},
+    {"textureGatherOffset", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicCounter", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicCounterIncrement", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicCounterDecrement", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicAdd", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicMin", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicMax", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicAnd", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicOr", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicXor", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicExchange", "ESSL3_1_BUILTINS", 310, 0},
+    {"atomicCompSwap", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageSize", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageLoad", "ESSL3_1_BUILTINS", 310, 0},
+    {"imageStore", "ESSL3_1_BUILTINS", 310, 0},
+    {"memoryBarrier", "ESSL3_1_BUILTINS", 310, 0},
+    {"memoryBarrierAtomicCounter", "ESSL3_1_BUILTINS", 310, 0},
+    {"memoryBarrierBuffer", "ESSL3_1_BUILTINS", 310, 0},
+    {"memoryBarrierImage", "ESSL3_1_BUILTINS", 310, 0},
+    {"barrier", "ESSL3_1_BUILTINS", 310, 2},
+    {"memoryBarrierShared", "ESSL3_1_BUILTINS", 310, 2},
+    {"groupMemoryBarrier", "ESSL3_1_BUILTINS", 310, 2},
+    {"EmitVertex", "ESSL3_1_BUILTINS", 310, 4},
+    {"EndPrimitive", "ESSL3_1_BUILTINS", 310, 4},
+    {"sinh", "ESSL3_BUILTINS", 300, 0},
+    {"cosh", "ESSL3_BUILTINS", 300, 0},
+    {"tanh", "ESSL3_BUILTINS", 300, 0},
+    {"asinh", "ESSL3_BUILTINS", 300, 0},
+    {"acosh", "ESSL3_BUILTINS", 300, 0},
+    {"atanh", "ESSL3_BUILTINS", 300, 0},
+    {"abs", "ESSL3_BUILTINS", 300, 0},
+    {"sign", "ESSL3_BUILTINS", 300, 0},
+    {"trunc", "ESSL3_BUILTINS", 300, 0},
+    {"round", "ESSL3_BUILTINS", 300, 0},
+    {"roundEven", "ESSL3_BUILTINS", 300, 0},
+    {"min", "ESSL3_BUILTINS", 300, 0},
+    {"max", "ESSL3_BUILTINS", 300, 0},
+    {"clamp", "ESSL3_BUILTINS", 300, 0},
+    {"mix", "ESSL3_BUILTINS", 300, 0},
+    {"modf", "ESSL3_BUILTINS", 300, 0},
+    {"isnan", "ESSL3_BUILTINS", 300, 0},
+    {"isinf", "ESSL3_BUILTINS", 300, 0},
+    {"floatBitsToInt", "ESSL3_BUILTINS", 300, 0},
+    {"floatBitsToUint", "ESSL3_BUILTINS", 300, 0},
+    {"intBitsToFloat", "ESSL3_BUILTINS", 300, 0},
+    {"uintBitsToFloat", "ESSL3_BUILTINS", 300, 0},
+    {"packSnorm2x16", "ESSL3_BUILTINS", 300, 0},
+    {"packHalf2x16", "ESSL3_BUILTINS", 300, 0},
+    {"unpackSnorm2x16", "ESSL3_BUILTINS", 300, 0},
+    {"unpackHalf2x16", "ESSL3_BUILTINS", 300, 0},
+    {"packUnorm2x16", "ESSL3_BUILTINS", 300, 0},
+    {"unpackUnorm2x16", "ESSL3_BUILTINS", 300, 0},
+    {"matrixCompMult", "ESSL3_BUILTINS", 300, 0},
+    {"outerProduct", "ESSL3_BUILTINS", 300, 0},
+    {"transpose", "ESSL3_BUILTINS", 300, 0},
+    {"determinant", "ESSL3_BUILTINS", 300, 0},
+    {"inverse", "ESSL3_BUILTINS", 300, 0},
+    {"lessThan", "ESSL3_BUILTINS", 300, 0},
+    {"lessThanEqual", "ESSL3_BUILTINS", 300, 0},
+    {"greaterThan", "ESSL3_BUILTINS", 300, 0},
+    {"greaterThanEqual", "ESSL3_BUILTINS", 300, 0},
+    {"equal", "ESSL3_BUILTINS", 300, 0},
+    {"notEqual", "ESSL3_BUILTINS", 300, 0},
+    {"texture", "ESSL3_BUILTINS", 300, 0},
+    {"textureProj", "ESSL3_BUILTINS", 300, 0},
+    {"textureLod", "ESSL3_BUILTINS", 300, 0},
+    {"textureSize", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLod", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetch", "ESSL3_BUILTINS", 300, 0},
+    {"textureGrad", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGrad", "ESSL3_BUILTINS", 300, 0},
+    {"textureOffset", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjOffset", "ESSL3_BUILTINS", 300, 0},
+    {"textureLodOffset", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjLodOffset", "ESSL3_BUILTINS", 300, 0},
+    {"texelFetchOffset", "ESSL3_BUILTINS", 300, 0},
+    {"textureGradOffset", "ESSL3_BUILTINS", 300, 0},
+    {"textureProjGradOffset", "ESSL3_BUILTINS", 300, 0},
+    {"rgb_2_yuv", "ESSL3_BUILTINS", 300, 0},
+    {"yuv_2_rgb", "ESSL3_BUILTINS", 300, 0},
+    {"dFdx", "ESSL3_BUILTINS", 300, 10},
+    {"dFdy", "ESSL3_BUILTINS", 300, 10},
+    {"fwidth", "ESSL3_BUILTINS", 300, 10},
+    {"texture2D", "ESSL1_BUILTINS", 100, 0},
+    {"texture2DProj", "ESSL1_BUILTINS", 100, 0},
+    {"textureCube", "ESSL1_BUILTINS", 100, 0},
+    {"texture2DRect", "ESSL1_BUILTINS", 100, 0},
+    {"texture2DRectProj", "ESSL1_BUILTINS", 100, 0},
+    {"texture2DGradEXT", "ESSL1_BUILTINS", 100, 0},
+    {"texture2DProjGradEXT", "ESSL1_BUILTINS", 100, 0},
+    {"textureCubeGradEXT", "ESSL1_BUILTINS", 100, 0},
+    {"dFdx", "ESSL1_BUILTINS", 100, 10},
+    {"dFdy", "ESSL1_BUILTINS", 100, 10},
+    {"fwidth", "ESSL1_BUILTINS", 100, 10},
+    {"texture2DLodEXT", "ESSL1_BUILTINS", 100, 10},
+    {"texture2DProjLodEXT", "ESSL1_BUILTINS", 100, 10},
+    {"textureCubeLodEXT", "ESSL1_BUILTINS", 100, 10},
+    {"texture3D", "ESSL1_BUILTINS", 100, 10},
+    {"texture3DProj", "ESSL1_BUILTINS", 100, 10},
+    {"texture3DLod", "ESSL1_BUILTINS", 100, 10},
+    {"texture3DProjLod", "ESSL1_BUILTINS", 100, 10},
+    {"texture2DLod", "ESSL1_BUILTINS", 100, 13},
+    {"texture2DProjLod", "ESSL1_BUILTINS", 100, 13},
+    {"textureCubeLod", "ESSL1_BUILTINS", 100, 13},
+    {"radians", "COMMON_BUILTINS", 100, 0},
+    {"degrees", "COMMON_BUILTINS", 100, 0},
+    {"sin", "COMMON_BUILTINS", 100, 0},
+    {"cos", "COMMON_BUILTINS", 100, 0},
+    {"tan", "COMMON_BUILTINS", 100, 0},
+    {"asin", "COMMON_BUILTINS", 100, 0},
+    {"acos", "COMMON_BUILTINS", 100, 0},
+    {"atan", "COMMON_BUILTINS", 100, 0},
+    {"pow", "COMMON_BUILTINS", 100, 0},
+    {"exp", "COMMON_BUILTINS", 100, 0},
+    {"log", "COMMON_BUILTINS", 100, 0},
+    {"exp2", "COMMON_BUILTINS", 100, 0},
+    {"log2", "COMMON_BUILTINS", 100, 0},
+    {"sqrt", "COMMON_BUILTINS", 100, 0},
+    {"inversesqrt", "COMMON_BUILTINS", 100, 0},
+    {"abs", "COMMON_BUILTINS", 100, 0},
+    {"sign", "COMMON_BUILTINS", 100, 0},
+    {"floor", "COMMON_BUILTINS", 100, 0},
+    {"ceil", "COMMON_BUILTINS", 100, 0},
+    {"fract", "COMMON_BUILTINS", 100, 0},
+    {"mod", "COMMON_BUILTINS", 100, 0},
+    {"min", "COMMON_BUILTINS", 100, 0},
+    {"max", "COMMON_BUILTINS", 100, 0},
+    {"clamp", "COMMON_BUILTINS", 100, 0},
+    {"mix", "COMMON_BUILTINS", 100, 0},
+    {"step", "COMMON_BUILTINS", 100, 0},
+    {"smoothstep", "COMMON_BUILTINS", 100, 0},
+    {"length", "COMMON_BUILTINS", 100, 0},
+    {"distance", "COMMON_BUILTINS", 100, 0},
+    {"dot", "COMMON_BUILTINS", 100, 0},
+    {"cross", "COMMON_BUILTINS", 100, 0},
+    {"normalize", "COMMON_BUILTINS", 100, 0},
+    {"faceforward", "COMMON_BUILTINS", 100, 0},
+    {"reflect", "COMMON_BUILTINS", 100, 0},
+    {"refract", "COMMON_BUILTINS", 100, 0},
+    {"matrixCompMult", "COMMON_BUILTINS", 100, 0},
+    {"lessThan", "COMMON_BUILTINS", 100, 0},
+    {"lessThanEqual", "COMMON_BUILTINS", 100, 0},
+    {"greaterThan", "COMMON_BUILTINS", 100, 0},
+    {"greaterThanEqual", "COMMON_BUILTINS", 100, 0},
+    {"equal", "COMMON_BUILTINS", 100, 0},
+    {"notEqual", "COMMON_BUILTINS", 100, 0},
+    {"any", "COMMON_BUILTINS", 100, 0},
+    {"all", "COMMON_BUILTINS", 100, 0},
+    {"not", "COMMON_BUILTINS", 100, 0},
+};
+
+constexpr BuiltInLookupName kGLSLUnmangledBuiltInNames[] = {
+    {"atomicCounterAdd", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterSubtract", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterMin", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterMax", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterAnd", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterOr", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterXor", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterExchange", "GLSL4_6_BUILTINS", 460, 0},
+    {"atomicCounterCompSwap", "GLSL4_6_BUILTINS", 460, 0},
+    {"subpassLoad", "GLSL4_6_BUILTINS", 460, 0},
+    {"anyInvocation", "GLSL4_6_BUILTINS", 460, 0},
+    {"allInvocations", "GLSL4_6_BUILTINS", 460, 0},
+    {"allInvocationsEqual", "GLSL4_6_BUILTINS", 460, 0},
+    {"mix", "GLSL4_5_BUILTINS", 450, 0},
+    {"textureSamples", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageSamples", "GLSL4_5_BUILTINS", 450, 0},
+    {"imageAtomicExchange", "GLSL4_5_BUILTINS", 450, 0},
+    {"dFdxFine", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdyFine", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdxCoarse", "GLSL4_5_BUILTINS", 450, 10},
+    {"dFdyCoarse", "GLSL4_5_BUILTINS", 450, 10},
+    {"fwidthFine", "GLSL4_5_BUILTINS", 450, 10},
+    {"fwidthCoarse", "GLSL4_5_BUILTINS", 450, 10},
+    {"textureQueryLevels", "GLSL4_3_BUILTINS", 430, 0},
+    {"textureOffset", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicAdd", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicMin", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicMax", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicAnd", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicOr", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicXor", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicExchange", "GLSL4_3_BUILTINS", 430, 0},
+    {"atomicCompSwap", "GLSL4_3_BUILTINS", 430, 0},
+    {"imageSize", "GLSL4_3_BUILTINS", 430, 0},
+    {"memoryBarrierAtomicCounter", "GLSL4_3_BUILTINS", 430, 0},
+    {"memoryBarrierBuffer", "GLSL4_3_BUILTINS", 430, 0},
+    {"memoryBarrierImage", "GLSL4_3_BUILTINS", 430, 0},
+    {"memoryBarrierShared", "GLSL4_3_BUILTINS", 430, 2},
+    {"groupMemoryBarrier", "GLSL4_3_BUILTINS", 430, 2},
+    {"packSnorm2x16", "GLSL4_2_BUILTINS", 420, 0},
+    {"packHalf2x16", "GLSL4_2_BUILTINS", 420, 0},
+    {"unpackSnorm2x16", "GLSL4_2_BUILTINS", 420, 0},
+    {"unpackHalf2x16", "GLSL4_2_BUILTINS", 420, 0},
+    {"atomicCounter", "GLSL4_2_BUILTINS", 420, 0},
+    {"atomicCounterIncrement", "GLSL4_2_BUILTINS", 420, 0},
+    {"atomicCounterDecrement", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAdd", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMin", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicMax", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicAnd", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicOr", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicXor", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicExchange", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageAtomicCompSwap", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageLoad", "GLSL4_2_BUILTINS", 420, 0},
+    {"imageStore", "GLSL4_2_BUILTINS", 420, 0},
+    {"memoryBarrier", "GLSL4_2_BUILTINS", 420, 0},
+    {"sqrt", "GLSL4_BUILTINS", 400, 0},
+    {"inversesqrt", "GLSL4_BUILTINS", 400, 0},
+    {"abs", "GLSL4_BUILTINS", 400, 0},
+    {"sign", "GLSL4_BUILTINS", 400, 0},
+    {"floor", "GLSL4_BUILTINS", 400, 0},
+    {"trunc", "GLSL4_BUILTINS", 400, 0},
+    {"round", "GLSL4_BUILTINS", 400, 0},
+    {"roundEven", "GLSL4_BUILTINS", 400, 0},
+    {"ceil", "GLSL4_BUILTINS", 400, 0},
+    {"fract", "GLSL4_BUILTINS", 400, 0},
+    {"mod", "GLSL4_BUILTINS", 400, 0},
+    {"min", "GLSL4_BUILTINS", 400, 0},
+    {"max", "GLSL4_BUILTINS", 400, 0},
+    {"clamp", "GLSL4_BUILTINS", 400, 0},
+    {"mix", "GLSL4_BUILTINS", 400, 0},
+    {"step", "GLSL4_BUILTINS", 400, 0},
+    {"smoothstep", "GLSL4_BUILTINS", 400, 0},
+    {"modf", "GLSL4_BUILTINS", 400, 0},
+    {"isnan", "GLSL4_BUILTINS", 400, 0},
+    {"isinf", "GLSL4_BUILTINS", 400, 0},
+    {"fma", "GLSL4_BUILTINS", 400, 0},
+    {"frexp", "GLSL4_BUILTINS", 400, 0},
+    {"ldexp", "GLSL4_BUILTINS", 400, 0},
+    {"packUnorm2x16", "GLSL4_BUILTINS", 400, 0},
+    {"unpackUnorm2x16", "GLSL4_BUILTINS", 400, 0},
+    {"packUnorm4x8", "GLSL4_BUILTINS", 400, 0},
+    {"packSnorm4x8", "GLSL4_BUILTINS", 400, 0},
+    {"unpackUnorm4x8", "GLSL4_BUILTINS", 400, 0},
+    {"unpackSnorm4x8", "GLSL4_BUILTINS", 400, 0},
+    {"packDouble2x32", "GLSL4_BUILTINS", 400, 0},
+    {"unpackDouble2x32", "GLSL4_BUILTINS", 400, 0},
+    {"length", "GLSL4_BUILTINS", 400, 0},
+    {"distance", "GLSL4_BUILTINS", 400, 0},
+    {"dot", "GLSL4_BUILTINS", 400, 0},
+    {"cross", "GLSL4_BUILTINS", 400, 0},
+    {"normalize", "GLSL4_BUILTINS", 400, 0},
+    {"faceforward", "GLSL4_BUILTINS", 400, 0},
+    {"reflect", "GLSL4_BUILTINS", 400, 0},
+    {"refract", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldExtract", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldInsert", "GLSL4_BUILTINS", 400, 0},
+    {"bitfieldReverse", "GLSL4_BUILTINS", 400, 0},
+    {"bitCount", "GLSL4_BUILTINS", 400, 0},
+    {"findLSB", "GLSL4_BUILTINS", 400, 0},
+    {"findMSB", "GLSL4_BUILTINS", 400, 0},
+    {"uaddCarry", "GLSL4_BUILTINS", 400, 0},
+    {"usubBorrow", "GLSL4_BUILTINS", 400, 0},
+    {"umulExtended", "GLSL4_BUILTINS", 400, 0},
+    {"imulExtended", "GLSL4_BUILTINS", 400, 0},
+    {"texture", "GLSL4_BUILTINS", 400, 0},
+    {"textureLod", "GLSL4_BUILTINS", 400, 0},
+    {"textureSize", "GLSL4_BUILTINS", 400, 0},
+    {"textureGrad", "GLSL4_BUILTINS", 400, 0},
+    {"textureGather", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffset", "GLSL4_BUILTINS", 400, 0},
+    {"textureGatherOffsets", "GLSL4_BUILTINS", 400, 0},
+    {"textureQueryLod", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtCentroid", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtSample", "GLSL4_BUILTINS", 400, 10},
+    {"interpolateAtOffset", "GLSL4_BUILTINS", 400, 10},
+    {"barrier", "GLSL4_BUILTINS", 400, 2},
+    {"EmitStreamVertex", "GLSL4_BUILTINS", 400, 25},
+    {"EndStreamPrimitive", "GLSL4_BUILTINS", 400, 25},
+    {"floatBitsToInt", "GLSL3_3_BUILTINS", 330, 0},
+    {"floatBitsToUint", "GLSL3_3_BUILTINS", 330, 0},
+    {"intBitsToFloat", "GLSL3_3_BUILTINS", 330, 0},
+    {"uintBitsToFloat", "GLSL3_3_BUILTINS", 330, 0},
+    {"textureSize", "GLSL1_5_BUILTINS", 150, 0},
+    {"texelFetch", "GLSL1_5_BUILTINS", 150, 0},
+    {"EmitVertex", "GLSL1_5_BUILTINS", 150, 25},
+    {"EndPrimitive", "GLSL1_5_BUILTINS", 150, 25},
+    {"inverse", "GLSL1_4_BUILTINS", 140, 0},
+    {"texture", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProj", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureSize", "GLSL1_4_BUILTINS", 140, 0},
+    {"texelFetch", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureGrad", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGrad", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureOffset", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjOffset", "GLSL1_4_BUILTINS", 140, 0},
+    {"texelFetchOffset", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureGradOffset", "GLSL1_4_BUILTINS", 140, 0},
+    {"textureProjGradOffset", "GLSL1_4_BUILTINS", 140, 0},
+    {"sinh", "GLSL1_3_BUILTINS", 130, 0},
+    {"cosh", "GLSL1_3_BUILTINS", 130, 0},
+    {"tanh", "GLSL1_3_BUILTINS", 130, 0},
+    {"asinh", "GLSL1_3_BUILTINS", 130, 0},
+    {"acosh", "GLSL1_3_BUILTINS", 130, 0},
+    {"atanh", "GLSL1_3_BUILTINS", 130, 0},
+    {"abs", "GLSL1_3_BUILTINS", 130, 0},
+    {"sign", "GLSL1_3_BUILTINS", 130, 0},
+    {"trunc", "GLSL1_3_BUILTINS", 130, 0},
+    {"round", "GLSL1_3_BUILTINS", 130, 0},
+    {"roundEven", "GLSL1_3_BUILTINS", 130, 0},
+    {"min", "GLSL1_3_BUILTINS", 130, 0},
+    {"max", "GLSL1_3_BUILTINS", 130, 0},
+    {"clamp", "GLSL1_3_BUILTINS", 130, 0},
+    {"mix", "GLSL1_3_BUILTINS", 130, 0},
+    {"modf", "GLSL1_3_BUILTINS", 130, 0},
+    {"isnan", "GLSL1_3_BUILTINS", 130, 0},
+    {"isinf", "GLSL1_3_BUILTINS", 130, 0},
+    {"lessThan", "GLSL1_3_BUILTINS", 130, 0},
+    {"lessThanEqual", "GLSL1_3_BUILTINS", 130, 0},
+    {"greaterThan", "GLSL1_3_BUILTINS", 130, 0},
+    {"greaterThanEqual", "GLSL1_3_BUILTINS", 130, 0},
+    {"equal", "GLSL1_3_BUILTINS", 130, 0},
+    {"notEqual", "GLSL1_3_BUILTINS", 130, 0},
+    {"texture", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProj", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLod", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureSize", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLod", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetch", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGrad", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGrad", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureOffset", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjOffset", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureLodOffset", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjLodOffset", "GLSL1_3_BUILTINS", 130, 0},
+    {"texelFetchOffset", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureGradOffset", "GLSL1_3_BUILTINS", 130, 0},
+    {"textureProjGradOffset", "GLSL1_3_BUILTINS", 130, 0},
+    {"outerProduct", "GLSL1_2_BUILTINS", 120, 0},
+    {"transpose", "GLSL1_2_BUILTINS", 120, 0},
+    {"radians", "COMMON_BUILTINS", 110, 0},
+    {"degrees", "COMMON_BUILTINS", 110, 0},
+    {"sin", "COMMON_BUILTINS", 110, 0},
+    {"cos", "COMMON_BUILTINS", 110, 0},
+    {"tan", "COMMON_BUILTINS", 110, 0},
+    {"asin", "COMMON_BUILTINS", 110, 0},
+    {"acos", "COMMON_BUILTINS", 110, 0},
+    {"atan", "COMMON_BUILTINS", 110, 0},
+    {"pow", "COMMON_BUILTINS", 110, 0},
+    {"exp", "COMMON_BUILTINS", 110, 0},
+    {"log", "COMMON_BUILTINS", 110, 0},
+    {"exp2", "COMMON_BUILTINS", 110, 0},
+    {"log2", "COMMON_BUILTINS", 110, 0},
+    {"sqrt", "COMMON_BUILTINS", 110, 0},
+    {"inversesqrt", "COMMON_BUILTINS", 110, 0},
+    {"abs", "COMMON_BUILTINS", 110, 0},
+    {"sign", "COMMON_BUILTINS", 110, 0},
+    {"floor", "COMMON_BUILTINS", 110, 0},
+    {"ceil", "COMMON_BUILTINS", 110, 0},
+    {"fract", "COMMON_BUILTINS", 110, 0},
+    {"mod", "COMMON_BUILTINS", 110, 0},
+    {"min", "COMMON_BUILTINS", 110, 0},
+    {"max", "COMMON_BUILTINS", 110, 0},
+    {"clamp", "COMMON_BUILTINS", 110, 0},
+    {"mix", "COMMON_BUILTINS", 110, 0},
+    {"step", "COMMON_BUILTINS", 110, 0},
+    {"smoothstep", "COMMON_BUILTINS", 110, 0},
+    {"length", "COMMON_BUILTINS", 110, 0},
+    {"distance", "COMMON_BUILTINS", 110, 0},
+    {"dot", "COMMON_BUILTINS", 110, 0},
+    {"cross", "COMMON_BUILTINS", 110, 0},
+    {"normalize", "COMMON_BUILTINS", 110, 0},
+    {"faceforward", "COMMON_BUILTINS", 110, 0},
+    {"reflect", "COMMON_BUILTINS", 110, 0},
+    {"refract", "COMMON_BUILTINS", 110, 0},
+    {"matrixCompMult", "COMMON_BUILTINS", 110, 0},
+    {"lessThan", "COMMON_BUILTINS", 110, 0},
+    {"lessThanEqual", "COMMON_BUILTINS", 110, 0},
+    {"greaterThan", "COMMON_BUILTINS", 110, 0},
+    {"greaterThanEqual", "COMMON_BUILTINS", 110, 0},
+    {"equal", "COMMON_BUILTINS", 110, 0},
+    {"notEqual", "COMMON_BUILTINS", 110, 0},
+    {"any", "COMMON_BUILTINS", 110, 0},
+    {"all", "COMMON_BUILTINS", 110, 0},
+    {"not", "COMMON_BUILTINS", 110, 0},
+    {"texture2D", "COMMON_BUILTINS", 110, 0},
+    {"texture2DProj", "COMMON_BUILTINS", 110, 0},
+    {"textureCube", "COMMON_BUILTINS", 110, 0},
+    {"texture1D", "COMMON_BUILTINS", 110, 0},
+    {"texture1DProj", "COMMON_BUILTINS", 110, 0},
+    {"texture3D", "COMMON_BUILTINS", 110, 0},
+    {"texture3DProj", "COMMON_BUILTINS", 110, 0},
+    {"shadow1D", "COMMON_BUILTINS", 110, 0},
+    {"shadow1DProj", "COMMON_BUILTINS", 110, 0},
+    {"shadow2D", "COMMON_BUILTINS", 110, 0},
+    {"shadow2DProj", "COMMON_BUILTINS", 110, 0},
+    {"noise1", "COMMON_BUILTINS", 110, 0},
+    {"noise2", "COMMON_BUILTINS", 110, 0},
+    {"noise3", "COMMON_BUILTINS", 110, 0},
+    {"noise4", "COMMON_BUILTINS", 110, 0},
+    {"ftransform", "COMMON_BUILTINS", 110, 13},
+    {"texture2DLod", "COMMON_BUILTINS", 110, 13},
+    {"texture2DProjLod", "COMMON_BUILTINS", 110, 13},
+    {"textureCubeLod", "COMMON_BUILTINS", 110, 13},
+    {"texture1DLod", "COMMON_BUILTINS", 110, 13},
+    {"texture1DProjLod", "COMMON_BUILTINS", 110, 13},
+    {"shadow1DLod", "COMMON_BUILTINS", 110, 13},
+    {"shadow1DProjLod", "COMMON_BUILTINS", 110, 13},
+    {"shadow2DLod", "COMMON_BUILTINS", 110, 13},
+    {"shadow2DProjLod", "COMMON_BUILTINS", 110, 13},
+    {"texture3DLod", "COMMON_BUILTINS", 110, 10},
+    {"texture3DProjLod", "COMMON_BUILTINS", 110, 10},
+    {"dFdx", "COMMON_BUILTINS", 110, 10},
+    {"dFdy", "COMMON_BUILTINS", 110, 10},
+    {"fwidth", "COMMON_BUILTINS", 110, 10},
+};
+
+// Names that aren't built-ins, but only differ from one in the last character.
+constexpr const char *kNearMissBuiltInNames[] = {
+    "textureProj(00R30B00x",
+    "interpolateAtOffset(30B10x",
+    "textureProjOffset(00g10B00x",
+    "imageAtomicOr(00z10D00x",
+    "texture2DProj(00I20x",
+    "textureProjGradOffset(00v30B10B10B10x",
+    "texelFetch(00o00D00x",
+    "imageLoad(01g00x",
+    "imageLoad(01I20x",
+    "tanh(30x",
+    "imageAtomicCompSwap(01E20D00D00x",
+    "textureQueryLod(00m00x",
+    "imageAtomicCompSwap(01f00D00D00x",
+    "allInvocationx",
+    "not(10x",
+    "textureGatherOffset(00L20B10x",
+    "lessThanEqual(30B30x",
+    "imageAtomicAdd(00z10D00x",
+    "textureLod(00t00B00x",
+    "textureProjGradOffset(00O30B10B10B10x",
+    "outerProduct(20B30x",
+    "imageAtomicOr(00z10D00y",
+    "imageAtomicAnd(01f00D00x",
+    "imageAtomicAnd(01f00D00y",
+    "imageSamples(01x",
+    "imageSamples(01y",
+    "imageSamples(01z",
+    "imageSamples(01_",
+    "mix(20B20B00x",
+    "imageSamples(010",
+    "textureLodOffset(00o00B00B00x",
+    "uintBitsToFloat(30x",
+    "imageAtomicExchange(01R10D00D00x",
+    "textureSize(00K00x",
+    "textureSize(00h00x",
+    "gl_MaxAtomicCounterBindingx",
+    "texelFetchOffset(00q10D10x",
+    "greaterThanEqual(10E10x",
+    "texture(00d20x",
+    "atan(10B10x",
+    "clamp(30B30B30x",
+    "imageAtomicCompSwap(01a20D00E00x",
+    "imageAtomicCompSwap(01R10D00D00D00x",
+    "textureLodOffset(00a20B00B10x",
+    "imageAtomicExchange(01R10D00D00y",
+    "imageStore(01K00D30x",
+    "greaterThanEqual(20B20x",
+    "imageLoad(01F20x",
+    "ceil(10x",
+    "imageAtomicCompSwap(01b20D00D00x",
+    "imageAtomicAnd(01A10D00x",
+    "imageAtomicAdd(01D20D00x",
+    "atomicAdd(00D00x",
+    "asix",
+    "textureSize(00p00x",
+    "floatBitsToUint(20x",
+    "textureProjOffset(00t30B00D00x",
+    "imageAtomicOr(01Q10D00D00x",
+    "imageAtomicOr(01Q10D00D00y",
+    "atomicMin(00D00x",
+    "mix(20D20D20x",
+    "degrees(20x",
+    "imageAtomicMin(01Y10D00x",
+    "imageAtomicAnd(01Z20D00x",
+    "imageAtomicCompSwap(01D20D00D00x",
+    "min(00C00x",
+    "imageAtomicMax(01S10D00D00x",
+    "imageAtomicXor(01R10D00D00x",
+    "imageAtomicXor(01Q10D00D00x",
+    "inversesqrt(00x",
+    "inversesqrt(00y",
+    "imageAtomicXor(01Q10D00D00y",
+    "texelFetchOffset(00J20D00D20x",
+    "textureProjGrad(00S30B20B20x",
+    "equal(10D10x",
+    "max(30D00x",
+    "groupMemoryBarrierx",
+    "imageAtomicOr(01N10D00x",
+    "imageAtomicOr(01N10D00y",
+    "imageAtomicExchange(01b20D00x",
+    "imageAtomicExchange(01b20D00y",
+    "intBitsToFloat(30x",
+    "texelFetch(00I10D00x",
+    "mod(00C00x",
+    "transpose(E0x",
+    "imageAtomicMin(01R10D00D00x",
+    "imageAtomicMin(01R10D00D00y",
+    "textureGatherOffsets(00f20B00B70x",
+    "packUnorm2x1x",
+    "textureGather(00O20x",
+    "matrixCompMulx",
+    "textureProjOffset(00Y30B20D00x",
+    "modf(10B10x",
+    "imageAtomicMax(01K00D00x",
+    "imageAtomicMax(01K00D00y",
+    "determinant(50x",
+    "imageAtomicCompSwap(01J20D00E00x",
+    "textureProj(00g10B00x",
+    "lessThan(20B20x",
+    "gl_MaxFragmentInputVectorx",
+    "sign(20x",
+    "cosh(20x",
+    "sign(20y",
+    "atanh(00x",
+    "imageAtomicAnd(01V20D00D00x",
+    "imageAtomicAnd(01V20D00D00y",
+    "imageAtomicOr(01X10D00x",
+    "textureProj(00t10x",
+    "texture(00p20B00x",
+    "fma(10C10C10x",
+    "imageAtomicXor(01Y10D00x",
+    "imageAtomicXor(01Y10D00y",
+    "imulExtendex",
+    "imageAtomicExchange(01N10D00x",
+    "imageAtomicAnd(01C20D00x",
+    "textureOffset(00d20B10D00x",
+    "textureOffset(00m20B00x",
+    "imageAtomicAnd(01C20D00y",
+    "lessThan(10E10x",
+    "imageAtomicCompSwap(01A10D00D00x",
+    "textureGrad(00X00B00B00x",
+    "textureProjLodOffset(00t30B00B00x",
+    "fma(30C30C30x",
+    "textureGrad(00v10B10B10x",
+    "textureProj(00N30B00x",
+    "step(00C00x",
+    "gl_MaxCombinedShaderOutputResourcex",
+    "texture(00I10B00x",
+    "texelFetch(00j00x",
+    "lessThan(20D20x",
+    "clamp(20C20C20x",
+    "imageAtomicXor(00z10D00x",
+    "all(10x",
+    "isinf(30x",
+    "isinf(30y",
+    "textureGatherOffset(00a20B10D00x",
+    "textureGatherOffset(00I10B10x",
+    "textureProjOffset(00q30B10x",
+    "textureOffset(00L20B10x",
+    "lessThanEqual(30E30x",
+    "min(10E00x",
+    "imageAtomicXor(01a20D00x",
+    "imageAtomicXor(01a20D00y",
+    "textureProjOffset(00S30B20x",
+    "round(00x",
+    "round(00y",
+    "textureCubx",
+    "greaterThan(30D30x",
+    "texture(00U20x",
+    "imageAtomicCompSwap(01P10D00E00x",
+    "smoothstep(00C00C20x",
+    "texture2DRect(00O10x",
+    "imageAtomicAdd(01K00D00x",
+    "imageAtomicAdd(01K00D00y",
+    "noise2(20x",
+    "gl_MaxGeometryOutputVerticex",
+    "step(20B20x",
+    "imageAtomicAnd(01b20D00x",
+    "findMSB(10x",
+    "findMSB(10y",
+    "interpolateAtOffset(00B10x",
+    "texture(00t00x",
+    "textureLodOffset(00S20B00B20x",
+    "textureQueryLod(00p00x",
+    "imageStore(00z10D30x",
+    "outerProduct(10B20x",
+    "fwidthFine(10x",
+    "imageAtomicExchangx",
+    "cos(30x",
+    "unpackHalf2x16(00x",
+    "sin(20x",
+    "imageStore(01J20D30x",
+    "outerProduct(10B10x",
+    "imageAtomicOr(01M00D00x",
+    "gl_MaxComputeTextureImageUnitx",
+    "imageAtomicMax(01Y10D00x",
+    "imageAtomicMax(01Y10D00y",
+    "sin(30x",
+    "imageAtomicAnd(01O10D00x",
+    "imageAtomicCompSwap(01Q10D00D00D00x",
+    "textureGather(00L20B00x",
+    "texture2DRecx",
+    "imageStore(01A10D30x",
+    "imageAtomicXor(01H20D00x",
+    "imageAtomicXor(01H20D00y",
+    "shadow1D(00m20B00x",
+    "max(10E10x",
+    "max(30B30x",
+    "clamp(10E10E10x",
+    "texture(00N10x",
+    "textureProjGrad(00t30B00B00x",
+    "imageAtomicOr(01E20D00x",
+    "imageAtomicOr(01E20D00y",
+    "texelFetchOffset(00a20D00D10x",
+    "imageLoad(01V20D00x",
+    "not(20x",
+    "imageAtomicExchange(01F20D00x",
+    "imageAtomicMax(01Q10D00D00x",
+    "imageAtomicMax(01Q10D00D00y",
+    "imageAtomicExchange(01F20D00y",
+    "imageStore(01L00D30x",
+    "outerProduct(20B20x",
+    "logx",
+    "barriex",
+    "textureProjLodOffset(00R20B00B10x",
+    "textureOffset(00p10B00x",
+    "texture(00h20x",
+    "imageAtomicXor(01B20D00x",
+    "imageAtomicXor(01B20D00y",
+    "textureProjGrad(00J30B20B20x",
+    "imageAtomicOr(01R10D00D00x",
+    "imageAtomicOr(01R10D00D00y",
+    "textureProjOffset(00g10B00D00x",
+    "gl_InvocationIx",
+    "imageAtomicAnd(01R10D00D00x",
+    "imageAtomicAdd(01E20D00x",
+    "radians(10x",
+    "textureGatherOffset(00n10B00B10x",
+    "noise2(10x",
+    "textureQueryLod(00a10x",
+    "textureGather(00e20B00x",
+    "distance(10B10x",
+    "ldexx",
+    "textureGrad(00Z20B20B20x",
+    "sign(00x",
+    "bitfieldReverse(00x",
+    "bitfieldReverse(00y",
+    "bitfieldExtract(30E00D00x",
+    "textureLod(00I10B00x",
+    "greaterThanEqual(10D10x",
+    "expx",
+    "imageStore(01f00D30x",
+    "EmitVertey",
+    "imageAtomicCompSwap(01I20D00E00x",
+    "degrees(30x",
+    "inversesqrt(30x",
+    "inversesqrt(30y",
+    "imageAtomicMin(01I20D00x",
+    "frexp(20B20x",
+    "intBitsToFloat(20x",
+    "exp(20x",
+    "imageAtomicMax(01A10D00x",
+    "imageAtomicMax(01A10D00y",
+    "acosh(00x",
+    "log(10x",
+    "textureProjLodOffset(00S30B00B20x",
+    "textureGather(00L20x",
+    "textureProj(00n30x",
+    "textureQueryLod(00i00x",
+    "texture(00p20x",
+    "outerProduct(30B20x",
+    "texture(00S20x",
+    "atomicXor(00D00x",
+    "texelFetch(00Y20D00x",
+    "imageAtomicOr(01P10D00x",
+    "imageAtomicOr(01P10D00y",
+    "imageAtomicXor(01N10D00x",
+    "imageAtomicXor(01N10D00y",
+    "bitfieldExtract(10D00D00x",
+    "sign(30x",
+    "sign(30y",
+    "sign(30z",
+    "texture(00Y20B00x",
+    "textureGathex",
+    "dFdy(20x",
+    "textureProj(00Y30x",
+    "textureOffset(00X10B10D00x",
+    "memoryBarrierBufferx",
+    "isinf(00x",
+    "isinf(00y",
+    "clamp(20D00D00x",
+    "texture2DProj(00I20B00x",
+    "mod(30B00x",
+    "imageAtomicAnd(01A10D00y",
+    "textureGatherOffsets(00O10B70D00x",
+    "textureGather(00f20B00x",
+    "textureProj(00m30x",
+    "greaterThan(20E20x",
+    "unpackUnorm2x1x",
+    "textureQueryLox",
+    "textureProjLod(00I30B00x",
+    "refract(00B00B00x",
+    "gl_MaxGeometryImageUniformx",
+    "imageAtomicMin(00y10D00x",
+    "imageAtomicMin(00y10D00y",
+    "imageAtomicMin(01X10D00x",
+    "imageAtomicMin(01X10D00y",
+    "dox",
+    "textureSize(00e00x",
+    "textureProx",
+    "texelFetch(00a20D00x",
+    "step(00C10x",
+    "frexp(30B30x",
+    "packSnorm4xx",
+    "imageAtomicMin(01Y10D00y",
+    "texture(00t00B00x",
+    "min(30C00x",
+    "imageAtomicCompSwap(01X10D00E00x",
+    "gl_ViewportIndey",
+    "texture(00I10x",
+    "all(30x",
+    "normalize(20x",
+    "normalize(20y",
+    "imageAtomicCompSwap(01H20D00D00x",
+    "inverse(F0x",
+    "imageLoad(01K00x",
+    "frexp(20C20x",
+    "ceix",
+    "atan(00x",
+    "textureGatherOffset(00R10B10D00x",
+    "imageAtomicMin(01h00D00x",
+    "imageAtomicMin(01h00D00y",
+    "greaterThan(30E30x",
+    "imageStore(01U20D00D30x",
+    "texelFetchOffset(00p10D00D00x",
+    "imageAtomicAnd(01J20D00x",
+    "imageAtomicAnd(01J20D00y",
+    "gl_DepthRangx",
+    "imageAtomicMax(01S10D00D00y",
+    "imageAtomicCompSwap(01K00D00D00x",
+    "textureProj(00o30x",
+    "imageAtomicAdd(01I20D00x",
+    "bitfieldExtract(20D00D00x",
+    "texture(00L20B00x",
+    "imageAtomicOr(01L00D00x",
+    "imageAtomicOr(01L00D00y",
+    "mix(30D30D30x",
+    "imageAtomicExchange(01Z20D00x",
+    "imageAtomicExchange(01Z20D00y",
+    "imageAtomicExchange(01Z20D00z",
+    "imageAtomicExchange(01f00D00x",
+    "imageAtomicExchange(01f00D00y",
+    "imageLoad(01h00x",
+    "imageAtomicCompSwap(01E20D00E00x",
+    "textureProjOffset(00O30B10x",
+    "floor(10x",
+    "floor(10y",
+    "imageAtomicMax(01R10D00D00x",
+    "imageAtomicMax(01R10D00D00y",
+    "textureQueryLod(00X10x",
+    "textureGatherOffsets(00a20B70D00x",
+    "texture2DProjLodEXx",
+    "textureGather(00x30B00x",
+    "memoryBarrierImagx",
+    "interpolateAtSample(10B00x",
+    "imageAtomicMin(01F20D00x",
+    "imageAtomicMin(01F20D00y",
+    "outerProduct(10B30x",
+    "imageAtomicCompSwap(01O10D00E00x",
+    "cos(00x",
+    "imageAtomicXor(01F20D00x",
+    "frexp(00C00x",
+    "atomicCounterCompSwap(00G00E00x",
+    "textureOffset(00a20B10D00x",
+    "textureGather(00X10x",
+    "textureOffset(00R10B10D00x",
+    "textureGatherOffset(00d10B00B10x",
+    "gl_MaxFragmentImageUniformx",
+    "cox",
+    "textureSize(00i00x",
+    "equal(20E20x",
+    "EmitStreamVertey",
+    "uaddCarry(00E00E00x",
+    "textureQueryLod(00T20x",
+    "textureCube(00K20x",
+    "imageAtomicMax(01U20D00D00x",
+    "imageAtomicMax(01U20D00D00y",
+    "matrixCompMult(90B90x",
+    "imageAtomicMin(01T20D00D00x",
+    "imageAtomicMin(01T20D00D00y",
+    "textureGradOffset(00p10B00B00B00x",
+    "textureProjLodOffset(00g30B00B00x",
+    "clamp(30E00E00x",
+    "asin(00x",
+    "textureProjOffset(00J30B20D00x",
+    "imageLoad(01W10x",
+    "texelFetch(00w00x",
+    "imageAtomicExchange(01b20D00z",
+    "not(30x",
+    "lessThanEqual(10E10x",
+    "inversesqrt(20x",
+    "inversesqrt(20y",
+    "textureLod(00i20B00x",
+    "textureOffset(00u10B00D00x",
+    "reflect(00C00x",
+    "atomicAdd(00E00x",
+    "step(20C20x",
+    "textureProjGradOffset(00v20B10B10B10x",
+    "textureGrad(00X10B10B10x",
+    "greaterThanEqual(30E30x",
+    "mix(20B20B20x",
+    "gl_MaxVertexAtomicCounterx",
+    "textureProjOffset(00X20B10x",
+    "any(10x",
+    "textureProjGradOffset(00d30B10B10B10x",
+    "imageLoad(01X10x",
+    "bitfieldInserx",
+    "texture3DProx",
+    "textureProjOffset(00I30B10x",
+    "imageAtomicExchange(01W10D00x",
+    "imageAtomicExchange(01W10D00y",
+    "imageAtomicExchange(01W10D00z",
+    "tanx",
+    "textureOffset(00X10B10x",
+    "fwidthCoarsx",
+    "texture(00R10x",
+    "imageAtomicAnd(01Z20D00y",
+    "imageStore(01M00D30x",
+    "radians(00x",
+    "imageStore(01Y10D30x",
+    "step(10B10x",
+    "gl_MaxDualSourceDrawBuffersEXx",
+    "imageAtomicAdd(01Y10D00x",
+    "imageAtomicAdd(01Y10D00y",
+    "bitfieldReverse(10x",
+    "bitfieldReverse(10y",
+    "imageStore(01g00D30x",
+    "textureProjGradOffset(00q20B10B10B10x",
+    "imageAtomicExchange(01S10D00D00x",
+    "atomicXor(00E00x",
+    "mix(00C00C00x",
+    "textureLodOffset(00g00B00B00x",
+    "greaterThan(30B30x",
+    "gl_MaxFragmentAtomicCounterx",
+    "faceforward(20B20B20x",
+    "textureSize(00x00x",
+    "textureProj(00S30B00x",
+    "imageAtomicMix",
+    "fma(20B20B20x",
+    "textureProjLod(00o10B00x",
+    "imageAtomicMin(01J20D00x",
+    "outerProduct(30B30x",
+    "textureProj(00q30x",
+    "exp(30x",
+    "bitCount(10x",
+    "bitCount(10y",
+    "log(00x",
+    "mix(00F00F00x",
+    "imageAtomicCompSwap(01M00D00D00x",
+    "imageAtomicAnd(01T20D00D00x",
+    "imageAtomicAnd(01T20D00D00y",
+    "subpassLoad(01l00x",
+    "imageStore(01N10D30x",
+    "acosh(30x",
+    "imageAtomicOr(01Y10D00x",
+    "imageAtomicOr(01Y10D00y",
+    "textureGradOffset(00X10B10B10B10x",
+    "texelFetchOffset(00X10D00D10x",
+    "packUnorm2x16(10x",
+    "texture(00h20B00x",
+    "umulExtended(20E20E20E20x",
+    "imageAtomicAnd(01b20D00y",
+    "texture(00m20B00x",
+    "textureProjGradOffset(00g30B00B00B00x",
+    "textureProj(00o30B00x",
+    "textureCubeLod(00K20B00x",
+    "textureSize(00L00x",
+    "imageAtomicXor(01L00D00x",
+    "max(20E00x",
+    "textureProj(00S30x",
+    "dFdy(30x",
+    "imageSize(00x",
+    "isinf(10x",
+    "isinf(10y",
+    "textureGatherOffsets(00a20B70x",
+    "textureProjGradOffsex",
+    "gl_MaxVertexTextureImageUnitx",
+    "greaterThanEqual(30B30x",
+    "texture2DProjLodEXT(00I20B00x",
+    "gl_FrontFacinx",
+    "imageStore(01C20D30x",
+    "textureProjOffset(00t10B00D00x",
+    "imageAtomicCompSwap(01Z20D00D00x",
+    "acos(10x",
+    "textureCube(00K20B00x",
+    "lessThan(10B10x",
+    "gl_MaxComputeAtomicCounterBufferx",
+    "textureSize(00f00x",
+    "imageLoad(01B20x",
+    "texelFetchOffset(00h10D00D00x",
+    "mod(20C00x",
+    "imageAtomicAnd(01g00D00x",
+    "gl_LastFragColorARx",
+    "lessThanEqual(20D20x",
+    "textureQueryLod(00k20x",
+    "textureProjLod(00Y30B00x",
+    "atomicMay",
+    "gl_SecondaryFragColorEXx",
+    "imageAtomicAnd(01U20D00D00x",
+    "imageAtomicAnd(01U20D00D00y",
+    "gl_BaseInstancx",
+    "transpose(B0x",
+    "imageAtomicXor(01b20D00x",
+    "mix(20F20F20x",
+    "smoothstep(00B00B30x",
+    "imageAtomicExchange(01M00D00x",
+    "imageAtomicExchange(01F20D00z",
+    "imageAtomicExchange(01M00D00y",
+    "imageAtomicExchange(01M00D00z",
+    "imageAtomicCompSwap(01F20D00E00x",
+    "texelFetch(00N10D00x",
+    "textureSize(00a00x",
+    "imageAtomicXor(01T20D00D00x",
+    "textureProjOffset(00Y30B20x",
+    "bitCount(30x",
+    "atan(30x",
+    "textureGatherOffsets(00R10B70D00x",
+    "imageAtomicMax(01b20D00x",
+    "ceil(10y",
+    "textureSize(00S00x",
+    "imageAtomicExchange(01S10D00D00y",
+    "atomicCounterDecrement(00x",
+    "ceil(30x",
+    "acox",
+    "texture(00f30x",
+    "imageSamples(011",
+    "texelFetch(00R10D00x",
+    "sign(20z",
+    "smoothstep(30B30B30x",
+    "textureGrad(00R10B10B10x",
+    "textureProjLox",
+    "min(00D00x",
+    "textureProj(00t10B00x",
+    "atomicCounterAnx",
+    "imageAtomicCompSwap(01W10D00E00x",
+    "imageSamplex",
+    "imageAtomicAdd(01V20D00D00x",
+    "ldexp(20B20x",
+    "greaterThanEqual(30D30x",
+    "imageLoad(01D20x",
+    "findLSB(10x",
+    "texture(00Z20B00x",
+    "imageAtomicXor(01S10D00D00x",
+    "imageAtomicXor(01S10D00D00y",
+    "cos(10x",
+    "texelFetch(00v10x",
+    "texture(00e30x",
+    "imageStore(01W10D30x",
+    "textureSize(00T00x",
+    "imageAtomicAnd(01g00D00y",
+    "textureSize(00u00x",
+    "textureProjGradOffset(00Y30B20B20B20x",
+    "noise3(30x",
+    "textureGrad(00T20B20B20x",
+    "texture1DProj(00g10B00x",
+    "textureProjOffset(00d30B10D00x",
+    "textureGatherOffsets(00X10B70x",
+    "imageAtomicXor(01U20D00D00x",
+    "imageAtomicXor(01U20D00D00y",
+    "imageAtomicAdd(01h00D00x",
+    "imageAtomicAdd(01h00D00y",
+    "matrixCompMult(50B50x",
+    "equal(30B30x",
+    "imageAtomicExchange(01E20D00x",
+    "textureLod(00U20B00x",
+    "imageAtomicXor(01I20D00x",
+    "imageAtomicXor(01I20D00y",
+    "textureOffset(00h10B00x",
+    "textureLod(00p10B00x",
+    "max(20C20x",
+    "greaterThanEquax",
+    "max(10B10x",
+    "gl_PointSizx",
+    "imageAtomicCompSwap(01B20D00E00x",
+    "asin(10x",
+    "sinh(00x",
+    "imageAtomicAdd(01g00D00x",
+    "imageAtomicCompSwap(01h00D00E00x",
+    "dFdyCoarsx",
+    "floox",
+    "nox",
+    "textureOffset(00S20B20x",
+    "fma(20C20C20x",
+    "imageAtomicCompSwap(01N10D00D00x",
+    "textureProj(00R20x",
+    "greaterThan(10E10x",
+    "imageAtomicAnd(01M00D00x",
+    "imageAtomicAnd(01M00D00y",
+    "EmitVertexx",
+    "smoothstep(20B20B20x",
+    "textureSamples(00x",
+    "textureOffset(00J20B20x",
+    "texelFetch(00J20D00x",
+    "imageAtomicExchange(01V20D00D00x",
+    "imageAtomicExchange(01V20D00D00y",
+    "imageAtomicCompSwap(01Y10D00E00x",
+    "imageAtomicExchange(00y10D00x",
+    "imageAtomicExchange(00y10D00y",
+    "imageAtomicExchange(00y10D00z",
+    "gl_ViewID_OVx",
+    "radians(30x",
+    "fract(30x",
+    "imageAtomicAdd(01B20D00x",
+    "imageAtomicAdd(01B20D00y",
+    "imageAtomicMin(01H20D00x",
+    "uaddCarry(20E20E20x",
+    "textureProjGrad(00X30B10B10x",
+    "textureSamples(00y",
+    "textureProjGrad(00o30B00B00x",
+    "shadow2D(00d20B00x",
+    "texelFetchOffset(00o00D00D00x",
+    "textureSamples(00z",
+    "textureSamples(00_",
+    "textureProjGrad(00q30B10B10x",
+    "textureGatherOffset(00O10B10x",
+    "imageAtomicAdx",
+    "clamp(10D00D00x",
+    "gl_MaxComputeImageUniformx",
+    "textureLod(00L20B00x",
+    "imageAtomicExchange(01A10D00x",
+    "imageAtomicCompSwap(01V20D00D00D00x",
+    "imageAtomicExchange(01A10D00y",
+    "imageAtomicExchange(01A10D00z",
+    "imageAtomicXor(01b20D00y",
+    "inversx",
+    "texture(00n20x",
+    "ldexp(20C20x",
+    "clamp(00E00E00x",
+    "length(20x",
+    "ldexp(00B00x",
+    "imageAtomicExchange(01N10D00y",
+    "bitfieldInsert(00D00D00D00x",
+    "textureProjGrad(00Y30B20B20x",
+    "roundEven(30x",
+    "roundEven(30y",
+    "acosh(20x",
+    "atanh(10x",
+    "length(20y",
+    "clamp(10B10B10x",
+    "textureGatherOffset(00L20B10D00x",
+    "bitCount(00x",
+    "bitCount(00y",
+    "imageAtomicExchange(01N10D00z",
+    "lessThax",
+    "floatBitsToInt(30x",
+    "rounx",
+    "max(20B00x",
+    "unpackHalf2x1x",
+    "gl_InstanceIx",
+    "imageAtomicAdd(00z10D00y",
+    "texelFetchOffset(00Y20D00D20x",
+    "atomicExchange(00E00x",
+    "imageAtomicXor(01h00D00x",
+    "imageAtomicXor(01h00D00y",
+    "cosx",
+    "ldexp(30C30x",
+    "texture(00o00x",
+    "textureGatherOffsets(00X10B70D00x",
+    "lessThanEqual(20B20x",
+    "min(10B00x",
+    "textureQueryLod(00f10x",
+    "smoothstep(10C10C10x",
+    "texture2DGradEXx",
+    "imageAtomicAnd(01L00D00x",
+    "imageAtomicAnd(01L00D00y",
+    "mix(30F30F30x",
+    "abs(20x",
+    "abs(20y",
+    "abs(20z",
+    "lessThanEqual(10B10x",
+    "atomicCounterDecremenx",
+    "imageAtomicOr(01f00D00x",
+    "imageAtomicOr(01f00D00y",
+    "imageAtomicOr(01a20D00x",
+    "mix(00B00B00x",
+    "mix(00B00B00y",
+    "textureGather(00s30B00x",
+    "textureProj(00I20x",
+    "imageAtomicExchange(01B20D00x",
+    "textureLodOffset(00p10B00B00x",
+    "gl_MaxVertexAtomicCounterBufferx",
+    "unpackDouble2x32(00x",
+    "acos(00x",
+    "usubBorrox",
+    "textureGradOffset(00J20B20B20B20x",
+    "fma(00C00C00x",
+    "texture2DGradEXT(00I10B10B10x",
+    "imageAtomicCompSwap(01G20D00D00x",
+    "imageAtomicAnd(01I20D00x",
+    "texture2DProjGradEXT(00I30B10B10x",
+    "fma(30B30B30x",
+    "imageAtomicAdd(01L00D00x",
+    "texture(00i20B00x",
+    "gl_MaxComputeWorkGroupCounx",
+    "clamp(20C00C00x",
+    "imageAtomicMax(01X10D00x",
+    "mix(30E30E30x",
+    "imageAtomicMax(01b20D00y",
+    "imageAtomicMin(01G20D00x",
+    "imageAtomicMin(01G20D00y",
+    "textureGatherOffsets(00I10B70x",
+    "imageAtomicExchange(01S10D00D00z",
+    "atan(20x",
+    "imageAtomicCompSwap(01Z20D00E00x",
+    "interpolateAtSample(30B00x",
+    "dFdxCoarse(30x",
+    "texture(00M10x",
+    "min(10B10x",
+    "textureLodOffset(00h10B00B00x",
+    "EndStreamPrimitive(00x",
+    "pow(10B10x",
+    "texture(00Y20x",
+    "imageAtomicXor(01P10D00x",
+    "texture(00X10B00x",
+    "frexp(00B00x",
+    "texture2D(00I10x",
+    "imageLoad(01O10x",
+    "ceil(20x",
+    "ceil(20y",
+    "atomicCounterMay",
+    "imageAtomicMin(01b20D00x",
+    "imageAtomicMin(01b20D00y",
+    "imageAtomicMax(01P10D00x",
+    "imageAtomicMax(01P10D00y",
+    "imageAtomicExchange(01P10D00x",
+    "textureProjOffset(00R20B10x",
+    "imageStore(01V20D00D30x",
+    "imageAtomicCompSwap(01T20D00D00E00x",
+    "subpassLoad(01m00x",
+    "textureOffset(00I10B10x",
+    "min(20B00x",
+    "normalizx",
+    "reflect(00B00x",
+    "noise4(10x",
+    "sqrt(10x",
+    "sqrt(10y",
+    "imageAtomicXor(01Z20D00x",
+    "imageAtomicXor(01Z20D00y",
+    "clamp(20E20E20x",
+    "textureGradOffset(00g00B00B00B00x",
+    "textureGather(00q20x",
+    "noise3(00x",
+    "atax",
+    "imageAtomicOr(01G20D00x",
+    "may",
+    "imageAtomicMin(01C20D00x",
+    "imageAtomicMin(01C20D00y",
+    "imageAtomicAnx",
+    "imageAtomicAnd(01F20D00x",
+    "textureProjLod(00d30B00x",
+    "imageStore(01a20D30x",
+    "imageLoad(01H20x",
+    "textureProjGradOffset(00I20B10B10B10x",
+    "interpolateAtSample(20B00x",
+    "reflect(10B10x",
+    "refract(10B10B00x",
+    "imageAtomicMax(01h00D00x",
+    "mix(20C20C20x",
+    "imageAtomicExchange(01X10D00x",
+    "imageAtomicExchange(01X10D00y",
+    "mix(20C20C20y",
+    "textureOffset(00v10B10x",
+    "fwidtx",
+    "atomicCounterIncremenx",
+    "imageAtomicMin(01P10D00x",
+    "sinh(30x",
+    "textureSize(00m00x",
+    "textureQueryLod(00e20x",
+    "asinh(20x",
+    "imageAtomicAdd(01C20D00x",
+    "imageAtomicAdd(00y10D00x",
+    "atomicAnx",
+    "imageAtomicCompSwap(01I20D00D00x",
+    "textureProj(00O20x",
+    "imageAtomicCompSwap(01M00D00E00x",
+    "frexp(10B10x",
+    "inverse(50x",
+    "dot(10B10x",
+    "imageAtomicExchange(01T20D00D00x",
+    "imageAtomicExchange(01T20D00D00y",
+    "noise2(00x",
+    "textureProjGradOffset(00o10B00B00B00x",
+    "textureProj(00N20B00x",
+    "atomicCompSwap(00E00E00x",
+    "textureGrad(00I00B00B00x",
+    "textureGrad(00Y20B20B20x",
+    "gl_MaxVertexUniformVectorx",
+    "textureOffset(00o00B00D00x",
+    "ftransformx",
+    "textureProj(00X20x",
+    "textureProjOffset(00n30B10x",
+    "gl_MaxGeometryUniformComponentx",
+    "greaterThanEqual(20E20x",
+    "textureProj(00M20x",
+    "texture3DProjLod(00J30B00x",
+    "faceforwarx",
+    "imageAtomicAdd(01S10D00D00x",
+    "mix(10D10D10x",
+    "textureProjGrad(00g10B00B00x",
+    "log(20x",
+    "imageAtomicMax(01D20D00x",
+    "imageAtomicMax(01D20D00y",
+    "textureOffset(00h10B00D00x",
+    "modf(30B30x",
+    "roundEven(20x",
+    "roundEven(20y",
+    "outerProduct(30B10x",
+    "textureProj(00J30x",
+    "imageAtomicOr(00y10D00x",
+    "imageAtomicOr(00y10D00y",
+    "imageAtomicOr(01F20D00x",
+    "imageAtomicOr(01F20D00y",
+    "textureLodOffset(00t00B00B00x",
+    "floatBitsToInt(20x",
+    "texelFetch(00U20D00x",
+    "max(00D00x",
+    "atomicMin(00E00x",
+    "imageAtomicMin(01Q10D00D00x",
+    "imageAtomicMin(01Q10D00D00y",
+    "textureGradOffset(00v10B10B10B10x",
+    "textureGrad(00n20B10B10x",
+    "imageLoad(01S10D00x",
+    "max(20E20x",
+    "texture(00e30B00x",
+    "imageAtomicCompSwap(01F20D00D00x",
+    "abs(10x",
+    "abs(10y",
+    "abs(10z",
+    "gl_FragDepthEXx",
+    "fmx",
+    "modf(30C30x",
+    "imageAtomicExchange(01g00D00x",
+    "textureGrad(00i20B00B00x",
+    "texture1DLox",
+    "textureProj(00g10x",
+    "equal(20B20x",
+    "textureProjLodOffset(00X20B00B10x",
+    "max(30C00x",
+    "imageAtomicMax(01W10D00x",
+    "textureSamples(000",
+    "texture(00U20B00x",
+    "textureProj(00I30x",
+    "mix(00E00E00x",
+    "imageAtomicCompSwap(01h00D00D00x",
+    "mix(00D00D00x",
+    "fwidthFine(00x",
+    "texture(00i20x",
+    "textureGradOffset(00a20B10B10B10x",
+    "smoothstep(00B00B20x",
+    "textureLod(00s30B00x",
+    "imageAtomicOr(01C20D00x",
+    "imageAtomicOr(01C20D00y",
+    "anx",
+    "notEqual(30B30x",
+    "imageAtomicCompSwap(01W10D00D00x",
+    "textureGatherOffset(00f20B00B10x",
+    "imageLoad(01T20D00x",
+    "imageSize(00_",
+    "imageAtomicMin(01W10D00x",
+    "dFdyCoarse(30x",
+    "mod(10C10x",
+    "imageAtomicXor(01g00D00x",
+    "faceforward(00C00C00x",
+    "textureGrad(00a20B10B10x",
+    "imageAtomicXor(01R10D00D00y",
+    "imageAtomicXor(01T20D00D00y",
+    "dFdxCoarse(00x",
+    "imageAtomicMin(01a20D00x",
+    "texture(00J20B00x",
+    "refract(20B20B00x",
+    "ceil(30y",
+    "gl_MaxGeometryOutputComponentx",
+    "noise1(30x",
+    "log2(30x",
+    "textureProjGrad(00d30B10B10x",
+    "mod(20C20x",
+    "fract(30y",
+    "texelFetch(00t00D00x",
+    "imageAtomicXor(01L00D00y",
+    "max(30E30x",
+    "gl_MaxFragmentAtomicCounterBufferx",
+    "gl_ix",
+    "noise4(00x",
+    "distance(10C10x",
+    "textureProjLodOffset(00J30B00B20x",
+    "imageAtomicMax(01H20D00x",
+    "imageAtomicMax(01H20D00y",
+    "imageAtomicExchange(01O10D00x",
+    "imageStore(01h00D30x",
+    "texturx",
+    "textureGatherOffsets(00d10B00B70x",
+    "frexx",
+    "texelFetch(00c20D00x",
+    "sqrt(00x",
+    "sqrt(00y",
+    "textureProjLod(00R30B00x",
+    "noise3(10x",
+    "texelFetch(00q10x",
+    "imageAtomicAnd(01F20D00y",
+    "textureLod(00m20B00x",
+    "textureProjOffset(00m30B00D00x",
+    "textureProjGrad(00v30B10B10x",
+    "clamp(20D20D20x",
+    "imageAtomicMin(01P10D00y",
+    "imageAtomicAdd(01C20D00y",
+    "clamp(00C00C00x",
+    "imageAtomicCompSwap(01b20D00E00x",
+    "max(10E00x",
+    "textureGrad(00U20B10B10x",
+    "imageAtomicCompSwap(01B20D00D00x",
+    "imageLoad(00z10x",
+    "clamp(30C00C00x",
+    "texture2DProx",
+    "sinh(20x",
+    "matrixCompMult(E0BE0x",
+    "textureProjOffset(00q20B10x",
+    "gl_PerVertey",
+    "textureGradOffset(00m20B00B00B00x",
+    "texture1DProx",
+    "textureQueryLevels(00y",
+    "gl_WorkGroupSizx",
+    "asinh(30x",
+    "cross(20C20x",
+    "textureGather(00a20x",
+    "textureProjGradOffset(00O20B10B10B10x",
+    "pow(30B30x",
+    "imageAtomicCompSwap(01G20D00E00x",
+    "smoothstep(10B10B10x",
+    "textureProj(00O30x",
+    "imageAtomicAdd(01Q10D00D00x",
+    "textureQueryLod(00R10x",
+    "texture2DLodEXx",
+    "imageAtomicAdd(01R10D00D00x",
+    "imageAtomicAdd(01R10D00D00y",
+    "imageAtomicExchange(01E20D00y",
+    "imageAtomicExchange(01E20D00z",
+    "isnan(00x",
+    "isnan(00y",
+    "imulExtended(10D10D10D10x",
+    "pox",
+    "textureProjGrad(00o10B00B00x",
+    "textureLodOffsex",
+    "refract(10C10C00x",
+    "min(00E00x",
+    "texture2DProj(00I30x",
+    "textureGradOffset(00I10B10B10B10x",
+    "textureLodOffset(00J20B00B20x",
+    "notEqual(20B20x",
+    "texture2DProjLod(00I30B00x",
+    "imageAtomicOr(01W10D00x",
+    "imageAtomicOr(01W10D00y",
+    "textureOffset(00i20B00x",
+    "floatBitsToInt(10x",
+    "textureLod(00a20B00x",
+    "textureProj(00N30x",
+    "refract(30C30C00x",
+    "equal(30D30x",
+    "packUnorm4xx",
+    "packSnorm2x16(10x",
+    "floatBitsToUint(30x",
+    "imageLoad(00y10x",
+    "textureOffset(00R10B10x",
+    "textureProjGrad(00q20B10B10x",
+    "textureProjGradOffset(00R20B10B10B10x",
+    "ldexp(30B30x",
+    "max(30B00x",
+    "imageAtomicAdd(01Q10D00D00y",
+    "atomicCounterOr(00G00x",
+    "step(30B30x",
+    "imageAtomicOr(01T20D00D00x",
+    "imageAtomicOr(01T20D00D00y",
+    "textureProj(00I30B00x",
+    "imageAtomicExchange(01D20D00x",
+    "textureOffset(00g00B00D00x",
+    "imageAtomicExchange(01D20D00y",
+    "imageAtomicCompSwap(01O10D00D00x",
+    "imageAtomicMin(01g00D00x",
+    "abs(00x",
+    "abs(00y",
+    "abs(00z",
+    "textureLod(00R10B00x",
+    "textureLodOffset(00U20B00B10x",
+    "texture1D(00g00x",
+    "frexp(10C10x",
+    "imageAtomicMax(01B20D00x",
+    "shadow2DLox",
+    "imageAtomicAdd(01g00D00y",
+    "texture2DLod(00I10B00x",
+    "textureProjGradOffset(00X20B10B10B10x",
+    "round(20x",
+    "EndPrimitivex",
+    "step(00B30x",
+    "textureSize(00x",
+    "equal(30E30x",
+    "imageAtomicCompSwap(01R10D00D00E00x",
+    "step(00C20x",
+    "dot(00C00x",
+    "max(30C30x",
+    "atomicOr(00D00x",
+    "texture2DProj(00M20x",
+    "packSnorm2x1x",
+    "notEqual(10D10x",
+    "textureSize(00y",
+    "imageAtomicAnd(01h00D00x",
+    "min(20C00x",
+    "imageAtomicAdd(01G20D00x",
+    "imageAtomicAdd(01G20D00y",
+    "findLSB(30x",
+    "findLSB(30y",
+    "textureProj(00X20B00x",
+    "shadow2D(00d20x",
+    "imageAtomicAdd(01N10D00x",
+    "imageAtomicAdd(01N10D00y",
+    "textureGatherOffset(00U20B10x",
+    "faceforward(10B10B10x",
+    "imageAtomicAnd(01h00D00y",
+    "min(10D00x",
+    "imageAtomicOr(01B20D00x",
+    "imageAtomicOr(01B20D00y",
+    "EmitStreamVertex(00x",
+    "imageAtomicCompSwap(01J20D00D00x",
+    "all(20x",
+    "imageSize(01x",
+    "imageSize(01y",
+    "textureOffset(00t00B00D00x",
+    "imageSize(01z",
+    "packHalf2x16(10x",
+    "textureGather(00f20x",
+    "imageSize(01_",
+    "imageSize(010",
+    "imageSize(011",
+    "imageSize(012",
+    "texelFetch(00r00x",
+    "imageSize(013",
+    "equal(30F30x",
+    "bitfieldExtract(00D00D00x",
+    "imageAtomicExchange(01L00D00x",
+    "imageAtomicMax(01Z20D00x",
+    "texelFetch(00X10D00x",
+    "notEqual(30F30x",
+    "textureQueryLod(00g00x",
+    "mox",
+    "fract(20x",
+    "fract(20y",
+    "textureGatherOffset(00X10B10x",
+    "texture2DProjGradEXT(00I20B10B10x",
+    "textureLod(00S20B00x",
+    "textureQueryLevelx",
+    "step(30C30x",
+    "imageAtomicMin(01J20D00y",
+    "gl_FragDeptx",
+    "unpackDouble2x3x",
+    "textureGather(00x30x",
+    "mix(30B30B30x",
+    "dFdxCoarse(10x",
+    "mix(30B30B30y",
+    "textureGather(00Z20B00x",
+    "noise4(30x",
+    "sqrt(30x",
+    "sqrt(30y",
+    "imageStore(01E20D30x",
+    "exp(00x",
+    "max(30D30x",
+    "gl_MaxGeometryTextureImageUnitx",
+    "interpolateAtCentroid(10x",
+    "texture(00q10x",
+    "textureSize(00M00x",
+    "textureSamples(001",
+    "textureGrax",
+    "noise3(20x",
+    "mix(10F10F10x",
+    "textureGradOffset(00U20B10B10B10x",
+    "gl_Positiox",
+    "textureGradOffset(00O10B10B10B10x",
+    "textureProj(00M30x",
+    "textureGradOffset(00L20B10B10B10x",
+    "imageAtomicExchange(01V20D00D00z",
+    "imageAtomicExchange(01J20D00x",
+    "imageAtomicExchange(01J20D00y",
+    "imageAtomicExchange(01J20D00z",
+    "textureQueryLod(00l20x",
+    "imageAtomicOr(01M00D00y",
+    "dot(20B20x",
+    "textureProjGrad(00v20B10B10x",
+    "textureProjLod(00S30B00x",
+    "textureProjGrad(00R20B10B10x",
+    "imageAtomicMax(00z10D00x",
+    "imageAtomicMax(00z10D00y",
+    "normalize(30x",
+    "normalize(30y",
+    "textureOffset(00O10B10x",
+    "textureProjGrad(00I20B10B10x",
+    "textureGather(00e20x",
+    "imageAtomicMax(01V20D00D00x",
+    "textureCubeLodEXx",
+    "imageAtomicAdd(01a20D00x",
+    "fwidthFine(30x",
+    "textureGather(00K20B00x",
+    "lox",
+    "textureCubeLodEXT(00K20B00x",
+    "textureGather(00T20B00x",
+    "textureProj(00N20x",
+    "textureQueryLod(00I10x",
+    "imageAtomicCompSwap(01A10D00E00x",
+    "dFdyFine(10x",
+    "modf(10C10x",
+    "imageAtomicMax(01E20D00x",
+    "imageAtomicMax(01E20D00y",
+    "atomicCounterSubtracx",
+    "textureProjLodOffset(00X30B00B10x",
+    "atomicCompSwap(00D00D00x",
+    "textureProjLod(00m30B00x",
+    "textureProjOffset(00g30B00D00x",
+    "texelFetchOffset(00U20D00D10x",
+    "imageAtomicCompSwap(00z10D00E00x",
+    "imageAtomicMin(01D20D00x",
+    "textureProjGradOffset(00q30B10B10B10x",
+    "textureGradOffset(00d20B10B10B10x",
+    "fwidthCoarse(20x",
+    "textureProjOffset(00d30B10x",
+    "memoryBarriex",
+    "equal(20F20x",
+    "imageAtomicAdd(01V20D00D00y",
+    "mix(20C20C00x",
+    "usubBorrow(10E10E10x",
+    "imageStore(01S10D00D30x",
+    "equal(10B10x",
+    "atomicCountex",
+    "imageAtomicExchange(01Q10D00D00x",
+    "imageAtomicExchange(01Q10D00D00y",
+    "imageAtomicExchange(01Q10D00D00z",
+    "bitfieldExtracx",
+    "isnan(10x",
+    "isnan(10y",
+    "imageAtomicMin(01H20D00y",
+    "imageAtomicXor(01A10D00x",
+    "imageAtomicXor(01A10D00y",
+    "imageAtomicCompSwap(01C20D00D00x",
+    "textureGrad(00R00B00B00x",
+    "imageAtomicXor(01W10D00x",
+    "imageAtomicXor(01W10D00y",
+    "textureProjLodOffset(00o30B00B00x",
+    "textureSize(00X00x",
+    "greaterThan(10B10x",
+    "mix(00C00C00y",
+    "clamp(30D00D00x",
+    "mix(20E20E20x",
+    "dFdyFine(00x",
+    "textureProjOffset(00R30B10D00x",
+    "textureGather(00U20B00x",
+    "floatBitsToInt(00x",
+    "imageLoad(01a20x",
+    "memoryBarrierx",
+    "floatBitsToUint(00x",
+    "min(30C30x",
+    "textureProjOffset(00v20B10x",
+    "textureGradOffset(00i20B00B00B00x",
+    "imageAtomicXor(00z10D00y",
+    "texture2DRectProj(00O20x",
+    "modf(20C20x",
+    "tan(20x",
+    "floor(00x",
+    "floor(00y",
+    "imageAtomicMax(01O10D00x",
+    "imageAtomicMax(01O10D00y",
+    "mod(30C30x",
+    "gl_DrawIx",
+    "textureOffset(00t00B00x",
+    "texture3DLod(00J20B00x",
+    "texture2DLox",
+    "alx",
+    "texture(00R10B00x",
+    "modf(00B00x",
+    "notEqual(20D20x",
+    "allInvocationsEquax",
+    "imageAtomicExchange(01R10D00D00z",
+    "acosx",
+    "ldexp(10C10x",
+    "textureCubeGradEXx",
+    "imageAtomicXor(00y10D00x",
+    "imageAtomicXor(00y10D00y",
+    "determinant(A0x",
+    "textureLodOffset(00i20B00B00x",
+    "imageStore(01D20D30x",
+    "shadow1DLod(00m20B00x",
+    "imageAtomicOr(01I20D00x",
+    "distance(00C00x",
+    "isnan(30x",
+    "textureProjOffset(00o30B00x",
+    "lessThanEqual(30D30x",
+    "textureProj(00M30B00x",
+    "texture2DProj(00M30x",
+    "atomicCounterMax(00G00x",
+    "atomicCounterExchange(00G00x",
+    "textureGrad(00I10B10B10x",
+    "step(00B20x",
+    "texture2DProjLod(00I20B00x",
+    "step(00C30x",
+    "yuv_2_rgb(20B00x",
+    "texelFetch(00b10D00x",
+    "textureProj(00J30B00x",
+    "dFdyCoarse(00x",
+    "textureGather(00R10x",
+    "imageAtomicCompSwap(01K00D00E00x",
+    "uaddCarrx",
+    "imageAtomicOr(01V20D00D00x",
+    "imageAtomicOr(01V20D00D00y",
+    "imageAtomicExchange(01P10D00y",
+    "imageLoad(01L00x",
+    "min(10D10x",
+    "abx",
+    "imageAtomicExchange(01P10D00z",
+    "imageAtomicMax(01a20D00x",
+    "imageAtomicAnd(01S10D00D00x",
+    "imageAtomicAnd(01S10D00D00y",
+    "imageAtomicMax(01a20D00y",
+    "bitfieldReverse(20x",
+    "bitfieldReverse(20y",
+    "imageAtomicExchange(01I20D00x",
+    "imageAtomicExchange(01I20D00y",
+    "imageAtomicExchange(01I20D00z",
+    "textureProjOffsex",
+    "trunx",
+    "texture(00u20x",
+    "interpolateAtSamplx",
+    "textureGather(00v20x",
+    "fract(10x",
+    "fract(10y",
+    "textureGatherOffset(00O10B10D00x",
+    "textureQueryLod(00K20x",
+    "textureLodOffset(00I10B00B10x",
+    "unpackUnorm4xx",
+    "imageAtomicCompSwap(01S10D00D00E00x",
+    "noise4(20x",
+    "textureOffset(00U20B10x",
+    "min(30B00x",
+    "imageAtomicMax(00y10D00x",
+    "imageAtomicMax(00y10D00y",
+    "atomicAnd(00D00x",
+    "gl_FragColox",
+    "exp(10x",
+    "textureOffset(00n20B10x",
+    "bitCount(30y",
+    "dFdyFinx",
+    "unpackUnorm2x16(00x",
+    "sqrt(20x",
+    "sqrt(20y",
+    "textureGrad(00L20B10B10x",
+    "interpolateAtCentroid(00x",
+    "textureGatherOffsetx",
+    "textureSize(00o00x",
+    "gl_MaxImageUnitx",
+    "greaterThax",
+    "packUnorm4x8(30x",
+    "texelFetch(00P10D00x",
+    "texture(00O10x",
+    "imageAtomicMin(01M00D00x",
+    "imageAtomicMin(01M00D00y",
+    "notEqual(30E30x",
+    "imageAtomicMin(01O10D00x",
+    "imageAtomicMin(01O10D00y",
+    "imageAtomicExchange(01B20D00y",
+    "imageAtomicExchange(01B20D00z",
+    "gl_FragCoorx",
+    "imageAtomicMax(01X10D00y",
+    "textureGrad(00u10B00B00x",
+    "fwidthFine(20x",
+    "textureQueryLod(00o00x",
+    "imageAtomicAnd(01E20D00x",
+    "imageAtomicAnd(01E20D00y",
+    "normalize(00x",
+    "normalize(00y",
+    "clamp(10C00C00x",
+    "imageAtomicCompSwap(01f00D00E00x",
+    "imageAtomicOr(01A10D00x",
+    "atomicOr(00E00x",
+    "imageAtomicOr(01A10D00y",
+    "imageAtomicOr(01K00D00x",
+    "imageAtomicOr(01K00D00y",
+    "atomicMax(00D00x",
+    "textureProjGrad(00m30B00B00x",
+    "imageAtomicAnd(01R10D00D00y",
+    "atanx",
+    "floatBitsToUint(10x",
+    "textureLod(00J20B00x",
+    "textureCubeLox",
+    "imageAtomicExchange(01D20D00z",
+    "textureGrad(00O10B10B10x",
+    "dFdyFine(20x",
+    "textureSize(00I00x",
+    "gl_MaxComputeWorkGroupSizx",
+    "texelFetchOffset(00R10D00D10x",
+    "dFdxFine(10x",
+    "reflecx",
+    "imageAtomicAnd(01K00D00x",
+    "imageAtomicAnd(01K00D00y",
+    "textureLodOffset(00X10B00B10x",
+    "texture(00T20B00x",
+    "textureGatherOffsets(00n10B00B70x",
+    "texelFetcx",
+    "imageAtomicCompSwap(00y10D00D00x",
+    "log(30x",
+    "outerProducx",
+    "notEqual(20F20x",
+    "allInvocationsEqual(00x",
+    "imageStore(01G20D30x",
+    "fwidth(10x",
+    "textureProjLod(00R20B00x",
+    "notEqual(30D30x",
+    "fwidthCoarse(30x",
+    "textureProjOffset(00I20B10x",
+    "imageStore(01X10D30x",
+    "textureQueryLevels(00z",
+    "textureQueryLevels(00_",
+    "rgb_2_yux",
+    "textureQueryLevels(000",
+    "textureQueryLevels(001",
+    "textureQueryLevels(002",
+    "textureQueryLevels(003",
+    "gl_MaxDrawBufferx",
+    "atomicCounterMin(00G00x",
+    "textureGradOffset(00u10B00B00B00x",
+    "imulExtended(20D20D20D20x",
+    "any(30x",
+    "distance(30B30x",
+    "imageAtomicExchange(01L00D00y",
+    "imageAtomicAnd(01W10D00x",
+    "imageAtomicAnd(01W10D00y",
+    "texture3D(00J20B00x",
+    "texture1DLod(00g00B00x",
+    "dot(30B30x",
+    "gl_MaxTextureImageUnitx",
+    "usubBorrow(20E20E20x",
+    "textureProj(00t30B00x",
+    "shadow1DProj(00m30B00x",
+    "clamp(30B00B00x",
+    "texture2DRectProj(00O30x",
+    "imageAtomicMax(01B20D00y",
+    "max(10D00x",
+    "smoothstex",
+    "textureGradOffset(00n20B10B10B10x",
+    "clamp(00D00D00x",
+    "floor(30x",
+    "floor(30y",
+    "imageStore(01P10D30x",
+    "clamx",
+    "textureProjGradOffset(00S30B20B20B20x",
+    "reflect(30C30x",
+    "gl_PointCoorx",
+    "imageAtomicOr(01D20D00x",
+    "textureGatherOffset(00v10B10x",
+    "imageAtomicOr(01D20D00y",
+    "packDouble2x32(10x",
+    "clamp(10B00B00x",
+    "imageStore(01F20D30x",
+    "texelFetchOffset(00S20D00D20x",
+    "lessThan(10D10x",
+    "bitfieldReversx",
+    "textureSize(00g00x",
+    "textureLox",
+    "textureGatherOffset(00U20B10D00x",
+    "textureGatherOffset(00q10B10D00x",
+    "textureGather(00I10B00x",
+    "texture1DProjLod(00g30B00x",
+    "texelFetch(00V10D00x",
+    "imageAtomicExchange(01h00D00x",
+    "imageAtomicExchange(01h00D00y",
+    "atan(30B30x",
+    "imageAtomicExchange(01h00D00z",
+    "textureGatherOffsets(00R10B70x",
+    "unpackSnorm2x1x",
+    "textureProjLod(00g30B00x",
+    "max(00B00x",
+    "imageAtomicOr(01J20D00x",
+    "imageAtomicOr(01J20D00y",
+    "imageAtomicMax(01F20D00x",
+    "imageAtomicMax(01F20D00y",
+    "exp2(20x",
+    "smoothstep(30C30C30x",
+    "imageAtomicExchange(00z10D00x",
+    "imageAtomicExchange(00z10D00y",
+    "imageAtomicExchange(00z10D00z",
+    "textureProj(00q20x",
+    "textureProjLod(00t10B00x",
+    "imageAtomicExchange(01K00D00x",
+    "imageAtomicExchange(01K00D00y",
+    "gl_MaxCombinedTextureImageUnitx",
+    "textureSize(00k00x",
+    "reflect(20B20x",
+    "imageAtomicXor(01V20D00D00x",
+    "imageAtomicXor(01V20D00D00y",
+    "equal(10F10x",
+    "imageAtomicOx",
+    "imageLoad(01f00x",
+    "acos(30x",
+    "dFdx(10x",
+    "bitfieldReverse(30x",
+    "bitfieldReverse(30y",
+    "texture1DProj(00g30x",
+    "textureOffsex",
+    "fract(00x",
+    "fract(00y",
+    "min(30E00x",
+    "sigx",
+    "gl_MinProgramTexelOffsex",
+    "interpolateAtOffset(20B10x",
+    "gl_MaxGeometryTotalOutputComponentx",
+    "subpassLoad(01x",
+    "reflect(30B30x",
+    "textureGatherOffsets(00I10B70D00x",
+    "interpolateAtCentroid(30x",
+    "mod(30B30x",
+    "imageAtomicXor(01X10D00x",
+    "imageAtomicXor(01X10D00y",
+    "imageStore(01Z20D30x",
+    "texture1D(00g00B00x",
+    "memoryBarrierBuffex",
+    "pow(00B00x",
+    "mod(00B00x",
+    "faceforward(30C30C30x",
+    "roundEven(10x",
+    "roundEven(10y",
+    "atanh(30x",
+    "textureLod(00K20B00x",
+    "bitCount(20x",
+    "bitCount(20y",
+    "texelFetch(00L20D00x",
+    "dFdxFine(00x",
+    "distance(20B20x",
+    "textureGradOffset(00q10B10B10B10x",
+    "uaddCarry(30E30E30x",
+    "textureSize(00U00x",
+    "textureProjOffset(00o10B00D00x",
+    "gl_MaxCombinedImageUniformx",
+    "atomicCounterXor(00G00x",
+    "imageAtomicOr(01g00D00x",
+    "imageAtomicOr(01g00D00y",
+    "gl_GlobalInvocationIx",
+    "gl_VertexIx",
+    "imageAtomicMin(01L00D00x",
+    "smoothstep(20C20C20x",
+    "imageAtomicCompSwap(01U20D00D00D00x",
+    "texture3x",
+    "imageAtomicExchange(01T20D00D00z",
+    "atomicCounterExchangx",
+    "mix(10B10B10x",
+    "reflect(10C10x",
+    "mix(10B10B10y",
+    "textureProj(00Y30B00x",
+    "textureGatherOffsets(00U20B70x",
+    "imageAtomicMax(01I20D00x",
+    "imageAtomicMax(01I20D00y",
+    "exx",
+    "textureGather(00v20B00x",
+    "textureGatherOffset(00I10B10D00x",
+    "notEqual(20E20x",
+    "textureLodOffset(00d20B00B10x",
+    "inverse(A0x",
+    "textureProjGrad(00X20B10B10x",
+    "imageLoad(01J20x",
+    "textureSize(00Y00x",
+    "atan(20B20x",
+    "usubBorrow(00E00E00x",
+    "imageAtomicXor(01M00D00x",
+    "imageAtomicXor(01M00D00y",
+    "dFdyFine(30x",
+    "textureQueryLod(00s20x",
+    "imageAtomicAnd(01N10D00x",
+    "texture(00v10x",
+    "gl_MaxVertexImageUniformx",
+    "subpassLoad(01n00x",
+    "roundEvex",
+    "distancx",
+    "textureProjLodOffset(00g10B00B00x",
+    "step(10C10x",
+    "textureQueryLod(00x20x",
+    "fma(10B10B10x",
+    "smoothstep(00B00B10x",
+    "imageAtomicCompSwap(01a20D00D00x",
+    "textureLod(00u10B00x",
+    "textureProjGradOffset(00m30B00B00B00x",
+    "normalize(10x",
+    "dFdyCoarse(20x",
+    "findMSx",
+    "textureProjGradOffset(00o30B00B00B00x",
+    "textureProj(00g30B00x",
+    "interpolateAtOffsex",
+    "bitfieldExtract(00E00D00x",
+    "imageStore(01I20D30x",
+    "distance(30C30x",
+    "any(20x",
+    "textureGatherOffsets(00L20B70x",
+    "textureLod(00g00B00x",
+    "sin(10x",
+    "textureSize(00N00x",
+    "mod(20B20x",
+    "imageAtomicOr(01h00D00x",
+    "imageAtomicOr(01h00D00y",
+    "textureGrad(00k30B20B20x",
+    "textureProjOffset(00o10B00x",
+    "imageAtomicMin(01A10D00x",
+    "imageAtomicMin(01A10D00y",
+    "textureGradOffset(00f30B10B10B10x",
+    "max(20D20x",
+    "max(10D10x",
+    "imageAtomicCompSwap(01N10D00E00x",
+    "textureGradOffset(00t00B00B00B00x",
+    "refract(30B30B00x",
+    "floor(20x",
+    "floor(20y",
+    "texelFetchOffset(00t00D00D00x",
+    "imageAtomicOr(01a20D00y",
+    "matrixCompMult(F0BF0x",
+    "umulExtended(10E10E10E10x",
+    "texture(00d20B00x",
+    "imageAtomicAdd(01Z20D00x",
+    "imageAtomicAdd(01Z20D00y",
+    "umulExtended(30E30E30E30x",
+    "textureGatherOffsets(00q10B70D00x",
+    "textureGradOffset(00Y20B20B20B20x",
+    "imageStorx",
+    "textureGatherOffset(00a20B10x",
+    "textureGrad(00f30B10B10x",
+    "atomicCounterSubtract(00G00x",
+    "imageAtomicXor(01C20D00x",
+    "modf(20B20x",
+    "imageAtomicAnd(01Y10D00x",
+    "imageAtomicAnd(01Y10D00y",
+    "noise1(00x",
+    "imageLoad(01M00x",
+    "imageAtomicCompSwap(01L00D00E00x",
+    "length(30x",
+    "length(30y",
+    "EndStreamPrimitivx",
+    "asinx",
+    "mix(10C10C10x",
+    "mix(10C10C10y",
+    "imageAtomicMin(00z10D00x",
+    "imageAtomicMin(00z10D00y",
+    "exp2(30x",
+    "allInvocations(00x",
+    "max(20C00x",
+    "texture3DProj(00J30B00x",
+    "imageLoad(01Q10D00x",
+    "textureProjLod(00X30B00x",
+    "textureProjGradOffset(00I30B10B10B10x",
+    "cosh(30x",
+    "texture1DProjLox",
+    "textureOffset(00S20B20D00x",
+    "usubBorrow(30E30E30x",
+    "textureProjOffset(00R20B10D00x",
+    "shadow2DProjLox",
+    "intBitsToFloax",
+    "imageAtomicXor(01f00D00x",
+    "imageAtomicXor(01f00D00y",
+    "imageAtomicXor(01g00D00y",
+    "textureOffset(00i20B00D00x",
+    "texture3DProj(00J30x",
+    "texture2x",
+    "matrixCompMult(B0BB0x",
+    "lessThan(30B30x",
+    "cross(20B20x",
+    "textureGrad(00q10B10B10x",
+    "clamp(20B00B00x",
+    "dFdx(00x",
+    "findLSB(00x",
+    "textureProj(00R20B00x",
+    "acos(20x",
+    "imageAtomicAnd(01B20D00x",
+    "max(20B20x",
+    "shadow1DProx",
+    "lessThan(20E20x",
+    "textureLod(00X10B00x",
+    "sign(00y",
+    "cosh(00x",
+    "imageAtomicMin(01E20D00x",
+    "imageAtomicMin(01E20D00y",
+    "textureLod(00Z20B00x",
+    "sign(00z",
+    "textureOffset(00Y20B20x",
+    "transpose(60x",
+    "imageAtomicExchange(01L00D00z",
+    "imageAtomicAdd(01O10D00x",
+    "imageAtomicAdd(01O10D00y",
+    "faceforward(00B00B00x",
+    "gl_NumWorkGroupx",
+    "imageAtomicOr(01O10D00x",
+    "imageAtomicOr(01O10D00y",
+    "imageAtomicAdd(01b20D00x",
+    "interpolateAtCentroid(20x",
+    "textureProjLodOffset(00R30B00B10x",
+    "textureGrad(00h10B00B00x",
+    "imageAtomicExchange(01U20D00D00x",
+    "yuv_2_rgx",
+    "texture1DProj(00g30B00x",
+    "textureQueryLod(00h00x",
+    "imageAtomicExchange(01U20D00D00y",
+    "modf(00C00x",
+    "textureProjLod(00t30B00x",
+    "textureOffset(00o00B00x",
+    "imageAtomicExchange(01U20D00D00z",
+    "textureGather(00U20x",
+    "imageStore(01H20D30x",
+    "texelFetch(00Q20D00x",
+    "roundEven(00x",
+    "roundEven(00y",
+    "texelFetchOffset(00O10D10x",
+    "atanh(20x",
+    "clamp(10E00E00x",
+    "dFdxFine(30x",
+    "imageAtomicAdd(01L00D00y",
+    "textureQueryLod(00J20x",
+    "textureProjOffset(00X30B10x",
+    "gl_MaxFragmentUniformVectorx",
+    "imageAtomicCompSwap(00y10D00E00x",
+    "interpolateAtOffset(10B10x",
+    "max(10C10x",
+    "texelFetch(00g00D00x",
+    "abs(30x",
+    "floatBitsToInx",
+    "bitfieldInsert(10E10E00D00x",
+    "packSnorm4x8(30x",
+    "mix(10B10B00x",
+    "clamp(30D30D30x",
+    "textureQueryLod(00d10x",
+    "unpackSnorm4xx",
+    "mod(10C00x",
+    "imageAtomicMax(01G20D00x",
+    "imageAtomicMax(01G20D00y",
+    "fwidthFinx",
+    "imageStore(01R10D00D30x",
+    "determinant(F0x",
+    "transpose(A0x",
+    "pow(20B20x",
+    "imageAtomicExchange(01G20D00x",
+    "imageAtomicExchange(01G20D00y",
+    "imageAtomicExchange(01G20D00z",
+    "imageLoad(01Y10x",
+    "imageAtomicMax(01g00D00x",
+    "imageAtomicMax(01g00D00y",
+    "textureProj(00v30x",
+    "textureProjGrad(00O20B10B10x",
+    "log2(20x",
+    "imageAtomicAnd(01a20D00x",
+    "dot(30C30x",
+    "fwidthCoarse(10x",
+    "stex",
+    "textureProjOffset(00I20B10D00x",
+    "textureGatherOffsets(00U20B70D00x",
+    "notEqual(10F10x",
+    "dFdxCoarse(20x",
+    "smoothstep(00B00B00x",
+    "textureProjLodOffset(00d30B00B10x",
+    "imageAtomicAnd(01P10D00x",
+    "imageAtomicAnd(01P10D00y",
+    "textureProjLodOffset(00I30B00B10x",
+    "gl_MaxCombinedAtomicCounterx",
+    "bitfieldInsert(10D10D00D00x",
+    "textureGather(00s30x",
+    "imageAtomicAdd(00y10D00y",
+    "imageAtomicAnd(01Q10D00D00x",
+    "imageAtomicAnd(01Q10D00D00y",
+    "imageAtomicCompSwap(01L00D00D00x",
+    "textureGather(00k30x",
+    "texture(00J20x",
+    "lessThanEqual(10D10x",
+    "textureProjOffset(00o30B00D00x",
+    "gl_MaxVaryingVectorx",
+    "textureSize(00d00x",
+    "sin(00x",
+    "bitCounx",
+    "imageLoad(01N10x",
+    "uaddCarry(10E10E10x",
+    "imageAtomicOr(01Z20D00x",
+    "imageAtomicOr(01Z20D00y",
+    "mix(10C10C00x",
+    "atomicCounterIncrement(00x",
+    "imageAtomicAdd(01J20D00x",
+    "imageAtomicAdd(01J20D00y",
+    "imageAtomicCompSwap(01S10D00D00D00x",
+    "imageAtomicMax(01W10D00y",
+    "textureProj(00o10B00x",
+    "imageAtomicAdd(01U20D00D00x",
+    "imageAtomicAdd(01U20D00D00y",
+    "textureProjOffset(00m30B00x",
+    "imageAtomicExchange(01Y10D00x",
+    "equal(10E10x",
+    "imageAtomicExchange(01Y10D00y",
+    "imageAtomicExchange(01Y10D00z",
+    "imageAtomicExchange(01O10D00y",
+    "isinx",
+    "textureProjOffset(00J30B20x",
+    "imageAtomicXor(01D20D00x",
+    "imageAtomicXor(01D20D00y",
+    "dFdxCoarsx",
+    "notEqual(10E10x",
+    "min(10C10x",
+    "textureProjGrad(00t10B00B00x",
+    "textureGather(00q20B00x",
+    "atomicCounterMix",
+    "imageAtomicAnd(01B20D00y",
+    "imageAtomicAdd(01S10D00D00y",
+    "atomicAdx",
+    "shadow1DProjLod(00m30B00x",
+    "imageAtomicMax(01f00D00x",
+    "imageAtomicMax(01f00D00y",
+    "texture(00u20B00x",
+    "EndPrimitivx",
+    "fwidthCoarse(00x",
+    "textureLodOffset(00R10B00B10x",
+    "trunc(10x",
+    "trunc(10y",
+    "gl_MaxComputeAtomicCounterx",
+    "texelFetch(00u10D00x",
+    "dot(20C20x",
+    "gl_DepthRangeParameterx",
+    "textureProj(00I20B00x",
+    "textureGatherOffsets(00L20B70D00x",
+    "noise1(10x",
+    "textureProjGrad(00g30B00B00x",
+    "shadow2DProj(00d30x",
+    "textureProj(00d30B00x",
+    "sign(10x",
+    "max(00E00x",
+    "texture(00a20B00x",
+    "textureGradOffsex",
+    "sign(10y",
+    "textureProj(00o10x",
+    "imageAtomicMay",
+    "interpolateAtCentroix",
+    "refract(20C20C00x",
+    "textureProj(00M20B00x",
+    "imageLoad(01A10x",
+    "textureProjOffset(00X30B10D00x",
+    "exp2(00x",
+    "imageAtomicExchange(01H20D00x",
+    "imageAtomicCompSwap(01T20D00D00D00x",
+    "texelFetchOffset(00u10D00D00x",
+    "imageAtomicCompSwap(01H20D00E00x",
+    "imageAtomicExchange(01H20D00y",
+    "imageAtomicExchange(01H20D00z",
+    "textureGatherOffset(00q10B10x",
+    "textureGather(00a20B00x",
+    "imageStore(01Q10D00D30x",
+    "ldexp(00C00x",
+    "textureSize(00s00x",
+    "imageAtomicXor(01P10D00y",
+    "imageAtomicOr(01I20D00y",
+    "texture(00N10B00x",
+    "gl_PrimitiveIx",
+    "imageAtomicOr(01X10D00y",
+    "imageAtomicCompSwap(01Y10D00D00x",
+    "findLSx",
+    "textureProjGrad(00I30B10B10x",
+    "gl_Layex",
+    "textureOffset(00d20B10x",
+    "dFdx(30x",
+    "imageAtomicMin(01V20D00D00x",
+    "imageAtomicMin(01V20D00D00y",
+    "gl_LastFragColox",
+    "textureProjGradOffset(00t30B00B00B00x",
+    "min(20E20x",
+    "asin(20x",
+    "imageAtomicCompSwap(01U20D00D00E00x",
+    "texture(00l30B00x",
+    "texture1DProjLod(00g10B00x",
+    "texture1x",
+    "dFdy(00x",
+    "shadow2DLod(00d20B00x",
+    "texture2DRectProx",
+    "texture1DProj(00g10x",
+    "lessThan(30E30x",
+    "imulExtended(30D30D30D30x",
+    "transpose(70x",
+    "textureProjGrax",
+    "imulExtended(00D00D00D00x",
+    "textureGatherOffsets(00q10B70x",
+    "imageAtomicAdd(01F20D00x",
+    "imageAtomicAdd(01F20D00y",
+    "texture(00S20B00x",
+    "textureLod(00Y20B00x",
+    "faceforward(10C10C10x",
+    "textureQueryLod(00u00x",
+    "min(20D00x",
+    "imageAtomicCompSwap(01P10D00D00x",
+    "uintBitsToFloat(00x",
+    "dFdxFine(20x",
+    "imageAtomicMin(01L00D00y",
+    "imageAtomicExchange(01g00D00y",
+    "bitfieldInsert(20D20D00D00x",
+    "mix(30B30B00x",
+    "textureQueryLod(00U10x",
+    "shadow2DProx",
+    "imageAtomicAnd(01N10D00y",
+    "tanh(00x",
+    "imageStore(00y10D30x",
+    "max(10C00x",
+    "matrixCompMult(D0BD0x",
+    "textureGatherOffsets(00v10B70D00x",
+    "gl_MaxComputeUniformComponentx",
+    "sinx",
+    "imageAtomicAnd(01X10D00x",
+    "shadow2DProjLod(00d30B00x",
+    "imageAtomicAnd(01X10D00y",
+    "min(30B30x",
+    "reflect(20C20x",
+    "texelFetch(00h10D00x",
+    "anyInvocatiox",
+    "memoryBarrierAtomicCounterx",
+    "bitfieldInsert(00E00E00D00x",
+    "imageAtomicMin(01Z20D00x",
+    "imageAtomicMin(01Z20D00y",
+    "imageAtomicAdd(01b20D00y",
+    "imageAtomicMin(01a20D00y",
+    "textureGrad(00d20B10B10x",
+    "atan(10x",
+    "imageAtomicMax(01T20D00D00x",
+    "imageAtomicMax(01T20D00D00y",
+    "imageAtomicCompSwap(01g00D00D00x",
+    "clamp(30C30C30x",
+    "textureProj(00v20x",
+    "step(00B10x",
+    "textureProjLod(00I20B00x",
+    "rgb_2_yuv(20B00x",
+    "imageStore(01B20D30x",
+    "imageLoad(01P10x",
+    "texture(00T20x",
+    "log2(10x",
+    "imageAtomicAnd(01D20D00x",
+    "imageAtomicAnd(01D20D00y",
+    "findLSB(20x",
+    "findLSB(20y",
+    "imageAtomicMin(01f00D00x",
+    "imageAtomicMin(01f00D00y",
+    "noise2(30x",
+    "imageAtomicOr(01U20D00D00x",
+    "greaterThanEqual(10B10x",
+    "imageAtomicXor(01K00D00x",
+    "clamp(10D10D10x",
+    "texelFetch(00M10D00x",
+    "textureQueryLod(00Y20x",
+    "transpose(F0x",
+    "textureOffset(00Y20B20D00x",
+    "textureGradOffset(00S20B20B20B20x",
+    "imageAtomicOr(01U20D00D00y",
+    "clamp(30E30E30x",
+    "textureSize(00R00x",
+    "imageAtomicAdd(01f00D00x",
+    "acosh(10x",
+    "imageAtomicAdd(01f00D00y",
+    "tax",
+    "imageAtomicMin(01W10D00y",
+    "imageAtomicXor(01K00D00y",
+    "imageLoad(01b20x",
+    "textureOffset(00L20B10D00x",
+    "mod(20B00x",
+    "imageLoad(01U20D00x",
+    "textureProjLod(00J30B00x",
+    "atomicCounterCompSwax",
+    "subpassLoad(01y",
+    "transpose(90x",
+    "mix(30C30C00x",
+    "atomicCounterAdx",
+    "atomicAnd(00E00x",
+    "six",
+    "max(20D00x",
+    "texelFetchOffset(00I10D00D10x",
+    "textureQueryLod(00L10x",
+    "noisex",
+    "shadow1x",
+    "textureGrad(00m20B00B00x",
+    "noisey",
+    "noisez",
+    "noise_",
+    "bitfieldInsert(30D30D00D00x",
+    "atomicMix",
+    "min(10C00x",
+    "greaterThan(10D10x",
+    "bitfieldExtract(10E00D00x",
+    "imageAtomicCompSwax",
+    "textureGradOffset(00h10B00B00B00x",
+    "imageAtomicMax(01V20D00D00y",
+    "shadow1DProjLox",
+    "texture2D(00I10B00x",
+    "greaterThan(20D20x",
+    "noise1(20x",
+    "textureProjLodOffset(00t10B00B00x",
+    "textureProjOffset(00O20B10x",
+    "trunc(00x",
+    "length(10x",
+    "length(10y",
+    "imageLoad(01R10D00x",
+    "imageAtomicAdd(01H20D00x",
+    "imageAtomicAdd(01H20D00y",
+    "subpassLoad(01z",
+    "degreex",
+    "dot(00B00x",
+    "tan(30x",
+    "textureLod(00T20B00x",
+    "textureProjGrad(00R30B10B10x",
+    "exp2(10x",
+    "textureProjOffset(00X20B10D00x",
+    "textureProjGradOffset(00X30B10B10B10x",
+    "matrixCompMult(A0BA0x",
+    "textureGatherOffsets(00v10B70x",
+    "textureGrad(00S20B20B20x",
+    "radianx",
+    "textureSize(00t00x",
+    "round(30x",
+    "modx",
+    "anyInvocation(00x",
+    "textureGrad(00x30B20B20x",
+    "texture2D(00M10x",
+    "imageAtomicCompSwap(01D20D00E00x",
+    "textureProjLod(00o30B00x",
+    "smoothstep(00C00C10x",
+    "interpolateAtSample(00B00x",
+    "dFdx(20x",
+    "textureGatherOffsex",
+    "texture(00L20x",
+    "barrierx",
+    "imageAtomicOr(01G20D00y",
+    "memoryBarrierSharex",
+    "imageAtomicAdd(01a20D00y",
+    "textureGather(00k30B00x",
+    "findMSB(20x",
+    "findMSB(20y",
+    "imageAtomicMin(01S10D00D00x",
+    "imageAtomicMin(01S10D00D00y",
+    "textureProjOffset(00S30B20D00x",
+    "imageAtomicAdd(01D20D00y",
+    "normalize(10y",
+    "unpackSnorm4x8(00x",
+    "imageLoad(01C20x",
+    "imageAtomicMax(01C20D00x",
+    "imageAtomicMax(01C20D00y",
+    "textureGather(00l30B00x",
+    "lessThanEquax",
+    "asin(30x",
+    "isnan(20x",
+    "isnan(20y",
+    "fwidth(00x",
+    "dFdy(10x",
+    "imageAtomicAdd(01P10D00x",
+    "imageAtomicAdd(01P10D00y",
+    "max(30E00x",
+    "textureLod(00d20B00x",
+    "lengtx",
+    "textureSizx",
+    "textureOffset(00q10B10x",
+    "uintBitsToFloax",
+    "gl_LastFragDatx",
+    "mod(10B00x",
+    "floatBitsToUinx",
+    "texture(00g00B00x",
+    "uintBitsToFloat(10x",
+    "textureProjOffset(00t30B00x",
+    "matrixCompMult(70B70x",
+    "imageAtomicAdd(01I20D00y",
+    "imageAtomicMax(01M00D00x",
+    "imageAtomicMax(01M00D00y",
+    "textureLod(00k30B00x",
+    "imageAtomicAdd(01E20D00y",
+    "textureLodOffset(00Y20B00B20x",
+    "refract(00C00C00x",
+    "atomicCompSwax",
+    "log2(00x",
+    "tanh(10x",
+    "imageAtomicMin(01I20D00y",
+    "textureLod(00h10B00x",
+    "imageStore(01b20D30x",
+    "textureGather(00O20B00x",
+    "gl_LocalInvocationIx",
+    "clamp(00B00B00x",
+    "textureGather(00d10x",
+    "gl_MaxGeometryAtomicCounterBufferx",
+    "textureOffset(00p10B00D00x",
+    "imageAtomicExchange(01f00D00z",
+    "atomicCounter(00x",
+    "clamp(10C10C10x",
+    "outerProduct(20B10x",
+    "textureProjOffset(00t10B00x",
+    "dFdyCoarse(10x",
+    "textureGrad(00e30B20B20x",
+    "textureSize(00J00x",
+    "textureQueryLod(00Z20x",
+    "dot(10C10x",
+    "atomicXox",
+    "textureProjGrad(00n30B10B10x",
+    "imageAtomicMin(01U20D00D00x",
+    "imageAtomicMin(01U20D00D00y",
+    "texture2DProjLodEXT(00I30B00x",
+    "miy",
+    "imageAtomicMax(01N10D00x",
+    "imageAtomicMax(01N10D00y",
+    "textureGrad(00K20B20B20x",
+    "step(00B00x",
+    "gl_MaxGeometryInputComponentx",
+    "miz",
+    "texture2DLodEXT(00I10B00x",
+    "texture(00K20B00x",
+    "textureProjGradOffset(00n30B10B10B10x",
+    "shadow2x",
+    "textureGrad(00J20B20B20x",
+    "imageAtomicCompSwap(01V20D00D00E00x",
+    "textureOffset(00U20B10D00x",
+    "groupMemoryBarriex",
+    "intBitsToFloat(10x",
+    "min(20C20x",
+    "umulExtendex",
+    "findLSB(10y",
+    "textureProjLodOffset(00Y30B00B20x",
+    "packHalf2x1x",
+    "refracx",
+    "imageAtomicMax(01h00D00y",
+    "texture3D(00J20x",
+    "gl_SecondaryFragDataEXx",
+    "imageAtomicAdd(01X10D00x",
+    "faceforward(20C20C20x",
+    "imageAtomicAnd(01O10D00y",
+    "imageAtomicAdd(01X10D00y",
+    "textureGather(00n10B00x",
+    "textureGather(00X10B00x",
+    "imageAtomicMax(01L00D00x",
+    "imageAtomicMax(01L00D00y",
+    "imageAtomicXor(01G20D00x",
+    "imageAtomicXor(01G20D00y",
+    "textureOffset(00a20B10x",
+    "imageAtomicExchange(01X10D00z",
+    "texture3DLox",
+    "min(30E30x",
+    "texture2DProj(00I30B00x",
+    "textureProjLodOffset(00o10B00B00x",
+    "imageAtomicAnd(01I20D00y",
+    "textureCubeGradEXT(00K20B20B20x",
+    "min(00B00x",
+    "textureGradOffset(00o00B00B00B00x",
+    "mix(30C30C30x",
+    "mix(30C30C30y",
+    "gl_WorkGroupIx",
+    "degrees(00x",
+    "imageAtomicMax(01J20D00x",
+    "imageAtomicMax(01J20D00y",
+    "imageAtomicMin(01D20D00y",
+    "memoryBarrierAtomicCountex",
+    "atomicExchange(00D00x",
+    "textureOffset(00m20B00D00x",
+    "gl_MaxGeometryAtomicCounterx",
+    "textureOffset(00f30B10x",
+    "imageAtomicExchange(01a20D00x",
+    "imageAtomicExchange(01a20D00y",
+    "imageAtomicExchange(01a20D00z",
+    "matrixCompMult(60B60x",
+    "imageAtomicCompSwap(00z10D00D00x",
+    "textureProj(00t30x",
+    "textureProjGradOffset(00t10B00B00B00x",
+    "unpackSnorm2x16(00x",
+    "lessThan(30D30x",
+    "atan(00B00x",
+    "textureQueryLod(00S20x",
+    "atomicCounterOx",
+    "notEqual(10B10x",
+    "imageLoad(01G20x",
+    "trunc(30x",
+    "trunc(30y",
+    "length(00x",
+    "length(00y",
+    "imageAtomicAnd(01H20D00x",
+    "imageAtomicAnd(01H20D00y",
+    "textureProj(00X30B00x",
+    "imageLoax",
+    "isnax",
+    "imageAtomicExchange(01O10D00z",
+    "imageAtomicCompSwap(01C20D00E00x",
+    "tan(00x",
+    "min(20E00x",
+    "subpassLoax",
+    "textureLod(00x30B00x",
+    "textureSize(00z",
+    "textureSize(00_",
+    "imageAtomicXor(01F20D00y",
+    "textureSize(000",
+    "textureSize(001",
+    "transposx",
+    "min(20B20x",
+    "textureSize(002",
+    "textureSize(003",
+    "bitfieldInsert(20E20E00D00x",
+    "gl_MaxProgramTexelOffsex",
+    "equax",
+    "imageAtomicMin(01g00D00y",
+    "trunc(00y",
+    "imageAtomicAnd(01a20D00y",
+    "round(20y",
+    "imageAtomicAdd(01M00D00x",
+    "imageAtomicAdd(01M00D00y",
+    "textureProjLod(00X20B00x",
+    "smoothstep(00C00C00x",
+    "atomicCounterAnd(00G00x",
+    "imageAtomicExchange(01K00D00z",
+    "faceforward(30B30B30x",
+    "distance(20C20x",
+    "atomicCounterAdd(00G00x",
+    "imageStore(01O10D30x",
+    "texture(00X10x",
+    "ceil(00x",
+    "ceil(00y",
+    "distance(00B00x",
+    "texelFetch(00O10x",
+    "imageAtomicMin(01N10D00x",
+    "imageAtomicMin(01N10D00y",
+    "imageAtomicExchange(01C20D00x",
+    "imageAtomicExchange(01C20D00y",
+    "textureGrad(00s30B20B20x",
+    "textureGather(00I10x",
+    "imageAtomicExchange(01C20D00z",
+    "fracx",
+    "min(30D30x",
+    "findMSB(30x",
+    "findMSB(30y",
+    "textureGradOffset(00R10B10B10B10x",
+    "fwidth(30x",
+    "determinanx",
+    "texelFetch(00S20D00x",
+    "max(10B00x",
+    "textureProjGradOffset(00R30B10B10B10x",
+    "texelFetchOffset(00L20D00D10x",
+    "isnan(30y",
+    "transpose(50x",
+    "greaterThanEqual(20D20x",
+    "asinh(00x",
+    "gl_PrimitiveIDIx",
+    "textureGather(00Z20x",
+    "textureGrad(00p10B00B00x",
+    "textureProjOffset(00v30B10x",
+    "greaterThan(20B20x",
+    "min(20D20x",
+    "texelFetchOffset(00g00D00D00x",
+    "imageAtomicCompSwap(01g00D00E00x",
+    "texture3DProjLox",
+    "imageAtomicCompSwap(01Q10D00D00E00x",
+    "imageAtomicXor(01O10D00x",
+    "imageAtomicXor(01O10D00y",
+    "tanh(20x",
+    "textureProj(00m30B00x",
+    "texelFetchOffsex",
+    "crosx",
+    "sqrx",
+    "smoothstep(00C00C30x",
+    "textureSize(00l00x",
+    "textureLod(00o00B00x",
+    "imageAtomicMin(01K00D00x",
+    "imageAtomicMin(01K00D00y",
+    "textureOffset(00I10B10D00x",
+    "imageAtomicAnd(00z10D00x",
+    "imageAtomicAnd(00z10D00y",
+    "gl_MaxAtomicCounterBufferSizx",
+    "textureOffset(00J20B20D00x",
+    "lessThanEqual(20E20x",
+    "gl_BaseVertey",
+    "textureOffset(00g00B00x",
+    "imageSizx",
+    "textureProj(00g30x",
+    "imageLoad(01Z20x",
+    "bitfieldInsert(30E30E00D00x",
+    "bitfieldExtract(20E00D00x",
+    "uintBitsToFloat(20x",
+    "unpackUnorm4x8(00x",
+    "mod(10B10x",
+    "gl_LocalInvocationIndey",
+    "atomicCounterXox",
+    "imageAtomicAdd(01W10D00x",
+    "imageAtomicAdd(01W10D00y",
+    "imageAtomicCompSwap(01X10D00D00x",
+    "equal(20D20x",
+    "gl_MaxCombinedAtomicCounterBufferx",
+    "mix(10E10E10x",
+    "textureGather(00R10B00x",
+    "textureSize(00Z00x",
+    "bitfieldExtract(30D00D00x",
+    "imageAtomicXor(01J20D00x",
+    "imageAtomicXor(01J20D00y",
+    "frexp(30C30x",
+    "texture2DProjGradEXx",
+    "imageStore(01T20D00D30x",
+    "intBitsToFloat(00x",
+    "textureLodOffset(00m20B00B00x",
+    "findLSB(00y",
+    "texelFetch(00p10D00x",
+    "textureGather(00d10B00x",
+    "dFdxFinx",
+    "shadow2DProj(00d30B00x",
+    "inversesqrt(10x",
+    "inversesqrt(10y",
+    "abs(30y",
+    "transpose(D0x",
+    "abs(30z",
+    "textureProjGrad(00O30B10B10x",
+    "imageAtomicMax(01Z20D00y",
+    "imageLoad(01E20x",
+    "dFdz",
+    "dFd_",
+    "radians(20x",
+    "gl_FragDatx",
+    "textureGatherOffsets(00O10B70x",
+    "clamp(20E00E00x",
+    "textureProj(00d30x",
+    "gl_MaxVertexOutputVectorx",
+    "imageAtomicXox",
+    "shadow1D(00m20x",
+    "textureOffset(00u10B00x",
+    "cosh(10x",
+    "round(30y",
+    "imageAtomicAnd(01G20D00x",
+    "imageAtomicAnd(01G20D00y",
+    "sign(10z",
+    "umulExtended(00E00E00E00x",
+    "gl_MaxVertexAttribx",
+    "texture(00a20x",
+    "imageAtomicAdd(01T20D00D00x",
+    "imageAtomicAdd(01T20D00D00y",
+    "imageAtomicExchange(01g00D00z",
+    "ldexp(10B10x",
+    "textureProjOffset(00g30B00x",
+    "texture(00Z20x",
+    "degrees(10x",
+    "texture(00K20x",
+    "sinh(10x",
+    "texture(00m20x",
+    "imageAtomicXor(01C20D00y",
+    "textureProjLodOffset(00I20B00B10x",
+    "textureGather(00K20x",
+    "textureGatherOffset(00R10B10x",
+    "memoryBarrierSharedx",
+    "atomicExchangx",
+    "clamp(20B20B20x",
+    "texture2DProjLox",
+    "texelFetch(00W20D00x",
+    "textureProjLod(00g10B00x",
+    "trunc(20x",
+    "trunc(20y",
+    "textureProjOffset(00I30B10D00x",
+    "textureProjLodOffsex",
+    "max(00C00x",
+    "tan(10x",
+    "texture(00g00x",
+    "textureLodOffset(00L20B00B10x",
+    "shadow1DLox",
+    "textureLodOffset(00u10B00B00x",
+    "imageAtomicAnd(00y10D00x",
+    "imageAtomicAnd(00y10D00y",
+    "isinf(20x",
+    "isinf(20y",
+    "textureGatherOffset(00X10B10D00x",
+    "min(10E10x",
+    "memoryBarrierImagex",
+    "inversesqrx",
+    "round(10x",
+    "round(10y",
+    "textureProjLodOffset(00m30B00B00x",
+    "textureProjGradOffset(00g10B00B00B00x",
+    "textureProj(00R30x",
+    "shadow1DProj(00m30x",
+    "texture(00f30B00x",
+    "fma(00B00B00x",
+    "imageAtomicOr(01b20D00x",
+    "imageAtomicOr(01b20D00y",
+    "textureGatherOffset(00v10B10D00x",
+    "atomicMax(00E00x",
+    "imageAtomicMin(01B20D00x",
+    "imageAtomicMin(01B20D00y",
+    "textureQueryLod(00t00x",
+    "textureProjOffset(00R30B10x",
+    "textureProj(00X30x",
+    "findMSB(00x",
+    "findMSB(00y",
+    "mix(20B20B20y",
+    "textureSamplex",
+    "ftransforx",
+    "min(30D00x",
+    "texture(00M10B00x",
+    "fwidth(20x",
+    "imageAtomicOr(01S10D00D00x",
+    "imageAtomicOr(01S10D00D00y",
+    "mod(30C00x",
+    "imageAtomicAdd(01A10D00x",
+    "imageAtomicAdd(01A10D00y",
+    "atomicOx",
+    "texture(00o00B00x",
+    "imageAtomicOr(01H20D00x",
+    "imageAtomicOr(01H20D00y",
+    "cos(20x",
+    "notEquax",
+    "packDouble2x3x",
+    "textureGather(00T20x",
+    "textureProjGradOffset(00J30B20B20B20x",
+    "asinh(10x",
+    "texelFetchOffset(00v10D10x",
+    "imageAtomicXor(01E20D00x",
+    "imageAtomicXor(01E20D00y",
+};
+
+}  // namespace sh
+
+#endif  // TESTS_PERF_TESTS_SYMBOLTABLELOOKUPPERF_AUTOGEN_H_